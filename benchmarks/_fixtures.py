@@ -0,0 +1,234 @@
+"""Shared synthetic data and timing helpers for the benchmark scripts."""
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from lxml import etree
+
+
+@dataclass
+class Problem:
+    """ProblemProtocol implementation."""
+
+    name: str
+    code: str = "38341003"
+    code_system: str = "SNOMED"
+    onset_date: Optional[date] = date(2020, 1, 1)
+    resolved_date: Optional[date] = None
+    status: str = "active"
+    persistent_id: Optional[object] = None
+
+
+@dataclass
+class ResultObservation:
+    """ResultObservationProtocol implementation."""
+
+    test_name: str
+    test_code: str = "2345-7"
+    value: str = "95"
+    unit: Optional[str] = "mg/dL"
+    status: str = "final"
+    effective_time: datetime = datetime(2024, 1, 15, 8, 30)
+    value_type: Optional[str] = "PQ"
+    interpretation: Optional[str] = "N"
+    reference_range_low: Optional[str] = "70"
+    reference_range_high: Optional[str] = "100"
+    reference_range_unit: Optional[str] = "mg/dL"
+
+
+@dataclass
+class ResultOrganizer:
+    """ResultOrganizerProtocol implementation."""
+
+    panel_name: str
+    results: List[ResultObservation] = field(default_factory=list)
+    panel_code: str = "24323-8"
+    status: str = "completed"
+    effective_time: datetime = datetime(2024, 1, 15, 8, 30)
+
+
+@dataclass
+class VitalSign:
+    """VitalSignProtocol implementation."""
+
+    type: str
+    code: str = "8867-4"
+    value: str = "72"
+    unit: str = "/min"
+    date: datetime = datetime(2024, 1, 15, 8, 30)
+    interpretation: Optional[str] = None
+
+
+@dataclass
+class VitalSignsOrganizer:
+    """VitalSignsOrganizerProtocol implementation."""
+
+    date: datetime
+    vital_signs: List[VitalSign] = field(default_factory=list)
+
+
+@dataclass
+class Address:
+    """AddressProtocol implementation."""
+
+    street_lines: List[str] = field(default_factory=lambda: ["123 Main St"])
+    city: str = "Boston"
+    state: str = "MA"
+    postal_code: str = "02101"
+    country: str = "US"
+
+
+@dataclass
+class Telecom:
+    """TelecomProtocol implementation."""
+
+    value: str = "617-555-1234"
+    type: str = "phone"
+    use: Optional[str] = "WP"
+
+
+@dataclass
+class Patient:
+    """PatientProtocol implementation."""
+
+    first_name: str
+    last_name: str = "Doe"
+    middle_name: Optional[str] = None
+    date_of_birth: date = date(1970, 1, 1)
+    sex: str = "F"
+    race: Optional[str] = "2106-3"
+    ethnicity: Optional[str] = "2186-5"
+    language: Optional[str] = "eng"
+    ssn: Optional[str] = None
+    addresses: List[Address] = field(default_factory=lambda: [Address()])
+    telecoms: List[Telecom] = field(default_factory=lambda: [Telecom(use="HP")])
+    marital_status: Optional[str] = "M"
+
+
+@dataclass
+class Organization:
+    """OrganizationProtocol implementation."""
+
+    name: str = "Example Medical Center"
+    npi: Optional[str] = "1234567890"
+    tin: Optional[str] = None
+    oid_root: Optional[str] = "2.16.840.1.113883.19.5"
+    addresses: List[Address] = field(default_factory=lambda: [Address()])
+    telecoms: List[Telecom] = field(default_factory=lambda: [Telecom()])
+
+
+@dataclass
+class Author:
+    """AuthorProtocol implementation."""
+
+    first_name: str = "Alice"
+    last_name: str = "Smith"
+    middle_name: Optional[str] = None
+    npi: Optional[str] = "9876543210"
+    addresses: List[Address] = field(default_factory=lambda: [Address()])
+    telecoms: List[Telecom] = field(default_factory=lambda: [Telecom()])
+    time: datetime = datetime(2024, 1, 15, 9, 0)
+    organization: Optional[Organization] = field(default_factory=Organization)
+    specialty_code: Optional[str] = None
+
+
+def make_patients(count: int) -> List[Patient]:
+    """Create count patients with distinct names and birth dates."""
+    start = date(1940, 1, 1)
+    return [
+        Patient(first_name=f"Patient{i}", date_of_birth=start + timedelta(days=i % 20000))
+        for i in range(count)
+    ]
+
+
+def make_problems(count: int) -> List[Problem]:
+    """Create count problems with distinct names and onset dates."""
+    start = date(2010, 1, 1)
+    return [
+        Problem(name=f"Problem {i}", onset_date=start + timedelta(days=30 * i))
+        for i in range(count)
+    ]
+
+
+def make_result_organizers(panels: int, results_per_panel: int = 8) -> List[ResultOrganizer]:
+    """Create lab panels with results_per_panel results each."""
+    start = datetime(2020, 1, 1, 8, 0)
+    organizers = []
+    for i in range(panels):
+        when = start + timedelta(days=7 * i)
+        results = [
+            ResultObservation(test_name=f"Test {i}-{j}", value=str(80 + j), effective_time=when)
+            for j in range(results_per_panel)
+        ]
+        organizers.append(
+            ResultOrganizer(panel_name=f"Panel {i}", results=results, effective_time=when)
+        )
+    return organizers
+
+
+def make_vital_signs_organizers(count: int) -> List[VitalSignsOrganizer]:
+    """Create count vital signs panels (heart rate, systolic, diastolic)."""
+    start = datetime(2020, 1, 1, 8, 0)
+    organizers = []
+    for i in range(count):
+        when = start + timedelta(days=i)
+        signs = [
+            VitalSign(type="Heart Rate", code="8867-4", value="72", unit="/min", date=when),
+            VitalSign(type="Systolic", code="8480-6", value="120", unit="mm[Hg]", date=when),
+            VitalSign(type="Diastolic", code="8462-4", value="80", unit="mm[Hg]", date=when),
+        ]
+        organizers.append(VitalSignsOrganizer(date=when, vital_signs=signs))
+    return organizers
+
+
+def make_document_element(items: int) -> etree._Element:
+    """
+    Build a ClinicalDocument element with Problems, Results and Vital Signs sections.
+
+    Only the body is generated (no header), which is enough for rule and
+    XPath benchmarks.
+
+    Args:
+        items: Entries in the Problems section (Results and Vital Signs scale with it)
+
+    Returns:
+        ClinicalDocument element
+    """
+    from ccdakit.builders.sections.problems import ProblemsSection
+    from ccdakit.builders.sections.results import ResultsSection
+    from ccdakit.builders.sections.vital_signs import VitalSignsSection
+
+    ns = "urn:hl7-org:v3"
+    root = etree.Element(f"{{{ns}}}ClinicalDocument", nsmap={None: ns})
+    etree.SubElement(root, f"{{{ns}}}effectiveTime", value="20240101090000")
+    body = etree.SubElement(etree.SubElement(root, f"{{{ns}}}component"), f"{{{ns}}}structuredBody")
+    sections = [
+        ProblemsSection(make_problems(items)),
+        ResultsSection(make_result_organizers(max(1, items // 8))),
+        VitalSignsSection(make_vital_signs_organizers(max(1, items // 3))),
+    ]
+    for section in sections:
+        etree.SubElement(body, f"{{{ns}}}component").append(section.to_element())
+    return root
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> Tuple[float, object]:
+    """
+    Time a callable and keep the fastest run.
+
+    Args:
+        func: Callable to time
+        repeat: Number of runs
+
+    Returns:
+        Tuple of (best wall time in seconds, result of the last run)
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark: section build time and size per build profile.
+
+Builds Problems, Results and Vital Signs sections under the FULL,
+STRUCTURED_ONLY and NARRATIVE_ONLY profiles and reports wall time, element
+count and serialized size relative to FULL.
+
+Usage:
+    python benchmarks/bench_build_profiles.py [--items 200] [--repeat 5]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+
+from _fixtures import best_of, make_problems, make_result_organizers, make_vital_signs_organizers
+from lxml import etree
+
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.base import BuildProfile
+
+
+def build_all(sections, profile):
+    """Build every section with the given profile."""
+    elements = []
+    for section in sections:
+        section.profile = profile
+        elements.append(section.to_element())
+    return elements
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=200, help="Entries per section")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per profile (best is kept)")
+    args = parser.parse_args()
+
+    sections = [
+        ProblemsSection(make_problems(args.items)),
+        ResultsSection(make_result_organizers(max(1, args.items // 8))),
+        VitalSignsSection(make_vital_signs_organizers(max(1, args.items // 3))),
+    ]
+
+    print(f"{'profile':<16}{'time (ms)':>12}{'elements':>12}{'bytes':>12}{'time vs full':>15}")
+    baseline = None
+    for profile in BuildProfile:
+        seconds, elements = best_of(lambda p=profile: build_all(sections, p), args.repeat)
+        count = sum(sum(1 for _ in element.iter()) for element in elements)
+        size = sum(len(etree.tostring(element)) for element in elements)
+        baseline = baseline or seconds
+        print(
+            f"{profile.value:<16}{seconds * 1000:>12.1f}{count:>12}{size:>12}"
+            f"{seconds / baseline:>14.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
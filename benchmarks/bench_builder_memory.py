@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory held by builder objects, with and without consume().
+
+Two measurements, both taken with tracemalloc:
+
+1. Bytes per builder. Creates 100,000 Problem Observation builders and the
+   same number of Problems Section builders over shared input, once from the
+   slotted library classes and once from a subclass that reintroduces a
+   per-instance __dict__ (what the classes looked like before __slots__).
+
+2. Retained memory in a batch worker. Builds 2,000 Problems sections of 25
+   problems each, whose problem objects are referenced only by their builder,
+   and keeps every builder afterwards (as a job keeping its work items for
+   reporting would). The "to_element" variant keeps the builders intact; the
+   "consume" variant builds with consume(), which drops the inputs.
+
+Usage:
+    python benchmarks/bench_builder_memory.py [--builders 100000] [--sections 2000]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from _fixtures import make_problems
+
+from ccdakit.builders.entries.problem import ProblemObservation
+from ccdakit.builders.sections.problems import ProblemsSection
+
+
+def allocated(func):
+    """Return (bytes still allocated after func returns, func's result)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, result
+
+
+def unslotted(cls):
+    """Subclass of cls whose instances carry a __dict__."""
+    return type(f"Unslotted{cls.__name__}", (cls,), {})
+
+
+def per_builder(count):
+    """Print bytes per builder for slotted and unslotted classes."""
+    problems = make_problems(50)
+    print(f"{'builder':<22}{'slotted (B)':>14}{'__dict__ (B)':>14}")
+    for cls, make in (
+        (ProblemObservation, lambda c, i: c(problems[i % 50])),
+        (ProblemsSection, lambda c, i: c(problems)),
+    ):
+        sizes = []
+        for variant in (cls, unslotted(cls)):
+            size, _ = allocated(lambda v=variant, m=make: [m(v, i) for i in range(count)])
+            sizes.append(size / count)
+        print(f"{cls.__name__:<22}{sizes[0]:>14.0f}{sizes[1]:>14.0f}")
+
+
+def batch_worker(sections, problems_per_section, consume):
+    """Build every section and keep the builders, as a reporting job would."""
+    kept = []
+    for _ in range(sections):
+        section = ProblemsSection(make_problems(problems_per_section))
+        section.consume() if consume else section.to_element()
+        kept.append(section)
+    return kept
+
+
+def retained(sections, problems_per_section):
+    """Print memory retained by kept builders after to_element versus consume."""
+    print(f"{'variant':<22}{'retained (KiB)':>14}")
+    sizes = {}
+    for label, consume in (("to_element", False), ("consume", True)):
+        sizes[label], _ = allocated(
+            lambda c=consume: batch_worker(sections, problems_per_section, c)
+        )
+        print(f"{label:<22}{sizes[label] / 1024:>14.0f}")
+    print(f"reduction: {sizes['to_element'] / sizes['consume']:.2f}x")
+
+
+def main() -> None:
+    """Run the benchmark and print the tables."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--builders", type=int, default=100000, help="Builders per class")
+    parser.add_argument("--sections", type=int, default=2000, help="Sections in the batch")
+    parser.add_argument("--problems", type=int, default=25, help="Problems per section")
+    args = parser.parse_args()
+
+    per_builder(args.builders)
+    print()
+    retained(args.sections, args.problems)
+
+
+if __name__ == "__main__":
+    main()
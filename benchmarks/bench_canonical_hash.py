@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: nightly re-export with and without content hashes.
+
+Builds 1,000 CCDs (Problems, Results and Vital Signs sections) twice, as two
+nightly runs in which only --changed percent of the records differ. The
+"send all" variant serializes, compresses and stores every document each
+night. The "skip unchanged" variant builds each document inside
+canonical_build() (record-derived clock and ids), hashes it with
+canonicalize() and stores only the documents whose hash differs from the
+previous night's. Also reports the per-document cost of canonicalize()
+against to_xml_string().
+
+Usage:
+    python benchmarks/bench_canonical_hash.py [--documents 1000] [--changed 20]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from _fixtures import (
+    Author,
+    Organization,
+    best_of,
+    make_patients,
+    make_problems,
+    make_result_organizers,
+    make_vital_signs_organizers,
+)
+
+from ccdakit.builders.documents import ContinuityOfCareDocument
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.canonical import SequentialIds, canonical_build, canonicalize
+from ccdakit.utils.sinks import compress
+
+
+UPDATED = datetime(2024, 1, 15, 9, 0)
+
+
+def records(count, changed_every):
+    """(record id, last update, problem count) of one night's records."""
+    for i in range(count):
+        changed = changed_every and i % changed_every == 0
+        yield f"DOC-{i}", UPDATED + timedelta(days=int(changed)), 5 + int(changed)
+
+
+def ccd(patient, problems, results, vitals, document_id, updated):
+    """One CCD of the batch."""
+    return ContinuityOfCareDocument(
+        patient=patient,
+        author=Author(),
+        custodian=Organization(),
+        sections=[
+            ProblemsSection(problems),
+            ResultsSection(results),
+            VitalSignsSection(vitals),
+        ],
+        document_id=document_id,
+        effective_time=updated,
+    )
+
+
+def night(count, changed_every, directory, stored_hashes):
+    """Export one night; store all documents, or only changed ones with stored_hashes."""
+    results, vitals = make_result_organizers(3, 6), make_vital_signs_organizers(4)
+    problems = {n: make_problems(n) for n in (5, 6)}
+    written = 0
+    for patient, (record_id, updated, n) in zip(
+        make_patients(count), records(count, changed_every)
+    ):
+        if stored_hashes is None:
+            doc = ccd(patient, problems[n], results, vitals, record_id, updated)
+            data = doc.to_xml_string(pretty=False).encode("utf-8")
+        else:
+            with canonical_build(clock=updated, ids=SequentialIds(record_id)):
+                doc = ccd(patient, problems[n], results, vitals, record_id, updated)
+                canonical = canonicalize(doc)
+            if stored_hashes.get(record_id) == canonical.content_hash:
+                continue
+            stored_hashes[record_id] = canonical.content_hash
+            data = canonical.xml
+        (directory / f"{record_id}.xml.gz").write_bytes(compress(data, "gzip"))
+        written += 1
+    return written
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=1000, help="Records per night")
+    parser.add_argument("--changed", type=int, default=20, help="Percent of changed records")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    n = args.documents
+    changed_every = round(100 / args.changed) if args.changed else 0
+    patient = make_patients(1)[0]
+    parts = (make_problems(5), make_result_organizers(3, 6), make_vital_signs_organizers(4))
+
+    def serialize():
+        return ccd(patient, *parts, "DOC-0", UPDATED).to_xml_string(pretty=False)
+
+    def hashed():
+        with canonical_build(clock=UPDATED):
+            return canonicalize(ccd(patient, *parts, "DOC-0", UPDATED))
+
+    per_doc = {
+        label: best_of(func, args.repeat * 10)[0] * 1000
+        for label, func in (("to_xml_string", serialize), ("canonicalize", hashed))
+    }
+    print(f"{'per document':<17}{'time (ms)':>10}")
+    for label, ms in per_doc.items():
+        print(f"{label:<17}{ms:>10.2f}")
+    print()
+
+    # The first night stores every document and its hash
+    stored = {}
+    root = Path(tempfile.mkdtemp(prefix="ccdakit-canonical-"))
+    try:
+        night(n, 0, root, stored)
+        variants = (
+            ("send all", lambda out: night(n, changed_every, out, None)),
+            ("skip unchanged", lambda out: night(n, changed_every, out, dict(stored))),
+        )
+        print(f"{'second night':<17}{'stored':>8}{'time (s)':>10}")
+        times = {}
+        for label, run in variants:
+
+            def fresh_run(run=run):
+                return run(Path(tempfile.mkdtemp(dir=root)))
+
+            times[label], written = best_of(fresh_run, args.repeat)
+            print(f"{label:<17}{written:>8}{times[label]:>10.2f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print(f"speedup: {times['send all'] / times['skip unchanged']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
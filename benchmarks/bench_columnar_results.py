@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Results and Vital Signs sections from objects versus columns.
+
+Starts from array data: 10,000 lab results (numeric values, reference ranges
+and timestamps) in panels of 10, and 3,000 vital signs in organizers of 3.
+The object path wraps each row in protocol dataclasses, formatting values and
+deriving the H/L/N interpretation one by one, and builds the sections with
+one builder per entry. The columnar path hands the same columns to
+ResultColumns / VitalSignColumns. Sections are built with the
+STRUCTURED_ONLY profile so the numbers cover the entries alone.
+
+Usage:
+    python benchmarks/bench_columnar_results.py [--results 10000] [--repeat 3]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+Uses NumPy arrays when NumPy is installed, lists otherwise.
+"""
+
+import argparse
+import itertools
+import uuid
+from datetime import datetime, timedelta
+
+from _fixtures import (
+    ResultObservation,
+    ResultOrganizer,
+    VitalSign,
+    VitalSignsOrganizer,
+    best_of,
+)
+from lxml import etree
+
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.base import BuildProfile
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PROFILE = BuildProfile.STRUCTURED_ONLY
+
+
+def make_columns(results, per_panel=10, signs_per_organizer=3):
+    """Create result and vital sign columns (arrays when NumPy is available)."""
+    panels = results // per_panel
+    start = datetime(2020, 1, 1, 8, 0)
+    times = [start + timedelta(hours=i) for i in range(panels)]
+    values = [60 + (i * 7) % 60 + (i % 10) / 10 for i in range(results)]
+    panel_columns = {
+        "panel_name": [f"Panel {i}" for i in range(panels)],
+        "panel_code": ["24323-8"] * panels,
+        "effective_time": times,
+    }
+    result_columns = {
+        "panel": [i // per_panel for i in range(results)],
+        "test_name": [f"Test {i % per_panel}" for i in range(results)],
+        "test_code": ["2345-7"] * results,
+        "value": values,
+        "unit": ["mg/dL"] * results,
+        "reference_range_low": [70.0] * results,
+        "reference_range_high": [100.0] * results,
+        "reference_range_unit": ["mg/dL"] * results,
+    }
+
+    signs = (results * 3) // 10
+    organizers = signs // signs_per_organizer
+    organizer_columns = {"date": [start + timedelta(hours=i) for i in range(organizers)]}
+    sign_columns = {
+        "organizer": [i // signs_per_organizer for i in range(signs)],
+        "type": ["Heart Rate"] * signs,
+        "code": ["8867-4"] * signs,
+        "value": [50 + i % 70 for i in range(signs)],
+        "unit": ["/min"] * signs,
+        "reference_range_low": [60] * signs,
+        "reference_range_high": [100] * signs,
+    }
+
+    if np is not None:
+        for columns in (result_columns, sign_columns):
+            for name in ("value", "reference_range_low", "reference_range_high"):
+                columns[name] = np.array(columns[name])
+        result_columns["panel"] = np.array(result_columns["panel"])
+        sign_columns["organizer"] = np.array(sign_columns["organizer"])
+        panel_columns["effective_time"] = np.array(times, dtype="datetime64[s]")
+        organizer_columns["date"] = np.array(organizer_columns["date"], dtype="datetime64[s]")
+    return panel_columns, result_columns, organizer_columns, sign_columns
+
+
+def interpret(value, low, high, labels):
+    """Classify one value against its range."""
+    if value < low:
+        return labels[0]
+    return labels[2] if value > high else labels[1]
+
+
+def build_from_objects(panels, results, organizers, signs):
+    """Wrap each row in protocol objects, then build both sections."""
+    times = _python_list(panels["effective_time"])
+    result_rows = zip(
+        _python_list(results["panel"]),
+        results["test_name"],
+        _python_list(results["value"]),
+        _python_list(results["reference_range_low"]),
+        _python_list(results["reference_range_high"]),
+    )
+    panel_objects = [
+        ResultOrganizer(panel_name=name, effective_time=when, results=[])
+        for name, when in zip(panels["panel_name"], times)
+    ]
+    for panel, name, value, low, high in result_rows:
+        panel_objects[panel].results.append(
+            ResultObservation(
+                test_name=name,
+                value=str(value),
+                effective_time=times[panel],
+                value_type=None,
+                interpretation=interpret(value, low, high, ("L", "N", "H")),
+                reference_range_low=str(low),
+                reference_range_high=str(high),
+            )
+        )
+
+    dates = _python_list(organizers["date"])
+    organizer_objects = [VitalSignsOrganizer(date=when) for when in dates]
+    sign_rows = zip(
+        _python_list(signs["organizer"]),
+        _python_list(signs["value"]),
+        _python_list(signs["reference_range_low"]),
+        _python_list(signs["reference_range_high"]),
+    )
+    for organizer, value, low, high in sign_rows:
+        organizer_objects[organizer].vital_signs.append(
+            VitalSign(
+                type="Heart Rate",
+                value=str(value),
+                date=dates[organizer],
+                interpretation=interpret(value, low, high, ("Low", "Normal", "High")),
+            )
+        )
+    return (
+        ResultsSection(panel_objects, profile=PROFILE).to_element(),
+        VitalSignsSection(organizer_objects, profile=PROFILE).to_element(),
+    )
+
+
+def build_from_columns(panels, results, organizers, signs):
+    """Build both sections straight from the columns."""
+    return (
+        ResultsSection.from_columns(panels, results, profile=PROFILE).to_element(),
+        VitalSignsSection.from_columns(organizers, signs, profile=PROFILE).to_element(),
+    )
+
+
+def _python_list(values):
+    """Get a column as Python objects."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def canonical(func, columns):
+    """Build with repeatable ids and return the C14N form of both sections."""
+    original = uuid.uuid4
+    counter = itertools.count()
+    uuid.uuid4 = lambda: uuid.UUID(int=next(counter))
+    try:
+        return [etree.tostring(e, method="c14n") for e in func(*columns)]
+    finally:
+        uuid.uuid4 = original
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--results", type=int, default=10000, help="Lab results")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    columns = make_columns(args.results)
+    old = canonical(build_from_objects, columns)
+    assert old == canonical(build_from_columns, columns), "output differs"
+
+    print(f"input: {'numpy arrays' if np is not None else 'lists'}")
+    print(f"{'variant':<10}{'time (ms)':>12}{'results':>10}{'vitals':>10}")
+    times = {}
+    for label, func in (("objects", build_from_objects), ("columns", build_from_columns)):
+        times[label], (results, vitals) = best_of(lambda f=func: f(*columns), args.repeat)
+        print(
+            f"{label:<10}{times[label] * 1000:>12.1f}"
+            f"{len(results.findall('.//{*}observation')):>10}"
+            f"{len(vitals.findall('.//{*}observation')):>10}"
+        )
+    print(f"speedup: {times['objects'] / times['columns']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
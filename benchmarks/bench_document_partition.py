@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one oversized CCD versus date-window parts built in parallel.
+
+The record spans 20 years: weekly lab panels of 8 results, vital signs every
+few days and a problem list. The "whole" variant builds and serializes it as
+a single document. The "parts" variant splits it with DocumentPartitioner
+(result and vital signs sections windowed, problems repeated) and builds the
+parts one after another; "parallel" builds the same parts in a process pool.
+Reports the number of documents, the largest one, and wall time.
+
+Usage:
+    python benchmarks/bench_document_partition.py [--years 20] [--max-entries 400] [--workers 4]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from _fixtures import (
+    Author,
+    Organization,
+    best_of,
+    make_patients,
+    make_problems,
+    make_result_organizers,
+    make_vital_signs_organizers,
+)
+from lxml import etree
+
+from ccdakit.builders.documents import ContinuityOfCareDocument
+from ccdakit.builders.partition import DocumentPartitioner
+from ccdakit.builders.plan import SectionPlan
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+
+
+EFFECTIVE_TIME = datetime(2024, 1, 15, 9, 0)
+
+# Record and partitioner of a worker process (set by _init_worker)
+_parts = None
+
+
+def make_record(years):
+    """Section data for one patient with years of history."""
+    return {
+        "problems": make_problems(20),
+        "results": make_result_organizers(52 * years),
+        "vital_signs": make_vital_signs_organizers(120 * years),
+    }
+
+
+def split(years, max_entries):
+    """Split the record into parts."""
+    plan = SectionPlan(
+        ContinuityOfCareDocument,
+        {
+            "problems": ProblemsSection([]),
+            "results": ResultsSection([]),
+            "vital_signs": VitalSignsSection([]),
+        },
+    )
+    partitioner = DocumentPartitioner(
+        plan, windowed=["results", "vital_signs"], max_entries=max_entries
+    )
+    return partitioner.split(
+        make_patients(1)[0],
+        Author(),
+        Organization(),
+        make_record(years),
+        document_id="DOC",
+        effective_time=EFFECTIVE_TIME,
+    )
+
+
+def build_whole(years):
+    """Build the record as one document; return serialized sizes."""
+    doc = ContinuityOfCareDocument(
+        patient=make_patients(1)[0],
+        author=Author(),
+        custodian=Organization(),
+        sections=[
+            ProblemsSection(make_problems(20)),
+            ResultsSection(make_result_organizers(52 * years)),
+            VitalSignsSection(make_vital_signs_organizers(120 * years)),
+        ],
+        document_id="DOC",
+        effective_time=EFFECTIVE_TIME,
+    )
+    return [len(etree.tostring(doc.to_element()))]
+
+
+def build_parts(parts):
+    """Build the parts in turn; return serialized sizes."""
+    return [len(etree.tostring(part.document.to_element())) for part in parts]
+
+
+def _init_worker(years, max_entries):
+    """Split the record once per worker process."""
+    global _parts
+    _parts = split(years, max_entries)
+
+
+def _build_part(index):
+    """Build one part in a worker process."""
+    return len(etree.tostring(_parts[index].document.to_element()))
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--years", type=int, default=20, help="Years of history")
+    parser.add_argument("--max-entries", type=int, default=400, help="Entries per part")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    parts = split(args.years, args.max_entries)
+    print(f"{'variant':<10}{'documents':>11}{'largest (KB)':>14}{'time (s)':>10}")
+    times = {}
+    with ProcessPoolExecutor(
+        args.workers, initializer=_init_worker, initargs=(args.years, args.max_entries)
+    ) as pool:
+        list(pool.map(_build_part, range(len(parts))))  # start the workers
+        variants = (
+            ("whole", lambda: build_whole(args.years)),
+            ("parts", lambda: build_parts(parts)),
+            ("parallel", lambda: list(pool.map(_build_part, range(len(parts))))),
+        )
+        for label, run in variants:
+            times[label], sizes = best_of(run, args.repeat)
+            print(f"{label:<10}{len(sizes):>11}{max(sizes) / 1024:>14.0f}{times[label]:>10.2f}")
+    print(f"speedup: {times['whole'] / times['parallel']:.2f}x ({args.workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
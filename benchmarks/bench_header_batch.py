@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-document headers versus a HeaderCache shared by the batch.
+
+Builds one ClinicalDocument per patient for a batch of 100,000 patients that
+share an author and a custodian. The "rebuild" variant builds every header
+fragment per document; the "shared" variant passes one HeaderCache, so the
+realm/typeId/templateId prefix, document code, confidentiality and language
+codes, author, custodian and legalAuthenticator are built once and copied.
+Documents carry no sections, so the numbers cover the header alone.
+
+Usage:
+    python benchmarks/bench_header_batch.py [--patients 100000] [--repeat 1]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from _fixtures import Author, Organization, best_of, make_patients
+from lxml import etree
+
+from ccdakit.builders.document import ClinicalDocument
+from ccdakit.core.cache import HeaderCache
+
+
+def build_batch(patients, author, custodian, header_cache=None):
+    """Build one document per patient and return the last serialized document."""
+    start = datetime(2024, 1, 15, 9, 0)
+    xml = None
+    for i, patient in enumerate(patients):
+        doc = ClinicalDocument(
+            patient,
+            author,
+            custodian,
+            document_id=f"DOC-{i}",
+            effective_time=start + timedelta(seconds=i),
+            header_cache=header_cache,
+        )
+        xml = etree.tostring(doc.to_element())
+    return xml
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--patients", type=int, default=100000, help="Documents in the batch")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    patients = make_patients(args.patients)
+    author, custodian = Author(), Organization()
+    sample = patients[:50]
+    assert build_batch(sample, author, custodian) == build_batch(
+        sample, author, custodian, HeaderCache()
+    ), "output differs"
+
+    print(f"{'variant':<10}{'time (s)':>10}{'docs/s':>10}")
+    times = {}
+    for label, cache_factory in (("rebuild", lambda: None), ("shared", HeaderCache)):
+        times[label], _ = best_of(
+            lambda f=cache_factory: build_batch(patients, author, custodian, f()), args.repeat
+        )
+        print(f"{label:<10}{times[label]:>10.2f}{args.patients / times[label]:>10.0f}")
+    print(f"speedup: {times['rebuild'] / times['shared']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
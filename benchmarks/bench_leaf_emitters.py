@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: leaf datatype builder objects versus append_* emitters.
+
+Builds a document body with 5,000 observation entries, each carrying an id,
+code, statusCode and effectiveTime, once through the Code / StatusCode /
+Identifier / EffectiveTime builder classes and once through the functional
+emitters in ccdakit.builders.common. Reports wall time, builder objects
+created and the tracemalloc peak for each.
+
+Usage:
+    python benchmarks/bench_leaf_emitters.py [--entries 5000] [--repeat 5]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import tracemalloc
+from datetime import datetime, timedelta
+
+from _fixtures import best_of
+from lxml import etree
+
+from ccdakit.builders.common import (
+    Code,
+    EffectiveTime,
+    Identifier,
+    StatusCode,
+    append_code,
+    append_effective_time,
+    append_identifier,
+    append_status_code,
+)
+from ccdakit.core.base import CDAElement
+
+
+NS = "urn:hl7-org:v3"
+LOINC_OID = "2.16.840.1.113883.6.1"
+
+
+def make_rows(count):
+    """Create (id, code, name, time) tuples for count entries."""
+    start = datetime(2020, 1, 1, 8, 0)
+    return [
+        (f"OBS-{i}", "2345-7", f"Glucose {i}", start + timedelta(hours=i)) for i in range(count)
+    ]
+
+
+def build_with_builders(rows):
+    """Build entries with one builder object per leaf element."""
+    body = etree.Element(f"{{{NS}}}structuredBody")
+    for ext, code, name, when in rows:
+        obs = etree.SubElement(body, f"{{{NS}}}observation", classCode="OBS", moodCode="EVN")
+        obs.append(Identifier(root="2.16.840.1.113883.19", extension=ext).to_element())
+        obs.append(Code(code=code, system="LOINC", display_name=name).to_element())
+        obs.append(StatusCode("completed").to_element())
+        obs.append(EffectiveTime(value=when).to_element())
+    return body
+
+
+def build_with_emitters(rows):
+    """Build entries by appending leaf elements directly."""
+    body = etree.Element(f"{{{NS}}}structuredBody")
+    for ext, code, name, when in rows:
+        obs = etree.SubElement(body, f"{{{NS}}}observation", classCode="OBS", moodCode="EVN")
+        append_identifier(obs, root="2.16.840.1.113883.19", extension=ext)
+        append_code(obs, code=code, system=LOINC_OID, system_name="LOINC", display_name=name)
+        append_status_code(obs, "completed")
+        append_effective_time(obs, value=when)
+    return body
+
+
+def count_builders(func, rows):
+    """Count CDAElement instances created by one run."""
+    created = 0
+    original = CDAElement.__init__
+
+    def counting_init(self, *args, **kwargs):
+        nonlocal created
+        created += 1
+        original(self, *args, **kwargs)
+
+    CDAElement.__init__ = counting_init
+    try:
+        func(rows)
+    finally:
+        CDAElement.__init__ = original
+    return created
+
+
+def peak_memory(func, rows):
+    """Get the tracemalloc peak (bytes) of one run."""
+    tracemalloc.start()
+    try:
+        func(rows)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=5000, help="Observation entries")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    rows = make_rows(args.entries)
+    old = etree.tostring(build_with_builders(rows), method="c14n")
+    assert old == etree.tostring(build_with_emitters(rows), method="c14n"), "output differs"
+
+    print(f"{'variant':<12}{'time (ms)':>12}{'builders':>12}{'peak (KiB)':>14}")
+    times = {}
+    for label, func in (("builders", build_with_builders), ("emitters", build_with_emitters)):
+        times[label], _ = best_of(lambda f=func: f(rows), args.repeat)
+        print(
+            f"{label:<12}{times[label] * 1000:>12.1f}{count_builders(func, rows):>12}"
+            f"{peak_memory(func, rows) / 1024:>14.0f}"
+        )
+    print(f"speedup: {times['builders'] / times['emitters']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one XML file per document versus compressed sinks.
+
+Builds 2,000 CCDs (Problems, Results and Vital Signs sections) and writes
+them out. The "xml files" variant writes one plain file per document, as
+`ccdakit generate` does; "xml.gz files" compresses each file on the caller's
+thread. The sink variants (directory of .xml.gz files, .tar.gz, .zip and an
+indexed .jsonl.gz container) compress on a thread pool while the next
+document is built. Reports the files written, bytes on disk and wall time
+including the build.
+
+Usage:
+    python benchmarks/bench_output_sinks.py [--documents 2000] [--workers 4]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from _fixtures import (
+    Author,
+    Organization,
+    best_of,
+    make_patients,
+    make_problems,
+    make_result_organizers,
+    make_vital_signs_organizers,
+)
+
+from ccdakit.builders.documents import ContinuityOfCareDocument
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.cache import HeaderCache
+from ccdakit.utils.sinks import compress, open_sink
+
+
+START = datetime(2024, 1, 15, 9, 0)
+
+
+def documents(count):
+    """Yield count documents."""
+    problems = make_problems(5)
+    results = make_result_organizers(3, 6)
+    vitals = make_vital_signs_organizers(4)
+    author, custodian, header_cache = Author(), Organization(), HeaderCache()
+    for i, patient in enumerate(make_patients(count)):
+        yield ContinuityOfCareDocument(
+            patient=patient,
+            author=author,
+            custodian=custodian,
+            sections=[
+                ProblemsSection(problems),
+                ResultsSection(results),
+                VitalSignsSection(vitals),
+            ],
+            document_id=f"DOC-{i}",
+            effective_time=START + timedelta(seconds=i),
+            header_cache=header_cache,
+        )
+
+
+def write_files(count, directory, compression):
+    """Write one file per document on the caller's thread."""
+    suffix = {None: ".xml", "gzip": ".xml.gz"}[compression]
+    for doc in documents(count):
+        data = doc.to_xml_string(pretty=False).encode("utf-8")
+        (directory / f"{doc.document_id}{suffix}").write_bytes(compress(data, compression))
+
+
+def write_sink(count, path, workers, compression=None):
+    """Write every document through a sink."""
+    with open_sink(path, compression=compression, workers=workers) as sink:
+        for doc in documents(count):
+            sink.write(doc)
+
+
+def disk_usage(path):
+    """Files and bytes under path."""
+    paths = [p for p in path.rglob("*") if p.is_file()]
+    return len(paths), sum(p.stat().st_size for p in paths)
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=2000, help="Documents in the batch")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    n, workers = args.documents, args.workers
+    variants = (
+        ("xml files", lambda out: write_files(n, out, None)),
+        ("xml.gz files", lambda out: write_files(n, out, "gzip")),
+        ("dir sink .gz", lambda out: write_sink(n, out / "docs", workers, "gzip")),
+        ("tar.gz sink", lambda out: write_sink(n, out / "a.tar.gz", workers)),
+        ("zip sink", lambda out: write_sink(n, out / "a.zip", workers)),
+        ("jsonl.gz sink", lambda out: write_sink(n, out / "a.jsonl.gz", workers)),
+    )
+
+    print(f"{'variant':<15}{'files':>7}{'size (MB)':>11}{'time (s)':>10}")
+    times = {}
+    for label, run in variants:
+        root = tempfile.mkdtemp(prefix="ccdakit-sinks-")
+        try:
+
+            def fresh_run(run=run, root=root):
+                out = Path(tempfile.mkdtemp(dir=root))
+                run(out)
+                return out
+
+            times[label], out = best_of(fresh_run, args.repeat)
+            files, size = disk_usage(out)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        print(f"{label:<15}{files:>7}{size / 1e6:>11.1f}{times[label]:>10.2f}")
+    print(f"speedup: {times['xml.gz files'] / times['tar.gz sink']:.2f}x ({workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
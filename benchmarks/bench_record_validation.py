@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-record validation, one record type at a time.
+
+Times DataValidator.validate_*_data() on one typical record of each type
+(nested addresses, telecoms, vital signs and lab results included), plus one
+invalid medication. This is the path RecordValidation and hand-written
+pre-build checks take, so it must stay as fast as a plain dict walk.
+
+With --against, the same records are also timed against another checkout
+(e.g. a baseline made with `git worktree add /tmp/base <rev>`), in a
+subprocess importing ccdakit from there, and the ratio is printed. The two
+are timed in alternating rounds and the best of each is kept, so that load
+on the machine does not favour either side.
+
+Usage:
+    python benchmarks/bench_record_validation.py [--calls 20000] [--repeat 5]
+        [--against DIR] [--rounds 5]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import date
+
+from _fixtures import best_of
+
+from ccdakit.utils.validators import DataValidator
+
+
+MEDICATION = {
+    "name": "Lisinopril 10 MG Oral Tablet",
+    "code": "314076",
+    "dosage": "10 mg",
+    "route": "oral",
+    "frequency": "daily",
+    "start_date": date(2023, 1, 1),
+    "status": "active",
+}
+
+OBSERVATION = {
+    "test_name": "Glucose",
+    "test_code": "2345-7",
+    "value": "95",
+    "status": "final",
+    "effective_time": date(2024, 1, 15),
+    "value_type": "PQ",
+    "reference_range_low": "70",
+    "reference_range_high": "100",
+    "reference_range_unit": "mg/dL",
+}
+
+RECORDS = {
+    "medication": ("validate_medication_data", MEDICATION),
+    "medication (bad)": (
+        "validate_medication_data",
+        dict(MEDICATION, status="paused", end_date=date(2020, 1, 1)),
+    ),
+    "problem": (
+        "validate_problem_data",
+        {
+            "name": "Hypertension",
+            "code": "38341003",
+            "code_system": "SNOMED",
+            "status": "active",
+            "onset_date": date(2020, 1, 1),
+        },
+    ),
+    "patient": (
+        "validate_patient_data",
+        {
+            "first_name": "John",
+            "last_name": "Doe",
+            "date_of_birth": date(1980, 1, 1),
+            "sex": "M",
+            "addresses": [
+                {
+                    "street_lines": ["123 Main St"],
+                    "city": "Boston",
+                    "state": "MA",
+                    "postal_code": "02101",
+                    "country": "US",
+                }
+            ],
+            "telecoms": [{"type": "phone", "value": "+1-617-555-1234", "use": "HP"}],
+        },
+    ),
+    "allergy": (
+        "validate_allergy_data",
+        {
+            "allergen": "Penicillin",
+            "allergy_type": "allergy",
+            "status": "active",
+            "severity": "moderate",
+            "allergen_code": "7980",
+            "allergen_code_system": "RxNorm",
+        },
+    ),
+    "immunization": (
+        "validate_immunization_data",
+        {
+            "vaccine_name": "Influenza",
+            "cvx_code": "140",
+            "administration_date": date(2023, 10, 1),
+            "status": "completed",
+        },
+    ),
+    "vital signs": (
+        "validate_vital_signs_data",
+        {
+            "date": date(2024, 1, 15),
+            "vital_signs": [
+                {"type": "Heart Rate", "code": "8867-4", "value": "72", "unit": "/min"},
+                {"type": "Body Temperature", "code": "8310-5", "value": "37", "unit": "Cel"},
+                {"type": "Respiratory Rate", "code": "9279-1", "value": "16", "unit": "/min"},
+            ],
+        },
+    ),
+    "procedure": (
+        "validate_procedure_data",
+        {
+            "name": "Appendectomy",
+            "code": "80146002",
+            "code_system": "SNOMED",
+            "status": "completed",
+            "date": date(2019, 5, 1),
+        },
+    ),
+    "result": (
+        "validate_result_data",
+        {
+            "panel_name": "Metabolic panel",
+            "panel_code": "24323-8",
+            "status": "final",
+            "effective_time": date(2024, 1, 15),
+            "results": [OBSERVATION] * 3,
+        },
+    ),
+    "encounter": (
+        "validate_encounter_data",
+        {
+            "encounter_type": "Office visit",
+            "code": "99213",
+            "code_system": "CPT-4",
+            "date": date(2024, 1, 15),
+        },
+    ),
+    "smoking status": (
+        "validate_smoking_status_data",
+        {"smoking_status": "Never smoker", "code": "266919005", "date": date(2024, 1, 15)},
+    ),
+}
+
+
+def time_records(calls: int, repeat: int):
+    """Get the best time per call, in microseconds, of each record type."""
+    timings = {}
+    for label, (method, record) in RECORDS.items():
+        validate = getattr(DataValidator, method)
+
+        def run(validate=validate, record=record):
+            for _ in range(calls):
+                validate(record)
+
+        seconds, _ = best_of(run, repeat)
+        timings[label] = seconds / calls * 1e6
+    return timings
+
+
+def time_checkout(checkout: str, calls: int, repeat: int):
+    """Time the same records in a subprocess importing ccdakit from another checkout."""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(checkout))
+    output = subprocess.run(  # noqa: S603  # Runs this script
+        [sys.executable, __file__, "--calls", str(calls), "--repeat", str(repeat), "--json"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=20000, help="Calls per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per record (best is kept)")
+    parser.add_argument("--against", metavar="DIR", help="Other checkout to compare with")
+    parser.add_argument("--rounds", type=int, default=5, help="Alternating rounds with --against")
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    timings = time_records(args.calls, args.repeat)
+    if args.json:
+        print(json.dumps(timings))
+        return
+
+    if not args.against:
+        print(f"{'record':<18}{'per call (us)':>14}")
+        for label, micros in timings.items():
+            print(f"{label:<18}{micros:>14.2f}")
+        return
+
+    other = time_checkout(args.against, args.calls, args.repeat)
+    for _ in range(args.rounds - 1):
+        for timed, new in (
+            (timings, time_records(args.calls, args.repeat)),
+            (other, time_checkout(args.against, args.calls, args.repeat)),
+        ):
+            for label, micros in new.items():
+                timed[label] = min(timed[label], micros)
+    print(f"{'record':<18}{'this (us)':>11}{'other (us)':>12}{'ratio':>8}")
+    for label, micros in timings.items():
+        print(f"{label:<18}{micros:>11.2f}{other[label]:>12.2f}{micros / other[label]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
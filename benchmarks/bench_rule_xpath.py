@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rules engine with compiled versus per-call XPath.
+
+Runs a 30-rule RulesEngine over synthetic documents twice: once with the
+RuleBuilder rules, which compile their expressions once through
+compile_xpath(), and once with equivalent rules that pass the expression
+string to element.xpath() on every call (the previous behavior).
+
+Usage:
+    python benchmarks/bench_rule_xpath.py [--documents 1000] [--items 20] [--repeat 3]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+import copy
+
+from _fixtures import best_of, make_document_element
+
+from ccdakit.core.validation import ValidationIssue, ValidationLevel
+from ccdakit.validators.rule_builder import FunctionBasedRule, RuleBuilder
+from ccdakit.validators.rules import RulesEngine
+from ccdakit.validators.xpath import CDA_NAMESPACES
+
+
+# (kind, expression, argument) for each rule
+RULE_SPECS = [
+    ("exists", "/cda:ClinicalDocument/cda:effectiveTime", None),
+    ("exists", "//cda:structuredBody", None),
+    ("exists", "//cda:section[cda:code/@code='11450-4']", None),
+    ("exists", "//cda:section[cda:code/@code='30954-2']", None),
+    ("exists", "//cda:section[cda:code/@code='8716-3']", None),
+    ("exists", "//cda:section/cda:title", None),
+    ("exists", "//cda:section/cda:text", None),
+    ("exists", "//cda:entry/cda:act", None),
+    ("exists", "//cda:entry/cda:organizer", None),
+    ("exists", "//cda:observation/cda:statusCode", None),
+    ("count", "//cda:section", 3),
+    ("count", "//cda:entry", 1),
+    ("count", "//cda:observation", 1),
+    ("count", "//cda:templateId", 1),
+    ("count", "//cda:id", 1),
+    ("count", "//cda:effectiveTime", 1),
+    ("count", "//cda:organizer/cda:component", 1),
+    ("count", "//cda:entryRelationship", 1),
+    ("count", "//cda:text//cda:tr", 1),
+    ("count", "//cda:value[@unit]", 1),
+    ("matches", "//cda:effectiveTime/@value", r"^\d{8}"),
+    ("matches", "//cda:effectiveTime/cda:low/@value", r"^\d{8}"),
+    ("matches", "//cda:templateId/@root", r"^[0-9.]+$"),
+    ("matches", "//cda:id/@root", r"^[0-9A-Fa-f.-]+$"),
+    ("matches", "//cda:code/@code", r"^[\w.-]+$"),
+    ("in_set", "//cda:statusCode/@code", {"active", "completed", "aborted"}),
+    ("in_set", "//cda:observation/@classCode", {"OBS"}),
+    ("in_set", "//cda:observation/@moodCode", {"EVN"}),
+    ("in_set", "//cda:act/@moodCode", {"EVN"}),
+    ("in_set", "//cda:organizer/@classCode", {"BATTERY", "CLUSTER"}),
+]
+
+
+def compiled_engine() -> RulesEngine:
+    """Build the engine from RuleBuilder rules (compiled XPath)."""
+    engine = RulesEngine()
+    for index, (kind, xpath, arg) in enumerate(RULE_SPECS):
+        name = f"rule_{index}"
+        if kind == "exists":
+            engine.add_rule(RuleBuilder.xpath_exists(name, xpath))
+        elif kind == "count":
+            engine.add_rule(RuleBuilder.xpath_count(name, xpath, min_count=arg))
+        elif kind == "matches":
+            engine.add_rule(RuleBuilder.xpath_value_matches(name, xpath, arg))
+        else:
+            engine.add_rule(RuleBuilder.xpath_value_in_set(name, xpath, arg))
+    return engine
+
+
+def uncompiled_rule(name, kind, xpath, arg):
+    """Equivalent rule evaluating the expression string on every call."""
+    import re
+
+    regex = re.compile(arg) if kind == "matches" else None
+
+    def validate(document):
+        results = document.xpath(xpath, namespaces=CDA_NAMESPACES)
+        if kind == "exists":
+            ok = bool(results)
+        elif kind == "count":
+            ok = len(results) >= arg
+        elif kind == "matches":
+            ok = all(regex.match(str(value)) for value in results)
+        else:
+            ok = all(str(value) in arg for value in results)
+        if ok:
+            return None
+        return ValidationIssue(level=ValidationLevel.WARNING, message=name, code=name)
+
+    return FunctionBasedRule(name, xpath, validate)
+
+
+def uncompiled_engine() -> RulesEngine:
+    """Build the engine from rules that do not compile their XPath."""
+    engine = RulesEngine()
+    for index, (kind, xpath, arg) in enumerate(RULE_SPECS):
+        engine.add_rule(uncompiled_rule(f"rule_{index}", kind, xpath, arg))
+    return engine
+
+
+def run(engine, documents):
+    """Validate every document and count the issues."""
+    return sum(len(engine.validate(document).all_issues) for document in documents)
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=1000, help="Documents to validate")
+    parser.add_argument("--items", type=int, default=20, help="Problems per document")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per engine (best is kept)")
+    args = parser.parse_args()
+
+    template = make_document_element(args.items)
+    documents = [copy.deepcopy(template) for _ in range(args.documents)]
+
+    print(f"{len(RULE_SPECS)} rules, {args.documents} documents")
+    print(f"{'xpath':<12}{'time (ms)':>12}{'per doc (us)':>14}{'issues':>10}")
+    baseline = None
+    for label, engine in (("per-call", uncompiled_engine()), ("compiled", compiled_engine())):
+        seconds, issues = best_of(lambda e=engine: run(e, documents), args.repeat)
+        baseline = baseline or seconds
+        print(
+            f"{label:<12}{seconds * 1000:>12.1f}{seconds / args.documents * 1e6:>14.1f}{issues:>10}"
+        )
+    print(f"speedup: {baseline / seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark: new section builders per document versus a SectionPlan.
+
+Generates one CCD per patient for 5,000 patients, each document carrying
+eight sections (Problems, Results and Vital Signs with a few entries, and
+empty Medications, Allergies, Immunizations, Procedures and Encounters). The
+"construct" variant creates every section builder per document; the "plan"
+variant compiles a SectionPlan once and rebinds its builders. Both share one
+HeaderCache. Reports the time to set up the document builders alone and to
+build and serialize the documents.
+
+Usage:
+    python benchmarks/bench_section_plan.py [--patients 5000] [--repeat 2]
+
+Run from the repository root with ccdakit installed (pip install -e .).
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from _fixtures import (
+    Author,
+    Organization,
+    best_of,
+    make_patients,
+    make_problems,
+    make_result_organizers,
+    make_vital_signs_organizers,
+)
+from lxml import etree
+
+from ccdakit.builders.documents import ContinuityOfCareDocument
+from ccdakit.builders.plan import SectionPlan
+from ccdakit.builders.sections.allergies import AllergiesSection
+from ccdakit.builders.sections.encounters import EncountersSection
+from ccdakit.builders.sections.immunizations import ImmunizationsSection
+from ccdakit.builders.sections.medications import MedicationsSection
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.procedures import ProceduresSection
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.cache import HeaderCache
+
+
+START = datetime(2024, 1, 15, 9, 0)
+
+
+def patient_data(count):
+    """Per-patient section data, keyed as in the plan."""
+    problems = make_problems(3)
+    results = make_result_organizers(1, 4)
+    vitals = make_vital_signs_organizers(2)
+    return [
+        {
+            "problems": problems,
+            "results": results,
+            "vital_signs": vitals,
+            "medications": [],
+            "allergies": [],
+            "immunizations": [],
+            "procedures": [],
+            "encounters": [],
+        }
+        for _ in range(count)
+    ]
+
+
+def constructed(patients, data, author, custodian, header_cache):
+    """Yield documents whose section builders are created per document."""
+    for i, (patient, record) in enumerate(zip(patients, data)):
+        yield ContinuityOfCareDocument(
+            patient=patient,
+            author=author,
+            custodian=custodian,
+            sections=[
+                ProblemsSection(record["problems"]),
+                ResultsSection(record["results"]),
+                VitalSignsSection(record["vital_signs"]),
+                MedicationsSection(record["medications"]),
+                AllergiesSection(record["allergies"]),
+                ImmunizationsSection(record["immunizations"]),
+                ProceduresSection(record["procedures"]),
+                EncountersSection(record["encounters"]),
+            ],
+            document_id=f"DOC-{i}",
+            effective_time=START + timedelta(seconds=i),
+            header_cache=header_cache,
+        )
+
+
+def planned(patients, data, author, custodian, header_cache):
+    """Yield documents from one SectionPlan."""
+    plan = SectionPlan(
+        ContinuityOfCareDocument,
+        {
+            "problems": ProblemsSection([]),
+            "results": ResultsSection([]),
+            "vital_signs": VitalSignsSection([]),
+            "medications": MedicationsSection([]),
+            "allergies": AllergiesSection([]),
+            "immunizations": ImmunizationsSection([]),
+            "procedures": ProceduresSection([]),
+            "encounters": EncountersSection([]),
+        },
+        header_cache=header_cache,
+    )
+    for i, (patient, record) in enumerate(zip(patients, data)):
+        yield plan.document(
+            patient,
+            author,
+            custodian,
+            record,
+            document_id=f"DOC-{i}",
+            effective_time=START + timedelta(seconds=i),
+        )
+
+
+def setup_only(documents):
+    """Create the document builders without building them."""
+    for _ in documents:
+        pass
+
+
+def build(documents):
+    """Build and serialize every document; return the last one."""
+    xml = None
+    for doc in documents:
+        xml = etree.tostring(doc.to_element())
+    return xml
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--patients", type=int, default=5000, help="Documents in the batch")
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per variant (best is kept)")
+    args = parser.parse_args()
+
+    patients = make_patients(args.patients)
+    data = patient_data(args.patients)
+    author, custodian = Author(), Organization()
+
+    print(f"{'variant':<11}{'setup (ms)':>12}{'build (s)':>11}{'docs/s':>9}")
+    times = {}
+    for label, documents in (("construct", constructed), ("plan", planned)):
+        setup, _ = best_of(
+            lambda d=documents: setup_only(d(patients, data, author, custodian, HeaderCache())),
+            args.repeat,
+        )
+        times[label], _ = best_of(
+            lambda d=documents: build(d(patients, data, author, custodian, HeaderCache())),
+            args.repeat,
+        )
+        docs_per_second = args.patients / times[label]
+        print(f"{label:<11}{setup * 1000:>12.1f}{times[label]:>11.2f}{docs_per_second:>9.0f}")
+    print(f"speedup: {times['construct'] / times['plan']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
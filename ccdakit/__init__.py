@@ -37,51 +37,98 @@ Basic Usage:
 """
 
 import logging
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.builders import ClinicalDocument
+    from ccdakit.builders.sections import (
+        AllergiesSection,
+        EncountersSection,
+        ImmunizationsSection,
+        MedicationsSection,
+        ProblemsSection,
+        ProceduresSection,
+        ResultsSection,
+        SocialHistorySection,
+        VitalSignsSection,
+    )
+    from ccdakit.core import (
+        BuildProfile,
+        CDAConfig,
+        CDAVersion,
+        OrganizationInfo,
+        ValidationError,
+        ValidationIssue,
+        ValidationLevel,
+        ValidationResult,
+        configure,
+        get_config,
+        reset_config,
+    )
+    from ccdakit.protocols import (
+        AddressProtocol,
+        AllergyProtocol,
+        AuthorProtocol,
+        EncounterProtocol,
+        MedicationProtocol,
+        OrganizationProtocol,
+        PatientProtocol,
+        ProblemProtocol,
+        ProcedureProtocol,
+        ResultObservationProtocol,
+        ResultOrganizerProtocol,
+        SmokingStatusProtocol,
+        TelecomProtocol,
+    )
 
-# Core exports
-# Builder exports
-from ccdakit.builders import ClinicalDocument
-
-# Section exports
-from ccdakit.builders.sections import (
-    AllergiesSection,
-    EncountersSection,
-    ImmunizationsSection,
-    MedicationsSection,
-    ProblemsSection,
-    ProceduresSection,
-    ResultsSection,
-    SocialHistorySection,
-    VitalSignsSection,
-)
-from ccdakit.core import (
-    CDAConfig,
-    CDAVersion,
-    OrganizationInfo,
-    ValidationError,
-    ValidationIssue,
-    ValidationLevel,
-    ValidationResult,
-    configure,
-    get_config,
-    reset_config,
-)
 
-# Protocol exports
-from ccdakit.protocols import (
-    AddressProtocol,
-    AllergyProtocol,
-    AuthorProtocol,
-    EncounterProtocol,
-    MedicationProtocol,
-    OrganizationProtocol,
-    PatientProtocol,
-    ProblemProtocol,
-    ProcedureProtocol,
-    ResultObservationProtocol,
-    ResultOrganizerProtocol,
-    SmokingStatusProtocol,
-    TelecomProtocol,
+# Public names are imported on first access (see ccdakit._lazy), so
+# ``import ccdakit`` stays cheap for CLI invocations and serverless handlers.
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        # Core
+        "CDAConfig": "ccdakit.core.config",
+        "OrganizationInfo": "ccdakit.core.config",
+        "configure": "ccdakit.core.config",
+        "get_config": "ccdakit.core.config",
+        "reset_config": "ccdakit.core.config",
+        "CDAVersion": "ccdakit.core.base",
+        "BuildProfile": "ccdakit.core.base",
+        "ValidationError": "ccdakit.core.validation",
+        "ValidationIssue": "ccdakit.core.validation",
+        "ValidationLevel": "ccdakit.core.validation",
+        "ValidationResult": "ccdakit.core.validation",
+        # Document builder
+        "ClinicalDocument": "ccdakit.builders.document",
+        # Sections
+        "AllergiesSection": "ccdakit.builders.sections.allergies",
+        "EncountersSection": "ccdakit.builders.sections.encounters",
+        "ImmunizationsSection": "ccdakit.builders.sections.immunizations",
+        "MedicationsSection": "ccdakit.builders.sections.medications",
+        "ProblemsSection": "ccdakit.builders.sections.problems",
+        "ProceduresSection": "ccdakit.builders.sections.procedures",
+        "ResultsSection": "ccdakit.builders.sections.results",
+        "SocialHistorySection": "ccdakit.builders.sections.social_history",
+        "VitalSignsSection": "ccdakit.builders.sections.vital_signs",
+        # Protocols
+        "AddressProtocol": "ccdakit.protocols",
+        "AllergyProtocol": "ccdakit.protocols",
+        "AuthorProtocol": "ccdakit.protocols",
+        "EncounterProtocol": "ccdakit.protocols",
+        "MedicationProtocol": "ccdakit.protocols",
+        "OrganizationProtocol": "ccdakit.protocols",
+        "PatientProtocol": "ccdakit.protocols",
+        "ProblemProtocol": "ccdakit.protocols",
+        "ProcedureProtocol": "ccdakit.protocols",
+        "ResultObservationProtocol": "ccdakit.protocols",
+        "ResultOrganizerProtocol": "ccdakit.protocols",
+        "SmokingStatusProtocol": "ccdakit.protocols",
+        "TelecomProtocol": "ccdakit.protocols",
+    },
 )
 
 
@@ -98,6 +145,7 @@ __all__ = [
     "__version__",
     "__author__",
     # Core
+    "BuildProfile",
     "CDAConfig",
     "CDAVersion",
     "OrganizationInfo",
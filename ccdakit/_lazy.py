@@ -0,0 +1,51 @@
+"""Lazy attribute loading for package ``__init__`` modules.
+
+Packages re-export many names from their submodules. Importing all of them
+eagerly makes ``import ccdakit`` load every builder, validator and the CLI
+stack, which short-lived processes pay for on every invocation. Packages
+instead declare where each public name lives and let PEP 562 module
+``__getattr__`` import it on first access.
+"""
+
+import sys
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def attach_lazy_imports(
+    package_name: str,
+    imports: Mapping[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Each name maps to the module it is imported from. A name that equals the
+    last component of its module path refers to the submodule itself (for
+    example ``{"common_rules": "ccdakit.validators.common_rules"}``).
+
+    Resolved values are stored in the package namespace, so each name is
+    imported at most once and later lookups are ordinary attribute access.
+
+    Args:
+        package_name: ``__name__`` of the package being set up
+        imports: Mapping of public name to defining module path
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at package level
+    """
+    namespace: Dict[str, Any] = sys.modules[package_name].__dict__
+
+    def lazy_getattr(name: str) -> Any:
+        module_path = imports.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # __import__ (unlike importlib.import_module) is reported by -X importtime
+        __import__(module_path)
+        module = sys.modules[module_path]
+        value = module if module_path.rsplit(".", 1)[-1] == name else getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def lazy_dir() -> List[str]:
+        return sorted(set(namespace) | set(imports))
+
+    return lazy_getattr, lazy_dir
@@ -1,11 +1,35 @@
 """Builders for C-CDA XML elements."""
 
-from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
-from ccdakit.builders.demographics import Address, Telecom
-from ccdakit.builders.document import ClinicalDocument
+from typing import TYPE_CHECKING
 
-# Document-level builders for specific document types
-from ccdakit.builders.documents import ContinuityOfCareDocument, DischargeSummary
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
+    from ccdakit.builders.demographics import Address, Telecom
+    from ccdakit.builders.document import ClinicalDocument
+    from ccdakit.builders.documents import ContinuityOfCareDocument, DischargeSummary
+    from ccdakit.builders.partition import DocumentPartitioner
+    from ccdakit.builders.plan import SectionPlan
+
+
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        "Code": "ccdakit.builders.common",
+        "EffectiveTime": "ccdakit.builders.common",
+        "Identifier": "ccdakit.builders.common",
+        "StatusCode": "ccdakit.builders.common",
+        "Address": "ccdakit.builders.demographics",
+        "Telecom": "ccdakit.builders.demographics",
+        "ClinicalDocument": "ccdakit.builders.document",
+        "ContinuityOfCareDocument": "ccdakit.builders.documents",
+        "DischargeSummary": "ccdakit.builders.documents",
+        "DocumentPartitioner": "ccdakit.builders.partition",
+        "SectionPlan": "ccdakit.builders.plan",
+    },
+)
 
 
 __all__ = [
@@ -21,4 +45,6 @@ __all__ = [
     "ClinicalDocument",
     "ContinuityOfCareDocument",
     "DischargeSummary",
+    "DocumentPartitioner",
+    "SectionPlan",
 ]
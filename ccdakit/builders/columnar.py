@@ -0,0 +1,839 @@
+"""Columnar input for the Results and Vital Signs sections.
+
+Lab panels and vital-sign series usually arrive as arrays: thousands of
+values with units, reference ranges and timestamps per patient. Wrapping each
+one in an object that satisfies the result or vital-sign protocols, then
+building it with one builder per entry, formats every value on its own.
+
+ResultColumns and VitalSignColumns take parallel columns instead (lists,
+tuples or NumPy arrays) keyed by the protocol attribute names. Values,
+timestamps and interpretations are formatted for a whole column at once,
+vectorized when NumPy is installed, and the organizers and observations are
+written in one loop without builder objects. Both classes are sequences of
+organizers that satisfy the usual protocols, so ResultsSection and
+VitalSignsSection accept them in place of organizer lists; the narrative is
+rendered from them as usual.
+
+Example:
+    results = ResultColumns(
+        panels={
+            "panel_name": ["Complete Blood Count"],
+            "panel_code": ["58410-2"],
+            "effective_time": [collected],
+        },
+        results={
+            "panel": [0, 0],
+            "test_name": ["WBC", "Hemoglobin"],
+            "test_code": ["6690-2", "718-7"],
+            "value": np.array([7.2, 12.1]),
+            "unit": ["10*3/uL", "g/dL"],
+            "reference_range_low": np.array([4.5, 13.5]),
+            "reference_range_high": np.array([11.0, 17.5]),
+        },
+    )
+    section = ResultsSection(results)  # Hemoglobin interpreted as "L"
+"""
+
+import copy
+import operator
+from collections import abc
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from ccdakit.builders.common import (
+    EFFECTIVE_TIME_TAG,
+    EffectiveTime,
+    append_code,
+    append_identifier,
+    append_status_code,
+    create_default_author_participation,
+    local_utc_offset,
+)
+from ccdakit.builders.entries.result import ResultObservation, ResultOrganizer
+from ccdakit.builders.entries.vital_signs import VitalSignObservation, VitalSignsOrganizer
+from ccdakit.core.base import CDAVersion
+from ccdakit.core.canonical import new_id
+from ccdakit.core.templates import append_templates, template_registry
+
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; columns are then formatted in Python
+    np = None
+
+
+# CDA namespace
+NS = "urn:hl7-org:v3"
+
+_ENTRY_TAG = f"{{{NS}}}entry"
+_ORGANIZER_TAG = f"{{{NS}}}organizer"
+_COMPONENT_TAG = f"{{{NS}}}component"
+_OBSERVATION_TAG = f"{{{NS}}}observation"
+_VALUE_TAG = f"{{{NS}}}value"
+_INTERPRETATION_TAG = f"{{{NS}}}interpretationCode"
+_XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+
+# Root of the generated entry ids (as in the entry builders)
+_ID_ROOT = "2.16.840.1.113883.19"
+
+# datetime64 units finer than datetime can hold
+_SUB_MICROSECOND = ("ns", "ps", "fs", "as")
+
+Columns = Mapping[str, Any]
+
+
+def format_numbers(values: Any) -> List[Optional[str]]:
+    """
+    Format a column of measurements as PQ value strings.
+
+    Strings pass through unchanged; numbers are written in their shortest
+    round-trip form ("98.6", "120"). Numeric NumPy arrays are converted in one
+    vectorized call.
+
+    Args:
+        values: Sequence or NumPy array of numbers or strings
+
+    Returns:
+        One string per value (None for None and NaN)
+    """
+    if _is_array(values) and values.dtype.kind in "iuf":
+        text = values.astype(str).tolist()
+        if values.dtype.kind == "f":
+            for row in np.flatnonzero(np.isnan(values)).tolist():
+                text[row] = None
+        return text
+    return [_format_number(value) for value in _to_list(values)]
+
+
+def format_timestamps(values: Any) -> List[Optional[str]]:
+    """
+    Format a column of dates and datetimes as CDA timestamps.
+
+    Matches EffectiveTime: dates as YYYYMMDD, datetimes as YYYYMMDDHHMMSS
+    with their UTC offset (the local offset when they have no tzinfo).
+    datetime64 arrays are formatted in one vectorized pass; other columns
+    format each distinct value once.
+
+    Args:
+        values: Sequence of date/datetime objects or a datetime64 array
+
+    Returns:
+        One string per value (None for None and NaT)
+    """
+    if _is_array(values) and values.dtype.kind == "M":
+        return _format_datetime64(values)
+    cache: Dict[Any, Optional[str]] = {None: None}
+    formatted = []
+    for value in _to_list(values):
+        text = cache.get(value)
+        if text is None and value is not None:
+            text = cache[value] = EffectiveTime._format_datetime(value)
+        formatted.append(text)
+    return formatted
+
+
+def derive_interpretations(
+    values: Any,
+    low: Any = None,
+    high: Any = None,
+    labels: Tuple[str, str, str] = ("L", "N", "H"),
+) -> List[Optional[str]]:
+    """
+    Classify each value against its reference range.
+
+    Values below the low bound get the first label, above the high bound the
+    last, anything else in between the middle one. Rows with a non-numeric
+    value, or without either bound, get None.
+
+    Args:
+        values: Measured values (numbers or numeric strings)
+        low: Lower bounds (None for no column)
+        high: Upper bounds (None for no column)
+        labels: (low, normal, high) labels
+
+    Returns:
+        One label or None per value
+    """
+    size = len(values)
+    if np is not None:
+        value = _float_array(values, size)
+        lower = _float_array(low, size)
+        upper = _float_array(high, size)
+        derived = np.where(
+            value < lower, labels[0], np.where(value > upper, labels[2], labels[1])
+        ).astype(object)
+        derived[np.isnan(value) | (np.isnan(lower) & np.isnan(upper))] = None
+        return derived.tolist()
+
+    derived = []
+    for value, lower, upper in zip(_floats(values), _floats(low, size), _floats(high, size)):
+        if value is None or (lower is None and upper is None):
+            derived.append(None)
+        elif lower is not None and value < lower:
+            derived.append(labels[0])
+        elif upper is not None and value > upper:
+            derived.append(labels[2])
+        else:
+            derived.append(labels[1])
+    return derived
+
+
+def _is_array(values: Any) -> bool:
+    """Check for a NumPy array (False when NumPy is not installed)."""
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _to_list(values: Any, size: int = 0) -> List[Any]:
+    """Get a column as a list of Python objects (None for a missing column)."""
+    if values is None:
+        return [None] * size
+    if _is_array(values):
+        if values.dtype.kind == "M" and np.datetime_data(values.dtype)[0] in _SUB_MICROSECOND:
+            # tolist() gives ints for units datetime cannot hold
+            values = values.astype("datetime64[us]")
+        return values.tolist()
+    return list(values)
+
+
+def _column(columns: Columns, name: str, size: int) -> List[Any]:
+    """Get an optional column as a list (all None if absent)."""
+    return _to_list(columns.get(name), size)
+
+
+def _format_number(value: Any) -> Optional[str]:
+    """Format one measurement (see format_numbers)."""
+    if value is None or isinstance(value, str):
+        return value
+    if value != value:  # NaN
+        return None
+    return str(value)
+
+
+def _format_datetime64(values: Any) -> List[Optional[str]]:
+    """Format a datetime64 array the way EffectiveTime formats naive values."""
+    if np.datetime_data(values.dtype)[0] in ("Y", "M", "W", "D"):
+        text = np.char.replace(np.datetime_as_string(values, unit="D"), "-", "")
+    else:
+        text = np.datetime_as_string(values, unit="s")
+        for separator in ("-", ":", "T"):
+            text = np.char.replace(text, separator, "")
+        text = np.char.add(text, local_utc_offset())
+    formatted = text.tolist()
+    for row in np.flatnonzero(np.isnat(values)).tolist():
+        formatted[row] = None
+    return formatted
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    """Convert a value to float (None if missing, NaN or not numeric)."""
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number
+
+
+def _floats(values: Any, size: int = 0) -> List[Optional[float]]:
+    """Get a column as floats (None where not numeric)."""
+    return [_parse_float(value) for value in _to_list(values, size)]
+
+
+def _float_array(values: Any, size: int) -> Any:
+    """Get a column as a float array (NaN where not numeric)."""
+    if values is None:
+        return np.full(size, np.nan)
+    if _is_array(values) and values.dtype.kind in "iuf":
+        return values.astype(float)
+    return np.array([np.nan if v is None else v for v in _floats(values)], dtype=float)
+
+
+def _column_size(columns: Columns, required: Sequence[str], kind: str) -> int:
+    """Check required columns exist and all columns have one length."""
+    missing = [name for name in required if name not in columns]
+    if missing:
+        raise ValueError(f"Missing {kind} columns: {', '.join(missing)}")
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"{kind.capitalize()} columns have different lengths: {sorted(lengths)}")
+    return lengths.pop() if lengths else 0
+
+
+def _check_present(values: List[Any], name: str, kind: str) -> None:
+    """Raise if a required column has missing values."""
+    rows = [row for row, value in enumerate(values) if value is None or value == ""]
+    if rows:
+        raise ValueError(f"Missing {name} in {kind} rows {rows[:5]}")
+
+
+def _group_rows(parents: List[Any], count: int, kind: str) -> List[List[int]]:
+    """Group child rows by the index of their parent row, keeping row order."""
+    members: List[List[int]] = [[] for _ in range(count)]
+    for row, parent in enumerate(parents):
+        try:
+            members[operator.index(parent)].append(row)
+        except (TypeError, IndexError):
+            raise ValueError(
+                f"{kind} row {row} refers to {parent!r}, not one of {count} rows"
+            ) from None
+    return members
+
+
+def _mapped(values: List[Optional[str]], mapping: Mapping[str, str], default: Any) -> List[Any]:
+    """Map each distinct value once (default(value) for unknown values)."""
+    cache: Dict[Optional[str], Any] = {None: None}
+    mapped = []
+    for value in values:
+        if value not in cache:
+            cache[value] = mapping.get(value.lower(), default(value))
+        mapped.append(cache[value])
+    return mapped
+
+
+def _templates(builder: type, version: CDAVersion) -> Tuple[etree._Element, ...]:
+    """Get a builder's compiled templateIds for a version."""
+    prototypes = template_registry.compiled(builder).prototypes(version)
+    if prototypes is None:
+        raise ValueError(f"Version {version.value} not supported for {builder.__name__}")
+    return prototypes
+
+
+def _append_time(parent: etree._Element, formatted: Optional[str]) -> None:
+    """Append an effectiveTime with a preformatted value."""
+    if formatted is None:
+        etree.SubElement(parent, EFFECTIVE_TIME_TAG)
+    else:
+        etree.SubElement(parent, EFFECTIVE_TIME_TAG, value=formatted)
+
+
+class _Row:
+    """One row of a column table, read through the protocol attribute names."""
+
+    __slots__ = ("_columns", "_row", "_children")
+
+    def __init__(
+        self,
+        columns: Dict[str, List[Any]],
+        row: int,
+        children: Optional[Tuple[str, List["_Row"]]] = None,
+    ) -> None:
+        self._columns = columns
+        self._row = row
+        self._children = children
+
+    def __getattr__(self, name: str) -> Any:
+        if self._children is not None and name == self._children[0]:
+            return self._children[1]
+        try:
+            return self._columns[name][self._row]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self) -> str:
+        return f"<row {self._row}>"
+
+
+class _ColumnOrganizers(abc.Sequence):
+    """Organizer rows with their child rows, as a sequence of protocol objects."""
+
+    # Attribute under which organizer rows list their child rows
+    CHILDREN = ""
+
+    def __init__(self, parents: Dict[str, List[Any]], children: Dict[str, List[Any]]) -> None:
+        self._parents = parents
+        self._children = children
+        self._members: List[List[int]] = []
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        rows = [_Row(self._children, row) for row in self._members[index]]
+        return _Row(self._parents, index, (self.CHILDREN, rows))
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def size(self) -> int:
+        """Get the number of observations."""
+        return sum(len(rows) for rows in self._members)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {len(self)} organizers, {self.size} observations>"
+
+
+class ResultColumns(_ColumnOrganizers):
+    """
+    Lab results as parallel columns, grouped into panels.
+
+    Panel columns: panel_name, panel_code, effective_time (required) and
+    status (default "completed").
+
+    Result columns: panel (index of the result's panel row), test_name,
+    test_code, value (required); unit, status, effective_time (default: the
+    panel's), value_type, interpretation, reference_range_low,
+    reference_range_high and reference_range_unit. Values and reference
+    ranges may be numbers or strings.
+
+    With interpret=True, rows without an interpretation get H, L or N from
+    their reference range.
+    """
+
+    CHILDREN = "results"
+
+    PANEL_REQUIRED = ("panel_name", "panel_code", "effective_time")
+    RESULT_REQUIRED = ("panel", "test_name", "test_code", "value")
+    RESULT_OPTIONAL = (
+        "unit",
+        "status",
+        "effective_time",
+        "value_type",
+        "interpretation",
+        "reference_range_low",
+        "reference_range_high",
+        "reference_range_unit",
+    )
+
+    def __init__(self, panels: Columns, results: Columns, interpret: bool = True) -> None:
+        """
+        Format result columns.
+
+        Args:
+            panels: Columns of the result organizers, keyed by attribute name
+            results: Columns of the result observations, keyed by attribute name
+            interpret: Derive missing interpretations from reference ranges
+
+        Raises:
+            ValueError: If a required column or value is missing, columns differ
+                in length, or a result refers to a panel that does not exist
+        """
+        panel_count = _column_size(panels, self.PANEL_REQUIRED, "panel")
+        result_count = _column_size(results, self.RESULT_REQUIRED, "result")
+
+        parents = {name: _to_list(values) for name, values in panels.items()}
+        for name in self.PANEL_REQUIRED:
+            _check_present(parents[name], name, "panel")
+        parents["status"] = [s or "completed" for s in _column(panels, "status", panel_count)]
+
+        children = {name: _column(results, name, result_count) for name in self.RESULT_OPTIONAL}
+        children["test_name"] = _to_list(results["test_name"])
+        children["test_code"] = _to_list(results["test_code"])
+        children["value"] = format_numbers(results["value"])
+        for name in ("reference_range_low", "reference_range_high"):
+            if name in results:
+                children[name] = format_numbers(results[name])
+        for name in ("test_name", "test_code", "value"):
+            _check_present(children[name], name, "result")
+        children["status"] = [s or "completed" for s in children["status"]]
+
+        super().__init__(parents, children)
+        panel = _to_list(results["panel"])
+        self._members = _group_rows(panel, panel_count, "Result")
+
+        if "effective_time" in results:
+            children["effective_time"] = _to_list(results["effective_time"])
+            times = format_timestamps(results["effective_time"])
+        else:
+            # Results default to their panel's time
+            panel_times = format_timestamps(panels["effective_time"])
+            children["effective_time"] = [parents["effective_time"][p] for p in panel]
+            times = [panel_times[p] for p in panel]
+
+        if interpret:
+            derived = derive_interpretations(
+                results["value"],
+                results.get("reference_range_low"),
+                results.get("reference_range_high"),
+            )
+            children["interpretation"] = [
+                given if given else computed
+                for given, computed in zip(children["interpretation"], derived)
+            ]
+
+        # Attribute values written to the entries, in entry order
+        self._panel_times = format_timestamps(panels["effective_time"])
+        self._panel_statuses = _mapped(
+            parents["status"], ResultOrganizer.STATUS_CODES, lambda _: "completed"
+        )
+        self._times = times
+        self._statuses = _mapped(
+            children["status"], ResultObservation.STATUS_CODES, lambda _: "completed"
+        )
+        self._interpretations = _mapped(
+            children["interpretation"], ResultObservation.INTERPRETATION_CODES, str.upper
+        )
+        self._value_types = [
+            value_type.upper() if value_type else "PQ" if unit else "ST"
+            for value_type, unit in zip(children["value_type"], children["unit"])
+        ]
+
+    def append_entries(self, section: etree._Element, version: CDAVersion) -> None:
+        """
+        Append one entry with a Result Organizer per panel.
+
+        Writes the same XML as ResultOrganizer and ResultObservation. The
+        first observation of each shape (value type and optional parts
+        present) is built; later ones are copied from it and filled in.
+
+        Args:
+            section: section element
+            version: C-CDA version
+
+        Raises:
+            ValueError: If version not supported
+        """
+        organizer_templates = _templates(ResultOrganizer, version)
+        observation_templates = _templates(ResultObservation, version)
+        first = len(observation_templates)
+        skeletons: Dict[Tuple[Any, ...], etree._Element] = {}
+
+        panel_names = self._parents["panel_name"]
+        panel_codes = self._parents["panel_code"]
+        columns = self._children
+        shapes = zip(
+            self._value_types,
+            columns["unit"],
+            self._times,
+            self._interpretations,
+            columns["reference_range_low"],
+            columns["reference_range_high"],
+            columns["reference_range_unit"],
+        )
+        shapes = [
+            (value_type, bool(unit), time is None, bool(code), bool(low), bool(high), bool(ru))
+            for value_type, unit, time, code, low, high, ru in shapes
+        ]
+
+        for index, rows in enumerate(self._members):
+            entry = etree.SubElement(section, _ENTRY_TAG, typeCode="DRIV")
+            organizer = etree.SubElement(entry, _ORGANIZER_TAG, classCode="CLUSTER", moodCode="EVN")
+            append_templates(organizer, organizer_templates)
+            append_identifier(organizer, root=_ID_ROOT, extension=new_id())
+            append_code(
+                organizer,
+                code=panel_codes[index],
+                system=ResultObservation.LOINC_OID,
+                system_name="LOINC",
+                display_name=panel_names[index],
+            )
+            append_status_code(organizer, self._panel_statuses[index])
+            _append_time(organizer, self._panel_times[index])
+
+            for row in rows:
+                component = etree.SubElement(organizer, _COMPONENT_TAG)
+                skeleton = skeletons.get(shapes[row])
+                if skeleton is None:
+                    skeletons[shapes[row]] = self._append_observation(
+                        component, row, observation_templates
+                    )
+                else:
+                    # copy.copy() of an lxml element copies its whole subtree
+                    observation = copy.copy(skeleton)
+                    component.append(observation)
+                    self._fill_observation(observation, row, first)
+
+    def _append_observation(
+        self, component: etree._Element, row: int, templates: Tuple[etree._Element, ...]
+    ) -> etree._Element:
+        """Build one Result Observation (see ResultObservation.build)."""
+        columns = self._children
+        observation = etree.SubElement(component, _OBSERVATION_TAG, classCode="OBS", moodCode="EVN")
+        append_templates(observation, templates)
+        append_identifier(observation, root=_ID_ROOT, extension=new_id())
+        append_code(
+            observation,
+            code=columns["test_code"][row],
+            system=ResultObservation.LOINC_OID,
+            system_name="LOINC",
+            display_name=columns["test_name"][row],
+        )
+        append_status_code(observation, self._statuses[row])
+        _append_time(observation, self._times[row])
+
+        value_type = self._value_types[row]
+        value = columns["value"][row]
+        unit = columns["unit"][row]
+        if value_type == "PQ":
+            value_elem = etree.SubElement(
+                observation, _VALUE_TAG, {_XSI_TYPE: "PQ", "value": value}
+            )
+            if unit:
+                value_elem.set("unit", unit)
+        elif value_type == "CD":
+            etree.SubElement(
+                observation,
+                _VALUE_TAG,
+                {
+                    _XSI_TYPE: "CD",
+                    "code": value,
+                    "codeSystem": ResultObservation.SNOMED_CT_OID,
+                    "displayName": columns["test_name"][row],
+                },
+            )
+        else:
+            value_elem = etree.SubElement(observation, _VALUE_TAG, {_XSI_TYPE: "ST"})
+            value_elem.text = value
+
+        if self._interpretations[row]:
+            etree.SubElement(
+                observation,
+                _INTERPRETATION_TAG,
+                code=self._interpretations[row],
+                codeSystem=ResultObservation.HL7_INTERPRETATION_OID,
+            )
+
+        low = columns["reference_range_low"][row]
+        high = columns["reference_range_high"][row]
+        if low or high:
+            range_unit = columns["reference_range_unit"][row]
+            reference_range = etree.SubElement(observation, f"{{{NS}}}referenceRange")
+            observation_range = etree.SubElement(reference_range, f"{{{NS}}}observationRange")
+            interval = etree.SubElement(observation_range, _VALUE_TAG, {_XSI_TYPE: "IVL_PQ"})
+            for tag, bound in ((f"{{{NS}}}low", low), (f"{{{NS}}}high", high)):
+                if bound:
+                    limit = etree.SubElement(interval, tag, value=bound)
+                    if range_unit:
+                        limit.set("unit", range_unit)
+        return observation
+
+    def _fill_observation(self, observation: etree._Element, row: int, first: int) -> None:
+        """Overwrite the row values of an observation copied from its shape's skeleton."""
+        columns = self._children
+        children = observation[first:]
+        identifier, code, status, time, value = children[:5]
+        identifier.set("extension", new_id())
+        code.set("code", columns["test_code"][row])
+        code.set("displayName", columns["test_name"][row])
+        status.set("code", self._statuses[row])
+        if self._times[row] is not None:
+            time.set("value", self._times[row])
+
+        value_type = self._value_types[row]
+        if value_type == "PQ":
+            value.set("value", columns["value"][row])
+            if columns["unit"][row]:
+                value.set("unit", columns["unit"][row])
+        elif value_type == "CD":
+            value.set("code", columns["value"][row])
+            value.set("displayName", columns["test_name"][row])
+        else:
+            value.text = columns["value"][row]
+
+        rest = children[5:]
+        if self._interpretations[row]:
+            rest.pop(0).set("code", self._interpretations[row])
+        if rest:
+            # referenceRange/observationRange/value
+            limits = iter(rest[0][0][0])
+            range_unit = columns["reference_range_unit"][row]
+            for bound in (
+                columns["reference_range_low"][row],
+                columns["reference_range_high"][row],
+            ):
+                if bound:
+                    limit = next(limits)
+                    limit.set("value", bound)
+                    if range_unit:
+                        limit.set("unit", range_unit)
+
+
+class VitalSignColumns(_ColumnOrganizers):
+    """
+    Vital signs as parallel columns, grouped into organizers.
+
+    Organizer columns: date (required).
+
+    Vital sign columns: organizer (index of the sign's organizer row), type,
+    code, value, unit (required); date (default: the organizer's),
+    interpretation, reference_range_low and reference_range_high. The
+    reference range is only used to derive interpretations; the Vital Sign
+    Observation builder writes no referenceRange.
+
+    With interpret=True, rows without an interpretation get "High", "Low" or
+    "Normal" from their reference range.
+    """
+
+    CHILDREN = "vital_signs"
+
+    ORGANIZER_REQUIRED = ("date",)
+    VITAL_SIGN_REQUIRED = ("organizer", "type", "code", "value", "unit")
+
+    # Interpretation codes (as in VitalSignObservation)
+    INTERPRETATION_CODES = {
+        "normal": "N",
+        "high": "H",
+        "low": "L",
+        "critical high": "HH",
+        "critical low": "LL",
+    }
+
+    def __init__(self, organizers: Columns, vital_signs: Columns, interpret: bool = True) -> None:
+        """
+        Format vital sign columns.
+
+        Args:
+            organizers: Columns of the vital signs organizers, keyed by attribute name
+            vital_signs: Columns of the vital sign observations, keyed by attribute name
+            interpret: Derive missing interpretations from reference ranges
+
+        Raises:
+            ValueError: If a required column or value is missing, columns differ
+                in length, or a vital sign refers to an organizer that does not exist
+        """
+        organizer_count = _column_size(organizers, self.ORGANIZER_REQUIRED, "organizer")
+        sign_count = _column_size(vital_signs, self.VITAL_SIGN_REQUIRED, "vital sign")
+
+        parents = {name: _to_list(organizers[name]) for name in organizers}
+        _check_present(parents["date"], "date", "organizer")
+
+        children = {name: _to_list(vital_signs[name]) for name in ("type", "code", "unit")}
+        children["value"] = format_numbers(vital_signs["value"])
+        children["interpretation"] = _column(vital_signs, "interpretation", sign_count)
+        for name in ("type", "code", "value", "unit"):
+            _check_present(children[name], name, "vital sign")
+
+        super().__init__(parents, children)
+        organizer = _to_list(vital_signs["organizer"])
+        self._members = _group_rows(organizer, organizer_count, "Vital sign")
+
+        if "date" in vital_signs:
+            children["date"] = _to_list(vital_signs["date"])
+        else:
+            children["date"] = [parents["date"][o] for o in organizer]
+
+        if interpret:
+            derived = derive_interpretations(
+                vital_signs["value"],
+                vital_signs.get("reference_range_low"),
+                vital_signs.get("reference_range_high"),
+                labels=("Low", "Normal", "High"),
+            )
+            children["interpretation"] = [
+                given if given else computed
+                for given, computed in zip(children["interpretation"], derived)
+            ]
+
+        # Attribute values written to the entries, in entry order
+        self._organizer_times = format_timestamps(organizers["date"])
+        self._times = (
+            format_timestamps(vital_signs["date"])
+            if "date" in vital_signs
+            else [self._organizer_times[o] for o in organizer]
+        )
+        self._interpretations = _mapped(
+            children["interpretation"], self.INTERPRETATION_CODES, lambda _: "N"
+        )
+
+    def append_entries(self, section: etree._Element, version: CDAVersion) -> None:
+        """
+        Append one entry with a Vital Signs Organizer per organizer row.
+
+        Writes the same XML as VitalSignsOrganizer and VitalSignObservation.
+        The first observation of each shape is built; later ones are copied
+        from it and filled in.
+
+        Args:
+            section: section element
+            version: C-CDA version
+
+        Raises:
+            ValueError: If version not supported
+        """
+        organizer_templates = _templates(VitalSignsOrganizer, version)
+        observation_templates = _templates(VitalSignObservation, version)
+        first = len(observation_templates)
+        skeletons: Dict[Tuple[bool, bool], etree._Element] = {}
+        organizer_dates = self._parents["date"]
+        interpretations = self._children["interpretation"]
+
+        for index, rows in enumerate(self._members):
+            entry = etree.SubElement(section, _ENTRY_TAG, typeCode="DRIV")
+            organizer = etree.SubElement(entry, _ORGANIZER_TAG, classCode="CLUSTER", moodCode="EVN")
+            append_templates(organizer, organizer_templates)
+            append_identifier(organizer, root=_ID_ROOT, extension=new_id())
+            etree.SubElement(
+                organizer,
+                f"{{{NS}}}code",
+                code=VitalSignsOrganizer.VITAL_SIGNS_PANEL_CODE,
+                codeSystem=VitalSignObservation.LOINC_OID,
+                codeSystemName="LOINC",
+                displayName="Vital signs",
+            )
+            append_status_code(organizer, "completed")
+            _append_time(organizer, self._organizer_times[index])
+            organizer.append(create_default_author_participation(organizer_dates[index]))
+
+            for row in rows:
+                component = etree.SubElement(organizer, _COMPONENT_TAG)
+                shape = (self._times[row] is None, bool(interpretations[row]))
+                skeleton = skeletons.get(shape)
+                if skeleton is None:
+                    skeletons[shape] = self._append_observation(
+                        component, row, observation_templates
+                    )
+                else:
+                    observation = copy.copy(skeleton)
+                    component.append(observation)
+                    self._fill_observation(observation, row, first)
+
+    def _append_observation(
+        self, component: etree._Element, row: int, templates: Tuple[etree._Element, ...]
+    ) -> etree._Element:
+        """Build one Vital Sign Observation (see VitalSignObservation.build)."""
+        columns = self._children
+        observation = etree.SubElement(component, _OBSERVATION_TAG, classCode="OBS", moodCode="EVN")
+        append_templates(observation, templates)
+        append_identifier(observation, root=_ID_ROOT, extension=new_id())
+        append_code(
+            observation,
+            code=columns["code"][row],
+            system=VitalSignObservation.LOINC_OID,
+            system_name="LOINC",
+            display_name=columns["type"][row],
+        )
+        append_status_code(observation, "completed")
+        _append_time(observation, self._times[row])
+        etree.SubElement(
+            observation,
+            _VALUE_TAG,
+            {_XSI_TYPE: "PQ", "value": columns["value"][row], "unit": columns["unit"][row]},
+        )
+        if columns["interpretation"][row]:
+            etree.SubElement(
+                observation,
+                _INTERPRETATION_TAG,
+                code=self._interpretations[row],
+                codeSystem=ResultObservation.HL7_INTERPRETATION_OID,
+                displayName=columns["interpretation"][row],
+            )
+        observation.append(create_default_author_participation(columns["date"][row]))
+        return observation
+
+    def _fill_observation(self, observation: etree._Element, row: int, first: int) -> None:
+        """Overwrite the row values of an observation copied from its shape's skeleton."""
+        columns = self._children
+        children = observation[first:]
+        identifier, code, _, time, value = children[:5]
+        identifier.set("extension", new_id())
+        code.set("code", columns["code"][row])
+        code.set("displayName", columns["type"][row])
+        value.set("value", columns["value"][row])
+        value.set("unit", columns["unit"][row])
+        if columns["interpretation"][row]:
+            interpretation = children[5]
+            interpretation.set("code", self._interpretations[row])
+            interpretation.set("displayName", columns["interpretation"][row])
+        if self._times[row] is not None:
+            time.set("value", self._times[row])
+            # author/time
+            children[-1][1].set("value", self._times[row])
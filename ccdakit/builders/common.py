@@ -1,20 +1,32 @@
 """Common reusable builders for C-CDA elements."""
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from lxml import etree
 
 from ccdakit.core.base import CDAElement
+from ccdakit.core.canonical import fixed_utc_offset, now
 
 
 # CDA namespace for element creation
 NS = "urn:hl7-org:v3"
 
+# Qualified tag names, built once rather than per element
+CODE_TAG = f"{{{NS}}}code"
+EFFECTIVE_TIME_TAG = f"{{{NS}}}effectiveTime"
+ID_TAG = f"{{{NS}}}id"
+STATUS_CODE_TAG = f"{{{NS}}}statusCode"
+_LOW_TAG = f"{{{NS}}}low"
+_HIGH_TAG = f"{{{NS}}}high"
+_XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+
 
 class Code(CDAElement):
     """Reusable code element builder."""
 
+    __slots__ = ("code", "system", "display_name", "null_flavor")
+
     # Standard code system OIDs
     # NOTE: This dictionary duplicates CodeSystemRegistry.SYSTEMS to avoid circular imports.
     # The Code class is a core builder used throughout the codebase, and importing
@@ -116,32 +128,16 @@ class Code(CDAElement):
         Raises:
             ValueError: If both code and null_flavor are missing
         """
-        elem = etree.Element(f"{{{NS}}}code")
-
-        if self.null_flavor:
-            elem.set("nullFlavor", self.null_flavor)
-        else:
-            if not self.code or not self.system:
-                raise ValueError("code and system required when null_flavor not provided")
-
-            elem.set("code", self.code)
-
-            # Handle system OID lookup
-            if self.system in self.SYSTEM_OIDS:
-                elem.set("codeSystem", self.SYSTEM_OIDS[self.system])
-                elem.set("codeSystemName", self.system)
-            else:
-                elem.set("codeSystem", self.system)
-
-            if self.display_name:
-                elem.set("displayName", self.display_name)
-
-        return elem
+        return etree.Element(
+            CODE_TAG, _code_attrib(self.code, self.system, self.display_name, self.null_flavor)
+        )
 
 
 class EffectiveTime(CDAElement):
     """Reusable effectiveTime element with support for points and intervals."""
 
+    __slots__ = ("value", "low", "high", "null_flavor", "include_both_value_and_low")
+
     def __init__(
         self,
         value: Optional[datetime] = None,
@@ -176,36 +172,15 @@ class EffectiveTime(CDAElement):
         Returns:
             lxml Element for effectiveTime
         """
-        elem = etree.Element(f"{{{NS}}}effectiveTime")
-
-        if self.null_flavor:
-            elem.set("nullFlavor", self.null_flavor)
-        elif self.include_both_value_and_low and self.value:
-            # Special case for CONF:1098-32775/32776: include both @value and <low>
-            elem.set("value", self._format_datetime(self.value))
-            low = etree.SubElement(elem, f"{{{NS}}}low")
-            low.set("value", self._format_datetime(self.value))
-        elif self.value:
-            # Point in time
-            elem.set("value", self._format_datetime(self.value))
-        else:
-            # Interval - MUST have xsi:type="IVL_TS" when using low/high children
-            # This is required by XSD schema for proper type validation
-            if self.low or self.high:
-                elem.set("{http://www.w3.org/2001/XMLSchema-instance}type", "IVL_TS")
-
-            if self.low:
-                low = etree.SubElement(elem, f"{{{NS}}}low")
-                low.set("value", self._format_datetime(self.low))
-
-            if self.high:
-                high = etree.SubElement(elem, f"{{{NS}}}high")
-                high.set("value", self._format_datetime(self.high))
-            elif self.low and not self.high:
-                # Ongoing - use nullFlavor for high
-                high = etree.SubElement(elem, f"{{{NS}}}high")
-                high.set("nullFlavor", "UNK")
-
+        elem = etree.Element(EFFECTIVE_TIME_TAG)
+        _fill_effective_time(
+            elem,
+            self.value,
+            self.low,
+            self.high,
+            self.null_flavor,
+            self.include_both_value_and_low,
+        )
         return elem
 
     @staticmethod
@@ -240,25 +215,14 @@ class EffectiveTime(CDAElement):
             return f"{base_time}{offset}"
         else:
             # No timezone info - assume local time and add offset
-            # For consistency, use UTC-5 (EST) as default
-            import time
-            if time.daylight:
-                # Daylight saving time
-                offset_seconds = -time.altzone
-            else:
-                # Standard time
-                offset_seconds = -time.timezone
-
-            # Convert to +/-HHMM format
-            offset_hours = offset_seconds // 3600
-            offset_minutes = abs(offset_seconds % 3600) // 60
-            offset_str = f"{offset_hours:+03d}{offset_minutes:02d}"
-            return f"{base_time}{offset_str}"
+            return f"{base_time}{local_utc_offset()}"
 
 
 class Identifier(CDAElement):
     """Reusable ID element builder."""
 
+    __slots__ = ("root", "extension", "null_flavor")
+
     def __init__(
         self,
         root: str,
@@ -287,21 +251,14 @@ class Identifier(CDAElement):
         Returns:
             lxml Element for id
         """
-        elem = etree.Element(f"{{{NS}}}id")
-
-        if self.null_flavor:
-            elem.set("nullFlavor", self.null_flavor)
-        else:
-            elem.set("root", self.root)
-            if self.extension:
-                elem.set("extension", self.extension)
-
-        return elem
+        return etree.Element(ID_TAG, _identifier_attrib(self.root, self.extension, self.null_flavor))
 
 
 class StatusCode(CDAElement):
     """Reusable statusCode element builder."""
 
+    __slots__ = ("code",)
+
     def __init__(self, code: str, **kwargs):
         """
         Initialize StatusCode builder.
@@ -320,9 +277,205 @@ class StatusCode(CDAElement):
         Returns:
             lxml Element for statusCode
         """
-        elem = etree.Element(f"{{{NS}}}statusCode")
-        elem.set("code", self.code)
-        return elem
+        return etree.Element(STATUS_CODE_TAG, code=self.code)
+
+
+def local_utc_offset() -> str:
+    """
+    Get the local UTC offset appended to datetimes without tzinfo.
+
+    Returns:
+        Offset in +HHMM / -HHMM format (daylight saving offset if the local
+        zone has one; the fixed offset inside canonical_build())
+    """
+    import time
+
+    fixed = fixed_utc_offset()
+    if fixed is not None:
+        return fixed
+    offset_seconds = -time.altzone if time.daylight else -time.timezone
+    offset_hours = offset_seconds // 3600
+    offset_minutes = abs(offset_seconds % 3600) // 60
+    return f"{offset_hours:+03d}{offset_minutes:02d}"
+
+
+# Functional emitters
+#
+# An entry builder that creates Code, StatusCode, Identifier and EffectiveTime
+# objects spends much of its time on builder objects discarded right after
+# to_element(). The append_* functions write the same elements straight onto
+# a parent; the builder classes above delegate to the same helpers, so both
+# paths produce identical XML.
+
+
+def _code_attrib(
+    code: Optional[str],
+    system: Optional[str],
+    display_name: Optional[str] = None,
+    null_flavor: Optional[str] = None,
+    system_name: Optional[str] = None,
+) -> Dict[str, str]:
+    """Get the attributes of a code element (see Code.build)."""
+    if null_flavor:
+        return {"nullFlavor": null_flavor}
+    if not code or not system:
+        raise ValueError("code and system required when null_flavor not provided")
+
+    attrib = {"code": code}
+    if system_name is None:
+        oid = Code.SYSTEM_OIDS.get(system)
+        if oid is None:
+            attrib["codeSystem"] = system
+        else:
+            attrib["codeSystem"] = oid
+            attrib["codeSystemName"] = system
+    else:
+        attrib["codeSystem"] = system
+        attrib["codeSystemName"] = system_name
+    if display_name:
+        attrib["displayName"] = display_name
+    return attrib
+
+
+def _identifier_attrib(
+    root: Optional[str], extension: Optional[str] = None, null_flavor: Optional[str] = None
+) -> Dict[str, str]:
+    """Get the attributes of an id element (see Identifier.build)."""
+    if null_flavor:
+        return {"nullFlavor": null_flavor}
+    if extension:
+        return {"root": root, "extension": extension}
+    return {"root": root}
+
+
+def _fill_effective_time(
+    elem: etree._Element,
+    value: Optional[datetime] = None,
+    low: Optional[datetime] = None,
+    high: Optional[datetime] = None,
+    null_flavor: Optional[str] = None,
+    include_both_value_and_low: bool = False,
+) -> None:
+    """Set the attributes and children of an effectiveTime element."""
+    format_datetime = EffectiveTime._format_datetime
+    if null_flavor:
+        elem.set("nullFlavor", null_flavor)
+    elif include_both_value_and_low and value:
+        # Special case for CONF:1098-32775/32776: include both @value and <low>
+        formatted = format_datetime(value)
+        elem.set("value", formatted)
+        etree.SubElement(elem, _LOW_TAG, value=formatted)
+    elif value:
+        # Point in time
+        elem.set("value", format_datetime(value))
+    else:
+        # Interval - MUST have xsi:type="IVL_TS" when using low/high children
+        # This is required by XSD schema for proper type validation
+        if low or high:
+            elem.set(_XSI_TYPE, "IVL_TS")
+        if low:
+            etree.SubElement(elem, _LOW_TAG, value=format_datetime(low))
+        if high:
+            etree.SubElement(elem, _HIGH_TAG, value=format_datetime(high))
+        elif low:
+            # Ongoing - use nullFlavor for high
+            etree.SubElement(elem, _HIGH_TAG, nullFlavor="UNK")
+
+
+def append_code(
+    parent: etree._Element,
+    code: Optional[str] = None,
+    system: Optional[str] = None,
+    display_name: Optional[str] = None,
+    null_flavor: Optional[str] = None,
+    system_name: Optional[str] = None,
+    tag: str = CODE_TAG,
+) -> etree._Element:
+    """
+    Append a code element to parent.
+
+    Args:
+        parent: Element to append to
+        code: Code value
+        system: Code system name (looked up in Code.SYSTEM_OIDS) or OID
+        display_name: Human-readable display name
+        null_flavor: Null flavor if code is not available
+        system_name: codeSystemName for a system given as an already resolved
+            OID, which skips the name lookup
+        tag: Qualified tag name (e.g. for value or translation elements)
+
+    Returns:
+        The appended element
+
+    Raises:
+        ValueError: If both code and null_flavor are missing
+    """
+    return etree.SubElement(
+        parent, tag, _code_attrib(code, system, display_name, null_flavor, system_name)
+    )
+
+
+def append_status_code(parent: etree._Element, code: str) -> etree._Element:
+    """
+    Append a statusCode element to parent.
+
+    Args:
+        parent: Element to append to
+        code: Status code value (e.g., 'completed', 'active')
+
+    Returns:
+        The appended element
+    """
+    return etree.SubElement(parent, STATUS_CODE_TAG, code=code)
+
+
+def append_identifier(
+    parent: etree._Element,
+    root: Optional[str] = None,
+    extension: Optional[str] = None,
+    null_flavor: Optional[str] = None,
+) -> etree._Element:
+    """
+    Append an id element to parent.
+
+    Args:
+        parent: Element to append to
+        root: OID or UUID root
+        extension: Extension within the root namespace
+        null_flavor: Null flavor if ID is not available
+
+    Returns:
+        The appended element
+    """
+    return etree.SubElement(parent, ID_TAG, _identifier_attrib(root, extension, null_flavor))
+
+
+def append_effective_time(
+    parent: etree._Element,
+    value: Optional[datetime] = None,
+    low: Optional[datetime] = None,
+    high: Optional[datetime] = None,
+    null_flavor: Optional[str] = None,
+    include_both_value_and_low: bool = False,
+) -> etree._Element:
+    """
+    Append an effectiveTime element to parent.
+
+    Args:
+        parent: Element to append to
+        value: Point in time
+        low: Start of interval
+        high: End of interval
+        null_flavor: Null flavor if time is not available
+        include_both_value_and_low: Include both @value and a <low> child
+            (for CONF:1098-32775/32776)
+
+    Returns:
+        The appended element
+    """
+    elem = etree.SubElement(parent, EFFECTIVE_TIME_TAG)
+    _fill_effective_time(elem, value, low, high, null_flavor, include_both_value_and_low)
+    return elem
 
 
 def create_default_author_participation(time: Optional[datetime] = None) -> etree.Element:
@@ -343,10 +496,8 @@ def create_default_author_participation(time: Optional[datetime] = None) -> etre
     Returns:
         lxml Element for author participation
     """
-    from datetime import datetime
-
     if time is None:
-        time = datetime.now()
+        time = now()
 
     # Create author element
     author_elem = etree.Element(f"{{{NS}}}author")
@@ -1,5 +1,7 @@
 """Builders for demographic elements (Address, Telecom)."""
 
+from typing import Dict, Optional
+
 from lxml import etree
 
 from ccdakit.core.base import CDAElement
@@ -9,10 +11,21 @@ from ccdakit.protocols.patient import AddressProtocol, TelecomProtocol
 # CDA namespace for element creation
 NS = "urn:hl7-org:v3"
 
+# Qualified tag names, built once rather than per element
+ADDR_TAG = f"{{{NS}}}addr"
+TELECOM_TAG = f"{{{NS}}}telecom"
+_STREET_TAG = f"{{{NS}}}streetAddressLine"
+_CITY_TAG = f"{{{NS}}}city"
+_STATE_TAG = f"{{{NS}}}state"
+_POSTAL_CODE_TAG = f"{{{NS}}}postalCode"
+_COUNTRY_TAG = f"{{{NS}}}country"
+
 
 class Address(CDAElement):
     """Builder for CDA address elements."""
 
+    __slots__ = ("address", "use")
+
     # HL7 AddressUse codes
     USE_CODES = {
         "home": "HP",  # Primary home
@@ -43,40 +56,16 @@ class Address(CDAElement):
         Returns:
             lxml Element for addr
         """
-        elem = etree.Element(f"{{{NS}}}addr")
-
-        # Add use attribute if specified
-        if self.use:
-            use_code = self.USE_CODES.get(self.use, self.use)
-            elem.set("use", use_code)
-
-        # Add street lines
-        for line in self.address.street_lines:
-            street = etree.SubElement(elem, f"{{{NS}}}streetAddressLine")
-            street.text = line
-
-        # Add city
-        city = etree.SubElement(elem, f"{{{NS}}}city")
-        city.text = self.address.city
-
-        # Add state
-        state = etree.SubElement(elem, f"{{{NS}}}state")
-        state.text = self.address.state
-
-        # Add postal code
-        postal = etree.SubElement(elem, f"{{{NS}}}postalCode")
-        postal.text = self.address.postal_code
-
-        # Add country
-        country = etree.SubElement(elem, f"{{{NS}}}country")
-        country.text = self.address.country
-
+        elem = etree.Element(ADDR_TAG)
+        _fill_address(elem, self.address, self.use)
         return elem
 
 
 class Telecom(CDAElement):
     """Builder for CDA telecom (contact) elements."""
 
+    __slots__ = ("telecom",)
+
     # HL7 TelecomUse codes
     USE_CODES = {
         "home": "HP",  # Primary home
@@ -103,18 +92,7 @@ class Telecom(CDAElement):
         Returns:
             lxml Element for telecom
         """
-        elem = etree.Element(f"{{{NS}}}telecom")
-
-        # Build value based on type
-        value = self._build_value()
-        elem.set("value", value)
-
-        # Add use attribute if specified
-        if self.telecom.use:
-            use_code = self.USE_CODES.get(self.telecom.use, self.telecom.use)
-            elem.set("use", use_code)
-
-        return elem
+        return etree.Element(TELECOM_TAG, _telecom_attrib(self.telecom))
 
     def _build_value(self) -> str:
         """
@@ -123,23 +101,89 @@ class Telecom(CDAElement):
         Returns:
             Formatted value string (e.g., 'tel:+1-617-555-1234', 'mailto:foo@example.com')
         """
-        telecom_type = self.telecom.type.lower()
-        value = self.telecom.value
-
-        if telecom_type == "phone":
-            # Format: tel:+1-555-555-5555
-            return f"tel:{value}"
-        elif telecom_type == "fax":
-            # Format: fax:+1-555-555-5555
-            return f"tel:{value}"
-        elif telecom_type == "email":
-            # Format: mailto:user@example.com
-            return f"mailto:{value}"
-        elif telecom_type == "url":
-            # Format: http://example.com or https://example.com
-            if not value.startswith(("http://", "https://")):
-                return f"http://{value}"
-            return value
-        else:
-            # Default: return as-is
-            return value
+        return telecom_value(self.telecom.type, self.telecom.value)
+
+
+def telecom_value(telecom_type: str, value: str) -> str:
+    """
+    Build a telecom value URL from its type.
+
+    Args:
+        telecom_type: Telecom type ('phone', 'fax', 'email', 'url')
+        value: Raw phone number, address or URL
+
+    Returns:
+        Formatted value string (e.g., 'tel:+1-617-555-1234', 'mailto:foo@example.com')
+    """
+    telecom_type = telecom_type.lower()
+
+    if telecom_type == "phone":
+        # Format: tel:+1-555-555-5555
+        return f"tel:{value}"
+    elif telecom_type == "fax":
+        # Format: fax:+1-555-555-5555
+        return f"tel:{value}"
+    elif telecom_type == "email":
+        # Format: mailto:user@example.com
+        return f"mailto:{value}"
+    elif telecom_type == "url":
+        # Format: http://example.com or https://example.com
+        if not value.startswith(("http://", "https://")):
+            return f"http://{value}"
+        return value
+    else:
+        # Default: return as-is
+        return value
+
+
+def _telecom_attrib(telecom: TelecomProtocol) -> Dict[str, str]:
+    """Get the attributes of a telecom element (see Telecom.build)."""
+    attrib = {"value": telecom_value(telecom.type, telecom.value)}
+    if telecom.use:
+        attrib["use"] = Telecom.USE_CODES.get(telecom.use, telecom.use)
+    return attrib
+
+
+def _fill_address(elem: etree._Element, address: AddressProtocol, use: Optional[str]) -> None:
+    """Set the use attribute and children of an addr element."""
+    if use:
+        elem.set("use", Address.USE_CODES.get(use, use))
+    for line in address.street_lines:
+        etree.SubElement(elem, _STREET_TAG).text = line
+    etree.SubElement(elem, _CITY_TAG).text = address.city
+    etree.SubElement(elem, _STATE_TAG).text = address.state
+    etree.SubElement(elem, _POSTAL_CODE_TAG).text = address.postal_code
+    etree.SubElement(elem, _COUNTRY_TAG).text = address.country
+
+
+def append_address(
+    parent: etree._Element, address: AddressProtocol, use: Optional[str] = None
+) -> etree._Element:
+    """
+    Append an addr element to parent without an intermediate Address builder.
+
+    Args:
+        parent: Element to append to
+        address: Address data satisfying AddressProtocol
+        use: Use code ('home', 'work', etc.) or HL7 code directly
+
+    Returns:
+        The appended element
+    """
+    elem = etree.SubElement(parent, ADDR_TAG)
+    _fill_address(elem, address, use)
+    return elem
+
+
+def append_telecom(parent: etree._Element, telecom: TelecomProtocol) -> etree._Element:
+    """
+    Append a telecom element to parent without an intermediate Telecom builder.
+
+    Args:
+        parent: Element to append to
+        telecom: Telecom data satisfying TelecomProtocol
+
+    Returns:
+        The appended element
+    """
+    return etree.SubElement(parent, TELECOM_TAG, _telecom_attrib(telecom))
@@ -1,16 +1,20 @@
 """ClinicalDocument top-level builder."""
 
-import uuid
+import copy
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Callable, List, Optional, Sequence
 
 from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier
 from ccdakit.builders.header.author import Author, Custodian
 from ccdakit.builders.header.record_target import RecordTarget
+from ccdakit.builders.header.related_document import RelatedDocument
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
-from ccdakit.core.config import get_config
+from ccdakit.core.build_validation import BuildValidation
+from ccdakit.core.cache import HeaderCache, SectionCache
+from ccdakit.core.canonical import new_id, now
+from ccdakit.core.config import get_document_id_root
 from ccdakit.protocols.author import AuthorProtocol, OrganizationProtocol
 from ccdakit.protocols.patient import PatientProtocol
 
@@ -18,6 +22,21 @@ from ccdakit.protocols.patient import PatientProtocol
 class ClinicalDocument(CDAElement):
     """Top-level C-CDA Clinical Document builder."""
 
+    __slots__ = (
+        "patient",
+        "author",
+        "custodian",
+        "sections",
+        "document_id",
+        "title",
+        "effective_time",
+        "section_cache",
+        "build_validation",
+        "header_cache",
+        "related_documents",
+        "_section_keys",
+    )
+
     # C-CDA R2.1 templates
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -46,6 +65,13 @@ class ClinicalDocument(CDAElement):
     # Default namespace URI for element creation
     NS = "urn:hl7-org:v3"
 
+    FINGERPRINT_EXCLUDE = CDAElement.FINGERPRINT_EXCLUDE | {
+        "section_cache",
+        "header_cache",
+        "build_validation",
+        "_section_keys",
+    }
+
     def __init__(
         self,
         patient: PatientProtocol,
@@ -55,6 +81,10 @@ class ClinicalDocument(CDAElement):
         document_id: Optional[str] = None,
         title: str = "Clinical Summary",
         effective_time: Optional[datetime] = None,
+        section_cache: Optional[SectionCache] = None,
+        build_validation: Optional[BuildValidation] = None,
+        header_cache: Optional[HeaderCache] = None,
+        related_documents: Optional[Sequence[RelatedDocument]] = None,
         **kwargs,
     ):
         """
@@ -68,16 +98,34 @@ class ClinicalDocument(CDAElement):
             document_id: Document UUID (generated if not provided)
             title: Document title
             effective_time: Document creation time (current time if not provided)
-            **kwargs: Additional arguments passed to CDAElement
+            section_cache: Optional cache of built sections; sections whose inputs
+                are unchanged since a previous build reuse the cached subtree
+            build_validation: Optional strategy that validates the finished
+                document once in to_element(), replacing per-section schema
+                checks (see BuildValidation for sampling and
+                changed-sections-only modes)
+            header_cache: Optional cache shared by a batch of documents; header
+                fragments that depend only on the author, custodian and document
+                type are built once and copied into each document
+            related_documents: Optional relatedDocument references to parent
+                documents (e.g. the first document of a split)
+            **kwargs: Additional arguments passed to CDAElement (a ``profile``
+                given here applies to every section without its own profile)
         """
         super().__init__(**kwargs)
         self.patient = patient
         self.author = author
         self.custodian = custodian
         self.sections = sections or []
-        self.document_id = document_id or str(uuid.uuid4())
+        self.document_id = document_id or new_id()
         self.title = title
-        self.effective_time = effective_time or datetime.now()
+        self.effective_time = effective_time or now()
+        self.section_cache = section_cache
+        self.build_validation = build_validation
+        self.header_cache = header_cache
+        self.related_documents = related_documents or []
+        # Fingerprints of the sections in the last build, for build_validation
+        self._section_keys: Optional[List[str]] = None
 
     def build(self) -> etree.Element:
         """
@@ -89,24 +137,15 @@ class ClinicalDocument(CDAElement):
         # Create root element with namespaces
         doc = etree.Element(f"{{{self.NS}}}ClinicalDocument", nsmap=self.NAMESPACES)
 
-        # Add realmCode (US)
-        realm = etree.SubElement(doc, f"{{{self.NS}}}realmCode")
-        realm.set("code", "US")
-
-        # Add typeId (CDA Release 2)
-        type_id = etree.SubElement(doc, f"{{{self.NS}}}typeId")
-        type_id.set("root", "2.16.840.1.113883.1.3")
-        type_id.set("extension", "POCD_HD000040")
-
-        # Add templateIds
-        self.add_template_ids(doc)
+        # Add realmCode, typeId and templateIds
+        self._append_shared(doc, "prefix", self._add_header_prefix)
 
         # Add document id
         doc_id = Identifier(root=self._get_document_id_root(), extension=self.document_id)
         doc.append(doc_id.to_element())
 
         # Add code (document type)
-        self._add_document_code(doc)
+        self._append_shared(doc, "code", self._add_document_code)
 
         # Add title
         title_elem = etree.SubElement(doc, f"{{{self.NS}}}title")
@@ -116,33 +155,37 @@ class ClinicalDocument(CDAElement):
         # Import here to avoid circular import with common module
         from ccdakit.builders.common import EffectiveTime
 
+        effective_time = EffectiveTime._format_datetime(self.effective_time)
         effective_time_elem = etree.SubElement(doc, f"{{{self.NS}}}effectiveTime")
-        effective_time_elem.set("value", EffectiveTime._format_datetime(self.effective_time))
+        effective_time_elem.set("value", effective_time)
 
-        # Add confidentialityCode
-        conf_code = Code(code="N", system="2.16.840.1.113883.5.25")  # Confidentiality
-        conf_elem = conf_code.to_element()
-        conf_elem.tag = f"{{{self.NS}}}confidentialityCode"
-        doc.append(conf_elem)
-
-        # Add languageCode
-        lang = etree.SubElement(doc, f"{{{self.NS}}}languageCode")
-        lang.set("code", "en-US")
+        # Add confidentialityCode and languageCode
+        self._append_shared(doc, "confidentiality", self._add_confidentiality)
 
         # Add recordTarget (patient)
         record_target = RecordTarget(self.patient, version=self.version)
         doc.append(record_target.to_element())
 
         # Add author
-        author_builder = Author(self.author, version=self.version)
-        doc.append(author_builder.to_element())
+        self._append_shared(doc, "author", self._add_author, source=self.author)
 
         # Add custodian
-        custodian_builder = Custodian(self.custodian, version=self.version)
-        doc.append(custodian_builder.to_element())
+        self._append_shared(doc, "custodian", self._add_custodian, source=self.custodian)
 
         # Add legalAuthenticator (SHOULD per CONF:1198-5579)
-        self._add_legal_authenticator(doc)
+        legal_auths = self._append_shared(
+            doc, "legalAuthenticator", self._add_legal_authenticator, source=self.author
+        )
+        if self.header_cache is not None:
+            # Shared copies carry the authentication time of the first document
+            for legal_auth in legal_auths:
+                time_elem = legal_auth.find(f"{{{self.NS}}}time")
+                if time_elem is not None:
+                    time_elem.set("value", effective_time)
+
+        # Add relatedDocument references
+        for related_document in self.related_documents:
+            doc.append(related_document.to_element())
 
         # Add component (body)
         if self.sections:
@@ -150,6 +193,95 @@ class ClinicalDocument(CDAElement):
 
         return doc
 
+    def _append_shared(
+        self,
+        doc: etree._Element,
+        name: str,
+        add: Callable[[etree._Element], None],
+        source: Optional[object] = None,
+    ) -> List[etree._Element]:
+        """
+        Append header elements, sharing them through header_cache when set.
+
+        Args:
+            doc: ClinicalDocument element
+            name: Fragment name in the header cache
+            add: Method that appends the fragment's elements to a parent
+            source: Author or custodian the fragment is built from
+
+        Returns:
+            The appended elements
+        """
+        if self.header_cache is None:
+            count = len(doc)
+            add(doc)
+            return doc[count:]
+
+        def build_fragment() -> List[etree._Element]:
+            scratch = etree.Element(f"{{{self.NS}}}ClinicalDocument", nsmap=self.NAMESPACES)
+            add(scratch)
+            return list(scratch)
+
+        # Fragments depend on the document class (templates, code) and version
+        key = (name, type(self), self.version)
+        elements = self.header_cache.get_or_build(key, build_fragment, source=source)
+        doc.extend(elements)
+        return elements
+
+    def _add_header_prefix(self, doc: etree._Element) -> None:
+        """
+        Add realmCode, typeId and templateIds to document.
+
+        Args:
+            doc: ClinicalDocument element
+        """
+        # Add realmCode (US)
+        realm = etree.SubElement(doc, f"{{{self.NS}}}realmCode")
+        realm.set("code", "US")
+
+        # Add typeId (CDA Release 2)
+        type_id = etree.SubElement(doc, f"{{{self.NS}}}typeId")
+        type_id.set("root", "2.16.840.1.113883.1.3")
+        type_id.set("extension", "POCD_HD000040")
+
+        # Add templateIds
+        self.add_template_ids(doc)
+
+    def _add_confidentiality(self, doc: etree._Element) -> None:
+        """
+        Add confidentialityCode and languageCode to document.
+
+        Args:
+            doc: ClinicalDocument element
+        """
+        # Add confidentialityCode
+        conf_code = Code(code="N", system="2.16.840.1.113883.5.25")  # Confidentiality
+        conf_elem = conf_code.to_element()
+        conf_elem.tag = f"{{{self.NS}}}confidentialityCode"
+        doc.append(conf_elem)
+
+        # Add languageCode
+        lang = etree.SubElement(doc, f"{{{self.NS}}}languageCode")
+        lang.set("code", "en-US")
+
+    def _add_author(self, doc: etree._Element) -> None:
+        """
+        Add author to document.
+
+        Args:
+            doc: ClinicalDocument element
+        """
+        doc.append(Author(self.author, version=self.version).to_element())
+
+    def _add_custodian(self, doc: etree._Element) -> None:
+        """
+        Add custodian to document.
+
+        Args:
+            doc: ClinicalDocument element
+        """
+        doc.append(Custodian(self.custodian, version=self.version).to_element())
+
     def _get_document_id_root(self) -> str:
         """
         Get document ID root from config or use default.
@@ -157,15 +289,7 @@ class ClinicalDocument(CDAElement):
         Returns:
             Document ID root OID
         """
-        try:
-            config = get_config()
-            if config.document_id_root:
-                return config.document_id_root
-        except RuntimeError:
-            pass
-
-        # Default document ID root
-        return "2.16.840.1.113883.19.5"
+        return get_document_id_root()
 
     def _add_document_code(self, doc: etree._Element) -> None:
         """
@@ -262,12 +386,46 @@ class ClinicalDocument(CDAElement):
         # Create structuredBody
         structured_body = etree.SubElement(component, f"{{{self.NS}}}structuredBody")
 
+        validation = self.build_validation
+        track_keys = validation is not None and validation.changed_sections_only
+        self._section_keys = [] if track_keys else None
+
         # Add each section wrapped in a component
         for section_builder in self.sections:
+            if self.profile is not None and section_builder.profile is None:
+                # Sections inherit the document's build profile unless they set their own
+                section_builder = copy.copy(section_builder)
+                section_builder.profile = self.profile
+            if validation is not None and section_builder.schema is not None:
+                # The whole document is validated once after the build
+                section_builder = copy.copy(section_builder)
+                section_builder.schema = None
+            key = section_builder.fingerprint() if track_keys else None
+            if key is not None:
+                self._section_keys.append(key)
             section_component = etree.SubElement(structured_body, f"{{{self.NS}}}component")
-            section_elem = section_builder.to_element()
+            if self.section_cache is not None:
+                section_elem = self.section_cache.get_or_build(section_builder, key=key)
+            else:
+                section_elem = section_builder.to_element()
             section_component.append(section_elem)
 
+    def to_element(self) -> etree._Element:
+        """
+        Build document element, then apply build_validation if configured.
+
+        Returns:
+            lxml Element for ClinicalDocument
+
+        Raises:
+            etree.DocumentInvalid: If schema validation fails
+            ValidationError: If build_validation finds the document invalid
+        """
+        element = super().to_element()
+        if self.build_validation is not None:
+            self.build_validation.check(element, self._section_keys)
+        return element
+
     def to_xml_string(self, pretty: bool = True) -> str:
         """
         Convert to XML string with declaration.
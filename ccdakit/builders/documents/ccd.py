@@ -57,6 +57,8 @@ class ContinuityOfCareDocument(ClinicalDocument):
         >>> xml_string = doc.to_xml_string()
     """
 
+    __slots__ = ()
+
     # CCD templates include both the base C-CDA template and CCD-specific template
     TEMPLATES = {
         CDAVersion.R2_1: [
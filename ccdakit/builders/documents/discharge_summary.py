@@ -16,6 +16,7 @@ from lxml import etree
 from ccdakit.builders.common import Code
 from ccdakit.builders.document import ClinicalDocument
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.author import AuthorProtocol, OrganizationProtocol
 from ccdakit.protocols.patient import PatientProtocol
 
@@ -65,6 +66,8 @@ class DischargeSummary(ClinicalDocument):
         >>> xml_string = doc.to_xml_string()
     """
 
+    __slots__ = ("admission_date", "discharge_date")
+
     # Discharge Summary templates include base C-CDA template and DS-specific template
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -216,9 +219,11 @@ class DischargeSummary(ClinicalDocument):
         # Use the document author as the performer
         self._add_service_event_performer(service_event)
 
-        # Insert documentationOf before component (body) if it exists
-        # Otherwise append to end
-        component_elem = doc.find(f".//{{{self.NS}}}component")
+        # Insert documentationOf before relatedDocument or component (body) if
+        # either exists. Otherwise append to end
+        component_elem = doc.find(f"{{{self.NS}}}relatedDocument")
+        if component_elem is None:
+            component_elem = doc.find(f".//{{{self.NS}}}component")
         if component_elem is not None:
             # Find index of component
             doc.insert(list(doc).index(component_elem), documentation_of)
@@ -284,8 +289,6 @@ class DischargeSummary(ClinicalDocument):
         Args:
             doc: ClinicalDocument element
         """
-        import uuid
-
         # Create componentOf element
         component_of = etree.Element(f"{{{self.NS}}}componentOf")
 
@@ -297,7 +300,7 @@ class DischargeSummary(ClinicalDocument):
         # Add ID for the encounter
         id_elem = etree.SubElement(encompassing_encounter, f"{{{self.NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add code for encounter type (if available)
         code_elem = etree.SubElement(encompassing_encounter, f"{{{self.NS}}}code")
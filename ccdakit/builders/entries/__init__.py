@@ -1,66 +1,121 @@
 """Entry-level builders for C-CDA documents."""
 
-from ccdakit.builders.entries.admission_diagnosis_entry import (
-    HospitalAdmissionDiagnosis,
-)
-from ccdakit.builders.entries.admission_medication import AdmissionMedication
-from ccdakit.builders.entries.advance_directive import AdvanceDirectiveObservation
-from ccdakit.builders.entries.allergy import AllergyObservation
-from ccdakit.builders.entries.anesthesia_entry import AnesthesiaProcedure
-from ccdakit.builders.entries.complication_entry import ComplicationObservation
-from ccdakit.builders.entries.coverage_activity import CoverageActivity, PolicyActivity
-from ccdakit.builders.entries.discharge_diagnosis_entry import (
-    HospitalDischargeDiagnosis,
-)
-from ccdakit.builders.entries.discharge_medication import DischargeMedication
-from ccdakit.builders.entries.encounter import EncounterActivity
-from ccdakit.builders.entries.entry_reference import EntryReference
-from ccdakit.builders.entries.family_member_history import (
-    FamilyHistoryObservation,
-    FamilyHistoryOrganizer,
-)
-from ccdakit.builders.entries.functional_status import (
-    FunctionalStatusObservation,
-    FunctionalStatusOrganizer,
-)
-from ccdakit.builders.entries.goal import GoalObservation
-from ccdakit.builders.entries.health_concern import HealthConcernAct
-from ccdakit.builders.entries.immunization import ImmunizationActivity
-from ccdakit.builders.entries.instruction import Instruction
-from ccdakit.builders.entries.intervention_act import InterventionAct
-from ccdakit.builders.entries.medical_equipment import (
-    MedicalEquipmentOrganizer,
-    NonMedicinalSupplyActivity,
-)
-from ccdakit.builders.entries.medication import MedicationActivity
-from ccdakit.builders.entries.medication_administered_entry import (
-    MedicationAdministeredActivity,
-)
-from ccdakit.builders.entries.mental_status import (
-    MentalStatusObservation,
-    MentalStatusOrganizer,
-)
-from ccdakit.builders.entries.nutrition_assessment import NutritionAssessment
-from ccdakit.builders.entries.nutritional_status import NutritionalStatusObservation
-from ccdakit.builders.entries.outcome_observation import OutcomeObservation
-from ccdakit.builders.entries.physical_exam import LongitudinalCareWoundObservation
-from ccdakit.builders.entries.planned_act import PlannedAct
-from ccdakit.builders.entries.planned_encounter import PlannedEncounter
-from ccdakit.builders.entries.planned_immunization import PlannedImmunization
-from ccdakit.builders.entries.planned_intervention_act import PlannedInterventionAct
-from ccdakit.builders.entries.planned_medication import PlannedMedication
-from ccdakit.builders.entries.planned_observation import PlannedObservation
-from ccdakit.builders.entries.planned_procedure import PlannedProcedure
-from ccdakit.builders.entries.planned_supply import PlannedSupply
-from ccdakit.builders.entries.preoperative_diagnosis_entry import (
-    PreoperativeDiagnosisEntry,
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.builders.entries.admission_diagnosis_entry import HospitalAdmissionDiagnosis
+    from ccdakit.builders.entries.admission_medication import AdmissionMedication
+    from ccdakit.builders.entries.advance_directive import AdvanceDirectiveObservation
+    from ccdakit.builders.entries.allergy import AllergyObservation
+    from ccdakit.builders.entries.anesthesia_entry import AnesthesiaProcedure
+    from ccdakit.builders.entries.complication_entry import ComplicationObservation
+    from ccdakit.builders.entries.coverage_activity import CoverageActivity, PolicyActivity
+    from ccdakit.builders.entries.discharge_diagnosis_entry import HospitalDischargeDiagnosis
+    from ccdakit.builders.entries.discharge_medication import DischargeMedication
+    from ccdakit.builders.entries.encounter import EncounterActivity
+    from ccdakit.builders.entries.entry_reference import EntryReference
+    from ccdakit.builders.entries.family_member_history import (
+        FamilyHistoryObservation,
+        FamilyHistoryOrganizer,
+    )
+    from ccdakit.builders.entries.functional_status import (
+        FunctionalStatusObservation,
+        FunctionalStatusOrganizer,
+    )
+    from ccdakit.builders.entries.goal import GoalObservation
+    from ccdakit.builders.entries.health_concern import HealthConcernAct
+    from ccdakit.builders.entries.immunization import ImmunizationActivity
+    from ccdakit.builders.entries.instruction import Instruction
+    from ccdakit.builders.entries.intervention_act import InterventionAct
+    from ccdakit.builders.entries.medical_equipment import (
+        MedicalEquipmentOrganizer,
+        NonMedicinalSupplyActivity,
+    )
+    from ccdakit.builders.entries.medication import MedicationActivity
+    from ccdakit.builders.entries.medication_administered_entry import (
+        MedicationAdministeredActivity,
+    )
+    from ccdakit.builders.entries.mental_status import (
+        MentalStatusObservation,
+        MentalStatusOrganizer,
+    )
+    from ccdakit.builders.entries.nutrition_assessment import NutritionAssessment
+    from ccdakit.builders.entries.nutritional_status import NutritionalStatusObservation
+    from ccdakit.builders.entries.outcome_observation import OutcomeObservation
+    from ccdakit.builders.entries.physical_exam import LongitudinalCareWoundObservation
+    from ccdakit.builders.entries.planned_act import PlannedAct
+    from ccdakit.builders.entries.planned_encounter import PlannedEncounter
+    from ccdakit.builders.entries.planned_immunization import PlannedImmunization
+    from ccdakit.builders.entries.planned_intervention_act import PlannedInterventionAct
+    from ccdakit.builders.entries.planned_medication import PlannedMedication
+    from ccdakit.builders.entries.planned_observation import PlannedObservation
+    from ccdakit.builders.entries.planned_procedure import PlannedProcedure
+    from ccdakit.builders.entries.planned_supply import PlannedSupply
+    from ccdakit.builders.entries.preoperative_diagnosis_entry import PreoperativeDiagnosisEntry
+    from ccdakit.builders.entries.problem import ProblemObservation
+    from ccdakit.builders.entries.procedure import ProcedureActivity
+    from ccdakit.builders.entries.progress_toward_goal import ProgressTowardGoalObservation
+    from ccdakit.builders.entries.result import ResultObservation, ResultOrganizer
+    from ccdakit.builders.entries.smoking_status import SmokingStatusObservation
+    from ccdakit.builders.entries.vital_signs import VitalSignObservation, VitalSignsOrganizer
+
+
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        "HospitalAdmissionDiagnosis": "ccdakit.builders.entries.admission_diagnosis_entry",
+        "AdmissionMedication": "ccdakit.builders.entries.admission_medication",
+        "AdvanceDirectiveObservation": "ccdakit.builders.entries.advance_directive",
+        "AllergyObservation": "ccdakit.builders.entries.allergy",
+        "AnesthesiaProcedure": "ccdakit.builders.entries.anesthesia_entry",
+        "ComplicationObservation": "ccdakit.builders.entries.complication_entry",
+        "CoverageActivity": "ccdakit.builders.entries.coverage_activity",
+        "PolicyActivity": "ccdakit.builders.entries.coverage_activity",
+        "HospitalDischargeDiagnosis": "ccdakit.builders.entries.discharge_diagnosis_entry",
+        "DischargeMedication": "ccdakit.builders.entries.discharge_medication",
+        "EncounterActivity": "ccdakit.builders.entries.encounter",
+        "EntryReference": "ccdakit.builders.entries.entry_reference",
+        "FamilyHistoryObservation": "ccdakit.builders.entries.family_member_history",
+        "FamilyHistoryOrganizer": "ccdakit.builders.entries.family_member_history",
+        "FunctionalStatusObservation": "ccdakit.builders.entries.functional_status",
+        "FunctionalStatusOrganizer": "ccdakit.builders.entries.functional_status",
+        "GoalObservation": "ccdakit.builders.entries.goal",
+        "HealthConcernAct": "ccdakit.builders.entries.health_concern",
+        "ImmunizationActivity": "ccdakit.builders.entries.immunization",
+        "Instruction": "ccdakit.builders.entries.instruction",
+        "InterventionAct": "ccdakit.builders.entries.intervention_act",
+        "MedicalEquipmentOrganizer": "ccdakit.builders.entries.medical_equipment",
+        "NonMedicinalSupplyActivity": "ccdakit.builders.entries.medical_equipment",
+        "MedicationActivity": "ccdakit.builders.entries.medication",
+        "MedicationAdministeredActivity": "ccdakit.builders.entries.medication_administered_entry",
+        "MentalStatusObservation": "ccdakit.builders.entries.mental_status",
+        "MentalStatusOrganizer": "ccdakit.builders.entries.mental_status",
+        "NutritionAssessment": "ccdakit.builders.entries.nutrition_assessment",
+        "NutritionalStatusObservation": "ccdakit.builders.entries.nutritional_status",
+        "OutcomeObservation": "ccdakit.builders.entries.outcome_observation",
+        "LongitudinalCareWoundObservation": "ccdakit.builders.entries.physical_exam",
+        "PlannedAct": "ccdakit.builders.entries.planned_act",
+        "PlannedEncounter": "ccdakit.builders.entries.planned_encounter",
+        "PlannedImmunization": "ccdakit.builders.entries.planned_immunization",
+        "PlannedInterventionAct": "ccdakit.builders.entries.planned_intervention_act",
+        "PlannedMedication": "ccdakit.builders.entries.planned_medication",
+        "PlannedObservation": "ccdakit.builders.entries.planned_observation",
+        "PlannedProcedure": "ccdakit.builders.entries.planned_procedure",
+        "PlannedSupply": "ccdakit.builders.entries.planned_supply",
+        "PreoperativeDiagnosisEntry": "ccdakit.builders.entries.preoperative_diagnosis_entry",
+        "ProblemObservation": "ccdakit.builders.entries.problem",
+        "ProcedureActivity": "ccdakit.builders.entries.procedure",
+        "ProgressTowardGoalObservation": "ccdakit.builders.entries.progress_toward_goal",
+        "ResultObservation": "ccdakit.builders.entries.result",
+        "ResultOrganizer": "ccdakit.builders.entries.result",
+        "SmokingStatusObservation": "ccdakit.builders.entries.smoking_status",
+        "VitalSignObservation": "ccdakit.builders.entries.vital_signs",
+        "VitalSignsOrganizer": "ccdakit.builders.entries.vital_signs",
+    },
 )
-from ccdakit.builders.entries.problem import ProblemObservation
-from ccdakit.builders.entries.procedure import ProcedureActivity
-from ccdakit.builders.entries.progress_toward_goal import ProgressTowardGoalObservation
-from ccdakit.builders.entries.result import ResultObservation, ResultOrganizer
-from ccdakit.builders.entries.smoking_status import SmokingStatusObservation
-from ccdakit.builders.entries.vital_signs import VitalSignObservation, VitalSignsOrganizer
 
 
 __all__ = [
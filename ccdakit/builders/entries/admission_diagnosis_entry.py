@@ -24,6 +24,8 @@ class HospitalAdmissionDiagnosis(CDAElement):
     Supports R2.1 (2015-08-01) version.
     """
 
+    __slots__ = ("diagnosis",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
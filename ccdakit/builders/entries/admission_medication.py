@@ -22,6 +22,8 @@ class AdmissionMedication(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.36
     """
 
+    __slots__ = ("medication",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
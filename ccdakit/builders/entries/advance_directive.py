@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.advance_directive import AdvanceDirectiveProtocol
 
 
@@ -22,6 +23,8 @@ class AdvanceDirectiveObservation(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.48
     """
 
+    __slots__ = ("directive",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -130,11 +133,9 @@ class AdvanceDirectiveObservation(CDAElement):
         Args:
             obs: observation element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         obs.append(id_elem)
 
@@ -351,10 +352,8 @@ class AdvanceDirectiveObservation(CDAElement):
             id_elem.set("root", self.directive.document_id)
         else:
             # Generate a UUID if no ID provided
-            import uuid
-
             id_elem = etree.SubElement(ext_doc, f"{{{NS}}}id")
-            id_elem.set("root", str(uuid.uuid4()))
+            id_elem.set("root", new_id())
 
         # Add text with URL or description (CONF:1198-8696, 8697, 8698)
         if self.directive.document_url or self.directive.document_description:
@@ -20,6 +20,7 @@ from typing import Optional
 
 from ccdakit.builders.common import EffectiveTime, Identifier, StatusCode, create_default_author_participation
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.allergy import AllergyProtocol
 
 
@@ -35,6 +36,8 @@ class AllergyObservation(CDAElement):
     Supports both R2.1 (2014-06-09) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("allergy",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -53,6 +56,25 @@ class AllergyObservation(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "reaction": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.9",
+                    extension="2014-06-09",
+                    description="Reaction Observation R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.9",
+                    description="Reaction Observation R2.0",
+                ),
+            ],
+        },
+    }
+
     # Code system OIDs
     SNOMED_OID = "2.16.840.1.113883.6.96"  # SNOMED CT
     RXNORM_OID = "2.16.840.1.113883.6.88"  # RxNorm (for medications)
@@ -177,11 +199,9 @@ class AllergyObservation(CDAElement):
         Args:
             obs: observation element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         obs.append(id_elem)
 
@@ -339,16 +359,12 @@ class AllergyObservation(CDAElement):
         )
 
         # Add template ID for reaction observation
-        template_id = etree.SubElement(reaction_obs, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.9")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(reaction_obs, nested="reaction")
 
         # Add ID for reaction observation
-        import uuid
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         reaction_obs.append(id_elem)
 
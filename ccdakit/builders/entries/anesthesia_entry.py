@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.anesthesia import AnesthesiaProtocol
 
 
@@ -24,6 +25,8 @@ class AnesthesiaProcedure(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.14
     """
 
+    __slots__ = ("anesthesia",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -135,11 +138,9 @@ class AnesthesiaProcedure(CDAElement):
         Args:
             proc: procedure element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         proc.append(id_elem)
 
@@ -199,8 +200,6 @@ class AnesthesiaProcedure(CDAElement):
         Args:
             proc: procedure element
         """
-        import uuid
-
         assert self.anesthesia.performer_name is not None
         performer_elem = etree.SubElement(proc, f"{{{NS}}}performer")
 
@@ -209,7 +208,7 @@ class AnesthesiaProcedure(CDAElement):
         # Add ID
         id_elem = etree.SubElement(assigned_entity, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add assigned person with name
         assigned_person = etree.SubElement(assigned_entity, f"{{{NS}}}assignedPerson")
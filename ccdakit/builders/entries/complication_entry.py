@@ -22,6 +22,8 @@ class ComplicationObservation(CDAElement):
     semantic clarity when working with complications specifically.
     """
 
+    __slots__ = ("complication", "_problem_obs")
+
     def __init__(
         self,
         complication: ComplicationProtocol,
@@ -1,6 +1,5 @@
 """Coverage Activity entry builder for C-CDA documents."""
 
-import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -8,6 +7,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.payer import PayerProtocol
 
 
@@ -30,6 +30,8 @@ class CoverageActivity(CDAElement):
     Supports both R2.1 and R2.0 versions.
     """
 
+    __slots__ = ("payer", "coverage_check_date")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -177,6 +179,8 @@ class PolicyActivity(CDAElement):
     - Extension: 2015-08-01
     """
 
+    __slots__ = ("payer",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -268,7 +272,7 @@ class PolicyActivity(CDAElement):
     def _add_id(self, act: etree._Element) -> None:
         """Add policy ID."""
         # Use group number if available, otherwise generate
-        extension = self.payer.group_number or str(uuid.uuid4())
+        extension = self.payer.group_number or new_id()
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
             extension=extension,
@@ -6,6 +6,7 @@ from lxml import etree
 
 from ccdakit.builders.entries.problem import ProblemObservation
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.discharge_diagnosis import DischargeDiagnosisProtocol
 
 
@@ -24,6 +25,8 @@ class HospitalDischargeDiagnosis(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.33
     """
 
+    __slots__ = ("diagnoses",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -107,9 +110,7 @@ class HospitalDischargeDiagnosis(CDAElement):
         Args:
             act: act element
         """
-        import uuid
-
         # Add a generated ID
         id_elem = etree.SubElement(act, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
@@ -24,6 +24,8 @@ class DischargeMedication(CDAElement):
     Supports both R2.1 (2016-03-01) and R2.0 (2016-03-01) versions.
     """
 
+    __slots__ = ("medication",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.encounter import EncounterProtocol
 
 
@@ -23,6 +24,8 @@ class EncounterActivity(CDAElement):
     Supports V3 (2015-08-01) and V2 (2014-06-09) versions.
     """
 
+    __slots__ = ("encounter",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -132,11 +135,9 @@ class EncounterActivity(CDAElement):
         Args:
             enc: encounter element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         enc.append(id_elem)
 
@@ -205,8 +206,6 @@ class EncounterActivity(CDAElement):
         Args:
             enc: encounter element
         """
-        import uuid
-
         assert self.encounter.performer_name is not None
         performer_elem = etree.SubElement(enc, f"{{{NS}}}performer", typeCode="PRF")
 
@@ -215,7 +214,7 @@ class EncounterActivity(CDAElement):
         # Add ID
         id_elem = etree.SubElement(assigned_entity, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add assigned person with name
         assigned_person = etree.SubElement(assigned_entity, f"{{{NS}}}assignedPerson")
@@ -243,8 +242,6 @@ class EncounterActivity(CDAElement):
         Args:
             enc: encounter element
         """
-        import uuid
-
         # Create participant with typeCode="LOC"
         participant_elem = etree.SubElement(enc, f"{{{NS}}}participant", typeCode="LOC")
 
@@ -262,7 +259,7 @@ class EncounterActivity(CDAElement):
         # Add ID for the location
         id_elem = etree.SubElement(participant_role, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add code (optional - we could add facility type code here)
         code_elem = etree.SubElement(participant_role, f"{{{NS}}}code")
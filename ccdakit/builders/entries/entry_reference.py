@@ -28,6 +28,8 @@ class EntryReference(CDAElement):
     - SHALL contain statusCode (CONF:1098-31498)
     """
 
+    __slots__ = ("reference_id", "reference_root")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
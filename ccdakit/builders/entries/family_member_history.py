@@ -1,11 +1,11 @@
 """Family Member History entry builders for C-CDA documents."""
 
-import uuid
 
 from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.family_history import (
     FamilyHistoryObservationProtocol,
     FamilyMemberHistoryProtocol,
@@ -28,6 +28,8 @@ class FamilyHistoryObservation(CDAElement):
     Conformance: 2.16.840.1.113883.10.20.22.4.46 (Family History Observation V3)
     """
 
+    __slots__ = ("observation",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -139,7 +141,7 @@ class FamilyHistoryObservation(CDAElement):
             # Add a generated ID
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             observation.append(id_elem)
 
@@ -357,6 +359,8 @@ class FamilyHistoryOrganizer(CDAElement):
     Conformance: 2.16.840.1.113883.10.20.22.4.45 (Family History Organizer V3)
     """
 
+    __slots__ = ("family_member",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -450,7 +454,7 @@ class FamilyHistoryOrganizer(CDAElement):
             # Add a generated ID
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             organizer.append(id_elem)
 
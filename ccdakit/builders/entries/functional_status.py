@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.functional_status import (
     FunctionalStatusObservationProtocol,
     FunctionalStatusOrganizerProtocol,
@@ -24,6 +25,8 @@ class FunctionalStatusObservation(CDAElement):
     Conformance: Template 2.16.840.1.113883.10.20.22.4.67
     """
 
+    __slots__ = ("observation",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -125,11 +128,9 @@ class FunctionalStatusObservation(CDAElement):
         Args:
             observation: observation element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         observation.append(id_elem)
 
@@ -168,6 +169,8 @@ class FunctionalStatusOrganizer(CDAElement):
     Conformance: Template 2.16.840.1.113883.10.20.22.4.66
     """
 
+    __slots__ = ("organizer",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -256,11 +259,9 @@ class FunctionalStatusOrganizer(CDAElement):
         Args:
             organizer_elem: organizer element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         organizer_elem.append(id_elem)
 
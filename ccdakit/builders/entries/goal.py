@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.goal import GoalProtocol
 
 
@@ -21,6 +22,8 @@ class GoalObservation(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.121
     """
 
+    __slots__ = ("goal",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -116,11 +119,9 @@ class GoalObservation(CDAElement):
             observation: observation element
         """
         # Add a generated ID (required: at least one [1..*])
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         observation.append(id_elem)
 
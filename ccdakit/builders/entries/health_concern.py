@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.health_concern import HealthConcernProtocol
 
 
@@ -26,6 +27,8 @@ class HealthConcernAct(CDAElement):
     - statusCode from ProblemAct statusCode value set (CONF:4515-32313)
     """
 
+    __slots__ = ("health_concern",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -131,11 +134,9 @@ class HealthConcernAct(CDAElement):
             act.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             act.append(id_elem)
 
@@ -192,11 +193,9 @@ class HealthConcernAct(CDAElement):
             self._add_observation_template(obs, observation.observation_type)
 
             # Add ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             obs.append(id_elem)
 
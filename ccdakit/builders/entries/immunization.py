@@ -2,8 +2,11 @@
 
 from lxml import etree
 
+from ccdakit.builders import vocabulary
 from ccdakit.builders.common import EffectiveTime, Identifier, StatusCode
+from ccdakit.builders.vocabulary import normalize_dose, normalize_route
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.immunization import ImmunizationProtocol
 
 
@@ -19,6 +22,8 @@ class ImmunizationActivity(CDAElement):
     and administration details. Supports both R2.1 (2014-06-09) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("immunization",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -37,6 +42,25 @@ class ImmunizationActivity(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "manufactured_product": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.54",
+                    extension="2014-06-09",
+                    description="Immunization Medication Information R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.54",
+                    description="Immunization Medication Information R2.0",
+                ),
+            ],
+        },
+    }
+
     # Code system OIDs
     CVX_OID = "2.16.840.1.113883.12.292"  # CVX (Vaccines Administered)
     ROUTE_OID = "2.16.840.1.113883.3.26.1.1"  # NCI Thesaurus for routes
@@ -51,14 +75,7 @@ class ImmunizationActivity(CDAElement):
     }
 
     # Common route codes (NCI Thesaurus)
-    ROUTE_CODES = {
-        "oral": "C38288",
-        "intramuscular": "C28161",
-        "subcutaneous": "C38299",
-        "intradermal": "C38238",
-        "intranasal": "C38284",
-        "intravenous": "C38276",
-    }
+    ROUTE_CODES = vocabulary.ROUTE_CODES
 
     # Common body site codes (SNOMED CT)
     SITE_CODES = {
@@ -142,11 +159,9 @@ class ImmunizationActivity(CDAElement):
         Args:
             sub_admin: substanceAdministration element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         sub_admin.append(id_elem)
 
@@ -168,8 +183,7 @@ class ImmunizationActivity(CDAElement):
             sub_admin: substanceAdministration element
         """
         assert self.immunization.route is not None
-        route_lower = self.immunization.route.lower()
-        route_code = self.ROUTE_CODES.get(route_lower)
+        route_code = normalize_route(self.immunization.route, self.ROUTE_CODES).code
 
         route_elem = etree.SubElement(sub_admin, f"{{{NS}}}routeCode")
 
@@ -218,26 +232,16 @@ class ImmunizationActivity(CDAElement):
         assert self.immunization.dose_quantity is not None
         dose_elem = etree.SubElement(sub_admin, f"{{{NS}}}doseQuantity")
 
-        # Try to parse dosage (e.g., "0.5 mL", "1 dose")
-        dosage = self.immunization.dose_quantity.strip()
-        parts = dosage.split(maxsplit=1)
-
-        if len(parts) == 2:
-            value, unit = parts
-            # Check if value is numeric
-            try:
-                # Try to convert to float to validate it's a number
-                float(value)
-                dose_elem.set("value", value)
-                dose_elem.set("unit", unit)
-            except ValueError:
-                # If value is not numeric, use originalText
-                text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
-                text_elem.text = dosage
+        # Parse dose (e.g., "0.5 mL", "1 dose")
+        dose = normalize_dose(self.immunization.dose_quantity)
+
+        if dose.value is not None and dose.unit is not None:
+            dose_elem.set("value", dose.value)
+            dose_elem.set("unit", dose.unit)
         else:
-            # Use originalText for complex dosage
+            # Use originalText for non-numeric or unitless dosage
             text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
-            text_elem.text = dosage
+            text_elem.text = dose.text
 
     def _add_consumable(self, sub_admin: etree._Element) -> None:
         """
@@ -252,10 +256,7 @@ class ImmunizationActivity(CDAElement):
         )
 
         # Add template ID for manufactured product
-        template_id = etree.SubElement(manufactured_product, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.54")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(manufactured_product, nested="manufactured_product")
 
         # Add manufactured material
         manufactured_material = etree.SubElement(
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 
 
 # CDA namespace
@@ -33,6 +34,8 @@ class Instruction(CDAElement):
     - SHALL contain statusCode="completed" (CONF:1098-7396, CONF:1098-19106)
     """
 
+    __slots__ = ("instruction",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -137,11 +140,9 @@ class Instruction(CDAElement):
             act.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             act.append(id_elem)
 
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.intervention import InterventionProtocol
 
 
@@ -32,6 +33,8 @@ class InterventionAct(CDAElement):
     - SHOULD contain effectiveTime (CONF:1198-31624)
     """
 
+    __slots__ = ("intervention",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -129,11 +132,9 @@ class InterventionAct(CDAElement):
             act.append(id_elem)
         else:
             # Generate a UUID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             act.append(id_elem)
 
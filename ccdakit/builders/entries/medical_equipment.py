@@ -6,6 +6,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.medical_equipment import MedicalEquipmentProtocol
 
 
@@ -23,6 +24,8 @@ class NonMedicinalSupplyActivity(CDAElement):
     Supports V2 (2014-06-09) version.
     """
 
+    __slots__ = ("equipment",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -159,11 +162,9 @@ class NonMedicinalSupplyActivity(CDAElement):
         Args:
             supply: supply element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         supply.append(id_elem)
 
@@ -264,11 +265,9 @@ class NonMedicinalSupplyActivity(CDAElement):
                 id_elem.set("extension", self.equipment.serial_number)
         else:
             # Generate a generic ID
-            import uuid
-
             id_elem = etree.SubElement(participant_role, f"{{{NS}}}id")
             id_elem.set("root", "2.16.840.1.113883.19")
-            id_elem.set("extension", str(uuid.uuid4()))
+            id_elem.set("extension", new_id())
 
         # Add playingDevice (CONF:81-7903)
         playing_device = etree.SubElement(participant_role, f"{{{NS}}}playingDevice")
@@ -370,6 +369,8 @@ class MedicalEquipmentOrganizer(CDAElement):
     No version specified in template (no extension attribute).
     """
 
+    __slots__ = ("equipment_list", "status", "date_start", "date_end", "organizer_code")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -476,11 +477,9 @@ class MedicalEquipmentOrganizer(CDAElement):
         Args:
             organizer: organizer element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         organizer.append(id_elem)
 
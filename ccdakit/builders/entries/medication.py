@@ -2,8 +2,23 @@
 
 from lxml import etree
 
-from ccdakit.builders.common import EffectiveTime, Identifier, StatusCode, create_default_author_participation
+from ccdakit.builders import vocabulary
+from ccdakit.builders.common import (
+    EffectiveTime,
+    append_code,
+    append_effective_time,
+    append_identifier,
+    append_status_code,
+    create_default_author_participation,
+)
+from ccdakit.builders.vocabulary import (
+    DEFAULT_FREQUENCY,
+    normalize_dose,
+    normalize_frequency,
+    normalize_route,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.medication import MedicationProtocol
 from typing import Optional
 
@@ -20,6 +35,8 @@ class MedicationActivity(CDAElement):
     Supports both R2.1 (2014-06-09) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("medication",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -38,6 +55,40 @@ class MedicationActivity(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "manufactured_product": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.23",
+                    extension="2014-06-09",
+                    description="Medication Information R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.23",
+                    description="Medication Information R2.0",
+                ),
+            ],
+        },
+        "instruction": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.20",
+                    extension="2014-06-09",
+                    description="Instruction R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.20",
+                    description="Instruction R2.0",
+                ),
+            ],
+        },
+    }
+
     # Code system OIDs
     RXNORM_OID = "2.16.840.1.113883.6.88"  # RxNorm
     ROUTE_OID = "2.16.840.1.113883.3.26.1.1"  # NCI Thesaurus for routes
@@ -53,35 +104,11 @@ class MedicationActivity(CDAElement):
     }
 
     # Common route codes (NCI Thesaurus for primary code)
-    ROUTE_CODES = {
-        "oral": "C38288",
-        "iv": "C38276",
-        "intravenous": "C38276",
-        "topical": "C38304",
-        "subcutaneous": "C38299",
-        "intramuscular": "C28161",
-        "inhalation": "C38216",
-        "rectal": "C38295",
-        "ophthalmic": "C38287",
-    }
+    ROUTE_CODES = vocabulary.ROUTE_CODES
 
     # Frequency mapping for effectiveTime with operator="A"
     # Maps common frequency terms to PIVL_TS period values
-    FREQUENCY_CODES = {
-        "once daily": {"period": "1", "unit": "d"},
-        "daily": {"period": "1", "unit": "d"},
-        "twice daily": {"period": "12", "unit": "h"},
-        "three times daily": {"period": "8", "unit": "h"},
-        "four times daily": {"period": "6", "unit": "h"},
-        "every 4 hours": {"period": "4", "unit": "h"},
-        "every 6 hours": {"period": "6", "unit": "h"},
-        "every 8 hours": {"period": "8", "unit": "h"},
-        "every 12 hours": {"period": "12", "unit": "h"},
-        "weekly": {"period": "1", "unit": "wk"},
-        "monthly": {"period": "1", "unit": "mo"},
-        "as needed": None,  # PRN - no fixed frequency
-        "prn": None,
-    }
+    FREQUENCY_CODES = vocabulary.FREQUENCY_CODES
 
     def __init__(
         self,
@@ -121,9 +148,7 @@ class MedicationActivity(CDAElement):
         self._add_id(sub_admin)
 
         # Add status code
-        status = self._map_status(self.medication.status)
-        status_elem = StatusCode(status).to_element()
-        sub_admin.append(status_elem)
+        append_status_code(sub_admin, self._map_status(self.medication.status))
 
         # Add effective time (start and end dates)
         self._add_effective_time(sub_admin)
@@ -156,13 +181,7 @@ class MedicationActivity(CDAElement):
         Args:
             sub_admin: substanceAdministration element
         """
-        import uuid
-
-        id_elem = Identifier(
-            root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
-        ).to_element()
-        sub_admin.append(id_elem)
+        append_identifier(sub_admin, root="2.16.840.1.113883.19", extension=new_id())
 
     def _add_effective_time(self, sub_admin: etree._Element) -> None:
         """
@@ -185,12 +204,10 @@ class MedicationActivity(CDAElement):
         # Per CONF:1098-32890: "SHALL contain either a low or a @value but not both"
         # This approach minimizes SHOULD warnings in most cases
         if self.medication.start_date:
-            time_elem = EffectiveTime(value=self.medication.start_date).to_element()
-            sub_admin.append(time_elem)
+            append_effective_time(sub_admin, value=self.medication.start_date)
         else:
             # No start date - use nullFlavor
-            time_elem = EffectiveTime(null_flavor="UNK").to_element()
-            sub_admin.append(time_elem)
+            append_effective_time(sub_admin, null_flavor="UNK")
 
     def _add_frequency_effective_time(self, sub_admin: etree._Element) -> None:
         """
@@ -206,19 +223,18 @@ class MedicationActivity(CDAElement):
         if not self.medication.frequency:
             # No frequency specified - use default "once daily"
             # This ensures we meet the SHOULD requirement
-            freq_data = self.FREQUENCY_CODES.get("daily")
+            frequency = DEFAULT_FREQUENCY
         else:
-            frequency_lower = self.medication.frequency.lower()
-            freq_data = self.FREQUENCY_CODES.get(frequency_lower)
+            frequency = normalize_frequency(self.medication.frequency, self.FREQUENCY_CODES)
 
-            if freq_data is None and frequency_lower not in ["as needed", "prn"]:
-                # Unknown frequency format - default to daily
-                freq_data = self.FREQUENCY_CODES.get("daily")
-
-            if freq_data is None:
+            if frequency.prn:
                 # PRN medication - no fixed frequency, skip
                 return
 
+            if not frequency.known:
+                # Unknown frequency format - default to daily
+                frequency = DEFAULT_FREQUENCY
+
         # Create effectiveTime with operator="A" and type PIVL_TS
         time_elem = etree.SubElement(sub_admin, f"{{{NS}}}effectiveTime")
         time_elem.set("operator", "A")
@@ -226,8 +242,8 @@ class MedicationActivity(CDAElement):
 
         # Add period element
         period = etree.SubElement(time_elem, f"{{{NS}}}period")
-        period.set("value", freq_data["period"])
-        period.set("unit", freq_data["unit"])
+        period.set("value", frequency.period)
+        period.set("unit", frequency.unit)
 
     def _add_route_code(self, sub_admin: etree._Element) -> None:
         """
@@ -243,8 +259,7 @@ class MedicationActivity(CDAElement):
             route_elem.set("nullFlavor", "UNK")
             return
 
-        route_lower = self.medication.route.lower()
-        route_code = self.ROUTE_CODES.get(route_lower)
+        route_code = normalize_route(self.medication.route, self.ROUTE_CODES).code
 
         if route_code:
             # Primary code from NCI Thesaurus
@@ -286,35 +301,22 @@ class MedicationActivity(CDAElement):
             dose_elem.set("value", "1")
             return
 
-        # Try to parse dosage (e.g., "10 mg", "1 tablet", "2")
-        dosage = self.medication.dosage.strip()
-        parts = dosage.split(maxsplit=1)
-
-        if len(parts) >= 1:
-            value = parts[0]
-            # Check if value is numeric
-            try:
-                # Try to convert to float to validate it's a number
-                float(value)
-                # SHOULD contain @value (CONF:1098-32775)
-                dose_elem.set("value", value)
-
-                # Add unit if provided
-                if len(parts) == 2:
-                    unit = parts[1]
-                    dose_elem.set("unit", unit)
-                # If no unit, this is a unitless number (pre-coordinated consumable)
-
-            except ValueError:
-                # If value is not numeric, default to value="1" and add originalText
-                dose_elem.set("value", "1")
-                text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
-                text_elem.text = dosage
+        # Parse dosage (e.g., "10 mg", "1 tablet", "2")
+        dose = normalize_dose(self.medication.dosage)
+
+        if dose.value is not None:
+            # SHOULD contain @value (CONF:1098-32775)
+            dose_elem.set("value", dose.value)
+
+            # Add unit if provided
+            # If no unit, this is a unitless number (pre-coordinated consumable)
+            if dose.unit is not None:
+                dose_elem.set("unit", dose.unit)
         else:
-            # Default to value="1" for complex dosage
+            # If value is not numeric, default to value="1" and add originalText
             dose_elem.set("value", "1")
             text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
-            text_elem.text = dosage
+            text_elem.text = dose.text
 
     def _add_consumable(self, sub_admin: etree._Element) -> None:
         """
@@ -329,10 +331,7 @@ class MedicationActivity(CDAElement):
         )
 
         # Add template ID for manufactured product
-        template_id = etree.SubElement(manufactured_product, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.23")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(manufactured_product, nested="manufactured_product")
 
         # Add manufactured material
         manufactured_material = etree.SubElement(
@@ -340,11 +339,13 @@ class MedicationActivity(CDAElement):
         )
 
         # Add medication code (RxNorm)
-        code_elem = etree.SubElement(manufactured_material, f"{{{NS}}}code")
-        code_elem.set("code", self.medication.code)
-        code_elem.set("codeSystem", self.RXNORM_OID)
-        code_elem.set("codeSystemName", "RxNorm")
-        code_elem.set("displayName", self.medication.name)
+        append_code(
+            manufactured_material,
+            code=self.medication.code,
+            system=self.RXNORM_OID,
+            system_name="RxNorm",
+            display_name=self.medication.name,
+        )
 
     def _add_authors(self, sub_admin: etree._Element) -> None:
         """
@@ -414,10 +415,7 @@ class MedicationActivity(CDAElement):
         )
 
         # Add template ID for instructions
-        template_id = etree.SubElement(act, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.20")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(act, nested="instruction")
 
         # Add code for instructions
         code_elem = etree.SubElement(act, f"{{{NS}}}code")
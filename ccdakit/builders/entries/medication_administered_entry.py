@@ -2,8 +2,11 @@
 
 from lxml import etree
 
+from ccdakit.builders import vocabulary
 from ccdakit.builders.common import Identifier, StatusCode
+from ccdakit.builders.vocabulary import normalize_dose, normalize_route
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.medication_administered import MedicationAdministeredProtocol
 
 
@@ -26,6 +29,8 @@ class MedicationAdministeredActivity(CDAElement):
     administration events with specific timing and administration details.
     """
 
+    __slots__ = ("medication",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -44,6 +49,55 @@ class MedicationAdministeredActivity(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "manufactured_product": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.23",
+                    extension="2014-06-09",
+                    description="Medication Information R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.23",
+                    description="Medication Information R2.0",
+                ),
+            ],
+        },
+        "instruction": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.20",
+                    extension="2014-06-09",
+                    description="Instruction R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.20",
+                    description="Instruction R2.0",
+                ),
+            ],
+        },
+        "indication": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.19",
+                    extension="2014-06-09",
+                    description="Indication R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.19",
+                    description="Indication R2.0",
+                ),
+            ],
+        },
+    }
+
     # Code system OIDs
     RXNORM_OID = "2.16.840.1.113883.6.88"  # RxNorm
     ROUTE_OID = "2.16.840.1.113883.3.26.1.1"  # NCI Thesaurus for routes
@@ -60,17 +114,7 @@ class MedicationAdministeredActivity(CDAElement):
     }
 
     # Common route codes (NCI Thesaurus)
-    ROUTE_CODES = {
-        "oral": "C38288",
-        "iv": "C38276",
-        "intravenous": "C38276",
-        "topical": "C38304",
-        "subcutaneous": "C38299",
-        "intramuscular": "C28161",
-        "inhalation": "C38216",
-        "rectal": "C38295",
-        "ophthalmic": "C38287",
-    }
+    ROUTE_CODES = vocabulary.ROUTE_CODES
 
     def __init__(
         self,
@@ -156,11 +200,9 @@ class MedicationAdministeredActivity(CDAElement):
         Args:
             sub_admin: substanceAdministration element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         sub_admin.append(id_elem)
 
@@ -206,8 +248,7 @@ class MedicationAdministeredActivity(CDAElement):
             route_elem.set("nullFlavor", "UNK")
             return
 
-        route_lower = self.medication.route.lower()
-        route_code = self.ROUTE_CODES.get(route_lower)
+        route_code = normalize_route(self.medication.route, self.ROUTE_CODES).code
 
         if route_code:
             route_elem.set("code", route_code)
@@ -234,26 +275,16 @@ class MedicationAdministeredActivity(CDAElement):
             dose_elem.set("nullFlavor", "UNK")
             return
 
-        # Try to parse dose (e.g., "325 mg", "2 tablets")
-        dose = self.medication.dose.strip()
-        parts = dose.split(maxsplit=1)
+        # Parse dose (e.g., "325 mg", "2 tablets")
+        dose = normalize_dose(self.medication.dose)
 
-        if len(parts) == 2:
-            value, unit = parts
-            # Check if value is numeric
-            try:
-                # Try to convert to float to validate it's a number
-                float(value)
-                dose_elem.set("value", value)
-                dose_elem.set("unit", unit)
-            except ValueError:
-                # If value is not numeric, use originalText
-                text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
-                text_elem.text = dose
+        if dose.value is not None and dose.unit is not None:
+            dose_elem.set("value", dose.value)
+            dose_elem.set("unit", dose.unit)
         else:
-            # Use originalText for complex dosage
+            # Use originalText for non-numeric or unitless dosage
             text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
-            text_elem.text = dose
+            text_elem.text = dose.text
 
     def _add_rate_quantity(self, sub_admin: etree._Element) -> None:
         """
@@ -312,10 +343,7 @@ class MedicationAdministeredActivity(CDAElement):
         )
 
         # Add template ID for manufactured product
-        template_id = etree.SubElement(manufactured_product, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.23")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(manufactured_product, nested="manufactured_product")
 
         # Add manufactured material
         manufactured_material = etree.SubElement(
@@ -370,10 +398,7 @@ class MedicationAdministeredActivity(CDAElement):
         )
 
         # Add template ID for instructions
-        template_id = etree.SubElement(act, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.20")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(act, nested="instruction")
 
         # Add code for instructions
         code_elem = etree.SubElement(act, f"{{{NS}}}code")
@@ -410,10 +435,7 @@ class MedicationAdministeredActivity(CDAElement):
         )
 
         # Add template ID for indication
-        template_id = etree.SubElement(observation, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.19")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(observation, nested="indication")
 
         # Add ID
         id_elem = etree.SubElement(observation, f"{{{NS}}}id")
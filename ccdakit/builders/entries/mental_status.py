@@ -6,6 +6,7 @@ from lxml import etree
 
 from ccdakit.builders.common import EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.mental_status import (
     MentalStatusObservationProtocol,
     MentalStatusOrganizerProtocol,
@@ -25,6 +26,8 @@ class MentalStatusObservation(CDAElement):
     Supports R2.1 (2015-08-01) version.
     """
 
+    __slots__ = ("observation",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -136,11 +139,9 @@ class MentalStatusObservation(CDAElement):
             obs.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             obs.append(id_elem)
 
@@ -196,6 +197,8 @@ class MentalStatusOrganizer(CDAElement):
     Supports R2.1 (2015-08-01) version.
     """
 
+    __slots__ = ("organizer",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -297,11 +300,9 @@ class MentalStatusOrganizer(CDAElement):
             org.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             org.append(id_elem)
 
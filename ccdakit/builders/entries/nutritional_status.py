@@ -5,6 +5,7 @@ from lxml import etree
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.builders.entries.nutrition_assessment import NutritionAssessment
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.nutrition import NutritionalStatusProtocol
 
 
@@ -42,6 +43,8 @@ class NutritionalStatusObservation(CDAElement):
     Supports both R2.1 and R2.0 versions.
     """
 
+    __slots__ = ("nutritional_status",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -138,11 +141,9 @@ class NutritionalStatusObservation(CDAElement):
         Args:
             observation: observation element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         observation.append(id_elem)
 
@@ -6,6 +6,7 @@ from ccdakit.builders.common import Identifier, StatusCode
 from ccdakit.builders.entries.entry_reference import EntryReference
 from ccdakit.builders.entries.progress_toward_goal import ProgressTowardGoalObservation
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.health_status_evaluation import OutcomeObservationProtocol
 
 
@@ -37,6 +38,8 @@ class OutcomeObservation(CDAElement):
     - SHALL contain at least one entryRelationship (CONF:1098-32782)
     """
 
+    __slots__ = ("outcome",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -143,11 +146,9 @@ class OutcomeObservation(CDAElement):
             observation.append(id_elem)
         else:
             # Generate a UUID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             observation.append(id_elem)
 
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.physical_exam import WoundObservationProtocol
 
 
@@ -23,6 +24,8 @@ class LongitudinalCareWoundObservation(CDAElement):
     - Problem Observation (V3): 2.16.840.1.113883.10.20.22.4.4:2015-08-01
     """
 
+    __slots__ = ("wound_observation",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -123,11 +126,9 @@ class LongitudinalCareWoundObservation(CDAElement):
         Args:
             observation: observation element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         observation.append(id_elem)
 
@@ -22,6 +22,8 @@ class PlannedAct(CDAElement):
     Version: 2014-06-09
     """
 
+    __slots__ = ("planned_act",)
+
     # Template IDs - Only one version (R2.0 and R2.1 use the same template)
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.plan_of_treatment import PlannedImmunizationProtocol
 
 
@@ -20,6 +21,8 @@ class PlannedImmunization(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.120
     """
 
+    __slots__ = ("immunization",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -38,6 +41,26 @@ class PlannedImmunization(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "manufactured_product": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.54",
+                    extension="2014-06-09",
+                    description="Immunization Medication Information R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.54",
+                    extension="2014-06-09",
+                    description="Immunization Medication Information R2.0",
+                ),
+            ],
+        },
+    }
+
     def __init__(
         self,
         immunization: PlannedImmunizationProtocol,
@@ -104,11 +127,9 @@ class PlannedImmunization(CDAElement):
             sub_admin.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             sub_admin.append(id_elem)
 
@@ -127,12 +148,7 @@ class PlannedImmunization(CDAElement):
         )
 
         # Add template ID for manufactured product
-        template = etree.SubElement(manufactured_product, f"{{{NS}}}templateId")
-        template.set("root", "2.16.840.1.113883.10.20.22.4.54")
-        if self.version == CDAVersion.R2_1:
-            template.set("extension", "2014-06-09")
-        else:
-            template.set("extension", "2014-06-09")
+        self.add_template_ids(manufactured_product, nested="manufactured_product")
 
         # Add manufactured material
         material = etree.SubElement(
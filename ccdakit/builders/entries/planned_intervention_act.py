@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.intervention import PlannedInterventionProtocol
 
 
@@ -33,6 +34,8 @@ class PlannedInterventionAct(CDAElement):
     - SHOULD contain effectiveTime (CONF:1198-32723)
     """
 
+    __slots__ = ("intervention",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -149,11 +152,9 @@ class PlannedInterventionAct(CDAElement):
             act.append(id_elem)
         else:
             # Generate a UUID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             act.append(id_elem)
 
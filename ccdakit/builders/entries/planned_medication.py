@@ -3,7 +3,14 @@
 from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
+from ccdakit.builders.vocabulary import (
+    ROUTE_OID,
+    normalize_dose,
+    normalize_frequency,
+    normalize_route,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.plan_of_treatment import PlannedMedicationProtocol
 
 
@@ -20,6 +27,8 @@ class PlannedMedication(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.42
     """
 
+    __slots__ = ("medication",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -38,6 +47,26 @@ class PlannedMedication(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "manufactured_product": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.23",
+                    extension="2014-06-09",
+                    description="Medication Information R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.23",
+                    extension="2014-06-09",
+                    description="Medication Information R2.0",
+                ),
+            ],
+        },
+    }
+
     def __init__(
         self,
         medication: PlannedMedicationProtocol,
@@ -85,24 +114,82 @@ class PlannedMedication(CDAElement):
             time_elem = EffectiveTime(value=self.medication.planned_date).to_element()
             sub_admin.append(time_elem)
 
+        # Add frequency if specified
+        if self.medication.frequency:
+            self._add_frequency_effective_time(sub_admin)
+
         # Add route code if specified
         if self.medication.route:
-            route_elem = etree.SubElement(sub_admin, f"{{{NS}}}routeCode")
-            route_elem.set("code", "C38288")  # Oral route as default
-            route_elem.set("codeSystem", "2.16.840.1.113883.3.26.1.1")
-            route_elem.set("codeSystemName", "NCI Thesaurus")
-            route_elem.set("displayName", self.medication.route)
+            self._add_route_code(sub_admin)
 
         # Add dose quantity if specified
         if self.medication.dose:
-            dose_elem = etree.SubElement(sub_admin, f"{{{NS}}}doseQuantity")
-            dose_elem.set("value", self.medication.dose)
+            self._add_dose_quantity(sub_admin)
 
         # Add consumable (medication information)
         self._add_consumable(sub_admin)
 
         return sub_admin
 
+    def _add_frequency_effective_time(self, sub_admin: etree._Element) -> None:
+        """
+        Add periodic effectiveTime for a recognized frequency.
+
+        Args:
+            sub_admin: substanceAdministration element
+        """
+        frequency = normalize_frequency(self.medication.frequency)
+        if frequency.period is None:
+            # PRN or unrecognized frequency - no fixed period
+            return
+
+        time_elem = etree.SubElement(sub_admin, f"{{{NS}}}effectiveTime")
+        time_elem.set("operator", "A")
+        time_elem.set("{http://www.w3.org/2001/XMLSchema-instance}type", "PIVL_TS")
+        period = etree.SubElement(time_elem, f"{{{NS}}}period")
+        period.set("value", frequency.period)
+        period.set("unit", frequency.unit)
+
+    def _add_route_code(self, sub_admin: etree._Element) -> None:
+        """
+        Add routeCode element.
+
+        Args:
+            sub_admin: substanceAdministration element
+        """
+        route_elem = etree.SubElement(sub_admin, f"{{{NS}}}routeCode")
+        route_code = normalize_route(self.medication.route).code
+
+        if route_code:
+            route_elem.set("code", route_code)
+            route_elem.set("codeSystem", ROUTE_OID)
+            route_elem.set("codeSystemName", "NCI Thesaurus")
+            route_elem.set("displayName", self.medication.route)
+        else:
+            # Use originalText if code not found
+            route_elem.set("nullFlavor", "OTH")
+            text_elem = etree.SubElement(route_elem, f"{{{NS}}}originalText")
+            text_elem.text = self.medication.route
+
+    def _add_dose_quantity(self, sub_admin: etree._Element) -> None:
+        """
+        Add doseQuantity element.
+
+        Args:
+            sub_admin: substanceAdministration element
+        """
+        dose_elem = etree.SubElement(sub_admin, f"{{{NS}}}doseQuantity")
+        dose = normalize_dose(self.medication.dose)
+
+        if dose.value is not None:
+            dose_elem.set("value", dose.value)
+            if dose.unit is not None:
+                dose_elem.set("unit", dose.unit)
+        else:
+            # Use originalText for non-numeric dosage
+            text_elem = etree.SubElement(dose_elem, f"{{{NS}}}originalText")
+            text_elem.text = dose.text
+
     def _add_ids(self, sub_admin: etree._Element) -> None:
         """
         Add ID elements to substanceAdministration.
@@ -117,11 +204,9 @@ class PlannedMedication(CDAElement):
             sub_admin.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             sub_admin.append(id_elem)
 
@@ -140,12 +225,7 @@ class PlannedMedication(CDAElement):
         )
 
         # Add template ID for manufactured product
-        template = etree.SubElement(manufactured_product, f"{{{NS}}}templateId")
-        template.set("root", "2.16.840.1.113883.10.20.22.4.23")
-        if self.version == CDAVersion.R2_1:
-            template.set("extension", "2014-06-09")
-        else:
-            template.set("extension", "2014-06-09")
+        self.add_template_ids(manufactured_product, nested="manufactured_product")
 
         # Add manufactured material
         material = etree.SubElement(
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.plan_of_treatment import PlannedObservationProtocol
 
 
@@ -20,6 +21,8 @@ class PlannedObservation(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.44
     """
 
+    __slots__ = ("observation",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -115,11 +118,9 @@ class PlannedObservation(CDAElement):
             observation.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             observation.append(id_elem)
 
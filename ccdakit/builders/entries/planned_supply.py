@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.plan_of_treatment import PlannedSupplyProtocol
 
 
@@ -20,6 +21,8 @@ class PlannedSupply(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.43
     """
 
+    __slots__ = ("supply",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -120,11 +123,9 @@ class PlannedSupply(CDAElement):
             supply.append(id_elem)
         else:
             # Add a generated ID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             supply.append(id_elem)
 
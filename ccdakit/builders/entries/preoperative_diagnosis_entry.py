@@ -26,6 +26,8 @@ class PreoperativeDiagnosisEntry(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.4.65 (V3, 2015-08-01)
     """
 
+    __slots__ = ("diagnosis",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -4,8 +4,15 @@ from typing import Optional
 
 from lxml import etree
 
-from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode, create_default_author_participation
+from ccdakit.builders.common import (
+    append_code,
+    append_effective_time,
+    append_identifier,
+    append_status_code,
+    create_default_author_participation,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.author import AuthorProtocol
 from ccdakit.protocols.problem import ProblemProtocol
 
@@ -27,6 +34,8 @@ class ProblemObservation(CDAElement):
     - Author Participation SHOULD be included
     """
 
+    __slots__ = ("problem", "author")
+
     # Template IDs for different versions
     # Note: V4 (2022-06-01) conforms to V3 (2015-08-01), so both templates are included
     TEMPLATES = {
@@ -111,19 +120,18 @@ class ProblemObservation(CDAElement):
         # SHALL contain exactly one code, which SHOULD be selected from
         # ValueSet Problem Type (SNOMEDCT) 2.16.840.1.113883.3.88.12.3221.7.2
         # Using 55607006 = "Problem" (SNOMED CT)
-        code_elem = Code(
+        append_code(
+            observation,
             code="55607006",
-            system="SNOMED",
+            system=self.PROBLEM_TYPE_OID,
+            system_name="SNOMED",
             display_name="Problem",
-        ).to_element()
-        code_elem.tag = f"{{{NS}}}code"
-        observation.append(code_elem)
+        )
 
         # Add status code
         # Per C-CDA specification, Problem Observation statusCode SHALL be "completed"
         # because it represents a completed observation of a problem (even if problem is active)
-        status_elem = StatusCode("completed").to_element()
-        observation.append(status_elem)
+        append_status_code(observation, "completed")
 
         # Add effective time (onset and resolved dates)
         # SHALL contain effectiveTime with low (CONF:4515-9050, CONF:4515-15603)
@@ -148,17 +156,12 @@ class ProblemObservation(CDAElement):
         # Add persistent ID if available
         if self.problem.persistent_id:
             pid = self.problem.persistent_id
-            id_elem = Identifier(root=pid.root, extension=pid.extension).to_element()
-            observation.append(id_elem)
+            append_identifier(observation, root=pid.root, extension=pid.extension)
         else:
             # Add a generated ID
-            import uuid
-
-            id_elem = Identifier(
-                root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
-            ).to_element()
-            observation.append(id_elem)
+            append_identifier(
+                observation, root="2.16.840.1.113883.19", extension=new_id()
+            )
 
     def _add_effective_time(self, observation: etree._Element) -> None:
         """
@@ -183,11 +186,11 @@ class ProblemObservation(CDAElement):
             )
 
         # Build effectiveTime with low and optional high
-        time_elem = EffectiveTime(
+        append_effective_time(
+            observation,
             low=self.problem.onset_date,
             high=self.problem.resolved_date,
-        ).to_element()
-        observation.append(time_elem)
+        )
 
     def _add_value(self, observation: etree._Element) -> None:
         """
@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode, create_default_author_participation
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.procedure import ProcedureProtocol
 
 
@@ -22,6 +23,8 @@ class ProcedureActivity(CDAElement):
     Supports V3 (2022-06-01) and V2 (2014-06-09) versions.
     """
 
+    __slots__ = ("procedure",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -148,11 +151,9 @@ class ProcedureActivity(CDAElement):
         Args:
             proc: procedure element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         proc.append(id_elem)
 
@@ -230,8 +231,6 @@ class ProcedureActivity(CDAElement):
         Args:
             proc: procedure element
         """
-        import uuid
-
         assert self.procedure.performer_name is not None
         performer_elem = etree.SubElement(proc, f"{{{NS}}}performer")
 
@@ -240,7 +239,7 @@ class ProcedureActivity(CDAElement):
         # Add ID (required)
         id_elem = etree.SubElement(assigned_entity, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add address (required per spec)
         # If performer_address is available, parse and add it; otherwise add nullFlavor
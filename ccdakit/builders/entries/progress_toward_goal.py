@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.health_status_evaluation import ProgressTowardGoalProtocol
 
 
@@ -30,6 +31,8 @@ class ProgressTowardGoalObservation(CDAElement):
     - SHALL contain value from Goal Achievement value set (CONF:1098-31426)
     """
 
+    __slots__ = ("progress",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -126,11 +129,9 @@ class ProgressTowardGoalObservation(CDAElement):
             observation.append(id_elem)
         else:
             # Generate a UUID
-            import uuid
-
             id_elem = Identifier(
                 root="2.16.840.1.113883.19",
-                extension=str(uuid.uuid4()),
+                extension=new_id(),
             ).to_element()
             observation.append(id_elem)
 
@@ -2,8 +2,14 @@
 
 from lxml import etree
 
-from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
+from ccdakit.builders.common import (
+    append_code,
+    append_effective_time,
+    append_identifier,
+    append_status_code,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.result import ResultObservationProtocol, ResultOrganizerProtocol
 
 
@@ -25,6 +31,8 @@ class ResultObservation(CDAElement):
     - Reference ranges
     """
 
+    __slots__ = ("result",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -113,22 +121,19 @@ class ResultObservation(CDAElement):
         self._add_id(observation)
 
         # Add code (LOINC code for the test)
-        code_elem = Code(
+        append_code(
+            observation,
             code=self.result.test_code,
-            system="LOINC",
+            system=self.LOINC_OID,
+            system_name="LOINC",
             display_name=self.result.test_name,
-        ).to_element()
-        code_elem.tag = f"{{{NS}}}code"
-        observation.append(code_elem)
+        )
 
         # Add status code
-        status = self._map_status(self.result.status)
-        status_elem = StatusCode(status).to_element()
-        observation.append(status_elem)
+        append_status_code(observation, self._map_status(self.result.status))
 
         # Add effective time
-        time_elem = EffectiveTime(value=self.result.effective_time).to_element()
-        observation.append(time_elem)
+        append_effective_time(observation, value=self.result.effective_time)
 
         # Add value (PQ, CD, or ST type)
         self._add_value(observation)
@@ -150,13 +155,7 @@ class ResultObservation(CDAElement):
         Args:
             observation: observation element
         """
-        import uuid
-
-        id_elem = Identifier(
-            root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
-        ).to_element()
-        observation.append(id_elem)
+        append_identifier(observation, root="2.16.840.1.113883.19", extension=new_id())
 
     def _map_status(self, status: str) -> str:
         """
@@ -320,6 +319,8 @@ class ResultOrganizer(CDAElement):
     - Contains multiple Result Observations
     """
 
+    __slots__ = ("organizer",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -386,22 +387,19 @@ class ResultOrganizer(CDAElement):
         self._add_id(organizer_elem)
 
         # Add code (LOINC code for the panel)
-        code_elem = Code(
+        append_code(
+            organizer_elem,
             code=self.organizer.panel_code,
-            system="LOINC",
+            system=ResultObservation.LOINC_OID,
+            system_name="LOINC",
             display_name=self.organizer.panel_name,
-        ).to_element()
-        code_elem.tag = f"{{{NS}}}code"
-        organizer_elem.append(code_elem)
+        )
 
         # Add status code
-        status = self._map_status(self.organizer.status)
-        status_elem = StatusCode(status).to_element()
-        organizer_elem.append(status_elem)
+        append_status_code(organizer_elem, self._map_status(self.organizer.status))
 
         # Add effective time
-        time_elem = EffectiveTime(value=self.organizer.effective_time).to_element()
-        organizer_elem.append(time_elem)
+        append_effective_time(organizer_elem, value=self.organizer.effective_time)
 
         # Add component entries for each result observation
         for result in self.organizer.results:
@@ -416,13 +414,7 @@ class ResultOrganizer(CDAElement):
         Args:
             organizer_elem: organizer element
         """
-        import uuid
-
-        id_elem = Identifier(
-            root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
-        ).to_element()
-        organizer_elem.append(id_elem)
+        append_identifier(organizer_elem, root="2.16.840.1.113883.19", extension=new_id())
 
     def _map_status(self, status: str) -> str:
         """
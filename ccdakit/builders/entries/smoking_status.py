@@ -4,6 +4,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.social_history import SmokingStatusProtocol
 
 
@@ -27,6 +28,8 @@ class SmokingStatusObservation(CDAElement):
     Supports both R2.1 and R2.0 versions.
     """
 
+    __slots__ = ("smoking_status",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -136,11 +139,9 @@ class SmokingStatusObservation(CDAElement):
         Args:
             observation: observation element
         """
-        import uuid
-
         id_elem = Identifier(
             root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
+            extension=new_id(),
         ).to_element()
         observation.append(id_elem)
 
@@ -2,8 +2,15 @@
 
 from lxml import etree
 
-from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode, create_default_author_participation
+from ccdakit.builders.common import (
+    append_code,
+    append_effective_time,
+    append_identifier,
+    append_status_code,
+    create_default_author_participation,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.vital_signs import VitalSignProtocol, VitalSignsOrganizerProtocol
 
 
@@ -19,6 +26,8 @@ class VitalSignObservation(CDAElement):
     Supports both R2.1 (2014-06-09) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("vital_sign",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -93,23 +102,21 @@ class VitalSignObservation(CDAElement):
         self._add_id(observation)
 
         # Add code (LOINC code for the vital sign type)
-        code_elem = Code(
+        append_code(
+            observation,
             code=self.vital_sign.code,
-            system="LOINC",
+            system=self.LOINC_OID,
+            system_name="LOINC",
             display_name=self.vital_sign.type,
-        ).to_element()
-        code_elem.tag = f"{{{NS}}}code"
-        observation.append(code_elem)
+        )
 
         # Add status code
-        status_elem = StatusCode("completed").to_element()
-        observation.append(status_elem)
+        append_status_code(observation, "completed")
 
         # Add effective time (CONF:1098-32775, CONF:1098-32776)
         # SHOULD contain @value OR low, not both
         # Use simple @value attribute for vital sign measurement time
-        time_elem = EffectiveTime(value=self.vital_sign.date).to_element()
-        observation.append(time_elem)
+        append_effective_time(observation, value=self.vital_sign.date)
 
         # Add value with unit
         self._add_value(observation)
@@ -130,13 +137,7 @@ class VitalSignObservation(CDAElement):
         Args:
             observation: observation element
         """
-        import uuid
-
-        id_elem = Identifier(
-            root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
-        ).to_element()
-        observation.append(id_elem)
+        append_identifier(observation, root="2.16.840.1.113883.19", extension=new_id())
 
     def _add_value(self, observation: etree._Element) -> None:
         """
@@ -202,6 +203,8 @@ class VitalSignsOrganizer(CDAElement):
     Supports both R2.1 (2014-06-09) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("organizer",)
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -268,12 +271,10 @@ class VitalSignsOrganizer(CDAElement):
         code_elem.set("displayName", "Vital signs")
 
         # Add status code
-        status_elem = StatusCode("completed").to_element()
-        organizer_elem.append(status_elem)
+        append_status_code(organizer_elem, "completed")
 
         # Add effective time
-        time_elem = EffectiveTime(value=self.organizer.date).to_element()
-        organizer_elem.append(time_elem)
+        append_effective_time(organizer_elem, value=self.organizer.date)
 
         # Add author participation (CONF:1198-31153)
         # Vital Signs Organizer SHOULD contain zero or more [0..*] Author Participation
@@ -292,13 +293,7 @@ class VitalSignsOrganizer(CDAElement):
         Args:
             organizer_elem: organizer element
         """
-        import uuid
-
-        id_elem = Identifier(
-            root="2.16.840.1.113883.19",
-            extension=str(uuid.uuid4()),
-        ).to_element()
-        organizer_elem.append(id_elem)
+        append_identifier(organizer_elem, root="2.16.840.1.113883.19", extension=new_id())
 
     def _add_author_participation(self, organizer_elem: etree._Element) -> None:
         """
@@ -2,10 +2,12 @@
 
 from ccdakit.builders.header.author import Author, Custodian
 from ccdakit.builders.header.record_target import RecordTarget
+from ccdakit.builders.header.related_document import RelatedDocument
 
 
 __all__ = [
     "RecordTarget",
     "Author",
     "Custodian",
+    "RelatedDocument",
 ]
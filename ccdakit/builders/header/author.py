@@ -3,7 +3,7 @@
 from lxml import etree
 
 from ccdakit.builders.common import Identifier
-from ccdakit.builders.demographics import Address, Telecom
+from ccdakit.builders.demographics import append_address, append_telecom
 from ccdakit.core.base import CDAElement
 from ccdakit.protocols.author import AuthorProtocol, OrganizationProtocol
 
@@ -15,6 +15,8 @@ NS = "urn:hl7-org:v3"
 class Author(CDAElement):
     """Builder for CDA Author."""
 
+    __slots__ = ("author",)
+
     # Standard OID for NPI
     NPI_OID = "2.16.840.1.113883.4.6"
 
@@ -54,13 +56,11 @@ class Author(CDAElement):
 
         # Add addresses
         for addr_data in self.author.addresses:
-            addr_builder = Address(addr_data, use="work")
-            assigned_author.append(addr_builder.to_element())
+            append_address(assigned_author, addr_data, use="work")
 
         # Add telecoms
         for telecom_data in self.author.telecoms:
-            telecom_builder = Telecom(telecom_data)
-            assigned_author.append(telecom_builder.to_element())
+            append_telecom(assigned_author, telecom_data)
 
         # Add assignedPerson
         assigned_person = etree.SubElement(assigned_author, f"{{{NS}}}assignedPerson")
@@ -174,18 +174,18 @@ class Author(CDAElement):
 
         # Add organization addresses
         for addr_data in org.addresses:
-            addr_builder = Address(addr_data, use="work")
-            rep_org.append(addr_builder.to_element())
+            append_address(rep_org, addr_data, use="work")
 
         # Add organization telecoms
         for telecom_data in org.telecoms:
-            telecom_builder = Telecom(telecom_data)
-            rep_org.append(telecom_builder.to_element())
+            append_telecom(rep_org, telecom_data)
 
 
 class Custodian(CDAElement):
     """Builder for CDA Custodian (document custodian organization)."""
 
+    __slots__ = ("organization",)
+
     # Standard OID for NPI
     NPI_OID = "2.16.840.1.113883.4.6"
 
@@ -233,12 +233,10 @@ class Custodian(CDAElement):
 
         # Add organization telecom
         for telecom_data in self.organization.telecoms:
-            telecom_builder = Telecom(telecom_data)
-            rep_org.append(telecom_builder.to_element())
+            append_telecom(rep_org, telecom_data)
 
         # Add organization address
         for addr_data in self.organization.addresses:
-            addr_builder = Address(addr_data, use="work")
-            rep_org.append(addr_builder.to_element())
+            append_address(rep_org, addr_data, use="work")
 
         return custodian
@@ -3,7 +3,7 @@
 from lxml import etree
 
 from ccdakit.builders.common import Code, Identifier
-from ccdakit.builders.demographics import Address, Telecom
+from ccdakit.builders.demographics import append_address, append_telecom
 from ccdakit.core.base import CDAElement
 from ccdakit.protocols.patient import PatientProtocol
 
@@ -15,6 +15,8 @@ NS = "urn:hl7-org:v3"
 class RecordTarget(CDAElement):
     """Builder for CDA RecordTarget (patient demographics)."""
 
+    __slots__ = ("patient",)
+
     # Standard OID for SSN
     SSN_OID = "2.16.840.1.113883.4.1"
 
@@ -53,13 +55,11 @@ class RecordTarget(CDAElement):
 
         # Add addresses
         for addr_data in self.patient.addresses:
-            addr_builder = Address(addr_data, use="home")
-            patient_role.append(addr_builder.to_element())
+            append_address(patient_role, addr_data, use="home")
 
         # Add telecoms
         for telecom_data in self.patient.telecoms:
-            telecom_builder = Telecom(telecom_data)
-            patient_role.append(telecom_builder.to_element())
+            append_telecom(patient_role, telecom_data)
 
         # Add patient element
         patient_elem = etree.SubElement(patient_role, f"{{{NS}}}patient")
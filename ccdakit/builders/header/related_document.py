@@ -0,0 +1,69 @@
+"""RelatedDocument builder linking a document to a parent document."""
+
+from typing import Optional
+
+from lxml import etree
+
+from ccdakit.builders.common import Identifier
+from ccdakit.core.base import CDAElement
+from ccdakit.core.config import get_document_id_root
+
+
+# CDA namespace for element creation
+NS = "urn:hl7-org:v3"
+
+
+class RelatedDocument(CDAElement):
+    """Builder for CDA relatedDocument (reference to a parent document)."""
+
+    __slots__ = ("document_id", "type_code", "root")
+
+    # x_ActRelationshipDocument codes
+    TYPE_CODES = {
+        "APND": "Append (addendum to the parent document)",
+        "RPLC": "Replace (supersedes the parent document)",
+        "XFRM": "Transform (derived from the parent document)",
+    }
+
+    def __init__(
+        self,
+        document_id: str,
+        type_code: str = "APND",
+        root: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Initialize RelatedDocument builder.
+
+        Args:
+            document_id: id extension of the parent document
+            type_code: Relationship to the parent (APND, RPLC or XFRM)
+            root: id root of the parent document (configured document id
+                root if not provided)
+            **kwargs: Additional arguments passed to CDAElement
+
+        Raises:
+            ValueError: If type_code is not a document relationship code
+        """
+        super().__init__(**kwargs)
+        if type_code not in self.TYPE_CODES:
+            raise ValueError(
+                f"Invalid relatedDocument typeCode {type_code!r}; "
+                f"expected one of {', '.join(self.TYPE_CODES)}"
+            )
+        self.document_id = document_id
+        self.type_code = type_code
+        self.root = root
+
+    def build(self) -> etree.Element:
+        """
+        Build relatedDocument XML element.
+
+        Returns:
+            lxml Element for relatedDocument
+        """
+        related = etree.Element(f"{{{NS}}}relatedDocument", typeCode=self.type_code)
+        parent = etree.SubElement(related, f"{{{NS}}}parentDocument")
+        root = self.root or get_document_id_root()
+        parent.append(Identifier(root=root, extension=self.document_id).to_element())
+        return related
@@ -0,0 +1,343 @@
+"""Shared narrative (section <text>) generation for C-CDA section builders.
+
+Sections declare their narrative layout once, as a NarrativeTable of columns
+with cell formatters, and render it per build in a single pass. The table
+header is compiled once per layout and cloned, and the same layout can be
+emitted as a table, a bulleted list or one paragraph per row depending on
+CDAConfig.narrative_style.
+
+Example:
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Problem", lambda row: row[1].name,
+                            content_id=lambda row: f"problem-{row[0]}"),
+            NarrativeColumn("Onset Date", lambda row: format_date(row[1].onset_date, "Unknown")),
+        ],
+        empty_text="No known problems",
+    )
+    NARRATIVE.render(section, enumerate(problems, start=1))
+"""
+
+import copy
+from datetime import date, datetime
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from lxml import etree
+
+from ccdakit.core.config import get_config_or_none
+
+
+# CDA namespace
+NS = "urn:hl7-org:v3"
+
+NARRATIVE_STYLES = ("table", "list", "paragraph")
+
+# Text of the placeholder narrative emitted by structured-only builds
+NARRATIVE_STUB_TEXT = "Narrative omitted; see structured entries."
+
+_TEXT = f"{{{NS}}}text"
+_TABLE = f"{{{NS}}}table"
+_THEAD = f"{{{NS}}}thead"
+_TBODY = f"{{{NS}}}tbody"
+_TR = f"{{{NS}}}tr"
+_TH = f"{{{NS}}}th"
+_TD = f"{{{NS}}}td"
+_LIST = f"{{{NS}}}list"
+_ITEM = f"{{{NS}}}item"
+_PARAGRAPH = f"{{{NS}}}paragraph"
+_CONTENT = f"{{{NS}}}content"
+_LINK_HTML = f"{{{NS}}}linkHtml"
+
+_NO_ROWS = object()
+
+# Cell text, or items of a nested list
+CellValue = Union[str, List[str]]
+
+
+def format_date(value: Optional[date], default: str = "-") -> str:
+    """
+    Format a date (or datetime) as YYYY-MM-DD.
+
+    Equivalent to ``strftime("%Y-%m-%d")`` but several times faster.
+
+    Args:
+        value: Date to format
+        default: Text returned when value is empty
+
+    Returns:
+        Formatted date or default
+    """
+    if not value:
+        return default
+    return value.isoformat()[:10]
+
+
+def format_datetime(value: Optional[date], default: str = "-") -> str:
+    """
+    Format a datetime as YYYY-MM-DD HH:MM.
+
+    Equivalent to ``strftime("%Y-%m-%d %H:%M")``; plain dates render as midnight.
+
+    Args:
+        value: Datetime (or date) to format
+        default: Text returned when value is empty
+
+    Returns:
+        Formatted datetime or default
+    """
+    if not value:
+        return default
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="minutes")[:16]
+    return f"{value.isoformat()} 00:00"
+
+
+def format_date_or_datetime(value: Any, default: str = "-") -> str:
+    """
+    Format a datetime as YYYY-MM-DD HH:MM and a plain date as YYYY-MM-DD.
+
+    Values that are not dates (e.g. preformatted text) are rendered with str().
+
+    Args:
+        value: Date or datetime to format
+        default: Text returned when value is empty
+
+    Returns:
+        Formatted value or default
+    """
+    if not value:
+        return default
+    if isinstance(value, datetime):
+        return format_datetime(value)
+    if isinstance(value, date):
+        return format_date(value)
+    return str(value)
+
+
+def resolve_narrative_style(style: Optional[str] = None) -> str:
+    """
+    Resolve the narrative style to render.
+
+    Args:
+        style: Explicit style, or None to use CDAConfig.narrative_style
+            (falling back to "table" when ccdakit is not configured)
+
+    Returns:
+        One of NARRATIVE_STYLES
+
+    Raises:
+        ValueError: If the style is not supported
+    """
+    if style is None:
+        config = get_config_or_none()
+        style = config.narrative_style if config is not None else "table"
+    if style not in NARRATIVE_STYLES:
+        raise ValueError(
+            f"Unsupported narrative style {style!r}; expected one of {', '.join(NARRATIVE_STYLES)}"
+        )
+    return style
+
+
+def add_narrative_stub(section: etree._Element) -> etree._Element:
+    """
+    Append a minimal <text> element to section.
+
+    Used by structured-only builds: every section template requires a <text>
+    element, but consumers of those builds never read it.
+
+    Args:
+        section: Section element to append to
+
+    Returns:
+        The created <text> element
+    """
+    text = etree.SubElement(section, _TEXT)
+    etree.SubElement(text, _PARAGRAPH).text = NARRATIVE_STUB_TEXT
+    return text
+
+
+class NarrativeColumn:
+    """One column of a narrative table: header text and cell formatter."""
+
+    __slots__ = ("header", "value", "content_id", "href", "rowspan")
+
+    def __init__(
+        self,
+        header: str,
+        value: Callable[[Any], CellValue],
+        content_id: Optional[Callable[[Any], Optional[str]]] = None,
+        href: Optional[Callable[[Any], Optional[str]]] = None,
+        rowspan: Optional[Callable[[Any], Optional[int]]] = None,
+    ) -> None:
+        """
+        Initialize narrative column.
+
+        Args:
+            header: Column header text
+            value: Function returning the cell text for a row, or a list of
+                strings rendered as a nested <list> (joined inline)
+            content_id: Optional function returning the ID of a <content>
+                element wrapping the cell text (referenced from entries).
+                Returning None renders the cell text without a wrapper.
+            href: Optional function returning the target of a <linkHtml>
+                element wrapping the cell text, or None for plain text
+            rowspan: Optional function returning the rowspan of the cell, 0 to
+                omit the cell (spanned from a row above) or None for a plain
+                cell. Ignored by the list and paragraph styles.
+        """
+        self.header = header
+        self.value = value
+        self.content_id = content_id
+        self.href = href
+        self.rowspan = rowspan
+
+
+class NarrativeTable:
+    """
+    Precompiled narrative layout for a section.
+
+    Layouts are immutable and meant to be created once at class level; the
+    header row is built at construction time and cloned into every table.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[NarrativeColumn],
+        empty_text: str,
+        table_attributes: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Initialize narrative layout.
+
+        Args:
+            columns: Columns in display order
+            empty_text: Paragraph text rendered when there are no rows
+            table_attributes: Attributes of the <table> element
+                (default: border="1" width="100%")
+        """
+        self.columns = tuple(columns)
+        self.empty_text = empty_text
+        self.table_attributes = dict(
+            table_attributes if table_attributes is not None else {"border": "1", "width": "100%"}
+        )
+        self._thead = self._compile_header()
+
+    def _compile_header(self) -> etree._Element:
+        """Build the reusable <thead> fragment."""
+        thead = etree.Element(_THEAD)
+        tr = etree.SubElement(thead, _TR)
+        for column in self.columns:
+            etree.SubElement(tr, _TH).text = column.header
+        return thead
+
+    def render(
+        self,
+        section: etree._Element,
+        rows: Iterable[Any],
+        style: Optional[str] = None,
+        empty_text: Optional[str] = None,
+    ) -> etree._Element:
+        """
+        Append a <text> element with the narrative for rows to section.
+
+        Args:
+            section: Section element to append to
+            rows: Row objects passed to each column's formatters
+            style: "table", "list" or "paragraph" (default: from config)
+            empty_text: Paragraph text when there are no rows
+                (default: the layout's empty_text)
+
+        Returns:
+            The created <text> element
+        """
+        style = resolve_narrative_style(style)
+        text = etree.SubElement(section, _TEXT)
+
+        iterator = iter(rows)
+        first = next(iterator, _NO_ROWS)
+        if first is _NO_ROWS:
+            etree.SubElement(text, _PARAGRAPH).text = (
+                self.empty_text if empty_text is None else empty_text
+            )
+            return text
+
+        all_rows = chain((first,), iterator)
+        if style == "table":
+            self._render_table(text, all_rows)
+        elif style == "list":
+            container = etree.SubElement(text, _LIST, listType="unordered")
+            for row in all_rows:
+                self._render_inline(etree.SubElement(container, _ITEM), row)
+        else:
+            for row in all_rows:
+                self._render_inline(etree.SubElement(text, _PARAGRAPH), row)
+        return text
+
+    def _render_table(self, text: etree._Element, rows: Iterable[Any]) -> None:
+        """Render rows as an HTML-style table."""
+        table = etree.SubElement(text, _TABLE, self.table_attributes)
+        table.append(copy.deepcopy(self._thead))
+        tbody = etree.SubElement(table, _TBODY)
+
+        sub_element = etree.SubElement
+        columns = [
+            (column.value, column.content_id, column.href, column.rowspan)
+            for column in self.columns
+        ]
+        for row in rows:
+            tr = sub_element(tbody, _TR)
+            for value, content_id, href, rowspan in columns:
+                if rowspan is None:
+                    td = sub_element(tr, _TD)
+                else:
+                    span = rowspan(row)
+                    if span == 0:
+                        continue
+                    td = sub_element(tr, _TD)
+                    if span is not None:
+                        td.set("rowspan", str(span))
+                cell = value(row)
+                cell_id = content_id(row) if content_id is not None else None
+                link = href(row) if href is not None else None
+                if cell_id is not None:
+                    sub_element(td, _CONTENT, ID=cell_id).text = cell
+                elif link is not None:
+                    sub_element(td, _LINK_HTML, href=link).text = cell
+                elif isinstance(cell, list):
+                    items = sub_element(td, _LIST)
+                    for item in cell:
+                        sub_element(items, _ITEM).text = item
+                else:
+                    td.text = cell
+
+    def _render_inline(self, parent: etree._Element, row: Any) -> None:
+        """Render one row as "Header: value; ..." mixed content of parent."""
+        last: Optional[etree._Element] = None
+        separator = ""
+        for column in self.columns:
+            cell = column.value(row)
+            if isinstance(cell, list):
+                cell = ", ".join(cell)
+            cell_id = column.content_id(row) if column.content_id is not None else None
+            link = column.href(row) if column.href is not None else None
+            wrapper = None
+            if cell_id is not None:
+                wrapper = (_CONTENT, {"ID": cell_id})
+            elif link is not None:
+                wrapper = (_LINK_HTML, {"href": link})
+            if not cell and wrapper is None:
+                continue
+            label = f"{separator}{column.header}: "
+            separator = "; "
+            if wrapper is None:
+                label += cell
+            # Mixed content: text goes to parent.text before the first child,
+            # and to the previous child's tail afterwards
+            if last is None:
+                parent.text = (parent.text or "") + label
+            else:
+                last.tail = (last.tail or "") + label
+            if wrapper is not None:
+                last = etree.SubElement(parent, *wrapper)
+                last.text = cell
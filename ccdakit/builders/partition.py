@@ -0,0 +1,333 @@
+"""Splitting one patient's record into several linked, bounded-size documents.
+
+A record holding decades of results and encounters produces a CCD that many
+receivers reject or time out on, and that is slow to build and validate as a
+unit. A DocumentPartitioner takes the section data of a SectionPlan and cuts
+the dated sections (results, encounters, vital signs, ...) into consecutive
+date windows, so that every document stays under an entry count and/or a byte
+size. The other sections (allergies, active problems, ...) are repeated in
+every part so each document stands on its own.
+
+The parts share one header: the same effective time, and one HeaderCache for
+the fragments built from the author and custodian. Every part after the first
+carries a relatedDocument (typeCode APND) pointing at the first part. Each
+part gets its own copies of the section builders, so parts can be built and
+validated in parallel.
+
+Example:
+    partitioner = DocumentPartitioner(
+        plan, windowed=["results", "encounters", "vital_signs"], max_entries=2000
+    )
+    parts = partitioner.split(patient, author, custodian, data)
+    for part in parts:
+        print(part.start, part.end, part.entries)
+        write(part.document.to_xml_string())
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from ccdakit.builders.document import ClinicalDocument
+from ccdakit.builders.header.related_document import RelatedDocument
+from ccdakit.builders.plan import SectionPlan
+from ccdakit.core.cache import HeaderCache
+from ccdakit.core.canonical import new_id, now
+from ccdakit.protocols.author import AuthorProtocol, OrganizationProtocol
+from ccdakit.protocols.patient import PatientProtocol
+
+
+# Protocol attributes tried, in order, for the date of a windowed entry
+DATE_ATTRIBUTES = (
+    "effective_time",
+    "date",
+    "administration_date",
+    "administration_time",
+    "start_date",
+    "onset_date",
+    "observation_date",
+    "diagnosis_date",
+    "planned_date",
+    "start_time",
+    "date_supplied",
+)
+
+
+def item_date(item: Any) -> Any:
+    """
+    Get the date of a section entry from its protocol attributes.
+
+    Args:
+        item: Entry data (result organizer, encounter, vital signs organizer, ...)
+
+    Returns:
+        Value of the first DATE_ATTRIBUTES attribute that is set, or None
+    """
+    for name in DATE_ATTRIBUTES:
+        value = getattr(item, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+@dataclass
+class DocumentPart:
+    """One document of a split record."""
+
+    document: ClinicalDocument
+    # First and last day with windowed entries (None if the part has none dated)
+    start: Optional[date]
+    end: Optional[date]
+    # Entries in the part, including those of the repeated sections
+    entries: int
+
+
+@dataclass
+class _Group:
+    """Windowed entries of one calendar day (or every undated entry)."""
+
+    day: Optional[date]
+    # Section name -> (position in the section's data, entry)
+    items: Dict[str, List[Tuple[int, Any]]] = field(default_factory=dict)
+    entries: int = 0
+    size: int = 0
+
+
+class DocumentPartitioner:
+    """
+    Split a record into documents of bounded size by date window.
+
+    Entries of the windowed sections are grouped by calendar day, and
+    consecutive days are packed into a part until the next day would exceed a
+    limit. A single day over the limits becomes a part of its own. Undated
+    entries go to the last part.
+
+    max_entries counts top-level items (a result organizer is one entry).
+    max_bytes applies to the compact serialization (etree.tostring); sizes are
+    estimated by building each day's entries once, so it costs about one extra
+    build of the windowed sections.
+    """
+
+    def __init__(
+        self,
+        plan: SectionPlan,
+        windowed: Sequence[str],
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        date_of: Callable[[Any], Any] = item_date,
+    ) -> None:
+        """
+        Initialize DocumentPartitioner.
+
+        Args:
+            plan: Document type and sections of the parts
+            windowed: Names of the plan sections to split by date
+            max_entries: Maximum entries per part
+            max_bytes: Maximum serialized size of a part, in bytes
+            date_of: Function returning an entry's date or datetime (None if
+                undated)
+
+        Raises:
+            ValueError: If no limit is given or a windowed section is not in
+                the plan
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("Set max_entries, max_bytes or both")
+        unknown = [key for key in windowed if key not in plan.keys]
+        if unknown:
+            raise ValueError(f"Sections not in plan: {', '.join(unknown)}")
+        self.plan = plan
+        self.windowed = tuple(windowed)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.date_of = date_of
+
+    def split(
+        self,
+        patient: PatientProtocol,
+        author: AuthorProtocol,
+        custodian: OrganizationProtocol,
+        data: Mapping[str, Any],
+        document_id: Optional[str] = None,
+        effective_time: Optional[datetime] = None,
+        **options: Any,
+    ) -> List[DocumentPart]:
+        """
+        Split one patient's data into linked documents.
+
+        Args:
+            patient: Patient data satisfying PatientProtocol
+            author: Author data satisfying AuthorProtocol
+            custodian: Custodian organization data satisfying OrganizationProtocol
+            data: Section data by section name (see SectionPlan.bind());
+                windowed sections take a list of entries
+            document_id: id of the first part; later parts get
+                "<document_id>-2", "-3", ... (UUIDs if not provided)
+            effective_time: Creation time of every part (current time if
+                not provided)
+            **options: Other per-document arguments passed to every part
+
+        Returns:
+            Parts in chronological order
+
+        Raises:
+            ValueError: If the repeated sections alone exceed a limit, or a
+                windowed section's data is not a list
+        """
+        shared = {key: value for key, value in data.items() if key not in self.windowed}
+        shared_entries = sum(_count(value) for value in shared.values())
+        windowed = [key for key in self.windowed if key in data]
+        parent_id = document_id or new_id()
+        options["effective_time"] = effective_time or now()
+        if "header_cache" not in options and "header_cache" not in self.plan.document_options:
+            options["header_cache"] = HeaderCache()
+
+        def make_document(window_data, part_id, related_documents):
+            return self.plan.document(
+                patient,
+                author,
+                custodian,
+                {**shared, **window_data},
+                fresh=True,
+                document_id=part_id,
+                related_documents=related_documents,
+                **options,
+            )
+
+        entry_budget = None
+        if self.max_entries is not None:
+            entry_budget = self.max_entries - shared_entries
+            if entry_budget < 1:
+                raise ValueError(
+                    f"Sections outside the date windows hold {shared_entries} entries "
+                    f"(max_entries={self.max_entries})"
+                )
+
+        groups = self._groups(data, windowed)
+        byte_budget = None
+        if self.max_bytes is not None:
+            empty = make_document({key: [] for key in windowed}, parent_id, None)
+            byte_budget = self.max_bytes - len(etree.tostring(empty.to_element()))
+            if byte_budget < 1:
+                raise ValueError(
+                    f"Header and sections outside the date windows exceed "
+                    f"max_bytes={self.max_bytes}"
+                )
+            self._measure(groups)
+
+        parts = []
+        for index, window in enumerate(_pack(groups, entry_budget, byte_budget)):
+            window_data = {}
+            for key in windowed:
+                items = sorted(item for group in window for item in group.items.get(key, ()))
+                window_data[key] = [entry for _, entry in items]
+            if index == 0:
+                part_id, related_documents = parent_id, None
+            else:
+                part_id = f"{document_id}-{index + 1}" if document_id else new_id()
+                related_documents = [RelatedDocument(parent_id, version=self.plan.version)]
+            days = [group.day for group in window if group.day is not None]
+            parts.append(
+                DocumentPart(
+                    document=make_document(window_data, part_id, related_documents),
+                    start=min(days) if days else None,
+                    end=max(days) if days else None,
+                    entries=shared_entries + sum(group.entries for group in window),
+                )
+            )
+        return parts
+
+    def _groups(self, data: Mapping[str, Any], windowed: List[str]) -> List[_Group]:
+        """Group windowed entries by day, oldest first and undated last."""
+        groups: Dict[Optional[date], _Group] = {}
+        for key in windowed:
+            entries = data[key]
+            if not isinstance(entries, (list, tuple)):
+                raise ValueError(f"Windowed section {key!r} needs a list of entries")
+            for position, entry in enumerate(entries):
+                day = _day(self.date_of(entry))
+                group = groups.get(day)
+                if group is None:
+                    group = groups[day] = _Group(day)
+                group.items.setdefault(key, []).append((position, entry))
+                group.entries += 1
+        undated = groups.pop(None, None)
+        ordered = [groups[day] for day in sorted(groups)]
+        if undated is not None:
+            ordered.append(undated)
+        return ordered
+
+    def _measure(self, groups: List[_Group]) -> None:
+        """Estimate the serialized size each group adds to a document."""
+        overheads: Dict[str, int] = {}
+        for group in groups:
+            for key, items in group.items.items():
+                if key not in overheads:
+                    overheads[key] = self._overhead(groups, key)
+                size = _section_size(self.plan, key, [entry for _, entry in items])
+                group.size += max(size - overheads[key], 0)
+
+    def _overhead(self, groups: List[_Group], key: str) -> int:
+        """
+        Size of a section's parts that do not grow with its entries.
+
+        Measured as the empty section plus what building two entries
+        separately costs over building them together (table header and the
+        like), so that per-day sizes add up to a whole window's size.
+        """
+        empty = _section_size(self.plan, key, [])
+        sample = [entry for group in groups for _, entry in group.items.get(key, ())][:2]
+        if len(sample) < 2:
+            return empty
+        apart = sum(_section_size(self.plan, key, [entry]) for entry in sample)
+        together = _section_size(self.plan, key, sample)
+        return empty + max(apart - together - empty, 0)
+
+
+def _section_size(plan: SectionPlan, key: str, entries: List[Any]) -> int:
+    """Serialized size of a plan section built over entries."""
+    (section,) = plan.bind({key: entries}, fresh=True)
+    return len(etree.tostring(section.to_element()))
+
+
+def _pack(
+    groups: List[_Group], entry_budget: Optional[int], byte_budget: Optional[int]
+) -> List[List[_Group]]:
+    """Pack consecutive groups into windows under the budgets."""
+    windows: List[List[_Group]] = []
+    current: List[_Group] = []
+    entries = size = 0
+    for group in groups:
+        over = (entry_budget is not None and entries + group.entries > entry_budget) or (
+            byte_budget is not None and size + group.size > byte_budget
+        )
+        if current and over:
+            windows.append(current)
+            current, entries, size = [], 0, 0
+        current.append(group)
+        entries += group.entries
+        size += group.size
+    windows.append(current)
+    return windows
+
+
+def _day(value: Any) -> Optional[date]:
+    """Calendar day of a date or datetime (None for anything else)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def _count(value: Any) -> int:
+    """Entries in a section's data."""
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_count(item) for item in value.values())
+    return 1
@@ -0,0 +1,241 @@
+"""Section builders compiled once per document type and rebound per patient.
+
+Generating one document per patient otherwise constructs a fresh builder for
+every section of every document. A SectionPlan holds one configured builder
+per section, checks up front that the document type and every section support
+the plan's C-CDA version (compiling their templateId tables), and for each
+patient only rebinds the sections' input data.
+
+Example:
+    plan = SectionPlan(
+        ContinuityOfCareDocument,
+        {
+            "problems": ProblemsSection(problems=[]),
+            "medications": MedicationsSection(medications=[]),
+            "results": ResultsSection(result_organizers=[], title="Labs"),
+        },
+        header_cache=HeaderCache(),
+    )
+    for record in records:
+        doc = plan.document(
+            record.patient,
+            author,
+            custodian,
+            {"problems": record.problems, "medications": record.medications},
+        )
+        write(doc.to_xml_string())
+"""
+
+import copy
+import inspect
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Tuple, Type
+
+from ccdakit.builders.document import ClinicalDocument
+from ccdakit.core.base import CDAElement, CDAVersion
+from ccdakit.core.templates import template_registry
+from ccdakit.protocols.author import AuthorProtocol, OrganizationProtocol
+from ccdakit.protocols.patient import PatientProtocol
+
+
+class SectionPlan:
+    """
+    Reusable section builders for one document type.
+
+    The plan keeps a single builder per section and rebinds it for each
+    document, so a document returned by document() (or sections returned by
+    bind()) must be built before the plan is applied to the next patient,
+    unless fresh=True is passed.
+    Building with consume() releases the plan's builders; use to_element() or
+    to_xml_string() instead.
+    """
+
+    def __init__(
+        self,
+        document_class: Type[ClinicalDocument],
+        sections: Mapping[str, CDAElement],
+        **document_options: Any,
+    ) -> None:
+        """
+        Compile a plan.
+
+        Args:
+            document_class: ClinicalDocument or a document type such as
+                ContinuityOfCareDocument or DischargeSummary
+            sections: Section builders in document order, keyed by the name
+                their data is passed under; each builder's options (title,
+                profile, ...) are kept for every document
+            **document_options: Arguments passed to every document, e.g.
+                version, title, header_cache or section_cache
+
+        Raises:
+            ValueError: If a section's version differs from the document's,
+                or a builder does not support that version
+            TypeError: If a section's first argument is not one of its inputs
+        """
+        self.document_class = document_class
+        self.document_options = document_options
+        self.version = document_options.get("version", CDAVersion.R2_1)
+        self._sections: Dict[str, CDAElement] = dict(sections)
+        self._inputs = {key: _primary_input(type(s)) for key, s in self._sections.items()}
+        self._defaults: Dict[str, Dict[str, Any]] = {}
+        self._required: Dict[str, List[str]] = {}
+
+        _check_version(document_class, self.version)
+        for key, section in self._sections.items():
+            if section.version != self.version:
+                raise ValueError(
+                    f"Section {key!r} is C-CDA {section.version.value}, "
+                    f"plan is {self.version.value}"
+                )
+            _check_version(type(section), self.version)
+            name = self._inputs[key]
+            section.bind(**{name: getattr(section, name, None)})
+            self._defaults[key], self._required[key] = _input_defaults(section)
+
+    @property
+    def keys(self) -> List[str]:
+        """Section names, in document order."""
+        return list(self._sections)
+
+    def bind(self, data: Mapping[str, Any], fresh: bool = False) -> List[CDAElement]:
+        """
+        Rebind the plan's sections to one patient's data.
+
+        Args:
+            data: Section data by section name. A value is the section's
+                primary input (e.g. the list of problems); a dict binds
+                several inputs by name (e.g. {"planned_procedures": [...],
+                "instructions": [...]}). Inputs a value does not name are
+                reset, data inputs to their constructor default and options
+                such as title to the plan's setting, so nothing carries over
+                from the previous patient. Sections without an entry are left
+                out of the result.
+            fresh: Bind copies of the plan's builders, so the result stays
+                valid when the plan is applied again (e.g. to build several
+                documents in parallel)
+
+        Returns:
+            The bound section builders, in document order
+
+        Raises:
+            ValueError: If data names a section that is not in the plan
+            TypeError: If a dict leaves out an input that has no default
+        """
+        unknown = [key for key in data if key not in self._sections]
+        if unknown:
+            raise ValueError(f"Sections not in plan: {', '.join(unknown)}")
+        bound = []
+        for key, section in self._sections.items():
+            if key not in data:
+                continue
+            value = data[key]
+            if not isinstance(value, dict):
+                value = {self._inputs[key]: value}
+            missing = [name for name in self._required[key] if name not in value]
+            if missing:
+                raise TypeError(f"Section {key!r} data is missing {', '.join(missing)}")
+            if fresh:
+                section = copy.copy(section)
+            defaults = self._defaults[key]
+            section.bind(
+                **{
+                    name: copy.copy(default)
+                    for name, default in defaults.items()
+                    if name not in value
+                },
+                **value,
+            )
+            bound.append(section)
+        return bound
+
+    def document(
+        self,
+        patient: PatientProtocol,
+        author: AuthorProtocol,
+        custodian: OrganizationProtocol,
+        data: Mapping[str, Any],
+        fresh: bool = False,
+        **options: Any,
+    ) -> ClinicalDocument:
+        """
+        Create a document for one patient from the plan.
+
+        Args:
+            patient: Patient data satisfying PatientProtocol
+            author: Author data satisfying AuthorProtocol
+            custodian: Custodian organization data satisfying OrganizationProtocol
+            data: Section data by section name (see bind())
+            fresh: Use copies of the plan's builders (see bind())
+            **options: Per-document arguments such as document_id or
+                effective_time; they override the plan's document options
+
+        Returns:
+            Document builder of the plan's document type
+        """
+        return self.document_class(
+            patient=patient,
+            author=author,
+            custodian=custodian,
+            sections=self.bind(data, fresh),
+            **{**self.document_options, **options},
+        )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<SectionPlan: {self.document_class.__name__}, {len(self._sections)} sections>"
+
+
+@lru_cache(maxsize=None)
+def _primary_input(cls: Type[CDAElement]) -> str:
+    """Name of the first argument of a builder class's __init__."""
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    if not parameters or parameters[0].kind not in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        raise ValueError(f"{cls.__name__} has no primary input to bind")
+    return parameters[0].name
+
+
+def _input_defaults(section: CDAElement) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Values a section's constructor inputs are reset to on every bind.
+
+    Data inputs (parameters without a default or defaulting to None) get the
+    value the constructor stores for their default (e.g. [] for None); other
+    parameters are options and keep the plan builder's value.
+
+    Returns:
+        Reset values by input name, and the data inputs without a default
+    """
+    cls = type(section)
+    parameters = [
+        parameter
+        for parameter in list(inspect.signature(cls.__init__).parameters.values())[1:]
+        if parameter.kind
+        in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        and parameter.name != "version"
+    ]
+    required = [p.name for p in parameters if p.default is inspect.Parameter.empty]
+    try:
+        pristine = cls(
+            **{name: getattr(section, name) for name in required}, version=section.version
+        )
+    except (TypeError, ValueError):
+        pristine = None
+    defaults = {}
+    for parameter in parameters:
+        if not hasattr(section, parameter.name):
+            continue  # not stored under its own name, so not bindable
+        if parameter.default is None:
+            defaults[parameter.name] = getattr(pristine, parameter.name, None)
+        elif parameter.default is not inspect.Parameter.empty:
+            defaults[parameter.name] = getattr(section, parameter.name, parameter.default)
+    return defaults, required
+
+
+def _check_version(cls: Type[CDAElement], version: CDAVersion) -> None:
+    """Compile a builder class's templates and check it supports version."""
+    if cls.TEMPLATES and template_registry.compiled(cls).prototypes(version) is None:
+        raise ValueError(f"Version {version.value} not supported for {cls.__name__}")
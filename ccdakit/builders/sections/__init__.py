@@ -1,58 +1,102 @@
 """Section-level builders for C-CDA documents."""
 
-from ccdakit.builders.sections.admission_diagnosis import AdmissionDiagnosisSection
-from ccdakit.builders.sections.admission_medications import AdmissionMedicationsSection
-from ccdakit.builders.sections.advance_directives import AdvanceDirectivesSection
-from ccdakit.builders.sections.allergies import AllergiesSection
-from ccdakit.builders.sections.anesthesia import AnesthesiaSection
-from ccdakit.builders.sections.assessment_and_plan import AssessmentAndPlanSection
-from ccdakit.builders.sections.chief_complaint_reason_for_visit import (
-    ChiefComplaintAndReasonForVisitSection,
-)
-from ccdakit.builders.sections.complications import ComplicationsSection
-from ccdakit.builders.sections.discharge_diagnosis import DischargeDiagnosisSection
-from ccdakit.builders.sections.discharge_medications import DischargeMedicationsSection
-from ccdakit.builders.sections.discharge_studies import (
-    HospitalDischargeStudiesSummarySection,
-)
-from ccdakit.builders.sections.encounters import EncountersSection
-from ccdakit.builders.sections.family_history import FamilyHistorySection
-from ccdakit.builders.sections.functional_status import FunctionalStatusSection
-from ccdakit.builders.sections.goals import GoalsSection
-from ccdakit.builders.sections.health_concerns import HealthConcernsSection
-from ccdakit.builders.sections.health_status_evaluations import (
-    HealthStatusEvaluationsAndOutcomesSection,
-)
-from ccdakit.builders.sections.hospital_course import HospitalCourseSection
-from ccdakit.builders.sections.hospital_discharge_instructions import (
-    HospitalDischargeInstructionsSection,
-)
-from ccdakit.builders.sections.immunizations import ImmunizationsSection
-from ccdakit.builders.sections.instructions import InstructionsSection
-from ccdakit.builders.sections.interventions import InterventionsSection
-from ccdakit.builders.sections.medical_equipment import MedicalEquipmentSection
-from ccdakit.builders.sections.medications import MedicationsSection
-from ccdakit.builders.sections.medications_administered import (
-    MedicationsAdministeredSection,
-)
-from ccdakit.builders.sections.mental_status import MentalStatusSection
-from ccdakit.builders.sections.nutrition import NutritionSection
-from ccdakit.builders.sections.past_medical_history import PastMedicalHistorySection
-from ccdakit.builders.sections.payers import PayersSection
-from ccdakit.builders.sections.physical_exam import PhysicalExamSection
-from ccdakit.builders.sections.plan_of_treatment import PlanOfTreatmentSection
-from ccdakit.builders.sections.postoperative_diagnosis import (
-    PostoperativeDiagnosisSection,
-)
-from ccdakit.builders.sections.preoperative_diagnosis import (
-    PreoperativeDiagnosisSection,
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.builders.sections.admission_diagnosis import AdmissionDiagnosisSection
+    from ccdakit.builders.sections.admission_medications import AdmissionMedicationsSection
+    from ccdakit.builders.sections.advance_directives import AdvanceDirectivesSection
+    from ccdakit.builders.sections.allergies import AllergiesSection
+    from ccdakit.builders.sections.anesthesia import AnesthesiaSection
+    from ccdakit.builders.sections.assessment_and_plan import AssessmentAndPlanSection
+    from ccdakit.builders.sections.chief_complaint_reason_for_visit import (
+        ChiefComplaintAndReasonForVisitSection,
+    )
+    from ccdakit.builders.sections.complications import ComplicationsSection
+    from ccdakit.builders.sections.discharge_diagnosis import DischargeDiagnosisSection
+    from ccdakit.builders.sections.discharge_medications import DischargeMedicationsSection
+    from ccdakit.builders.sections.discharge_studies import HospitalDischargeStudiesSummarySection
+    from ccdakit.builders.sections.encounters import EncountersSection
+    from ccdakit.builders.sections.family_history import FamilyHistorySection
+    from ccdakit.builders.sections.functional_status import FunctionalStatusSection
+    from ccdakit.builders.sections.goals import GoalsSection
+    from ccdakit.builders.sections.health_concerns import HealthConcernsSection
+    from ccdakit.builders.sections.health_status_evaluations import (
+        HealthStatusEvaluationsAndOutcomesSection,
+    )
+    from ccdakit.builders.sections.hospital_course import HospitalCourseSection
+    from ccdakit.builders.sections.hospital_discharge_instructions import (
+        HospitalDischargeInstructionsSection,
+    )
+    from ccdakit.builders.sections.immunizations import ImmunizationsSection
+    from ccdakit.builders.sections.instructions import InstructionsSection
+    from ccdakit.builders.sections.interventions import InterventionsSection
+    from ccdakit.builders.sections.medical_equipment import MedicalEquipmentSection
+    from ccdakit.builders.sections.medications import MedicationsSection
+    from ccdakit.builders.sections.medications_administered import MedicationsAdministeredSection
+    from ccdakit.builders.sections.mental_status import MentalStatusSection
+    from ccdakit.builders.sections.nutrition import NutritionSection
+    from ccdakit.builders.sections.past_medical_history import PastMedicalHistorySection
+    from ccdakit.builders.sections.payers import PayersSection
+    from ccdakit.builders.sections.physical_exam import PhysicalExamSection
+    from ccdakit.builders.sections.plan_of_treatment import PlanOfTreatmentSection
+    from ccdakit.builders.sections.postoperative_diagnosis import PostoperativeDiagnosisSection
+    from ccdakit.builders.sections.preoperative_diagnosis import PreoperativeDiagnosisSection
+    from ccdakit.builders.sections.problems import ProblemsSection
+    from ccdakit.builders.sections.procedures import ProceduresSection
+    from ccdakit.builders.sections.reason_for_visit import ReasonForVisitSection
+    from ccdakit.builders.sections.results import ResultsSection
+    from ccdakit.builders.sections.social_history import SocialHistorySection
+    from ccdakit.builders.sections.vital_signs import VitalSignsSection
+
+
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        "AdmissionDiagnosisSection": "ccdakit.builders.sections.admission_diagnosis",
+        "AdmissionMedicationsSection": "ccdakit.builders.sections.admission_medications",
+        "AdvanceDirectivesSection": "ccdakit.builders.sections.advance_directives",
+        "AllergiesSection": "ccdakit.builders.sections.allergies",
+        "AnesthesiaSection": "ccdakit.builders.sections.anesthesia",
+        "AssessmentAndPlanSection": "ccdakit.builders.sections.assessment_and_plan",
+        "ChiefComplaintAndReasonForVisitSection": "ccdakit.builders.sections.chief_complaint_reason_for_visit",
+        "ComplicationsSection": "ccdakit.builders.sections.complications",
+        "DischargeDiagnosisSection": "ccdakit.builders.sections.discharge_diagnosis",
+        "DischargeMedicationsSection": "ccdakit.builders.sections.discharge_medications",
+        "HospitalDischargeStudiesSummarySection": "ccdakit.builders.sections.discharge_studies",
+        "EncountersSection": "ccdakit.builders.sections.encounters",
+        "FamilyHistorySection": "ccdakit.builders.sections.family_history",
+        "FunctionalStatusSection": "ccdakit.builders.sections.functional_status",
+        "GoalsSection": "ccdakit.builders.sections.goals",
+        "HealthConcernsSection": "ccdakit.builders.sections.health_concerns",
+        "HealthStatusEvaluationsAndOutcomesSection": "ccdakit.builders.sections.health_status_evaluations",
+        "HospitalCourseSection": "ccdakit.builders.sections.hospital_course",
+        "HospitalDischargeInstructionsSection": "ccdakit.builders.sections.hospital_discharge_instructions",
+        "ImmunizationsSection": "ccdakit.builders.sections.immunizations",
+        "InstructionsSection": "ccdakit.builders.sections.instructions",
+        "InterventionsSection": "ccdakit.builders.sections.interventions",
+        "MedicalEquipmentSection": "ccdakit.builders.sections.medical_equipment",
+        "MedicationsSection": "ccdakit.builders.sections.medications",
+        "MedicationsAdministeredSection": "ccdakit.builders.sections.medications_administered",
+        "MentalStatusSection": "ccdakit.builders.sections.mental_status",
+        "NutritionSection": "ccdakit.builders.sections.nutrition",
+        "PastMedicalHistorySection": "ccdakit.builders.sections.past_medical_history",
+        "PayersSection": "ccdakit.builders.sections.payers",
+        "PhysicalExamSection": "ccdakit.builders.sections.physical_exam",
+        "PlanOfTreatmentSection": "ccdakit.builders.sections.plan_of_treatment",
+        "PostoperativeDiagnosisSection": "ccdakit.builders.sections.postoperative_diagnosis",
+        "PreoperativeDiagnosisSection": "ccdakit.builders.sections.preoperative_diagnosis",
+        "ProblemsSection": "ccdakit.builders.sections.problems",
+        "ProceduresSection": "ccdakit.builders.sections.procedures",
+        "ReasonForVisitSection": "ccdakit.builders.sections.reason_for_visit",
+        "ResultsSection": "ccdakit.builders.sections.results",
+        "SocialHistorySection": "ccdakit.builders.sections.social_history",
+        "VitalSignsSection": "ccdakit.builders.sections.vital_signs",
+    },
 )
-from ccdakit.builders.sections.problems import ProblemsSection
-from ccdakit.builders.sections.procedures import ProceduresSection
-from ccdakit.builders.sections.reason_for_visit import ReasonForVisitSection
-from ccdakit.builders.sections.results import ResultsSection
-from ccdakit.builders.sections.social_history import SocialHistorySection
-from ccdakit.builders.sections.vital_signs import VitalSignsSection
 
 
 __all__ = [
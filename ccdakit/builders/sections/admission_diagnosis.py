@@ -8,6 +8,12 @@ from ccdakit.builders.common import Code
 from ccdakit.builders.entries.admission_diagnosis_entry import (
     HospitalAdmissionDiagnosis,
 )
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.admission_diagnosis import AdmissionDiagnosisProtocol
 
@@ -39,6 +45,8 @@ class AdmissionDiagnosisSection(CDAElement):
     - SHOULD contain entry with Hospital Admission Diagnosis (CONF:1198-9934, 1198-15481)
     """
 
+    __slots__ = ("diagnoses", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -50,6 +58,25 @@ class AdmissionDiagnosisSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, diagnosis) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Diagnosis",
+                lambda row: row[1].name,
+                content_id=lambda row: f"admission-diagnosis-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn(
+                "Admission Date", lambda row: format_date(row[1].admission_date, "Unknown")
+            ),
+            NarrativeColumn(
+                "Diagnosis Date", lambda row: format_date(row[1].diagnosis_date, "Unknown")
+            ),
+        ],
+        empty_text="No admission diagnosis documented",
+    )
+
     def __init__(
         self,
         diagnoses: Optional[Sequence[AdmissionDiagnosisProtocol]] = None,
@@ -91,11 +118,15 @@ class AdmissionDiagnosisSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1198-9933)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries (CONF:1198-9934, 1198-15481)
-        for diagnosis in self.diagnoses:
-            self._add_entry(section, diagnosis)
+        if self.include_entries:
+            # Add entries (CONF:1198-9934, 1198-15481)
+            for diagnosis in self.diagnoses:
+                self._add_entry(section, diagnosis)
 
         return section
 
@@ -132,64 +163,12 @@ class AdmissionDiagnosisSection(CDAElement):
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.diagnoses:
-            # No diagnoses - add "No admission diagnosis documented" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No admission diagnosis documented"
-            return
-
-        # Create table for diagnoses
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Diagnosis", "Code", "Admission Date", "Diagnosis Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, diagnosis in enumerate(self.diagnoses, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Diagnosis name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"admission-diagnosis-{idx}",
-            )
-            content.text = diagnosis.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{diagnosis.code} ({diagnosis.code_system})"
-
-            # Admission date
-            td_admission = etree.SubElement(tr, f"{{{NS}}}td")
-            if diagnosis.admission_date:
-                td_admission.text = diagnosis.admission_date.strftime("%Y-%m-%d")
-            else:
-                td_admission.text = "Unknown"
-
-            # Diagnosis date
-            td_diagnosis = etree.SubElement(tr, f"{{{NS}}}td")
-            if diagnosis.diagnosis_date:
-                td_diagnosis.text = diagnosis.diagnosis_date.strftime("%Y-%m-%d")
-            else:
-                td_diagnosis.text = "Unknown"
+        self.NARRATIVE.render(section, enumerate(self.diagnoses, start=1))
 
     def _add_entry(self, section: etree._Element, diagnosis: AdmissionDiagnosisProtocol) -> None:
         """
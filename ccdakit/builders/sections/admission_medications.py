@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.admission_medication import AdmissionMedication
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.medication import MedicationProtocol
 
@@ -14,6 +20,19 @@ from ccdakit.protocols.medication import MedicationProtocol
 NS = "urn:hl7-org:v3"
 
 
+# Narrative text of a section with a nullFlavor, by nullFlavor code
+_NULL_FLAVOR_TEXT = {
+    "NI": "No information about admission medications",
+    "NA": "Not applicable",
+    "UNK": "Unknown",
+    "ASKU": "Asked but unknown",
+    "NAV": "Temporarily unavailable",
+    "NASK": "Not asked",
+    "MSK": "Masked",
+    "OTH": "Other",
+}
+
+
 class AdmissionMedicationsSection(CDAElement):
     """
     Builder for C-CDA Admission Medications Section (entries optional).
@@ -25,6 +44,8 @@ class AdmissionMedicationsSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 versions.
     """
 
+    __slots__ = ("medications", "title", "null_flavor")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -47,6 +68,36 @@ class AdmissionMedicationsSection(CDAElement):
     LOINC_CODE = "42346-7"
     LOINC_OID = "2.16.840.1.113883.6.1"
 
+    # Narrative layout; rows are (index, medication) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Medication",
+                lambda row: row[1].name,
+                content_id=lambda row: f"admission-medication-{row[0]}",
+            ),
+            NarrativeColumn("Dosage", lambda row: str(row[1].dosage) if row[1].dosage else "N/A"),
+            NarrativeColumn(
+                "Route", lambda row: row[1].route.capitalize() if row[1].route else "N/A"
+            ),
+            NarrativeColumn(
+                "Frequency", lambda row: str(row[1].frequency) if row[1].frequency else "N/A"
+            ),
+            NarrativeColumn("Start Date", lambda row: format_date(row[1].start_date, "Unknown")),
+            NarrativeColumn(
+                "End Date",
+                lambda row: format_date(
+                    row[1].end_date,
+                    "Ongoing" if row[1].status == "active" else "Unknown",
+                ),
+            ),
+            NarrativeColumn(
+                "Status", lambda row: row[1].status.capitalize() if row[1].status else "Unknown"
+            ),
+        ],
+        empty_text="No medications on admission",
+    )
+
     def __init__(
         self,
         medications: Sequence[MedicationProtocol],
@@ -101,121 +152,35 @@ class AdmissionMedicationsSection(CDAElement):
 
         # Add narrative text (HTML table)
         # CONF:1198-10101
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Admission Medication acts
-        # CONF:1198-10102 (SHOULD), CONF:1198-15484
-        for medication in self.medications:
-            self._add_entry(section, medication)
+        if self.include_entries:
+            # Add entries with Admission Medication acts
+            # CONF:1198-10102 (SHOULD), CONF:1198-15484
+            for medication in self.medications:
+                self._add_entry(section, medication)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
         if self.null_flavor:
-            # Handle null flavor case
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            null_flavor_text = {
-                "NI": "No information about admission medications",
-                "NA": "Not applicable",
-                "UNK": "Unknown",
-                "ASKU": "Asked but unknown",
-                "NAV": "Temporarily unavailable",
-                "NASK": "Not asked",
-                "MSK": "Masked",
-                "OTH": "Other",
-            }
-            paragraph.text = null_flavor_text.get(
+            rows = ()
+            empty_text = _NULL_FLAVOR_TEXT.get(
                 self.null_flavor, "No admission medications recorded"
             )
-            return
-
-        if not self.medications:
-            # No medications - add "No medications on admission" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No medications on admission"
-            return
-
-        # Create table for medications
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Medication",
-            "Dosage",
-            "Route",
-            "Frequency",
-            "Start Date",
-            "End Date",
-            "Status",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, medication in enumerate(self.medications, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Medication name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"admission-medication-{idx}",
-            )
-            content.text = medication.name
-
-            # Dosage
-            td_dosage = etree.SubElement(tr, f"{{{NS}}}td")
-            td_dosage.text = str(medication.dosage) if medication.dosage else "N/A"
-
-            # Route
-            td_route = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.route:
-                td_route.text = medication.route.capitalize()
-            else:
-                td_route.text = "N/A"
-
-            # Frequency
-            td_frequency = etree.SubElement(tr, f"{{{NS}}}td")
-            td_frequency.text = str(medication.frequency) if medication.frequency else "N/A"
-
-            # Start date
-            td_start = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.start_date:
-                td_start.text = medication.start_date.strftime("%Y-%m-%d")
-            else:
-                td_start.text = "Unknown"
-
-            # End date
-            td_end = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.end_date:
-                td_end.text = medication.end_date.strftime("%Y-%m-%d")
-            elif medication.status == "active":
-                td_end.text = "Ongoing"
-            else:
-                td_end.text = "Unknown"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.status:
-                td_status.text = medication.status.capitalize()
-            else:
-                td_status.text = "Unknown"
+        else:
+            rows = enumerate(self.medications, start=1)
+            empty_text = None
+        self.NARRATIVE.render(section, rows, empty_text=empty_text)
 
     def _add_entry(self, section: etree._Element, medication: MedicationProtocol) -> None:
         """
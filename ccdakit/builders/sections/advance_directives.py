@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.advance_directive import AdvanceDirectiveObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.advance_directive import AdvanceDirectiveProtocol
 
@@ -14,6 +20,26 @@ from ccdakit.protocols.advance_directive import AdvanceDirectiveProtocol
 NS = "urn:hl7-org:v3"
 
 
+def _custodian(directive: AdvanceDirectiveProtocol) -> str:
+    """Format a directive's custodian, with their relationship, for the narrative."""
+    if not directive.custodian_name:
+        return "Not specified"
+    if directive.custodian_relationship:
+        return f"{directive.custodian_name} ({directive.custodian_relationship})"
+    return directive.custodian_name
+
+
+def _verification(directive: AdvanceDirectiveProtocol) -> str:
+    """Format who verified a directive, and when, for the narrative."""
+    if not (directive.verifier_name or directive.verification_date):
+        return "Not verified"
+    verification_text = directive.verifier_name or ""
+    if directive.verification_date:
+        date_str = format_date(directive.verification_date)
+        verification_text += f" on {date_str}" if verification_text else date_str
+    return verification_text
+
+
 class AdvanceDirectivesSection(CDAElement):
     """
     Builder for C-CDA Advance Directives Section (entries required).
@@ -25,6 +51,11 @@ class AdvanceDirectivesSection(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.2.21.1
     """
 
+    __slots__ = ("directives", "title", "null_flavor")
+
+    # Entries are mandatory, so they are kept in narrative-only builds
+    ENTRIES_REQUIRED = True
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -32,6 +63,7 @@ class AdvanceDirectivesSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.21.1",
                 extension="2015-08-01",
                 description="Advance Directives Section (entries required) R2.1",
+                entries_required=True,
             ),
         ],
         CDAVersion.R2_0: [
@@ -39,10 +71,33 @@ class AdvanceDirectivesSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.21.1",
                 extension="2015-08-01",
                 description="Advance Directives Section (entries required) R2.0",
+                entries_required=True,
             ),
         ],
     }
 
+    # Narrative layout; rows are (index, directive) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Type",
+                lambda row: row[1].directive_type,
+                content_id=lambda row: f"directive-{row[0]}",
+            ),
+            # Linked to the directive document when available
+            NarrativeColumn(
+                "Directive",
+                lambda row: row[1].directive_value,
+                href=lambda row: row[1].document_url or None,
+            ),
+            NarrativeColumn("Start Date", lambda row: format_date(row[1].start_date, "Unknown")),
+            NarrativeColumn("End Date", lambda row: format_date(row[1].end_date, "N/A")),
+            NarrativeColumn("Custodian", lambda row: _custodian(row[1])),
+            NarrativeColumn("Verification", lambda row: _verification(row[1])),
+        ],
+        empty_text="No advance directives on file",
+    )
+
     def __init__(
         self,
         directives: Optional[Sequence[AdvanceDirectiveProtocol]] = None,
@@ -111,117 +166,35 @@ class AdvanceDirectivesSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1198-32933)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries if not nullFlavor (CONF:1198-30235, 30236, 32420, 32881)
-        if not self.null_flavor:
-            for directive in self.directives:
-                self._add_entry(section, directive)
+        if self.include_entries:
+            # Add entries if not nullFlavor (CONF:1198-30235, 30236, 32420, 32881)
+            if not self.null_flavor:
+                for directive in self.directives:
+                    self._add_entry(section, directive)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if self.null_flavor or not self.directives:
-            # No information or no directives
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            if self.null_flavor == "NI":
-                paragraph.text = "No information about advance directives"
-            else:
-                paragraph.text = "No advance directives on file"
-            return
-
-        # Create table for advance directives
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Type",
-            "Directive",
-            "Start Date",
-            "End Date",
-            "Custodian",
-            "Verification",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, directive in enumerate(self.directives, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Directive type (with ID reference)
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_type,
-                f"{{{NS}}}content",
-                ID=f"directive-{idx}",
+        if self.null_flavor:
+            rows = ()
+            empty_text = (
+                "No information about advance directives" if self.null_flavor == "NI" else None
             )
-            content.text = directive.directive_type
-
-            # Directive value/details
-            td_value = etree.SubElement(tr, f"{{{NS}}}td")
-            if directive.document_url:
-                # Create link if URL available
-                link = etree.SubElement(
-                    td_value,
-                    f"{{{NS}}}linkHtml",
-                    href=directive.document_url,
-                )
-                link.text = directive.directive_value
-            else:
-                td_value.text = directive.directive_value
-
-            # Start date
-            td_start = etree.SubElement(tr, f"{{{NS}}}td")
-            if directive.start_date:
-                td_start.text = directive.start_date.strftime("%Y-%m-%d")
-            else:
-                td_start.text = "Unknown"
-
-            # End date
-            td_end = etree.SubElement(tr, f"{{{NS}}}td")
-            if directive.end_date:
-                td_end.text = directive.end_date.strftime("%Y-%m-%d")
-            else:
-                td_end.text = "N/A"
-
-            # Custodian
-            td_custodian = etree.SubElement(tr, f"{{{NS}}}td")
-            if directive.custodian_name:
-                custodian_text = directive.custodian_name
-                if directive.custodian_relationship:
-                    custodian_text += f" ({directive.custodian_relationship})"
-                td_custodian.text = custodian_text
-            else:
-                td_custodian.text = "Not specified"
-
-            # Verification
-            td_verification = etree.SubElement(tr, f"{{{NS}}}td")
-            if directive.verifier_name or directive.verification_date:
-                verification_text = ""
-                if directive.verifier_name:
-                    verification_text = directive.verifier_name
-                if directive.verification_date:
-                    date_str = directive.verification_date.strftime("%Y-%m-%d")
-                    verification_text += f" on {date_str}" if verification_text else date_str
-                td_verification.text = verification_text
-            else:
-                td_verification.text = "Not verified"
+        else:
+            rows = enumerate(self.directives, start=1)
+            empty_text = None
+        self.NARRATIVE.render(section, rows, empty_text=empty_text)
 
     def _add_entry(self, section: etree._Element, directive: AdvanceDirectiveProtocol) -> None:
         """
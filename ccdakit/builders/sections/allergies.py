@@ -6,7 +6,14 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, StatusCode, create_default_author_participation
 from ccdakit.builders.entries.allergy import AllergyObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.allergy import AllergyProtocol
 
 
@@ -22,6 +29,8 @@ class AllergiesSection(CDAElement):
     Supports both R2.1 (2014-06-09) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("allergies", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -36,6 +45,7 @@ class AllergiesSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.6.1",
                 extension="2015-08-01",
                 description="Allergies and Intolerances Section (entries required) R2.1",
+                entries_required=True,
             ),
         ],
         CDAVersion.R2_0: [
@@ -50,10 +60,51 @@ class AllergiesSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.6.1",
                 extension="2015-08-01",
                 description="Allergies and Intolerances Section (entries required) R2.0",
+                entries_required=True,
             ),
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "allergy_concern_act": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.30",
+                    extension="2015-08-01",
+                    description="Allergy Concern Act R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.30",
+                    extension="2014-06-09",
+                    description="Allergy Concern Act R2.0",
+                ),
+            ],
+        },
+    }
+
+    # Narrative layout; rows are (index, allergy) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Allergen",
+                lambda row: row[1].allergen,
+                content_id=lambda row: f"allergy-{row[0]}",
+            ),
+            NarrativeColumn("Type", lambda row: row[1].allergy_type.capitalize()),
+            NarrativeColumn("Reaction", lambda row: row[1].reaction or "Not specified"),
+            NarrativeColumn(
+                "Severity",
+                lambda row: row[1].severity.capitalize() if row[1].severity else "Not specified",
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Onset Date", lambda row: format_date(row[1].onset_date, "Unknown")),
+        ],
+        empty_text="No known allergies",
+    )
+
     def __init__(
         self,
         allergies: Sequence[AllergyProtocol],
@@ -101,88 +152,26 @@ class AllergiesSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Allergy Concern Acts
-        for allergy in self.allergies:
-            self._add_entry(section, allergy)
+        if self.include_entries:
+            # Add entries with Allergy Concern Acts
+            for allergy in self.allergies:
+                self._add_entry(section, allergy)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.allergies:
-            # No allergies - add "No known allergies" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No known allergies"
-            return
-
-        # Create table for allergies
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Allergen",
-            "Type",
-            "Reaction",
-            "Severity",
-            "Status",
-            "Onset Date",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, allergy in enumerate(self.allergies, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Allergen name (with ID reference)
-            td_allergen = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_allergen,
-                f"{{{NS}}}content",
-                ID=f"allergy-{idx}",
-            )
-            content.text = allergy.allergen
-
-            # Type
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            td_type.text = allergy.allergy_type.capitalize()
-
-            # Reaction
-            td_reaction = etree.SubElement(tr, f"{{{NS}}}td")
-            td_reaction.text = allergy.reaction if allergy.reaction else "Not specified"
-
-            # Severity
-            td_severity = etree.SubElement(tr, f"{{{NS}}}td")
-            td_severity.text = (
-                allergy.severity.capitalize() if allergy.severity else "Not specified"
-            )
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = allergy.status.capitalize()
-
-            # Onset date
-            td_onset = etree.SubElement(tr, f"{{{NS}}}td")
-            if allergy.onset_date:
-                td_onset.text = allergy.onset_date.strftime("%Y-%m-%d")
-            else:
-                td_onset.text = "Unknown"
+        self.NARRATIVE.render(section, enumerate(self.allergies, start=1))
 
     def _add_entry(self, section: etree._Element, allergy: AllergyProtocol) -> None:
         """
@@ -204,19 +193,12 @@ class AllergiesSection(CDAElement):
         )
 
         # Add template ID for Allergy Concern Act
-        template_id = etree.SubElement(act, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.30")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2015-08-01")
-        elif self.version == CDAVersion.R2_0:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(act, nested="allergy_concern_act")
 
         # Add ID
-        import uuid
-
         id_elem = etree.SubElement(act, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add code
         code_elem = etree.SubElement(act, f"{{{NS}}}code")
@@ -7,6 +7,12 @@ from lxml import etree
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.anesthesia_entry import AnesthesiaProcedure
 from ccdakit.builders.entries.medication import MedicationActivity
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date_or_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.anesthesia import AnesthesiaProtocol
 
@@ -34,6 +40,8 @@ class AnesthesiaSection(CDAElement):
     LOINC Code: 59774-0 (Anesthesia)
     """
 
+    __slots__ = ("anesthesia_records", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -52,6 +60,35 @@ class AnesthesiaSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, anesthesia record) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Anesthesia Type",
+                lambda row: row[1].anesthesia_type,
+                content_id=lambda row: f"anesthesia-{row[0]}",
+            ),
+            NarrativeColumn(
+                "Code",
+                lambda row: f"{row[1].anesthesia_code} ({row[1].anesthesia_code_system})",
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Start Time", lambda row: format_date_or_datetime(row[1].start_time)),
+            NarrativeColumn("End Time", lambda row: format_date_or_datetime(row[1].end_time)),
+            NarrativeColumn("Route", lambda row: row[1].route or "-"),
+            NarrativeColumn(
+                "Agents",
+                lambda row: (
+                    ", ".join(agent.name for agent in row[1].anesthesia_agents)
+                    if row[1].anesthesia_agents
+                    else "-"
+                ),
+            ),
+            NarrativeColumn("Performer", lambda row: row[1].performer_name or "-"),
+        ],
+        empty_text="No anesthesia recorded",
+    )
+
     def __init__(
         self,
         anesthesia_records: Sequence[AnesthesiaProtocol],
@@ -99,127 +136,32 @@ class AnesthesiaSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
-
-        # Add entries with Anesthesia Procedures and Medications
-        for anesthesia in self.anesthesia_records:
-            # Add anesthesia procedure entry
-            self._add_procedure_entry(section, anesthesia)
-
-            # Add medication entries if anesthesia agents are provided
-            if anesthesia.anesthesia_agents:
-                for agent in anesthesia.anesthesia_agents:
-                    self._add_medication_entry(section, agent)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries with Anesthesia Procedures and Medications
+            for anesthesia in self.anesthesia_records:
+                # Add anesthesia procedure entry
+                self._add_procedure_entry(section, anesthesia)
+
+                # Add medication entries if anesthesia agents are provided
+                if anesthesia.anesthesia_agents:
+                    for agent in anesthesia.anesthesia_agents:
+                        self._add_medication_entry(section, agent)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.anesthesia_records:
-            # No anesthesia records - add "No anesthesia recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No anesthesia recorded"
-            return
-
-        # Create table for anesthesia records
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Anesthesia Type",
-            "Code",
-            "Status",
-            "Start Time",
-            "End Time",
-            "Route",
-            "Agents",
-            "Performer",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, anesthesia in enumerate(self.anesthesia_records, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Anesthesia type (with ID reference)
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_type,
-                f"{{{NS}}}content",
-                ID=f"anesthesia-{idx}",
-            )
-            content.text = anesthesia.anesthesia_type
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{anesthesia.anesthesia_code} ({anesthesia.anesthesia_code_system})"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = anesthesia.status.capitalize()
-
-            # Start time
-            td_start = etree.SubElement(tr, f"{{{NS}}}td")
-            if anesthesia.start_time:
-                # Format based on whether it's a date or datetime
-                if hasattr(anesthesia.start_time, "hour"):
-                    # It's a datetime
-                    td_start.text = anesthesia.start_time.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # It's a date
-                    td_start.text = anesthesia.start_time.strftime("%Y-%m-%d")
-            else:
-                td_start.text = "-"
-
-            # End time
-            td_end = etree.SubElement(tr, f"{{{NS}}}td")
-            if anesthesia.end_time:
-                # Format based on whether it's a date or datetime
-                if hasattr(anesthesia.end_time, "hour"):
-                    # It's a datetime
-                    td_end.text = anesthesia.end_time.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # It's a date
-                    td_end.text = anesthesia.end_time.strftime("%Y-%m-%d")
-            else:
-                td_end.text = "-"
-
-            # Route
-            td_route = etree.SubElement(tr, f"{{{NS}}}td")
-            if anesthesia.route:
-                td_route.text = anesthesia.route
-            else:
-                td_route.text = "-"
-
-            # Agents/medications
-            td_agents = etree.SubElement(tr, f"{{{NS}}}td")
-            if anesthesia.anesthesia_agents:
-                agents_list = [agent.name for agent in anesthesia.anesthesia_agents]
-                td_agents.text = ", ".join(agents_list)
-            else:
-                td_agents.text = "-"
-
-            # Performer
-            td_performer = etree.SubElement(tr, f"{{{NS}}}td")
-            if anesthesia.performer_name:
-                td_performer.text = anesthesia.performer_name
-            else:
-                td_performer.text = "-"
+        self.NARRATIVE.render(section, enumerate(self.anesthesia_records, start=1))
 
     def _add_procedure_entry(self, section: etree._Element, anesthesia: AnesthesiaProtocol) -> None:
         """
@@ -6,6 +6,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.planned_act import PlannedAct
+from ccdakit.builders.narrative import add_narrative_stub
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.assessment_and_plan import AssessmentAndPlanItemProtocol
 
@@ -30,6 +31,8 @@ class AssessmentAndPlanSection(CDAElement):
     - Plan of Treatment Section (V2): 2.16.840.1.113883.10.20.22.2.10
     """
 
+    __slots__ = ("items", "title")
+
     # Template IDs - Only one version (R2.0 and R2.1 use the same template)
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -102,12 +105,16 @@ class AssessmentAndPlanSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1098-7707)
-        self._add_narrative(section)
-
-        # Add entries with Planned Acts (CONF:1098-7708, 15448)
-        for item in self.items:
-            if item.planned_act:
-                self._add_entry(section, item.planned_act)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries with Planned Acts (CONF:1098-7708, 15448)
+            for item in self.items:
+                if item.planned_act:
+                    self._add_entry(section, item.planned_act)
 
         return section
 
@@ -38,6 +38,8 @@ class ChiefComplaintAndReasonForVisitSection(CDAElement):
     - CONF:81-7843: SHALL contain exactly one [1..1] text
     """
 
+    __slots__ = ("chief_complaints", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
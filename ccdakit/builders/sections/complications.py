@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.problem import ProblemObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.complication import ComplicationProtocol
 
@@ -25,6 +31,8 @@ class ComplicationsSection(CDAElement):
     Supports R2.1 (2015-08-01) version.
     """
 
+    __slots__ = ("complications", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -36,6 +44,32 @@ class ComplicationsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, complication) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Complication",
+                lambda row: row[1].name,
+                content_id=lambda row: f"complication-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn(
+                "Severity",
+                lambda row: row[1].severity.capitalize() if row[1].severity else "Not specified",
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Onset Date", lambda row: format_date(row[1].onset_date, "Unknown")),
+            NarrativeColumn(
+                "Resolved Date",
+                lambda row: format_date(
+                    row[1].resolved_date,
+                    "Ongoing" if row[1].status == "active" else "Unknown",
+                ),
+            ),
+        ],
+        empty_text="No complications",
+    )
+
     def __init__(
         self,
         complications: Sequence[ComplicationProtocol],
@@ -83,85 +117,26 @@ class ComplicationsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Problem Observations
-        for complication in self.complications:
-            self._add_entry(section, complication)
+        if self.include_entries:
+            # Add entries with Problem Observations
+            for complication in self.complications:
+                self._add_entry(section, complication)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.complications:
-            # No complications - add "No complications" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No complications"
-            return
-
-        # Create table for complications
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Complication", "Code", "Severity", "Status", "Onset Date", "Resolved Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, complication in enumerate(self.complications, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Complication name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"complication-{idx}",
-            )
-            content.text = complication.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{complication.code} ({complication.code_system})"
-
-            # Severity
-            td_severity = etree.SubElement(tr, f"{{{NS}}}td")
-            if complication.severity:
-                td_severity.text = complication.severity.capitalize()
-            else:
-                td_severity.text = "Not specified"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = complication.status.capitalize()
-
-            # Onset date
-            td_onset = etree.SubElement(tr, f"{{{NS}}}td")
-            if complication.onset_date:
-                td_onset.text = complication.onset_date.strftime("%Y-%m-%d")
-            else:
-                td_onset.text = "Unknown"
-
-            # Resolved date
-            td_resolved = etree.SubElement(tr, f"{{{NS}}}td")
-            if complication.resolved_date:
-                td_resolved.text = complication.resolved_date.strftime("%Y-%m-%d")
-            else:
-                td_resolved.text = "Ongoing" if complication.status == "active" else "Unknown"
+        self.NARRATIVE.render(section, enumerate(self.complications, start=1))
 
     def _add_entry(self, section: etree._Element, complication: ComplicationProtocol) -> None:
         """
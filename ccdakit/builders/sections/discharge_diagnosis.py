@@ -7,6 +7,12 @@ from lxml import etree
 from ccdakit.builders.entries.discharge_diagnosis_entry import (
     HospitalDischargeDiagnosis,
 )
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.discharge_diagnosis import DischargeDiagnosisProtocol
 
@@ -30,6 +36,8 @@ class DischargeDiagnosisSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("diagnoses", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -48,6 +56,23 @@ class DischargeDiagnosisSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, diagnosis) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Diagnosis",
+                lambda row: row[1].name,
+                content_id=lambda row: f"discharge-diagnosis-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn(
+                "Diagnosis Date", lambda row: format_date(row[1].diagnosis_date, "Unknown")
+            ),
+        ],
+        empty_text="No discharge diagnoses",
+    )
+
     def __init__(
         self,
         diagnoses: Sequence[DischargeDiagnosisProtocol],
@@ -100,73 +125,28 @@ class DischargeDiagnosisSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1198-7982)
-        self._add_narrative(section)
-
-        # Add entries with Hospital Discharge Diagnosis (CONF:1198-7983, CONF:1198-15489)
-        if self.diagnoses:
-            entry = etree.SubElement(section, f"{{{NS}}}entry")
-            discharge_diag = HospitalDischargeDiagnosis(
-                self.diagnoses,
-                version=self.version,
-            )
-            entry.append(discharge_diag.to_element())
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries with Hospital Discharge Diagnosis (CONF:1198-7983, CONF:1198-15489)
+            if self.diagnoses:
+                entry = etree.SubElement(section, f"{{{NS}}}entry")
+                discharge_diag = HospitalDischargeDiagnosis(
+                    self.diagnoses,
+                    version=self.version,
+                )
+                entry.append(discharge_diag.to_element())
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.diagnoses:
-            # No diagnoses - add "No discharge diagnoses" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No discharge diagnoses"
-            return
-
-        # Create table for diagnoses
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Diagnosis", "Code", "Status", "Diagnosis Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, diagnosis in enumerate(self.diagnoses, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Diagnosis name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"discharge-diagnosis-{idx}",
-            )
-            content.text = diagnosis.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{diagnosis.code} ({diagnosis.code_system})"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = diagnosis.status.capitalize()
-
-            # Diagnosis date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            if diagnosis.diagnosis_date:
-                td_date.text = diagnosis.diagnosis_date.strftime("%Y-%m-%d")
-            else:
-                td_date.text = "Unknown"
+        self.NARRATIVE.render(section, enumerate(self.diagnoses, start=1))
@@ -5,6 +5,12 @@ from typing import Optional, Sequence
 from lxml import etree
 
 from ccdakit.builders.entries.discharge_medication import DischargeMedication
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.medication import MedicationProtocol
 
@@ -29,6 +35,8 @@ class DischargeMedicationsSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2015-08-01) versions.
     """
 
+    __slots__ = ("medications", "title", "null_flavor")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -37,6 +45,7 @@ class DischargeMedicationsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.11.1",
                 extension="2015-08-01",
                 description="Discharge Medications Section (entries required) (V3) R2.1",
+                entries_required=True,
             ),
             # Base template (entries optional) - required parent template per CONF:1198-30525
             TemplateConfig(
@@ -51,6 +60,7 @@ class DischargeMedicationsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.11.1",
                 extension="2015-08-01",
                 description="Discharge Medications Section (entries required) (V3) R2.0",
+                entries_required=True,
             ),
             # Base template (entries optional) - required parent template
             TemplateConfig(
@@ -64,6 +74,31 @@ class DischargeMedicationsSection(CDAElement):
     # LOINC code system OID
     LOINC_OID = "2.16.840.1.113883.6.1"
 
+    # Narrative layout; rows are (index, medication) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Medication",
+                lambda row: row[1].name,
+                content_id=lambda row: f"discharge-medication-{row[0]}",
+            ),
+            NarrativeColumn("Dosage", lambda row: row[1].dosage),
+            NarrativeColumn("Route", lambda row: row[1].route.capitalize()),
+            NarrativeColumn("Frequency", lambda row: row[1].frequency),
+            NarrativeColumn("Start Date", lambda row: format_date(row[1].start_date)),
+            NarrativeColumn(
+                "End Date",
+                lambda row: format_date(
+                    row[1].end_date,
+                    "Ongoing" if row[1].status == "active" else "Unknown",
+                ),
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Instructions", lambda row: row[1].instructions or "-"),
+        ],
+        empty_text="No discharge medications",
+    )
+
     def __init__(
         self,
         medications: Sequence[MedicationProtocol],
@@ -112,13 +147,17 @@ class DischargeMedicationsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1198-7825)
-        self._add_narrative(section)
-
-        # Add entries with Discharge Medication (CONF:1198-7826, CONF:1198-15491)
-        # If section/@nullFlavor is not present: SHALL contain at least one entry
-        if not self.null_flavor:
-            for medication in self.medications:
-                self._add_entry(section, medication)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries with Discharge Medication (CONF:1198-7826, CONF:1198-15491)
+            # If section/@nullFlavor is not present: SHALL contain at least one entry
+            if not self.null_flavor:
+                for medication in self.medications:
+                    self._add_entry(section, medication)
 
         return section
 
@@ -153,92 +192,18 @@ class DischargeMedicationsSection(CDAElement):
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.medications:
-            # No medications - add "No discharge medications" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            if self.null_flavor:
-                paragraph.text = "No information available for discharge medications"
-            else:
-                paragraph.text = "No discharge medications"
-            return
-
-        # Create table for medications
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Medication",
-            "Dosage",
-            "Route",
-            "Frequency",
-            "Start Date",
-            "End Date",
-            "Status",
-            "Instructions",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, medication in enumerate(self.medications, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Medication name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"discharge-medication-{idx}",
-            )
-            content.text = medication.name
-
-            # Dosage
-            td_dosage = etree.SubElement(tr, f"{{{NS}}}td")
-            td_dosage.text = medication.dosage
-
-            # Route
-            td_route = etree.SubElement(tr, f"{{{NS}}}td")
-            td_route.text = medication.route.capitalize()
-
-            # Frequency
-            td_frequency = etree.SubElement(tr, f"{{{NS}}}td")
-            td_frequency.text = medication.frequency
-
-            # Start date
-            td_start = etree.SubElement(tr, f"{{{NS}}}td")
-            td_start.text = medication.start_date.strftime("%Y-%m-%d")
-
-            # End date
-            td_end = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.end_date:
-                td_end.text = medication.end_date.strftime("%Y-%m-%d")
-            else:
-                td_end.text = "Ongoing" if medication.status == "active" else "Unknown"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = medication.status.capitalize()
-
-            # Instructions
-            td_instructions = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.instructions:
-                td_instructions.text = medication.instructions
-            else:
-                td_instructions.text = "-"
+        self.NARRATIVE.render(
+            section,
+            enumerate(self.medications, start=1),
+            empty_text=(
+                "No information available for discharge medications" if self.null_flavor else None
+            ),
+        )
 
     def _add_entry(self, section: etree._Element, medication: MedicationProtocol) -> None:
         """
@@ -6,14 +6,40 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.result import ResultOrganizer
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
-from ccdakit.protocols.discharge_studies import DischargeStudyOrganizerProtocol
+from ccdakit.protocols.discharge_studies import (
+    DischargeStudyObservationProtocol,
+    DischargeStudyOrganizerProtocol,
+)
 
 
 # CDA namespace
 NS = "urn:hl7-org:v3"
 
 
+def _reference_range_text(study: DischargeStudyObservationProtocol) -> str:
+    """Format a study's reference range for the narrative."""
+    if not (study.reference_range_low or study.reference_range_high):
+        return "-"
+    range_text = []
+    if study.reference_range_low:
+        range_text.append(study.reference_range_low)
+    if study.reference_range_high:
+        if range_text:
+            range_text.append(f" - {study.reference_range_high}")
+        else:
+            range_text.append(f"< {study.reference_range_high}")
+    if study.reference_range_unit:
+        range_text.append(f" {study.reference_range_unit}")
+    return "".join(range_text)
+
+
 class HospitalDischargeStudiesSummarySection(CDAElement):
     """
     Builder for C-CDA Hospital Discharge Studies Summary Section.
@@ -33,6 +59,8 @@ class HospitalDischargeStudiesSummarySection(CDAElement):
     - Reuses Result Organizer entry pattern for consistency
     """
 
+    __slots__ = ("study_organizers", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -51,6 +79,29 @@ class HospitalDischargeStudiesSummarySection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (panel index, organizer, study index, study)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            # Panel name only on the first row of each panel
+            NarrativeColumn(
+                "Study Panel",
+                lambda row: row[1].study_panel_name if row[2] == 1 else "",
+                content_id=lambda row: f"discharge-study-panel-{row[0]}" if row[2] == 1 else None,
+            ),
+            NarrativeColumn(
+                "Study",
+                lambda row: row[3].study_name,
+                content_id=lambda row: f"discharge-study-{row[0]}-{row[2]}",
+            ),
+            NarrativeColumn("Value", lambda row: row[3].value),
+            NarrativeColumn("Unit", lambda row: row[3].unit or "-"),
+            NarrativeColumn("Interpretation", lambda row: row[3].interpretation or "-"),
+            NarrativeColumn("Reference Range", lambda row: _reference_range_text(row[3])),
+            NarrativeColumn("Date", lambda row: format_date(row[1].effective_time)),
+        ],
+        empty_text="No discharge studies available",
+    )
+
     def __init__(
         self,
         study_organizers: Sequence[DischargeStudyOrganizerProtocol],
@@ -98,118 +149,31 @@ class HospitalDischargeStudiesSummarySection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Result Organizers (reusing the pattern)
-        for organizer in self.study_organizers:
-            self._add_entry(section, organizer)
+        if self.include_entries:
+            # Add entries with Result Organizers (reusing the pattern)
+            for organizer in self.study_organizers:
+                self._add_entry(section, organizer)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.study_organizers:
-            # No studies - add "No discharge studies available" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No discharge studies available"
-            return
-
-        # Create table for studies
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Study Panel",
-            "Study",
-            "Value",
-            "Unit",
-            "Interpretation",
-            "Reference Range",
-            "Date",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for organizer_idx, organizer in enumerate(self.study_organizers, start=1):
-            # Add each study in the organizer
-            for study_idx, study in enumerate(organizer.studies, start=1):
-                tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                # Study panel name (only on first row of each panel)
-                td_panel = etree.SubElement(tr, f"{{{NS}}}td")
-                if study_idx == 1:
-                    content_panel = etree.SubElement(
-                        td_panel,
-                        f"{{{NS}}}content",
-                        ID=f"discharge-study-panel-{organizer_idx}",
-                    )
-                    content_panel.text = organizer.study_panel_name
-                else:
-                    td_panel.text = ""  # Empty for subsequent rows
-
-                # Study name (with ID reference)
-                td_study = etree.SubElement(tr, f"{{{NS}}}td")
-                content_study = etree.SubElement(
-                    td_study,
-                    f"{{{NS}}}content",
-                    ID=f"discharge-study-{organizer_idx}-{study_idx}",
-                )
-                content_study.text = study.study_name
-
-                # Value
-                td_value = etree.SubElement(tr, f"{{{NS}}}td")
-                td_value.text = study.value
-
-                # Unit
-                td_unit = etree.SubElement(tr, f"{{{NS}}}td")
-                if study.unit:
-                    td_unit.text = study.unit
-                else:
-                    td_unit.text = "-"
-
-                # Interpretation
-                td_interpretation = etree.SubElement(tr, f"{{{NS}}}td")
-                if study.interpretation:
-                    td_interpretation.text = study.interpretation
-                else:
-                    td_interpretation.text = "-"
-
-                # Reference Range
-                td_range = etree.SubElement(tr, f"{{{NS}}}td")
-                if study.reference_range_low or study.reference_range_high:
-                    range_text = []
-                    if study.reference_range_low:
-                        range_text.append(study.reference_range_low)
-                    if study.reference_range_high:
-                        if range_text:
-                            range_text.append(f" - {study.reference_range_high}")
-                        else:
-                            range_text.append(f"< {study.reference_range_high}")
-                    if study.reference_range_unit:
-                        range_text.append(f" {study.reference_range_unit}")
-                    td_range.text = "".join(range_text)
-                else:
-                    td_range.text = "-"
-
-                # Date (from organizer or study)
-                td_date = etree.SubElement(tr, f"{{{NS}}}td")
-                # Use organizer date for consistency
-                td_date.text = organizer.effective_time.strftime("%Y-%m-%d")
+        rows = (
+            (organizer_idx, organizer, study_idx, study)
+            for organizer_idx, organizer in enumerate(self.study_organizers, start=1)
+            for study_idx, study in enumerate(organizer.studies, start=1)
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_entry(
         self, section: etree._Element, organizer: DischargeStudyOrganizerProtocol
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.encounter import EncounterActivity
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date_or_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.encounter import EncounterProtocol
 
@@ -14,6 +20,16 @@ from ccdakit.protocols.encounter import EncounterProtocol
 NS = "urn:hl7-org:v3"
 
 
+def _encounter_period(encounter: EncounterProtocol) -> str:
+    """Format an encounter's date, or date range, for the narrative."""
+    if not encounter.date:
+        return "Unknown"
+    start = format_date_or_datetime(encounter.date)
+    if encounter.end_date:
+        return f"{start} to {format_date_or_datetime(encounter.end_date)}"
+    return start
+
+
 class EncountersSection(CDAElement):
     """
     Builder for C-CDA Encounters Section (entries required).
@@ -22,6 +38,8 @@ class EncountersSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("encounters", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -29,6 +47,7 @@ class EncountersSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.22.1",
                 extension="2015-08-01",
                 description="Encounters Section (entries required) V3",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.22",
@@ -41,6 +60,7 @@ class EncountersSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.22.1",
                 extension="2014-06-09",
                 description="Encounters Section (entries required) V2",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.22",
@@ -50,6 +70,25 @@ class EncountersSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, encounter) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Encounter Type",
+                lambda row: row[1].encounter_type,
+                content_id=lambda row: f"encounter-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn("Date", lambda row: _encounter_period(row[1])),
+            NarrativeColumn("Location", lambda row: row[1].location or "-"),
+            NarrativeColumn("Performer", lambda row: row[1].performer_name or "-"),
+            NarrativeColumn(
+                "Discharge Disposition", lambda row: row[1].discharge_disposition or "-"
+            ),
+        ],
+        empty_text="No encounters recorded",
+    )
+
     def __init__(
         self,
         encounters: Sequence[EncounterProtocol],
@@ -97,111 +136,26 @@ class EncountersSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Encounter Activities
-        for encounter in self.encounters:
-            self._add_entry(section, encounter)
+        if self.include_entries:
+            # Add entries with Encounter Activities
+            for encounter in self.encounters:
+                self._add_entry(section, encounter)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.encounters:
-            # No encounters - add "No encounters recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No encounters recorded"
-            return
-
-        # Create table for encounters
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Encounter Type",
-            "Code",
-            "Date",
-            "Location",
-            "Performer",
-            "Discharge Disposition",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, encounter in enumerate(self.encounters, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Encounter type (with ID reference)
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_type,
-                f"{{{NS}}}content",
-                ID=f"encounter-{idx}",
-            )
-            content.text = encounter.encounter_type
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{encounter.code} ({encounter.code_system})"
-
-            # Date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            if encounter.date:
-                # Format based on whether it's a date or datetime
-                if hasattr(encounter.date, "hour"):
-                    # It's a datetime
-                    date_str = encounter.date.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # It's a date
-                    date_str = encounter.date.strftime("%Y-%m-%d")
-
-                # Add end date if available
-                if encounter.end_date:
-                    if hasattr(encounter.end_date, "hour"):
-                        end_str = encounter.end_date.strftime("%Y-%m-%d %H:%M")
-                    else:
-                        end_str = encounter.end_date.strftime("%Y-%m-%d")
-                    td_date.text = f"{date_str} to {end_str}"
-                else:
-                    td_date.text = date_str
-            else:
-                td_date.text = "Unknown"
-
-            # Location
-            td_location = etree.SubElement(tr, f"{{{NS}}}td")
-            if encounter.location:
-                td_location.text = encounter.location
-            else:
-                td_location.text = "-"
-
-            # Performer
-            td_performer = etree.SubElement(tr, f"{{{NS}}}td")
-            if encounter.performer_name:
-                td_performer.text = encounter.performer_name
-            else:
-                td_performer.text = "-"
-
-            # Discharge Disposition
-            td_disposition = etree.SubElement(tr, f"{{{NS}}}td")
-            if encounter.discharge_disposition:
-                td_disposition.text = encounter.discharge_disposition
-            else:
-                td_disposition.text = "-"
+        self.NARRATIVE.render(section, enumerate(self.encounters, start=1))
 
     def _add_entry(self, section: etree._Element, encounter: EncounterProtocol) -> None:
         """
@@ -1,19 +1,59 @@
 """Family History Section builder for C-CDA documents."""
 
-from typing import Sequence
+from typing import Optional, Sequence
 
 from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.family_member_history import FamilyHistoryOrganizer
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
-from ccdakit.protocols.family_history import FamilyMemberHistoryProtocol
+from ccdakit.protocols.family_history import (
+    FamilyHistoryObservationProtocol,
+    FamilyMemberHistoryProtocol,
+)
 
 
 # CDA namespace
 NS = "urn:hl7-org:v3"
 
 
+# Display names of administrative gender codes
+_GENDER_NAMES = {"M": "Male", "F": "Female", "UN": "Undifferentiated"}
+
+
+def _member_gender(family_member: FamilyMemberHistoryProtocol) -> str:
+    """Get a family member's gender shown in the narrative."""
+    subject = family_member.subject
+    if subject and subject.administrative_gender_code:
+        return _GENDER_NAMES.get(subject.administrative_gender_code, "Unknown")
+    return "Unknown"
+
+
+def _member_status(family_member: FamilyMemberHistoryProtocol) -> str:
+    """Get a family member's vital status (deceased or living) shown in the narrative."""
+    subject = family_member.subject
+    if not (subject and subject.deceased_ind):
+        return "Living"
+    if subject.deceased_time:
+        return f"Deceased ({format_date(subject.deceased_time)})"
+    return "Deceased"
+
+
+def _age_at_onset(observation: Optional[FamilyHistoryObservationProtocol]) -> str:
+    """Format the age at onset of a family history observation for the narrative."""
+    if not observation:
+        return ""
+    if observation.age_at_onset is not None:
+        return f"{observation.age_at_onset} years"
+    return "Unknown"
+
+
 class FamilyHistorySection(CDAElement):
     """
     Builder for C-CDA Family History Section.
@@ -28,6 +68,8 @@ class FamilyHistorySection(CDAElement):
     Conformance: 2.16.840.1.113883.10.20.22.2.15 (Family History Section V3)
     """
 
+    __slots__ = ("family_members", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -46,6 +88,29 @@ class FamilyHistorySection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (member index, member, observation or None, first row of
+    # the member); member details are only shown on the first row of each member
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Family Member",
+                lambda row: f"Family Member {row[0]}" if row[3] else "",
+                content_id=lambda row: f"family-member-{row[0]}" if row[3] else None,
+            ),
+            NarrativeColumn("Gender", lambda row: _member_gender(row[1]) if row[3] else ""),
+            NarrativeColumn(
+                "Relationship", lambda row: row[1].relationship_display_name if row[3] else ""
+            ),
+            NarrativeColumn(
+                "Condition",
+                lambda row: row[2].condition_name if row[2] else "No conditions documented",
+            ),
+            NarrativeColumn("Age at Onset", lambda row: _age_at_onset(row[2])),
+            NarrativeColumn("Status", lambda row: _member_status(row[1]) if row[3] else ""),
+        ],
+        empty_text="No known family history",
+    )
+
     def __init__(
         self,
         family_members: Sequence[FamilyMemberHistoryProtocol],
@@ -105,155 +170,32 @@ class FamilyHistorySection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1198-7935)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Family History Organizers (CONF:1198-32430, CONF:1198-32431)
-        for family_member in self.family_members:
-            self._add_entry(section, family_member)
+        if self.include_entries:
+            # Add entries with Family History Organizers (CONF:1198-32430, CONF:1198-32431)
+            for family_member in self.family_members:
+                self._add_entry(section, family_member)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.family_members:
-            # No family history - add "No known family history" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No known family history"
-            return
-
-        # Create table for family history
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Family Member",
-            "Gender",
-            "Relationship",
-            "Condition",
-            "Age at Onset",
-            "Status",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, family_member in enumerate(self.family_members, start=1):
-            # Each family member can have multiple observations
-            observations = family_member.observations
-            if not observations:
-                # Add row for family member with no observations
-                self._add_family_member_row(tbody, idx, family_member, None, first_row=True)
-            else:
-                # Add row for each observation
-                for obs_idx, observation in enumerate(observations):
-                    self._add_family_member_row(
-                        tbody,
-                        idx,
-                        family_member,
-                        observation,
-                        first_row=(obs_idx == 0),
-                    )
-
-    def _add_family_member_row(
-        self,
-        tbody: etree._Element,
-        member_idx: int,
-        family_member: FamilyMemberHistoryProtocol,
-        observation,
-        first_row: bool,
-    ) -> None:
-        """
-        Add a table row for a family member observation.
-
-        Args:
-            tbody: Table body element
-            member_idx: Family member index
-            family_member: Family member data
-            observation: Observation data (or None)
-            first_row: Whether this is the first row for this family member
-        """
-        tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-        # Family member name/ID (with ID reference, only on first row)
-        td_member = etree.SubElement(tr, f"{{{NS}}}td")
-        if first_row:
-            content = etree.SubElement(
-                td_member,
-                f"{{{NS}}}content",
-                ID=f"family-member-{member_idx}",
-            )
-            content.text = f"Family Member {member_idx}"
-        else:
-            # Empty cell or just text for continuation rows
-            td_member.text = ""
-
-        # Gender (only on first row)
-        td_gender = etree.SubElement(tr, f"{{{NS}}}td")
-        if first_row and family_member.subject and family_member.subject.administrative_gender_code:
-            gender_map = {
-                "M": "Male",
-                "F": "Female",
-                "UN": "Undifferentiated",
-            }
-            td_gender.text = gender_map.get(
-                family_member.subject.administrative_gender_code, "Unknown"
-            )
-        elif first_row:
-            td_gender.text = "Unknown"
-        else:
-            td_gender.text = ""
-
-        # Relationship (only on first row)
-        td_relationship = etree.SubElement(tr, f"{{{NS}}}td")
-        if first_row:
-            td_relationship.text = family_member.relationship_display_name
-        else:
-            td_relationship.text = ""
-
-        # Condition
-        td_condition = etree.SubElement(tr, f"{{{NS}}}td")
-        if observation:
-            td_condition.text = observation.condition_name
-        else:
-            td_condition.text = "No conditions documented"
-
-        # Age at onset
-        td_age = etree.SubElement(tr, f"{{{NS}}}td")
-        if observation and observation.age_at_onset is not None:
-            td_age.text = f"{observation.age_at_onset} years"
-        elif observation:
-            td_age.text = "Unknown"
-        else:
-            td_age.text = ""
-
-        # Status (deceased or living)
-        td_status = etree.SubElement(tr, f"{{{NS}}}td")
-        if first_row:
-            if family_member.subject and family_member.subject.deceased_ind:
-                if family_member.subject.deceased_time:
-                    td_status.text = (
-                        f"Deceased ({family_member.subject.deceased_time.strftime('%Y-%m-%d')})"
-                    )
-                else:
-                    td_status.text = "Deceased"
-            else:
-                td_status.text = "Living"
-        else:
-            td_status.text = ""
+        rows = (
+            (idx, family_member, observation, obs_idx == 0)
+            for idx, family_member in enumerate(self.family_members, start=1)
+            # A member without observations still gets one row
+            for obs_idx, observation in enumerate(family_member.observations or [None])
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_entry(
         self, section: etree._Element, family_member: FamilyMemberHistoryProtocol
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.functional_status import FunctionalStatusOrganizer
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.functional_status import FunctionalStatusOrganizerProtocol
 
@@ -28,6 +34,8 @@ class FunctionalStatusSection(CDAElement):
     Conformance: Template 2.16.840.1.113883.10.20.22.2.14
     """
 
+    __slots__ = ("organizers", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -49,6 +57,21 @@ class FunctionalStatusSection(CDAElement):
     # LOINC code for section per CONF:1098-14578, CONF:1098-14579
     SECTION_CODE = "47420-5"  # Functional Status
 
+    # Narrative layout; rows are (organizer index, organizer, observation index, observation)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Category", lambda row: row[1].category),
+            NarrativeColumn(
+                "Functional Status",
+                lambda row: row[3].type,
+                content_id=lambda row: f"funcstatus-{row[0]}-{row[2]}",
+            ),
+            NarrativeColumn("Value", lambda row: row[3].value),
+            NarrativeColumn("Date/Time", lambda row: format_datetime(row[3].date)),
+        ],
+        empty_text="No functional status recorded",
+    )
+
     def __init__(
         self,
         organizers: Sequence[FunctionalStatusOrganizerProtocol],
@@ -103,76 +126,33 @@ class FunctionalStatusSection(CDAElement):
         title_elem.text = self.title
 
         # CONF:1098-7923: Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # CONF:1098-14414, CONF:1098-14415: Add entries with organizers
-        for organizer in self.organizers:
-            self._add_entry(section, organizer)
+        if self.include_entries:
+            # CONF:1098-14414, CONF:1098-14415: Add entries with organizers
+            for organizer in self.organizers:
+                self._add_entry(section, organizer)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         CONF:1098-7923: SHALL contain exactly one [1..1] text
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.organizers:
-            # No functional status data - add "No functional status recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No functional status recorded"
-            return
-
-        # Create table for functional status
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Category",
-            "Functional Status",
-            "Value",
-            "Date/Time",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for org_idx, organizer in enumerate(self.organizers, start=1):
-            for obs_idx, observation in enumerate(organizer.observations, start=1):
-                tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                # Category
-                td_category = etree.SubElement(tr, f"{{{NS}}}td")
-                td_category.text = organizer.category
-
-                # Functional Status type (with ID reference)
-                td_type = etree.SubElement(tr, f"{{{NS}}}td")
-                content = etree.SubElement(
-                    td_type,
-                    f"{{{NS}}}content",
-                    ID=f"funcstatus-{org_idx}-{obs_idx}",
-                )
-                content.text = observation.type
-
-                # Value
-                td_value = etree.SubElement(tr, f"{{{NS}}}td")
-                td_value.text = observation.value
-
-                # Date/Time
-                td_date = etree.SubElement(tr, f"{{{NS}}}td")
-                td_date.text = observation.date.strftime("%Y-%m-%d %H:%M")
+        rows = (
+            (organizer_idx, organizer, observation_idx, observation)
+            for organizer_idx, organizer in enumerate(self.organizers, start=1)
+            for observation_idx, observation in enumerate(organizer.observations, start=1)
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_entry(
         self, section: etree._Element, organizer: FunctionalStatusOrganizerProtocol
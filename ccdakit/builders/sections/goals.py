@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.goal import GoalObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.goal import GoalProtocol
 
@@ -14,6 +20,30 @@ from ccdakit.protocols.goal import GoalProtocol
 NS = "urn:hl7-org:v3"
 
 
+def _format_status(status: str) -> str:
+    """
+    Format status for display in narrative.
+
+    Args:
+        status: Raw status string
+
+    Returns:
+        Formatted status string
+    """
+    # Capitalize and replace hyphens with spaces
+    formatted = status.replace("-", " ").replace("_", " ")
+    return formatted.title()
+
+
+def _goal_value(goal: GoalProtocol) -> str:
+    """Format a goal's target value, with its unit, for the narrative."""
+    if not goal.value:
+        return "Not specified"
+    if goal.value_unit:
+        return f"{goal.value} {goal.value_unit}"
+    return str(goal.value)
+
+
 class GoalsSection(CDAElement):
     """
     Builder for C-CDA Goals Section.
@@ -24,6 +54,11 @@ class GoalsSection(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.2.60
     """
 
+    __slots__ = ("goals", "title", "null_flavor")
+
+    # Entries are mandatory, so they are kept in narrative-only builds
+    ENTRIES_REQUIRED = True
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -42,6 +77,26 @@ class GoalsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, goal) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Goal",
+                lambda row: row[1].description,
+                content_id=lambda row: f"goal-{row[0]}",
+            ),
+            NarrativeColumn("Status", lambda row: _format_status(row[1].status)),
+            NarrativeColumn(
+                "Start Date", lambda row: format_date(row[1].start_date, "Not specified")
+            ),
+            NarrativeColumn(
+                "Target Date", lambda row: format_date(row[1].target_date, "Not specified")
+            ),
+            NarrativeColumn("Value", lambda row: _goal_value(row[1])),
+        ],
+        empty_text="No goals documented",
+    )
+
     def __init__(
         self,
         goals: Sequence[GoalProtocol],
@@ -104,85 +159,27 @@ class GoalsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1098-30722)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Goal Observations (CONF:1098-30719, CONF:1098-30720)
-        if self.goals:
-            for goal in self.goals:
-                self._add_entry(section, goal)
+        if self.include_entries:
+            # Add entries with Goal Observations (CONF:1098-30719, CONF:1098-30720)
+            if self.goals:
+                for goal in self.goals:
+                    self._add_entry(section, goal)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.goals:
-            # No goals - add "No goals documented" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No goals documented"
-            return
-
-        # Create table for goals
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Goal", "Status", "Start Date", "Target Date", "Value"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, goal in enumerate(self.goals, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Goal description (with ID reference)
-            td_desc = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_desc,
-                f"{{{NS}}}content",
-                ID=f"goal-{idx}",
-            )
-            content.text = goal.description
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = self._format_status(goal.status)
-
-            # Start date
-            td_start = etree.SubElement(tr, f"{{{NS}}}td")
-            if goal.start_date:
-                td_start.text = goal.start_date.strftime("%Y-%m-%d")
-            else:
-                td_start.text = "Not specified"
-
-            # Target date
-            td_target = etree.SubElement(tr, f"{{{NS}}}td")
-            if goal.target_date:
-                td_target.text = goal.target_date.strftime("%Y-%m-%d")
-            else:
-                td_target.text = "Not specified"
-
-            # Value
-            td_value = etree.SubElement(tr, f"{{{NS}}}td")
-            if goal.value:
-                if goal.value_unit:
-                    td_value.text = f"{goal.value} {goal.value_unit}"
-                else:
-                    td_value.text = str(goal.value)
-            else:
-                td_value.text = "Not specified"
+        self.NARRATIVE.render(section, enumerate(self.goals, start=1))
 
     def _add_entry(self, section: etree._Element, goal: GoalProtocol) -> None:
         """
@@ -198,17 +195,3 @@ class GoalsSection(CDAElement):
         # Create and add Goal Observation (CONF:1098-30720)
         obs_builder = GoalObservation(goal, version=self.version)
         entry.append(obs_builder.to_element())
-
-    def _format_status(self, status: str) -> str:
-        """
-        Format status for display in narrative.
-
-        Args:
-            status: Raw status string
-
-        Returns:
-            Formatted status string
-        """
-        # Capitalize and replace hyphens with spaces
-        formatted = status.replace("-", " ").replace("_", " ")
-        return formatted.title()
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.health_concern import HealthConcernAct
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.health_concern import HealthConcernProtocol
 
@@ -14,6 +20,16 @@ from ccdakit.protocols.health_concern import HealthConcernProtocol
 NS = "urn:hl7-org:v3"
 
 
+def _effective_period(concern: HealthConcernProtocol) -> str:
+    """Format a health concern's effective time range for the narrative."""
+    if not concern.effective_time_low:
+        return "Unknown"
+    start = format_date(concern.effective_time_low)
+    if concern.effective_time_high:
+        return f"{start} to {format_date(concern.effective_time_high)}"
+    return f"{start} - Ongoing"
+
+
 class HealthConcernsSection(CDAElement):
     """
     Builder for C-CDA Health Concerns Section (V2).
@@ -30,6 +46,11 @@ class HealthConcernsSection(CDAElement):
     - MAY contain nullFlavor="NI" (CONF:1198-32802)
     """
 
+    __slots__ = ("health_concerns", "title", "null_flavor")
+
+    # Entries are mandatory, so they are kept in narrative-only builds
+    ENTRIES_REQUIRED = True
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -48,6 +69,32 @@ class HealthConcernsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, health concern) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Health Concern",
+                lambda row: row[1].name,
+                content_id=lambda row: f"health-concern-{row[0]}",
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Effective Time", lambda row: _effective_period(row[1])),
+            # Listed within the cell
+            NarrativeColumn(
+                "Related Observations",
+                lambda row: (
+                    [f"{obs.display_name} ({obs.observation_type})" for obs in row[1].observations]
+                    or "None"
+                ),
+            ),
+            NarrativeColumn(
+                "Concern Type",
+                lambda row: "Patient" if row[1].author_is_patient else "Provider",
+            ),
+        ],
+        empty_text="No health concerns",
+    )
+
     def __init__(
         self,
         health_concerns: Sequence[HealthConcernProtocol],
@@ -102,97 +149,34 @@ class HealthConcernsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1198-28810)
-        self._add_narrative(section)
-
-        # Add entries with Health Concern Acts (CONF:1198-30768)
-        # If nullFlavor is not present, SHALL contain at least one entry
-        if not self.null_flavor:
-            for health_concern in self.health_concerns:
-                self._add_entry(section, health_concern)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries with Health Concern Acts (CONF:1198-30768)
+            # If nullFlavor is not present, SHALL contain at least one entry
+            if not self.null_flavor:
+                for health_concern in self.health_concerns:
+                    self._add_entry(section, health_concern)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if self.null_flavor or not self.health_concerns:
-            # No health concerns - add "No health concerns" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            if self.null_flavor == "NI":
-                paragraph.text = "No information available"
-            else:
-                paragraph.text = "No health concerns"
-            return
-
-        # Create table for health concerns
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Health Concern",
-            "Status",
-            "Effective Time",
-            "Related Observations",
-            "Concern Type",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, concern in enumerate(self.health_concerns, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Health concern name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"health-concern-{idx}",
-            )
-            content.text = concern.name
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = concern.status.capitalize()
-
-            # Effective time
-            td_time = etree.SubElement(tr, f"{{{NS}}}td")
-            if concern.effective_time_low:
-                time_str = concern.effective_time_low.strftime("%Y-%m-%d")
-                if concern.effective_time_high:
-                    time_str += f" to {concern.effective_time_high.strftime('%Y-%m-%d')}"
-                else:
-                    time_str += " - Ongoing"
-                td_time.text = time_str
-            else:
-                td_time.text = "Unknown"
-
-            # Related observations
-            td_observations = etree.SubElement(tr, f"{{{NS}}}td")
-            if concern.observations:
-                obs_list = etree.SubElement(td_observations, f"{{{NS}}}list")
-                for obs in concern.observations:
-                    item = etree.SubElement(obs_list, f"{{{NS}}}item")
-                    item.text = f"{obs.display_name} ({obs.observation_type})"
-            else:
-                td_observations.text = "None"
-
-            # Concern type (patient vs provider)
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            td_type.text = "Patient" if concern.author_is_patient else "Provider"
+        if self.null_flavor:
+            rows = ()
+            empty_text = "No information available" if self.null_flavor == "NI" else None
+        else:
+            rows = enumerate(self.health_concerns, start=1)
+            empty_text = None
+        self.NARRATIVE.render(section, rows, empty_text=empty_text)
 
     def _add_entry(self, section: etree._Element, health_concern: HealthConcernProtocol) -> None:
         """
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.outcome_observation import OutcomeObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.health_status_evaluation import OutcomeObservationProtocol
 
@@ -14,6 +20,42 @@ from ccdakit.protocols.health_status_evaluation import OutcomeObservationProtoco
 NS = "urn:hl7-org:v3"
 
 
+def _outcome_name(outcome: OutcomeObservationProtocol) -> str:
+    """Get the outcome name shown in the narrative (display name or code)."""
+    if outcome.display_name:
+        return outcome.display_name
+    if outcome.code:
+        return f"Outcome: {outcome.code}"
+    return "Outcome observation"
+
+
+def _outcome_value(outcome: OutcomeObservationProtocol) -> str:
+    """Format an outcome's value, with its unit, for the narrative."""
+    if not outcome.value:
+        return "Not specified"
+    if getattr(outcome, "value_unit", None):
+        return f"{outcome.value} {outcome.value_unit}"
+    return str(outcome.value)
+
+
+def _outcome_date(outcome: OutcomeObservationProtocol) -> str:
+    """Format an outcome's effective time as a date for the narrative."""
+    effective_time = getattr(outcome, "effective_time", None)
+    if not effective_time:
+        return "Not specified"
+    if hasattr(effective_time, "strftime"):
+        return format_date(effective_time)
+    return str(effective_time)
+
+
+def _outcome_progress(outcome: OutcomeObservationProtocol) -> str:
+    """Get the progress toward goal shown in the narrative."""
+    progress = getattr(outcome, "progress_toward_goal", None)
+    if progress and hasattr(progress, "achievement_display_name"):
+        return progress.achievement_display_name or "Progress documented"
+    return "Not specified"
+
+
 class HealthStatusEvaluationsAndOutcomesSection(CDAElement):
     """
     Builder for C-CDA Health Status Evaluations and Outcomes Section.
@@ -37,6 +79,11 @@ class HealthStatusEvaluationsAndOutcomesSection(CDAElement):
     - SHALL contain at least one [1..*] entry with Outcome Observation (CONF:1098-31227, CONF:1098-31228)
     """
 
+    __slots__ = ("outcomes", "title", "null_flavor")
+
+    # Entries are mandatory, so they are kept in narrative-only builds
+    ENTRIES_REQUIRED = True
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -55,6 +102,21 @@ class HealthStatusEvaluationsAndOutcomesSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, outcome) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Outcome",
+                lambda row: _outcome_name(row[1]),
+                content_id=lambda row: f"outcome-{row[0]}",
+            ),
+            NarrativeColumn("Value", lambda row: _outcome_value(row[1])),
+            NarrativeColumn("Date", lambda row: _outcome_date(row[1])),
+            NarrativeColumn("Progress Toward Goal", lambda row: _outcome_progress(row[1])),
+        ],
+        empty_text="No health status evaluations or outcomes documented",
+    )
+
     def __init__(
         self,
         outcomes: Sequence[OutcomeObservationProtocol],
@@ -118,97 +180,28 @@ class HealthStatusEvaluationsAndOutcomesSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1098-29590)
-        self._add_narrative(section)
-
-        # Add entries with Outcome Observations (CONF:1098-31227, CONF:1098-31228)
-        # SHALL contain at least one [1..*] entry
-        if self.outcomes:
-            for outcome in self.outcomes:
-                self._add_entry(section, outcome)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries with Outcome Observations (CONF:1098-31227, CONF:1098-31228)
+            # SHALL contain at least one [1..*] entry
+            if self.outcomes:
+                for outcome in self.outcomes:
+                    self._add_entry(section, outcome)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.outcomes:
-            # No outcomes - add "No outcomes documented" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No health status evaluations or outcomes documented"
-            return
-
-        # Create table for outcomes
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Outcome", "Value", "Date", "Progress Toward Goal"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, outcome in enumerate(self.outcomes, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Outcome description (with ID reference)
-            td_desc = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_desc,
-                f"{{{NS}}}content",
-                ID=f"outcome-{idx}",
-            )
-            # Use display name or code
-            if outcome.display_name:
-                content.text = outcome.display_name
-            elif outcome.code:
-                content.text = f"Outcome: {outcome.code}"
-            else:
-                content.text = "Outcome observation"
-
-            # Value
-            td_value = etree.SubElement(tr, f"{{{NS}}}td")
-            if outcome.value:
-                if hasattr(outcome, "value_unit") and outcome.value_unit:
-                    td_value.text = f"{outcome.value} {outcome.value_unit}"
-                else:
-                    td_value.text = str(outcome.value)
-            else:
-                td_value.text = "Not specified"
-
-            # Effective time
-            td_time = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(outcome, "effective_time") and outcome.effective_time:
-                if hasattr(outcome.effective_time, "strftime"):
-                    td_time.text = outcome.effective_time.strftime("%Y-%m-%d")
-                else:
-                    td_time.text = str(outcome.effective_time)
-            else:
-                td_time.text = "Not specified"
-
-            # Progress toward goal
-            td_progress = etree.SubElement(tr, f"{{{NS}}}td")
-            if (
-                hasattr(outcome, "progress_toward_goal")
-                and outcome.progress_toward_goal
-                and hasattr(outcome.progress_toward_goal, "achievement_display_name")
-            ):
-                td_progress.text = (
-                    outcome.progress_toward_goal.achievement_display_name or "Progress documented"
-                )
-            else:
-                td_progress.text = "Not specified"
+        self.NARRATIVE.render(section, enumerate(self.outcomes, start=1))
 
     def _add_entry(self, section: etree._Element, outcome: OutcomeObservationProtocol) -> None:
         """
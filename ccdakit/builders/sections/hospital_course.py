@@ -42,6 +42,8 @@ class HospitalCourseSection(CDAElement):
     - CONF:81-7855: SHALL contain text
     """
 
+    __slots__ = ("hospital_course", "narrative_text", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -91,15 +93,6 @@ class HospitalCourseSection(CDAElement):
         self.narrative_text = narrative_text
         self.title = title
 
-        # Determine the final narrative text to use
-        if self.narrative_text:
-            self._final_narrative = self.narrative_text
-        elif self.hospital_course:
-            self._final_narrative = self.hospital_course.course_text
-        else:
-            # Allow empty content - will show default message
-            self._final_narrative = "No hospital course information provided."
-
     def build(self) -> etree.Element:
         """
         Build Hospital Course Section XML element.
@@ -155,10 +148,19 @@ class HospitalCourseSection(CDAElement):
         # Create text element
         text = etree.SubElement(section, f"{{{NS}}}text")
 
+        # Determine the final narrative text to use
+        if self.narrative_text:
+            narrative = self.narrative_text
+        elif self.hospital_course:
+            narrative = self.hospital_course.course_text
+        else:
+            # Allow empty content - will show default message
+            narrative = "No hospital course information provided."
+
         # Split narrative into paragraphs if it contains double line breaks
         # This helps with readability for longer hospital courses
-        if "\n\n" in self._final_narrative:
-            paragraphs = self._final_narrative.split("\n\n")
+        if "\n\n" in narrative:
+            paragraphs = narrative.split("\n\n")
             for para_text in paragraphs:
                 if para_text.strip():  # Only add non-empty paragraphs
                     paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
@@ -166,4 +168,4 @@ class HospitalCourseSection(CDAElement):
         else:
             # Single paragraph for simpler narratives
             paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = self._final_narrative
+            paragraph.text = narrative
@@ -40,6 +40,8 @@ class HospitalDischargeInstructionsSection(CDAElement):
     - CONF:81-9922: SHALL contain text
     """
 
+    __slots__ = ("instructions", "narrative_text", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -89,11 +91,6 @@ class HospitalDischargeInstructionsSection(CDAElement):
         self.narrative_text = narrative_text
         self.title = title
 
-        # At least one source of content must be provided
-        if not self.instructions and not self.narrative_text:
-            # Allow empty content - will show default message
-            self.narrative_text = "No discharge instructions provided."
-
     def build(self) -> etree.Element:
         """
         Build Hospital Discharge Instructions Section XML element.
@@ -151,10 +148,15 @@ class HospitalDischargeInstructionsSection(CDAElement):
         # Create text element
         text = etree.SubElement(section, f"{{{NS}}}text")
 
+        narrative_text = self.narrative_text
+        if not self.instructions and not narrative_text:
+            # Allow empty content - will show default message
+            narrative_text = "No discharge instructions provided."
+
         # Add preamble paragraph if narrative_text is provided
-        if self.narrative_text:
+        if narrative_text:
             paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = self.narrative_text
+            paragraph.text = narrative_text
 
         # Add instructions if provided
         if self.instructions:
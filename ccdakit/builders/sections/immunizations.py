@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.immunization import ImmunizationActivity
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.immunization import ImmunizationProtocol
 
@@ -22,6 +28,8 @@ class ImmunizationsSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("immunizations", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -29,6 +37,7 @@ class ImmunizationsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.2.1",
                 extension="2015-08-01",
                 description="Immunizations Section (entries required) R2.1",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.2",
@@ -41,6 +50,7 @@ class ImmunizationsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.2.1",
                 extension="2014-06-09",
                 description="Immunizations Section (entries required) R2.0",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.2",
@@ -50,6 +60,22 @@ class ImmunizationsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, immunization) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Vaccine",
+                lambda row: row[1].vaccine_name,
+                content_id=lambda row: f"immunization-{row[0]}",
+            ),
+            NarrativeColumn("Date", lambda row: format_date(row[1].administration_date)),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Lot Number", lambda row: row[1].lot_number or "Not recorded"),
+            NarrativeColumn("Manufacturer", lambda row: row[1].manufacturer or "Not recorded"),
+        ],
+        empty_text="No known immunizations",
+    )
+
     def __init__(
         self,
         immunizations: Sequence[ImmunizationProtocol],
@@ -97,84 +123,26 @@ class ImmunizationsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Immunization Activities
-        for immunization in self.immunizations:
-            self._add_entry(section, immunization)
+        if self.include_entries:
+            # Add entries with Immunization Activities
+            for immunization in self.immunizations:
+                self._add_entry(section, immunization)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.immunizations:
-            # No immunizations - add "No known immunizations" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No known immunizations"
-            return
-
-        # Create table for immunizations
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Vaccine",
-            "Date",
-            "Status",
-            "Lot Number",
-            "Manufacturer",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, immunization in enumerate(self.immunizations, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Vaccine name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"immunization-{idx}",
-            )
-            content.text = immunization.vaccine_name
-
-            # Administration date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            td_date.text = immunization.administration_date.strftime("%Y-%m-%d")
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = immunization.status.capitalize()
-
-            # Lot number
-            td_lot = etree.SubElement(tr, f"{{{NS}}}td")
-            if immunization.lot_number:
-                td_lot.text = immunization.lot_number
-            else:
-                td_lot.text = "Not recorded"
-
-            # Manufacturer
-            td_manufacturer = etree.SubElement(tr, f"{{{NS}}}td")
-            if immunization.manufacturer:
-                td_manufacturer.text = immunization.manufacturer
-            else:
-                td_manufacturer.text = "Not recorded"
+        self.NARRATIVE.render(section, enumerate(self.immunizations, start=1))
 
     def _add_entry(self, section: etree._Element, immunization: ImmunizationProtocol) -> None:
         """
@@ -6,6 +6,7 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.instruction import Instruction
+from ccdakit.builders.narrative import NarrativeColumn, NarrativeTable, add_narrative_stub
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.instruction import InstructionProtocol
 
@@ -14,6 +15,25 @@ from ccdakit.protocols.instruction import InstructionProtocol
 NS = "urn:hl7-org:v3"
 
 
+def _instruction_type(instruction: InstructionProtocol) -> str:
+    """Get the instruction type shown in the narrative."""
+    if getattr(instruction, "display_name", None):
+        return instruction.display_name
+    if getattr(instruction, "code", None):
+        return f"Instruction ({instruction.code})"
+    return "Instruction"
+
+
+def _instruction_text(instruction: InstructionProtocol) -> str:
+    """Get the instruction text shown in the narrative."""
+    # Support both 'text' and 'instruction_text' properties for backward compatibility
+    if hasattr(instruction, "text"):
+        return instruction.text
+    if hasattr(instruction, "instruction_text"):
+        return instruction.instruction_text
+    return ""
+
+
 class InstructionsSection(CDAElement):
     """
     Builder for C-CDA Instructions Section (V2).
@@ -44,6 +64,11 @@ class InstructionsSection(CDAElement):
     - Medication instructions
     """
 
+    __slots__ = ("instructions", "title", "null_flavor")
+
+    # Entries are mandatory, so they are kept in narrative-only builds
+    ENTRIES_REQUIRED = True
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -62,6 +87,19 @@ class InstructionsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, instruction) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Instruction Type", lambda row: _instruction_type(row[1])),
+            NarrativeColumn(
+                "Details",
+                lambda row: _instruction_text(row[1]),
+                content_id=lambda row: f"instruction-{row[0]}",
+            ),
+        ],
+        empty_text="No instructions documented",
+    )
+
     def __init__(
         self,
         instructions: Optional[Sequence[InstructionProtocol]] = None,
@@ -117,72 +155,27 @@ class InstructionsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1098-10115)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Instruction (V2) (CONF:1098-10116, CONF:1098-31398)
-        # SHALL contain at least one entry if @nullFlavor is not present
-        for instruction in self.instructions:
-            self._add_instruction_entry(section, instruction)
+        if self.include_entries:
+            # Add entries with Instruction (V2) (CONF:1098-10116, CONF:1098-31398)
+            # SHALL contain at least one entry if @nullFlavor is not present
+            for instruction in self.instructions:
+                self._add_instruction_entry(section, instruction)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.instructions:
-            # No instructions - add "No instructions documented" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No instructions documented"
-            return
-
-        # Create table for instructions
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Instruction Type", "Details"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, instruction in enumerate(self.instructions, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Instruction Type (code display name or default)
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(instruction, "display_name") and instruction.display_name:
-                td_type.text = instruction.display_name
-            elif hasattr(instruction, "code") and instruction.code:
-                td_type.text = f"Instruction ({instruction.code})"
-            else:
-                td_type.text = "Instruction"
-
-            # Details (with ID reference)
-            td_details = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_details,
-                f"{{{NS}}}content",
-                ID=f"instruction-{idx}",
-            )
-            # Support both 'text' and 'instruction_text' properties for backward compatibility
-            if hasattr(instruction, "text"):
-                content.text = instruction.text
-            elif hasattr(instruction, "instruction_text"):
-                content.text = instruction.instruction_text
-            else:
-                content.text = ""
+        self.NARRATIVE.render(section, enumerate(self.instructions, start=1))
 
     def _add_instruction_entry(
         self,
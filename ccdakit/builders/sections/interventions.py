@@ -1,12 +1,19 @@
 """Interventions Section builder for C-CDA documents."""
 
-from typing import Optional, Sequence
+from itertools import chain
+from typing import Optional, Sequence, Union
 
 from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.intervention_act import InterventionAct
 from ccdakit.builders.entries.planned_intervention_act import PlannedInterventionAct
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.intervention import (
     InterventionProtocol,
@@ -23,6 +30,40 @@ NS = "urn:hl7-org:v3"
 # - Planned Intervention Act (CONF:1198-32730) - planned interventions
 
 
+def _format_status(status: str) -> str:
+    """
+    Format status for display in narrative.
+
+    Args:
+        status: Raw status string
+
+    Returns:
+        Formatted status string
+    """
+    # Capitalize and replace hyphens with spaces
+    formatted = status.replace("-", " ").replace("_", " ")
+    return formatted.title()
+
+
+def _intervention_status(
+    intervention_type: str, intervention: Union[InterventionProtocol, PlannedInterventionProtocol]
+) -> str:
+    """Get the status shown in the narrative, defaulting by intervention type."""
+    if hasattr(intervention, "status"):
+        return _format_status(intervention.status)
+    return "Active" if intervention_type == "Planned" else "Completed"
+
+
+def _effective_date(intervention: Union[InterventionProtocol, PlannedInterventionProtocol]) -> str:
+    """Format an intervention's effective time as a date for the narrative."""
+    effective_time = getattr(intervention, "effective_time", None)
+    if not effective_time:
+        return "Not specified"
+    if hasattr(effective_time, "strftime"):
+        return format_date(effective_time)
+    return str(effective_time)
+
+
 class InterventionsSection(CDAElement):
     """
     Builder for C-CDA Interventions Section (V3).
@@ -50,6 +91,8 @@ class InterventionsSection(CDAElement):
     - SHOULD contain zero or more [0..*] entry with Planned Intervention Act (CONF:1198-32730, CONF:1198-32731)
     """
 
+    __slots__ = ("interventions", "planned_interventions", "title", "null_flavor")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -68,6 +111,29 @@ class InterventionsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, "Completed" or "Planned", intervention)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Type", lambda row: row[1]),
+            NarrativeColumn(
+                "Description",
+                lambda row: row[2].description,
+                content_id=lambda row: f"intervention-{row[0]}",
+            ),
+            NarrativeColumn("Status", lambda row: _intervention_status(row[1], row[2])),
+            NarrativeColumn("Date", lambda row: _effective_date(row[2])),
+            NarrativeColumn(
+                "Goal Reference",
+                lambda row: (
+                    f"Goal: {row[2].goal_reference_id}"
+                    if getattr(row[2], "goal_reference_id", None)
+                    else "Not specified"
+                ),
+            ),
+        ],
+        empty_text="No interventions documented",
+    )
+
     def __init__(
         self,
         interventions: Optional[Sequence[InterventionProtocol]] = None,
@@ -126,96 +192,38 @@ class InterventionsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1198-8683)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Intervention Acts (CONF:1198-30996, CONF:1198-30997)
-        for intervention in self.interventions:
-            self._add_intervention_entry(section, intervention)
+        if self.include_entries:
+            # Add entries with Intervention Acts (CONF:1198-30996, CONF:1198-30997)
+            for intervention in self.interventions:
+                self._add_intervention_entry(section, intervention)
 
-        # Add entries with Planned Intervention Acts (CONF:1198-32730, CONF:1198-32731)
-        for planned in self.planned_interventions:
-            self._add_planned_intervention_entry(section, planned)
+            # Add entries with Planned Intervention Acts (CONF:1198-32730, CONF:1198-32731)
+            for planned in self.planned_interventions:
+                self._add_planned_intervention_entry(section, planned)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        # Collect all interventions
-        all_interventions = []
-        for intervention in self.interventions:
-            all_interventions.append(("Completed", intervention))
-        for planned in self.planned_interventions:
-            all_interventions.append(("Planned", planned))
-
-        if not all_interventions:
-            # No interventions - add "No interventions documented" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No interventions documented"
-            return
-
-        # Create table for interventions
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Type", "Description", "Status", "Date", "Goal Reference"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, (intervention_type, intervention) in enumerate(all_interventions, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Type (Completed/Planned)
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            td_type.text = intervention_type
-
-            # Description (with ID reference)
-            td_desc = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_desc,
-                f"{{{NS}}}content",
-                ID=f"intervention-{idx}",
-            )
-            content.text = intervention.description
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(intervention, "status"):
-                td_status.text = self._format_status(intervention.status)
-            else:
-                td_status.text = "Active" if intervention_type == "Planned" else "Completed"
-
-            # Date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(intervention, "effective_time") and intervention.effective_time:
-                eff_time = intervention.effective_time
-                if hasattr(eff_time, "strftime"):
-                    td_date.text = eff_time.strftime("%Y-%m-%d")
-                else:
-                    td_date.text = str(eff_time)
-            else:
-                td_date.text = "Not specified"
-
-            # Goal Reference
-            td_goal = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(intervention, "goal_reference_id") and intervention.goal_reference_id:
-                td_goal.text = f"Goal: {intervention.goal_reference_id}"
-            else:
-                td_goal.text = "Not specified"
+        interventions = chain(
+            (("Completed", intervention) for intervention in self.interventions),
+            (("Planned", planned) for planned in self.planned_interventions),
+        )
+        rows = (
+            (idx, intervention_type, intervention)
+            for idx, (intervention_type, intervention) in enumerate(interventions, start=1)
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_intervention_entry(
         self,
@@ -254,17 +262,3 @@ class InterventionsSection(CDAElement):
         # Create and add Planned Intervention Act (CONF:1198-32731)
         act_builder = PlannedInterventionAct(planned, version=self.version)
         entry.append(act_builder.to_element())
-
-    def _format_status(self, status: str) -> str:
-        """
-        Format status for display in narrative.
-
-        Args:
-            status: Raw status string
-
-        Returns:
-            Formatted status string
-        """
-        # Capitalize and replace hyphens with spaces
-        formatted = status.replace("-", " ").replace("_", " ")
-        return formatted.title()
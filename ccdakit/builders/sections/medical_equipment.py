@@ -9,6 +9,12 @@ from ccdakit.builders.entries.medical_equipment import (
     MedicalEquipmentOrganizer,
     NonMedicinalSupplyActivity,
 )
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date_or_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.medical_equipment import MedicalEquipmentProtocol
 
@@ -22,6 +28,16 @@ NS = "urn:hl7-org:v3"
 # - Non-Medicinal Supply Activity (CONF:1098-31125)
 
 
+def _model_and_serial(equipment: MedicalEquipmentProtocol) -> str:
+    """Format a device's model and serial numbers for the narrative."""
+    parts = []
+    if equipment.model_number:
+        parts.append(f"Model: {equipment.model_number}")
+    if equipment.serial_number:
+        parts.append(f"S/N: {equipment.serial_number}")
+    return ", ".join(parts) if parts else "-"
+
+
 class MedicalEquipmentSection(CDAElement):
     """
     Builder for C-CDA Medical Equipment Section.
@@ -34,6 +50,14 @@ class MedicalEquipmentSection(CDAElement):
     Supports both R2.1 and R2.0 versions (both use 2014-06-09 extension).
     """
 
+    __slots__ = (
+        "equipment_list",
+        "title",
+        "use_organizer",
+        "organizer_start_date",
+        "organizer_end_date",
+    )
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -52,6 +76,37 @@ class MedicalEquipmentSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, equipment) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Equipment",
+                lambda row: row[1].name,
+                content_id=lambda row: f"equipment-{row[0]}",
+            ),
+            NarrativeColumn(
+                "Code",
+                lambda row: (
+                    f"{row[1].code} ({row[1].code_system})"
+                    if row[1].code and row[1].code_system
+                    else "-"
+                ),
+            ),
+            NarrativeColumn(
+                "Date Supplied", lambda row: format_date_or_datetime(row[1].date_supplied)
+            ),
+            NarrativeColumn("Date End", lambda row: format_date_or_datetime(row[1].date_end)),
+            NarrativeColumn(
+                "Quantity",
+                lambda row: str(row[1].quantity) if row[1].quantity is not None else "-",
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Manufacturer", lambda row: row[1].manufacturer or "-"),
+            NarrativeColumn("Model/Serial", lambda row: _model_and_serial(row[1])),
+        ],
+        empty_text="No medical equipment recorded",
+    )
+
     def __init__(
         self,
         equipment_list: Sequence[MedicalEquipmentProtocol],
@@ -108,127 +163,31 @@ class MedicalEquipmentSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1098-7947)
-        self._add_narrative(section)
-
-        # Add entries
-        if self.use_organizer and self.equipment_list:
-            # Add Medical Equipment Organizer (CONF:1098-7948, CONF:1098-30351)
-            self._add_organizer_entry(section)
+        if self.include_narrative:
+            self._add_narrative(section)
         else:
-            # Add individual Non-Medicinal Supply Activity entries (CONF:1098-31125, CONF:1098-31861)
-            for equipment in self.equipment_list:
-                self._add_supply_entry(section, equipment)
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            # Add entries
+            if self.use_organizer and self.equipment_list:
+                # Add Medical Equipment Organizer (CONF:1098-7948, CONF:1098-30351)
+                self._add_organizer_entry(section)
+            else:
+                # Add individual Non-Medicinal Supply Activity entries (CONF:1098-31125, CONF:1098-31861)
+                for equipment in self.equipment_list:
+                    self._add_supply_entry(section, equipment)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.equipment_list:
-            # No equipment - add "No medical equipment recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No medical equipment recorded"
-            return
-
-        # Create table for equipment
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Equipment",
-            "Code",
-            "Date Supplied",
-            "Date End",
-            "Quantity",
-            "Status",
-            "Manufacturer",
-            "Model/Serial",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, equipment in enumerate(self.equipment_list, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Equipment name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"equipment-{idx}",
-            )
-            content.text = equipment.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            if equipment.code and equipment.code_system:
-                td_code.text = f"{equipment.code} ({equipment.code_system})"
-            else:
-                td_code.text = "-"
-
-            # Date supplied
-            td_date_start = etree.SubElement(tr, f"{{{NS}}}td")
-            if equipment.date_supplied:
-                if hasattr(equipment.date_supplied, "hour"):
-                    td_date_start.text = equipment.date_supplied.strftime("%Y-%m-%d %H:%M")
-                else:
-                    td_date_start.text = equipment.date_supplied.strftime("%Y-%m-%d")
-            else:
-                td_date_start.text = "-"
-
-            # Date end
-            td_date_end = etree.SubElement(tr, f"{{{NS}}}td")
-            if equipment.date_end:
-                if hasattr(equipment.date_end, "hour"):
-                    td_date_end.text = equipment.date_end.strftime("%Y-%m-%d %H:%M")
-                else:
-                    td_date_end.text = equipment.date_end.strftime("%Y-%m-%d")
-            else:
-                td_date_end.text = "-"
-
-            # Quantity
-            td_quantity = etree.SubElement(tr, f"{{{NS}}}td")
-            if equipment.quantity is not None:
-                td_quantity.text = str(equipment.quantity)
-            else:
-                td_quantity.text = "-"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = equipment.status.capitalize()
-
-            # Manufacturer
-            td_manufacturer = etree.SubElement(tr, f"{{{NS}}}td")
-            if equipment.manufacturer:
-                td_manufacturer.text = equipment.manufacturer
-            else:
-                td_manufacturer.text = "-"
-
-            # Model/Serial
-            td_model = etree.SubElement(tr, f"{{{NS}}}td")
-            parts = []
-            if equipment.model_number:
-                parts.append(f"Model: {equipment.model_number}")
-            if equipment.serial_number:
-                parts.append(f"S/N: {equipment.serial_number}")
-            if parts:
-                td_model.text = ", ".join(parts)
-            else:
-                td_model.text = "-"
+        self.NARRATIVE.render(section, enumerate(self.equipment_list, start=1))
 
     def _add_supply_entry(
         self, section: etree._Element, equipment: MedicalEquipmentProtocol
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.medication import MedicationActivity
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.medication import MedicationProtocol
 
@@ -22,6 +28,8 @@ class MedicationsSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("medications", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -29,6 +37,7 @@ class MedicationsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.1.1",
                 extension="2015-08-01",
                 description="Medications Section (entries required) R2.1",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.1",
@@ -41,6 +50,7 @@ class MedicationsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.1.1",
                 extension="2014-06-09",
                 description="Medications Section (entries required) R2.0",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.1",
@@ -50,6 +60,30 @@ class MedicationsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, medication) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Medication",
+                lambda row: row[1].name,
+                content_id=lambda row: f"medication-{row[0]}",
+            ),
+            NarrativeColumn("Dosage", lambda row: row[1].dosage),
+            NarrativeColumn("Route", lambda row: row[1].route.capitalize()),
+            NarrativeColumn("Frequency", lambda row: row[1].frequency),
+            NarrativeColumn("Start Date", lambda row: format_date(row[1].start_date)),
+            NarrativeColumn(
+                "End Date",
+                lambda row: format_date(
+                    row[1].end_date,
+                    "Ongoing" if row[1].status == "active" else "Unknown",
+                ),
+            ),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+        ],
+        empty_text="No known medications",
+    )
+
     def __init__(
         self,
         medications: Sequence[MedicationProtocol],
@@ -97,91 +131,26 @@ class MedicationsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Medication Activities
-        for medication in self.medications:
-            self._add_entry(section, medication)
+        if self.include_entries:
+            # Add entries with Medication Activities
+            for medication in self.medications:
+                self._add_entry(section, medication)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.medications:
-            # No medications - add "No known medications" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No known medications"
-            return
-
-        # Create table for medications
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Medication",
-            "Dosage",
-            "Route",
-            "Frequency",
-            "Start Date",
-            "End Date",
-            "Status",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, medication in enumerate(self.medications, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Medication name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"medication-{idx}",
-            )
-            content.text = medication.name
-
-            # Dosage
-            td_dosage = etree.SubElement(tr, f"{{{NS}}}td")
-            td_dosage.text = medication.dosage
-
-            # Route
-            td_route = etree.SubElement(tr, f"{{{NS}}}td")
-            td_route.text = medication.route.capitalize()
-
-            # Frequency
-            td_frequency = etree.SubElement(tr, f"{{{NS}}}td")
-            td_frequency.text = medication.frequency
-
-            # Start date
-            td_start = etree.SubElement(tr, f"{{{NS}}}td")
-            td_start.text = medication.start_date.strftime("%Y-%m-%d")
-
-            # End date
-            td_end = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.end_date:
-                td_end.text = medication.end_date.strftime("%Y-%m-%d")
-            else:
-                td_end.text = "Ongoing" if medication.status == "active" else "Unknown"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = medication.status.capitalize()
+        self.NARRATIVE.render(section, enumerate(self.medications, start=1))
 
     def _add_entry(self, section: etree._Element, medication: MedicationProtocol) -> None:
         """
@@ -8,6 +8,12 @@ from ccdakit.builders.common import Code
 from ccdakit.builders.entries.medication_administered_entry import (
     MedicationAdministeredActivity,
 )
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.medication_administered import MedicationAdministeredProtocol
 
@@ -16,6 +22,14 @@ from ccdakit.protocols.medication_administered import MedicationAdministeredProt
 NS = "urn:hl7-org:v3"
 
 
+def _administration_time(medication: MedicationAdministeredProtocol) -> str:
+    """Format an administration time, or time range for infusions, for the narrative."""
+    start = format_datetime(medication.administration_time)
+    if medication.administration_end_time:
+        return f"{start} - {format_datetime(medication.administration_end_time)}"
+    return start
+
+
 class MedicationsAdministeredSection(CDAElement):
     """
     Builder for C-CDA Medications Administered Section (V2).
@@ -37,6 +51,8 @@ class MedicationsAdministeredSection(CDAElement):
     (2.16.840.1.113883.10.20.22.2.25) instead.
     """
 
+    __slots__ = ("medications", "title", "null_flavor")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -55,6 +71,25 @@ class MedicationsAdministeredSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, medication) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Medication",
+                lambda row: row[1].name,
+                content_id=lambda row: f"medication-administered-{row[0]}",
+            ),
+            NarrativeColumn("Dose", lambda row: row[1].dose),
+            NarrativeColumn("Route", lambda row: row[1].route.capitalize()),
+            NarrativeColumn("Administration Time", lambda row: _administration_time(row[1])),
+            NarrativeColumn("Site", lambda row: row[1].site or "-"),
+            NarrativeColumn("Rate", lambda row: row[1].rate or "-"),
+            NarrativeColumn("Performer", lambda row: row[1].performer or "-"),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+        ],
+        empty_text="No medications administered",
+    )
+
     def __init__(
         self,
         medications: Sequence[MedicationAdministeredProtocol],
@@ -109,107 +144,33 @@ class MedicationsAdministeredSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1098-8155)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Medication Activities (CONF:1098-8156, CONF:1098-15499)
-        if not self.null_flavor:
-            for medication in self.medications:
-                self._add_entry(section, medication)
+        if self.include_entries:
+            # Add entries with Medication Activities (CONF:1098-8156, CONF:1098-15499)
+            if not self.null_flavor:
+                for medication in self.medications:
+                    self._add_entry(section, medication)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
         if self.null_flavor:
-            # No information available
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No information available about medications administered"
-            return
-
-        if not self.medications:
-            # No medications administered
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No medications administered"
-            return
-
-        # Create table for medications
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Medication",
-            "Dose",
-            "Route",
-            "Administration Time",
-            "Site",
-            "Rate",
-            "Performer",
-            "Status",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, medication in enumerate(self.medications, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Medication name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"medication-administered-{idx}",
-            )
-            content.text = medication.name
-
-            # Dose
-            td_dose = etree.SubElement(tr, f"{{{NS}}}td")
-            td_dose.text = medication.dose
-
-            # Route
-            td_route = etree.SubElement(tr, f"{{{NS}}}td")
-            td_route.text = medication.route.capitalize()
-
-            # Administration time
-            td_time = etree.SubElement(tr, f"{{{NS}}}td")
-            if medication.administration_end_time:
-                # Show time range for infusions
-                td_time.text = (
-                    f"{medication.administration_time.strftime('%Y-%m-%d %H:%M')} - "
-                    f"{medication.administration_end_time.strftime('%Y-%m-%d %H:%M')}"
-                )
-            else:
-                td_time.text = medication.administration_time.strftime("%Y-%m-%d %H:%M")
-
-            # Site (optional)
-            td_site = etree.SubElement(tr, f"{{{NS}}}td")
-            td_site.text = medication.site if medication.site else "-"
-
-            # Rate (optional)
-            td_rate = etree.SubElement(tr, f"{{{NS}}}td")
-            td_rate.text = medication.rate if medication.rate else "-"
-
-            # Performer (optional)
-            td_performer = etree.SubElement(tr, f"{{{NS}}}td")
-            td_performer.text = medication.performer if medication.performer else "-"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = medication.status.capitalize()
+            rows = ()
+            empty_text = "No information available about medications administered"
+        else:
+            rows = enumerate(self.medications, start=1)
+            empty_text = None
+        self.NARRATIVE.render(section, rows, empty_text=empty_text)
 
     def _add_entry(
         self, section: etree._Element, medication: MedicationAdministeredProtocol
@@ -1,5 +1,6 @@
 """Mental Status Section builder for C-CDA documents."""
 
+from itertools import chain
 from typing import Sequence
 
 from lxml import etree
@@ -9,6 +10,12 @@ from ccdakit.builders.entries.mental_status import (
     MentalStatusObservation,
     MentalStatusOrganizer,
 )
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.mental_status import (
     MentalStatusObservationProtocol,
@@ -35,6 +42,8 @@ class MentalStatusSection(CDAElement):
     Includes narrative (HTML table) and structured entries.
     """
 
+    __slots__ = ("observations", "organizers", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -53,6 +62,24 @@ class MentalStatusSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, category, observation)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Category", lambda row: row[1]),
+            NarrativeColumn(
+                "Finding/Value",
+                lambda row: row[2].value,
+                content_id=lambda row: f"mental-status-{row[0]}",
+            ),
+            NarrativeColumn("Date", lambda row: format_date(row[2].observation_date, "Unknown")),
+            NarrativeColumn(
+                "Status",
+                lambda row: row[2].status.capitalize() if row[2].status else "Completed",
+            ),
+        ],
+        empty_text="No mental status observations recorded",
+    )
+
     def __init__(
         self,
         observations: Sequence[MentalStatusObservationProtocol] = None,
@@ -116,105 +143,40 @@ class MentalStatusSection(CDAElement):
         title_elem.text = self.title
 
         # CONF:1198-28298: Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # CONF:1198-28301, CONF:1198-28302: Add entries with Mental Status Organizers
-        for organizer in self.organizers:
-            self._add_organizer_entry(section, organizer)
+        if self.include_entries:
+            # CONF:1198-28301, CONF:1198-28302: Add entries with Mental Status Organizers
+            for organizer in self.organizers:
+                self._add_organizer_entry(section, organizer)
 
-        # CONF:1198-28305, CONF:1198-28306: Add entries with Mental Status Observations
-        for observation in self.observations:
-            self._add_observation_entry(section, observation)
+            # CONF:1198-28305, CONF:1198-28306: Add entries with Mental Status Observations
+            for observation in self.observations:
+                self._add_observation_entry(section, observation)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        # Check if we have any data to display
-        if not self.observations and not self.organizers:
-            # No mental status data - add "No observations recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No mental status observations recorded"
-            return
-
-        # Create table for mental status observations
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Category", "Finding/Value", "Date", "Status"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        # Add observations from organizers (grouped)
-        idx = 1
-        for organizer in self.organizers:
-            for obs in organizer.observations:
-                self._add_observation_row(tbody, obs, organizer.category, idx)
-                idx += 1
-
-        # Add standalone observations
-        for obs in self.observations:
-            category = obs.category if obs.category else "General"
-            self._add_observation_row(tbody, obs, category, idx)
-            idx += 1
-
-    def _add_observation_row(
-        self,
-        tbody: etree._Element,
-        obs: MentalStatusObservationProtocol,
-        category: str,
-        idx: int,
-    ) -> None:
-        """
-        Add a single observation row to the narrative table.
-
-        Args:
-            tbody: table body element
-            obs: observation data
-            category: category name
-            idx: row index for ID
-        """
-        tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-        # Category
-        td_category = etree.SubElement(tr, f"{{{NS}}}td")
-        td_category.text = category
-
-        # Finding/Value (with ID reference)
-        td_value = etree.SubElement(tr, f"{{{NS}}}td")
-        content = etree.SubElement(
-            td_value,
-            f"{{{NS}}}content",
-            ID=f"mental-status-{idx}",
+        # Observations from organizers (grouped) first, then standalone observations
+        observations = chain(
+            (
+                (organizer.category, obs)
+                for organizer in self.organizers
+                for obs in organizer.observations
+            ),
+            ((obs.category or "General", obs) for obs in self.observations),
         )
-        content.text = obs.value
-
-        # Date
-        td_date = etree.SubElement(tr, f"{{{NS}}}td")
-        obs_date = obs.observation_date
-        if obs_date:
-            td_date.text = obs_date.strftime("%Y-%m-%d")
-        else:
-            td_date.text = "Unknown"
-
-        # Status
-        td_status = etree.SubElement(tr, f"{{{NS}}}td")
-        td_status.text = obs.status.capitalize() if obs.status else "Completed"
+        rows = ((idx, category, obs) for idx, (category, obs) in enumerate(observations, start=1))
+        self.NARRATIVE.render(section, rows)
 
     def _add_organizer_entry(
         self,
@@ -1,19 +1,34 @@
 """Nutrition Section builder for C-CDA documents."""
 
-from typing import Sequence
+from typing import Optional, Sequence, Tuple
 
 from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.nutritional_status import NutritionalStatusObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date_or_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
-from ccdakit.protocols.nutrition import NutritionalStatusProtocol
+from ccdakit.protocols.nutrition import NutritionalStatusProtocol, NutritionAssessmentProtocol
 
 
 # CDA namespace
 NS = "urn:hl7-org:v3"
 
 
+def _status_rowspan(
+    row: Tuple[int, NutritionalStatusProtocol, int, Optional[NutritionAssessmentProtocol]],
+) -> Optional[int]:
+    """Get the rowspan of a status cell: all assessment rows, on the first one."""
+    if not row[3]:
+        return None
+    return len(row[1].assessments) if row[2] == 1 else 0
+
+
 class NutritionSection(CDAElement):
     """
     Builder for C-CDA Nutrition Section.
@@ -41,6 +56,8 @@ class NutritionSection(CDAElement):
     Supports both R2.1 and R2.0 versions.
     """
 
+    __slots__ = ("nutritional_statuses", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -63,6 +80,27 @@ class NutritionSection(CDAElement):
     NUTRITION_CODE = "61144-2"
     NUTRITION_DISPLAY = "Diet and nutrition"
 
+    # Narrative layout; rows are (status index, status, assessment index, assessment or
+    # None); status cells span all assessment rows of the status
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Nutritional Status",
+                lambda row: row[1].status if row[2] == 1 else "",
+                content_id=lambda row: f"nutrition-status-{row[0]}" if row[2] == 1 else None,
+                rowspan=_status_rowspan,
+            ),
+            NarrativeColumn(
+                "Date Observed",
+                lambda row: format_date_or_datetime(row[1].date) if row[2] == 1 else "",
+                rowspan=_status_rowspan,
+            ),
+            NarrativeColumn("Assessment", lambda row: row[3].assessment_type if row[3] else "-"),
+            NarrativeColumn("Value", lambda row: row[3].value if row[3] else "-"),
+        ],
+        empty_text="No nutrition information available",
+    )
+
     def __init__(
         self,
         nutritional_statuses: Sequence[NutritionalStatusProtocol],
@@ -110,125 +148,33 @@ class NutritionSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1098-31043)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Nutritional Status Observations
-        # (CONF:1098-30321, CONF:1098-30322)
-        for status in self.nutritional_statuses:
-            self._add_entry(section, status)
+        if self.include_entries:
+            # Add entries with Nutritional Status Observations
+            # (CONF:1098-30321, CONF:1098-30322)
+            for status in self.nutritional_statuses:
+                self._add_entry(section, status)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.nutritional_statuses:
-            # No nutritional statuses - add "No nutrition information available" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No nutrition information available"
-            return
-
-        # Create table for nutritional status
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Nutritional Status",
-            "Date Observed",
-            "Assessment",
-            "Value",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for status_idx, status in enumerate(self.nutritional_statuses, start=1):
-            # First row for the nutritional status
-            if status.assessments:
-                # If there are assessments, show them in subsequent rows
-                for assessment_idx, assessment in enumerate(status.assessments, start=1):
-                    tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                    if assessment_idx == 1:
-                        # First assessment row includes status info
-                        # Nutritional Status (with ID reference and rowspan)
-                        td_status = etree.SubElement(
-                            tr,
-                            f"{{{NS}}}td",
-                            rowspan=str(len(status.assessments)),
-                        )
-                        content = etree.SubElement(
-                            td_status,
-                            f"{{{NS}}}content",
-                            ID=f"nutrition-status-{status_idx}",
-                        )
-                        content.text = status.status
-
-                        # Date Observed (with rowspan)
-                        td_date = etree.SubElement(
-                            tr,
-                            f"{{{NS}}}td",
-                            rowspan=str(len(status.assessments)),
-                        )
-                        # Format date/datetime appropriately
-                        if hasattr(status.date, "strftime"):
-                            if hasattr(status.date, "hour"):
-                                # It's a datetime
-                                td_date.text = status.date.strftime("%Y-%m-%d %H:%M")
-                            else:
-                                # It's a date
-                                td_date.text = status.date.strftime("%Y-%m-%d")
-                        else:
-                            td_date.text = str(status.date)
-
-                    # Assessment
-                    td_assessment = etree.SubElement(tr, f"{{{NS}}}td")
-                    td_assessment.text = assessment.assessment_type
-
-                    # Value
-                    td_value = etree.SubElement(tr, f"{{{NS}}}td")
-                    td_value.text = assessment.value
-            else:
-                # No assessments, just show status
-                tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                # Nutritional Status (with ID reference)
-                td_status = etree.SubElement(tr, f"{{{NS}}}td")
-                content = etree.SubElement(
-                    td_status,
-                    f"{{{NS}}}content",
-                    ID=f"nutrition-status-{status_idx}",
-                )
-                content.text = status.status
-
-                # Date Observed
-                td_date = etree.SubElement(tr, f"{{{NS}}}td")
-                if hasattr(status.date, "strftime"):
-                    if hasattr(status.date, "hour"):
-                        td_date.text = status.date.strftime("%Y-%m-%d %H:%M")
-                    else:
-                        td_date.text = status.date.strftime("%Y-%m-%d")
-                else:
-                    td_date.text = str(status.date)
-
-                # Empty cells for assessment and value
-                td_assessment = etree.SubElement(tr, f"{{{NS}}}td")
-                td_assessment.text = "-"
-                td_value = etree.SubElement(tr, f"{{{NS}}}td")
-                td_value.text = "-"
+        rows = (
+            (status_idx, status, assessment_idx, assessment)
+            for status_idx, status in enumerate(self.nutritional_statuses, start=1)
+            # A status without assessments still gets one row
+            for assessment_idx, assessment in enumerate(status.assessments or [None], start=1)
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_entry(self, section: etree._Element, status: NutritionalStatusProtocol) -> None:
         """
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.problem import ProblemObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.problem import ProblemProtocol
 
@@ -14,6 +20,10 @@ from ccdakit.protocols.problem import ProblemProtocol
 NS = "urn:hl7-org:v3"
 
 
+# Resolved date text, by status, of problems without a resolved date
+_UNRESOLVED_TEXT = {"active": "Ongoing", "resolved": "Unknown"}
+
+
 class PastMedicalHistorySection(CDAElement):
     """
     Builder for C-CDA Past Medical History Section.
@@ -31,6 +41,8 @@ class PastMedicalHistorySection(CDAElement):
     - Contains: Problem Observation entries (optional, 0..*)
     """
 
+    __slots__ = ("problems", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -49,6 +61,28 @@ class PastMedicalHistorySection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, problem) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Problem",
+                lambda row: row[1].name,
+                content_id=lambda row: f"pmh-problem-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Onset Date", lambda row: format_date(row[1].onset_date, "Unknown")),
+            NarrativeColumn(
+                "Resolved Date",
+                lambda row: format_date(
+                    row[1].resolved_date,
+                    _UNRESOLVED_TEXT.get(row[1].status.lower(), "-"),
+                ),
+            ),
+        ],
+        empty_text="No past medical history",
+    )
+
     def __init__(
         self,
         problems: Sequence[ProblemProtocol],
@@ -109,17 +143,21 @@ class PastMedicalHistorySection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1198-7831)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Problem Observations (CONF:1198-8791, CONF:1198-15476)
-        for problem in self.problems:
-            self._add_entry(section, problem)
+        if self.include_entries:
+            # Add entries with Problem Observations (CONF:1198-8791, CONF:1198-15476)
+            for problem in self.problems:
+                self._add_entry(section, problem)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         The narrative provides human-readable content for the section.
         When no problems are present, displays "No past medical history".
@@ -127,69 +165,7 @@ class PastMedicalHistorySection(CDAElement):
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.problems:
-            # No problems - add "No past medical history" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No past medical history"
-            return
-
-        # Create table for problems
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Problem", "Code", "Status", "Onset Date", "Resolved Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, problem in enumerate(self.problems, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Problem name (with ID reference for linking)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"pmh-problem-{idx}",
-            )
-            content.text = problem.name
-
-            # Code with system
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{problem.code} ({problem.code_system})"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = problem.status.capitalize()
-
-            # Onset date
-            td_onset = etree.SubElement(tr, f"{{{NS}}}td")
-            if problem.onset_date:
-                td_onset.text = problem.onset_date.strftime("%Y-%m-%d")
-            else:
-                td_onset.text = "Unknown"
-
-            # Resolved date
-            td_resolved = etree.SubElement(tr, f"{{{NS}}}td")
-            if problem.resolved_date:
-                td_resolved.text = problem.resolved_date.strftime("%Y-%m-%d")
-            else:
-                # Show different text based on status
-                if problem.status.lower() == "active":
-                    td_resolved.text = "Ongoing"
-                elif problem.status.lower() == "resolved":
-                    td_resolved.text = "Unknown"
-                else:
-                    td_resolved.text = "-"
+        self.NARRATIVE.render(section, enumerate(self.problems, start=1))
 
     def _add_entry(self, section: etree._Element, problem: ProblemProtocol) -> None:
         """
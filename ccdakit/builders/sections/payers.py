@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.coverage_activity import CoverageActivity
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.payer import PayerProtocol
 
@@ -14,6 +20,25 @@ from ccdakit.protocols.payer import PayerProtocol
 NS = "urn:hl7-org:v3"
 
 
+# Priority names of payer sequence numbers
+_PRIORITY_NAMES = {1: "Primary", 2: "Secondary", 3: "Tertiary"}
+
+
+def _coverage_period(payer: PayerProtocol) -> str:
+    """Format a payer's coverage period for the narrative."""
+    if not payer.start_date:
+        return "Unknown"
+    end = format_date(payer.end_date, "present")
+    return f"{format_date(payer.start_date)} to {end}"
+
+
+def _priority(payer: PayerProtocol) -> str:
+    """Format a payer's priority (sequence number) for the narrative."""
+    if payer.sequence_number is None:
+        return "Not specified"
+    return _PRIORITY_NAMES.get(payer.sequence_number, f"Priority {payer.sequence_number}")
+
+
 class PayersSection(CDAElement):
     """
     Builder for C-CDA Payers Section.
@@ -33,6 +58,8 @@ class PayersSection(CDAElement):
     Supports both R2.1 and R2.0 versions.
     """
 
+    __slots__ = ("payers", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -51,6 +78,23 @@ class PayersSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, payer) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Payer Name",
+                lambda row: row[1].payer_name,
+                content_id=lambda row: f"payer-{row[0]}",
+            ),
+            NarrativeColumn("Insurance Type", lambda row: row[1].insurance_type),
+            NarrativeColumn("Member ID", lambda row: row[1].member_id),
+            NarrativeColumn("Group Number", lambda row: row[1].group_number or "N/A"),
+            NarrativeColumn("Coverage Period", lambda row: _coverage_period(row[1])),
+            NarrativeColumn("Priority", lambda row: _priority(row[1])),
+        ],
+        empty_text="No insurance information available",
+    )
+
     def __init__(
         self,
         payers: Sequence[PayerProtocol],
@@ -105,99 +149,28 @@ class PayersSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1198-7927)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Coverage Activities (CONF:1198-7959, CONF:1198-15501)
-        for payer in self.payers:
-            self._add_entry(section, payer)
+        if self.include_entries:
+            # Add entries with Coverage Activities (CONF:1198-7959, CONF:1198-15501)
+            for payer in self.payers:
+                self._add_entry(section, payer)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Generates a human-readable table of payer information.
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.payers:
-            # No payers - add "No insurance information" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No insurance information available"
-            return
-
-        # Create table for payers
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Payer Name",
-            "Insurance Type",
-            "Member ID",
-            "Group Number",
-            "Coverage Period",
-            "Priority",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, payer in enumerate(self.payers, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Payer name (with ID reference)
-            td_payer = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_payer,
-                f"{{{NS}}}content",
-                ID=f"payer-{idx}",
-            )
-            content.text = payer.payer_name
-
-            # Insurance type
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            td_type.text = payer.insurance_type
-
-            # Member ID
-            td_member = etree.SubElement(tr, f"{{{NS}}}td")
-            td_member.text = payer.member_id
-
-            # Group number
-            td_group = etree.SubElement(tr, f"{{{NS}}}td")
-            td_group.text = payer.group_number if payer.group_number else "N/A"
-
-            # Coverage period
-            td_period = etree.SubElement(tr, f"{{{NS}}}td")
-            if payer.start_date:
-                period_text = payer.start_date.strftime("%Y-%m-%d")
-                if payer.end_date:
-                    period_text += f" to {payer.end_date.strftime('%Y-%m-%d')}"
-                else:
-                    period_text += " to present"
-                td_period.text = period_text
-            else:
-                td_period.text = "Unknown"
-
-            # Priority/sequence
-            td_priority = etree.SubElement(tr, f"{{{NS}}}td")
-            if payer.sequence_number is not None:
-                priority_map = {1: "Primary", 2: "Secondary", 3: "Tertiary"}
-                td_priority.text = priority_map.get(
-                    payer.sequence_number, f"Priority {payer.sequence_number}"
-                )
-            else:
-                td_priority.text = "Not specified"
+        self.NARRATIVE.render(section, enumerate(self.payers, start=1))
 
     def _add_entry(self, section: etree._Element, payer: PayerProtocol) -> None:
         """
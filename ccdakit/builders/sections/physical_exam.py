@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.physical_exam import LongitudinalCareWoundObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.physical_exam import WoundObservationProtocol
 
@@ -28,6 +34,8 @@ class PhysicalExamSection(CDAElement):
     - Physical Exam Section (V3): 2.16.840.1.113883.10.20.2.10:2015-08-01
     """
 
+    __slots__ = ("wound_observations", "title", "text")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -46,6 +54,28 @@ class PhysicalExamSection(CDAElement):
         ],
     }
 
+    # Narrative layout for wound observations; rows are (index, observation) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Date/Time",
+                lambda row: (
+                    format_datetime(row[1].date)
+                    if hasattr(row[1].date, "strftime")
+                    else str(row[1].date)
+                ),
+            ),
+            NarrativeColumn(
+                "Wound Type",
+                lambda row: row[1].wound_type,
+                content_id=lambda row: f"wound-{row[0]}",
+            ),
+            NarrativeColumn("Location", lambda row: row[1].location or "-"),
+            NarrativeColumn("Laterality", lambda row: row[1].laterality or "-"),
+        ],
+        empty_text="No physical exam findings recorded",
+    )
+
     def __init__(
         self,
         wound_observations: Optional[Sequence[WoundObservationProtocol]] = None,
@@ -96,11 +126,15 @@ class PhysicalExamSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1198-7809)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Wound Observations (CONF:1198-31926, CONF:1198-31927)
-        for wound_obs in self.wound_observations:
-            self._add_entry(section, wound_obs)
+        if self.include_entries:
+            # Add entries with Wound Observations (CONF:1198-31926, CONF:1198-31927)
+            for wound_obs in self.wound_observations:
+                self._add_entry(section, wound_obs)
 
         return section
 
@@ -111,69 +145,12 @@ class PhysicalExamSection(CDAElement):
         Args:
             section: section element
         """
-        # Create text element
-        text_elem = etree.SubElement(section, f"{{{NS}}}text")
-
         if self.text:
             # Use provided narrative text
+            text_elem = etree.SubElement(section, f"{{{NS}}}text")
             text_elem.text = self.text
-        elif not self.wound_observations:
-            # No observations - add default paragraph
-            paragraph = etree.SubElement(text_elem, f"{{{NS}}}paragraph")
-            paragraph.text = "No physical exam findings recorded"
-        else:
-            # Create table for wound observations
-            table = etree.SubElement(text_elem, f"{{{NS}}}table", border="1", width="100%")
-
-            # Table header
-            thead = etree.SubElement(table, f"{{{NS}}}thead")
-            tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-            headers = [
-                "Date/Time",
-                "Wound Type",
-                "Location",
-                "Laterality",
-            ]
-            for header_text in headers:
-                th = etree.SubElement(tr, f"{{{NS}}}th")
-                th.text = header_text
-
-            # Table body
-            tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-            for obs_idx, wound_obs in enumerate(self.wound_observations, start=1):
-                tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                # Date/Time
-                td_date = etree.SubElement(tr, f"{{{NS}}}td")
-                if hasattr(wound_obs.date, "strftime"):
-                    td_date.text = wound_obs.date.strftime("%Y-%m-%d %H:%M")
-                else:
-                    td_date.text = str(wound_obs.date)
-
-                # Wound Type (with ID reference)
-                td_type = etree.SubElement(tr, f"{{{NS}}}td")
-                content = etree.SubElement(
-                    td_type,
-                    f"{{{NS}}}content",
-                    ID=f"wound-{obs_idx}",
-                )
-                content.text = wound_obs.wound_type
-
-                # Location
-                td_location = etree.SubElement(tr, f"{{{NS}}}td")
-                if wound_obs.location:
-                    td_location.text = wound_obs.location
-                else:
-                    td_location.text = "-"
-
-                # Laterality
-                td_laterality = etree.SubElement(tr, f"{{{NS}}}td")
-                if wound_obs.laterality:
-                    td_laterality.text = wound_obs.laterality
-                else:
-                    td_laterality.text = "-"
+            return
+        self.NARRATIVE.render(section, enumerate(self.wound_observations, start=1))
 
     def _add_entry(self, section: etree._Element, wound_obs: WoundObservationProtocol) -> None:
         """
@@ -1,5 +1,6 @@
 """Plan of Treatment Section builder for C-CDA documents."""
 
+from itertools import chain
 from typing import Optional, Sequence, Union
 
 from lxml import etree
@@ -13,6 +14,12 @@ from ccdakit.builders.entries.planned_medication import PlannedMedication
 from ccdakit.builders.entries.planned_observation import PlannedObservation
 from ccdakit.builders.entries.planned_procedure import PlannedProcedure
 from ccdakit.builders.entries.planned_supply import PlannedSupply
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.plan_of_treatment import (
     InstructionProtocol,
@@ -55,6 +62,18 @@ class PlanOfTreatmentSection(CDAElement):
     or other prospective mood codes.
     """
 
+    __slots__ = (
+        "planned_observations",
+        "planned_procedures",
+        "planned_encounters",
+        "planned_acts",
+        "planned_medications",
+        "planned_supplies",
+        "planned_immunizations",
+        "instructions",
+        "title",
+    )
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -73,6 +92,40 @@ class PlanOfTreatmentSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, activity type, planned activity)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Type", lambda row: row[1]),
+            NarrativeColumn(
+                "Description",
+                # Instructions carry instruction_text instead of a description
+                lambda row: (
+                    row[2].instruction_text
+                    if hasattr(row[2], "instruction_text")
+                    else row[2].description
+                ),
+                content_id=lambda row: f"planned-activity-{row[0]}",
+            ),
+            NarrativeColumn(
+                "Code",
+                lambda row: (
+                    f"{row[2].code} ({getattr(row[2], 'code_system', 'Unknown')})"
+                    if getattr(row[2], "code", None)
+                    else "N/A"
+                ),
+            ),
+            NarrativeColumn(
+                "Status",
+                lambda row: row[2].status.capitalize() if hasattr(row[2], "status") else "N/A",
+            ),
+            NarrativeColumn(
+                "Planned Date",
+                lambda row: format_date(getattr(row[2], "planned_date", None), "Not specified"),
+            ),
+        ],
+        empty_text="No planned activities",
+    )
+
     def __init__(
         self,
         planned_observations: Optional[Sequence[PlannedObservationProtocol]] = None,
@@ -141,135 +194,69 @@ class PlanOfTreatmentSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (CONF:1098-7725)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries for each type of planned activity
-        # Planned Observations (CONF:1098-7726, CONF:1098-14751)
-        for obs in self.planned_observations:
-            self._add_entry(section, obs, PlannedObservation)
+        if self.include_entries:
+            # Add entries for each type of planned activity
+            # Planned Observations (CONF:1098-7726, CONF:1098-14751)
+            for obs in self.planned_observations:
+                self._add_entry(section, obs, PlannedObservation)
 
-        # Planned Encounters (CONF:1098-8805, CONF:1098-30472)
-        for enc in self.planned_encounters:
-            self._add_entry(section, enc, PlannedEncounter)
+            # Planned Encounters (CONF:1098-8805, CONF:1098-30472)
+            for enc in self.planned_encounters:
+                self._add_entry(section, enc, PlannedEncounter)
 
-        # Planned Acts (CONF:1098-8807, CONF:1098-30473)
-        for act in self.planned_acts:
-            self._add_entry(section, act, PlannedAct)
+            # Planned Acts (CONF:1098-8807, CONF:1098-30473)
+            for act in self.planned_acts:
+                self._add_entry(section, act, PlannedAct)
 
-        # Planned Procedures (CONF:1098-8809, CONF:1098-30474)
-        for proc in self.planned_procedures:
-            self._add_entry(section, proc, PlannedProcedure)
+            # Planned Procedures (CONF:1098-8809, CONF:1098-30474)
+            for proc in self.planned_procedures:
+                self._add_entry(section, proc, PlannedProcedure)
 
-        # Planned Medications (CONF:1098-8811, CONF:1098-30475)
-        for med in self.planned_medications:
-            self._add_entry(section, med, PlannedMedication)
+            # Planned Medications (CONF:1098-8811, CONF:1098-30475)
+            for med in self.planned_medications:
+                self._add_entry(section, med, PlannedMedication)
 
-        # Planned Supplies (CONF:1098-8813, CONF:1098-30476)
-        for supply in self.planned_supplies:
-            self._add_entry(section, supply, PlannedSupply)
+            # Planned Supplies (CONF:1098-8813, CONF:1098-30476)
+            for supply in self.planned_supplies:
+                self._add_entry(section, supply, PlannedSupply)
 
-        # Instructions (CONF:1098-14695, CONF:1098-31397)
-        for instruction in self.instructions:
-            self._add_entry(section, instruction, Instruction)
+            # Instructions (CONF:1098-14695, CONF:1098-31397)
+            for instruction in self.instructions:
+                self._add_entry(section, instruction, Instruction)
 
-        # Planned Immunizations (CONF:1098-32353, CONF:1098-32354)
-        for immunization in self.planned_immunizations:
-            self._add_entry(section, immunization, PlannedImmunization)
+            # Planned Immunizations (CONF:1098-32353, CONF:1098-32354)
+            for immunization in self.planned_immunizations:
+                self._add_entry(section, immunization, PlannedImmunization)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        # Collect all activities
-        all_activities = []
-
-        for obs in self.planned_observations:
-            all_activities.append(("Observation", obs))
-        for proc in self.planned_procedures:
-            all_activities.append(("Procedure", proc))
-        for enc in self.planned_encounters:
-            all_activities.append(("Encounter", enc))
-        for act in self.planned_acts:
-            all_activities.append(("Act", act))
-        for med in self.planned_medications:
-            all_activities.append(("Medication", med))
-        for supply in self.planned_supplies:
-            all_activities.append(("Supply", supply))
-        for immunization in self.planned_immunizations:
-            all_activities.append(("Immunization", immunization))
-        for instruction in self.instructions:
-            all_activities.append(("Instruction", instruction))
-
-        if not all_activities:
-            # No planned activities - add "No planned activities" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No planned activities"
-            return
-
-        # Create table for planned activities
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Type", "Description", "Code", "Status", "Planned Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, (activity_type, activity) in enumerate(all_activities, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Activity type
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            td_type.text = activity_type
-
-            # Description (with ID reference)
-            td_desc = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_desc,
-                f"{{{NS}}}content",
-                ID=f"planned-activity-{idx}",
-            )
-            # Check if it's an instruction by checking for instruction_text attribute
-            if hasattr(activity, "instruction_text"):
-                content.text = activity.instruction_text
-            else:
-                content.text = activity.description
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(activity, "code") and activity.code:
-                code_system = getattr(activity, "code_system", "Unknown")
-                td_code.text = f"{activity.code} ({code_system})"
-            else:
-                td_code.text = "N/A"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(activity, "status"):
-                td_status.text = activity.status.capitalize()
-            else:
-                td_status.text = "N/A"
-
-            # Planned date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            if hasattr(activity, "planned_date") and activity.planned_date:
-                td_date.text = activity.planned_date.strftime("%Y-%m-%d")
-            else:
-                td_date.text = "Not specified"
+        activities = chain(
+            (("Observation", obs) for obs in self.planned_observations),
+            (("Procedure", proc) for proc in self.planned_procedures),
+            (("Encounter", enc) for enc in self.planned_encounters),
+            (("Act", act) for act in self.planned_acts),
+            (("Medication", med) for med in self.planned_medications),
+            (("Supply", supply) for supply in self.planned_supplies),
+            (("Immunization", immunization) for immunization in self.planned_immunizations),
+            (("Instruction", instruction) for instruction in self.instructions),
+        )
+        rows = (
+            (idx, activity_type, activity)
+            for idx, (activity_type, activity) in enumerate(activities, start=1)
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_entry(
         self,
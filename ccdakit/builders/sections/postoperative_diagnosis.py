@@ -27,6 +27,8 @@ class PostoperativeDiagnosisSection(CDAElement):
     - Contains: Only narrative text, no structured entries
     """
 
+    __slots__ = ("diagnosis_text", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -8,6 +8,12 @@ from ccdakit.builders.common import Code
 from ccdakit.builders.entries.preoperative_diagnosis_entry import (
     PreoperativeDiagnosisEntry,
 )
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.preoperative_diagnosis import PreoperativeDiagnosisProtocol
 
@@ -31,6 +37,8 @@ class PreoperativeDiagnosisSection(CDAElement):
     Template ID: 2.16.840.1.113883.10.20.22.2.34
     """
 
+    __slots__ = ("diagnoses", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -42,6 +50,23 @@ class PreoperativeDiagnosisSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, diagnosis) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Diagnosis",
+                lambda row: row[1].name,
+                content_id=lambda row: f"preop-diagnosis-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn(
+                "Diagnosis Date", lambda row: format_date(row[1].diagnosis_date, "Unknown")
+            ),
+        ],
+        empty_text="No preoperative diagnosis",
+    )
+
     def __init__(
         self,
         diagnoses: Sequence[PreoperativeDiagnosisProtocol],
@@ -89,71 +114,26 @@ class PreoperativeDiagnosisSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table) (CONF:1198-8100)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Preoperative Diagnosis Acts (CONF:1198-10096, CONF:1198-15504)
-        for diagnosis in self.diagnoses:
-            self._add_entry(section, diagnosis)
+        if self.include_entries:
+            # Add entries with Preoperative Diagnosis Acts (CONF:1198-10096, CONF:1198-15504)
+            for diagnosis in self.diagnoses:
+                self._add_entry(section, diagnosis)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.diagnoses:
-            # No diagnoses - add "No preoperative diagnosis" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No preoperative diagnosis"
-            return
-
-        # Create table for diagnoses
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Diagnosis", "Code", "Status", "Diagnosis Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, diagnosis in enumerate(self.diagnoses, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Diagnosis name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"preop-diagnosis-{idx}",
-            )
-            content.text = diagnosis.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{diagnosis.code} ({diagnosis.code_system})"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = diagnosis.status.capitalize()
-
-            # Diagnosis date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            if diagnosis.diagnosis_date:
-                td_date.text = diagnosis.diagnosis_date.strftime("%Y-%m-%d")
-            else:
-                td_date.text = "Unknown"
+        self.NARRATIVE.render(section, enumerate(self.diagnoses, start=1))
 
     def _add_entry(self, section: etree._Element, diagnosis: PreoperativeDiagnosisProtocol) -> None:
         """
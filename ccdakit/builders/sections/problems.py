@@ -6,7 +6,14 @@ from lxml import etree
 
 from ccdakit.builders.common import Code, StatusCode, create_default_author_participation
 from ccdakit.builders.entries.problem import ProblemObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.canonical import new_id
 from ccdakit.protocols.problem import ProblemProtocol
 
 
@@ -22,6 +29,8 @@ class ProblemsSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("problems", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -29,6 +38,7 @@ class ProblemsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.5.1",
                 extension="2015-08-01",
                 description="Problems Section (entries required) R2.1",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.5",
@@ -41,6 +51,7 @@ class ProblemsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.5.1",
                 extension="2014-06-09",
                 description="Problems Section (entries required) R2.0",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.5",
@@ -50,6 +61,48 @@ class ProblemsSection(CDAElement):
         ],
     }
 
+    # Templates of structures written inline, by name
+    NESTED_TEMPLATES = {
+        "problem_concern_act": {
+            CDAVersion.R2_1: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.3",
+                    extension="2015-08-01",
+                    description="Problem Concern Act R2.1",
+                ),
+            ],
+            CDAVersion.R2_0: [
+                TemplateConfig(
+                    root="2.16.840.1.113883.10.20.22.4.3",
+                    extension="2014-06-09",
+                    description="Problem Concern Act R2.0",
+                ),
+            ],
+        },
+    }
+
+    # Narrative layout; rows are (index, problem) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Problem",
+                lambda row: row[1].name,
+                content_id=lambda row: f"problem-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Onset Date", lambda row: format_date(row[1].onset_date, "Unknown")),
+            NarrativeColumn(
+                "Resolved Date",
+                lambda row: format_date(
+                    row[1].resolved_date,
+                    "Ongoing" if row[1].status == "active" else "Unknown",
+                ),
+            ),
+        ],
+        empty_text="No known problems",
+    )
+
     def __init__(
         self,
         problems: Sequence[ProblemProtocol],
@@ -97,78 +150,26 @@ class ProblemsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Problem Concern Acts
-        for problem in self.problems:
-            self._add_entry(section, problem)
+        if self.include_entries:
+            # Add entries with Problem Concern Acts
+            for problem in self.problems:
+                self._add_entry(section, problem)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.problems:
-            # No problems - add "No known problems" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No known problems"
-            return
-
-        # Create table for problems
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = ["Problem", "Code", "Status", "Onset Date", "Resolved Date"]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, problem in enumerate(self.problems, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Problem name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"problem-{idx}",
-            )
-            content.text = problem.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{problem.code} ({problem.code_system})"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = problem.status.capitalize()
-
-            # Onset date
-            td_onset = etree.SubElement(tr, f"{{{NS}}}td")
-            if problem.onset_date:
-                td_onset.text = problem.onset_date.strftime("%Y-%m-%d")
-            else:
-                td_onset.text = "Unknown"
-
-            # Resolved date
-            td_resolved = etree.SubElement(tr, f"{{{NS}}}td")
-            if problem.resolved_date:
-                td_resolved.text = problem.resolved_date.strftime("%Y-%m-%d")
-            else:
-                td_resolved.text = "Ongoing" if problem.status == "active" else "Unknown"
+        self.NARRATIVE.render(section, enumerate(self.problems, start=1))
 
     def _add_entry(self, section: etree._Element, problem: ProblemProtocol) -> None:
         """
@@ -190,19 +191,12 @@ class ProblemsSection(CDAElement):
         )
 
         # Add template ID for Problem Concern Act
-        template_id = etree.SubElement(act, f"{{{NS}}}templateId")
-        template_id.set("root", "2.16.840.1.113883.10.20.22.4.3")
-        if self.version == CDAVersion.R2_1:
-            template_id.set("extension", "2015-08-01")
-        elif self.version == CDAVersion.R2_0:
-            template_id.set("extension", "2014-06-09")
+        self.add_template_ids(act, nested="problem_concern_act")
 
         # Add ID
-        import uuid
-
         id_elem = etree.SubElement(act, f"{{{NS}}}id")
         id_elem.set("root", "2.16.840.1.113883.19")
-        id_elem.set("extension", str(uuid.uuid4()))
+        id_elem.set("extension", new_id())
 
         # Add code (CONC = Concern)
         code_elem = etree.SubElement(act, f"{{{NS}}}code")
@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.procedure import ProcedureActivity
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date_or_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.procedure import ProcedureProtocol
 
@@ -22,6 +28,8 @@ class ProceduresSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("procedures", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -29,6 +37,7 @@ class ProceduresSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.7.1",
                 extension="2014-06-09",
                 description="Procedures Section (entries required) R2.1",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.7",
@@ -41,6 +50,7 @@ class ProceduresSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.7.1",
                 extension="2014-06-09",
                 description="Procedures Section (entries required) R2.0",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.7",
@@ -50,6 +60,23 @@ class ProceduresSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (index, procedure) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn(
+                "Procedure",
+                lambda row: row[1].name,
+                content_id=lambda row: f"procedure-{row[0]}",
+            ),
+            NarrativeColumn("Code", lambda row: f"{row[1].code} ({row[1].code_system})"),
+            NarrativeColumn("Date", lambda row: format_date_or_datetime(row[1].date, "Unknown")),
+            NarrativeColumn("Status", lambda row: row[1].status.capitalize()),
+            NarrativeColumn("Target Site", lambda row: row[1].target_site or "-"),
+            NarrativeColumn("Performer", lambda row: row[1].performer_name or "-"),
+        ],
+        empty_text="No procedures recorded",
+    )
+
     def __init__(
         self,
         procedures: Sequence[ProcedureProtocol],
@@ -97,98 +124,26 @@ class ProceduresSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Procedure Activities
-        for procedure in self.procedures:
-            self._add_entry(section, procedure)
+        if self.include_entries:
+            # Add entries with Procedure Activities
+            for procedure in self.procedures:
+                self._add_entry(section, procedure)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.procedures:
-            # No procedures - add "No procedures recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No procedures recorded"
-            return
-
-        # Create table for procedures
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Procedure",
-            "Code",
-            "Date",
-            "Status",
-            "Target Site",
-            "Performer",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, procedure in enumerate(self.procedures, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Procedure name (with ID reference)
-            td_name = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_name,
-                f"{{{NS}}}content",
-                ID=f"procedure-{idx}",
-            )
-            content.text = procedure.name
-
-            # Code
-            td_code = etree.SubElement(tr, f"{{{NS}}}td")
-            td_code.text = f"{procedure.code} ({procedure.code_system})"
-
-            # Date
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            if procedure.date:
-                # Format based on whether it's a date or datetime
-                if hasattr(procedure.date, "hour"):
-                    # It's a datetime
-                    td_date.text = procedure.date.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # It's a date
-                    td_date.text = procedure.date.strftime("%Y-%m-%d")
-            else:
-                td_date.text = "Unknown"
-
-            # Status
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            td_status.text = procedure.status.capitalize()
-
-            # Target site
-            td_site = etree.SubElement(tr, f"{{{NS}}}td")
-            if procedure.target_site:
-                td_site.text = procedure.target_site
-            else:
-                td_site.text = "-"
-
-            # Performer
-            td_performer = etree.SubElement(tr, f"{{{NS}}}td")
-            if procedure.performer_name:
-                td_performer.text = procedure.performer_name
-            else:
-                td_performer.text = "-"
+        self.NARRATIVE.render(section, enumerate(self.procedures, start=1))
 
     def _add_entry(self, section: etree._Element, procedure: ProcedureProtocol) -> None:
         """
@@ -27,6 +27,8 @@ class ReasonForVisitSection(CDAElement):
     - Contains: Only narrative text, no structured entries
     """
 
+    __slots__ = ("reason_text", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
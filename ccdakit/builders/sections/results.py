@@ -1,19 +1,52 @@
 """Results Section builder for C-CDA documents."""
 
-from typing import Sequence
+from typing import Any, Iterator, Mapping, Sequence, Tuple
 
 from lxml import etree
 
+from ccdakit.builders.columnar import ResultColumns
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.result import ResultOrganizer
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
-from ccdakit.protocols.result import ResultOrganizerProtocol
+from ccdakit.protocols.result import ResultObservationProtocol, ResultOrganizerProtocol
 
 
 # CDA namespace
 NS = "urn:hl7-org:v3"
 
 
+def _result_rows(
+    organizers: Sequence[ResultOrganizerProtocol],
+) -> Iterator[Tuple[int, ResultOrganizerProtocol, int, ResultObservationProtocol]]:
+    """Flatten organizers into one narrative row per result."""
+    for organizer_idx, organizer in enumerate(organizers, start=1):
+        for result_idx, result in enumerate(organizer.results, start=1):
+            yield organizer_idx, organizer, result_idx, result
+
+
+def _reference_range_text(result: ResultObservationProtocol) -> str:
+    """Format a result's reference range for the narrative."""
+    if not (result.reference_range_low or result.reference_range_high):
+        return "-"
+    range_text = []
+    if result.reference_range_low:
+        range_text.append(result.reference_range_low)
+    if result.reference_range_high:
+        if range_text:
+            range_text.append(f" - {result.reference_range_high}")
+        else:
+            range_text.append(f"< {result.reference_range_high}")
+    if result.reference_range_unit:
+        range_text.append(f" {result.reference_range_unit}")
+    return "".join(range_text)
+
+
 class ResultsSection(CDAElement):
     """
     Builder for C-CDA Results Section (entries required).
@@ -27,6 +60,8 @@ class ResultsSection(CDAElement):
     - Supports LOINC codes for test identification
     """
 
+    __slots__ = ("result_organizers", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -34,6 +69,7 @@ class ResultsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.3.1",
                 extension="2015-08-01",
                 description="Results Section (entries required) V3",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.3",
@@ -46,6 +82,7 @@ class ResultsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.3.1",
                 extension="2015-08-01",
                 description="Results Section (entries required) V3",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.3",
@@ -55,6 +92,30 @@ class ResultsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (panel index, organizer, result index, result)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            # Panel name only on the first row of each panel
+            NarrativeColumn(
+                "Panel",
+                lambda row: row[1].panel_name if row[2] == 1 else "",
+                content_id=lambda row: f"result-panel-{row[0]}" if row[2] == 1 else None,
+            ),
+            NarrativeColumn(
+                "Test",
+                lambda row: row[3].test_name,
+                content_id=lambda row: f"result-{row[0]}-{row[2]}",
+            ),
+            NarrativeColumn("Value", lambda row: row[3].value),
+            NarrativeColumn("Unit", lambda row: row[3].unit or "-"),
+            NarrativeColumn("Interpretation", lambda row: row[3].interpretation or "-"),
+            NarrativeColumn("Reference Range", lambda row: _reference_range_text(row[3])),
+            # Use organizer date for consistency
+            NarrativeColumn("Date", lambda row: format_date(row[1].effective_time)),
+        ],
+        empty_text="No lab results available",
+    )
+
     def __init__(
         self,
         result_organizers: Sequence[ResultOrganizerProtocol],
@@ -66,7 +127,8 @@ class ResultsSection(CDAElement):
         Initialize ResultsSection builder.
 
         Args:
-            result_organizers: List of result organizers (lab panels)
+            result_organizers: List of result organizers (lab panels), or
+                ResultColumns for columnar input
             title: Section title (default: "Results")
             version: C-CDA version (R2.1 or R2.0)
             **kwargs: Additional arguments passed to CDAElement
@@ -75,6 +137,33 @@ class ResultsSection(CDAElement):
         self.result_organizers = result_organizers
         self.title = title
 
+    @classmethod
+    def from_columns(
+        cls,
+        panels: Mapping[str, Any],
+        results: Mapping[str, Any],
+        interpret: bool = True,
+        **kwargs,
+    ) -> "ResultsSection":
+        """
+        Create a Results Section from parallel columns (lists or NumPy arrays).
+
+        Args:
+            panels: Panel columns keyed by ResultOrganizerProtocol attribute
+            results: Result columns keyed by ResultObservationProtocol
+                attribute, plus "panel" (index of each result's panel)
+            interpret: Derive missing H/L/N interpretations from reference ranges
+            **kwargs: Additional arguments passed to ResultsSection
+
+        Returns:
+            ResultsSection over ResultColumns
+
+        Raises:
+            ValueError: If columns are missing, differ in length, or a result
+                refers to a panel that does not exist
+        """
+        return cls(ResultColumns(panels, results, interpret=interpret), **kwargs)
+
     def build(self) -> etree.Element:
         """
         Build Results Section XML element.
@@ -102,118 +191,30 @@ class ResultsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
-
-        # Add entries with Result Organizers
-        for organizer in self.result_organizers:
-            self._add_entry(section, organizer)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            if isinstance(self.result_organizers, ResultColumns):
+                # Columnar input: write every entry in one pass
+                self.result_organizers.append_entries(section, self.version)
+            else:
+                # Add entries with Result Organizers
+                for organizer in self.result_organizers:
+                    self._add_entry(section, organizer)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.result_organizers:
-            # No results - add "No lab results available" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No lab results available"
-            return
-
-        # Create table for results
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Panel",
-            "Test",
-            "Value",
-            "Unit",
-            "Interpretation",
-            "Reference Range",
-            "Date",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for organizer_idx, organizer in enumerate(self.result_organizers, start=1):
-            # Add each result in the organizer
-            for result_idx, result in enumerate(organizer.results, start=1):
-                tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                # Panel name (only on first row of each panel)
-                td_panel = etree.SubElement(tr, f"{{{NS}}}td")
-                if result_idx == 1:
-                    content_panel = etree.SubElement(
-                        td_panel,
-                        f"{{{NS}}}content",
-                        ID=f"result-panel-{organizer_idx}",
-                    )
-                    content_panel.text = organizer.panel_name
-                else:
-                    td_panel.text = ""  # Empty for subsequent rows
-
-                # Test name (with ID reference)
-                td_test = etree.SubElement(tr, f"{{{NS}}}td")
-                content_test = etree.SubElement(
-                    td_test,
-                    f"{{{NS}}}content",
-                    ID=f"result-{organizer_idx}-{result_idx}",
-                )
-                content_test.text = result.test_name
-
-                # Value
-                td_value = etree.SubElement(tr, f"{{{NS}}}td")
-                td_value.text = result.value
-
-                # Unit
-                td_unit = etree.SubElement(tr, f"{{{NS}}}td")
-                if result.unit:
-                    td_unit.text = result.unit
-                else:
-                    td_unit.text = "-"
-
-                # Interpretation
-                td_interpretation = etree.SubElement(tr, f"{{{NS}}}td")
-                if result.interpretation:
-                    td_interpretation.text = result.interpretation
-                else:
-                    td_interpretation.text = "-"
-
-                # Reference Range
-                td_range = etree.SubElement(tr, f"{{{NS}}}td")
-                if result.reference_range_low or result.reference_range_high:
-                    range_text = []
-                    if result.reference_range_low:
-                        range_text.append(result.reference_range_low)
-                    if result.reference_range_high:
-                        if range_text:
-                            range_text.append(f" - {result.reference_range_high}")
-                        else:
-                            range_text.append(f"< {result.reference_range_high}")
-                    if result.reference_range_unit:
-                        range_text.append(f" {result.reference_range_unit}")
-                    td_range.text = "".join(range_text)
-                else:
-                    td_range.text = "-"
-
-                # Date (from organizer or result)
-                td_date = etree.SubElement(tr, f"{{{NS}}}td")
-                # Use organizer date for consistency
-                td_date.text = organizer.effective_time.strftime("%Y-%m-%d")
+        self.NARRATIVE.render(section, _result_rows(self.result_organizers))
 
     def _add_entry(self, section: etree._Element, organizer: ResultOrganizerProtocol) -> None:
         """
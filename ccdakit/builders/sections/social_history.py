@@ -6,6 +6,12 @@ from lxml import etree
 
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.smoking_status import SmokingStatusObservation
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_date_or_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.social_history import SmokingStatusProtocol
 
@@ -29,6 +35,8 @@ class SocialHistorySection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2015-08-01) versions.
     """
 
+    __slots__ = ("smoking_statuses", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -51,6 +59,20 @@ class SocialHistorySection(CDAElement):
     SOCIAL_HISTORY_CODE = "29762-2"
     SOCIAL_HISTORY_DISPLAY = "Social History"
 
+    # Narrative layout; rows are (index, smoking status) pairs
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Social History Type", lambda row: "Smoking Status"),
+            NarrativeColumn(
+                "Status",
+                lambda row: row[1].smoking_status,
+                content_id=lambda row: f"smoking-status-{row[0]}",
+            ),
+            NarrativeColumn("Date Observed", lambda row: format_date_or_datetime(row[1].date)),
+        ],
+        empty_text="No social history information available",
+    )
+
     def __init__(
         self,
         smoking_statuses: Sequence[SmokingStatusProtocol],
@@ -98,77 +120,26 @@ class SocialHistorySection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
 
-        # Add entries with Smoking Status Observations
-        for status in self.smoking_statuses:
-            self._add_entry(section, status)
+        if self.include_entries:
+            # Add entries with Smoking Status Observations
+            for status in self.smoking_statuses:
+                self._add_entry(section, status)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.smoking_statuses:
-            # No smoking status - add "No social history information available" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No social history information available"
-            return
-
-        # Create table for smoking status
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Social History Type",
-            "Status",
-            "Date Observed",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for idx, status in enumerate(self.smoking_statuses, start=1):
-            tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-            # Social History Type
-            td_type = etree.SubElement(tr, f"{{{NS}}}td")
-            td_type.text = "Smoking Status"
-
-            # Status (with ID reference)
-            td_status = etree.SubElement(tr, f"{{{NS}}}td")
-            content = etree.SubElement(
-                td_status,
-                f"{{{NS}}}content",
-                ID=f"smoking-status-{idx}",
-            )
-            content.text = status.smoking_status
-
-            # Date Observed
-            td_date = etree.SubElement(tr, f"{{{NS}}}td")
-            # Format date/datetime appropriately
-            if hasattr(status.date, "strftime"):
-                if hasattr(status.date, "hour"):
-                    # It's a datetime
-                    td_date.text = status.date.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # It's a date
-                    td_date.text = status.date.strftime("%Y-%m-%d")
-            else:
-                td_date.text = str(status.date)
+        self.NARRATIVE.render(section, enumerate(self.smoking_statuses, start=1))
 
     def _add_entry(self, section: etree._Element, status: SmokingStatusProtocol) -> None:
         """
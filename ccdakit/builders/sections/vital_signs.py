@@ -1,11 +1,18 @@
 """Vital Signs Section builder for C-CDA documents."""
 
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 from lxml import etree
 
+from ccdakit.builders.columnar import VitalSignColumns
 from ccdakit.builders.common import Code
 from ccdakit.builders.entries.vital_signs import VitalSignsOrganizer
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    add_narrative_stub,
+    format_datetime,
+)
 from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
 from ccdakit.protocols.vital_signs import VitalSignsOrganizerProtocol
 
@@ -22,6 +29,8 @@ class VitalSignsSection(CDAElement):
     Supports both R2.1 (2015-08-01) and R2.0 (2014-06-09) versions.
     """
 
+    __slots__ = ("vital_signs_organizers", "title")
+
     # Template IDs for different versions
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -29,6 +38,7 @@ class VitalSignsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.4.1",
                 extension="2015-08-01",
                 description="Vital Signs Section (entries required) R2.1",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.4",
@@ -41,6 +51,7 @@ class VitalSignsSection(CDAElement):
                 root="2.16.840.1.113883.10.20.22.2.4.1",
                 extension="2014-06-09",
                 description="Vital Signs Section (entries required) R2.0",
+                entries_required=True,
             ),
             TemplateConfig(
                 root="2.16.840.1.113883.10.20.22.2.4",
@@ -50,6 +61,22 @@ class VitalSignsSection(CDAElement):
         ],
     }
 
+    # Narrative layout; rows are (organizer index, organizer, sign index, vital sign)
+    NARRATIVE = NarrativeTable(
+        columns=[
+            NarrativeColumn("Date/Time", lambda row: format_datetime(row[1].date)),
+            NarrativeColumn(
+                "Vital Sign",
+                lambda row: row[3].type,
+                content_id=lambda row: f"vitalsign-{row[0]}-{row[2]}",
+            ),
+            NarrativeColumn("Value", lambda row: row[3].value),
+            NarrativeColumn("Unit", lambda row: row[3].unit),
+            NarrativeColumn("Interpretation", lambda row: row[3].interpretation or "-"),
+        ],
+        empty_text="No vital signs recorded",
+    )
+
     def __init__(
         self,
         vital_signs_organizers: Sequence[VitalSignsOrganizerProtocol],
@@ -61,7 +88,8 @@ class VitalSignsSection(CDAElement):
         Initialize VitalSignsSection builder.
 
         Args:
-            vital_signs_organizers: List of vital signs organizers
+            vital_signs_organizers: List of vital signs organizers, or
+                VitalSignColumns for columnar input
             title: Section title (default: "Vital Signs")
             version: C-CDA version (R2.1 or R2.0)
             **kwargs: Additional arguments passed to CDAElement
@@ -70,6 +98,33 @@ class VitalSignsSection(CDAElement):
         self.vital_signs_organizers = vital_signs_organizers
         self.title = title
 
+    @classmethod
+    def from_columns(
+        cls,
+        organizers: Mapping[str, Any],
+        vital_signs: Mapping[str, Any],
+        interpret: bool = True,
+        **kwargs,
+    ) -> "VitalSignsSection":
+        """
+        Create a Vital Signs Section from parallel columns (lists or NumPy arrays).
+
+        Args:
+            organizers: Organizer columns keyed by VitalSignsOrganizerProtocol attribute
+            vital_signs: Vital sign columns keyed by VitalSignProtocol attribute,
+                plus "organizer" (index of each sign's organizer)
+            interpret: Derive missing interpretations from reference range columns
+            **kwargs: Additional arguments passed to VitalSignsSection
+
+        Returns:
+            VitalSignsSection over VitalSignColumns
+
+        Raises:
+            ValueError: If columns are missing, differ in length, or a vital
+                sign refers to an organizer that does not exist
+        """
+        return cls(VitalSignColumns(organizers, vital_signs, interpret=interpret), **kwargs)
+
     def build(self) -> etree.Element:
         """
         Build Vital Signs Section XML element.
@@ -97,82 +152,35 @@ class VitalSignsSection(CDAElement):
         title_elem.text = self.title
 
         # Add narrative text (HTML table)
-        self._add_narrative(section)
-
-        # Add entries with Vital Signs Organizers
-        for organizer in self.vital_signs_organizers:
-            self._add_entry(section, organizer)
+        if self.include_narrative:
+            self._add_narrative(section)
+        else:
+            add_narrative_stub(section)
+
+        if self.include_entries:
+            if isinstance(self.vital_signs_organizers, VitalSignColumns):
+                # Columnar input: write every entry in one pass
+                self.vital_signs_organizers.append_entries(section, self.version)
+            else:
+                # Add entries with Vital Signs Organizers
+                for organizer in self.vital_signs_organizers:
+                    self._add_entry(section, organizer)
 
         return section
 
     def _add_narrative(self, section: etree._Element) -> None:
         """
-        Add narrative text element with HTML table.
+        Add narrative text element (table, list or paragraphs per config).
 
         Args:
             section: section element
         """
-        # Create text element
-        text = etree.SubElement(section, f"{{{NS}}}text")
-
-        if not self.vital_signs_organizers:
-            # No vital signs - add "No vital signs recorded" paragraph
-            paragraph = etree.SubElement(text, f"{{{NS}}}paragraph")
-            paragraph.text = "No vital signs recorded"
-            return
-
-        # Create table for vital signs
-        table = etree.SubElement(text, f"{{{NS}}}table", border="1", width="100%")
-
-        # Table header
-        thead = etree.SubElement(table, f"{{{NS}}}thead")
-        tr = etree.SubElement(thead, f"{{{NS}}}tr")
-
-        headers = [
-            "Date/Time",
-            "Vital Sign",
-            "Value",
-            "Unit",
-            "Interpretation",
-        ]
-        for header_text in headers:
-            th = etree.SubElement(tr, f"{{{NS}}}th")
-            th.text = header_text
-
-        # Table body
-        tbody = etree.SubElement(table, f"{{{NS}}}tbody")
-
-        for organizer_idx, organizer in enumerate(self.vital_signs_organizers, start=1):
-            for sign_idx, vital_sign in enumerate(organizer.vital_signs, start=1):
-                tr = etree.SubElement(tbody, f"{{{NS}}}tr")
-
-                # Date/Time
-                td_date = etree.SubElement(tr, f"{{{NS}}}td")
-                td_date.text = organizer.date.strftime("%Y-%m-%d %H:%M")
-
-                # Vital Sign type (with ID reference)
-                td_type = etree.SubElement(tr, f"{{{NS}}}td")
-                content = etree.SubElement(
-                    td_type,
-                    f"{{{NS}}}content",
-                    ID=f"vitalsign-{organizer_idx}-{sign_idx}",
-                )
-                content.text = vital_sign.type
-
-                # Value
-                td_value = etree.SubElement(tr, f"{{{NS}}}td")
-                td_value.text = vital_sign.value
-
-                # Unit
-                td_unit = etree.SubElement(tr, f"{{{NS}}}td")
-                td_unit.text = vital_sign.unit
-
-                # Interpretation
-                td_interpretation = etree.SubElement(tr, f"{{{NS}}}td")
-                if vital_sign.interpretation:
-                    td_interpretation.text = vital_sign.interpretation
-                else:
-                    td_interpretation.text = "-"
+        rows = (
+            (organizer_idx, organizer, sign_idx, vital_sign)
+            for organizer_idx, organizer in enumerate(self.vital_signs_organizers, start=1)
+            for sign_idx, vital_sign in enumerate(organizer.vital_signs, start=1)
+        )
+        self.NARRATIVE.render(section, rows)
 
     def _add_entry(self, section: etree._Element, organizer: VitalSignsOrganizerProtocol) -> None:
         """
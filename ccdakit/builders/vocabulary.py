@@ -0,0 +1,249 @@
+"""Shared normalization of free-text medication route, frequency and dose.
+
+Medication feeds carry route, frequency and dosage as free text drawn from a
+small vocabulary ("oral", "twice daily", "10 mg") repeated across every entry.
+The medication-family builders ask this module for the parsed form instead of
+lower-casing, looking up and splitting each string again: every distinct
+string is parsed once and kept in a bounded LRU cache.
+
+ROUTE_CODES and FREQUENCY_CODES are the shared tables; the builders expose
+them as class attributes and pass them in, so a subclass can override its
+table. Strings looked up in another table are parsed on every call, without
+the cache. Call clear_vocabulary_cache() after changing a shared table in
+place.
+
+Example:
+    warm_vocabulary_cache("vocabulary.json")  # optional, before a large run
+    route = normalize_route("Oral")  # RouteCode(code="C38288", text="Oral")
+    frequency = normalize_frequency("twice daily")  # period 12 h
+    dose = normalize_dose("10 mg")  # value "10", unit "mg"
+    print(vocabulary_cache_info())
+"""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+
+# NCI Thesaurus code system for routes of administration
+ROUTE_OID = "2.16.840.1.113883.3.26.1.1"
+
+# Common route codes (NCI Thesaurus), keyed by lower-cased route text
+ROUTE_CODES = {
+    "oral": "C38288",
+    "iv": "C38276",
+    "intravenous": "C38276",
+    "topical": "C38304",
+    "subcutaneous": "C38299",
+    "intramuscular": "C28161",
+    "inhalation": "C38216",
+    "rectal": "C38295",
+    "ophthalmic": "C38287",
+    "intradermal": "C38238",
+    "intranasal": "C38284",
+}
+
+# Frequency terms mapped to PIVL_TS period values; None marks PRN
+FREQUENCY_CODES = {
+    "once daily": {"period": "1", "unit": "d"},
+    "daily": {"period": "1", "unit": "d"},
+    "twice daily": {"period": "12", "unit": "h"},
+    "three times daily": {"period": "8", "unit": "h"},
+    "four times daily": {"period": "6", "unit": "h"},
+    "every 4 hours": {"period": "4", "unit": "h"},
+    "every 6 hours": {"period": "6", "unit": "h"},
+    "every 8 hours": {"period": "8", "unit": "h"},
+    "every 12 hours": {"period": "12", "unit": "h"},
+    "weekly": {"period": "1", "unit": "wk"},
+    "monthly": {"period": "1", "unit": "mo"},
+    "as needed": None,  # PRN - no fixed frequency
+    "prn": None,
+}
+
+# Number of distinct strings kept per vocabulary
+VOCABULARY_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class RouteCode:
+    """Route of administration parsed from free text."""
+
+    code: Optional[str]
+    text: str
+
+
+@dataclass(frozen=True)
+class Frequency:
+    """Administration frequency parsed from free text."""
+
+    period: Optional[str]
+    unit: Optional[str]
+    prn: bool = False
+
+    @property
+    def known(self) -> bool:
+        """Whether the text mapped to a period or to PRN."""
+        return self.prn or self.period is not None
+
+
+@dataclass(frozen=True)
+class DoseQuantity:
+    """Dose parsed from free text into a PQ value and unit."""
+
+    value: Optional[str]
+    unit: Optional[str]
+    text: str
+
+
+def _parse_route(text: str, codes: Mapping[str, str]) -> RouteCode:
+    return RouteCode(code=codes.get(text.lower()), text=text)
+
+
+def _parse_frequency(text: str, codes: Mapping[str, Optional[Dict[str, str]]]) -> Frequency:
+    key = text.lower()
+    if key not in codes:
+        return Frequency(period=None, unit=None)
+    period = codes[key]
+    if period is None:
+        return Frequency(period=None, unit=None, prn=True)
+    return Frequency(period=period["period"], unit=period["unit"])
+
+
+@lru_cache(maxsize=VOCABULARY_CACHE_SIZE)
+def _cached_route(text: str) -> RouteCode:
+    return _parse_route(text, ROUTE_CODES)
+
+
+@lru_cache(maxsize=VOCABULARY_CACHE_SIZE)
+def _cached_frequency(text: str) -> Frequency:
+    return _parse_frequency(text, FREQUENCY_CODES)
+
+
+# Period used when a frequency is missing or not recognized
+DEFAULT_FREQUENCY = _parse_frequency("daily", FREQUENCY_CODES)
+
+
+def normalize_route(text: str, codes: Optional[Mapping[str, str]] = None) -> RouteCode:
+    """
+    Parse a free-text route of administration.
+
+    Args:
+        text: Route as given (e.g., "Oral", "IV")
+        codes: Route table keyed by lower-cased text (default: ROUTE_CODES)
+
+    Returns:
+        RouteCode with the NCI Thesaurus code, or code None when not recognized
+    """
+    if codes is None or codes is ROUTE_CODES:
+        return _cached_route(text)
+    return _parse_route(text, codes)
+
+
+def normalize_frequency(
+    text: str, codes: Optional[Mapping[str, Optional[Dict[str, str]]]] = None
+) -> Frequency:
+    """
+    Parse a free-text administration frequency.
+
+    Args:
+        text: Frequency as given (e.g., "twice daily", "PRN")
+        codes: Frequency table keyed by lower-cased text (default: FREQUENCY_CODES)
+
+    Returns:
+        Frequency with the PIVL_TS period, a PRN flag, or neither when not recognized
+    """
+    if codes is None or codes is FREQUENCY_CODES:
+        return _cached_frequency(text)
+    return _parse_frequency(text, codes)
+
+
+@lru_cache(maxsize=VOCABULARY_CACHE_SIZE)
+def normalize_dose(text: str) -> DoseQuantity:
+    """
+    Parse a free-text dose such as "10 mg", "2" or "1 tablet".
+
+    The first word is the value when it is numeric; the rest of the text, if
+    any, is the unit.
+
+    Args:
+        text: Dose as given
+
+    Returns:
+        DoseQuantity with value and unit (None when absent or not numeric) and
+        the stripped text
+    """
+    dose = text.strip()
+    parts = dose.split(maxsplit=1)
+    if not parts:
+        return DoseQuantity(value=None, unit=None, text=dose)
+    try:
+        float(parts[0])
+    except ValueError:
+        return DoseQuantity(value=None, unit=None, text=dose)
+    unit = parts[1] if len(parts) == 2 else None
+    return DoseQuantity(value=parts[0], unit=unit, text=dose)
+
+
+# Cached parser of each vocabulary kind
+_NORMALIZERS: Dict[str, Any] = {
+    "route": _cached_route,
+    "frequency": _cached_frequency,
+    "dose": normalize_dose,
+}
+
+
+def warm_vocabulary_cache(path: Union[str, Path]) -> int:
+    """
+    Pre-parse a known vocabulary so a run starts with a warm cache.
+
+    The file is a JSON object with optional "route", "frequency" and "dose"
+    lists of strings, e.g. ``{"route": ["Oral", "IV"], "dose": ["10 mg"]}``.
+
+    Args:
+        path: Path to the vocabulary file
+
+    Returns:
+        Number of strings parsed
+
+    Raises:
+        ValueError: If the file has an unknown key or a non-string entry
+    """
+    vocabulary = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(vocabulary, dict):
+        raise ValueError("Vocabulary file must contain a JSON object")
+    unknown = sorted(set(vocabulary) - set(_NORMALIZERS))
+    if unknown:
+        raise ValueError(f"Unknown vocabulary kinds: {', '.join(unknown)}")
+
+    count = 0
+    for kind, entries in vocabulary.items():
+        normalize = _NORMALIZERS[kind]
+        for entry in entries:
+            if not isinstance(entry, str):
+                raise ValueError(f"{kind} entries must be strings, got {entry!r}")
+            normalize(entry)
+            count += 1
+    return count
+
+
+def vocabulary_cache_info() -> Dict[str, Dict[str, int]]:
+    """
+    Get statistics for the vocabulary caches.
+
+    Returns:
+        Dictionary keyed by "route", "frequency" and "dose", each with hits,
+        misses and current size
+    """
+    stats = {}
+    for kind, normalize in _NORMALIZERS.items():
+        info = normalize.cache_info()
+        stats[kind] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return stats
+
+
+def clear_vocabulary_cache() -> None:
+    """Drop every parsed string and reset the statistics."""
+    for normalize in _NORMALIZERS.values():
+        normalize.cache_clear()
@@ -4,6 +4,17 @@ Provides tools for validating, generating, converting, and comparing C-CDA docum
 Also includes a web UI for interactive document operations.
 """
 
-__all__ = ["app"]
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.cli.__main__ import app
 
-from ccdakit.cli.__main__ import app
+
+# Typer and rich are only imported when the app is actually used
+__getattr__, __dir__ = attach_lazy_imports(__name__, {"app": "ccdakit.cli.__main__"})
+
+
+__all__ = ["app"]
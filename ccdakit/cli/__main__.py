@@ -23,11 +23,29 @@ def validate(
     xsd: bool = typer.Option(True, help="Run XSD schema validation"),
     schematron: bool = typer.Option(True, help="Run Schematron validation"),
     output_format: str = typer.Option("text", help="Output format: text, json, or html"),
+    fail_fast: bool = typer.Option(
+        False, help="Skip Schematron validation when XSD validation fails"
+    ),
+    rules: Optional[str] = typer.Option(
+        None,
+        help="Custom rules to run, as module:attribute (a RulesEngine or list of rules)",
+    ),
+    slowest_rules: int = typer.Option(
+        0, help="Profile the custom rules and print the N slowest", min=0
+    ),
 ) -> None:
     """Validate a C-CDA document using XSD and/or Schematron rules."""
     from ccdakit.cli.commands.validate import validate_command
 
-    validate_command(file_path, xsd=xsd, schematron=schematron, output_format=output_format)
+    validate_command(
+        file_path,
+        xsd=xsd,
+        schematron=schematron,
+        output_format=output_format,
+        fail_fast=fail_fast,
+        rules=rules,
+        slowest_rules=slowest_rules,
+    )
 
 
 @app.command()
@@ -42,11 +60,28 @@ def generate(
     interactive: bool = typer.Option(
         False, "--interactive", "-i", help="Interactive mode with prompts"
     ),
+    count: int = typer.Option(
+        1,
+        "--count",
+        "-n",
+        help="Number of documents; several go to an archive (.zip, .tar.gz, ...), "
+        "container (.jsonl, .jsonl.gz) or directory",
+    ),
+    compress: Optional[str] = typer.Option(
+        None, help="Compress XML files: gzip or xz (archives use their file name)"
+    ),
 ) -> None:
     """Generate a sample C-CDA document for testing."""
     from ccdakit.cli.commands.generate import generate_command
 
-    generate_command(document_type, output=output, sections=sections, interactive=interactive)
+    generate_command(
+        document_type,
+        output=output,
+        sections=sections,
+        interactive=interactive,
+        count=count,
+        compression=compress,
+    )
 
 
 @app.command()
@@ -96,11 +131,14 @@ def from_json(
     input_file: Path = typer.Argument(..., help="Path to JSON file containing C-CDA data"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
     pretty: bool = typer.Option(True, help="Pretty-print the XML output"),
+    compress: Optional[str] = typer.Option(
+        None, help="Compress XML files: gzip or xz (archives use their file name)"
+    ),
 ) -> None:
     """Convert JSON/dictionary data to a C-CDA XML document."""
     from ccdakit.cli.commands.from_json import from_json_command
 
-    from_json_command(input_file, output=output, pretty=pretty)
+    from_json_command(input_file, output=output, pretty=pretty, compression=compress)
 
 
 @app.command()
@@ -140,10 +178,21 @@ def list_code_systems(
 def list_templates(
     template_name: Optional[str] = typer.Argument(None, help="Specific template to show"),
     show_content: bool = typer.Option(False, "--show-content", help="Display the full template content"),
+    oids: bool = typer.Option(
+        False,
+        "--oids",
+        help="List C-CDA template OIDs and the builders that emit them (argument filters by OID)",
+    ),
 ) -> None:
     """List all available document templates."""
-    from ccdakit.cli.commands.list_templates import list_templates_command
-
+    from ccdakit.cli.commands.list_templates import (
+        list_template_oids_command,
+        list_templates_command,
+    )
+
+    if oids:
+        list_template_oids_command(root=template_name)
+        return
     list_templates_command(template_name=template_name, show_content=show_content)
 
 
@@ -6,13 +6,20 @@ from typing import Optional
 
 from lxml import etree
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
+from ccdakit.utils.diff import diff_entries, extract_entries
+
 
 console = Console()
 
 # XML namespaces
 NAMESPACES = {"cda": "urn:hl7-org:v3"}
+SECTION_TAG = "{urn:hl7-org:v3}section"
+
+# Maximum attribute changes listed per entry in reports
+MAX_DETAILS_PER_ENTRY = 10
 
 
 def compare_command(
@@ -71,35 +78,34 @@ def compare_command(
 
 def _extract_comparison_data(root: etree._Element) -> dict:
     """Extract data for comparison."""
-    # Patient info
-    patient_role = root.find(".//cda:recordTarget/cda:patientRole", NAMESPACES)
-    patient = patient_role.find(".//cda:patient", NAMESPACES) if patient_role else None
+    # Patient info (direct child paths avoid rescanning the whole document per field)
+    patient = root.find("cda:recordTarget/cda:patientRole/cda:patient", NAMESPACES)
 
     patient_data = {}
     if patient is not None:
-        name_elem = patient.find(".//cda:name", NAMESPACES)
+        name_elem = patient.find("cda:name", NAMESPACES)
         if name_elem is not None:
-            given = _get_text(name_elem, ".//cda:given")
-            family = _get_text(name_elem, ".//cda:family")
+            given = _get_text(name_elem, "cda:given")
+            family = _get_text(name_elem, "cda:family")
             patient_data["name"] = f"{given} {family}".strip()
 
-        patient_data["gender"] = _get_text(patient, ".//cda:administrativeGenderCode/@displayName")
-        patient_data["birth_date"] = _get_text(patient, ".//cda:birthTime/@value")
+        patient_data["gender"] = _get_text(patient, "cda:administrativeGenderCode/@displayName")
+        patient_data["birth_date"] = _get_text(patient, "cda:birthTime/@value")
 
     # Document metadata
     doc_data = {
-        "title": _get_text(root, ".//cda:title"),
-        "effective_time": _get_text(root, ".//cda:effectiveTime/@value"),
+        "title": _get_text(root, "cda:title"),
+        "effective_time": _get_text(root, "cda:effectiveTime/@value"),
     }
 
     # Sections
     sections = {}
-    component = root.find(".//cda:component/cda:structuredBody", NAMESPACES)
+    component = root.find("cda:component/cda:structuredBody", NAMESPACES)
     if component is not None:
-        for section in component.findall(".//cda:section", NAMESPACES):
-            title = _get_text(section, ".//cda:title")
-            code = _get_text(section, ".//cda:code/@code")
-            entry_count = len(section.findall(".//cda:entry", NAMESPACES))
+        for section in component.iter(SECTION_TAG):
+            title = _get_text(section, "cda:title")
+            code = _get_text(section, "cda:code/@code")
+            entry_count = len(section.findall("cda:entry", NAMESPACES))
             sections[title or code] = {
                 "code": code,
                 "entry_count": entry_count,
@@ -109,6 +115,7 @@ def _extract_comparison_data(root: etree._Element) -> dict:
         "patient": patient_data,
         "document": doc_data,
         "sections": sections,
+        "entries": extract_entries(root),
     }
 
 
@@ -121,6 +128,8 @@ def _compare_documents(data1: dict, data2: dict) -> dict:
         "sections_only_in_1": [],
         "sections_only_in_2": [],
         "common_sections": [],
+        "entry_differences": [],
+        "unchanged_entries": 0,
     }
 
     # Compare patient data
@@ -172,6 +181,27 @@ def _compare_documents(data1: dict, data2: dict) -> dict:
         else:
             comparison["common_sections"].append(section_name)
 
+    # Align and compare individual entries
+    if "entries" in data1 and "entries" in data2:
+        entry_diff = diff_entries(data1["entries"], data2["entries"])
+        comparison["unchanged_entries"] = entry_diff.unchanged_count
+        for change in entry_diff.all_changes:
+            comparison["entry_differences"].append(
+                {
+                    "section": change.section,
+                    "entry": change.label,
+                    "status": change.status,
+                    "details": [
+                        {
+                            "path": c.path,
+                            "file1": c.old if c.old is not None else "N/A",
+                            "file2": c.new if c.new is not None else "N/A",
+                        }
+                        for c in change.changes
+                    ],
+                }
+            )
+
     return comparison
 
 
@@ -238,6 +268,28 @@ def _output_text_comparison(comparison: dict, file1: Path, file2: Path) -> None:
 
         console.print(table)
 
+    # Entry differences
+    if comparison["entry_differences"]:
+        console.print("\n[bold yellow]Entry Differences:[/bold yellow]")
+        markers = {"added": "[green]+[/green]", "removed": "[red]-[/red]", "changed": "[yellow]~[/yellow]"}
+
+        for diff in comparison["entry_differences"]:
+            console.print(
+                f"  {markers[diff['status']]} {diff['status']} "
+                f"{escape(diff['section'])}: {escape(diff['entry'])}"
+            )
+            details = diff["details"]
+            for detail in details[:MAX_DETAILS_PER_ENTRY]:
+                console.print(
+                    f"      {escape(detail['path'])}: "
+                    f"{escape(str(detail['file1']))} → {escape(str(detail['file2']))}"
+                )
+            if len(details) > MAX_DETAILS_PER_ENTRY:
+                console.print(f"      ... {len(details) - MAX_DETAILS_PER_ENTRY} more")
+
+        if comparison["unchanged_entries"]:
+            console.print(f"  {comparison['unchanged_entries']} entries unchanged")
+
     # Common sections
     if comparison["common_sections"]:
         console.print(
@@ -252,6 +304,7 @@ def _output_text_comparison(comparison: dict, file1: Path, file2: Path) -> None:
         + len(comparison["sections_only_in_1"])
         + len(comparison["sections_only_in_2"])
         + len(comparison["section_differences"])
+        + len(comparison.get("entry_differences", []))
     )
 
     if total_diffs == 0:
@@ -340,6 +393,25 @@ def _generate_comparison_html(comparison: dict, file1: Path, file2: Path) -> str
             {% endfor %}
         </table>
         {% endif %}
+
+        {% if comparison.entry_differences %}
+        <h2 class="warning">Entry Differences</h2>
+        <table>
+            <tr><th>Section</th><th>Change</th><th>Entry</th><th>Details</th></tr>
+            {% for diff in comparison.entry_differences %}
+            <tr class="diff-row">
+                <td>{{ diff.section }}</td>
+                <td>{{ diff.status }}</td>
+                <td>{{ diff.entry }}</td>
+                <td>
+                    {% for detail in diff.details %}
+                    <div>{{ detail.path }}: {{ detail.file1 }} &rarr; {{ detail.file2 }}</div>
+                    {% endfor %}
+                </td>
+            </tr>
+            {% endfor %}
+        </table>
+        {% endif %}
     </div>
 </body>
 </html>
@@ -361,7 +433,10 @@ def _get_text(element, xpath: str) -> str:
     try:
         result = element.xpath(xpath, namespaces=NAMESPACES)
         if result:
-            return str(result[0]) if result[0] else ""
+            value = result[0]
+            if isinstance(value, etree._Element):
+                return (value.text or "").strip()
+            return str(value)
     except Exception:
         # Silently ignore XPath errors and return empty string
         return ""
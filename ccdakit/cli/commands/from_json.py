@@ -10,27 +10,59 @@ from rich.console import Console
 
 logger = logging.getLogger(__name__)
 console = Console()
+error_console = Console(stderr=True)
 
 
 def from_json_command(
     input_file: Path,
     output: Optional[Path] = None,
     pretty: bool = True,
+    compression: Optional[str] = None,
 ) -> None:
     """Convert JSON/dictionary data to a C-CDA XML document.
 
+    A JSON list holds several documents, which are written to an archive,
+    container or directory (see ccdakit.utils.sinks.open_sink).
+
     Args:
         input_file: Path to JSON file containing C-CDA data
         output: Output file path (prints to stdout if not specified)
         pretty: Pretty-print the XML output
+        compression: Compress XML files with "gzip" or "xz" (archives and
+            containers take their compression from the file name)
     """
     from ccdakit.utils.converters import DictToCCDAConverter
+    from ccdakit.utils.sinks import (
+        ARCHIVE_SUFFIXES,
+        COMPRESSIONS,
+        compress,
+        compression_of,
+        open_sink,
+    )
 
     try:
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown compression: {compression} (expected one of: {', '.join(COMPRESSIONS)})"
+            )
+
         # Read JSON file
         with open(input_file, "r") as f:
             data = json.load(f)
 
+        # Several documents (or an archive) go through a sink
+        if isinstance(data, list) or (
+            output is not None and str(output).lower().endswith(ARCHIVE_SUFFIXES)
+        ):
+            if output is None:
+                raise ValueError("Writing several documents needs --output")
+            records = data if isinstance(data, list) else [data]
+            with open_sink(output, compression=compression, pretty=pretty) as sink:
+                for document in DictToCCDAConverter.from_dicts(records):
+                    sink.write(document)
+            console.print(f"[green]✓[/green] {sink.count} C-CDA documents written to: {output}")
+            return
+
         # Convert to C-CDA
         converter = DictToCCDAConverter()
         document = converter.from_dict(data)
@@ -40,18 +72,20 @@ def from_json_command(
 
         # Output
         if output:
-            output.write_text(xml_string)
+            if compression is not None and not output.name.endswith(COMPRESSIONS[compression]):
+                output = output.with_name(output.name + COMPRESSIONS[compression])
+            output.write_bytes(compress(xml_string.encode("utf-8"), compression_of(output)))
             console.print(f"[green]✓[/green] C-CDA document written to: {output}")
         else:
             console.print(xml_string)
 
     except FileNotFoundError:
-        console.print(f"[red]Error:[/red] File not found: {input_file}", err=True)
+        error_console.print(f"[red]Error:[/red] File not found: {input_file}")
         raise typer.Exit(1)
     except json.JSONDecodeError as e:
-        console.print(f"[red]Error:[/red] Invalid JSON: {e}", err=True)
+        error_console.print(f"[red]Error:[/red] Invalid JSON: {e}")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}", err=True)
+        error_console.print(f"[red]Error:[/red] {e}")
         logger.exception("Failed to convert JSON to C-CDA")
         raise typer.Exit(1)
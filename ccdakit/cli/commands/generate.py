@@ -12,6 +12,7 @@ from rich.prompt import Prompt
 from rich.table import Table
 
 from ccdakit.builders.documents import ContinuityOfCareDocument, DischargeSummary
+from ccdakit.utils.sinks import ARCHIVE_SUFFIXES, COMPRESSIONS, compress, compression_of, open_sink
 
 
 console = Console()
@@ -75,15 +76,21 @@ def generate_command(
     output: Path | None = None,
     sections: str | None = None,
     interactive: bool = False,
+    count: int = 1,
+    compression: str | None = None,
 ) -> None:
     """
     Generate a sample C-CDA document.
 
     Args:
         document_type: Type of document to generate (ccd, discharge-summary)
-        output: Output file path
+        output: Output file path (an archive, container or directory when
+            generating several documents)
         sections: Comma-separated list of sections to include
         interactive: Whether to use interactive mode
+        count: Number of documents to generate
+        compression: Compress XML files with "gzip" or "xz" (archives and
+            containers take their compression from the file name)
     """
     # Validate document type
     if document_type not in DOCUMENT_TYPES:
@@ -91,6 +98,15 @@ def generate_command(
         console.print(f"Available types: {', '.join(DOCUMENT_TYPES.keys())}")
         sys.exit(1)
 
+    if compression is not None and compression not in COMPRESSIONS:
+        console.print(f"[red]Error:[/red] Unknown compression: {compression}")
+        console.print(f"Available compressions: {', '.join(COMPRESSIONS)}")
+        sys.exit(1)
+
+    if count < 1:
+        console.print("[red]Error:[/red] --count must be at least 1")
+        sys.exit(1)
+
     # Check if faker is installed
     try:
         import importlib.util
@@ -135,6 +151,18 @@ def generate_command(
         else:
             sections_to_include = []
 
+    # Determine output path
+    if output is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = Path(
+            f"{document_type}_{timestamp}" if count > 1 else f"{document_type}_{timestamp}.xml"
+        )
+
+    # Several documents (or an archive) go through a sink
+    if count > 1 or str(output).lower().endswith(ARCHIVE_SUFFIXES):
+        _generate_batch(document_type, sections_to_include, output, count, compression)
+        return
+
     # Generate the document
     console.print("\n[bold]Generating test data...[/bold]")
     try:
@@ -147,14 +175,11 @@ def generate_command(
         traceback.print_exc()
         sys.exit(1)
 
-    # Determine output path
-    if output is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output = Path(f"{document_type}_{timestamp}.xml")
-
-    # Write to file
+    # Write to file, compressed if asked for or if the file name says so
+    if compression is not None and not output.name.endswith(COMPRESSIONS[compression]):
+        output = output.with_name(output.name + COMPRESSIONS[compression])
     try:
-        output.write_text(xml_string)
+        output.write_bytes(compress(xml_string.encode("utf-8"), compression_of(output)))
         console.print("\n[green]✓[/green] Document generated successfully!")
         console.print(f"[green]Output:[/green] {output.absolute()}")
 
@@ -166,6 +191,29 @@ def generate_command(
         sys.exit(1)
 
 
+def _generate_batch(
+    document_type: str,
+    sections_to_include: list[str],
+    output: Path,
+    count: int,
+    compression: str | None,
+) -> None:
+    """Generate several documents into an archive, container or directory."""
+    console.print(f"\n[bold]Generating {count} documents...[/bold]")
+    try:
+        with open_sink(output, compression=compression, pretty=True) as sink:
+            for _ in range(count):
+                doc = _generate_document(document_type, sections_to_include)
+                sink.write(doc)
+    except Exception as e:
+        console.print(f"[red]Error generating documents:[/red] {e}")
+        sys.exit(1)
+
+    console.print(f"\n[green]✓[/green] {count} documents generated successfully!")
+    console.print(f"[green]Output:[/green] {output.absolute()}")
+    _show_document_summary(doc, sections_to_include)
+
+
 def _interactive_section_selection() -> list[str]:
     """Interactively select sections to include."""
     console.print("\n[bold]Select sections to include:[/bold]")
@@ -105,3 +105,43 @@ def list_templates_command(
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
+
+
+def list_template_oids_command(root: Optional[str] = None) -> None:
+    """
+    List C-CDA template OIDs and the builders that emit them.
+
+    Args:
+        root: Only show this template OID
+    """
+    from ccdakit.core.templates import load_builders, template_registry
+
+    load_builders()
+    if root:
+        usages = template_registry.find(root)
+        if not usages:
+            console.print(f"[red]No builder emits template '{root}'[/red]")
+            sys.exit(1)
+        index = {root: usages}
+    else:
+        index = template_registry.index()
+
+    # Plain lines rather than a table: OIDs and builder paths must never be
+    # cropped, whatever the terminal width
+    console.print("\n[bold cyan]C-CDA Templates by Builder[/bold cyan]")
+    for template_root, usages in index.items():
+        console.print(f"\n[cyan]{template_root}[/cyan]", soft_wrap=True)
+        for usage in usages:
+            line = (
+                f"  [green]R{usage.version.value}[/green]"
+                f"  [yellow]{usage.extension or '-'}[/yellow]"
+                f"  {usage.builder_name.replace('ccdakit.builders.', '')}"
+            )
+            if usage.nested:
+                line += f"  [dim]({usage.nested})[/dim]"
+            console.print(line, soft_wrap=True)
+
+    count = sum(len(usages) for usages in index.values())
+    console.print(
+        f"\n[bold green]Total:[/bold green] {len(index)} template OID(s), {count} builder usage(s)\n"
+    )
@@ -1,26 +1,43 @@
 """Validate command implementation."""
 
+import importlib
 import json
 import sys
 from pathlib import Path
+from typing import Optional
 
+from lxml import etree
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from ccdakit.core.validation import ValidationLevel, ValidationResult
 from ccdakit.validators import SchematronValidator, XSDValidator
+from ccdakit.validators.pipeline import PARSE_STAGE, ValidationPipeline
+from ccdakit.validators.rules import RulesEngine
 from ccdakit.validators.utils import get_default_schema_path
 
 
 console = Console()
 
 
+# Display names of the pipeline stages run by the validate command
+STAGE_TITLES = {
+    PARSE_STAGE: "XML Parse",
+    "xsd": "XSD",
+    "schematron": "Schematron",
+    "rules": "Custom Rules",
+}
+
+
 def validate_command(
     file_path: Path,
     xsd: bool = True,
     schematron: bool = True,
     output_format: str = "text",
+    fail_fast: bool = False,
+    rules: Optional[str] = None,
+    slowest_rules: int = 0,
 ) -> None:
     """
     Validate a C-CDA document.
@@ -30,6 +47,10 @@ def validate_command(
         xsd: Whether to run XSD validation
         schematron: Whether to run Schematron validation
         output_format: Output format (text, json, html)
+        fail_fast: Skip Schematron validation when XSD validation fails
+        rules: Custom rules to run, as "module:attribute" naming a
+            RulesEngine, a list of rules, or a function returning either
+        slowest_rules: Profile the custom rules and print the N slowest
     """
     # Validate file exists
     if not file_path.exists():
@@ -48,26 +69,39 @@ def validate_command(
         )
     )
 
-    # Store all results
-    all_results = {}
+    engine = None
+    if rules:
+        engine = _load_rules_engine(rules)
+        engine.profile = engine.profile or slowest_rules > 0
+    elif slowest_rules:
+        console.print("[yellow]--slowest-rules has no effect without --rules[/yellow]")
 
-    # Run XSD validation
+    # The document is parsed once and shared by all stages
+    pipeline = ValidationPipeline(fail_fast=fail_fast)
     if xsd:
         console.print("\n[bold]Running XSD Schema Validation...[/bold]")
-        xsd_result = _run_xsd_validation(file_path)
-        all_results["xsd"] = xsd_result
-
-        if output_format == "text":
-            _print_validation_result(xsd_result, "XSD")
-
-    # Run Schematron validation
+        pipeline.add_stage("xsd", _run_xsd_validation, gate=True)
     if schematron:
         console.print("\n[bold]Running Schematron Validation...[/bold]")
-        schematron_result = _run_schematron_validation(file_path)
-        all_results["schematron"] = schematron_result
+        pipeline.add_stage("schematron", _run_schematron_validation)
+    if engine is not None:
+        console.print(f"\n[bold]Running {len(engine)} Custom Rules...[/bold]")
+        pipeline.add_stage("rules", engine)
+
+    try:
+        stage_results = pipeline.run_stages(file_path)
+    except Exception as e:
+        console.print(f"[red]Validation Error:[/red] {e}")
+        sys.exit(1)
+
+    # Only report the parse stage when the document could not be parsed
+    parse_result = stage_results.pop(PARSE_STAGE)
+    all_results = {PARSE_STAGE: parse_result} if not parse_result.is_valid else {}
+    all_results.update(stage_results)
 
-        if output_format == "text":
-            _print_validation_result(schematron_result, "Schematron")
+    if output_format == "text":
+        for name, result in all_results.items():
+            _print_validation_result(result, STAGE_TITLES.get(name, name))
 
     # Output in requested format
     if output_format == "json":
@@ -77,14 +111,48 @@ def validate_command(
 
     # Print summary
     _print_summary(all_results)
+    if engine is not None and slowest_rules > 0:
+        _print_slowest_rules(engine, slowest_rules)
 
     # Exit with error code if validation failed
     if any(not result.is_valid for result in all_results.values()):
         sys.exit(1)
 
 
-def _run_xsd_validation(file_path: Path) -> ValidationResult:
-    """Run XSD validation with automatic schema download."""
+def _load_rules_engine(spec: str) -> RulesEngine:
+    """
+    Import custom rules given as "module:attribute".
+
+    The attribute (default "engine") may be a RulesEngine, a list of
+    ValidationRule objects, or a function returning either. Exits with an
+    error message if it cannot be loaded.
+    """
+    module_name, _, attribute = spec.partition(":")
+    # Like other "module:attribute" loaders, look in the working directory
+    # first, but only while loading the rules
+    added = "" not in sys.path
+    if added:
+        sys.path.insert(0, "")
+    try:
+        target = getattr(importlib.import_module(module_name), attribute or "engine")
+        if callable(target) and not isinstance(target, RulesEngine):
+            target = target()
+        if isinstance(target, RulesEngine):
+            return target
+        engine = RulesEngine()
+        for rule in target:
+            engine.add_rule(rule)
+        return engine
+    except Exception as e:
+        console.print(f"[red]Error:[/red] Cannot load rules from {spec!r}: {e}")
+        sys.exit(1)
+    finally:
+        if added:
+            sys.path.remove("")
+
+
+def _run_xsd_validation(document: etree._Element) -> ValidationResult:
+    """Run XSD validation of a parsed document with automatic schema download."""
     try:
         from ccdakit.validators.xsd_downloader import XSDDownloader
 
@@ -141,7 +209,7 @@ def _run_xsd_validation(file_path: Path) -> ValidationResult:
             return result
 
         validator = XSDValidator(schema_path)
-        return validator.validate(file_path)
+        return validator.validate(document)
 
     except Exception as e:
         console.print(f"[red]XSD Validation Error:[/red] {e}")
@@ -161,12 +229,12 @@ def _run_xsd_validation(file_path: Path) -> ValidationResult:
         return result
 
 
-def _run_schematron_validation(file_path: Path) -> ValidationResult:
-    """Run Schematron validation."""
+def _run_schematron_validation(document: etree._Element) -> ValidationResult:
+    """Run Schematron validation of a parsed document."""
     try:
         # Use default schematron (auto-downloads if needed)
         validator = SchematronValidator()
-        return validator.validate(file_path)
+        return validator.validate(document)
 
     except Exception as e:
         console.print(f"[red]Schematron Validation Error:[/red] {e}")
@@ -188,12 +256,16 @@ def _run_schematron_validation(file_path: Path) -> ValidationResult:
 
 def _print_validation_result(result: ValidationResult, validator_name: str) -> None:
     """Print validation result in a nice table format."""
+    if result.skipped:
+        console.print(f"[dim]-[/dim] {validator_name} validation skipped")
+        return
+
     if result.is_valid and not result.has_warnings:
         console.print(f"[green]✓[/green] {validator_name} validation passed!")
         return
 
     # Create table for issues
-    table = Table(show_header=True, header_style="bold")
+    table = Table(title=f"{validator_name} Validation", show_header=True, header_style="bold")
     table.add_column("Level", style="bold", width=10)
     table.add_column("Location", style="dim", width=30)
     table.add_column("Message", width=70)
@@ -328,6 +400,27 @@ def _output_html(results: dict, file_path: Path) -> None:
     console.print(f"\n[green]HTML report saved to:[/green] {output_path}")
 
 
+def _print_slowest_rules(engine: RulesEngine, count: int) -> None:
+    """Print the custom rules that took the most time."""
+    table = Table(title=f"Slowest Rules (top {count})", show_header=True, header_style="bold")
+    table.add_column("Rule", style="bold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    table.add_column("Issues", justify="right")
+
+    for name, stats in engine.slowest_rules(count):
+        table.add_row(
+            name,
+            str(stats.calls),
+            f"{stats.total_time * 1000:.2f}",
+            f"{stats.max_time * 1000:.2f}",
+            str(stats.issues),
+        )
+
+    console.print(table)
+
+
 def _print_summary(results: dict) -> None:
     """Print validation summary."""
     console.print("\n" + "=" * 60)
@@ -338,9 +431,17 @@ def _print_summary(results: dict) -> None:
     total_warnings = sum(len(r.warnings) for r in results.values())
 
     for name, result in results.items():
+        if result.skipped:
+            console.print(f"{name.upper()}: [dim]SKIPPED[/dim]")
+            continue
         status = "[green]PASSED[/green]" if result.is_valid else "[red]FAILED[/red]"
         console.print(f"{name.upper()}: {status}")
         console.print(f"  Errors: {len(result.errors)}, Warnings: {len(result.warnings)}")
+        for timing in result.timings:
+            console.print(
+                f"  Time: {timing.wall_time:.3f}s wall, {timing.cpu_time:.3f}s CPU",
+                style="dim",
+            )
 
     console.print("\n" + "=" * 60)
     if total_errors == 0:
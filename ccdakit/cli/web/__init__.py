@@ -1,6 +1,20 @@
 """Web UI for ccdakit."""
 
-from ccdakit.cli.web.app import create_app
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.cli.web.app import create_app
+
+
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        "create_app": "ccdakit.cli.web.app",
+    },
+)
 
 
 __all__ = ["create_app"]
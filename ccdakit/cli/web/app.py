@@ -8,6 +8,7 @@ from typing import Optional
 from flask import Flask, jsonify, render_template, request
 
 from ccdakit.cli.commands.compare import _compare_documents, _extract_comparison_data
+from ccdakit.validators.pipeline import PARSE_STAGE, ValidationPipeline
 from ccdakit.validators.schematron import SchematronValidator
 from ccdakit.validators.xsd import XSDValidator
 
@@ -83,15 +84,7 @@ def create_app() -> Flask:
         else:
             return jsonify({"error": "No file or content provided"}), 400
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as tmp:
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
-
         try:
-            # Run validation
-            results = {}
-
             # Check if validators are enabled (checkboxes send "on" when checked)
             run_xsd = request.form.get("xsd") == "on"
             run_schematron = request.form.get("schematron") == "on"
@@ -109,26 +102,30 @@ def create_app() -> Flask:
                 run_schematron = True
                 logger.debug("No validators specified, running both by default")
 
+            # Parse the upload once; XSD and Schematron run side by side on the
+            # shared tree unless fail-fast makes Schematron wait for XSD
+            pipeline = ValidationPipeline(
+                fail_fast=request.form.get("fail_fast") == "on", concurrent=True
+            )
             if run_xsd:
-                logger.debug("Running XSD validation...")
-                validator = get_xsd_validator()
-                xsd_result = validator.validate(tmp_path)
-                results["xsd"] = xsd_result.to_dict()
-                logger.debug(
-                    "XSD validation complete: valid=%s, errors=%d",
-                    xsd_result.is_valid,
-                    len(xsd_result.errors),
-                )
-
+                pipeline.add_stage("xsd", get_xsd_validator().validate, gate=True)
             if run_schematron:
-                logger.debug("Running Schematron validation...")
-                validator = get_schematron_validator()
-                schematron_result = validator.validate(tmp_path)
-                results["schematron"] = schematron_result.to_dict()
+                pipeline.add_stage("schematron", get_schematron_validator().validate)
+
+            logger.debug("Running validation stages: %s", ", ".join(pipeline.stage_names))
+            stage_results = pipeline.run_stages(content)
+
+            # Report parse failures as their own result; omit stages that never ran
+            results = {}
+            for name, result in stage_results.items():
+                if result.skipped or (name == PARSE_STAGE and result.is_valid):
+                    continue
+                results[name] = result.to_dict()
                 logger.debug(
-                    "Schematron validation complete: valid=%s, errors=%d",
-                    schematron_result.is_valid,
-                    len(schematron_result.errors),
+                    "%s validation complete: valid=%s, errors=%d",
+                    name,
+                    result.is_valid,
+                    len(result.errors),
                 )
 
             logger.debug("Returning %d validation results", len(results))
@@ -138,10 +135,6 @@ def create_app() -> Flask:
             logger.exception("Validation error: %s", e)
             return jsonify({"error": str(e)}), 500
 
-        finally:
-            # Clean up temp file
-            tmp_path.unlink(missing_ok=True)
-
     @app.route("/api/generate", methods=["POST"])
     def api_generate():
         """Generate a sample C-CDA document."""
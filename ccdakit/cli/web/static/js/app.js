@@ -183,6 +183,10 @@ async function validateDocument(event) {
             html += `<h3>${validator.toUpperCase()} Validation</h3>`;
             html += `<p><strong>Status:</strong> ${result.is_valid ? '✅ PASSED' : '❌ FAILED'}</p>`;
             html += `<p><strong>Errors:</strong> ${result.error_count} | <strong>Warnings:</strong> ${result.warning_count}</p>`;
+            if (result.timings && result.timings.length > 0) {
+                const seconds = result.timings.reduce((total, timing) => total + timing.wall_time, 0);
+                html += `<p><strong>Time:</strong> ${seconds.toFixed(2)} s</p>`;
+            }
 
             if (result.errors && result.errors.length > 0) {
                 html += '<h4>Errors:</h4>';
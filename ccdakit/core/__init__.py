@@ -1,9 +1,20 @@
 """Core infrastructure for ccdakit."""
 
-from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.base import BuildProfile, CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.build_validation import BuildValidation
+from ccdakit.core.cache import HeaderCache, SectionCache, compute_fingerprint
+from ccdakit.core.canonical import (
+    CanonicalDocument,
+    SequentialIds,
+    canonical_build,
+    canonicalize,
+)
 from ccdakit.core.config import CDAConfig, OrganizationInfo, configure, get_config, reset_config
 from ccdakit.core.null_flavor import NullFlavor, get_null_flavor_for_missing, is_null_flavor
+from ccdakit.core.templates import TemplateRegistry, TemplateUsage, template_registry
 from ccdakit.core.validation import (
+    RuleStats,
+    StageTiming,
     ValidationError,
     ValidationIssue,
     ValidationLevel,
@@ -15,7 +26,21 @@ __all__ = [
     # Base classes
     "CDAElement",
     "CDAVersion",
+    "BuildProfile",
     "TemplateConfig",
+    # Template registry
+    "TemplateRegistry",
+    "TemplateUsage",
+    "template_registry",
+    # Section and header caching
+    "SectionCache",
+    "HeaderCache",
+    "compute_fingerprint",
+    # Deterministic builds and content hashes
+    "canonical_build",
+    "canonicalize",
+    "CanonicalDocument",
+    "SequentialIds",
     # Configuration
     "CDAConfig",
     "OrganizationInfo",
@@ -27,6 +52,9 @@ __all__ = [
     "ValidationIssue",
     "ValidationResult",
     "ValidationError",
+    "StageTiming",
+    "RuleStats",
+    "BuildValidation",
     # Null flavors
     "NullFlavor",
     "get_null_flavor_for_missing",
@@ -2,10 +2,13 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, Optional
 
 from lxml import etree
 
+from ccdakit.core.templates import append_templates, template_registry
+
 
 if TYPE_CHECKING:
     from ccdakit.validators.xsd import XSDValidator
@@ -20,6 +23,24 @@ class CDAVersion(Enum):
     R3_0 = "3.0"  # Planned
 
 
+class BuildProfile(Enum):
+    """Which parts of a section builders generate."""
+
+    FULL = "full"
+    STRUCTURED_ONLY = "structured-only"  # Minimal narrative stub, all entries
+    NARRATIVE_ONLY = "narrative-only"  # Narrative, entries only where required
+
+    @property
+    def includes_narrative(self) -> bool:
+        """Whether narrative <text> blocks are generated."""
+        return self is not BuildProfile.STRUCTURED_ONLY
+
+    @property
+    def includes_entries(self) -> bool:
+        """Whether structured entries are generated."""
+        return self is not BuildProfile.NARRATIVE_ONLY
+
+
 class TemplateConfig:
     """Template identifier configuration."""
 
@@ -31,6 +52,7 @@ class TemplateConfig:
         root: str,
         extension: Optional[str] = None,
         description: Optional[str] = None,
+        entries_required: bool = False,
     ) -> None:
         """
         Initialize template configuration.
@@ -39,10 +61,13 @@ class TemplateConfig:
             root: Template OID
             extension: Version extension (e.g., '2015-08-01')
             description: Human-readable description
+            entries_required: Whether the template requires entries (dropped
+                from sections built without entries)
         """
         self.root = root
         self.extension = extension
         self.description = description
+        self.entries_required = entries_required
 
     def to_element(self) -> etree._Element:
         """
@@ -64,13 +89,31 @@ class CDAElement(ABC):
     All builders inherit from this class and implement the build() method.
     """
 
+    __slots__ = ("version", "schema", "profile", "_released")
+
     # Subclasses override with version-specific templates
     TEMPLATES: "dict[CDAVersion, List[TemplateConfig]]" = {}
 
+    # Templates of structures a builder writes inline rather than through another
+    # builder (e.g. the concern act around a problem observation), keyed by name
+    NESTED_TEMPLATES: "dict[str, dict[CDAVersion, List[TemplateConfig]]]" = {}
+
+    # Attributes that do not affect the built XML (ignored by fingerprint())
+    FINGERPRINT_EXCLUDE: "frozenset[str]" = frozenset({"schema"})
+
+    # Sections whose templates require entries keep them in narrative-only builds
+    ENTRIES_REQUIRED: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Compile the subclass's templateId tables into the template registry."""
+        super().__init_subclass__(**kwargs)
+        template_registry.register(cls)
+
     def __init__(
         self,
         version: CDAVersion = CDAVersion.R2_1,
         schema: Optional["XSDValidator"] = None,
+        profile: Optional[BuildProfile] = None,
     ) -> None:
         """
         Initialize CDA element.
@@ -78,9 +121,12 @@ class CDAElement(ABC):
         Args:
             version: C-CDA version to generate
             schema: Optional XSD validator
+            profile: Build profile (default: FULL, or STRUCTURED_ONLY when
+                CDAConfig.include_narrative is False)
         """
         self.version = version
         self.schema = schema
+        self.profile = profile
 
     @abstractmethod
     def build(self) -> etree._Element:
@@ -103,7 +149,12 @@ class CDAElement(ABC):
 
         Raises:
             etree.DocumentInvalid: If validation fails
+            RuntimeError: If the builder was released by consume()
         """
+        if getattr(self, "_released", False):
+            raise RuntimeError(
+                f"{self.__class__.__name__} was released by consume() and cannot be built again"
+            )
         element = self.build()
 
         if self.schema:
@@ -111,6 +162,72 @@ class CDAElement(ABC):
 
         return element
 
+    def consume(self) -> etree._Element:
+        """
+        Build element, then release the builder's inputs.
+
+        Meant for long-lived batch workers: a builder kept around after its
+        build no longer holds the protocol objects (or nested builders) it was
+        given, so they can be garbage collected.
+
+        Returns:
+            lxml Element representing this CDA component
+        """
+        element = self.to_element()
+        self.release()
+        return element
+
+    def release(self) -> None:
+        """
+        Drop references to input data, releasing nested builders too.
+
+        Everything except version, schema and profile is dropped; the builder
+        cannot be built again afterwards.
+        """
+        for name in _input_attributes(self):
+            value = getattr(self, name, None)
+            if isinstance(value, CDAElement):
+                value.release()
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    if isinstance(item, CDAElement):
+                        item.release()
+            delattr(self, name)
+        self._released = True
+
+    def bind(self, **inputs) -> "CDAElement":
+        """
+        Replace input data, keeping version, profile and every other option.
+
+        Lets one builder be reused across patients instead of constructing a
+        new one per document. Values are stored as given, so pass an empty
+        list rather than None for "no items".
+
+        Args:
+            **inputs: New values for the builder's inputs, by name (e.g.
+                ``problems=[...]`` for ProblemsSection)
+
+        Returns:
+            The builder itself
+
+        Raises:
+            TypeError: If a name is not one of the builder's inputs
+            RuntimeError: If the builder was released by consume()
+        """
+        if getattr(self, "_released", False):
+            raise RuntimeError(
+                f"{self.__class__.__name__} was released by consume() and cannot be rebound"
+            )
+        slots = _slot_inputs(type(self))
+        for name in inputs:
+            if name not in slots and (
+                name.startswith("_") or name not in getattr(self, "__dict__", ())
+            ):
+                raise TypeError(f"{self.__class__.__name__} has no input {name!r}")
+        for name, value in inputs.items():
+            setattr(self, name, value)
+        return self
+
     def to_string(self, pretty: bool = True, encoding: str = "unicode") -> str:
         """
         Convert to XML string.
@@ -128,10 +245,54 @@ class CDAElement(ABC):
             encoding=encoding,  # type: ignore
         )
 
+    def fingerprint(self) -> str:
+        """
+        Compute a stable fingerprint of this builder's inputs.
+
+        Two builders with equal fingerprints produce equivalent XML (apart from
+        generated ids and timestamps), which lets SectionCache reuse subtrees.
+
+        Returns:
+            Hex digest of builder class, version, and input data
+        """
+        from ccdakit.core.cache import compute_fingerprint
+
+        return compute_fingerprint(self)
+
+    @property
+    def build_profile(self) -> BuildProfile:
+        """
+        Get the effective build profile.
+
+        Returns:
+            Explicit profile, or one derived from CDAConfig.include_narrative
+        """
+        if self.profile is not None:
+            return self.profile
+        from ccdakit.core.config import get_config_or_none
+
+        config = get_config_or_none()
+        if config is not None and not config.include_narrative:
+            return BuildProfile.STRUCTURED_ONLY
+        return BuildProfile.FULL
+
+    @property
+    def include_narrative(self) -> bool:
+        """Whether section builders generate the full narrative."""
+        return self.build_profile.includes_narrative
+
+    @property
+    def include_entries(self) -> bool:
+        """Whether section builders generate structured entries."""
+        return self.ENTRIES_REQUIRED or self.build_profile.includes_entries
+
     def get_templates(self) -> List[TemplateConfig]:
         """
         Get templateIds for current version.
 
+        When entries are omitted, templates with entries_required are dropped
+        so the section claims only its entries-optional variant.
+
         Returns:
             List of TemplateConfig for this version
 
@@ -142,14 +303,69 @@ class CDAElement(ABC):
             raise ValueError(
                 f"Version {self.version.value} not supported for {self.__class__.__name__}"
             )
-        return self.TEMPLATES[self.version]
-
-    def add_template_ids(self, parent: etree._Element) -> None:
+        templates = self.TEMPLATES[self.version]
+        if not self.include_entries:
+            optional = [t for t in templates if not t.entries_required]
+            if optional:
+                return optional
+        return templates
+
+    def add_template_ids(self, parent: etree._Element, nested: Optional[str] = None) -> None:
         """
         Add all templateIds for current version to parent element.
 
+        The templateIds are cloned from elements prebuilt once per class by
+        the template registry.
+
         Args:
             parent: Parent element to add templateIds to
+            nested: NESTED_TEMPLATES key, to add the templates of an inline
+                structure instead of the builder's own
+
+        Raises:
+            ValueError: If version not supported
         """
-        for template in self.get_templates():
-            parent.append(template.to_element())
+        cls = type(self)
+        if nested is None and cls.get_templates is not CDAElement.get_templates:
+            # Subclass computes its own templates; build them as before
+            for template in self.get_templates():
+                parent.append(template.to_element())
+            return
+
+        compiled = template_registry.compiled(cls)
+        prototypes = compiled.prototypes(
+            self.version, self.include_entries if nested is None else True, nested
+        )
+        if prototypes is None:
+            name = cls.__name__ if nested is None else f"{cls.__name__} {nested}"
+            raise ValueError(f"Version {self.version.value} not supported for {name}")
+        append_templates(parent, prototypes)
+
+
+@lru_cache(maxsize=None)
+def _slot_inputs(cls: type) -> "frozenset[str]":
+    """Public slot names a builder class declares below CDAElement."""
+    names = set()
+    for klass in cls.__mro__:
+        if klass is CDAElement:
+            break
+        slots = klass.__dict__.get("__slots__", ())
+        names.update((slots,) if isinstance(slots, str) else slots)
+    return frozenset(name for name in names if not name.startswith("_"))
+
+
+def _input_attributes(builder: CDAElement) -> List[str]:
+    """Names of a builder's attributes set by subclasses (its inputs and options)."""
+    names = list(getattr(builder, "__dict__", ()))
+    for cls in type(builder).__mro__:
+        if cls is CDAElement:
+            break
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(
+            name
+            for name in slots
+            if name not in ("__dict__", "__weakref__") and hasattr(builder, name)
+        )
+    return names
@@ -0,0 +1,199 @@
+"""Deferred, single-pass schema validation of built documents.
+
+Attaching a schema to individual builders validates every subtree as it is
+built, and a bare section is not a valid CDA document on its own anyway.
+BuildValidation instead validates the finished ClinicalDocument once, and can
+thin that further for production batches: validate only one document in N,
+or only the sections whose inputs changed since they last passed.
+
+Example:
+    validation = BuildValidation(XSDValidator(), sample_every=10)
+    for patient in patients:
+        doc = ClinicalDocument(patient, author, custodian, sections=..., build_validation=validation)
+        doc.to_xml_string()  # raises ValidationError if a sampled document is invalid
+    print(validation.stats())
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+from lxml import etree
+
+from ccdakit.core.validation import ValidationResult
+
+
+NS = "urn:hl7-org:v3"
+
+_STRUCTURED_BODY = f"{{{NS}}}component/{{{NS}}}structuredBody"
+_COMPONENT = f"{{{NS}}}component"
+
+
+class BuildValidation:
+    """
+    Validation strategy applied to finished documents.
+
+    Counters (see stats()) record how many documents and sections were
+    validated versus skipped, so the savings of sampling and
+    changed-sections-only runs are visible.
+    """
+
+    def __init__(
+        self,
+        validator: Any,
+        sample_every: int = 1,
+        changed_sections_only: bool = False,
+        raise_on_error: bool = True,
+        max_tracked_sections: int = 4096,
+    ) -> None:
+        """
+        Initialize build validation.
+
+        Args:
+            validator: Object with a validate(element) method returning a
+                ValidationResult (XSDValidator, ValidationPipeline, ...)
+            sample_every: Validate one document in every N built (1 = all)
+            changed_sections_only: Leave out of validation the sections whose
+                fingerprint already passed in an earlier document. The header
+                is always validated; when no section changed, the first one is
+                kept because a structuredBody needs at least one component.
+            raise_on_error: Raise ValidationError for invalid documents
+                (otherwise the result is only returned and counted)
+            max_tracked_sections: Number of passed section fingerprints remembered
+
+        Raises:
+            ValueError: If sample_every or max_tracked_sections is less than 1
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        if max_tracked_sections < 1:
+            raise ValueError("max_tracked_sections must be at least 1")
+        self.validator = validator
+        self.sample_every = sample_every
+        self.changed_sections_only = changed_sections_only
+        self.raise_on_error = raise_on_error
+        self.max_tracked_sections = max_tracked_sections
+        self._passed_sections: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._built = 0
+        self.documents_validated = 0
+        self.documents_skipped = 0
+        self.documents_failed = 0
+        self.sections_validated = 0
+        self.sections_skipped = 0
+
+    def check(
+        self,
+        document: etree._Element,
+        section_keys: Optional[Sequence[str]] = None,
+    ) -> Optional[ValidationResult]:
+        """
+        Validate a finished document, unless sampling skips it.
+
+        Args:
+            document: Built ClinicalDocument element
+            section_keys: Fingerprints of the document's sections, in body
+                order (needed for changed_sections_only)
+
+        Returns:
+            ValidationResult, or None if the document was skipped
+
+        Raises:
+            ValidationError: If the document is invalid and raise_on_error is set
+            ValueError: If section_keys does not match the document's sections
+        """
+        with self._lock:
+            sampled = self._built % self.sample_every == 0
+            self._built += 1
+            if not sampled:
+                self.documents_skipped += 1
+                return None
+
+        body = document.find(_STRUCTURED_BODY)
+        components = body.findall(_COMPONENT) if body is not None else []
+        keep = set(range(len(components)))
+        if self.changed_sections_only and section_keys is not None and components:
+            if len(section_keys) != len(components):
+                raise ValueError(
+                    f"Got {len(section_keys)} section keys for {len(components)} sections"
+                )
+            with self._lock:
+                keep = {i for i, key in enumerate(section_keys) if key not in self._passed_sections}
+            keep = keep or {0}
+
+        result = self._validate(document, body, components, keep)
+
+        with self._lock:
+            self.documents_validated += 1
+            self.sections_validated += len(keep)
+            self.sections_skipped += len(components) - len(keep)
+            if not result.is_valid:
+                self.documents_failed += 1
+            elif self.changed_sections_only and section_keys is not None:
+                for index in keep:
+                    self._remember(section_keys[index])
+
+        if self.raise_on_error:
+            result.raise_if_invalid()
+        return result
+
+    def _validate(
+        self,
+        document: etree._Element,
+        body: Optional[etree._Element],
+        components: Sequence[etree._Element],
+        keep: set,
+    ) -> ValidationResult:
+        """Validate document with only the kept section components attached."""
+        if body is None or len(keep) == len(components):
+            return self.validator.validate(document)
+
+        for index, component in enumerate(components):
+            if index not in keep:
+                body.remove(component)
+        try:
+            return self.validator.validate(document)
+        finally:
+            # Re-append every component in its original order
+            for component in components:
+                body.append(component)
+
+    def _remember(self, key: str) -> None:
+        """Record a section fingerprint that passed validation (lock must be held)."""
+        self._passed_sections[key] = None
+        self._passed_sections.move_to_end(key)
+        while len(self._passed_sections) > self.max_tracked_sections:
+            self._passed_sections.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get validation counters.
+
+        Returns:
+            Dictionary with documents validated, skipped and failed, and
+            sections validated and skipped
+        """
+        with self._lock:
+            return {
+                "documents_validated": self.documents_validated,
+                "documents_skipped": self.documents_skipped,
+                "documents_failed": self.documents_failed,
+                "sections_validated": self.sections_validated,
+                "sections_skipped": self.sections_skipped,
+            }
+
+    def reset(self) -> None:
+        """Reset counters, the sampling position and remembered sections."""
+        with self._lock:
+            self._passed_sections.clear()
+            self._built = 0
+            self.documents_validated = 0
+            self.documents_skipped = 0
+            self.documents_failed = 0
+            self.sections_validated = 0
+            self.sections_skipped = 0
+
+    def __repr__(self) -> str:
+        """String representation of build validation."""
+        mode = "changed sections" if self.changed_sections_only else "full"
+        return f"<BuildValidation: 1 in {self.sample_every}, {mode}>"
@@ -0,0 +1,432 @@
+"""Fingerprinting and caching of built section and header subtrees.
+
+Section builders are pure functions of their inputs: the protocol objects they
+were given, the C-CDA version, and their options. A fingerprint of those inputs
+identifies the XML a builder would produce, so a document can reuse the subtree
+of every section whose inputs did not change and rebuild only the dirty ones.
+
+Example:
+    cache = SectionCache(maxsize=256)
+    doc = ClinicalDocument(patient, author, custodian, sections=sections, section_cache=cache)
+    doc.to_xml_string()  # builds every section
+
+    doc.sections[1] = MedicationsSection(updated_medications)
+    doc.to_xml_string()  # rebuilds only the medications section
+
+A HeaderCache plays the same role across a batch of documents: header
+fragments that depend only on the author, custodian and document type are
+built for the first document and copied into the rest.
+"""
+
+import copy
+import enum
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Set, Union
+
+from lxml import etree
+
+from ccdakit.core.canonical import build_context
+from ccdakit.core.config import get_config_or_none
+
+
+if TYPE_CHECKING:
+    from ccdakit.core.base import CDAElement
+
+
+# Bump when the builders change output for identical inputs, so stale
+# on-disk cache entries stop matching.
+FINGERPRINT_VERSION = "2"
+
+
+def compute_fingerprint(builder: Any) -> str:
+    """
+    Compute a stable fingerprint of a builder's inputs.
+
+    The fingerprint covers the builder class, its C-CDA version, every
+    attribute it holds (recursively, including protocol objects and nested
+    builders), and the global settings that change builder output
+    (CDAConfig.narrative_style and include_narrative, and the enclosing
+    canonical_build() scope, if any). Attributes listed in the builder's
+    FINGERPRINT_EXCLUDE are ignored.
+
+    Any other object (a protocol object, for example) is fingerprinted the
+    same way, by its type and attributes.
+
+    Args:
+        builder: Builder (or other object) to fingerprint
+
+    Returns:
+        Hex digest identifying the builder's output
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(FINGERPRINT_VERSION.encode())
+    fingerprinter = _Fingerprinter(digest)
+    fingerprinter.feed(_output_settings())
+    fingerprinter.feed(builder)
+    return digest.hexdigest()
+
+
+def _output_settings() -> Dict[str, Any]:
+    """Global configuration values that affect built XML."""
+    config = get_config_or_none()
+    settings: Dict[str, Any]
+    if config is None:
+        settings = {"include_narrative": True, "narrative_style": "table"}
+    else:
+        settings = {
+            "include_narrative": config.include_narrative,
+            "narrative_style": config.narrative_style,
+        }
+    # Subtrees built inside canonical_build() carry ids that are only hashed
+    # as generated ids within that scope, so they are not reused outside it
+    context = build_context()
+    if context is not None:
+        settings["canonical_scope"] = context.scope
+    return settings
+
+
+class _Fingerprinter:
+    """Streams a canonical encoding of an object graph into a hash."""
+
+    def __init__(self, digest: Any) -> None:
+        self._digest = digest
+        self._active: Set[int] = set()
+
+    def _write(self, tag: str, text: str = "") -> None:
+        self._digest.update(f"{tag}:{text}\x1e".encode())
+
+    def feed(self, obj: Any) -> None:
+        """Feed one value (recursively) into the digest."""
+        if obj is None or isinstance(obj, (bool, int, float, str, bytes, Decimal)):
+            self._write(type(obj).__name__, repr(obj))
+        elif isinstance(obj, enum.Enum):
+            self._write(type(obj).__qualname__, repr(obj.value))
+        elif isinstance(obj, (datetime, date, time)):
+            self._write(type(obj).__name__, obj.isoformat())
+        elif isinstance(obj, etree._Element):
+            self._write("element", etree.tostring(obj, encoding="unicode"))
+        else:
+            self._feed_container(obj)
+
+    def _feed_container(self, obj: Any) -> None:
+        obj_id = id(obj)
+        if obj_id in self._active:
+            # Reference cycle - the object is already being encoded
+            self._write("cycle")
+            return
+        self._active.add(obj_id)
+        try:
+            if isinstance(obj, dict):
+                self._write("dict", str(len(obj)))
+                for key in sorted(obj, key=repr):
+                    self.feed(key)
+                    self.feed(obj[key])
+            elif isinstance(obj, (list, tuple)):
+                self._write(type(obj).__name__, str(len(obj)))
+                for item in obj:
+                    self.feed(item)
+            elif isinstance(obj, (set, frozenset)):
+                self._write("set", str(len(obj)))
+                for item in sorted(obj, key=repr):
+                    self.feed(item)
+            else:
+                self._feed_object(obj)
+        finally:
+            self._active.discard(obj_id)
+
+    def _feed_object(self, obj: Any) -> None:
+        cls = type(obj)
+        attributes = _object_attributes(obj)
+        if attributes is None:
+            self._write("repr", f"{cls.__module__}.{cls.__qualname__}:{obj!r}")
+            return
+        self._write("object", f"{cls.__module__}.{cls.__qualname__}")
+        excluded = getattr(obj, "FINGERPRINT_EXCLUDE", ())
+        for name in sorted(attributes):
+            if name in excluded:
+                continue
+            self._write("attr", name)
+            self.feed(attributes[name])
+
+
+def _object_attributes(obj: Any) -> Optional[Dict[str, Any]]:
+    """Collect instance attributes from __dict__ and __slots__ (None if neither)."""
+    attributes: Optional[Dict[str, Any]] = None
+    if hasattr(obj, "__dict__"):
+        attributes = dict(vars(obj))
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__") or not hasattr(obj, name):
+                continue
+            if attributes is None:
+                attributes = {}
+            attributes[name] = getattr(obj, name)
+    return attributes
+
+
+class SectionCache:
+    """
+    LRU cache of built section subtrees keyed by builder fingerprint.
+
+    Entries are kept in memory up to ``maxsize`` and, when ``directory`` is
+    given, also persisted as serialized XML so separate processes and later
+    runs can reuse them. Cached subtrees are copied on every hit, so callers
+    are free to modify or re-parent the returned element.
+
+    Example:
+        cache = SectionCache(maxsize=128, directory=".ccdakit-cache")
+        element = cache.get_or_build(ProblemsSection(problems))
+        print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        directory: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Initialize section cache.
+
+        Args:
+            maxsize: Maximum number of subtrees kept in memory
+            directory: Optional directory for a persistent on-disk cache
+
+        Raises:
+            ValueError: If maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, etree._Element] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, builder: "CDAElement", key: Optional[str] = None) -> etree._Element:
+        """
+        Return the builder's element, reusing a cached subtree when unchanged.
+
+        Args:
+            builder: Section (or any CDAElement) builder
+            key: Builder fingerprint, if the caller already computed it
+
+        Returns:
+            lxml Element owned by the caller
+        """
+        if key is None:
+            key = builder.fingerprint()
+        element = self.get(key)
+        if element is not None:
+            return element
+
+        element = builder.to_element()
+        self.put(key, element)
+        return element
+
+    def get(self, key: str) -> Optional[etree._Element]:
+        """
+        Get a copy of a cached subtree.
+
+        Args:
+            key: Builder fingerprint
+
+        Returns:
+            Copy of the cached element, or None on a miss
+        """
+        with self._lock:
+            element = self._entries.get(key)
+            if element is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(element)
+
+        element = self._load(key)
+        with self._lock:
+            if element is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, element)
+        return copy.deepcopy(element)
+
+    def put(self, key: str, element: etree._Element) -> None:
+        """
+        Store a subtree under a fingerprint.
+
+        Args:
+            key: Builder fingerprint
+            element: Built element (a private copy is stored)
+        """
+        stored = copy.deepcopy(element)
+        with self._lock:
+            self._store(key, stored)
+        if self.directory is not None:
+            path = self.directory / f"{key}.xml"
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(etree.tostring(stored))
+            tmp_path.replace(path)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop one cached subtree, or everything when key is None.
+
+        Args:
+            key: Builder fingerprint to drop (None clears the cache)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        if self.directory is not None:
+            paths = self.directory.glob("*.xml") if key is None else [self.directory / f"{key}.xml"]
+            for path in paths:
+                if path.exists():
+                    path.unlink()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, and current in-memory size
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def _store(self, key: str, element: etree._Element) -> None:
+        """Insert into the in-memory LRU (lock must be held)."""
+        self._entries[key] = element
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[etree._Element]:
+        """Load a subtree from the on-disk cache, if enabled and present."""
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.xml"
+        try:
+            return etree.fromstring(path.read_bytes())
+        except (OSError, etree.XMLSyntaxError):
+            return None
+
+    def __len__(self) -> int:
+        """Get number of subtrees held in memory."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation of cache."""
+        return f"<SectionCache: {len(self._entries)}/{self.maxsize} entries>"
+
+
+class HeaderCache:
+    """
+    LRU cache of header subtrees shared by a batch of documents.
+
+    When many documents are generated for the same author and custodian, the
+    realmCode/typeId/templateId prefix, the document code, the confidentiality
+    and language codes, author, custodian and legalAuthenticator come out the
+    same in every document. Documents given the same HeaderCache build each of
+    these fragments once and append copies; only the recordTarget, document id,
+    title and times are built per document.
+
+    Fragments built from an author or custodian are keyed by the object's
+    compute_fingerprint(), not its identity: equal objects share a fragment
+    even when every record brings its own copy, and a modified object gets a
+    fresh one. The cache holds no reference to the objects and keeps at most
+    ``maxsize`` fragments, dropping the least recently used.
+
+    Example:
+        header_cache = HeaderCache()
+        for patient in patients:
+            doc = ClinicalDocument(patient, author, custodian, header_cache=header_cache)
+            write(doc.to_xml_string())
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize an empty header cache.
+
+        Args:
+            maxsize: Maximum number of fragments kept
+
+        Raises:
+            ValueError: If maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, List[etree._Element]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        factory: Callable[[], List[etree._Element]],
+        source: Any = None,
+    ) -> List[etree._Element]:
+        """
+        Return copies of a header fragment, building it on first use.
+
+        Args:
+            key: Fragment name (with anything else its output depends on)
+            factory: Builds the fragment's elements on a miss
+            source: Protocol object the fragment is built from; its
+                fingerprint is part of the key
+
+        Returns:
+            Copies of the fragment's elements, owned by the caller
+        """
+        full_key = (key, compute_fingerprint(source))
+        with self._lock:
+            elements = self._entries.get(full_key)
+            if elements is not None:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+        if elements is None:
+            elements = factory()
+            with self._lock:
+                self.misses += 1
+                elements = self._entries.setdefault(full_key, elements)
+                self._entries.move_to_end(full_key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        # copy.copy of an lxml element copies its whole subtree
+        return [copy.copy(element) for element in elements]
+
+    def invalidate(self) -> None:
+        """Drop every cached fragment."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, and number of cached fragments
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def __len__(self) -> int:
+        """Get number of cached fragments."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation of cache."""
+        return f"<HeaderCache: {len(self._entries)}/{self.maxsize} fragments>"
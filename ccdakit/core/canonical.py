@@ -0,0 +1,324 @@
+"""Deterministic builds and content hashes.
+
+A plain build differs from run to run: ids come from uuid.uuid4(), default
+times from datetime.now(), and datetimes without tzinfo get the host's UTC
+offset. canonical_build() replaces all three for the builds in its scope (the
+current thread or asyncio task): times come from an injected clock, ids from
+an injected id source (by default SequentialIds, a repeatable UUID sequence),
+and naive datetimes get a fixed offset. Builders read them through now(),
+new_id() and fixed_utc_offset().
+
+canonicalize() serializes a built document as Canonical XML (C14N 1.0) and
+hashes its content, as a whole and per section, so that unchanged records can
+be recognized without comparing XML:
+
+- Ids generated during the build are hashed as their order of appearance
+  within the hashed part, so adding an entry to one section leaves the hashes
+  of the other sections alone.
+- The document's own id, setId and versionNumber are left out of the document
+  hash, so a re-export under a new document id hashes the same.
+- Times are hashed as built; inject a clock that only moves when the record
+  does (its last-modified time, for example).
+- Section caches only reuse subtrees built in the same scope, since ids
+  from another scope would hash differently.
+
+Example:
+    with canonical_build(clock=record.updated_at):
+        doc = ContinuityOfCareDocument(...)
+        canonical = canonicalize(doc)
+    if canonical.content_hash != stored_hashes.get(record.id):
+        send(canonical.xml)
+"""
+
+import hashlib
+import itertools
+import re
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Set, Union
+
+from lxml import etree
+
+
+if TYPE_CHECKING:
+    from ccdakit.core.base import CDAElement
+
+
+NS = "urn:hl7-org:v3"
+
+# Namespace of the UUIDs made by SequentialIds
+SEQUENTIAL_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "urn:ccdakit:sequential-ids")
+
+# Children of ClinicalDocument that identify the document instance rather than
+# its content (left out of the document hash)
+IDENTITY_TAGS = frozenset(f"{{{NS}}}{name}" for name in ("id", "setId", "versionNumber"))
+
+_SECTION_TAG = f"{{{NS}}}section"
+_SECTIONS_PATH = f"{{{NS}}}component/{{{NS}}}structuredBody/{{{NS}}}component/{{{NS}}}section"
+_COMPONENT_TAG = f"{{{NS}}}component"
+_ID_TAG = f"{{{NS}}}id"
+_STRUCTURED_BODY_TAG = f"{{{NS}}}structuredBody"
+_UTC_OFFSET = re.compile(r"[+-](?:[01]\d|2[0-3])[0-5]\d")
+
+
+class SequentialIds:
+    """
+    Repeatable id source: UUIDs derived from a seed and a counter.
+
+    Two sources with the same seed return the same sequence, so a document
+    built the same way twice gets the same ids.
+    """
+
+    def __init__(self, seed: str = "ccdakit") -> None:
+        """
+        Initialize SequentialIds.
+
+        Args:
+            seed: Distinguishes the sequences of different sources
+        """
+        self.seed = seed
+        self._counter = itertools.count(1)
+
+    def __call__(self) -> str:
+        """Return the next id."""
+        return str(uuid.uuid5(SEQUENTIAL_ID_NAMESPACE, f"{self.seed}:{next(self._counter)}"))
+
+    def __repr__(self) -> str:
+        """String representation of id source."""
+        return f"<SequentialIds: {self.seed!r}>"
+
+
+@dataclass
+class BuildContext:
+    """Clock, id source and UTC offset of the builds in a canonical_build() scope."""
+
+    clock: Callable[[], datetime]
+    ids: Callable[[], str]
+    # Offset for datetimes without tzinfo (None for the host's offset)
+    utc_offset: Optional[str]
+    # Ids handed out by new_id() in this scope
+    generated: Set[str] = field(default_factory=set)
+    # Unique per scope; keeps cached subtrees (and their ids) inside the scope
+    scope: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+
+@dataclass
+class CanonicalDocument:
+    """Built element with its content hashes and canonical serialization."""
+
+    element: etree._Element
+    # SHA-256 of the content (hex)
+    content_hash: str
+    # SHA-256 of each top-level section by section code (see section_key())
+    section_hashes: Dict[str, str]
+
+    @cached_property
+    def xml(self) -> bytes:
+        """Canonical XML (C14N 1.0, no XML declaration), serialized on first use."""
+        return etree.tostring(self.element, method="c14n")
+
+
+_context: ContextVar[Optional[BuildContext]] = ContextVar("ccdakit_build_context", default=None)
+
+
+@contextmanager
+def canonical_build(
+    clock: Union[datetime, Callable[[], datetime]],
+    ids: Optional[Callable[[], str]] = None,
+    utc_offset: Optional[str] = "+0000",
+) -> Iterator[BuildContext]:
+    """
+    Make builders inside the block deterministic.
+
+    Builders constructed and built inside the block take default times from
+    clock and generated ids from ids. Scopes nest; the innermost one applies.
+
+    Args:
+        clock: Fixed datetime, or callable returning the current time
+        ids: Callable returning a new id (default: a new SequentialIds())
+        utc_offset: Offset given to datetimes without tzinfo, as +HHMM/-HHMM
+            (None keeps the host's offset)
+
+    Yields:
+        The scope's BuildContext
+
+    Raises:
+        ValueError: If utc_offset is not a +HHMM/-HHMM offset
+    """
+    if utc_offset is not None and not _UTC_OFFSET.fullmatch(utc_offset):
+        raise ValueError(f"Invalid UTC offset {utc_offset!r} (expected +HHMM or -HHMM)")
+    if isinstance(clock, datetime):
+        fixed = clock
+
+        def clock() -> datetime:
+            return fixed
+
+    context = BuildContext(clock=clock, ids=ids or SequentialIds(), utc_offset=utc_offset)
+    token = _context.set(context)
+    try:
+        yield context
+    finally:
+        _context.reset(token)
+
+
+def build_context() -> Optional[BuildContext]:
+    """
+    Get the innermost canonical_build() scope.
+
+    Returns:
+        The active BuildContext, or None outside canonical_build()
+    """
+    return _context.get()
+
+
+def new_id() -> str:
+    """
+    Get a new id for a generated identifier.
+
+    Returns:
+        Id from the canonical_build() id source, or a random UUID outside one
+    """
+    context = _context.get()
+    if context is None:
+        return str(uuid.uuid4())
+    value = context.ids()
+    context.generated.add(value)
+    return value
+
+
+def now() -> datetime:
+    """
+    Get the current time for default timestamps.
+
+    Returns:
+        Time from the canonical_build() clock, or datetime.now() outside one
+    """
+    context = _context.get()
+    return datetime.now() if context is None else context.clock()
+
+
+def fixed_utc_offset() -> Optional[str]:
+    """
+    Get the offset canonical_build() gives datetimes without tzinfo.
+
+    Returns:
+        Offset in +HHMM/-HHMM format, or None to use the host's offset
+    """
+    context = _context.get()
+    return None if context is None else context.utc_offset
+
+
+def canonicalize(builder: "CDAElement") -> CanonicalDocument:
+    """
+    Build an element and return its canonical XML and content hashes.
+
+    Call it inside the canonical_build() block the builder was created in;
+    outside one, ids and times are random and so are the hashes.
+
+    Args:
+        builder: Document (or section) builder
+
+    Returns:
+        CanonicalDocument with the element and the SHA-256 hashes of the
+        document and its sections (its C14N serialization is only made when
+        the xml attribute is read, so skipping unchanged documents is cheap)
+    """
+    element = builder.to_element()
+    context = _context.get()
+    generated = context.generated if context is not None else set()
+    section_hashes: Dict[str, str] = {}
+    if element.tag == _SECTION_TAG:
+        sections = [element]
+    else:
+        sections = element.findall(_SECTIONS_PATH)
+    for section in sections:
+        key = section_key(section)
+        if key in section_hashes:
+            key = next(
+                f"{key}#{n}" for n in itertools.count(2) if f"{key}#{n}" not in section_hashes
+            )
+        section_hashes[key] = _hash(section, generated)
+
+    if element.tag == _SECTION_TAG:
+        content_hash = section_hashes[key]
+    else:
+        header = _hash_without(element, generated, _detachable(element))
+        digest = hashlib.sha256(header.encode())
+        for value in section_hashes.values():
+            digest.update(value.encode())
+        content_hash = digest.hexdigest()
+
+    return CanonicalDocument(
+        element=element,
+        content_hash=content_hash,
+        section_hashes=section_hashes,
+    )
+
+
+def section_key(section: etree._Element) -> str:
+    """
+    Get the key of a section in CanonicalDocument.section_hashes.
+
+    Args:
+        section: section element
+
+    Returns:
+        The section's code (LOINC), else its first templateId root, else
+        "section"
+    """
+    code = section.find(f"{{{NS}}}code")
+    if code is not None and code.get("code"):
+        return code.get("code")
+    template_id = section.find(f"{{{NS}}}templateId")
+    if template_id is not None and template_id.get("root"):
+        return template_id.get("root")
+    return "section"
+
+
+def _detachable(document: etree._Element) -> List[etree._Element]:
+    """Children hashed separately (sections) or not at all (identity)."""
+    return [
+        child
+        for child in document
+        if child.tag in IDENTITY_TAGS
+        or (child.tag == _COMPONENT_TAG and child.find(_STRUCTURED_BODY_TAG) is not None)
+    ]
+
+
+def _hash_without(
+    element: etree._Element, generated: Set[str], children: List[etree._Element]
+) -> str:
+    """Hash an element with some of its children temporarily removed."""
+    positions = [(element.index(child), child) for child in children]
+    for child in children:
+        element.remove(child)
+    try:
+        return _hash(element, generated)
+    finally:
+        for index, child in positions:
+            element.insert(index, child)
+
+
+def _hash(element: etree._Element, generated: Set[str]) -> str:
+    """SHA-256 of an element's exclusive C14N, with generated ids numbered."""
+    replaced = []
+    if generated:
+        tokens: Dict[str, str] = {}
+        # Builders only generate identifiers (id/@root and id/@extension)
+        for node in element.iter(_ID_TAG):
+            for name in ("root", "extension"):
+                value = node.get(name)
+                if value in generated:
+                    token = tokens.setdefault(value, f"generated-{len(tokens) + 1}")
+                    replaced.append((node, name, value))
+                    node.set(name, token)
+    try:
+        canonical = etree.tostring(element, method="c14n", exclusive=True, with_comments=False)
+        return hashlib.sha256(canonical).hexdigest()
+    finally:
+        for node, name, value in replaced:
+            node.set(name, value)
@@ -56,6 +56,9 @@ class CDAConfig:
 # Global config instance
 _config: Optional[CDAConfig] = None
 
+# Document id root when none is configured
+DEFAULT_DOCUMENT_ID_ROOT = "2.16.840.1.113883.19.5"
+
 
 def configure(config: CDAConfig) -> None:
     """
@@ -83,6 +86,31 @@ def get_config() -> CDAConfig:
     return _config
 
 
+def get_config_or_none() -> Optional[CDAConfig]:
+    """
+    Get current configuration without requiring it to be set.
+
+    Builders use this for optional settings that have sensible defaults.
+
+    Returns:
+        Current CDAConfig instance, or None if not configured
+    """
+    return _config
+
+
+def get_document_id_root() -> str:
+    """
+    Get the root OID for document ids.
+
+    Returns:
+        The configured document_id_root, or the example OID used when
+        ccdakit is not configured
+    """
+    if _config is not None and _config.document_id_root:
+        return _config.document_id_root
+    return DEFAULT_DOCUMENT_ID_ROOT
+
+
 def reset_config() -> None:
     """Reset configuration (useful for testing)."""
     global _config
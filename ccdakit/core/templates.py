@@ -0,0 +1,285 @@
+"""Compiled templateId tables and an index of the templates each builder emits.
+
+Builders declare their templateIds as TemplateConfig lists keyed by
+CDAVersion. Turning those into elements on every build means a dict lookup,
+a version check and a new element with two attributes set, for every entry
+and section. The registry resolves each builder class's tables once, when the
+class is defined, into prebuilt templateId elements that are cloned onto the
+output.
+
+The same tables answer which builder emits a template OID, for the
+``list-templates --oids`` CLI command and any tooling that needs to map
+templates in a document back to the code that produced them.
+
+Example:
+    from ccdakit.core.templates import template_registry
+
+    for usage in template_registry.find("2.16.840.1.113883.10.20.22.4.3"):
+        print(usage.builder.__name__, usage.version.value, usage.extension)
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+from lxml import etree
+
+
+if TYPE_CHECKING:
+    from ccdakit.core.base import CDAElement, CDAVersion, TemplateConfig
+
+    TemplateTable = Dict[CDAVersion, List[TemplateConfig]]
+
+
+_Prototypes = Tuple[etree._Element, ...]
+
+
+@dataclass(frozen=True)
+class TemplateUsage:
+    """One templateId emitted by a builder class for one C-CDA version."""
+
+    root: str
+    extension: str | None
+    version: CDAVersion
+    builder: type
+    nested: str | None = None  # Key in NESTED_TEMPLATES, None for the builder's own
+    description: str | None = None
+
+    @property
+    def builder_name(self) -> str:
+        """Get the builder's qualified name (module.Class)."""
+        return f"{self.builder.__module__}.{self.builder.__qualname__}"
+
+
+class CompiledTemplates:
+    """Prebuilt templateId elements of one builder class, resolved per version."""
+
+    __slots__ = ("source", "nested_source", "_full", "_entries_optional", "_nested")
+
+    def __init__(
+        self,
+        templates: TemplateTable,
+        nested: dict[str, TemplateTable],
+    ) -> None:
+        """
+        Compile template tables.
+
+        Args:
+            templates: The builder's TEMPLATES
+            nested: The builder's NESTED_TEMPLATES
+        """
+        self.source = templates
+        self.nested_source = nested
+        self._full: dict[CDAVersion, _Prototypes] = {}
+        self._entries_optional: dict[CDAVersion, _Prototypes] = {}
+        for version, configs in templates.items():
+            self._full[version] = _prototypes(configs)
+            optional = [c for c in configs if not c.entries_required]
+            self._entries_optional[version] = (
+                _prototypes(optional) if optional else self._full[version]
+            )
+        self._nested: dict[tuple[str, CDAVersion], _Prototypes] = {
+            (name, version): _prototypes(configs)
+            for name, table in nested.items()
+            for version, configs in table.items()
+        }
+
+    def prototypes(
+        self,
+        version: CDAVersion,
+        include_entries: bool = True,
+        nested: str | None = None,
+    ) -> _Prototypes | None:
+        """
+        Get the prebuilt templateIds for a version.
+
+        Args:
+            version: C-CDA version
+            include_entries: False to drop templates with entries_required
+            nested: NESTED_TEMPLATES key (None for the builder's own templates)
+
+        Returns:
+            Prototype elements (clone before use), or None if the version is
+            not in the table
+        """
+        if nested is not None:
+            return self._nested.get((nested, version))
+        table = self._full if include_entries else self._entries_optional
+        return table.get(version)
+
+    def is_current(self, cls: type) -> bool:
+        """Check the tables still belong to the class's current TEMPLATES."""
+        return self.source is cls.TEMPLATES and self.nested_source is cls.NESTED_TEMPLATES
+
+
+def _prototypes(configs: list[TemplateConfig]) -> _Prototypes:
+    """Build one templateId element per config."""
+    return tuple(config.to_element() for config in configs)
+
+
+def append_templates(parent: etree._Element, prototypes: _Prototypes) -> None:
+    """
+    Append a copy of each prototype templateId to parent.
+
+    Args:
+        parent: Element to append to
+        prototypes: Elements from CompiledTemplates.prototypes()
+    """
+    for prototype in prototypes:
+        parent.append(copy.copy(prototype))
+
+
+class TemplateRegistry:
+    """
+    Compiled templateId tables of every builder class.
+
+    CDAElement registers each subclass when it is defined. Tables are keyed by
+    the identity of the class's TEMPLATES and NESTED_TEMPLATES, so assigning
+    new tables to a class recompiles them on next use; a table mutated in
+    place needs refresh().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._compiled: dict[type, CompiledTemplates] = {}
+        self._lock = threading.Lock()
+
+    def register(self, cls: type[CDAElement]) -> CompiledTemplates:
+        """
+        Compile and store a builder class's templates.
+
+        Args:
+            cls: CDAElement subclass
+
+        Returns:
+            Compiled templates of the class
+        """
+        compiled = CompiledTemplates(cls.TEMPLATES, cls.NESTED_TEMPLATES)
+        with self._lock:
+            self._compiled[cls] = compiled
+        return compiled
+
+    def compiled(self, cls: type[CDAElement]) -> CompiledTemplates:
+        """
+        Get a builder class's compiled templates, recompiling stale tables.
+
+        Args:
+            cls: CDAElement subclass
+
+        Returns:
+            Compiled templates of the class
+        """
+        compiled = self._compiled.get(cls)
+        if compiled is None or not compiled.is_current(cls):
+            compiled = self.register(cls)
+        return compiled
+
+    def refresh(self, cls: type[CDAElement] | None = None) -> None:
+        """
+        Recompile templates after a TEMPLATES table was changed in place.
+
+        Args:
+            cls: Builder class to recompile (None for every registered class)
+        """
+        with self._lock:
+            classes = [cls] if cls is not None else list(self._compiled)
+        for builder in classes:
+            self.register(builder)
+
+    def usages(self) -> Iterator[TemplateUsage]:
+        """
+        Iterate over every templateId emitted by a registered builder.
+
+        Only the class that declares a table is listed, not subclasses that
+        inherit it unchanged.
+
+        Yields:
+            TemplateUsage per builder, version and template
+        """
+        with self._lock:
+            classes = list(self._compiled)
+        for cls in classes:
+            own = cls.__dict__
+            tables: list[tuple[str | None, TemplateTable]] = []
+            if own.get("TEMPLATES"):
+                tables.append((None, own["TEMPLATES"]))
+            for name, table in (own.get("NESTED_TEMPLATES") or {}).items():
+                tables.append((name, table))
+            for nested, table in tables:
+                for version, configs in table.items():
+                    for config in configs:
+                        yield TemplateUsage(
+                            root=config.root,
+                            extension=config.extension,
+                            version=version,
+                            builder=cls,
+                            nested=nested,
+                            description=config.description,
+                        )
+
+    def find(
+        self,
+        root: str,
+        extension: str | None = None,
+        version: CDAVersion | None = None,
+    ) -> list[TemplateUsage]:
+        """
+        Find the builders that emit a template.
+
+        Args:
+            root: Template OID
+            extension: Only match this extension (None matches any)
+            version: Only match this C-CDA version (None matches any)
+
+        Returns:
+            Matching usages, sorted by builder name and version
+        """
+        matches = [
+            usage
+            for usage in self.usages()
+            if usage.root == root
+            and (extension is None or usage.extension == extension)
+            and (version is None or usage.version == version)
+        ]
+        return sorted(matches, key=lambda u: (u.builder_name, u.version.value))
+
+    def index(self) -> dict[str, list[TemplateUsage]]:
+        """
+        Group every templateId usage by template OID.
+
+        Returns:
+            Usages keyed by root OID, in OID order
+        """
+        grouped: dict[str, list[TemplateUsage]] = {}
+        for usage in self.usages():
+            grouped.setdefault(usage.root, []).append(usage)
+        return {
+            root: sorted(grouped[root], key=lambda u: (u.builder_name, u.version.value))
+            for root in sorted(grouped)
+        }
+
+    def __len__(self) -> int:
+        """Get number of registered builder classes."""
+        return len(self._compiled)
+
+    def __repr__(self) -> str:
+        """String representation of registry."""
+        return f"<TemplateRegistry: {len(self)} builders>"
+
+
+# Registry shared by every CDAElement subclass
+template_registry = TemplateRegistry()
+
+
+def load_builders() -> None:
+    """Import every builder module so the registry lists all builders."""
+    import importlib
+    import pkgutil
+
+    import ccdakit.builders
+
+    for module in pkgutil.walk_packages(ccdakit.builders.__path__, "ccdakit.builders."):
+        importlib.import_module(module.name)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
 
 
 class ValidationLevel(Enum):
@@ -32,6 +32,73 @@ class ValidationIssue:
         return f"{self.level.value.upper()}{location_str}: {self.message}{code_str}"
 
 
+@dataclass
+class StageTiming:
+    """Time spent in one stage of a validation run."""
+
+    stage: str
+    wall_time: float = 0.0  # Seconds of wall-clock time
+    cpu_time: float = 0.0  # Seconds of CPU time on the thread that ran the stage
+    skipped: bool = False  # Stage did not run (e.g. fail-fast after an earlier failure)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "stage": self.stage,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "skipped": self.skipped,
+        }
+
+
+@dataclass
+class RuleStats:
+    """
+    Profile of one validation rule across the documents it checked.
+
+    failures counts the documents for which the rule reported at least one
+    issue (or raised); issues counts the issues themselves.
+    """
+
+    calls: int = 0
+    failures: int = 0
+    issues: int = 0
+    total_time: float = 0.0  # Seconds spent in the rule
+    max_time: float = 0.0  # Slowest single call, in seconds
+
+    def record(self, elapsed: float, issue_count: int) -> None:
+        """Add one call of the rule."""
+        self.calls += 1
+        self.failures += 1 if issue_count else 0
+        self.issues += issue_count
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def merge(self, other: RuleStats) -> None:
+        """Add another profile of the same rule to this one."""
+        self.calls += other.calls
+        self.failures += other.failures
+        self.issues += other.issues
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+
+    @property
+    def mean_time(self) -> float:
+        """Average seconds per call."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "issues": self.issues,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+            "mean_time": self.mean_time,
+        }
+
+
 @dataclass
 class ValidationResult:
     """Result of validation with errors, warnings, and info."""
@@ -39,12 +106,41 @@ class ValidationResult:
     errors: list[ValidationIssue] = field(default_factory=list)
     warnings: list[ValidationIssue] = field(default_factory=list)
     infos: list[ValidationIssue] = field(default_factory=list)
+    timings: list[StageTiming] = field(default_factory=list)
+    # Per-rule profile, keyed by rule name (only set by a profiling RulesEngine)
+    rule_stats: dict[str, RuleStats] = field(default_factory=dict)
+
+    @classmethod
+    def merge(cls, results: Iterable[ValidationResult]) -> ValidationResult:
+        """
+        Combine several results into one, keeping issue and timing order.
+
+        Args:
+            results: Results to combine
+
+        Returns:
+            New ValidationResult holding every issue, timing and rule profile
+        """
+        merged = cls()
+        for result in results:
+            merged.errors.extend(result.errors)
+            merged.warnings.extend(result.warnings)
+            merged.infos.extend(result.infos)
+            merged.timings.extend(result.timings)
+            for name, stats in result.rule_stats.items():
+                merged.rule_stats.setdefault(name, RuleStats()).merge(stats)
+        return merged
 
     @property
     def is_valid(self) -> bool:
         """Check if validation passed (no errors)."""
         return len(self.errors) == 0
 
+    @property
+    def skipped(self) -> bool:
+        """Check if this is the result of a pipeline stage that did not run."""
+        return bool(self.timings) and all(timing.skipped for timing in self.timings)
+
     @property
     def has_warnings(self) -> bool:
         """Check if there are warnings."""
@@ -79,7 +175,7 @@ class ValidationResult:
                 result["parsed"] = issue.parsed_data
             return result
 
-        return {
+        output = {
             "is_valid": self.is_valid,
             "error_count": len(self.errors),
             "warning_count": len(self.warnings),
@@ -88,6 +184,15 @@ class ValidationResult:
             "warnings": [issue_to_dict(w) for w in self.warnings],
             "infos": [issue_to_dict(i) for i in self.infos],
         }
+        # Only pipeline runs record timings
+        if self.timings:
+            output["timings"] = [timing.to_dict() for timing in self.timings]
+        # Only profiling rules engines record rule statistics
+        if self.rule_stats:
+            output["rule_stats"] = [
+                {"rule": name, **stats.to_dict()} for name, stats in self.rule_stats.items()
+            ]
+        return output
 
     def __str__(self) -> str:
         """String representation of validation result."""
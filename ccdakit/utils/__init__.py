@@ -1,53 +1,129 @@
 """Utility modules for ccdakit."""
 
-from ccdakit.utils.builders import (
-    SimpleAllergyBuilder,
-    SimpleEncounterBuilder,
-    SimpleImmunizationBuilder,
-    SimpleMedicationBuilder,
-    SimplePatientBuilder,
-    SimpleProblemBuilder,
-    SimpleProcedureBuilder,
-    SimpleResultObservationBuilder,
-    SimpleResultOrganizerBuilder,
-    SimpleSmokingStatusBuilder,
-    SimpleVitalSignBuilder,
-    SimpleVitalSignsOrganizerBuilder,
-)
-from ccdakit.utils.code_systems import CodeSystemRegistry
-from ccdakit.utils.converters import DictToCCDAConverter
-from ccdakit.utils.factories import DocumentFactory
-from ccdakit.utils.null_flavors import (
-    NullFlavor,
-    add_null_flavor,
-    create_null_code,
-    create_null_id,
-    create_null_time,
-    create_null_time_high,
-    create_null_time_low,
-    create_null_value,
-    get_default_null_flavor_for_element,
-    should_use_null_flavor,
-)
-from ccdakit.utils.templates import DocumentTemplates
-from ccdakit.utils.test_data import SampleDataGenerator
-from ccdakit.utils.validators import DataValidator
-from ccdakit.utils.value_sets import ValueSetRegistry
-from ccdakit.utils.xslt import (
-    download_cda_stylesheet,
-    get_default_xslt_path,
-    transform_cda_string_to_html,
-    transform_cda_to_html,
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.utils.builders import (
+        SimpleAllergyBuilder,
+        SimpleEncounterBuilder,
+        SimpleImmunizationBuilder,
+        SimpleMedicationBuilder,
+        SimplePatientBuilder,
+        SimpleProblemBuilder,
+        SimpleProcedureBuilder,
+        SimpleResultObservationBuilder,
+        SimpleResultOrganizerBuilder,
+        SimpleSmokingStatusBuilder,
+        SimpleVitalSignBuilder,
+        SimpleVitalSignsOrganizerBuilder,
+    )
+    from ccdakit.utils.code_systems import CodeSystemRegistry
+    from ccdakit.utils.converters import DictToCCDAConverter, ErrorBudgetError, RecordValidation
+    from ccdakit.utils.diff import DocumentDiff, diff_documents
+    from ccdakit.utils.factories import DocumentFactory
+    from ccdakit.utils.null_flavors import (
+        NullFlavor,
+        add_null_flavor,
+        create_null_code,
+        create_null_id,
+        create_null_time,
+        create_null_time_high,
+        create_null_time_low,
+        create_null_value,
+        get_default_null_flavor_for_element,
+        should_use_null_flavor,
+    )
+    from ccdakit.utils.sinks import (
+        ContainerReader,
+        ContainerSink,
+        DirectorySink,
+        DocumentSink,
+        TarSink,
+        ZipSink,
+        open_sink,
+    )
+    from ccdakit.utils.templates import DocumentTemplates
+    from ccdakit.utils.test_data import SampleDataGenerator
+    from ccdakit.utils.validators import BatchValidationResult, DataValidator
+    from ccdakit.utils.value_sets import ValueSetRegistry
+    from ccdakit.utils.xslt import (
+        download_cda_stylesheet,
+        get_default_xslt_path,
+        transform_cda_string_to_html,
+        transform_cda_to_html,
+    )
+
+
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        "SimpleAllergyBuilder": "ccdakit.utils.builders",
+        "SimpleEncounterBuilder": "ccdakit.utils.builders",
+        "SimpleImmunizationBuilder": "ccdakit.utils.builders",
+        "SimpleMedicationBuilder": "ccdakit.utils.builders",
+        "SimplePatientBuilder": "ccdakit.utils.builders",
+        "SimpleProblemBuilder": "ccdakit.utils.builders",
+        "SimpleProcedureBuilder": "ccdakit.utils.builders",
+        "SimpleResultObservationBuilder": "ccdakit.utils.builders",
+        "SimpleResultOrganizerBuilder": "ccdakit.utils.builders",
+        "SimpleSmokingStatusBuilder": "ccdakit.utils.builders",
+        "SimpleVitalSignBuilder": "ccdakit.utils.builders",
+        "SimpleVitalSignsOrganizerBuilder": "ccdakit.utils.builders",
+        "CodeSystemRegistry": "ccdakit.utils.code_systems",
+        "DictToCCDAConverter": "ccdakit.utils.converters",
+        "ErrorBudgetError": "ccdakit.utils.converters",
+        "RecordValidation": "ccdakit.utils.converters",
+        "DocumentDiff": "ccdakit.utils.diff",
+        "diff_documents": "ccdakit.utils.diff",
+        "DocumentFactory": "ccdakit.utils.factories",
+        "NullFlavor": "ccdakit.utils.null_flavors",
+        "add_null_flavor": "ccdakit.utils.null_flavors",
+        "create_null_code": "ccdakit.utils.null_flavors",
+        "create_null_id": "ccdakit.utils.null_flavors",
+        "create_null_time": "ccdakit.utils.null_flavors",
+        "create_null_time_high": "ccdakit.utils.null_flavors",
+        "create_null_time_low": "ccdakit.utils.null_flavors",
+        "create_null_value": "ccdakit.utils.null_flavors",
+        "get_default_null_flavor_for_element": "ccdakit.utils.null_flavors",
+        "should_use_null_flavor": "ccdakit.utils.null_flavors",
+        "ContainerReader": "ccdakit.utils.sinks",
+        "ContainerSink": "ccdakit.utils.sinks",
+        "DirectorySink": "ccdakit.utils.sinks",
+        "DocumentSink": "ccdakit.utils.sinks",
+        "TarSink": "ccdakit.utils.sinks",
+        "ZipSink": "ccdakit.utils.sinks",
+        "open_sink": "ccdakit.utils.sinks",
+        "DocumentTemplates": "ccdakit.utils.templates",
+        "SampleDataGenerator": "ccdakit.utils.test_data",
+        "BatchValidationResult": "ccdakit.utils.validators",
+        "DataValidator": "ccdakit.utils.validators",
+        "ValueSetRegistry": "ccdakit.utils.value_sets",
+        "download_cda_stylesheet": "ccdakit.utils.xslt",
+        "get_default_xslt_path": "ccdakit.utils.xslt",
+        "transform_cda_string_to_html": "ccdakit.utils.xslt",
+        "transform_cda_to_html": "ccdakit.utils.xslt",
+    },
 )
 
 
 __all__ = [
+    "BatchValidationResult",
     "CodeSystemRegistry",
+    "ContainerReader",
+    "ContainerSink",
     "DataValidator",
     "DictToCCDAConverter",
+    "DirectorySink",
+    "DocumentDiff",
     "DocumentFactory",
+    "DocumentSink",
     "DocumentTemplates",
+    "ErrorBudgetError",
     "NullFlavor",
+    "RecordValidation",
     "SampleDataGenerator",
     "SimpleAllergyBuilder",
     "SimpleEncounterBuilder",
@@ -61,7 +137,9 @@ __all__ = [
     "SimpleSmokingStatusBuilder",
     "SimpleVitalSignBuilder",
     "SimpleVitalSignsOrganizerBuilder",
+    "TarSink",
     "ValueSetRegistry",
+    "ZipSink",
     "add_null_flavor",
     "create_null_code",
     "create_null_id",
@@ -69,9 +147,11 @@ __all__ = [
     "create_null_time_high",
     "create_null_time_low",
     "create_null_value",
+    "diff_documents",
     "download_cda_stylesheet",
     "get_default_null_flavor_for_element",
     "get_default_xslt_path",
+    "open_sink",
     "should_use_null_flavor",
     "transform_cda_to_html",
     "transform_cda_string_to_html",
@@ -1,6 +1,7 @@
 """Code system registry and utilities for C-CDA code systems."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -453,7 +454,7 @@ class CodeSystemRegistry:
             # No pattern defined, consider valid
             return True
 
-        return bool(re.match(pattern, code))
+        return _matches_format(pattern, code)
 
     @staticmethod
     def get_system_info(system: str) -> Optional[dict]:
@@ -563,3 +564,9 @@ class CodeSystemRegistry:
             ],
         }
         return categories
+
+
+@lru_cache(maxsize=4096)
+def _matches_format(pattern: str, code: str) -> bool:
+    """Check a code against a format pattern (cached, as feeds repeat the same codes)."""
+    return re.match(pattern, code) is not None
@@ -5,9 +5,11 @@ into properly formatted C-CDA documents using the ccdakit builders.
 """
 
 import json
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ccdakit.builders.document import ClinicalDocument
 from ccdakit.builders.sections.allergies import AllergiesSection
@@ -20,6 +22,220 @@ from ccdakit.builders.sections.results import ResultsSection
 from ccdakit.builders.sections.social_history import SocialHistorySection
 from ccdakit.builders.sections.vital_signs import VitalSignsSection
 from ccdakit.core.base import CDAVersion
+from ccdakit.core.canonical import now
+from ccdakit.core.validation import (
+    ValidationError,
+    ValidationIssue,
+    ValidationLevel,
+    ValidationResult,
+)
+from ccdakit.utils.validators import DataValidator
+
+
+class ErrorBudgetError(Exception):
+    """Exception raised when a conversion run rejects more records than allowed."""
+
+    def __init__(self, message: str, result: ValidationResult) -> None:
+        """
+        Initialize with the issues collected so far.
+
+        Args:
+            message: Which budget was exceeded
+            result: ValidationResult holding the rejected records' errors
+        """
+        self.result = result
+        super().__init__(message)
+
+
+class RecordValidation:
+    """
+    Inline DataValidator checks for DictToCCDAConverter, with an error budget.
+
+    Each patient and section record is converted and checked with the
+    matching DataValidator method before any XML is built. Records with
+    errors are dropped from their section (a rejected patient rejects the
+    whole document), and their errors are collected. One instance is meant
+    to span a whole run: once the rejected records exceed max_errors, or the
+    share of rejected records among the last rate_window exceeds
+    max_error_rate, conversion raises ErrorBudgetError so a bad feed
+    stops early instead of being built and schema-validated record by record.
+
+    Example:
+        validation = RecordValidation(max_errors=50, max_error_rate=0.2)
+        for document in DictToCCDAConverter.from_dicts(feed, validation=validation):
+            write(document.to_xml_string())
+        print(validation.stats())
+    """
+
+    def __init__(
+        self,
+        max_errors: Optional[int] = None,
+        max_error_rate: Optional[float] = None,
+        rate_window: int = 100,
+        max_issues: Optional[int] = 1000,
+    ) -> None:
+        """
+        Initialize record validation.
+
+        Args:
+            max_errors: Number of rejected records tolerated per run (None: no limit)
+            max_error_rate: Share of rejected records tolerated among the last
+                rate_window records, between 0 and 1 (None: no limit)
+            rate_window: Number of most recent records the rate is measured over;
+                the rate is only enforced once that many records were checked
+            max_issues: Maximum number of issues kept (None for unlimited)
+
+        Raises:
+            ValueError: If max_error_rate is not between 0 and 1 or rate_window
+                is less than 1
+        """
+        if max_error_rate is not None and not 0 <= max_error_rate <= 1:
+            raise ValueError("max_error_rate must be between 0 and 1")
+        if rate_window < 1:
+            raise ValueError("rate_window must be at least 1")
+        self.max_errors = max_errors
+        self.max_error_rate = max_error_rate
+        self.rate_window = rate_window
+        self.max_issues = max_issues
+        self._lock = threading.Lock()
+        self._recent: deque = deque(maxlen=rate_window)
+        self._issues: List[ValidationIssue] = []
+        self.records_checked = 0
+        self.records_rejected = 0
+        self.documents_rejected = 0
+
+    def convert(
+        self,
+        kind: str,
+        converter: Callable[[Dict[str, Any]], object],
+        data: Dict[str, Any],
+        location: str,
+    ) -> Tuple[Optional[object], List[ValidationIssue]]:
+        """
+        Convert one record and check it, counting it against the budget.
+
+        Args:
+            kind: "patient" or a section type (keys of RECORD_VALIDATORS)
+            converter: Function converting the dict to a protocol object
+            data: Record dictionary
+            location: Where the record is, used as the issues' location
+
+        Returns:
+            Tuple of (converted object, or None if the record was rejected;
+            the record's errors)
+
+        Raises:
+            ErrorBudgetError: If rejecting this record exceeds the budget
+        """
+        issues: List[ValidationIssue] = []
+        converted = None
+        try:
+            converted = converter(data)
+        except KeyError as e:
+            issues.append(_record_issue(f"Missing required field: {e.args[0]}", "MISSING_FIELD"))
+        except (ValueError, TypeError, AttributeError) as e:
+            issues.append(_record_issue(f"Cannot convert record: {e}", "INVALID_VALUE"))
+        else:
+            validator = DictToCCDAConverter.RECORD_VALIDATORS.get(kind)
+            if validator is not None:
+                issues = validator(_record_fields(converted)).errors
+
+        issues = [
+            ValidationIssue(level=i.level, message=i.message, location=location, code=i.code)
+            for i in issues
+        ]
+        self._record(issues)
+        return (None if issues else converted), issues
+
+    def _record(self, issues: List[ValidationIssue]) -> None:
+        """Count a checked record and enforce the budget."""
+        with self._lock:
+            self.records_checked += 1
+            self._recent.append(bool(issues))
+            if not issues:
+                return
+            self.records_rejected += 1
+            room = len(issues)
+            if self.max_issues is not None:
+                room = max(0, self.max_issues - len(self._issues))
+            self._issues.extend(issues[:room])
+            exceeded = self._exceeded()
+            if exceeded:
+                raise ErrorBudgetError(exceeded, ValidationResult(errors=list(self._issues)))
+
+    def _exceeded(self) -> Optional[str]:
+        """Describe the exceeded budget, if any (lock must be held)."""
+        if self.max_errors is not None and self.records_rejected > self.max_errors:
+            return f"Rejected {self.records_rejected} records, more than the budget of {self.max_errors}"
+        if self.max_error_rate is not None and len(self._recent) == self.rate_window:
+            rate = sum(self._recent) / self.rate_window
+            if rate > self.max_error_rate:
+                return (
+                    f"Rejected {rate:.0%} of the last {self.rate_window} records, "
+                    f"more than the budget of {self.max_error_rate:.0%}"
+                )
+        return None
+
+    def reject_document(self) -> None:
+        """Count a document dropped because its patient record was rejected."""
+        with self._lock:
+            self.documents_rejected += 1
+
+    @property
+    def result(self) -> ValidationResult:
+        """Get the collected errors of rejected records."""
+        with self._lock:
+            return ValidationResult(errors=list(self._issues))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get validation counters.
+
+        Returns:
+            Dictionary with records checked and rejected, and documents rejected
+        """
+        with self._lock:
+            return {
+                "records_checked": self.records_checked,
+                "records_rejected": self.records_rejected,
+                "documents_rejected": self.documents_rejected,
+            }
+
+    def reset(self) -> None:
+        """Reset counters and collected issues for a new run."""
+        with self._lock:
+            self._recent.clear()
+            self._issues.clear()
+            self.records_checked = 0
+            self.records_rejected = 0
+            self.documents_rejected = 0
+
+    def __repr__(self) -> str:
+        """String representation of record validation."""
+        return (
+            f"<RecordValidation: {self.records_rejected}/{self.records_checked} rejected, "
+            f"max_errors={self.max_errors}, max_error_rate={self.max_error_rate}>"
+        )
+
+
+def _record_issue(message: str, code: str) -> ValidationIssue:
+    """Create an error issue for a record that could not be converted."""
+    return ValidationIssue(level=ValidationLevel.ERROR, message=message, code=code)
+
+
+def _location(document_id: Optional[str], record: str) -> str:
+    """Describe where a record is, for issue locations."""
+    return f"{document_id}: {record}" if document_id else record
+
+
+def _record_fields(obj: object) -> Dict[str, Any]:
+    """Get a converted object's attributes as a dict, DataValidator style."""
+    fields = {}
+    for name, value in vars(obj).items():
+        if isinstance(value, list):
+            value = [_record_fields(item) if hasattr(item, "__dict__") else item for item in value]
+        fields[name] = value
+    return fields
 
 
 class DictToCCDAConverter:
@@ -57,8 +273,24 @@ class DictToCCDAConverter:
         "social_history": SocialHistorySection,
     }
 
+    # DataValidator checks applied to converted records by RecordValidation
+    RECORD_VALIDATORS = {
+        "patient": DataValidator.validate_patient_data,
+        "problems": DataValidator.validate_problem_data,
+        "medications": DataValidator.validate_medication_data,
+        "allergies": DataValidator.validate_allergy_data,
+        "immunizations": DataValidator.validate_immunization_data,
+        "vital_signs": DataValidator.validate_vital_signs_data,
+        "procedures": DataValidator.validate_procedure_data,
+        "results": DataValidator.validate_result_data,
+        "encounters": DataValidator.validate_encounter_data,
+        "social_history": DataValidator.validate_smoking_status_data,
+    }
+
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> ClinicalDocument:
+    def from_dict(
+        data: Dict[str, Any], validation: Optional[RecordValidation] = None
+    ) -> ClinicalDocument:
         """Convert dictionary to C-CDA document.
 
         Expected format:
@@ -117,6 +349,9 @@ class DictToCCDAConverter:
 
         Args:
             data: Dictionary containing patient, author, custodian, and sections data
+            validation: Check the patient and every section record with
+                DataValidator before building, dropping invalid records and
+                counting them against the run's error budget
 
         Returns:
             ClinicalDocument instance ready to generate XML
@@ -124,6 +359,8 @@ class DictToCCDAConverter:
         Raises:
             ValueError: If required fields are missing or invalid
             KeyError: If expected dictionary keys are not found
+            ValidationError: If validation rejects the patient record
+            ErrorBudgetError: If validation rejects more records than its budget allows
         """
         # Validate required top-level keys
         required_keys = ["patient", "author", "custodian"]
@@ -131,8 +368,22 @@ class DictToCCDAConverter:
         if missing_keys:
             raise ValueError(f"Missing required keys: {', '.join(missing_keys)}")
 
+        doc_metadata = data.get("document", {})
+        document_id = doc_metadata.get("document_id")
+
         # Convert patient data
-        patient = DictToCCDAConverter._dict_to_patient(data["patient"])
+        if validation is None:
+            patient = DictToCCDAConverter._dict_to_patient(data["patient"])
+        else:
+            patient, errors = validation.convert(
+                "patient",
+                DictToCCDAConverter._dict_to_patient,
+                data["patient"],
+                _location(document_id, "patient"),
+            )
+            if patient is None:
+                validation.reject_document()
+                raise ValidationError(ValidationResult(errors=errors))
 
         # Convert author data
         author = DictToCCDAConverter._dict_to_author(data["author"])
@@ -141,9 +392,7 @@ class DictToCCDAConverter:
         custodian = DictToCCDAConverter._dict_to_organization(data["custodian"])
 
         # Get document metadata
-        doc_metadata = data.get("document", {})
         title = doc_metadata.get("title", "Clinical Summary")
-        document_id = doc_metadata.get("document_id")
         effective_time = doc_metadata.get("effective_time")
         if effective_time and isinstance(effective_time, str):
             effective_time = datetime.fromisoformat(effective_time)
@@ -153,7 +402,9 @@ class DictToCCDAConverter:
         # Build sections if provided
         sections = []
         if "sections" in data:
-            sections = DictToCCDAConverter._build_sections(data["sections"], version)
+            sections = DictToCCDAConverter._build_sections(
+                data["sections"], version, validation, document_id
+            )
 
         # Create and return document
         return ClinicalDocument(
@@ -191,6 +442,31 @@ class DictToCCDAConverter:
 
         return DictToCCDAConverter.from_dict(data)
 
+    @staticmethod
+    def from_dicts(
+        items: Iterable[Dict[str, Any]], validation: Optional[RecordValidation] = None
+    ) -> Iterator[ClinicalDocument]:
+        """Convert a batch of dictionaries, one document at a time.
+
+        Args:
+            items: Document dictionaries (see from_dict)
+            validation: Record validation for the whole batch. Documents whose
+                patient record is rejected are skipped rather than raised.
+
+        Yields:
+            ClinicalDocument instances, in input order
+
+        Raises:
+            ValueError: If a document's structure is invalid
+            ErrorBudgetError: If validation rejects more records than its budget allows
+        """
+        for data in items:
+            try:
+                yield DictToCCDAConverter.from_dict(data, validation=validation)
+            except ValidationError:
+                if validation is None:
+                    raise
+
     @staticmethod
     def to_dict(document: ClinicalDocument) -> Dict[str, Any]:
         """Convert C-CDA document to dictionary.
@@ -313,7 +589,7 @@ class DictToCCDAConverter:
                     else:
                         self.time = time_val
                 else:
-                    self.time = datetime.now()
+                    self.time = now()
                 self.addresses = [
                     DictToCCDAConverter._dict_to_address(addr) for addr in data.get("addresses", [])
                 ]
@@ -329,12 +605,19 @@ class DictToCCDAConverter:
         return Author(data)
 
     @staticmethod
-    def _build_sections(sections_data: List[Dict[str, Any]], version: CDAVersion) -> List:
+    def _build_sections(
+        sections_data: List[Dict[str, Any]],
+        version: CDAVersion,
+        validation: Optional[RecordValidation] = None,
+        document_id: Optional[str] = None,
+    ) -> List:
         """Build section objects from section data.
 
         Args:
             sections_data: List of section dictionaries
             version: C-CDA version to use
+            validation: Record validation applied to each section record
+            document_id: Document ID, used in issue locations
 
         Returns:
             List of section builder instances
@@ -352,7 +635,9 @@ class DictToCCDAConverter:
             section_data = section_def.get("data", [])
 
             # Convert section data to appropriate objects
-            converted_data = DictToCCDAConverter._convert_section_data(section_type, section_data)
+            converted_data = DictToCCDAConverter._convert_section_data(
+                section_type, section_data, validation, document_id
+            )
 
             # Get the section builder class
             builder_class = DictToCCDAConverter.SECTION_BUILDERS[section_type]
@@ -388,12 +673,19 @@ class DictToCCDAConverter:
         return sections
 
     @staticmethod
-    def _convert_section_data(section_type: str, data: List[Dict[str, Any]]) -> List:
+    def _convert_section_data(
+        section_type: str,
+        data: List[Dict[str, Any]],
+        validation: Optional[RecordValidation] = None,
+        document_id: Optional[str] = None,
+    ) -> List:
         """Convert section data to appropriate protocol objects.
 
         Args:
             section_type: Type of section (problems, medications, etc.)
             data: List of dictionaries containing section data
+            validation: Record validation; rejected records are left out
+            document_id: Document ID, used in issue locations
 
         Returns:
             List of protocol-compliant objects
@@ -414,7 +706,16 @@ class DictToCCDAConverter:
         if not converter:
             raise ValueError(f"No converter for section type: {section_type}")
 
-        return [converter(item) for item in data]
+        if validation is None:
+            return [converter(item) for item in data]
+
+        converted = []
+        for index, item in enumerate(data):
+            location = _location(document_id, f"{section_type}[{index}]")
+            record, _ = validation.convert(section_type, converter, item, location)
+            if record is not None:
+                converted.append(record)
+        return converted
 
     @staticmethod
     def _dict_to_problem(data: Dict[str, Any]) -> object:
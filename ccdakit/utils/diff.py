@@ -0,0 +1,362 @@
+"""Structural diff engine for C-CDA documents.
+
+Aligns clinical statement entries across two documents and reports entries
+that were added, removed, or changed, down to individual attribute values.
+
+Entries are matched in two passes, both backed by hash indexes so the whole
+diff stays linear in the number of entries:
+
+1. By section, templateId, and id root/extension.
+2. Entries left over from the first pass are matched by section, templateId,
+   and the codes they carry (used when ids are regenerated between exports).
+
+Matched entries whose content signatures are equal are reported as unchanged
+without a field-by-field comparison.
+
+Example:
+    from ccdakit.utils.diff import diff_documents
+
+    result = diff_documents("inbound.xml", "outbound.xml")
+    for change in result.changed:
+        print(change.label, [c.path for c in change.changes])
+"""
+
+import hashlib
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from lxml import etree
+
+
+NS = "urn:hl7-org:v3"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+
+_ENTRY = f"{{{NS}}}entry"
+_SECTION = f"{{{NS}}}section"
+_TEMPLATE_ID = f"{{{NS}}}templateId"
+_ID = f"{{{NS}}}id"
+_CODE = f"{{{NS}}}code"
+_VALUE = f"{{{NS}}}value"
+_TITLE = f"{{{NS}}}title"
+
+# Elements whose @code/@codeSystem identify an entry when ids are not stable
+_CODED_ELEMENTS = frozenset([_CODE, _VALUE])
+
+DocumentSource = Union[etree._Element, etree._ElementTree, str, bytes, Path]
+
+
+@dataclass
+class AttributeChange:
+    """A single attribute or text value that differs between matched entries."""
+
+    path: str
+    old: Optional[str]
+    new: Optional[str]
+
+
+@dataclass
+class EntrySnapshot:
+    """Flattened view of one section entry used for alignment and comparison."""
+
+    section: str
+    label: str
+    templates: Tuple[Tuple[str, str], ...]
+    ids: Tuple[Tuple[str, str], ...]
+    codes: Tuple[Tuple[str, str], ...]
+    fields: Dict[str, str]
+    signature: str
+
+    @property
+    def id_key(self) -> Optional[tuple]:
+        """Alignment key based on section, templates, and ids (None without ids)."""
+        if not self.ids:
+            return None
+        return (self.section, self.templates, self.ids)
+
+    @property
+    def code_key(self) -> tuple:
+        """Fallback alignment key based on section, templates, and codes."""
+        return (self.section, self.templates, self.codes)
+
+
+@dataclass
+class EntryChange:
+    """An entry that was added, removed, or changed between two documents."""
+
+    section: str
+    label: str
+    status: str  # 'added', 'removed', or 'changed'
+    changes: List[AttributeChange] = field(default_factory=list)
+
+
+@dataclass
+class DocumentDiff:
+    """Result of comparing the entries of two documents."""
+
+    added: List[EntryChange] = field(default_factory=list)
+    removed: List[EntryChange] = field(default_factory=list)
+    changed: List[EntryChange] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    @property
+    def has_differences(self) -> bool:
+        """Check if any entry was added, removed, or changed."""
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def all_changes(self) -> List[EntryChange]:
+        """Get all entry changes in order: removed, added, changed."""
+        return self.removed + self.added + self.changed
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+
+        def change_to_dict(change: EntryChange) -> dict:
+            return {
+                "section": change.section,
+                "entry": change.label,
+                "status": change.status,
+                "changes": [
+                    {"path": c.path, "old": c.old, "new": c.new} for c in change.changes
+                ],
+            }
+
+        return {
+            "added_count": len(self.added),
+            "removed_count": len(self.removed),
+            "changed_count": len(self.changed),
+            "unchanged_count": self.unchanged_count,
+            "added": [change_to_dict(c) for c in self.added],
+            "removed": [change_to_dict(c) for c in self.removed],
+            "changed": [change_to_dict(c) for c in self.changed],
+        }
+
+
+def diff_documents(doc1: DocumentSource, doc2: DocumentSource) -> DocumentDiff:
+    """
+    Compare the entries of two C-CDA documents.
+
+    Args:
+        doc1: First (baseline) document as element, tree, XML string/bytes, or path
+        doc2: Second document in any of the same forms
+
+    Returns:
+        DocumentDiff describing added, removed, and changed entries
+    """
+    return diff_entries(extract_entries(_to_root(doc1)), extract_entries(_to_root(doc2)))
+
+
+def extract_entries(root: etree._Element) -> List[EntrySnapshot]:
+    """
+    Flatten every section entry of a document into snapshots.
+
+    Args:
+        root: ClinicalDocument root element
+
+    Returns:
+        List of EntrySnapshot in document order
+    """
+    snapshots = []
+    for section in root.iter(_SECTION):
+        section_key = _section_key(section)
+        for entry in section.iterchildren(_ENTRY):
+            snapshots.append(_snapshot_entry(section_key, entry))
+    return snapshots
+
+
+def diff_entries(entries1: List[EntrySnapshot], entries2: List[EntrySnapshot]) -> DocumentDiff:
+    """
+    Align two lists of entry snapshots and report the differences.
+
+    Args:
+        entries1: Snapshots from the first (baseline) document
+        entries2: Snapshots from the second document
+
+    Returns:
+        DocumentDiff describing added, removed, and changed entries
+    """
+    result = DocumentDiff()
+    matched2: Set[int] = set()
+    pairs: List[Tuple[EntrySnapshot, EntrySnapshot]] = []
+
+    # Pass 1: align by templateId + id root/extension
+    by_id: Dict[tuple, Deque[int]] = defaultdict(deque)
+    for idx, snapshot in enumerate(entries2):
+        key = snapshot.id_key
+        if key is not None:
+            by_id[key].append(idx)
+
+    leftovers: List[EntrySnapshot] = []
+    for snapshot in entries1:
+        key = snapshot.id_key
+        candidates = by_id.get(key) if key is not None else None
+        if candidates:
+            idx = candidates.popleft()
+            matched2.add(idx)
+            pairs.append((snapshot, entries2[idx]))
+        else:
+            leftovers.append(snapshot)
+
+    # Pass 2: align the remainder by templateId + codes
+    by_code: Dict[tuple, Deque[int]] = defaultdict(deque)
+    for idx, snapshot in enumerate(entries2):
+        if idx not in matched2:
+            by_code[snapshot.code_key].append(idx)
+
+    for snapshot in leftovers:
+        candidates = by_code.get(snapshot.code_key)
+        if candidates:
+            idx = candidates.popleft()
+            matched2.add(idx)
+            pairs.append((snapshot, entries2[idx]))
+        else:
+            result.removed.append(EntryChange(snapshot.section, snapshot.label, "removed"))
+
+    for idx, snapshot in enumerate(entries2):
+        if idx not in matched2:
+            result.added.append(EntryChange(snapshot.section, snapshot.label, "added"))
+
+    for old, new in pairs:
+        if old.signature == new.signature:
+            result.unchanged_count += 1
+            continue
+        result.changed.append(
+            EntryChange(new.section, new.label, "changed", _diff_fields(old.fields, new.fields))
+        )
+
+    return result
+
+
+def _to_root(document: DocumentSource) -> etree._Element:
+    """Parse any supported document source into its root element."""
+    if isinstance(document, etree._ElementTree):
+        return document.getroot()
+    if isinstance(document, etree._Element):
+        return document
+    if isinstance(document, Path):
+        return etree.parse(str(document)).getroot()
+    if isinstance(document, bytes):
+        return etree.fromstring(document)
+    if isinstance(document, str):
+        if document.lstrip().startswith("<"):
+            return etree.fromstring(document.encode("utf-8"))
+        return etree.parse(document).getroot()
+    raise TypeError(
+        f"Unsupported document type: {type(document)}. "
+        "Expected etree._Element, str, bytes, or Path"
+    )
+
+
+def _section_key(section: etree._Element) -> str:
+    """Identify a section by its LOINC code, falling back to its title."""
+    code = section.find(_CODE)
+    if code is not None and code.get("code"):
+        return code.get("code")
+    title = section.find(_TITLE)
+    if title is not None and title.text:
+        return title.text.strip()
+    return ""
+
+
+def _snapshot_entry(section_key: str, entry: etree._Element) -> EntrySnapshot:
+    """Build the alignment keys, flattened fields, and signature for one entry."""
+    # The clinical statement is the first element child of the entry
+    statement = next(entry.iterchildren(tag=etree.Element), None)
+
+    templates: Tuple[Tuple[str, str], ...] = ()
+    ids: Tuple[Tuple[str, str], ...] = ()
+    if statement is not None:
+        templates = tuple(
+            (t.get("root", ""), t.get("extension", ""))
+            for t in statement.iterchildren(_TEMPLATE_ID)
+        )
+        ids = tuple(
+            (i.get("root", ""), i.get("extension", ""))
+            for i in statement.iterchildren(_ID)
+            if i.get("root")
+        )
+
+    codes = []
+    value_code = None
+    fields: Dict[str, str] = {}
+    for path, elem in _walk(entry):
+        if elem.tag in _CODED_ELEMENTS and elem.get("code"):
+            codes.append((elem.get("code"), elem.get("codeSystem", "")))
+            if value_code is None and elem.tag == _VALUE:
+                value_code = elem.get("code")
+        for name, value in elem.attrib.items():
+            fields[f"{path}/@{_attr_name(name)}"] = value
+        text = elem.text.strip() if elem.text else ""
+        if text:
+            fields[f"{path}/text()"] = text
+
+    digest = hashlib.blake2b(digest_size=16)
+    for key, value in fields.items():
+        digest.update(f"{key}\x1f{value}\x1e".encode())
+
+    return EntrySnapshot(
+        section=section_key,
+        label=_entry_label(statement, ids, value_code or (codes[0][0] if codes else None)),
+        templates=templates,
+        ids=ids,
+        codes=tuple(codes),
+        fields=fields,
+        signature=digest.hexdigest(),
+    )
+
+
+def _walk(entry: etree._Element) -> Iterator[Tuple[str, etree._Element]]:
+    """Yield (path, element) for an entry subtree with positional sibling indexes."""
+    stack: List[Tuple[str, etree._Element]] = [("entry", entry)]
+    while stack:
+        path, elem = stack.pop()
+        yield path, elem
+        seen: Dict[str, int] = {}
+        children = []
+        for child in elem.iterchildren(tag=etree.Element):
+            name = etree.QName(child).localname
+            seen[name] = seen.get(name, 0) + 1
+            index = seen[name]
+            child_path = f"{path}/{name}" if index == 1 else f"{path}/{name}[{index}]"
+            children.append((child_path, child))
+        stack.extend(reversed(children))
+
+
+def _attr_name(name: str) -> str:
+    """Render an attribute name, keeping the xsi prefix readable."""
+    if name.startswith(f"{{{XSI_NS}}}"):
+        return "xsi:" + name[len(XSI_NS) + 2 :]
+    return etree.QName(name).localname
+
+
+def _entry_label(
+    statement: Optional[etree._Element],
+    ids: Tuple[Tuple[str, str], ...],
+    code: Optional[str],
+) -> str:
+    """Human-readable label for an entry in reports."""
+    if statement is None:
+        return "entry"
+    label = etree.QName(statement).localname
+    if ids:
+        root, extension = ids[0]
+        label += f" id={extension or root}"
+    if code:
+        label += f" code={code}"
+    return label
+
+
+def _diff_fields(old: Dict[str, str], new: Dict[str, str]) -> List[AttributeChange]:
+    """Compute attribute-level differences between two flattened entries."""
+    changes = []
+    for path, value in old.items():
+        new_value = new.get(path)
+        if new_value != value:
+            changes.append(AttributeChange(path, value, new_value))
+    for path, value in new.items():
+        if path not in old:
+            changes.append(AttributeChange(path, None, value))
+    return changes
+
@@ -310,6 +310,8 @@ class ContinuityOfCareDocument(ClinicalDocument):
     document type codes.
     """
 
+    __slots__ = ()
+
     # CCD-specific templates
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -367,6 +369,8 @@ class DischargeSummary(ClinicalDocument):
     template IDs and document type codes.
     """
 
+    __slots__ = ()
+
     # Discharge Summary templates
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -424,6 +428,8 @@ class ProgressNote(ClinicalDocument):
     template IDs and document type codes.
     """
 
+    __slots__ = ()
+
     # Progress Note templates
     TEMPLATES = {
         CDAVersion.R2_1: [
@@ -481,6 +487,8 @@ class ConsultationNote(ClinicalDocument):
     template IDs and document type codes.
     """
 
+    __slots__ = ()
+
     # Consultation Note templates
     TEMPLATES = {
         CDAVersion.R2_1: [
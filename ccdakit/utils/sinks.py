@@ -0,0 +1,750 @@
+"""Output sinks for writing many serialized documents.
+
+Bulk exports of 10^5 documents and more spend much of their I/O on small
+files. A DocumentSink takes ClinicalDocuments (or serialized XML) one at a
+time and writes them as:
+
+- DirectorySink: one file per document, optionally gzip or xz compressed
+- TarSink: one streaming tar archive, optionally gzip or xz compressed
+- ZipSink: one streaming zip archive (deflate)
+- ContainerSink: newline-delimited JSON records plus an index of byte
+  offsets, read back by document id with ContainerReader
+
+Documents are serialized on the caller's thread. Compression runs on a thread
+pool (zlib and lzma release the GIL), so it overlaps with building the next
+document. Output keeps the order in which documents were written, and at most
+max_pending documents wait for the pool, which bounds memory.
+
+Compressed archives are compressed one document at a time: a .tar.gz is a
+series of gzip members, which gzip, tar and tarfile.open() read as a single
+stream (tarfile's pipe modes, such as "r|gz", stop after the first member).
+Compressed containers are built the same way, so every offset in the index
+points at a member that can be decompressed on its own.
+
+Example:
+    with open_sink("export.tar.gz") as sink:
+        for patient in patients:
+            sink.write(build_document(patient))
+"""
+
+import json
+import lzma
+import os
+import shutil
+import struct
+import tarfile
+import tempfile
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ccdakit.core.canonical import now
+
+
+if TYPE_CHECKING:
+    from ccdakit.builders.document import ClinicalDocument
+
+
+# Supported compressions and their file suffixes
+COMPRESSIONS = {"gzip": ".gz", "xz": ".xz"}
+
+# File names that open_sink() writes as one archive or container
+ARCHIVE_SUFFIXES = (
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.xz",
+    ".txz",
+    ".jsonl",
+    ".jsonl.gz",
+    ".jsonl.xz",
+)
+
+# Characters that may not appear in a document id (ids become file names)
+_RESERVED_ID_CHARACTERS = frozenset("/\\\t\r\n\0")
+
+_TAR_BLOCK = tarfile.BLOCKSIZE
+_TAR_RECORD = tarfile.RECORDSIZE
+
+# Zip record layouts (APPNOTE 4.3.7, 4.3.12, 4.3.14, 4.3.15, 4.3.16)
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_ZIP_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_ZIP64_END = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP_END = struct.Struct("<4s4H2LH")
+_ZIP64_OFFSET_EXTRA = struct.Struct("<2HQ")
+_ZIP_LIMIT = 0xFFFFFFFF
+_ZIP_COUNT_LIMIT = 0xFFFF
+_ZIP_UTF8_FLAG = 0x800
+
+
+def _check_compression(compression: Optional[str]) -> None:
+    """Raise ValueError for an unsupported compression name."""
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression {compression!r} (expected one of: {', '.join(COMPRESSIONS)})"
+        )
+
+
+def compress(data: bytes, compression: Optional[str], level: Optional[int] = None) -> bytes:
+    """
+    Compress data as one gzip member or one xz stream.
+
+    The gzip header carries no file name or time stamp, so equal input gives
+    equal output.
+
+    Args:
+        data: Bytes to compress
+        compression: "gzip", "xz", or None to return data unchanged
+        level: Compression level (gzip 0-9) or preset (xz 0-9); 6 if not provided
+
+    Returns:
+        Compressed bytes
+
+    Raises:
+        ValueError: If the compression is not supported
+    """
+    _check_compression(compression)
+    level = 6 if level is None else level
+    if compression == "gzip":
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    if compression == "xz":
+        return lzma.compress(data, preset=level)
+    return data
+
+
+def decompress(data: bytes, compression: Optional[str]) -> bytes:
+    """
+    Decompress data written by compress().
+
+    Args:
+        data: Compressed bytes (one or more gzip members or xz streams)
+        compression: "gzip", "xz", or None to return data unchanged
+
+    Returns:
+        Decompressed bytes
+
+    Raises:
+        ValueError: If the compression is not supported
+    """
+    _check_compression(compression)
+    if compression == "gzip":
+        # Concatenated members are one stream to gzip; decompress them all
+        chunks = []
+        while data:
+            decompressor = zlib.decompressobj(31)
+            chunks.append(decompressor.decompress(data))
+            data = decompressor.unused_data
+        return b"".join(chunks)
+    if compression == "xz":
+        return lzma.decompress(data)
+    return data
+
+
+def compression_of(path: Union[str, Path]) -> Optional[str]:
+    """
+    Get the compression a file name calls for.
+
+    Args:
+        path: File name (.gz, .tgz, .xz and .txz are recognized)
+
+    Returns:
+        "gzip", "xz", or None
+    """
+    name = str(path).lower()
+    if name.endswith((".gz", ".tgz")):
+        return "gzip"
+    if name.endswith((".xz", ".txz")):
+        return "xz"
+    return None
+
+
+class DocumentSink(ABC):
+    """
+    Base class for document sinks.
+
+    Subclasses implement _encode(), which runs on the thread pool, and
+    _emit(), which runs on the caller's thread in the order documents were
+    written. A sink is not safe to write to from several threads at once.
+    """
+
+    def __init__(
+        self,
+        pretty: bool = False,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Initialize DocumentSink.
+
+        Args:
+            pretty: Pretty-print the XML of written documents
+            workers: Compression threads (default: one per CPU)
+            max_pending: Documents that may wait for compression before
+                write() blocks (default: twice the number of workers)
+            executor: Executor to compress on instead of an owned thread pool
+        """
+        self.pretty = pretty
+        workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * workers
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ccdakit-sink"
+        )
+        self._pending: Deque[Tuple[str, Future[Any]]] = deque()
+        self.count = 0
+        self.closed = False
+
+    def write(self, document: "ClinicalDocument", document_id: Optional[str] = None) -> None:
+        """
+        Serialize a document and queue it for output.
+
+        Args:
+            document: Document builder
+            document_id: Name of the document in the output (default: the
+                document's id extension)
+        """
+        xml = document.to_xml_string(pretty=self.pretty)
+        self.write_xml(document_id or document.document_id, xml)
+
+    def write_xml(self, document_id: str, xml: Union[str, bytes]) -> None:
+        """
+        Queue serialized XML for output.
+
+        Args:
+            document_id: Name of the document in the output
+            xml: Serialized document (str, or UTF-8 bytes)
+
+        Raises:
+            ValueError: If the sink is closed or the id cannot be used as a
+                file name
+        """
+        if self.closed:
+            raise ValueError(f"{type(self).__name__} is closed")
+        _check_document_id(document_id)
+        data = xml.encode("utf-8") if isinstance(xml, str) else xml
+        self._pending.append((document_id, self._executor.submit(self._encode, document_id, data)))
+        while self._pending and (
+            len(self._pending) > self.max_pending or self._pending[0][1].done()
+        ):
+            self._emit_next()
+
+    def close(self) -> None:
+        """Write the remaining documents and any trailer, and close the output."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            while self._pending:
+                self._emit_next()
+            self._finish()
+        finally:
+            for _, future in self._pending:
+                future.cancel()
+            if self._owns_executor:
+                self._executor.shutdown()
+            self._release()
+
+    def _emit_next(self) -> None:
+        """Output the oldest queued document, waiting for its compression."""
+        document_id, future = self._pending.popleft()
+        self._emit(document_id, future.result())
+        self.count += 1
+
+    @abstractmethod
+    def _encode(self, document_id: str, data: bytes) -> Any:
+        """Prepare a document for output (runs on the thread pool)."""
+
+    @abstractmethod
+    def _emit(self, document_id: str, encoded: Any) -> None:
+        """Output a prepared document (runs in write order)."""
+
+    def _finish(self) -> None:  # noqa: B027  # Optional hook
+        """Write what follows the last document."""
+
+    def _release(self) -> None:  # noqa: B027  # Optional hook
+        """Close open files."""
+
+    def __enter__(self) -> "DocumentSink":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Exit context manager, closing the sink."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of sink."""
+        return f"<{type(self).__name__}: {self.count} documents>"
+
+
+class DirectorySink(DocumentSink):
+    """
+    Write each document to its own file, "<document_id>.xml[.gz|.xz]".
+
+    Files are written on the thread pool along with their compression.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Initialize DirectorySink.
+
+        Args:
+            directory: Output directory (created if missing)
+            compression: "gzip", "xz", or None for plain XML files
+            level: Compression level
+            **options: DocumentSink options (pretty, workers, ...)
+        """
+        _check_compression(compression)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.level = level
+        self.suffix = ".xml" + COMPRESSIONS.get(compression, "")
+        super().__init__(**options)
+
+    def _encode(self, document_id: str, data: bytes) -> None:
+        """Compress and write one file."""
+        path = self.directory / f"{document_id}{self.suffix}"
+        path.write_bytes(compress(data, self.compression, self.level))
+
+    def _emit(self, document_id: str, encoded: None) -> None:
+        """Nothing to do; the file was written by _encode()."""
+
+    def __repr__(self) -> str:
+        """String representation of sink."""
+        return f"<DirectorySink: {self.directory}, {self.count} documents>"
+
+
+class TarSink(DocumentSink):
+    """
+    Write documents as "<document_id>.xml" members of one tar archive.
+
+    The archive is written front to back (no seeking), so path may be a pipe.
+    With compression, every member is a separate gzip member or xz stream;
+    read the archive with tarfile.open(path) rather than a pipe mode.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        mtime: Optional[datetime] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Initialize TarSink.
+
+        Args:
+            path: Archive file
+            compression: "gzip", "xz", or None for a plain tar archive
+            level: Compression level
+            mtime: Modification time of the members (current time if not provided)
+            **options: DocumentSink options (pretty, workers, ...)
+        """
+        _check_compression(compression)
+        self.path = Path(path)
+        self.compression = compression
+        self.level = level
+        self.mtime = int((mtime or now()).timestamp())
+        self._size = 0
+        self._file: BinaryIO = open(self.path, "wb")
+        super().__init__(**options)
+
+    def _encode(self, document_id: str, data: bytes) -> Tuple[int, bytes]:
+        """Build and compress one tar member; return its uncompressed size too."""
+        info = tarfile.TarInfo(f"{document_id}.xml")
+        info.size = len(data)
+        info.mtime = self.mtime
+        info.mode = 0o644
+        padding = -len(data) % _TAR_BLOCK
+        member = info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape") + data
+        member += b"\0" * padding
+        return len(member), compress(member, self.compression, self.level)
+
+    def _emit(self, document_id: str, encoded: Tuple[int, bytes]) -> None:
+        """Append one member."""
+        size, member = encoded
+        self._file.write(member)
+        self._size += size
+
+    def _finish(self) -> None:
+        """Write the end-of-archive blocks, padded to a full record."""
+        end = 2 * _TAR_BLOCK
+        end += -(self._size + end) % _TAR_RECORD
+        self._file.write(compress(b"\0" * end, self.compression, self.level))
+
+    def _release(self) -> None:
+        """Close the archive file."""
+        self._file.close()
+
+    def __repr__(self) -> str:
+        """String representation of sink."""
+        return f"<TarSink: {self.path}, {self.count} documents>"
+
+
+class ZipSink(DocumentSink):
+    """
+    Write documents as deflated "<document_id>.xml" entries of one zip archive.
+
+    Entries are deflated on the thread pool and written front to back; the
+    central directory is kept in a temporary file until close(). Zip64 records
+    are added when the archive outgrows the classic format. A single document
+    may not exceed 4 GiB.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        level: Optional[int] = None,
+        mtime: Optional[datetime] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Initialize ZipSink.
+
+        Args:
+            path: Archive file
+            level: Deflate level (6 if not provided)
+            mtime: Modification time of the entries (current time if not provided)
+            **options: DocumentSink options (pretty, workers, ...)
+        """
+        self.path = Path(path)
+        self.level = 6 if level is None else level
+        when = mtime or now()
+        self._dos_date = (max(when.year, 1980) - 1980) << 9 | when.month << 5 | when.day
+        self._dos_time = when.hour << 11 | when.minute << 5 | when.second // 2
+        self._offset = 0
+        self._file: BinaryIO = open(self.path, "wb")
+        self._central = tempfile.TemporaryFile()
+        super().__init__(**options)
+
+    def _encode(self, document_id: str, data: bytes) -> Tuple[int, int, bytes]:
+        """Deflate one entry; return its CRC and uncompressed size too."""
+        if len(data) >= _ZIP_LIMIT:
+            raise ValueError(f"Document {document_id!r} is too large for a zip entry")
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15)
+        return zlib.crc32(data), len(data), compressor.compress(data) + compressor.flush()
+
+    def _emit(self, document_id: str, encoded: Tuple[int, int, bytes]) -> None:
+        """Append one entry and record its central directory header."""
+        crc, size, body = encoded
+        name = f"{document_id}.xml".encode()
+        header = _ZIP_LOCAL_HEADER.pack(
+            b"PK\x03\x04",
+            20,
+            0,
+            _ZIP_UTF8_FLAG,
+            zlib.DEFLATED,
+            self._dos_time,
+            self._dos_date,
+            crc,
+            len(body),
+            size,
+            len(name),
+            0,
+        )
+        self._file.write(header + name)
+        self._file.write(body)
+
+        offset, extra, version = self._offset, b"", 20
+        if offset >= _ZIP_LIMIT:
+            offset, extra, version = _ZIP_LIMIT, _ZIP64_OFFSET_EXTRA.pack(1, 8, self._offset), 45
+        self._central.write(
+            _ZIP_CENTRAL_HEADER.pack(
+                b"PK\x01\x02",
+                version,
+                3,  # Unix, so that external attributes carry the file mode
+                version,
+                0,
+                _ZIP_UTF8_FLAG,
+                zlib.DEFLATED,
+                self._dos_time,
+                self._dos_date,
+                crc,
+                len(body),
+                size,
+                len(name),
+                len(extra),
+                0,
+                0,
+                0,
+                0o100644 << 16,
+                offset,
+            )
+            + name
+            + extra
+        )
+        self._offset += len(header) + len(name) + len(body)
+
+    def _finish(self) -> None:
+        """Write the central directory and end records."""
+        directory_offset = self._offset
+        self._central.seek(0)
+        shutil.copyfileobj(self._central, self._file)
+        directory_size = self._central.tell()
+        if (
+            self.count >= _ZIP_COUNT_LIMIT
+            or directory_offset >= _ZIP_LIMIT
+            or directory_size >= _ZIP_LIMIT
+        ):
+            zip64_end_offset = directory_offset + directory_size
+            self._file.write(
+                _ZIP64_END.pack(
+                    b"PK\x06\x06",
+                    _ZIP64_END.size - 12,
+                    45,
+                    45,
+                    0,
+                    0,
+                    self.count,
+                    self.count,
+                    directory_size,
+                    directory_offset,
+                )
+            )
+            self._file.write(_ZIP64_LOCATOR.pack(b"PK\x06\x07", 0, zip64_end_offset, 1))
+        count = min(self.count, _ZIP_COUNT_LIMIT)
+        self._file.write(
+            _ZIP_END.pack(
+                b"PK\x05\x06",
+                0,
+                0,
+                count,
+                count,
+                min(directory_size, _ZIP_LIMIT),
+                min(directory_offset, _ZIP_LIMIT),
+                0,
+            )
+        )
+
+    def _release(self) -> None:
+        """Close the archive and the temporary central directory."""
+        self._central.close()
+        self._file.close()
+
+    def __repr__(self) -> str:
+        """String representation of sink."""
+        return f"<ZipSink: {self.path}, {self.count} documents>"
+
+
+class ContainerSink(DocumentSink):
+    """
+    Write documents as newline-delimited JSON records with an offset index.
+
+    Each record is one line, {"document_id": ..., "xml": ...}. With
+    compression, each line is compressed on its own, so the file is a valid
+    .gz/.xz stream and every record can still be read in isolation.
+
+    The index is a text file with one line per record:
+    "<document_id>\\t<byte offset>\\t<byte length>". Offsets and lengths are
+    those of the (compressed) record in the container file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        index_path: Optional[Union[str, Path]] = None,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Initialize ContainerSink.
+
+        Args:
+            path: Container file
+            index_path: Index file (default: path with ".idx" appended)
+            compression: "gzip", "xz", or None for plain JSON lines
+            level: Compression level
+            **options: DocumentSink options (pretty, workers, ...)
+        """
+        _check_compression(compression)
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else _default_index_path(self.path)
+        self.compression = compression
+        self.level = level
+        self._offset = 0
+        self._file: BinaryIO = open(self.path, "wb")
+        self._index = open(self.index_path, "w", encoding="utf-8", newline="\n")
+        super().__init__(**options)
+
+    def _encode(self, document_id: str, data: bytes) -> bytes:
+        """Build and compress one record."""
+        record = {"document_id": document_id, "xml": data.decode("utf-8")}
+        line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        return compress(line, self.compression, self.level)
+
+    def _emit(self, document_id: str, encoded: bytes) -> None:
+        """Append one record and its index line."""
+        self._file.write(encoded)
+        self._index.write(f"{document_id}\t{self._offset}\t{len(encoded)}\n")
+        self._offset += len(encoded)
+
+    def _release(self) -> None:
+        """Close the container and index files."""
+        self._index.close()
+        self._file.close()
+
+    def __repr__(self) -> str:
+        """String representation of sink."""
+        return f"<ContainerSink: {self.path}, {self.count} documents>"
+
+
+class ContainerReader:
+    """
+    Random access to the documents of a ContainerSink file through its index.
+
+    Example:
+        with ContainerReader("export.jsonl.gz") as reader:
+            xml = reader.read("DOC-123")
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        index_path: Optional[Union[str, Path]] = None,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize ContainerReader, loading the index.
+
+        Args:
+            path: Container file
+            index_path: Index file (default: path with ".idx" appended)
+            compression: Compression of the records (default: from the file name)
+        """
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else _default_index_path(self.path)
+        self.compression = compression or compression_of(self.path)
+        _check_compression(self.compression)
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        with open(self.index_path, encoding="utf-8") as index:
+            for line in index:
+                document_id, offset, length = line.rstrip("\n").split("\t")
+                self._offsets[document_id] = (int(offset), int(length))
+        self._file: Optional[BinaryIO] = None
+
+    def read(self, document_id: str) -> str:
+        """
+        Read one document.
+
+        Args:
+            document_id: Id the document was written under
+
+        Returns:
+            Serialized XML
+
+        Raises:
+            KeyError: If the container has no such document
+        """
+        offset, length = self._offsets[document_id]
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        self._file.seek(offset)
+        line = decompress(self._file.read(length), self.compression)
+        return json.loads(line)["xml"]
+
+    def keys(self) -> List[str]:
+        """Document ids in container order."""
+        return list(self._offsets)
+
+    def close(self) -> None:
+        """Close the container file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, document_id: object) -> bool:
+        """Check whether the container has a document."""
+        return document_id in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over document ids in container order."""
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        """Number of documents in the container."""
+        return len(self._offsets)
+
+    def __enter__(self) -> "ContainerReader":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Exit context manager, closing the container file."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of reader."""
+        return f"<ContainerReader: {self.path}, {len(self)} documents>"
+
+
+def open_sink(
+    path: Union[str, Path], compression: Optional[str] = None, **options: Any
+) -> DocumentSink:
+    """
+    Open the sink a path's name calls for.
+
+    - .zip: ZipSink
+    - .tar, .tar.gz, .tgz, .tar.xz, .txz: TarSink
+    - .jsonl, .jsonl.gz, .jsonl.xz: ContainerSink
+    - anything else: DirectorySink, using compression for every file
+
+    Args:
+        path: Archive, container or directory
+        compression: Per-file compression of a directory ("gzip" or "xz");
+            archives and containers take theirs from the file name
+        **options: Sink options (pretty, workers, max_pending, level, ...)
+
+    Returns:
+        Open sink; close it (or use it as a context manager) when done
+    """
+    name = str(path).lower()
+    if name.endswith(".zip"):
+        return ZipSink(path, **options)
+    if name.endswith((".tar", ".tar.gz", ".tgz", ".tar.xz", ".txz")):
+        return TarSink(path, compression=compression_of(name), **options)
+    if name.endswith((".jsonl", ".jsonl.gz", ".jsonl.xz")):
+        return ContainerSink(path, compression=compression_of(name), **options)
+    return DirectorySink(path, compression=compression, **options)
+
+
+def _default_index_path(path: Path) -> Path:
+    """Index file that goes with a container file."""
+    return path.with_name(path.name + ".idx")
+
+
+def _check_document_id(document_id: str) -> None:
+    """Raise ValueError for ids that cannot name a file or index line."""
+    if (
+        not document_id
+        or document_id in (".", "..")
+        or not _RESERVED_ID_CHARACTERS.isdisjoint(document_id)
+    ):
+        raise ValueError(f"Invalid document_id for output: {document_id!r}")
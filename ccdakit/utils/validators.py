@@ -4,13 +4,84 @@ This module provides pre-build validation utilities to catch errors early
 and ensure data quality before creating C-CDA documents.
 """
 
+import dataclasses
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from ccdakit.core.validation import ValidationIssue, ValidationLevel, ValidationResult
 from ccdakit.utils.code_systems import CodeSystemRegistry
 
 
+# A batch of records: a list of dicts, or a dict of equally long columns
+Records = Union[Sequence[Dict[str, Any]], Dict[str, Sequence[Any]]]
+
+
+@dataclass
+class BatchValidationResult:
+    """Result of validating a batch of records, as row indices per issue.
+
+    Issues are keyed "<CODE>:<field>" (for example "MISSING_FIELD:code" or
+    "INVALID_VALUE:status"); nested fields are dotted ("INVALID_VALUE:results.status").
+    Each key maps to the sorted indices of the rows that have the issue.
+    Rows without issues cost nothing, so a 500k-row feed with a handful of bad
+    rows produces a handful of integers rather than 500k ValidationResults.
+    """
+
+    size: int
+    errors: Dict[str, List[int]] = dataclasses.field(default_factory=dict)
+    warnings: Dict[str, List[int]] = dataclasses.field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if no row has errors."""
+        return not self.errors
+
+    @property
+    def error_rows(self) -> List[int]:
+        """Get the sorted indices of rows with at least one error."""
+        return sorted({row for rows in self.errors.values() for row in rows})
+
+    @property
+    def warning_rows(self) -> List[int]:
+        """Get the sorted indices of rows with at least one warning."""
+        return sorted({row for rows in self.warnings.values() for row in rows})
+
+    def valid_rows(self) -> List[int]:
+        """Get the indices of rows without errors."""
+        invalid = set(self.error_rows)
+        return [row for row in range(self.size) if row not in invalid]
+
+    def row_errors(self, row: int) -> List[str]:
+        """Get the error keys of one row."""
+        return [key for key, rows in self.errors.items() if row in rows]
+
+    def row_warnings(self, row: int) -> List[str]:
+        """Get the warning keys of one row."""
+        return [key for key, rows in self.warnings.items() if row in rows]
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "size": self.size,
+            "is_valid": self.is_valid,
+            "error_count": len(self.error_rows),
+            "warning_count": len(self.warning_rows),
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
 class DataValidator:
     """Validate data before building C-CDA elements.
 
@@ -40,6 +111,42 @@ class DataValidator:
     # Valid value types for results
     VALID_VALUE_TYPES = {"PQ", "CD", "ST"}  # Physical Quantity, Coded, String
 
+    # Required fields of each record type
+    _PATIENT_REQUIRED = ["first_name", "last_name", "date_of_birth", "sex"]
+    _ADDRESS_REQUIRED = ["city", "state", "postal_code", "country"]
+    _TELECOM_REQUIRED = ["type", "value"]
+    _PROBLEM_REQUIRED = ["name", "code", "code_system", "status"]
+    _MEDICATION_REQUIRED = [
+        "name",
+        "code",
+        "dosage",
+        "route",
+        "frequency",
+        "start_date",
+        "status",
+    ]
+    _ALLERGY_REQUIRED = ["allergen", "allergy_type", "status"]
+    _IMMUNIZATION_REQUIRED = ["vaccine_name", "cvx_code", "administration_date", "status"]
+    _VITAL_SIGNS_REQUIRED = ["date", "vital_signs"]
+    _VITAL_SIGN_REQUIRED = ["type", "code", "value", "unit"]
+    _PROCEDURE_REQUIRED = ["name", "code", "code_system", "status"]
+    _RESULT_REQUIRED = ["panel_name", "panel_code", "status", "effective_time", "results"]
+    _RESULT_OBSERVATION_REQUIRED = ["test_name", "test_code", "value", "status", "effective_time"]
+    _ENCOUNTER_REQUIRED = ["encounter_type", "code", "code_system"]
+    _SMOKING_STATUS_REQUIRED = ["smoking_status", "code", "date"]
+
+    # Record validators
+    #
+    # Each record type has two validators. The *_data validators check one
+    # record directly and return its issues with their messages. The *_batch
+    # validators check a batch one column at a time (see the _check_* methods
+    # below) and return the failing rows per issue, with code format and code
+    # system lookups run once per distinct value. Both check the same fields
+    # in the same order, from the same required-field lists and row predicates
+    # (the module-level functions below DataValidator). Records missing a
+    # required field are only reported for the missing fields. Absent fields
+    # and fields set to None are treated alike.
+
     @staticmethod
     def validate_patient_data(patient: Dict[str, Any]) -> ValidationResult:
         """Validate patient demographic data.
@@ -61,149 +168,55 @@ class DataValidator:
             >>> result.is_valid
             True
         """
-        errors = []
-        warnings = []
-
-        # Check required fields
-        required = ["first_name", "last_name", "date_of_birth", "sex"]
-        missing = DataValidator.validate_required_fields(patient, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
-
-        # If required fields are missing, return early
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(patient, DataValidator._PATIENT_REQUIRED)
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
-
-        # Validate data types
-        if not isinstance(patient.get("first_name"), str):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="first_name must be a string",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        if not isinstance(patient.get("last_name"), str):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="last_name must be a string",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        # Validate date of birth
-        dob = patient.get("date_of_birth")
-        if dob is not None:
-            if not isinstance(dob, date):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="date_of_birth must be a date object",
-                        code="INVALID_TYPE",
-                    )
-                )
-            elif dob > date.today():
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="date_of_birth cannot be in the future",
-                        code="INVALID_DATE",
-                    )
-                )
-            elif dob < date(1900, 1, 1):
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message="date_of_birth is before 1900, please verify",
-                        code="SUSPICIOUS_DATE",
-                    )
-                )
-
-        # Validate sex
-        sex = patient.get("sex")
-        if sex is not None and sex not in DataValidator.VALID_SEX:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"sex must be one of {DataValidator.VALID_SEX}, got '{sex}'",
-                    code="INVALID_VALUE",
-                )
+            return ValidationResult(errors=_missing_field_errors(missing))
+
+        if not isinstance(patient["first_name"], str):
+            errors.append(_error("INVALID_TYPE", "first_name must be a string"))
+        if not isinstance(patient["last_name"], str):
+            errors.append(_error("INVALID_TYPE", "last_name must be a string"))
+        dob = patient["date_of_birth"]
+        if not isinstance(dob, date):
+            errors.append(_error("INVALID_TYPE", "date_of_birth must be a date object"))
+        elif _is_future(dob):
+            errors.append(_error("INVALID_DATE", "date_of_birth cannot be in the future"))
+        elif _is_before_1900(dob):
+            warnings.append(
+                _warning("SUSPICIOUS_DATE", "date_of_birth is before 1900, please verify")
             )
-
-        # Validate optional fields
-        if "addresses" in patient:
-            if not isinstance(patient["addresses"], list):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="addresses must be a list",
-                        code="INVALID_TYPE",
-                    )
-                )
+        sex = patient["sex"]
+        if sex and sex not in DataValidator.VALID_SEX:
+            errors.append(_not_in_set_error("sex", DataValidator.VALID_SEX, sex))
+
+        addresses = patient.get("addresses")
+        if addresses is not None:
+            if not isinstance(addresses, list):
+                errors.append(_error("INVALID_TYPE", "addresses must be a list"))
             else:
-                for i, addr in enumerate(patient["addresses"]):
-                    addr_result = DataValidator._validate_address(addr)
-                    for issue in addr_result.errors:
-                        errors.append(
-                            ValidationIssue(
-                                level=issue.level,
-                                message=f"Address {i}: {issue.message}",
-                                code=issue.code,
-                            )
-                        )
-
-        if "telecoms" in patient:
-            if not isinstance(patient["telecoms"], list):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="telecoms must be a list",
-                        code="INVALID_TYPE",
-                    )
-                )
+                for i, address in enumerate(addresses):
+                    issues = DataValidator._validate_address(address).errors
+                    if issues:
+                        errors.extend(_prefixed(issues, f"Address {i}: "))
+        telecoms = patient.get("telecoms")
+        if telecoms is not None:
+            if not isinstance(telecoms, list):
+                errors.append(_error("INVALID_TYPE", "telecoms must be a list"))
             else:
-                for i, telecom in enumerate(patient["telecoms"]):
-                    telecom_result = DataValidator._validate_telecom(telecom)
-                    for issue in telecom_result.errors:
-                        errors.append(
-                            ValidationIssue(
-                                level=issue.level,
-                                message=f"Telecom {i}: {issue.message}",
-                                code=issue.code,
-                            )
-                        )
+                # Only errors: use is not reported for patient telecoms
+                for i, telecom in enumerate(telecoms):
+                    issues = DataValidator._validate_telecom(telecom).errors
+                    if issues:
+                        errors.extend(_prefixed(issues, f"Telecom {i}: "))
 
         # Validate race/ethnicity codes if provided
-        if "race" in patient and patient["race"] is not None:
-            if not DataValidator.validate_code_system("Race"):
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message="Could not validate race code system",
-                        code="UNKNOWN_CODE_SYSTEM",
-                    )
-                )
-
-        if "ethnicity" in patient and patient["ethnicity"] is not None:
-            if not DataValidator.validate_code_system("Ethnicity"):
+        for name, system in (("race", "Race"), ("ethnicity", "Ethnicity")):
+            if patient.get(name) is not None and not DataValidator.validate_code_system(system):
                 warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message="Could not validate ethnicity code system",
-                        code="UNKNOWN_CODE_SYSTEM",
-                    )
+                    _warning("UNKNOWN_CODE_SYSTEM", f"Could not validate {name} code system")
                 )
-
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -216,131 +229,42 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
-
-        # Check required fields
-        required = ["name", "code", "code_system", "status"]
-        missing = DataValidator.validate_required_fields(problem, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
-
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(problem, DataValidator._PROBLEM_REQUIRED)
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
-
-        # Validate data types
-        if not isinstance(problem.get("name"), str):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="name must be a string",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        if not isinstance(problem.get("code"), str):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="code must be a string",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        # Validate code system
-        code_system = problem.get("code_system")
+            return ValidationResult(errors=_missing_field_errors(missing))
+
+        if not isinstance(problem["name"], str):
+            errors.append(_error("INVALID_TYPE", "name must be a string"))
+        code = problem["code"]
+        if not isinstance(code, str):
+            errors.append(_error("INVALID_TYPE", "code must be a string"))
+        code_system = problem["code_system"]
         if code_system and not DataValidator.validate_code_system(code_system):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"Unknown code system: {code_system}",
-                    code="UNKNOWN_CODE_SYSTEM",
-                )
-            )
-
-        # Validate code format
-        code = problem.get("code")
-        if code and code_system:
-            if not DataValidator.validate_code(code, code_system):
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message=f"Code '{code}' does not match expected format for {code_system}",
-                        code="INVALID_CODE_FORMAT",
-                    )
-                )
-
-        # Validate status
-        status = problem.get("status")
+            warnings.append(_unknown_code_system_warning(code_system))
+        if _has_invalid_format(code, code_system):
+            message = f"Code '{code}' does not match expected format for {code_system}"
+            warnings.append(_warning("INVALID_CODE_FORMAT", message))
+        status = problem["status"]
         if status and status not in DataValidator.VALID_PROBLEM_STATUS:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_PROBLEM_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
-            )
-
-        # Validate dates
+            errors.append(_not_in_set_error("status", DataValidator.VALID_PROBLEM_STATUS, status))
         onset = problem.get("onset_date")
         resolved = problem.get("resolved_date")
-
         if onset is not None and not isinstance(onset, date):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="onset_date must be a date object",
-                    code="INVALID_TYPE",
-                )
-            )
-
+            errors.append(_error("INVALID_TYPE", "onset_date must be a date object"))
         if resolved is not None and not isinstance(resolved, date):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="resolved_date must be a date object",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        # Validate date logic
-        if onset and resolved:
-            if not DataValidator.validate_date_range(onset, resolved):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="resolved_date must be after onset_date",
-                        code="INVALID_DATE_RANGE",
-                    )
-                )
+            errors.append(_error("INVALID_TYPE", "resolved_date must be a date object"))
+        if _ends_before_start(onset, resolved):
+            errors.append(_error("INVALID_DATE_RANGE", "resolved_date must be after onset_date"))
 
         # Validate status consistency
-        if status == "resolved" and not resolved:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message="Problem marked as resolved but no resolved_date provided",
-                    code="INCONSISTENT_DATA",
-                )
-            )
-
-        if status != "resolved" and resolved:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message="Problem has resolved_date but status is not 'resolved'",
-                    code="INCONSISTENT_DATA",
-                )
-            )
-
+        if _resolved_without_date(status, resolved):
+            message = "Problem marked as resolved but no resolved_date provided"
+            warnings.append(_warning("INCONSISTENT_DATA", message))
+        if _resolved_date_without_status(status, resolved):
+            message = "Problem has resolved_date but status is not 'resolved'"
+            warnings.append(_warning("INCONSISTENT_DATA", message))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -353,90 +277,36 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
-
-        # Check required fields
-        required = ["name", "code", "dosage", "route", "frequency", "start_date", "status"]
-        missing = DataValidator.validate_required_fields(medication, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(
+            medication, DataValidator._MEDICATION_REQUIRED
         )
-
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
-
-        # Validate code (should be RxNorm)
-        code = medication.get("code")
-        if code and not DataValidator.validate_code(code, "RxNorm"):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"Code '{code}' does not match expected RxNorm format",
-                    code="INVALID_CODE_FORMAT",
-                )
-            )
+            return ValidationResult(errors=_missing_field_errors(missing))
 
-        # Validate status
-        status = medication.get("status")
+        code = medication["code"]
+        if _has_invalid_format(code, "RxNorm"):
+            message = f"Code '{code}' does not match expected RxNorm format"
+            warnings.append(_warning("INVALID_CODE_FORMAT", message))
+        status = medication["status"]
         if status and status not in DataValidator.VALID_MEDICATION_STATUS:
             errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_MEDICATION_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
+                _not_in_set_error("status", DataValidator.VALID_MEDICATION_STATUS, status)
             )
-
-        # Validate dates
-        start = medication.get("start_date")
+        start = medication["start_date"]
         end = medication.get("end_date")
-
-        if start is not None and not isinstance(start, date):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="start_date must be a date object",
-                    code="INVALID_TYPE",
-                )
-            )
-
+        if not isinstance(start, date):
+            errors.append(_error("INVALID_TYPE", "start_date must be a date object"))
         if end is not None and not isinstance(end, date):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="end_date must be a date object",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        if start and end:
-            if not DataValidator.validate_date_range(start, end):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="end_date must be after start_date",
-                        code="INVALID_DATE_RANGE",
-                    )
-                )
+            errors.append(_error("INVALID_TYPE", "end_date must be a date object"))
+        if _ends_before_start(start, end):
+            errors.append(_error("INVALID_DATE_RANGE", "end_date must be after start_date"))
 
         # Validate status consistency
-        if status in ["completed", "discontinued"] and not end:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"Medication status is '{status}' but no end_date provided",
-                    code="INCONSISTENT_DATA",
-                )
-            )
-
+        if _ended_without_end_date(status, end):
+            message = f"Medication status is '{status}' but no end_date provided"
+            warnings.append(_warning("INCONSISTENT_DATA", message))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -449,99 +319,41 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
-
-        # Check required fields
-        required = ["allergen", "allergy_type", "status"]
-        missing = DataValidator.validate_required_fields(allergy, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
-
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(allergy, DataValidator._ALLERGY_REQUIRED)
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+            return ValidationResult(errors=_missing_field_errors(missing))
 
-        # Validate allergy type
-        allergy_type = allergy.get("allergy_type")
+        allergy_type = allergy["allergy_type"]
         if allergy_type and allergy_type not in DataValidator.VALID_ALLERGY_TYPE:
             errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"allergy_type must be one of {DataValidator.VALID_ALLERGY_TYPE}, got '{allergy_type}'",
-                    code="INVALID_VALUE",
-                )
+                _not_in_set_error("allergy_type", DataValidator.VALID_ALLERGY_TYPE, allergy_type)
             )
-
-        # Validate status
-        status = allergy.get("status")
+        status = allergy["status"]
         if status and status not in DataValidator.VALID_ALLERGY_STATUS:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_ALLERGY_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
-            )
-
-        # Validate severity if provided
+            errors.append(_not_in_set_error("status", DataValidator.VALID_ALLERGY_STATUS, status))
         severity = allergy.get("severity")
         if severity and severity not in DataValidator.VALID_ALLERGY_SEVERITY:
             warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"severity should be one of {DataValidator.VALID_ALLERGY_SEVERITY}, got '{severity}'",
-                    code="INVALID_VALUE",
-                )
+                _not_in_set_warning("severity", DataValidator.VALID_ALLERGY_SEVERITY, severity)
             )
 
         # Validate code system if code is provided
-        if "allergen_code" in allergy and allergy["allergen_code"]:
-            code_system = allergy.get("allergen_code_system")
-            if not code_system:
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message="allergen_code provided but allergen_code_system is missing",
-                        code="MISSING_FIELD",
-                    )
-                )
-            elif not DataValidator.validate_code_system(code_system):
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message=f"Unknown code system: {code_system}",
-                        code="UNKNOWN_CODE_SYSTEM",
-                    )
-                )
+        allergen_code = allergy.get("allergen_code")
+        code_system = allergy.get("allergen_code_system")
+        if _given_without(allergen_code, code_system):
+            message = "allergen_code provided but allergen_code_system is missing"
+            warnings.append(_warning("MISSING_FIELD", message))
+        elif allergen_code and code_system and not DataValidator.validate_code_system(code_system):
+            warnings.append(_unknown_code_system_warning(code_system))
 
-        # Validate onset date
         onset = allergy.get("onset_date")
         if onset is not None:
             if not isinstance(onset, date):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="onset_date must be a date object",
-                        code="INVALID_TYPE",
-                    )
-                )
-            elif onset > date.today():
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message="onset_date is in the future",
-                        code="SUSPICIOUS_DATE",
-                    )
-                )
-
+                errors.append(_error("INVALID_TYPE", "onset_date must be a date object"))
+            elif _is_future(onset):
+                warnings.append(_warning("SUSPICIOUS_DATE", "onset_date is in the future"))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -554,71 +366,28 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
-
-        # Check required fields
-        required = ["vaccine_name", "cvx_code", "administration_date", "status"]
-        missing = DataValidator.validate_required_fields(immunization, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(
+            immunization, DataValidator._IMMUNIZATION_REQUIRED
         )
-
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
-
-        # Validate CVX code format
-        cvx_code = immunization.get("cvx_code")
-        if cvx_code and not DataValidator.validate_code(cvx_code, "CVX"):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"cvx_code '{cvx_code}' does not match expected CVX format",
-                    code="INVALID_CODE_FORMAT",
-                )
-            )
+            return ValidationResult(errors=_missing_field_errors(missing))
 
-        # Validate status
-        status = immunization.get("status")
+        cvx_code = immunization["cvx_code"]
+        if _has_invalid_format(cvx_code, "CVX"):
+            warnings.append(_code_format_warning("cvx_code", cvx_code, "CVX"))
+        status = immunization["status"]
         if status and status not in DataValidator.VALID_IMMUNIZATION_STATUS:
             errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_IMMUNIZATION_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
+                _not_in_set_error("status", DataValidator.VALID_IMMUNIZATION_STATUS, status)
             )
-
-        # Validate administration date
-        admin_date = immunization.get("administration_date")
-        if admin_date is not None:
-            if not isinstance(admin_date, (date, datetime)):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="administration_date must be a date or datetime object",
-                        code="INVALID_TYPE",
-                    )
-                )
-            else:
-                # Convert to date for comparison
-                check_date = admin_date.date() if isinstance(admin_date, datetime) else admin_date
-                if check_date > date.today():
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message="administration_date is in the future",
-                            code="SUSPICIOUS_DATE",
-                        )
-                    )
-
+        administered = immunization["administration_date"]
+        if not isinstance(administered, date):
+            message = "administration_date must be a date or datetime object"
+            errors.append(_error("INVALID_TYPE", message))
+        elif _is_future(administered):
+            warnings.append(_warning("SUSPICIOUS_DATE", "administration_date is in the future"))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -631,78 +400,27 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
-
-        # Check required fields for organizer
-        required = ["date", "vital_signs"]
-        missing = DataValidator.validate_required_fields(vital_signs, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(
+            vital_signs, DataValidator._VITAL_SIGNS_REQUIRED
         )
-
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
-
-        # Validate date
-        vs_date = vital_signs.get("date")
-        if vs_date is not None and not isinstance(vs_date, (date, datetime)):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="date must be a date or datetime object",
-                    code="INVALID_TYPE",
-                )
-            )
-
-        # Validate vital signs list
-        vs_list = vital_signs.get("vital_signs")
-        if not isinstance(vs_list, list):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="vital_signs must be a list",
-                    code="INVALID_TYPE",
-                )
-            )
-            return ValidationResult(errors=errors, warnings=warnings)
-
-        if len(vs_list) == 0:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message="vital_signs list is empty",
-                    code="EMPTY_LIST",
-                )
-            )
-
-        # Validate each vital sign
-        for i, vs in enumerate(vs_list):
-            vs_result = DataValidator._validate_single_vital_sign(vs)
-            for issue in vs_result.errors:
-                errors.append(
-                    ValidationIssue(
-                        level=issue.level,
-                        message=f"Vital sign {i}: {issue.message}",
-                        code=issue.code,
-                    )
-                )
-            for issue in vs_result.warnings:
-                warnings.append(
-                    ValidationIssue(
-                        level=issue.level,
-                        message=f"Vital sign {i}: {issue.message}",
-                        code=issue.code,
-                    )
-                )
-
+            return ValidationResult(errors=_missing_field_errors(missing))
+
+        if not isinstance(vital_signs["date"], date):
+            errors.append(_error("INVALID_TYPE", "date must be a date or datetime object"))
+        observations = vital_signs["vital_signs"]
+        if not isinstance(observations, list):
+            errors.append(_error("INVALID_TYPE", "vital_signs must be a list"))
+        elif not observations:
+            warnings.append(_warning("EMPTY_LIST", "vital_signs list is empty"))
+        else:
+            for i, observation in enumerate(observations):
+                item = DataValidator._validate_single_vital_sign(observation)
+                if item.errors or item.warnings:
+                    errors.extend(_prefixed(item.errors, f"Vital sign {i}: "))
+                    warnings.extend(_prefixed(item.warnings, f"Vital sign {i}: "))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -715,82 +433,31 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
-
-        # Check required fields
-        required = ["name", "code", "code_system", "status"]
-        missing = DataValidator.validate_required_fields(procedure, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(
+            procedure, DataValidator._PROCEDURE_REQUIRED
         )
-
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+            return ValidationResult(errors=_missing_field_errors(missing))
 
-        # Validate code system
-        code_system = procedure.get("code_system")
+        code_system = procedure["code_system"]
         if code_system and not DataValidator.validate_code_system(code_system):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"Unknown code system: {code_system}",
-                    code="UNKNOWN_CODE_SYSTEM",
-                )
-            )
-
-        # Validate status
-        status = procedure.get("status")
+            warnings.append(_unknown_code_system_warning(code_system))
+        status = procedure["status"]
         if status and status not in DataValidator.VALID_PROCEDURE_STATUS:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_PROCEDURE_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
-            )
-
-        # Validate date
-        proc_date = procedure.get("date")
-        if proc_date is not None:
-            if not isinstance(proc_date, (date, datetime)):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="date must be a date or datetime object",
-                        code="INVALID_TYPE",
-                    )
-                )
-            else:
-                # Convert to date for comparison
-                check_date = proc_date.date() if isinstance(proc_date, datetime) else proc_date
-                if check_date > date.today():
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message="Procedure date is in the future",
-                            code="SUSPICIOUS_DATE",
-                        )
-                    )
+            errors.append(_not_in_set_error("status", DataValidator.VALID_PROCEDURE_STATUS, status))
+        performed = procedure.get("date")
+        if performed is not None:
+            if not isinstance(performed, date):
+                errors.append(_error("INVALID_TYPE", "date must be a date or datetime object"))
+            elif _is_future(performed):
+                warnings.append(_warning("SUSPICIOUS_DATE", "Procedure date is in the future"))
 
         # Validate target site code if provided
-        if "target_site_code" in procedure and procedure["target_site_code"]:
-            if not procedure.get("target_site"):
-                warnings.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        message="target_site_code provided but target_site name is missing",
-                        code="MISSING_FIELD",
-                    )
-                )
-
+        if _given_without(procedure.get("target_site_code"), procedure.get("target_site")):
+            message = "target_site_code provided but target_site name is missing"
+            warnings.append(_warning("MISSING_FIELD", message))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
@@ -803,241 +470,250 @@ class DataValidator:
         Returns:
             ValidationResult with any validation issues found
         """
-        errors = []
-        warnings = []
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(result, DataValidator._RESULT_REQUIRED)
+        if missing:
+            return ValidationResult(errors=_missing_field_errors(missing))
 
-        # Check required fields for organizer
-        required = ["panel_name", "panel_code", "status", "effective_time", "results"]
-        missing = DataValidator.validate_required_fields(result, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+        panel_code = result["panel_code"]
+        if _has_invalid_format(panel_code, "LOINC"):
+            warnings.append(_code_format_warning("panel_code", panel_code, "LOINC"))
+        status = result["status"]
+        if status and status not in DataValidator.VALID_RESULT_STATUS:
+            errors.append(_not_in_set_error("status", DataValidator.VALID_RESULT_STATUS, status))
+        if not isinstance(result["effective_time"], date):
+            message = "effective_time must be a date or datetime object"
+            errors.append(_error("INVALID_TYPE", message))
+        observations = result["results"]
+        if not isinstance(observations, (list, tuple)):
+            errors.append(_error("INVALID_TYPE", "results must be a list or tuple"))
+        elif not observations:
+            warnings.append(_warning("EMPTY_LIST", "results list is empty"))
+        else:
+            for i, observation in enumerate(observations):
+                item = DataValidator._validate_result_observation(observation)
+                if item.errors or item.warnings:
+                    errors.extend(_prefixed(item.errors, f"Result {i}: "))
+                    warnings.extend(_prefixed(item.warnings, f"Result {i}: "))
+        return ValidationResult(errors=errors, warnings=warnings)
+
+    @staticmethod
+    def validate_encounter_data(encounter: Dict[str, Any]) -> ValidationResult:
+        """Validate encounter data.
+
+        Args:
+            encounter: Dictionary containing encounter data
+
+        Returns:
+            ValidationResult with any validation issues found
+        """
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(
+            encounter, DataValidator._ENCOUNTER_REQUIRED
         )
+        if missing:
+            return ValidationResult(errors=_missing_field_errors(missing))
+
+        code_system = encounter["code_system"]
+        if code_system and not DataValidator.validate_code_system(code_system):
+            warnings.append(_unknown_code_system_warning(code_system))
+        start = encounter.get("date")
+        end = encounter.get("end_date")
+        if start is not None and not isinstance(start, date):
+            errors.append(_error("INVALID_TYPE", "date must be a date or datetime object"))
+        if end is not None and not isinstance(end, date):
+            errors.append(_error("INVALID_TYPE", "end_date must be a date or datetime object"))
+        if _ends_before_start(start, end):
+            errors.append(_error("INVALID_DATE_RANGE", "end_date must be after date"))
+        return ValidationResult(errors=errors, warnings=warnings)
+
+    @staticmethod
+    def validate_smoking_status_data(smoking_status: Dict[str, Any]) -> ValidationResult:
+        """Validate smoking status data.
+
+        Args:
+            smoking_status: Dictionary containing smoking status data
 
+        Returns:
+            ValidationResult with any validation issues found
+        """
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        missing = DataValidator.validate_required_fields(
+            smoking_status, DataValidator._SMOKING_STATUS_REQUIRED
+        )
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+            return ValidationResult(errors=_missing_field_errors(missing))
+
+        code = smoking_status["code"]
+        if _has_invalid_format(code, "SNOMED"):
+            warnings.append(_code_format_warning("code", code, "SNOMED"))
+        observed = smoking_status["date"]
+        if not isinstance(observed, date):
+            errors.append(_error("INVALID_TYPE", "date must be a date or datetime object"))
+        elif _is_future(observed):
+            warnings.append(_warning("SUSPICIOUS_DATE", "Smoking status date is in the future"))
+        return ValidationResult(errors=errors, warnings=warnings)
 
-        # Validate panel code (should be LOINC)
-        panel_code = result.get("panel_code")
-        if panel_code and not DataValidator.validate_code(panel_code, "LOINC"):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"panel_code '{panel_code}' does not match expected LOINC format",
-                    code="INVALID_CODE_FORMAT",
-                )
-            )
+    @staticmethod
+    def validate_patient_batch(patients: Records) -> BatchValidationResult:
+        """Validate a batch of patient demographic records.
 
-        # Validate status
-        status = result.get("status")
-        if status and status not in DataValidator.VALID_RESULT_STATUS:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_RESULT_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
-            )
+        Args:
+            patients: List of patient dicts, or a dict of columns
 
-        # Validate effective time
-        effective_time = result.get("effective_time")
-        if effective_time is not None and not isinstance(effective_time, (date, datetime)):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="effective_time must be a date or datetime object",
-                    code="INVALID_TYPE",
-                )
-            )
+        Returns:
+            BatchValidationResult with the failing rows per issue
 
-        # Validate results list
-        results_list = result.get("results")
-        if not isinstance(results_list, (list, tuple)):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="results must be a list or tuple",
-                    code="INVALID_TYPE",
-                )
-            )
-            return ValidationResult(errors=errors, warnings=warnings)
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_patients(_ColumnBatch(patients)).finish()
 
-        if len(results_list) == 0:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message="results list is empty",
-                    code="EMPTY_LIST",
-                )
-            )
+    @staticmethod
+    def validate_problem_batch(problems: Records) -> BatchValidationResult:
+        """Validate a batch of problem/diagnosis records.
 
-        # Validate each result observation
-        for i, obs in enumerate(results_list):
-            obs_result = DataValidator._validate_result_observation(obs)
-            for issue in obs_result.errors:
-                errors.append(
-                    ValidationIssue(
-                        level=issue.level, message=f"Result {i}: {issue.message}", code=issue.code
-                    )
-                )
-            for issue in obs_result.warnings:
-                warnings.append(
-                    ValidationIssue(
-                        level=issue.level, message=f"Result {i}: {issue.message}", code=issue.code
-                    )
-                )
+        Args:
+            problems: List of problem dicts, or a dict of columns
 
-        return ValidationResult(errors=errors, warnings=warnings)
+        Returns:
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_problems(_ColumnBatch(problems)).finish()
 
     @staticmethod
-    def validate_encounter_data(encounter: Dict[str, Any]) -> ValidationResult:
-        """Validate encounter data.
+    def validate_medication_batch(medications: Records) -> BatchValidationResult:
+        """Validate a batch of medication records.
 
         Args:
-            encounter: Dictionary containing encounter data
+            medications: List of medication dicts, or a dict of columns
 
         Returns:
-            ValidationResult with any validation issues found
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
         """
-        errors = []
-        warnings = []
+        return DataValidator._check_medications(_ColumnBatch(medications)).finish()
 
-        # Check required fields
-        required = ["encounter_type", "code", "code_system"]
-        missing = DataValidator.validate_required_fields(encounter, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
+    @staticmethod
+    def validate_allergy_batch(allergies: Records) -> BatchValidationResult:
+        """Validate a batch of allergy/intolerance records.
 
-        if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+        Args:
+            allergies: List of allergy dicts, or a dict of columns
 
-        # Validate code system
-        code_system = encounter.get("code_system")
-        if code_system and not DataValidator.validate_code_system(code_system):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"Unknown code system: {code_system}",
-                    code="UNKNOWN_CODE_SYSTEM",
-                )
-            )
+        Returns:
+            BatchValidationResult with the failing rows per issue
 
-        # Validate date
-        enc_date = encounter.get("date")
-        if enc_date is not None:
-            if not isinstance(enc_date, (date, datetime)):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="date must be a date or datetime object",
-                        code="INVALID_TYPE",
-                    )
-                )
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_allergies(_ColumnBatch(allergies)).finish()
 
-        # Validate end date
-        end_date = encounter.get("end_date")
-        if end_date is not None:
-            if not isinstance(end_date, (date, datetime)):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="end_date must be a date or datetime object",
-                        code="INVALID_TYPE",
-                    )
-                )
+    @staticmethod
+    def validate_immunization_batch(immunizations: Records) -> BatchValidationResult:
+        """Validate a batch of immunization records.
 
-            # Validate date range if both dates present
-            if enc_date and end_date:
-                if not DataValidator.validate_date_range(enc_date, end_date):
-                    errors.append(
-                        ValidationIssue(
-                            level=ValidationLevel.ERROR,
-                            message="end_date must be after date",
-                            code="INVALID_DATE_RANGE",
-                        )
-                    )
+        Args:
+            immunizations: List of immunization dicts, or a dict of columns
 
-        return ValidationResult(errors=errors, warnings=warnings)
+        Returns:
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_immunizations(_ColumnBatch(immunizations)).finish()
 
     @staticmethod
-    def validate_smoking_status_data(smoking_status: Dict[str, Any]) -> ValidationResult:
-        """Validate smoking status data.
+    def validate_vital_signs_batch(organizers: Records) -> BatchValidationResult:
+        """Validate a batch of vital signs organizer records.
+
+        Issues of individual vital signs are reported against their organizer's
+        row, with keys such as "OUT_OF_RANGE:vital_signs.value".
 
         Args:
-            smoking_status: Dictionary containing smoking status data
+            organizers: List of organizer dicts (each with a vital_signs list),
+                or a dict of columns
 
         Returns:
-            ValidationResult with any validation issues found
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
         """
-        errors = []
-        warnings = []
+        return DataValidator._check_vital_signs(_ColumnBatch(organizers)).finish()
 
-        # Check required fields
-        required = ["smoking_status", "code", "date"]
-        missing = DataValidator.validate_required_fields(smoking_status, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
+    @staticmethod
+    def validate_procedure_batch(procedures: Records) -> BatchValidationResult:
+        """Validate a batch of procedure records.
 
-        if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+        Args:
+            procedures: List of procedure dicts, or a dict of columns
 
-        # Validate code (should be SNOMED from smoking status value set)
-        code = smoking_status.get("code")
-        if code and not DataValidator.validate_code(code, "SNOMED"):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"code '{code}' does not match expected SNOMED format",
-                    code="INVALID_CODE_FORMAT",
-                )
-            )
+        Returns:
+            BatchValidationResult with the failing rows per issue
 
-        # Validate date
-        ss_date = smoking_status.get("date")
-        if ss_date is not None:
-            if not isinstance(ss_date, (date, datetime)):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="date must be a date or datetime object",
-                        code="INVALID_TYPE",
-                    )
-                )
-            else:
-                # Convert to date for comparison
-                check_date = ss_date.date() if isinstance(ss_date, datetime) else ss_date
-                if check_date > date.today():
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message="Smoking status date is in the future",
-                            code="SUSPICIOUS_DATE",
-                        )
-                    )
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_procedures(_ColumnBatch(procedures)).finish()
 
-        return ValidationResult(errors=errors, warnings=warnings)
+    @staticmethod
+    def validate_result_batch(organizers: Records) -> BatchValidationResult:
+        """Validate a batch of lab result organizer records.
+
+        Issues of individual result observations are reported against their
+        organizer's row, with keys such as "INVALID_VALUE:results.status".
+
+        Args:
+            organizers: List of organizer dicts (each with a results list), or a
+                dict of columns
+
+        Returns:
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_results(_ColumnBatch(organizers)).finish()
+
+    @staticmethod
+    def validate_encounter_batch(encounters: Records) -> BatchValidationResult:
+        """Validate a batch of encounter records.
+
+        Args:
+            encounters: List of encounter dicts, or a dict of columns
+
+        Returns:
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_encounters(_ColumnBatch(encounters)).finish()
+
+    @staticmethod
+    def validate_smoking_status_batch(smoking_statuses: Records) -> BatchValidationResult:
+        """Validate a batch of smoking status records.
+
+        Args:
+            smoking_statuses: List of smoking status dicts, or a dict of columns
+
+        Returns:
+            BatchValidationResult with the failing rows per issue
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        return DataValidator._check_smoking_statuses(_ColumnBatch(smoking_statuses)).finish()
 
     # Helper methods
 
@@ -1112,283 +788,651 @@ class DataValidator:
     @staticmethod
     def _validate_address(address: Dict[str, Any]) -> ValidationResult:
         """Validate address data."""
-        errors = []
-
-        required = ["city", "state", "postal_code", "country"]
-        missing = DataValidator.validate_required_fields(address, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
-
-        # Validate street_lines if present
-        if "street_lines" in address:
-            street_lines = address["street_lines"]
+        missing = DataValidator.validate_required_fields(address, DataValidator._ADDRESS_REQUIRED)
+        errors = _missing_field_errors(missing) if missing else []
+        street_lines = address.get("street_lines")
+        if street_lines is not None:
             if not isinstance(street_lines, list):
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="street_lines must be a list",
-                        code="INVALID_TYPE",
-                    )
-                )
-            elif len(street_lines) > 4:
-                errors.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        message="street_lines can have at most 4 lines",
-                        code="INVALID_VALUE",
-                    )
-                )
-
+                errors.append(_error("INVALID_TYPE", "street_lines must be a list"))
+            elif _has_too_many_lines(street_lines):
+                errors.append(_error("INVALID_VALUE", "street_lines can have at most 4 lines"))
         return ValidationResult(errors=errors)
 
     @staticmethod
     def _validate_telecom(telecom: Dict[str, Any]) -> ValidationResult:
         """Validate telecom data."""
-        errors = []
+        missing = DataValidator.validate_required_fields(telecom, DataValidator._TELECOM_REQUIRED)
+        errors = _missing_field_errors(missing) if missing else []
         warnings = []
-
-        required = ["type", "value"]
-        missing = DataValidator.validate_required_fields(telecom, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
-        )
-
-        # Validate type
         telecom_type = telecom.get("type")
         if telecom_type and telecom_type not in DataValidator.VALID_TELECOM_TYPES:
             errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"type must be one of {DataValidator.VALID_TELECOM_TYPES}, got '{telecom_type}'",
-                    code="INVALID_VALUE",
-                )
+                _not_in_set_error("type", DataValidator.VALID_TELECOM_TYPES, telecom_type)
             )
-
-        # Validate use if present
+        # Validate use if present (not reported for patient telecoms)
         use = telecom.get("use")
         if use and use not in DataValidator.VALID_TELECOM_USE:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"use should be one of {DataValidator.VALID_TELECOM_USE}, got '{use}'",
-                    code="INVALID_VALUE",
-                )
-            )
-
+            warnings.append(_not_in_set_warning("use", DataValidator.VALID_TELECOM_USE, use))
         return ValidationResult(errors=errors, warnings=warnings)
 
     @staticmethod
     def _validate_single_vital_sign(vital_sign: Dict[str, Any]) -> ValidationResult:
         """Validate a single vital sign observation."""
-        errors = []
+        missing = DataValidator.validate_required_fields(
+            vital_sign, DataValidator._VITAL_SIGN_REQUIRED
+        )
+        if missing:
+            return ValidationResult(errors=_missing_field_errors(missing))
+
         warnings = []
+        code = vital_sign["code"]
+        if _has_invalid_format(code, "LOINC"):
+            warnings.append(_code_format_warning("code", code, "LOINC"))
+        message = _vital_sign_range_warning(vital_sign["type"], vital_sign["value"])
+        if message:
+            warnings.append(_warning("OUT_OF_RANGE", message))
+        return ValidationResult(warnings=warnings)
 
-        required = ["type", "code", "value", "unit"]
-        missing = DataValidator.validate_required_fields(vital_sign, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+    @staticmethod
+    def _validate_result_observation(observation: Dict[str, Any]) -> ValidationResult:
+        """Validate a single result observation."""
+        missing = DataValidator.validate_required_fields(
+            observation, DataValidator._RESULT_OBSERVATION_REQUIRED
         )
-
         if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+            return ValidationResult(errors=_missing_field_errors(missing))
+
+        errors: List[ValidationIssue] = []
+        warnings: List[ValidationIssue] = []
+        test_code = observation["test_code"]
+        if _has_invalid_format(test_code, "LOINC"):
+            warnings.append(_code_format_warning("test_code", test_code, "LOINC"))
+        status = observation["status"]
+        if status and status not in DataValidator.VALID_RESULT_STATUS:
+            errors.append(_not_in_set_error("status", DataValidator.VALID_RESULT_STATUS, status))
+        if not isinstance(observation["effective_time"], date):
+            message = "effective_time must be a date or datetime object"
+            errors.append(_error("INVALID_TYPE", message))
+        value_type = observation.get("value_type")
+        if value_type and value_type not in DataValidator.VALID_VALUE_TYPES:
+            errors.append(
+                _not_in_set_error("value_type", DataValidator.VALID_VALUE_TYPES, value_type)
+            )
 
-        # Validate code (should be LOINC)
-        code = vital_sign.get("code")
-        if code and not DataValidator.validate_code(code, "LOINC"):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"code '{code}' does not match expected LOINC format",
-                    code="INVALID_CODE_FORMAT",
-                )
+        # Validate reference range consistency
+        low = observation.get("reference_range_low")
+        high = observation.get("reference_range_high")
+        if _range_without_unit(low, high, observation.get("reference_range_unit")):
+            message = "Reference range provided but reference_range_unit is missing"
+            warnings.append(_warning("MISSING_FIELD", message))
+        if _inverted_range(low, high):
+            message = (
+                f"reference_range_low ({float(low)}) must be less than "
+                f"reference_range_high ({float(high)})"
             )
+            errors.append(_error("INVALID_RANGE", message))
+        return ValidationResult(errors=errors, warnings=warnings)
 
-        # Validate value is numeric for common vital signs
-        value = vital_sign.get("value")
-        vs_type = vital_sign.get("type", "").lower()
+    # Batch checks (see "Record validators" above)
 
-        # Try to parse value as float for validation
-        try:
-            numeric_value = float(value)
-
-            # Reasonable range checks for common vital signs
-            if "blood pressure" in vs_type or "bp" in vs_type:
-                if numeric_value < 40 or numeric_value > 300:
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message=f"Blood pressure value {numeric_value} is outside typical range (40-300)",
-                            code="OUT_OF_RANGE",
-                        )
-                    )
-            elif "heart rate" in vs_type or "pulse" in vs_type:
-                if numeric_value < 20 or numeric_value > 250:
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message=f"Heart rate value {numeric_value} is outside typical range (20-250)",
-                            code="OUT_OF_RANGE",
-                        )
-                    )
-            elif "temperature" in vs_type or "temp" in vs_type:
-                # Check both Celsius and Fahrenheit
-                if numeric_value < 90:  # Likely Fahrenheit
-                    if numeric_value < 90 or numeric_value > 110:
-                        warnings.append(
-                            ValidationIssue(
-                                level=ValidationLevel.WARNING,
-                                message=f"Temperature value {numeric_value}°F is outside typical range (90-110)",
-                                code="OUT_OF_RANGE",
-                            )
-                        )
-                else:  # Likely Celsius
-                    if numeric_value < 30 or numeric_value > 45:
-                        warnings.append(
-                            ValidationIssue(
-                                level=ValidationLevel.WARNING,
-                                message=f"Temperature value {numeric_value}°C is outside typical range (30-45)",
-                                code="OUT_OF_RANGE",
-                            )
-                        )
-            elif "respiratory" in vs_type or "respiration" in vs_type:
-                if numeric_value < 5 or numeric_value > 60:
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message=f"Respiratory rate value {numeric_value} is outside typical range (5-60)",
-                            code="OUT_OF_RANGE",
-                        )
-                    )
-            elif "oxygen" in vs_type or "spo2" in vs_type or "o2" in vs_type:
-                if numeric_value < 50 or numeric_value > 100:
-                    warnings.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message=f"Oxygen saturation value {numeric_value} is outside typical range (50-100)",
-                            code="OUT_OF_RANGE",
-                        )
-                    )
-        except (ValueError, TypeError):
-            # Value is not numeric, which is okay for some vital signs
-            pass
+    @staticmethod
+    def _check_patients(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check patient demographic records."""
+        batch.require(DataValidator._PATIENT_REQUIRED)
+        batch.check_type("first_name", str)
+        batch.check_type("last_name", str)
+        batch.check_type("date_of_birth", date)
+        batch.error_if("INVALID_DATE", "date_of_birth", ("date_of_birth",), _is_future)
+        batch.warning_if("SUSPICIOUS_DATE", "date_of_birth", ("date_of_birth",), _is_before_1900)
+        batch.check_in_set("sex", DataValidator.VALID_SEX)
+        DataValidator._check_addresses(batch.nested("addresses", list))
+        DataValidator._check_telecoms(batch.nested("telecoms", list))
 
-        return ValidationResult(errors=errors, warnings=warnings)
+        # Validate race/ethnicity codes if provided
+        for name, system in (("race", "Race"), ("ethnicity", "Ethnicity")):
+            if not DataValidator.validate_code_system(system):
+                batch.warning_if("UNKNOWN_CODE_SYSTEM", name, (name,), _is_present)
+        return batch
 
     @staticmethod
-    def _validate_result_observation(observation: Dict[str, Any]) -> ValidationResult:
-        """Validate a single result observation."""
-        errors = []
-        warnings = []
+    def _check_addresses(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check address records."""
+        batch.require(DataValidator._ADDRESS_REQUIRED, stop=False)
+        batch.check_type("street_lines", list)
+        batch.error_if("INVALID_VALUE", "street_lines", ("street_lines",), _has_too_many_lines)
+        return batch
 
-        required = ["test_name", "test_code", "value", "status", "effective_time"]
-        missing = DataValidator.validate_required_fields(observation, required)
-        errors.extend(
-            [
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"Missing required field: {field}",
-                    code="MISSING_FIELD",
-                )
-                for field in missing
-            ]
+    @staticmethod
+    def _check_telecoms(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check telecom records."""
+        batch.require(DataValidator._TELECOM_REQUIRED, stop=False)
+        batch.check_in_set("type", DataValidator.VALID_TELECOM_TYPES)
+        return batch
+
+    @staticmethod
+    def _check_problems(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check problem/diagnosis records."""
+        batch.require(DataValidator._PROBLEM_REQUIRED)
+        batch.check_type("name", str)
+        batch.check_type("code", str)
+        batch.check_code_system("code_system")
+        batch.check_code_format("code", system_field="code_system")
+        batch.check_in_set("status", DataValidator.VALID_PROBLEM_STATUS)
+        batch.check_type("onset_date", date)
+        batch.check_type("resolved_date", date)
+        batch.check_date_range("onset_date", "resolved_date")
+
+        # Validate status consistency
+        batch.warning_if(
+            "INCONSISTENT_DATA",
+            "resolved_date",
+            ("status", "resolved_date"),
+            _resolved_without_date,
+        )
+        batch.warning_if(
+            "INCONSISTENT_DATA",
+            "status",
+            ("status", "resolved_date"),
+            _resolved_date_without_status,
         )
+        return batch
 
-        if missing:
-            return ValidationResult(errors=errors, warnings=warnings)
+    @staticmethod
+    def _check_medications(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check medication records."""
+        batch.require(DataValidator._MEDICATION_REQUIRED)
+        batch.check_code_format("code", system="RxNorm")
+        batch.check_in_set("status", DataValidator.VALID_MEDICATION_STATUS)
+        batch.check_type("start_date", date)
+        batch.check_type("end_date", date)
+        batch.check_date_range("start_date", "end_date")
 
-        # Validate test code (should be LOINC)
-        test_code = observation.get("test_code")
-        if test_code and not DataValidator.validate_code(test_code, "LOINC"):
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message=f"test_code '{test_code}' does not match expected LOINC format",
-                    code="INVALID_CODE_FORMAT",
-                )
-            )
+        # Validate status consistency
+        batch.warning_if(
+            "INCONSISTENT_DATA",
+            "end_date",
+            ("status", "end_date"),
+            _ended_without_end_date,
+        )
+        return batch
 
-        # Validate status
-        status = observation.get("status")
-        if status and status not in DataValidator.VALID_RESULT_STATUS:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"status must be one of {DataValidator.VALID_RESULT_STATUS}, got '{status}'",
-                    code="INVALID_VALUE",
-                )
-            )
+    @staticmethod
+    def _check_allergies(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check allergy/intolerance records."""
+        batch.require(DataValidator._ALLERGY_REQUIRED)
+        batch.check_in_set("allergy_type", DataValidator.VALID_ALLERGY_TYPE)
+        batch.check_in_set("status", DataValidator.VALID_ALLERGY_STATUS)
+        batch.check_in_set("severity", DataValidator.VALID_ALLERGY_SEVERITY, warning=True)
 
-        # Validate effective time
-        effective_time = observation.get("effective_time")
-        if effective_time is not None and not isinstance(effective_time, (date, datetime)):
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message="effective_time must be a date or datetime object",
-                    code="INVALID_TYPE",
-                )
-            )
+        # Validate code system if code is provided
+        batch.warning_if(
+            "MISSING_FIELD",
+            "allergen_code_system",
+            ("allergen_code", "allergen_code_system"),
+            _given_without,
+        )
+        batch.check_code_system("allergen_code_system", only_with="allergen_code")
 
-        # Validate value_type if provided
-        value_type = observation.get("value_type")
-        if value_type and value_type not in DataValidator.VALID_VALUE_TYPES:
-            errors.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    message=f"value_type must be one of {DataValidator.VALID_VALUE_TYPES}, got '{value_type}'",
-                    code="INVALID_VALUE",
-                )
-            )
+        batch.check_type("onset_date", date)
+        batch.warning_if("SUSPICIOUS_DATE", "onset_date", ("onset_date",), _is_future)
+        return batch
+
+    @staticmethod
+    def _check_immunizations(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check immunization records."""
+        batch.require(DataValidator._IMMUNIZATION_REQUIRED)
+        batch.check_code_format("cvx_code", system="CVX")
+        batch.check_in_set("status", DataValidator.VALID_IMMUNIZATION_STATUS)
+        batch.check_type("administration_date", (date, datetime))
+        batch.warning_if(
+            "SUSPICIOUS_DATE",
+            "administration_date",
+            ("administration_date",),
+            _is_future,
+        )
+        return batch
+
+    @staticmethod
+    def _check_vital_signs(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check vital signs organizer records."""
+        batch.require(DataValidator._VITAL_SIGNS_REQUIRED)
+        batch.check_type("date", (date, datetime))
+        vital_signs = batch.nested("vital_signs", list, warn_empty=True)
+        DataValidator._check_vital_sign_observations(vital_signs)
+        return batch
+
+    @staticmethod
+    def _check_vital_sign_observations(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check vital sign observation records."""
+        batch.require(DataValidator._VITAL_SIGN_REQUIRED)
+        batch.check_code_format("code", system="LOINC")
+        batch.warning_if("OUT_OF_RANGE", "value", ("type", "value"), _vital_sign_range_warning)
+        return batch
+
+    @staticmethod
+    def _check_procedures(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check procedure records."""
+        batch.require(DataValidator._PROCEDURE_REQUIRED)
+        batch.check_code_system("code_system")
+        batch.check_in_set("status", DataValidator.VALID_PROCEDURE_STATUS)
+        batch.check_type("date", (date, datetime))
+        batch.warning_if("SUSPICIOUS_DATE", "date", ("date",), _is_future)
+
+        # Validate target site code if provided
+        batch.warning_if(
+            "MISSING_FIELD",
+            "target_site",
+            ("target_site_code", "target_site"),
+            _given_without,
+        )
+        return batch
+
+    @staticmethod
+    def _check_results(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check lab result organizer records."""
+        batch.require(DataValidator._RESULT_REQUIRED)
+        batch.check_code_format("panel_code", system="LOINC")
+        batch.check_in_set("status", DataValidator.VALID_RESULT_STATUS)
+        batch.check_type("effective_time", (date, datetime))
+        results = batch.nested("results", (list, tuple), warn_empty=True)
+        DataValidator._check_result_observations(results)
+        return batch
+
+    @staticmethod
+    def _check_result_observations(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check result observation records."""
+        batch.require(DataValidator._RESULT_OBSERVATION_REQUIRED)
+        batch.check_code_format("test_code", system="LOINC")
+        batch.check_in_set("status", DataValidator.VALID_RESULT_STATUS)
+        batch.check_type("effective_time", (date, datetime))
+        batch.check_in_set("value_type", DataValidator.VALID_VALUE_TYPES)
 
         # Validate reference range consistency
-        ref_low = observation.get("reference_range_low")
-        ref_high = observation.get("reference_range_high")
-        ref_unit = observation.get("reference_range_unit")
+        batch.warning_if(
+            "MISSING_FIELD",
+            "reference_range_unit",
+            ("reference_range_low", "reference_range_high", "reference_range_unit"),
+            _range_without_unit,
+        )
+        batch.error_if(
+            "INVALID_RANGE",
+            "reference_range_low",
+            ("reference_range_low", "reference_range_high"),
+            _inverted_range,
+        )
+        return batch
 
-        if (ref_low or ref_high) and not ref_unit:
-            warnings.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    message="Reference range provided but reference_range_unit is missing",
-                    code="MISSING_FIELD",
-                )
-            )
+    @staticmethod
+    def _check_encounters(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check encounter records."""
+        batch.require(DataValidator._ENCOUNTER_REQUIRED)
+        batch.check_code_system("code_system")
+        batch.check_type("date", (date, datetime))
+        batch.check_type("end_date", (date, datetime))
+        batch.check_date_range("date", "end_date")
+        return batch
 
-        if ref_low and ref_high:
-            try:
-                low = float(ref_low)
-                high = float(ref_high)
-                if low >= high:
-                    errors.append(
-                        ValidationIssue(
-                            level=ValidationLevel.ERROR,
-                            message=f"reference_range_low ({low}) must be less than reference_range_high ({high})",
-                            code="INVALID_RANGE",
-                        )
-                    )
-            except (ValueError, TypeError):
-                pass  # Non-numeric ranges are okay
+    @staticmethod
+    def _check_smoking_statuses(batch: "_ColumnBatch") -> "_ColumnBatch":
+        """Check smoking status records."""
+        batch.require(DataValidator._SMOKING_STATUS_REQUIRED)
+        batch.check_code_format("code", system="SNOMED")
+        batch.check_type("date", (date, datetime))
+        batch.warning_if("SUSPICIOUS_DATE", "date", ("date",), _is_future)
+        return batch
 
-        return ValidationResult(errors=errors, warnings=warnings)
+
+# Row predicates shared by the single-record and batch checks. Each takes the
+# values of the fields it is given (None when absent) and returns whether the
+# issue applies.
+
+_JANUARY_1900 = date(1900, 1, 1)
+
+
+def _is_future(value: Any) -> bool:
+    """Check if a value is a date or datetime after today."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return isinstance(value, date) and value > date.today()
+
+
+def _is_before_1900(value: Any) -> bool:
+    """Check if a value is a date or datetime before 1900."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return isinstance(value, date) and value < _JANUARY_1900
+
+
+def _is_present(value: Any) -> bool:
+    """Check if a value is set."""
+    return value is not None
+
+
+def _has_too_many_lines(lines: Any) -> bool:
+    """Check if street lines are a list of more than 4 lines."""
+    return isinstance(lines, list) and len(lines) > 4
+
+
+def _given_without(value: Any, other: Any) -> bool:
+    """Check if a value is given without the field it depends on."""
+    return bool(value) and not other
+
+
+def _resolved_without_date(status: Any, resolved_date: Any) -> bool:
+    """Check if a problem is resolved but has no resolved date."""
+    return status == "resolved" and not resolved_date
+
+
+def _resolved_date_without_status(status: Any, resolved_date: Any) -> bool:
+    """Check if a problem has a resolved date but is not resolved."""
+    return status != "resolved" and bool(resolved_date)
+
+
+def _ended_without_end_date(status: Any, end_date: Any) -> bool:
+    """Check if a medication has ended but has no end date."""
+    return status in ("completed", "discontinued") and not end_date
+
+
+def _ends_before_start(start: Any, end: Any) -> bool:
+    """Check if an end date lies before its start date (non-dates pass)."""
+    return (
+        isinstance(start, date)
+        and isinstance(end, date)
+        and not DataValidator.validate_date_range(start, end)
+    )
+
+
+def _range_without_unit(low: Any, high: Any, unit: Any) -> bool:
+    """Check if a reference range has bounds but no unit."""
+    return bool(low or high) and not unit
+
+
+def _inverted_range(low: Any, high: Any) -> bool:
+    """Check if a numeric reference range has low >= high (missing or non-numeric bounds pass)."""
+    if not (low and high):
+        return False
+    try:
+        return float(low) >= float(high)
+    except (ValueError, TypeError):
+        return False
+
+
+def _vital_sign_range_warning(vs_type: Any, value: Any) -> Optional[str]:
+    """Get the out-of-range warning for a vital sign value, if any.
+
+    Args:
+        vs_type: Vital sign type name (e.g. "Heart Rate")
+        value: Measured value
+
+    Returns:
+        Warning message, or None if the value is in range or not numeric
+    """
+    try:
+        numeric_value = float(value)
+    except (ValueError, TypeError):
+        # Value is not numeric, which is okay for some vital signs
+        return None
+
+    vs_type = (vs_type or "").lower()
+
+    # Reasonable range checks for common vital signs
+    if "blood pressure" in vs_type or "bp" in vs_type:
+        if numeric_value < 40 or numeric_value > 300:
+            return f"Blood pressure value {numeric_value} is outside typical range (40-300)"
+    elif "heart rate" in vs_type or "pulse" in vs_type:
+        if numeric_value < 20 or numeric_value > 250:
+            return f"Heart rate value {numeric_value} is outside typical range (20-250)"
+    elif "temperature" in vs_type or "temp" in vs_type:
+        # Check both Celsius and Fahrenheit
+        if numeric_value < 90:  # Likely Fahrenheit
+            if numeric_value < 90 or numeric_value > 110:
+                return f"Temperature value {numeric_value}°F is outside typical range (90-110)"
+        else:  # Likely Celsius
+            if numeric_value < 30 or numeric_value > 45:
+                return f"Temperature value {numeric_value}°C is outside typical range (30-45)"
+    elif "respiratory" in vs_type or "respiration" in vs_type:
+        if numeric_value < 5 or numeric_value > 60:
+            return f"Respiratory rate value {numeric_value} is outside typical range (5-60)"
+    elif "oxygen" in vs_type or "spo2" in vs_type or "o2" in vs_type:
+        if numeric_value < 50 or numeric_value > 100:
+            return f"Oxygen saturation value {numeric_value} is outside typical range (50-100)"
+    return None
+
+
+def _has_invalid_format(code: Any, system: Any) -> bool:
+    """Check if a code does not match its code system's format (missing codes pass)."""
+    return bool(code and system) and not (
+        isinstance(code, str) and DataValidator.validate_code(code, system)
+    )
+
+
+# Issues of the single-record validators
+
+
+def _error(code: str, message: str) -> ValidationIssue:
+    """Create an error issue."""
+    return ValidationIssue(level=ValidationLevel.ERROR, message=message, code=code)
+
+
+def _warning(code: str, message: str) -> ValidationIssue:
+    """Create a warning issue."""
+    return ValidationIssue(level=ValidationLevel.WARNING, message=message, code=code)
+
+
+def _missing_field_errors(missing: List[str]) -> List[ValidationIssue]:
+    """Create an error per missing required field."""
+    return [_error("MISSING_FIELD", f"Missing required field: {field}") for field in missing]
+
+
+def _not_in_set_error(name: str, allowed: Iterable[Any], value: Any) -> ValidationIssue:
+    """Create the error for a value outside an allowed set."""
+    return _error("INVALID_VALUE", f"{name} must be one of {allowed}, got '{value}'")
+
+
+def _not_in_set_warning(name: str, allowed: Iterable[Any], value: Any) -> ValidationIssue:
+    """Create the warning for a value outside an allowed set."""
+    return _warning("INVALID_VALUE", f"{name} should be one of {allowed}, got '{value}'")
+
+
+def _unknown_code_system_warning(system: Any) -> ValidationIssue:
+    """Create the warning for a code system missing from the registry."""
+    return _warning("UNKNOWN_CODE_SYSTEM", f"Unknown code system: {system}")
+
+
+def _code_format_warning(name: str, code: Any, system: str) -> ValidationIssue:
+    """Create the warning for a code not matching its system's format."""
+    message = f"{name} '{code}' does not match expected {system} format"
+    return _warning("INVALID_CODE_FORMAT", message)
+
+
+def _prefixed(issues: List[ValidationIssue], prefix: str) -> List[ValidationIssue]:
+    """Copy the issues of a nested item with its label ("Result 0: ...")."""
+    return [
+        ValidationIssue(level=issue.level, message=prefix + issue.message, code=issue.code)
+        for issue in issues
+    ]
+
+
+def _memoized(function: Callable[..., bool]) -> Callable[..., bool]:
+    """Wrap a lookup so each distinct argument tuple is evaluated once."""
+    cache: Dict[Hashable, bool] = {}
+
+    def lookup(*args: Any) -> bool:
+        try:
+            return cache[args]
+        except KeyError:
+            result = cache[args] = function(*args)
+            return result
+
+    return lookup
+
+
+def _is_missing(value: Any) -> bool:
+    """Check a value the way validate_required_fields does."""
+    return value is None or (isinstance(value, str) and value == "")
+
+
+class _ColumnBatch:
+    """Columns of a record batch, the rows still being checked, and their issues.
+
+    Nested batches (e.g. the results of result organizers) share the parent's
+    BatchValidationResult and report issues against the parent's rows.
+    """
+
+    def __init__(
+        self,
+        records: Records,
+        result: Optional[BatchValidationResult] = None,
+        prefix: str = "",
+        parents: Optional[List[int]] = None,
+    ) -> None:
+        if isinstance(records, dict):
+            lengths = {len(values) for values in records.values()}
+            if len(lengths) > 1:
+                raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+            self.size = lengths.pop() if lengths else 0
+            self._columns: Dict[str, Sequence[Any]] = dict(records)
+            self._records: Optional[Sequence[Dict[str, Any]]] = None
+        else:
+            self.size = len(records)
+            self._columns = {}
+            self._records = records
+        self.result = result if result is not None else BatchValidationResult(size=self.size)
+        self.prefix = prefix
+        self.parents = parents
+        self.rows: List[int] = list(range(self.size))
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Get a column, extracting it from the records on first use."""
+        values = self._columns.get(name)
+        if values is None:
+            if self._records is not None:
+                values = [record.get(name) for record in self._records]
+            else:
+                values = [None] * self.size
+            self._columns[name] = values
+        return values
+
+    def _flag(self, level: ValidationLevel, code: str, name: str, rows: List[int]) -> None:
+        if not rows:
+            return
+        if self.parents is not None:
+            rows = [self.parents[row] for row in rows]
+        issues = self.result.errors if level is ValidationLevel.ERROR else self.result.warnings
+        issues.setdefault(f"{code}:{self.prefix}{name}", []).extend(rows)
+
+    def _matching(self, fields: Sequence[str], predicate: Callable[..., Any]) -> List[int]:
+        """Get the rows whose field values satisfy predicate."""
+        columns = [self.column(field) for field in fields]
+        if len(columns) == 1:
+            (values,) = columns
+            return [row for row in self.rows if predicate(values[row])]
+        return [row for row in self.rows if predicate(*[values[row] for values in columns])]
+
+    def require(self, names: List[str], stop: bool = True) -> None:
+        """Report missing required fields; with stop, drop those rows from further checks."""
+        missing = set()
+        for name in names:
+            values = self.column(name)
+            rows = [row for row in self.rows if _is_missing(values[row])]
+            self._flag(ValidationLevel.ERROR, "MISSING_FIELD", name, rows)
+            missing.update(rows)
+        if stop and missing:
+            self.rows = [row for row in self.rows if row not in missing]
+
+    def check_type(self, name: str, types: Any) -> None:
+        """Report values of the wrong type."""
+        values = self.column(name)
+        rows = [
+            row
+            for row in self.rows
+            if values[row] is not None and not isinstance(values[row], types)
+        ]
+        self._flag(ValidationLevel.ERROR, "INVALID_TYPE", name, rows)
+
+    def check_in_set(self, name: str, allowed: Iterable[Any], warning: bool = False) -> None:
+        """Report values outside an allowed set."""
+        values = self.column(name)
+        rows = [row for row in self.rows if values[row] and values[row] not in allowed]
+        level = ValidationLevel.WARNING if warning else ValidationLevel.ERROR
+        self._flag(level, "INVALID_VALUE", name, rows)
+
+    def check_code_system(self, name: str, only_with: Optional[str] = None) -> None:
+        """Warn about code systems missing from the registry (one lookup per value)."""
+        known = _memoized(DataValidator.validate_code_system)
+        values = self.column(name)
+        given = self.column(only_with) if only_with else values
+        rows = [row for row in self.rows if given[row] and values[row] and not known(values[row])]
+        self._flag(ValidationLevel.WARNING, "UNKNOWN_CODE_SYSTEM", name, rows)
+
+    def check_code_format(
+        self,
+        name: str,
+        system: Optional[str] = None,
+        system_field: Optional[str] = None,
+    ) -> None:
+        """Warn about codes not matching their system's format (one check per value)."""
+        valid = _memoized(DataValidator.validate_code)
+        codes = self.column(name)
+        systems = self.column(system_field) if system_field else [system] * self.size
+        rows = []
+        for row in self.rows:
+            code = codes[row]
+            code_system = systems[row]
+            if code and code_system and not (isinstance(code, str) and valid(code, code_system)):
+                rows.append(row)
+        self._flag(ValidationLevel.WARNING, "INVALID_CODE_FORMAT", name, rows)
+
+    def check_date_range(self, start_name: str, name: str) -> None:
+        """Report rows whose end date is before their start date."""
+        rows = self._matching((start_name, name), _ends_before_start)
+        self._flag(ValidationLevel.ERROR, "INVALID_DATE_RANGE", name, rows)
+
+    def error_if(
+        self, code: str, name: str, fields: Sequence[str], predicate: Callable[..., Any]
+    ) -> None:
+        """Record an error for the rows whose field values satisfy predicate."""
+        self._flag(ValidationLevel.ERROR, code, name, self._matching(fields, predicate))
+
+    def warning_if(
+        self, code: str, name: str, fields: Sequence[str], predicate: Callable[..., Any]
+    ) -> None:
+        """Record a warning for the rows whose field values satisfy predicate."""
+        self._flag(ValidationLevel.WARNING, code, name, self._matching(fields, predicate))
+
+    def nested(self, name: str, types: Any, warn_empty: bool = False) -> "_ColumnBatch":
+        """Flatten a list-valued field into a child batch reporting against these rows.
+
+        Args:
+            name: List-valued field
+            types: Accepted container types
+            warn_empty: Warn about empty lists
+        """
+        values = self.column(name)
+        children = []
+        parents = []
+        invalid = []
+        empty = []
+        for row in self.rows:
+            items = values[row]
+            if items is None:
+                continue
+            if not isinstance(items, types):
+                invalid.append(row)
+                continue
+            if not items:
+                empty.append(row)
+            parent = row if self.parents is None else self.parents[row]
+            children.extend(items)
+            parents.extend([parent] * len(items))
+        self._flag(ValidationLevel.ERROR, "INVALID_TYPE", name, invalid)
+        if warn_empty:
+            self._flag(ValidationLevel.WARNING, "EMPTY_LIST", name, empty)
+        return _ColumnBatch(children, self.result, prefix=f"{self.prefix}{name}.", parents=parents)
+
+    def finish(self) -> BatchValidationResult:
+        """Sort and de-duplicate the row indices of every issue."""
+        for issues in (self.result.errors, self.result.warnings):
+            for key, rows in issues.items():
+                issues[key] = sorted(set(rows))
+        return self.result
@@ -1,34 +1,84 @@
 """Validators for C-CDA documents."""
 
-# Import common rules for convenience
-from . import common_rules
-from .base import BaseValidator
-from .rule_builder import FunctionBasedRule, RuleBuilder
-from .rules import RulesEngine, ValidationRule
-from .schematron import SchematronValidator
-from .schematron_downloader import SchematronDownloader, download_schematron_files
-from .utils import (
-    SchemaManager,
-    check_schema_installed,
-    get_default_schema_path,
-    install_schemas,
-    print_schema_installation_help,
+from typing import TYPE_CHECKING
+
+from ccdakit._lazy import attach_lazy_imports
+
+
+if TYPE_CHECKING:
+    from ccdakit.validators import common_rules
+    from ccdakit.validators.base import BaseValidator
+    from ccdakit.validators.pipeline import ValidationPipeline, ValidationStage
+    from ccdakit.validators.rule_builder import FunctionBasedRule, RuleBuilder
+    from ccdakit.validators.rules import RulesEngine, ValidationRule
+    from ccdakit.validators.schematron import SchematronValidator
+    from ccdakit.validators.schematron_downloader import (
+        SchematronDownloader,
+        download_schematron_files,
+    )
+    from ccdakit.validators.schematron_tiered import (
+        TieredResult,
+        TieredSchematronValidator,
+        WarningsPolicy,
+    )
+    from ccdakit.validators.utils import (
+        SchemaManager,
+        check_schema_installed,
+        get_default_schema_path,
+        install_schemas,
+        print_schema_installation_help,
+    )
+    from ccdakit.validators.xpath import compile_xpath
+    from ccdakit.validators.xsd import XSDValidator
+    from ccdakit.validators.xsd_downloader import XSDDownloader
+
+
+__getattr__, __dir__ = attach_lazy_imports(
+    __name__,
+    {
+        "common_rules": "ccdakit.validators.common_rules",
+        "BaseValidator": "ccdakit.validators.base",
+        "ValidationPipeline": "ccdakit.validators.pipeline",
+        "ValidationStage": "ccdakit.validators.pipeline",
+        "FunctionBasedRule": "ccdakit.validators.rule_builder",
+        "RuleBuilder": "ccdakit.validators.rule_builder",
+        "RulesEngine": "ccdakit.validators.rules",
+        "ValidationRule": "ccdakit.validators.rules",
+        "SchematronValidator": "ccdakit.validators.schematron",
+        "SchematronDownloader": "ccdakit.validators.schematron_downloader",
+        "download_schematron_files": "ccdakit.validators.schematron_downloader",
+        "TieredResult": "ccdakit.validators.schematron_tiered",
+        "TieredSchematronValidator": "ccdakit.validators.schematron_tiered",
+        "WarningsPolicy": "ccdakit.validators.schematron_tiered",
+        "SchemaManager": "ccdakit.validators.utils",
+        "check_schema_installed": "ccdakit.validators.utils",
+        "get_default_schema_path": "ccdakit.validators.utils",
+        "install_schemas": "ccdakit.validators.utils",
+        "print_schema_installation_help": "ccdakit.validators.utils",
+        "compile_xpath": "ccdakit.validators.xpath",
+        "XSDValidator": "ccdakit.validators.xsd",
+        "XSDDownloader": "ccdakit.validators.xsd_downloader",
+    },
 )
-from .xsd import XSDValidator
-from .xsd_downloader import XSDDownloader
 
 
 __all__ = [
     "BaseValidator",
+    "ValidationPipeline",
+    "ValidationStage",
     "XSDValidator",
     "XSDDownloader",
     "SchematronValidator",
+    "TieredSchematronValidator",
+    "TieredResult",
+    "WarningsPolicy",
     "SchematronDownloader",
     "download_schematron_files",
     "ValidationRule",
     "RulesEngine",
     "RuleBuilder",
     "FunctionBasedRule",
+    "compile_xpath",
     "common_rules",
     "SchemaManager",
     "get_default_schema_path",
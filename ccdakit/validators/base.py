@@ -2,13 +2,70 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from lxml import etree
 
 from ..core.validation import ValidationResult
 
 
+def parse_document(
+    document: Union[etree._Element, str, bytes, Path],
+    parser: Optional[etree.XMLParser] = None,
+) -> etree._Element:
+    """
+    Parse a document given in any supported form into an lxml Element.
+
+    Shared by every validator and by ValidationPipeline, which parses once and
+    hands the same element to all of its stages.
+
+    Args:
+        document: Document to parse. Can be:
+            - etree._Element: returned unchanged
+            - str: XML string or file path
+            - bytes: XML bytes
+            - Path: Path to XML file
+        parser: Parser to use (e.g. one created with huge_tree=True).
+            Default: lxml's default parser
+
+    Returns:
+        Parsed XML element
+
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        etree.XMLSyntaxError: If document is not well-formed XML
+        TypeError: If document is of an unsupported type
+    """
+    if isinstance(document, etree._Element):
+        return document
+
+    if isinstance(document, Path):
+        if not document.exists():
+            raise FileNotFoundError(f"File not found: {document}")
+        return etree.parse(str(document), parser).getroot()
+
+    if isinstance(document, str):
+        # Check if it looks like XML (starts with < or whitespace then <)
+        stripped = document.lstrip()
+        if stripped.startswith("<"):
+            # Parse as XML string
+            return etree.fromstring(document.encode("utf-8"), parser)
+        # Otherwise try as file path
+        path = Path(document)
+        if path.exists():
+            return etree.parse(str(path), parser).getroot()
+        # If not found, try parsing as XML anyway (might be malformed)
+        return etree.fromstring(document.encode("utf-8"), parser)
+
+    if isinstance(document, bytes):
+        return etree.fromstring(document, parser)
+
+    raise TypeError(
+        f"Unsupported document type: {type(document)}. "
+        "Expected etree._Element, str, bytes, or Path"
+    )
+
+
 class BaseValidator(ABC):
     """
     Abstract base class for C-CDA validators.
@@ -52,31 +109,4 @@ class BaseValidator(ABC):
             FileNotFoundError: If file path doesn't exist
             etree.XMLSyntaxError: If document is not well-formed XML
         """
-        if isinstance(document, etree._Element):
-            return document
-
-        if isinstance(document, Path):
-            if not document.exists():
-                raise FileNotFoundError(f"File not found: {document}")
-            return etree.parse(str(document)).getroot()
-
-        if isinstance(document, str):
-            # Check if it looks like XML (starts with < or whitespace then <)
-            stripped = document.lstrip()
-            if stripped.startswith("<"):
-                # Parse as XML string
-                return etree.fromstring(document.encode("utf-8"))
-            # Otherwise try as file path
-            path = Path(document)
-            if path.exists():
-                return etree.parse(str(path)).getroot()
-            # If not found, try parsing as XML anyway (might be malformed)
-            return etree.fromstring(document.encode("utf-8"))
-
-        if isinstance(document, bytes):
-            return etree.fromstring(document)
-
-        raise TypeError(
-            f"Unsupported document type: {type(document)}. "
-            "Expected etree._Element, str, bytes, or Path"
-        )
+        return parse_document(document)
@@ -7,6 +7,7 @@ from lxml import etree
 
 from ..core.validation import ValidationIssue, ValidationLevel
 from .rules import ValidationRule
+from .xpath import compile_xpath
 
 
 class UniqueIDRule(ValidationRule):
@@ -27,14 +28,14 @@ class UniqueIDRule(ValidationRule):
             description="Check that all IDs in the document are unique",
         )
         self.level = level
+        self._ids = compile_xpath("//cda:id[@root and @extension]")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate ID uniqueness."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Collect all IDs
-        id_elements = document.xpath("//cda:id[@root and @extension]", namespaces=ns)
+        id_elements = self._ids(document)
         seen_ids: Set[str] = set()
 
         for id_elem in id_elements:
@@ -83,14 +84,14 @@ class TemplateIDPresenceRule(ValidationRule):
             "2.16.840.1.113883.10.20.22.1.1",  # US Realm Header
         ]
         self.level = level
+        self._template_ids = compile_xpath("//cda:templateId/@root")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate template ID presence."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Get all template IDs in document
-        template_ids = cast(List[str], document.xpath("//cda:templateId/@root", namespaces=ns))
+        template_ids = cast(List[str], self._template_ids(document))
 
         for required_template in self.required_templates:
             if required_template not in template_ids:
@@ -133,20 +134,16 @@ class PatientNameRule(ValidationRule):
         self.require_given = require_given
         self.require_family = require_family
         self.level = level
+        self._names = compile_xpath("//cda:recordTarget/cda:patientRole/cda:patient/cda:name")
+        self._given = compile_xpath("cda:given/text()")
+        self._family = compile_xpath("cda:family/text()")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate patient name."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find patient name
-        patient_names = cast(
-            List[etree._Element],
-            document.xpath(
-                "//cda:recordTarget/cda:patientRole/cda:patient/cda:name",
-                namespaces=ns,
-            ),
-        )
+        patient_names = cast(List[etree._Element], self._names(document))
 
         if not patient_names:
             issues.append(
@@ -162,7 +159,7 @@ class PatientNameRule(ValidationRule):
         name = patient_names[0]
 
         if self.require_given:
-            given_names = name.xpath("cda:given/text()", namespaces=ns)
+            given_names = self._given(name)
             if not given_names or not any(g.strip() for g in given_names):
                 issues.append(
                     ValidationIssue(
@@ -174,7 +171,7 @@ class PatientNameRule(ValidationRule):
                 )
 
         if self.require_family:
-            family_names = name.xpath("cda:family/text()", namespaces=ns)
+            family_names = self._family(name)
             if not family_names or not any(f.strip() for f in family_names):
                 issues.append(
                     ValidationIssue(
@@ -215,17 +212,14 @@ class DocumentDateRule(ValidationRule):
         self.allow_future = allow_future
         self.max_years_past = max_years_past
         self.level = level
+        self._effective_time = compile_xpath("/cda:ClinicalDocument/cda:effectiveTime/@value")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate document date."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find document effectiveTime
-        effective_times = cast(
-            List[str],
-            document.xpath("/cda:ClinicalDocument/cda:effectiveTime/@value", namespaces=ns),
-        )
+        effective_times = cast(List[str], self._effective_time(document))
 
         if not effective_times:
             issues.append(
@@ -315,14 +309,15 @@ class AuthorPresenceRule(ValidationRule):
         )
         self.require_name = require_name
         self.level = level
+        self._authors = compile_xpath("/cda:ClinicalDocument/cda:author")
+        self._author_names = compile_xpath(".//cda:assignedAuthor/cda:assignedPerson/cda:name")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate author presence."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find authors
-        authors = document.xpath("/cda:ClinicalDocument/cda:author", namespaces=ns)
+        authors = self._authors(document)
 
         if not authors:
             issues.append(
@@ -337,10 +332,7 @@ class AuthorPresenceRule(ValidationRule):
 
         if self.require_name:
             for idx, author in enumerate(authors, 1):
-                names = author.xpath(
-                    ".//cda:assignedAuthor/cda:assignedPerson/cda:name",
-                    namespaces=ns,
-                )
+                names = self._author_names(author)
                 if not names:
                     issues.append(
                         ValidationIssue(
@@ -378,17 +370,15 @@ class CustodianPresenceRule(ValidationRule):
         )
         self.require_organization_name = require_organization_name
         self.level = level
+        self._custodians = compile_xpath("/cda:ClinicalDocument/cda:custodian")
+        self._org_names = compile_xpath(".//cda:representedCustodianOrganization/cda:name/text()")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate custodian presence."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find custodian
-        custodians = cast(
-            List[etree._Element],
-            document.xpath("/cda:ClinicalDocument/cda:custodian", namespaces=ns),
-        )
+        custodians = cast(List[etree._Element], self._custodians(document))
 
         if not custodians:
             issues.append(
@@ -402,10 +392,7 @@ class CustodianPresenceRule(ValidationRule):
             return issues
 
         if self.require_organization_name:
-            org_names = custodians[0].xpath(
-                ".//cda:representedCustodianOrganization/cda:name/text()",
-                namespaces=ns,
-            )
+            org_names = self._org_names(custodians[0])
             if not org_names or not any(n.strip() for n in org_names):
                 issues.append(
                     ValidationIssue(
@@ -445,14 +432,14 @@ class SectionCountRule(ValidationRule):
         self.min_sections = min_sections
         self.max_sections = max_sections
         self.level = level
+        self._sections = compile_xpath("//cda:section")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate section count."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Count sections
-        sections = document.xpath("//cda:section", namespaces=ns)
+        sections = self._sections(document)
         count = len(sections)
 
         if count < self.min_sections:
@@ -514,18 +501,21 @@ class VitalSignRangeRule(ValidationRule):
         )
         self.ranges = ranges or self.DEFAULT_RANGES
         self.level = level
+        self._observations = compile_xpath("//cda:observation")
+        self._code = compile_xpath("cda:code/@code")
+        self._value = compile_xpath("cda:value/@value")
+        self._display_name = compile_xpath("cda:code/@displayName")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate vital sign ranges."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find all observations
-        observations = document.xpath("//cda:observation", namespaces=ns)
+        observations = self._observations(document)
 
         for obs in observations:
             # Get observation code
-            codes = obs.xpath("cda:code/@code", namespaces=ns)
+            codes = self._code(obs)
             if not codes:
                 continue
 
@@ -536,14 +526,14 @@ class VitalSignRangeRule(ValidationRule):
             min_val, max_val = self.ranges[code]
 
             # Get observation value
-            values = obs.xpath("cda:value/@value", namespaces=ns)
+            values = self._value(obs)
             if not values:
                 continue
 
             try:
                 value = float(values[0])
                 if value < min_val or value > max_val:
-                    code_display = obs.xpath("cda:code/@displayName", namespaces=ns)
+                    code_display = self._display_name(obs)
                     display = code_display[0] if code_display else code
 
                     issues.append(
@@ -591,26 +581,20 @@ class AllergyStatusRule(ValidationRule):
         )
         self.allowed_statuses = allowed_statuses or self.VALID_STATUSES
         self.level = level
+        self._allergies = compile_xpath(
+            "//cda:observation[cda:templateId/@root='2.16.840.1.113883.10.20.22.4.7']"
+        )
+        self._status_codes = compile_xpath("cda:entryRelationship/cda:observation/cda:value/@code")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate allergy statuses."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find allergy observations (template 2.16.840.1.113883.10.20.22.4.7)
-        allergies = document.xpath(
-            "//cda:observation[cda:templateId/@root='2.16.840.1.113883.10.20.22.4.7']",
-            namespaces=ns,
-        )
+        allergies = self._allergies(document)
 
         for idx, allergy in enumerate(allergies, 1):
-            status_codes = cast(
-                List[str],
-                allergy.xpath(
-                    "cda:entryRelationship/cda:observation/cda:value/@code",
-                    namespaces=ns,
-                ),
-            )
+            status_codes = cast(List[str], self._status_codes(allergy))
 
             if status_codes and status_codes[0] not in self.allowed_statuses:
                 issues.append(
@@ -655,26 +639,20 @@ class ProblemStatusRule(ValidationRule):
         )
         self.allowed_statuses = allowed_statuses or self.VALID_STATUSES
         self.level = level
+        self._problems = compile_xpath(
+            "//cda:observation[cda:templateId/@root='2.16.840.1.113883.10.20.22.4.4']"
+        )
+        self._status_codes = compile_xpath("cda:entryRelationship/cda:observation/cda:value/@code")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate problem statuses."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find problem observations (template 2.16.840.1.113883.10.20.22.4.4)
-        problems = document.xpath(
-            "//cda:observation[cda:templateId/@root='2.16.840.1.113883.10.20.22.4.4']",
-            namespaces=ns,
-        )
+        problems = self._problems(document)
 
         for idx, problem in enumerate(problems, 1):
-            status_codes = cast(
-                List[str],
-                problem.xpath(
-                    "cda:entryRelationship/cda:observation/cda:value/@code",
-                    namespaces=ns,
-                ),
-            )
+            status_codes = cast(List[str], self._status_codes(problem))
 
             if status_codes and status_codes[0] not in self.allowed_statuses:
                 issues.append(
@@ -716,16 +694,15 @@ class ContactInfoPresenceRule(ValidationRule):
         self.require_telecom = require_telecom
         self.require_address = require_address
         self.level = level
+        self._patient_role = compile_xpath("//cda:recordTarget/cda:patientRole")
+        self._telecoms = compile_xpath("cda:telecom")
+        self._addresses = compile_xpath("cda:addr")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate contact info presence."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
-        patient_role = cast(
-            List[etree._Element],
-            document.xpath("//cda:recordTarget/cda:patientRole", namespaces=ns),
-        )
+        patient_role = cast(List[etree._Element], self._patient_role(document))
 
         if not patient_role:
             return issues
@@ -733,7 +710,7 @@ class ContactInfoPresenceRule(ValidationRule):
         role = patient_role[0]
 
         if self.require_telecom:
-            telecoms = role.xpath("cda:telecom", namespaces=ns)
+            telecoms = self._telecoms(role)
             if not telecoms:
                 issues.append(
                     ValidationIssue(
@@ -745,7 +722,7 @@ class ContactInfoPresenceRule(ValidationRule):
                 )
 
         if self.require_address:
-            addresses = role.xpath("cda:addr", namespaces=ns)
+            addresses = self._addresses(role)
             if not addresses:
                 issues.append(
                     ValidationIssue(
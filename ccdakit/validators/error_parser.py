@@ -4,9 +4,33 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 
+# Precompiled patterns (messages are parsed in bulk for broken documents)
+
+# *[local-name()='ElementName' and namespace-uri()='...'] or *[local-name()='ElementName']
+_LOCAL_NAME_RE = re.compile(
+    r"\*\[local-name\(\)=['\"]([^'\"]+)['\"](?:\s+and\s+namespace-uri\(\)=['\"][^'\"]*['\"])?\]"
+)
+_POSITION_RE = re.compile(r"\]\[(\d+)\]")
+_PREDICATE_RE = re.compile(r"\[.*?\]")
+_TEMPLATE_ID_RE = re.compile(r'@root="([\d.]+)"')
+_CONF_PAREN_RE = re.compile(r"\(CONF:([0-9-]+)\)")
+_CONF_RE = re.compile(r"CONF:([0-9-]+)")
+_REQUIREMENT_RE = re.compile(
+    r":\s+((?:SHALL|SHOULD|MAY|MUST|This).*?)(?:\s*\[SCHEMATRON|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+_REQUIREMENT_AFTER_PATH_RE = re.compile(r"\]:\s+(.+?)(?:\s*\[SCHEMATRON|$)", re.DOTALL)
+_MESSAGE_PREFIX_RE = re.compile(r"^(ERROR|WARNING)\s+at\s+.*?:\s*")
+_SCHEMATRON_SUFFIX_RE = re.compile(r"\s*\[SCHEMATRON[^\]]*\]\s*$")
+_XPATH_RE = re.compile(r"^(?:ERROR|WARNING)\s+at\s+(.*?):\s+", re.DOTALL)
+_ATTRIBUTE_RE = re.compile(r'@(\w+)="([^"]+)"')
+
+
 @dataclass
 class ParsedError:
     """Parsed Schematron validation error with enhanced readability."""
@@ -53,247 +77,256 @@ class ParsedError:
         }
 
 
+def _freeze_index(
+    index: dict[str, dict[str, str]],
+) -> MappingProxyType[str, MappingProxyType[str, str]]:
+    """Make a template index read-only (it is shared by every parse and cached result)."""
+    return MappingProxyType({key: MappingProxyType(dict(value)) for key, value in index.items()})
+
+
 class SchematronErrorParser:
     """Parser for Schematron validation errors."""
 
     # Common template names for quick lookup with documentation links
     # Comprehensive mapping of C-CDA R2.1 template IDs to documentation
-    TEMPLATE_INFO = {
-        # === SECTIONS ===
-        # Core Clinical Sections
-        "2.16.840.1.113883.10.20.22.2.1": {
-            "name": "Medications Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#medications-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.5": {
-            "name": "Problems Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#problems-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.6": {
-            "name": "Allergies Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#allergies-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.2": {
-            "name": "Immunizations Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#immunizations-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.4": {
-            "name": "Vital Signs Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#vital-signs-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.7": {
-            "name": "Procedures Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#procedures-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.3": {
-            "name": "Results Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#results-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.17": {
-            "name": "Social History Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#social-history-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.22": {
-            "name": "Encounters Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#encounters-section",
-        },
-        # Patient History & Assessments
-        "2.16.840.1.113883.10.20.22.2.15": {
-            "name": "Family History Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#family-history-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.20": {
-            "name": "Past Medical History Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#past-medical-history-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.56": {
-            "name": "Health Status Evaluations Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#health-status-evaluations-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.10": {
-            "name": "Physical Exam Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#physical-exam-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.14": {
-            "name": "Functional Status Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#functional-status-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.18": {
-            "name": "Mental Status Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#mental-status-section",
-        },
-        # Care Planning & Goals
-        "2.16.840.1.113883.10.20.22.2.60": {
-            "name": "Goals Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#goals-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.10": {
-            "name": "Plan of Treatment Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#plan-of-treatment-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.9": {
-            "name": "Assessment and Plan Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#assessment-and-plan-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.58": {
-            "name": "Health Concerns Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#health-concerns-section",
-        },
-        "2.16.840.1.113883.10.20.21.2.3": {
-            "name": "Interventions Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#interventions-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.45": {
-            "name": "Instructions Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#instructions-section",
-        },
-        # Hospital & Admission
-        "2.16.840.1.113883.10.20.22.2.43": {
-            "name": "Admission Diagnosis Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#admission-diagnosis-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.44": {
-            "name": "Admission Medications Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#admission-medications-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.25": {
-            "name": "Anesthesia Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#anesthesia-section",
-        },
-        "1.3.6.1.4.1.19376.1.5.3.1.3.5": {
-            "name": "Hospital Course Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#hospital-course-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.12": {
-            "name": "Reason for Visit Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#reason-for-visit-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.13": {
-            "name": "Chief Complaint and Reason for Visit Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#chief-complaint-reason-for-visit-section",
-        },
-        # Discharge & Summary
-        "2.16.840.1.113883.10.20.22.2.24": {
-            "name": "Discharge Diagnosis Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#discharge-diagnosis-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.11": {
-            "name": "Discharge Medications Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#discharge-medications-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.16": {
-            "name": "Hospital Discharge Studies Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#hospital-discharge-studies-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.41": {
-            "name": "Hospital Discharge Instructions Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#hospital-discharge-instructions-section",
-        },
-        # Surgical & Operative
-        "2.16.840.1.113883.10.20.22.2.34": {
-            "name": "Preoperative Diagnosis Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#preoperative-diagnosis-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.35": {
-            "name": "Postoperative Diagnosis Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#postoperative-diagnosis-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.37": {
-            "name": "Complications Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#complications-section",
-        },
-        # Other Sections
-        "2.16.840.1.113883.10.20.22.2.21": {
-            "name": "Advance Directives Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#advance-directives-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.23": {
-            "name": "Medical Equipment Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#medical-equipment-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.38": {
-            "name": "Medications Administered Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#medications-administered-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.57": {
-            "name": "Nutrition Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#nutrition-section",
-        },
-        "2.16.840.1.113883.10.20.22.2.18": {
-            "name": "Payers Section",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#payers-section",
-        },
-        # === ENTRIES ===
-        # Allergy entries
-        "2.16.840.1.113883.10.20.22.4.30": {
-            "name": "Allergy Concern Act",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#allergies-section",
-        },
-        "2.16.840.1.113883.10.20.22.4.7": {
-            "name": "Allergy Observation",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#allergies-section",
-        },
-        # Problem entries
-        "2.16.840.1.113883.10.20.22.4.3": {
-            "name": "Problem Concern Act",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#problems-section",
-        },
-        "2.16.840.1.113883.10.20.22.4.4": {
-            "name": "Problem Observation",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#problems-section",
-        },
-        # Medication entries
-        "2.16.840.1.113883.10.20.22.4.16": {
-            "name": "Medication Activity",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#medications-section",
-        },
-        # Vital Signs entries
-        "2.16.840.1.113883.10.20.22.4.26": {
-            "name": "Vital Signs Organizer",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#vital-signs-section",
-        },
-        "2.16.840.1.113883.10.20.22.4.27": {
-            "name": "Vital Signs Observation",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#vital-signs-section",
-        },
-        # Procedure entries
-        "2.16.840.1.113883.10.20.22.4.12": {
-            "name": "Procedure Activity Act",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#procedures-section",
-        },
-        "2.16.840.1.113883.10.20.22.4.14": {
-            "name": "Procedure Activity Procedure",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#procedures-section",
-        },
-        # Result entries
-        "2.16.840.1.113883.10.20.22.4.1": {
-            "name": "Result Organizer",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#results-section",
-        },
-        "2.16.840.1.113883.10.20.22.4.2": {
-            "name": "Result Observation",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#results-section",
-        },
-        # Immunization entries
-        "2.16.840.1.113883.10.20.22.4.52": {
-            "name": "Immunization Activity",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#immunizations-section",
-        },
-        # Encounter entries
-        "2.16.840.1.113883.10.20.22.4.49": {
-            "name": "Encounter Activity",
-            "doc_url": "https://docs.ccdakit.com/api/sections/#encounters-section",
-        },
-        # Common/Shared entries
-        "2.16.840.1.113883.10.20.22.4.119": {
-            "name": "Author Participation",
-            "doc_url": "https://docs.ccdakit.com/guides/hl7-guide/#author",
-        },
-        "2.16.840.1.113883.10.20.22.4.121": {
-            "name": "Caregiver Characteristics",
-            "doc_url": "https://docs.ccdakit.com/guides/hl7-guide/",
-        },
-    }
+    TEMPLATE_INFO = _freeze_index(
+        {
+            # === SECTIONS ===
+            # Core Clinical Sections
+            "2.16.840.1.113883.10.20.22.2.1": {
+                "name": "Medications Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#medications-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.5": {
+                "name": "Problems Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#problems-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.6": {
+                "name": "Allergies Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#allergies-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.2": {
+                "name": "Immunizations Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#immunizations-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.4": {
+                "name": "Vital Signs Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#vital-signs-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.7": {
+                "name": "Procedures Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#procedures-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.3": {
+                "name": "Results Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#results-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.17": {
+                "name": "Social History Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#social-history-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.22": {
+                "name": "Encounters Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#encounters-section",
+            },
+            # Patient History & Assessments
+            "2.16.840.1.113883.10.20.22.2.15": {
+                "name": "Family History Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#family-history-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.20": {
+                "name": "Past Medical History Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#past-medical-history-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.56": {
+                "name": "Health Status Evaluations Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#health-status-evaluations-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.10": {
+                "name": "Physical Exam Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#physical-exam-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.14": {
+                "name": "Functional Status Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#functional-status-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.18": {
+                "name": "Mental Status Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#mental-status-section",
+            },
+            # Care Planning & Goals
+            "2.16.840.1.113883.10.20.22.2.60": {
+                "name": "Goals Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#goals-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.10": {
+                "name": "Plan of Treatment Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#plan-of-treatment-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.9": {
+                "name": "Assessment and Plan Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#assessment-and-plan-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.58": {
+                "name": "Health Concerns Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#health-concerns-section",
+            },
+            "2.16.840.1.113883.10.20.21.2.3": {
+                "name": "Interventions Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#interventions-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.45": {
+                "name": "Instructions Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#instructions-section",
+            },
+            # Hospital & Admission
+            "2.16.840.1.113883.10.20.22.2.43": {
+                "name": "Admission Diagnosis Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#admission-diagnosis-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.44": {
+                "name": "Admission Medications Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#admission-medications-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.25": {
+                "name": "Anesthesia Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#anesthesia-section",
+            },
+            "1.3.6.1.4.1.19376.1.5.3.1.3.5": {
+                "name": "Hospital Course Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#hospital-course-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.12": {
+                "name": "Reason for Visit Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#reason-for-visit-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.13": {
+                "name": "Chief Complaint and Reason for Visit Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#chief-complaint-reason-for-visit-section",
+            },
+            # Discharge & Summary
+            "2.16.840.1.113883.10.20.22.2.24": {
+                "name": "Discharge Diagnosis Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#discharge-diagnosis-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.11": {
+                "name": "Discharge Medications Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#discharge-medications-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.16": {
+                "name": "Hospital Discharge Studies Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#hospital-discharge-studies-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.41": {
+                "name": "Hospital Discharge Instructions Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#hospital-discharge-instructions-section",
+            },
+            # Surgical & Operative
+            "2.16.840.1.113883.10.20.22.2.34": {
+                "name": "Preoperative Diagnosis Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#preoperative-diagnosis-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.35": {
+                "name": "Postoperative Diagnosis Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#postoperative-diagnosis-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.37": {
+                "name": "Complications Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#complications-section",
+            },
+            # Other Sections
+            "2.16.840.1.113883.10.20.22.2.21": {
+                "name": "Advance Directives Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#advance-directives-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.23": {
+                "name": "Medical Equipment Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#medical-equipment-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.38": {
+                "name": "Medications Administered Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#medications-administered-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.57": {
+                "name": "Nutrition Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#nutrition-section",
+            },
+            "2.16.840.1.113883.10.20.22.2.18": {
+                "name": "Payers Section",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#payers-section",
+            },
+            # === ENTRIES ===
+            # Allergy entries
+            "2.16.840.1.113883.10.20.22.4.30": {
+                "name": "Allergy Concern Act",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#allergies-section",
+            },
+            "2.16.840.1.113883.10.20.22.4.7": {
+                "name": "Allergy Observation",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#allergies-section",
+            },
+            # Problem entries
+            "2.16.840.1.113883.10.20.22.4.3": {
+                "name": "Problem Concern Act",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#problems-section",
+            },
+            "2.16.840.1.113883.10.20.22.4.4": {
+                "name": "Problem Observation",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#problems-section",
+            },
+            # Medication entries
+            "2.16.840.1.113883.10.20.22.4.16": {
+                "name": "Medication Activity",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#medications-section",
+            },
+            # Vital Signs entries
+            "2.16.840.1.113883.10.20.22.4.26": {
+                "name": "Vital Signs Organizer",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#vital-signs-section",
+            },
+            "2.16.840.1.113883.10.20.22.4.27": {
+                "name": "Vital Signs Observation",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#vital-signs-section",
+            },
+            # Procedure entries
+            "2.16.840.1.113883.10.20.22.4.12": {
+                "name": "Procedure Activity Act",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#procedures-section",
+            },
+            "2.16.840.1.113883.10.20.22.4.14": {
+                "name": "Procedure Activity Procedure",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#procedures-section",
+            },
+            # Result entries
+            "2.16.840.1.113883.10.20.22.4.1": {
+                "name": "Result Organizer",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#results-section",
+            },
+            "2.16.840.1.113883.10.20.22.4.2": {
+                "name": "Result Observation",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#results-section",
+            },
+            # Immunization entries
+            "2.16.840.1.113883.10.20.22.4.52": {
+                "name": "Immunization Activity",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#immunizations-section",
+            },
+            # Encounter entries
+            "2.16.840.1.113883.10.20.22.4.49": {
+                "name": "Encounter Activity",
+                "doc_url": "https://docs.ccdakit.com/api/sections/#encounters-section",
+            },
+            # Common/Shared entries
+            "2.16.840.1.113883.10.20.22.4.119": {
+                "name": "Author Participation",
+                "doc_url": "https://docs.ccdakit.com/guides/hl7-guide/#author",
+            },
+            "2.16.840.1.113883.10.20.22.4.121": {
+                "name": "Caregiver Characteristics",
+                "doc_url": "https://docs.ccdakit.com/guides/hl7-guide/",
+            },
+        }
+    )
 
     @staticmethod
     def simplify_xpath(xpath: str) -> str:
@@ -307,27 +340,19 @@ class SchematronErrorParser:
         if not xpath:
             return ""
 
-        # Pattern to match: *[local-name()='ElementName' and namespace-uri()='...']
-        # or just: *[local-name()='ElementName']
-        # Using non-greedy matching and handling both single and double quotes
-        pattern = r"\*\[local-name\(\)=['\"]([^'\"]+)['\"](?:\s+and\s+namespace-uri\(\)=['\"][^'\"]*['\"])?\]"
-
-        # Split by / to process each segment
-        segments = xpath.split("/")
         path_parts = []
-
-        for segment in segments:
+        for segment in xpath.split("/"):
             if not segment or segment == "*":
                 continue
 
             # Extract element name
-            match = re.search(pattern, segment)
+            match = _LOCAL_NAME_RE.search(segment)
             if match:
                 element_name = match.group(1)
 
                 # Check for position predicate (appears after the predicate block)
                 # Pattern: ][1] or ][2] etc.
-                position_match = re.search(r"\]\[(\d+)\]", segment)
+                position_match = _POSITION_RE.search(segment)
                 if position_match:
                     element_name += f"[{position_match.group(1)}]"
 
@@ -335,7 +360,7 @@ class SchematronErrorParser:
             else:
                 # If no match, try to extract any meaningful text
                 # This handles simpler XPath expressions
-                cleaned = re.sub(r"\[.*?\]", "", segment).strip()
+                cleaned = _PREDICATE_RE.sub("", segment).strip()
                 if cleaned and cleaned != "*":
                     path_parts.append(cleaned)
 
@@ -345,42 +370,34 @@ class SchematronErrorParser:
     def extract_template_id(message: str) -> str | None:
         """Extract template ID from error message."""
         # Pattern: @root="2.16.840.1.113883..."
-        match = re.search(r'@root="([\d.]+)"', message)
+        match = _TEMPLATE_ID_RE.search(message)
         return match.group(1) if match else None
 
     @staticmethod
     def extract_conf_number(message: str) -> str | None:
         """Extract CONF number from error message."""
         # Pattern: CONF:1098-8583 or (CONF:1098-8583)
-        match = re.search(r"\(CONF:([0-9-]+)\)", message) or re.search(r"CONF:([0-9-]+)", message)
+        match = _CONF_PAREN_RE.search(message) or _CONF_RE.search(message)
         return match.group(1) if match else None
 
     @staticmethod
     def extract_requirement(message: str) -> str:
         """Extract the SHALL/SHOULD requirement from the error message."""
         # Pattern: ERROR at <xpath>: <requirement> [SCHEMATRON_...]
-        # The requirement typically starts with SHALL, SHOULD, MAY, or other keywords
-        # Look for ": " followed by these keywords
-
-        # Find the last occurrence of ': ' before the requirement starts
-        # The requirement typically starts with SHALL, SHOULD, MAY, etc.
-        match = re.search(
-            r":\s+((?:SHALL|SHOULD|MAY|MUST|This).*?)(?:\s*\[SCHEMATRON|$)",
-            message,
-            re.DOTALL | re.IGNORECASE,
-        )
+        # The requirement typically starts with SHALL, SHOULD, MAY, MUST or This
+        match = _REQUIREMENT_RE.search(message)
         if match:
             return match.group(1).strip()
 
         # Fallback: try to extract everything after "ERROR at ... :"
         # by looking for the pattern that closes the XPath (the last ']' before ':')
-        match = re.search(r"\]:\s+(.+?)(?:\s*\[SCHEMATRON|$)", message, re.DOTALL)
+        match = _REQUIREMENT_AFTER_PATH_RE.search(message)
         if match:
             return match.group(1).strip()
 
         # Last fallback: just remove the prefix and suffix
-        cleaned = re.sub(r"^(ERROR|WARNING)\s+at\s+.*?:\s*", "", message)
-        cleaned = re.sub(r"\s*\[SCHEMATRON[^\]]*\]\s*$", "", cleaned)
+        cleaned = _MESSAGE_PREFIX_RE.sub("", message)
+        cleaned = _SCHEMATRON_SUFFIX_RE.sub("", cleaned)
         return cleaned.strip()
 
     @staticmethod
@@ -388,7 +405,7 @@ class SchematronErrorParser:
         """Extract XPath from error message."""
         # Pattern: ERROR at /xpath/here: message
         # The XPath ends at ": " (colon followed by space)
-        match = re.match(r"^(?:ERROR|WARNING)\s+at\s+(.*?):\s+", message, re.DOTALL)
+        match = _XPATH_RE.match(message)
         return match.group(1).strip() if match else ""
 
     @staticmethod
@@ -433,8 +450,7 @@ class SchematronErrorParser:
 
         # Attribute suggestions
         if "@" in parsed_error.requirement:
-            attr_matches = re.findall(r'@(\w+)="([^"]+)"', parsed_error.requirement)
-            for attr_name, attr_value in attr_matches:
+            for attr_name, attr_value in _ATTRIBUTE_RE.findall(parsed_error.requirement):
                 suggestions.append(f'Set attribute {attr_name}="{attr_value}"')
 
         # Add documentation link if available
@@ -454,42 +470,43 @@ class SchematronErrorParser:
         """
         Parse a Schematron error message into structured components.
 
+        Everything derived from the assertion text (requirement, template,
+        CONF number, suggestions) is cached per distinct assertion; only the
+        location is processed for every message.
+
         Args:
             error_message: The raw error message from Schematron validation
 
         Returns:
             ParsedError with all extracted information
         """
-        # Extract components
-        xpath = cls.extract_xpath(error_message)
-        simplified_path = cls.simplify_xpath(xpath)
-        requirement = cls.extract_requirement(error_message)
-        template_id = cls.extract_template_id(error_message)
-        conf_number = cls.extract_conf_number(error_message)
-        severity = cls.determine_severity(error_message)
-
-        # Get template info if available
-        template_info = cls.TEMPLATE_INFO.get(template_id) if template_id else None
-        template_name = template_info["name"] if template_info else None
-
-        # Create parsed error
-        parsed = ParsedError(
+        match = _XPATH_RE.match(error_message)
+        if match:
+            xpath = match.group(1).strip()
+            # Replace the location with a fixed placeholder so that the same
+            # assertion reported at different nodes shares one cache entry.
+            # The placeholder keeps the trailing "]" the extractors look for.
+            placeholder = "*[1]" if xpath.endswith("]") else "*"
+            assertion_key = (
+                error_message[: match.start(1)] + placeholder + error_message[match.end(1) :]
+            )
+        else:
+            xpath = ""
+            assertion_key = error_message
+        info = _assertion_info(assertion_key)
+
+        return ParsedError(
             original_message=error_message,
-            simplified_path=simplified_path or "Document root",
+            simplified_path=cls.simplify_xpath(xpath) or "Document root",
             full_xpath=xpath,
-            requirement=requirement,
-            template_id=template_id,
-            conf_number=conf_number,
-            template_name=template_name,
-            severity=severity,
-            suggestions=[],
+            requirement=info.requirement,
+            template_id=info.template_id,
+            conf_number=info.conf_number,
+            template_name=info.template_name,
+            severity=info.severity,
+            suggestions=list(info.suggestions),
         )
 
-        # Generate suggestions
-        parsed.suggestions = cls.generate_suggestions(parsed)
-
-        return parsed
-
     @classmethod
     def parse_errors(cls, error_messages: list[str]) -> list[ParsedError]:
         """
@@ -502,3 +519,63 @@ class SchematronErrorParser:
             List of ParsedError objects
         """
         return [cls.parse_error(msg) for msg in error_messages]
+
+    @staticmethod
+    def cache_info() -> Any:
+        """
+        Get statistics of the per-assertion cache.
+
+        Returns:
+            functools cache info (hits, misses, maxsize, currsize)
+        """
+        return _assertion_info.cache_info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the per-assertion cache."""
+        _assertion_info.cache_clear()
+
+
+# Number of distinct assertions whose enrichment is kept
+ASSERTION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class _AssertionInfo:
+    """Location-independent parts of a parsed error."""
+
+    requirement: str
+    template_id: str | None
+    conf_number: str | None
+    template_name: str | None
+    severity: str
+    suggestions: tuple[str, ...]
+
+
+@lru_cache(maxsize=ASSERTION_CACHE_SIZE)
+def _assertion_info(message: str) -> _AssertionInfo:
+    """Extract and enrich everything in a message that does not depend on its location."""
+    parser = SchematronErrorParser
+    requirement = parser.extract_requirement(message)
+    template_id = parser.extract_template_id(message)
+    template_info = parser.TEMPLATE_INFO.get(template_id) if template_id else None
+    template_name = template_info["name"] if template_info else None
+    partial = ParsedError(
+        original_message=message,
+        simplified_path="",
+        full_xpath="",
+        requirement=requirement,
+        template_id=template_id,
+        conf_number=parser.extract_conf_number(message),
+        template_name=template_name,
+        severity=parser.determine_severity(message),
+        suggestions=[],
+    )
+    return _AssertionInfo(
+        requirement=partial.requirement,
+        template_id=partial.template_id,
+        conf_number=partial.conf_number,
+        template_name=partial.template_name,
+        severity=partial.severity,
+        suggestions=tuple(parser.generate_suggestions(partial)),
+    )
@@ -0,0 +1,266 @@
+"""Staged validation pipeline that parses a document once for all validators."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from lxml import etree
+
+from ..core.validation import StageTiming, ValidationIssue, ValidationLevel, ValidationResult
+from .base import parse_document
+
+
+# Name of the implicit first stage that parses the input document
+PARSE_STAGE = "parse"
+
+
+class ValidationStage:
+    """A named validator run by ValidationPipeline."""
+
+    __slots__ = ("name", "validator", "gate")
+
+    def __init__(self, name: str, validator: Any, gate: bool = False) -> None:
+        """
+        Initialize validation stage.
+
+        Args:
+            name: Stage name, used as key in per-stage results
+            validator: Callable taking the parsed element and returning a
+                ValidationResult, or an object with such a validate() method
+                (XSDValidator, SchematronValidator, RulesEngine, ...)
+            gate: With fail_fast, skip all later stages when this one
+                reports errors
+        """
+        self.name = name
+        self.validator = validator
+        self.gate = gate
+
+    def run(self, document: etree._Element) -> ValidationResult:
+        """
+        Run the stage and record its wall-clock and CPU time.
+
+        Args:
+            document: Parsed document
+
+        Returns:
+            Stage result with a single StageTiming
+        """
+        validate: Callable[[etree._Element], ValidationResult] = (
+            self.validator if callable(self.validator) else self.validator.validate
+        )
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        result = validate(document)
+        timing = StageTiming(
+            stage=self.name,
+            wall_time=time.perf_counter() - wall_start,
+            cpu_time=time.thread_time() - cpu_start,
+        )
+        # Copy so a validator returning a shared result object is never mutated
+        return ValidationResult(
+            errors=list(result.errors),
+            warnings=list(result.warnings),
+            infos=list(result.infos),
+            timings=[*result.timings, timing],
+            rule_stats=dict(result.rule_stats),
+        )
+
+    def __repr__(self) -> str:
+        """String representation of stage."""
+        return f"<ValidationStage: {self.name}{' (gate)' if self.gate else ''}>"
+
+
+class ValidationPipeline:
+    """
+    Run several validators against one parsed document.
+
+    XSDValidator, SchematronValidator and RulesEngine each parse their input;
+    calling them one after another parses the same bytes up to three times.
+    The pipeline parses once and hands the element to every stage, in the
+    order the stages were added.
+
+    Example:
+        pipeline = ValidationPipeline(fail_fast=True)
+        pipeline.add_stage("xsd", XSDValidator(), gate=True)
+        pipeline.add_stage("schematron", SchematronValidator())
+        pipeline.add_stage("rules", engine)
+
+        result = pipeline.validate(Path("ccd.xml"))
+        for timing in result.timings:
+            print(timing.stage, timing.wall_time)
+
+    With fail_fast=True, a gate stage that reports errors stops the run and the
+    remaining stages are recorded as skipped (e.g. no Schematron run on a
+    document that is not schema-valid). With concurrent=True, stages between
+    gates run on a thread pool. lxml releases the GIL while validating, and
+    validators only read the shared tree, so this is safe as long as each
+    stage uses its own validator instance.
+    """
+
+    def __init__(
+        self,
+        fail_fast: bool = False,
+        concurrent: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize validation pipeline.
+
+        Args:
+            fail_fast: Skip the remaining stages once a gate stage fails
+            concurrent: Run independent stages on a thread pool
+            max_workers: Thread pool size (default: one thread per stage)
+        """
+        self.fail_fast = fail_fast
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        self._stages: List[ValidationStage] = []
+
+    def add_stage(self, name: str, validator: Any, gate: bool = False) -> "ValidationPipeline":
+        """
+        Append a stage to the pipeline.
+
+        Args:
+            name: Unique stage name
+            validator: Validator object or callable (see ValidationStage)
+            gate: With fail_fast, skip later stages when this one fails
+
+        Returns:
+            The pipeline, for chaining
+
+        Raises:
+            ValueError: If the name is reserved or already used
+        """
+        if name == PARSE_STAGE or name in self.stage_names:
+            raise ValueError(f"Duplicate or reserved stage name: {name!r}")
+        self._stages.append(ValidationStage(name, validator, gate=gate))
+        return self
+
+    @property
+    def stage_names(self) -> List[str]:
+        """Get stage names in run order."""
+        return [stage.name for stage in self._stages]
+
+    def run_stages(
+        self, document: Union[etree._Element, str, bytes, Path]
+    ) -> Dict[str, ValidationResult]:
+        """
+        Parse document once and run every stage.
+
+        Args:
+            document: Document to validate (element, XML string, file path,
+                bytes or Path)
+
+        Returns:
+            Results keyed by stage name, in run order. The first entry is
+            always the parse stage; stages that did not run have an empty
+            result whose timing is marked skipped.
+
+        Raises:
+            Exception: Any exception raised by a stage's validator
+        """
+        results: Dict[str, ValidationResult] = {}
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        parse_result = ValidationResult()
+        try:
+            element: Optional[etree._Element] = parse_document(document)
+        except etree.XMLSyntaxError as e:
+            element = None
+            parse_result.errors.append(
+                ValidationIssue(
+                    level=ValidationLevel.ERROR,
+                    message=f"XML syntax error: {e}",
+                    location=f"Line {e.lineno}" if hasattr(e, "lineno") else None,
+                    code="XML_SYNTAX_ERROR",
+                )
+            )
+        except FileNotFoundError as e:
+            element = None
+            parse_result.errors.append(
+                ValidationIssue(
+                    level=ValidationLevel.ERROR,
+                    message=str(e),
+                    code="FILE_NOT_FOUND",
+                )
+            )
+        parse_result.timings.append(
+            StageTiming(
+                stage=PARSE_STAGE,
+                wall_time=time.perf_counter() - wall_start,
+                cpu_time=time.thread_time() - cpu_start,
+            )
+        )
+        results[PARSE_STAGE] = parse_result
+
+        pending = list(self._stages)
+        while pending and element is not None:
+            batch = self._next_batch(pending)
+            del pending[: len(batch)]
+            results.update(self._run_batch(batch, element))
+
+            gate_failed = any(
+                stage.gate and not results[stage.name].is_valid for stage in batch
+            )
+            if self.fail_fast and gate_failed:
+                break
+
+        # Stages left over after a parse failure or a failed gate
+        for stage in pending:
+            results[stage.name] = ValidationResult(
+                timings=[StageTiming(stage=stage.name, skipped=True)]
+            )
+        return results
+
+    def validate(self, document: Union[etree._Element, str, bytes, Path]) -> ValidationResult:
+        """
+        Parse document once, run every stage and merge the results.
+
+        Args:
+            document: Document to validate (element, XML string, file path,
+                bytes or Path)
+
+        Returns:
+            Merged ValidationResult; timings holds one entry per stage,
+            starting with the parse stage
+
+        Raises:
+            Exception: Any exception raised by a stage's validator
+        """
+        return ValidationResult.merge(self.run_stages(document).values())
+
+    def _next_batch(self, pending: List[ValidationStage]) -> List[ValidationStage]:
+        """
+        Get the leading stages that can run together.
+
+        Without fail_fast every stage is independent. With fail_fast a batch
+        ends at the first gate, since later stages depend on its outcome.
+        """
+        if not self.fail_fast:
+            return list(pending)
+        for index, stage in enumerate(pending):
+            if stage.gate:
+                return pending[: index + 1]
+        return list(pending)
+
+    def _run_batch(
+        self, batch: List[ValidationStage], element: etree._Element
+    ) -> Dict[str, ValidationResult]:
+        """Run a batch of stages, on a thread pool when concurrent."""
+        if not self.concurrent or len(batch) == 1:
+            return {stage.name: stage.run(element) for stage in batch}
+
+        workers = self.max_workers or len(batch)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [(stage.name, executor.submit(stage.run, element)) for stage in batch]
+            return {name: future.result() for name, future in futures}
+
+    def __len__(self) -> int:
+        """Get number of stages in pipeline."""
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        """String representation of pipeline."""
+        return f"<ValidationPipeline: {', '.join(self.stage_names) or 'no stages'}>"
@@ -1,11 +1,14 @@
 """Rule builder utility for creating custom validation rules without subclassing."""
 
+import re
+from functools import partial
 from typing import Callable, List, Optional, cast
 
 from lxml import etree
 
 from ..core.validation import ValidationIssue, ValidationLevel
 from .rules import ValidationRule
+from .xpath import compile_xpath
 
 
 class FunctionBasedRule(ValidationRule):
@@ -126,17 +129,15 @@ class RuleBuilder:
             )
         """
 
-        def validation_func(document: etree._Element) -> Optional[ValidationIssue]:
-            is_valid = predicate(document)
-            if not is_valid:
-                return ValidationIssue(
-                    level=level,
-                    message=error_message,
-                    code=code or f"rule_{name}",
-                )
-            return None
-
-        return FunctionBasedRule(name, description, validation_func)
+        check = partial(
+            _check_predicate,
+            name=name,
+            predicate=predicate,
+            error_message=error_message,
+            level=level,
+            code=code,
+        )
+        return FunctionBasedRule(name, description, check)
 
     @staticmethod
     def xpath_exists(
@@ -159,6 +160,9 @@ class RuleBuilder:
         Returns:
             ValidationRule instance
 
+        Raises:
+            etree.XPathSyntaxError: If xpath is not a valid expression
+
         Example:
             rule = RuleBuilder.xpath_exists(
                 "has_patient_id",
@@ -166,21 +170,19 @@ class RuleBuilder:
                 error_message="Patient ID is required"
             )
         """
-        ns = namespaces or {"cda": "urn:hl7-org:v3"}
+        query = compile_xpath(xpath, namespaces or None)
         error_msg = error_message or f"XPath '{xpath}' returned no results"
 
-        def validation_func(document: etree._Element) -> Optional[ValidationIssue]:
-            results = document.xpath(xpath, namespaces=ns)
-            if not results:
-                return ValidationIssue(
-                    level=level,
-                    message=error_msg,
-                    code=f"xpath_not_found_{name}",
-                    location=xpath,
-                )
-            return None
+        check = partial(
+            _check_xpath_exists,
+            name=name,
+            xpath=xpath,
+            query=query,
+            error_msg=error_msg,
+            level=level,
+        )
 
-        return FunctionBasedRule(name, f"Check XPath exists: {xpath}", validation_func)
+        return FunctionBasedRule(name, f"Check XPath exists: {xpath}", check)
 
     @staticmethod
     def xpath_count(
@@ -209,6 +211,9 @@ class RuleBuilder:
         Returns:
             ValidationRule instance
 
+        Raises:
+            etree.XPathSyntaxError: If xpath is not a valid expression
+
         Example:
             rule = RuleBuilder.xpath_count(
                 "section_count",
@@ -218,49 +223,19 @@ class RuleBuilder:
                 error_message="Document should have 2-20 sections"
             )
         """
-        ns = namespaces or {"cda": "urn:hl7-org:v3"}
-
-        def validation_func(document: etree._Element) -> Optional[ValidationIssue]:
-            results = document.xpath(xpath, namespaces=ns)
-            count = len(results)
-
-            if exact_count is not None and count != exact_count:
-                msg = (
-                    error_message
-                    or f"XPath '{xpath}' returned {count} results, expected exactly {exact_count}"
-                )
-                return ValidationIssue(
-                    level=level,
-                    message=msg,
-                    code=f"xpath_count_mismatch_{name}",
-                    location=xpath,
-                )
-
-            if min_count is not None and count < min_count:
-                msg = (
-                    error_message
-                    or f"XPath '{xpath}' returned {count} results, minimum is {min_count}"
-                )
-                return ValidationIssue(
-                    level=level,
-                    message=msg,
-                    code=f"xpath_count_too_low_{name}",
-                    location=xpath,
-                )
-
-            if max_count is not None and count > max_count:
-                msg = (
-                    error_message
-                    or f"XPath '{xpath}' returned {count} results, maximum is {max_count}"
-                )
-                return ValidationIssue(
-                    level=level,
-                    message=msg,
-                    code=f"xpath_count_too_high_{name}",
-                    location=xpath,
-                )
-
-            return None
+        query = compile_xpath(xpath, namespaces or None)
+
+        check = partial(
+            _check_xpath_count,
+            name=name,
+            xpath=xpath,
+            query=query,
+            min_count=min_count,
+            max_count=max_count,
+            exact_count=exact_count,
+            error_message=error_message,
+            level=level,
+        )
 
         desc = f"Check XPath count: {xpath}"
         if exact_count:
@@ -272,7 +247,7 @@ class RuleBuilder:
         elif max_count:
             desc += f" (max {max_count})"
 
-        return FunctionBasedRule(name, desc, validation_func)
+        return FunctionBasedRule(name, desc, check)
 
     @staticmethod
     def xpath_value_matches(
@@ -297,6 +272,9 @@ class RuleBuilder:
         Returns:
             ValidationRule instance
 
+        Raises:
+            etree.XPathSyntaxError: If xpath is not a valid expression
+
         Example:
             rule = RuleBuilder.xpath_value_matches(
                 "valid_date_format",
@@ -305,37 +283,22 @@ class RuleBuilder:
                 error_message="Date must be in YYYYMMDD format"
             )
         """
-        import re
-
-        ns = namespaces or {"cda": "urn:hl7-org:v3"}
+        query = compile_xpath(xpath, namespaces or None)
         regex = re.compile(pattern)
 
-        def validation_func(document: etree._Element) -> List[ValidationIssue]:
-            results = document.xpath(xpath, namespaces=ns)
-            issues = []
-
-            for idx, value in enumerate(results, 1):
-                text = str(value)
-                if not regex.match(text):
-                    msg = (
-                        error_message
-                        or f"Value '{text}' at {xpath}[{idx}] does not match pattern '{pattern}'"
-                    )
-                    issues.append(
-                        ValidationIssue(
-                            level=level,
-                            message=msg,
-                            code=f"xpath_value_mismatch_{name}",
-                            location=f"{xpath}[{idx}]",
-                        )
-                    )
-
-            return issues
-
-        return FunctionBasedRule(
-            name, f"Check XPath value matches pattern: {xpath}", validation_func
+        check = partial(
+            _check_xpath_value_matches,
+            name=name,
+            xpath=xpath,
+            query=query,
+            pattern=pattern,
+            regex=regex,
+            error_message=error_message,
+            level=level,
         )
 
+        return FunctionBasedRule(name, f"Check XPath value matches pattern: {xpath}", check)
+
     @staticmethod
     def xpath_value_in_set(
         name: str,
@@ -359,6 +322,9 @@ class RuleBuilder:
         Returns:
             ValidationRule instance
 
+        Raises:
+            etree.XPathSyntaxError: If xpath is not a valid expression
+
         Example:
             rule = RuleBuilder.xpath_value_in_set(
                 "valid_gender",
@@ -367,35 +333,21 @@ class RuleBuilder:
                 error_message="Gender code must be M, F, or UN"
             )
         """
-        ns = namespaces or {"cda": "urn:hl7-org:v3"}
+        query = compile_xpath(xpath, namespaces or None)
         allowed_set = set(allowed_values)
 
-        def validation_func(document: etree._Element) -> List[ValidationIssue]:
-            results = cast(List[str], document.xpath(xpath, namespaces=ns))
-            issues = []
-
-            for idx, value in enumerate(results, 1):
-                text = str(value)
-                if text not in allowed_set:
-                    msg = (
-                        error_message
-                        or f"Value '{text}' at {xpath}[{idx}] not in allowed set: {allowed_set}"
-                    )
-                    issues.append(
-                        ValidationIssue(
-                            level=level,
-                            message=msg,
-                            code=f"xpath_value_not_allowed_{name}",
-                            location=f"{xpath}[{idx}]",
-                        )
-                    )
-
-            return issues
-
-        return FunctionBasedRule(
-            name, f"Check XPath value in allowed set: {xpath}", validation_func
+        check = partial(
+            _check_xpath_value_in_set,
+            name=name,
+            xpath=xpath,
+            query=query,
+            allowed_set=allowed_set,
+            error_message=error_message,
+            level=level,
         )
 
+        return FunctionBasedRule(name, f"Check XPath value in allowed set: {xpath}", check)
+
     @staticmethod
     def composite(
         name: str,
@@ -427,27 +379,198 @@ class RuleBuilder:
             )
         """
 
-        def validation_func(document: etree._Element) -> List[ValidationIssue]:
-            all_issues = []
-
-            for rule in rules:
-                issues = rule.validate(document)
-                all_issues.extend(issues)
-
-            if all_must_pass:
-                # Return all issues
-                return all_issues
-            else:
-                # At least one must pass - if all have issues, return them
-                if len(all_issues) == sum(len(r.validate(document)) for r in rules):
-                    # All rules failed
-                    return [
-                        ValidationIssue(
-                            level=ValidationLevel.ERROR,
-                            message=f"Composite rule '{name}' failed: none of the {len(rules)} sub-rules passed",
-                            code=f"composite_all_failed_{name}",
-                        )
-                    ]
-                return []
-
-        return FunctionBasedRule(name, description, validation_func)
+        check = partial(_check_composite, name=name, rules=rules, all_must_pass=all_must_pass)
+
+        return FunctionBasedRule(name, description, check)
+
+
+# Check functions are module-level (bound with functools.partial) so rules
+# built by RuleBuilder can be pickled and sent to worker processes.
+
+
+def _check_predicate(
+    document: etree._Element,
+    *,
+    name: str,
+    predicate: Callable[[etree._Element], bool],
+    error_message: str,
+    level: ValidationLevel,
+    code: Optional[str],
+) -> Optional[ValidationIssue]:
+    """Check function of RuleBuilder.create()."""
+    is_valid = predicate(document)
+    if not is_valid:
+        return ValidationIssue(
+            level=level,
+            message=error_message,
+            code=code or f"rule_{name}",
+        )
+    return None
+
+
+def _check_xpath_exists(
+    document: etree._Element,
+    *,
+    name: str,
+    xpath: str,
+    query: etree.XPath,
+    error_msg: str,
+    level: ValidationLevel,
+) -> Optional[ValidationIssue]:
+    """Check function of RuleBuilder.xpath_exists()."""
+    results = query(document)
+    if not results:
+        return ValidationIssue(
+            level=level,
+            message=error_msg,
+            code=f"xpath_not_found_{name}",
+            location=xpath,
+        )
+    return None
+
+
+def _check_xpath_count(
+    document: etree._Element,
+    *,
+    name: str,
+    xpath: str,
+    query: etree.XPath,
+    min_count: Optional[int],
+    max_count: Optional[int],
+    exact_count: Optional[int],
+    error_message: Optional[str],
+    level: ValidationLevel,
+) -> Optional[ValidationIssue]:
+    """Check function of RuleBuilder.xpath_count()."""
+    results = query(document)
+    count = len(results)
+
+    if exact_count is not None and count != exact_count:
+        msg = (
+            error_message
+            or f"XPath '{xpath}' returned {count} results, expected exactly {exact_count}"
+        )
+        return ValidationIssue(
+            level=level,
+            message=msg,
+            code=f"xpath_count_mismatch_{name}",
+            location=xpath,
+        )
+
+    if min_count is not None and count < min_count:
+        msg = error_message or f"XPath '{xpath}' returned {count} results, minimum is {min_count}"
+        return ValidationIssue(
+            level=level,
+            message=msg,
+            code=f"xpath_count_too_low_{name}",
+            location=xpath,
+        )
+
+    if max_count is not None and count > max_count:
+        msg = error_message or f"XPath '{xpath}' returned {count} results, maximum is {max_count}"
+        return ValidationIssue(
+            level=level,
+            message=msg,
+            code=f"xpath_count_too_high_{name}",
+            location=xpath,
+        )
+
+    return None
+
+
+def _check_xpath_value_matches(
+    document: etree._Element,
+    *,
+    name: str,
+    xpath: str,
+    query: etree.XPath,
+    pattern: str,
+    regex: "re.Pattern[str]",
+    error_message: Optional[str],
+    level: ValidationLevel,
+) -> List[ValidationIssue]:
+    """Check function of RuleBuilder.xpath_value_matches()."""
+    results = query(document)
+    issues = []
+
+    for idx, value in enumerate(results, 1):
+        text = str(value)
+        if not regex.match(text):
+            msg = (
+                error_message
+                or f"Value '{text}' at {xpath}[{idx}] does not match pattern '{pattern}'"
+            )
+            issues.append(
+                ValidationIssue(
+                    level=level,
+                    message=msg,
+                    code=f"xpath_value_mismatch_{name}",
+                    location=f"{xpath}[{idx}]",
+                )
+            )
+
+    return issues
+
+
+def _check_xpath_value_in_set(
+    document: etree._Element,
+    *,
+    name: str,
+    xpath: str,
+    query: etree.XPath,
+    allowed_set: set,
+    error_message: Optional[str],
+    level: ValidationLevel,
+) -> List[ValidationIssue]:
+    """Check function of RuleBuilder.xpath_value_in_set()."""
+    results = cast(List[str], query(document))
+    issues = []
+
+    for idx, value in enumerate(results, 1):
+        text = str(value)
+        if text not in allowed_set:
+            msg = (
+                error_message
+                or f"Value '{text}' at {xpath}[{idx}] not in allowed set: {allowed_set}"
+            )
+            issues.append(
+                ValidationIssue(
+                    level=level,
+                    message=msg,
+                    code=f"xpath_value_not_allowed_{name}",
+                    location=f"{xpath}[{idx}]",
+                )
+            )
+
+    return issues
+
+
+def _check_composite(
+    document: etree._Element,
+    *,
+    name: str,
+    rules: List[ValidationRule],
+    all_must_pass: bool,
+) -> List[ValidationIssue]:
+    """Check function of RuleBuilder.composite()."""
+    all_issues = []
+
+    for rule in rules:
+        issues = rule.validate(document)
+        all_issues.extend(issues)
+
+    if all_must_pass:
+        # Return all issues
+        return all_issues
+    else:
+        # At least one must pass - if all have issues, return them
+        if len(all_issues) == sum(len(r.validate(document)) for r in rules):
+            # All rules failed
+            return [
+                ValidationIssue(
+                    level=ValidationLevel.ERROR,
+                    message=f"Composite rule '{name}' failed: none of the {len(rules)} sub-rules passed",
+                    code=f"composite_all_failed_{name}",
+                )
+            ]
+        return []
@@ -1,12 +1,20 @@
 """Custom validation rules engine for organization-specific business logic."""
 
+import pickle
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional, Union, cast
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 from lxml import etree
 
-from ..core.validation import ValidationIssue, ValidationLevel, ValidationResult
+from ..core.validation import RuleStats, ValidationIssue, ValidationLevel, ValidationResult
+from .base import parse_document
+from .xpath import compile_xpath
 
 
 class ValidationRule(ABC):
@@ -56,6 +64,12 @@ class ValidationRule(ABC):
         return f"<ValidationRule: {self.name}>"
 
 
+# Document given to validate_many(), optionally paired with its ID
+BatchDocument = Union[
+    etree._Element, str, bytes, Path, Tuple[str, Union[etree._Element, str, bytes, Path]]
+]
+
+
 class RulesEngine:
     """
     Engine for running custom validation rules.
@@ -71,11 +85,28 @@ class RulesEngine:
         result = engine.validate(document)
         if not result.is_valid:
             print(f"Found {len(result.errors)} errors")
+
+    With profile=True every rule call is timed: each result carries its
+    per-rule profile (result.rule_stats, also in to_dict()), and the engine
+    keeps running totals for finding slow rules:
+
+        engine = RulesEngine(profile=True)
+        ...
+        for name, stats in engine.slowest_rules(5):
+            print(name, stats.calls, stats.total_time, stats.max_time)
     """
 
-    def __init__(self):
-        """Initialize rules engine with empty rule set."""
+    def __init__(self, profile: bool = False):
+        """
+        Initialize rules engine with empty rule set.
+
+        Args:
+            profile: Record call count, time and issues per rule (see stats())
+        """
         self._rules: List[ValidationRule] = []
+        self.profile = profile
+        self._rule_stats: Dict[str, RuleStats] = {}
+        self._stats_lock = threading.Lock()
 
     def add_rule(self, rule: ValidationRule) -> None:
         """
@@ -149,22 +180,46 @@ class RulesEngine:
         """
         # Parse document if needed
         doc_element = self._parse_document(document)
+        if not self.profile:
+            return self._run_rules(doc_element)
+
+        stats: Dict[str, RuleStats] = {}
+        result = self._run_rules(doc_element, stats)
+        self._record_stats(result, stats)
+        return result
+
+    def _run_rules(
+        self, doc_element: etree._Element, stats: Optional[Dict[str, RuleStats]] = None
+    ) -> ValidationResult:
+        """
+        Run every rule against a parsed document.
+
+        Args:
+            doc_element: Parsed document
+            stats: If given, every rule call is recorded in it
 
+        Returns:
+            ValidationResult with all issues categorized by level
+        """
         # Collect all issues from all rules
         all_issues: List[ValidationIssue] = []
         for rule in self._rules:
+            start = time.perf_counter() if stats is not None else 0.0
             try:
                 issues = rule.validate(doc_element)
-                all_issues.extend(issues)
             except Exception as e:
                 # If rule throws an exception, add it as an error
-                all_issues.append(
+                issues = [
                     ValidationIssue(
                         level=ValidationLevel.ERROR,
                         message=f"Rule '{rule.name}' failed: {str(e)}",
                         code=f"rule_error_{rule.name}",
                     )
-                )
+                ]
+            all_issues.extend(issues)
+            if stats is not None:
+                elapsed = time.perf_counter() - start
+                stats.setdefault(rule.name, RuleStats()).record(elapsed, len(issues))
 
         # Categorize issues by level
         errors = [i for i in all_issues if i.level == ValidationLevel.ERROR]
@@ -173,6 +228,127 @@ class RulesEngine:
 
         return ValidationResult(errors=errors, warnings=warnings, infos=infos)
 
+    def validate_many(
+        self,
+        documents: Iterable[BatchDocument],
+        workers: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Tuple[str, ValidationResult]]:
+        """
+        Validate a stream of documents, optionally on a process pool.
+
+        With workers > 1 the rule set is pickled once and every worker process
+        unpickles its own copy, so rules must be picklable: ValidationRule
+        subclasses and rules made by RuleBuilder are, as long as functions
+        passed to RuleBuilder.create() are defined at module level (not
+        lambdas). Paths are read by the workers; elements are serialized and
+        re-parsed there.
+
+        Documents that cannot be parsed are reported as a result with an
+        XML_SYNTAX_ERROR or FILE_NOT_FOUND error instead of stopping the batch.
+        Per-rule statistics of the batch are always added to stats(); with
+        profile=True each result also carries its own.
+
+        Example:
+            for doc_id, result in engine.validate_many(Path("out").glob("*.xml"), workers=8):
+                if not result.is_valid:
+                    print(doc_id, len(result.errors))
+            for name, stats in engine.stats().items():
+                print(name, stats.failures, stats.total_time)
+
+        Args:
+            documents: Iterable of elements, XML strings or bytes, file paths,
+                or (doc_id, document) pairs
+            workers: Number of worker processes (1 = validate in this process)
+            max_pending: Documents queued ahead of the consumer
+                (default: 4 per worker)
+
+        Yields:
+            (doc_id, ValidationResult) pairs in input order. doc_id is the
+            given ID, the file path, or the document's position in the input.
+
+        Raises:
+            ValueError: If workers is less than 1
+            TypeError: If the rules cannot be pickled for worker processes
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        items = (_batch_item(index, document) for index, document in enumerate(documents))
+
+        if workers == 1:
+            for doc_id, document in items:
+                result, stats = _validate_batch_document(self, document)
+                self._record_stats(result, stats)
+                yield doc_id, result
+            return
+
+        try:
+            payload = pickle.dumps(self._rules)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise TypeError(
+                f"Rules cannot be sent to worker processes ({e}); "
+                "use workers=1 or define rule functions at module level"
+            ) from e
+
+        limit = max_pending or workers * 4
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(payload,)
+        ) as executor:
+            pending: Deque = deque()
+            for doc_id, document in items:
+                if isinstance(document, etree._Element):
+                    document = etree.tostring(document)
+                pending.append((doc_id, executor.submit(_validate_in_worker, document)))
+                if len(pending) >= limit:
+                    yield self._collect(*pending.popleft())
+            while pending:
+                yield self._collect(*pending.popleft())
+
+    def _collect(self, doc_id: str, future) -> Tuple[str, ValidationResult]:
+        """Wait for a worker result and record its rule statistics."""
+        result, stats = future.result()
+        self._record_stats(result, stats)
+        return doc_id, result
+
+    def _record_stats(self, result: ValidationResult, stats: Dict[str, RuleStats]) -> None:
+        """Add one document's rule statistics to the engine totals."""
+        if self.profile:
+            result.rule_stats = stats
+        with self._stats_lock:
+            for name, rule_stats in stats.items():
+                self._rule_stats.setdefault(name, RuleStats()).merge(rule_stats)
+
+    def stats(self) -> Dict[str, RuleStats]:
+        """
+        Get per-rule statistics recorded so far.
+
+        Collected by validate() when profiling and by validate_many().
+
+        Returns:
+            Copy of the statistics, keyed by rule name in first-run order
+        """
+        with self._stats_lock:
+            return {name: replace(stats) for name, stats in self._rule_stats.items()}
+
+    def slowest_rules(self, count: int = 10) -> List[Tuple[str, RuleStats]]:
+        """
+        Get the rules that took the most total time.
+
+        Args:
+            count: Number of rules to return
+
+        Returns:
+            (rule name, statistics) pairs, slowest first
+        """
+        ranked = sorted(self.stats().items(), key=lambda item: item[1].total_time, reverse=True)
+        return ranked[:count]
+
+    def reset_stats(self) -> None:
+        """Clear per-rule statistics."""
+        with self._stats_lock:
+            self._rule_stats.clear()
+
     def _parse_document(self, document: Union[etree._Element, str, bytes, Path]) -> etree._Element:
         """
         Parse document into an lxml Element.
@@ -187,29 +363,7 @@ class RulesEngine:
             FileNotFoundError: If file path doesn't exist
             etree.XMLSyntaxError: If document is not well-formed XML
         """
-        if isinstance(document, etree._Element):
-            return document
-
-        if isinstance(document, Path):
-            if not document.exists():
-                raise FileNotFoundError(f"File not found: {document}")
-            return etree.parse(str(document)).getroot()
-
-        if isinstance(document, str):
-            # Try as file path first
-            path = Path(document)
-            if path.exists():
-                return etree.parse(str(path)).getroot()
-            # Otherwise parse as XML string
-            return etree.fromstring(document.encode("utf-8"))
-
-        if isinstance(document, bytes):
-            return etree.fromstring(document)
-
-        raise TypeError(
-            f"Unsupported document type: {type(document)}. "
-            "Expected etree._Element, str, bytes, or Path"
-        )
+        return parse_document(document)
 
     def __len__(self) -> int:
         """Get number of rules in engine."""
@@ -220,6 +374,63 @@ class RulesEngine:
         return f"<RulesEngine: {len(self._rules)} rules>"
 
 
+# Worker side of RulesEngine.validate_many(). Each worker process unpickles
+# the rule set once, in _init_worker().
+_worker_engine: Optional[RulesEngine] = None
+
+
+def _init_worker(payload: bytes) -> None:
+    """Load the pickled rule set into this worker process."""
+    global _worker_engine
+    _worker_engine = RulesEngine()
+    for rule in pickle.loads(payload):  # noqa: S301  # Pickled by the parent engine
+        _worker_engine.add_rule(rule)
+
+
+def _validate_in_worker(
+    document: Union[str, bytes, Path],
+) -> Tuple[ValidationResult, Dict[str, RuleStats]]:
+    """Validate one document with the worker's rule set."""
+    assert _worker_engine is not None, "worker not initialized"
+    return _validate_batch_document(_worker_engine, document)
+
+
+def _validate_batch_document(
+    engine: RulesEngine, document: Union[etree._Element, str, bytes, Path]
+) -> Tuple[ValidationResult, Dict[str, RuleStats]]:
+    """Parse and validate one batch document, reporting parse failures as errors."""
+    stats: Dict[str, RuleStats] = {}
+    try:
+        element = engine._parse_document(document)
+    except etree.XMLSyntaxError as e:
+        issue = ValidationIssue(
+            level=ValidationLevel.ERROR,
+            message=f"XML syntax error: {e}",
+            location=f"Line {e.lineno}" if hasattr(e, "lineno") else None,
+            code="XML_SYNTAX_ERROR",
+        )
+        return ValidationResult(errors=[issue]), stats
+    except FileNotFoundError as e:
+        issue = ValidationIssue(level=ValidationLevel.ERROR, message=str(e), code="FILE_NOT_FOUND")
+        return ValidationResult(errors=[issue]), stats
+    return engine._run_rules(element, stats), stats
+
+
+def _batch_item(
+    index: int, document: BatchDocument
+) -> Tuple[str, Union[etree._Element, str, bytes, Path]]:
+    """Split a validate_many() input into its ID and document."""
+    if isinstance(document, tuple):
+        doc_id, document = document
+        return str(doc_id), document
+    if isinstance(document, Path):
+        return str(document), document
+    if isinstance(document, str) and not document.lstrip().startswith("<"):
+        # A file path; send it as a Path so workers never mistake it for XML
+        return document, Path(document)
+    return str(index), document
+
+
 # Example custom rules
 
 
@@ -259,16 +470,14 @@ class RequiredSectionsRule(ValidationRule):
         self.required_sections = required_sections
         self.section_names = section_names or {}
         self.level = level
+        self._section_codes = compile_xpath("//cda:section/cda:code/@code")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate required sections are present."""
         issues = []
 
-        # Define namespace
-        ns = {"cda": "urn:hl7-org:v3"}
-
         # Find all section codes in document
-        sections = cast(List[str], document.xpath("//cda:section/cda:code/@code", namespaces=ns))
+        sections = cast(List[str], self._section_codes(document))
 
         # Check each required section
         for required_code in self.required_sections:
@@ -321,17 +530,14 @@ class MedicationDosageRule(ValidationRule):
         self.max_dosage = max_dosage
         self.min_dosage = min_dosage
         self.level = level
+        self._dosages = compile_xpath("//cda:substanceAdministration/cda:doseQuantity/@value")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate medication dosages."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find all medication dosage values
-        dosages = document.xpath(
-            "//cda:substanceAdministration/cda:doseQuantity/@value",
-            namespaces=ns,
-        )
+        dosages = self._dosages(document)
 
         for idx, dosage_str in enumerate(dosages, 1):
             try:
@@ -402,18 +608,18 @@ class DateConsistencyRule(ValidationRule):
         self.allow_future_dates = allow_future_dates
         self.max_years_past = max_years_past
         self.level = level
+        self._times = compile_xpath("//cda:effectiveTime/@value")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate date consistency."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         from datetime import datetime
 
         today = datetime.now()
 
         # Find all effectiveTime elements with values
-        times = document.xpath("//cda:effectiveTime/@value", namespaces=ns)
+        times = self._times(document)
 
         for time_str in times:
             try:
@@ -490,19 +696,19 @@ class CodeSystemConsistencyRule(ValidationRule):
             "procedure": "2.16.840.1.113883.6.96",  # SNOMED CT or CPT
         }
         self.level = level
+        self._problem_code_systems = compile_xpath(
+            "//cda:observation[cda:templateId/@root='2.16.840.1.113883.10.20.22.4.4']"
+            "/cda:value/@codeSystem"
+        )
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate code system usage."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Check problem codes (in observation acts)
         if "problem" in self.expected_systems:
             expected_oid = self.expected_systems["problem"]
-            problem_codes = document.xpath(
-                "//cda:observation[cda:templateId/@root='2.16.840.1.113883.10.20.22.4.4']/cda:value/@codeSystem",
-                namespaces=ns,
-            )
+            problem_codes = self._problem_code_systems(document)
             for idx, code_system in enumerate(problem_codes, 1):
                 if code_system != expected_oid:
                     issues.append(
@@ -552,22 +758,24 @@ class NarrativePresenceRule(ValidationRule):
         self.require_narrative = require_narrative
         self.min_length = min_length
         self.level = level
+        self._sections = compile_xpath("//cda:section")
+        self._text = compile_xpath("cda:text")
+        self._title = compile_xpath("cda:title/text()")
 
     def validate(self, document: etree._Element) -> List[ValidationIssue]:
         """Validate narrative presence."""
         issues = []
-        ns = {"cda": "urn:hl7-org:v3"}
 
         # Find all sections
-        sections = document.xpath("//cda:section", namespaces=ns)
+        sections = self._sections(document)
 
         for idx, section in enumerate(sections, 1):
             # Check if section has text element
-            text_elements = section.xpath("cda:text", namespaces=ns)
+            text_elements = self._text(section)
 
             if not text_elements and self.require_narrative:
                 # Get section title or code for better error message
-                title = section.xpath("cda:title/text()", namespaces=ns)
+                title = self._title(section)
                 title_str = title[0] if title else f"Section {idx}"
 
                 issues.append(
@@ -585,7 +793,7 @@ class NarrativePresenceRule(ValidationRule):
                 ).strip()
 
                 if len(text_content) < self.min_length:
-                    title = section.xpath("cda:title/text()", namespaces=ns)
+                    title = self._title(section)
                     title_str = title[0] if title else f"Section {idx}"
 
                     issues.append(
@@ -1,5 +1,6 @@
 """Schematron validator for C-CDA documents."""
 
+import threading
 import warnings
 from pathlib import Path
 from typing import List, Optional, Union
@@ -52,6 +53,7 @@ class SchematronValidator(BaseValidator):
         phase: Optional[str] = None,
         auto_download: bool = True,
         max_errors: Optional[int] = 100,
+        assert_level: ValidationLevel = ValidationLevel.ERROR,
     ):
         """
         Initialize Schematron validator.
@@ -65,6 +67,9 @@ class SchematronValidator(BaseValidator):
                 Default: True. Set to False to disable automatic downloads.
             max_errors: Maximum number of errors to extract and store (default: 100).
                 Set to None for unlimited. Limiting errors reduces memory usage significantly.
+            assert_level: Level reported for failed assertions. The HL7 "warnings"
+                phase holds SHOULD conformance statements, so a validator compiled
+                for that phase reports them with ValidationLevel.WARNING.
 
         Raises:
             FileNotFoundError: If schematron file doesn't exist and auto_download=False
@@ -78,6 +83,10 @@ class SchematronValidator(BaseValidator):
         self.phase = phase
         self.auto_download = auto_download
         self.max_errors = max_errors
+        self.assert_level = assert_level
+        # validation_report is state on the compiled schematron, so concurrent
+        # validate() calls on one validator take turns
+        self._lock = threading.Lock()
 
         # Attempt auto-download if file doesn't exist
         if not self.schematron_path.exists() and self.auto_download:
@@ -258,13 +267,14 @@ class SchematronValidator(BaseValidator):
             doc_element = self._parse_document(document)
 
             # Run Schematron validation
-            is_valid = self.schematron.validate(doc_element)
+            with self._lock:
+                is_valid = self.schematron.validate(doc_element)
+                if not is_valid:
+                    # Extract validation messages from SVRL report
+                    report = self.schematron.validation_report
+                    issues, has_more = self._extract_issues_from_report(report)
 
             if not is_valid:
-                # Extract validation messages from SVRL report
-                report = self.schematron.validation_report
-                issues, has_more = self._extract_issues_from_report(report)
-
                 # Categorize issues by level (schematron reports as failed-assert or successful-report)
                 for issue in issues:
                     if issue.level == ValidationLevel.ERROR:
@@ -380,13 +390,14 @@ class SchematronValidator(BaseValidator):
         code = f"SCHEMATRON_{rule_id}" if rule_id else "SCHEMATRON_ERROR"
 
         # Format full error message for parser
-        full_message = f"ERROR at {location}: {message}" if location else f"ERROR: {message}"
+        label = self.assert_level.value.upper()
+        full_message = f"{label} at {location}: {message}" if location else f"{label}: {message}"
 
         # Parse error for enhanced display
         parsed_error = SchematronErrorParser.parse_error(full_message)
 
         return ValidationIssue(
-            level=ValidationLevel.ERROR,
+            level=self.assert_level,
             message=message,
             location=location,
             code=code,
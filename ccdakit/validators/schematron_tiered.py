@@ -0,0 +1,350 @@
+"""Two-tier Schematron validation: a fast errors verdict, warnings later.
+
+The HL7 C-CDA Schematron splits its patterns into an "errors" phase (SHALL
+statements) and a "warnings" phase (SHOULD statements). A plain
+SchematronValidator evaluates both, so callers wait for every warning before
+they learn whether the document passes. TieredSchematronValidator compiles
+the two phases as separate validators, answers with the errors phase right
+away, and runs the warnings phase afterwards on a background thread, on the
+caller's thread, or not at all.
+
+Compiled phase validators are cached per file, phase and settings, and shared
+by every tiered validator in the process.
+
+Example:
+    validator = TieredSchematronValidator()
+    tiered = validator.check(document)
+    render(tiered.errors)  # pass/fail verdict
+    render(tiered.warnings())  # waits for the warnings phase
+"""
+
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from lxml import etree
+
+from ..core.validation import StageTiming, ValidationLevel, ValidationResult
+from .base import BaseValidator
+from .schematron import SchematronValidator
+
+
+ERRORS_PHASE = "errors"
+WARNINGS_PHASE = "warnings"
+
+_CacheKey = Tuple[Optional[str], Optional[str], Optional[int], ValidationLevel]
+
+_phase_validators: Dict[_CacheKey, SchematronValidator] = {}
+_phase_validators_lock = threading.Lock()
+
+
+class WarningsPolicy(Enum):
+    """How TieredSchematronValidator runs the warnings phase."""
+
+    DEFERRED = "deferred"  # Background thread, after the errors phase returns
+    SYNC = "sync"  # Caller's thread, right after the errors phase
+    SKIP = "skip"  # Not run (the warnings phase is never compiled)
+
+
+def get_phase_validator(
+    schematron_path: Optional[Union[str, Path]] = None,
+    phase: Optional[str] = None,
+    max_errors: Optional[int] = 100,
+    assert_level: ValidationLevel = ValidationLevel.ERROR,
+    auto_download: bool = True,
+) -> SchematronValidator:
+    """
+    Get a compiled SchematronValidator for one phase, compiling it on first use.
+
+    Compiling the HL7 Schematron takes seconds and tens of megabytes, so each
+    combination of file, phase and settings is compiled once per process.
+
+    Args:
+        schematron_path: Path to Schematron file (None for the default HL7 file)
+        phase: Phase to compile (None for all patterns)
+        max_errors: Maximum number of issues extracted per document
+        assert_level: Level reported for failed assertions
+        auto_download: Download the default Schematron files if missing
+
+    Returns:
+        Shared SchematronValidator
+
+    Raises:
+        FileNotFoundError: If the Schematron file does not exist
+        etree.SchematronParseError: If the Schematron is invalid
+    """
+    path = str(Path(schematron_path)) if schematron_path is not None else None
+    key = (path, phase, max_errors, assert_level)
+    with _phase_validators_lock:
+        validator = _phase_validators.get(key)
+        if validator is None:
+            validator = SchematronValidator(
+                schematron_path=path,
+                phase=phase,
+                auto_download=auto_download,
+                max_errors=max_errors,
+                assert_level=assert_level,
+            )
+            _phase_validators[key] = validator
+        return validator
+
+
+def clear_phase_validators() -> None:
+    """Drop every cached phase validator."""
+    with _phase_validators_lock:
+        _phase_validators.clear()
+
+
+class TieredResult:
+    """Errors-phase result of a tiered validation, with the warnings phase to follow."""
+
+    def __init__(
+        self, errors: ValidationResult, warnings: Optional["Future[ValidationResult]"] = None
+    ) -> None:
+        """
+        Initialize tiered result.
+
+        Args:
+            errors: Result of the errors phase
+            warnings: Future for the warnings phase result (None if not run)
+        """
+        self.errors = errors
+        self._warnings = warnings
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if the errors phase passed."""
+        return self.errors.is_valid
+
+    @property
+    def warnings_pending(self) -> bool:
+        """Check if the warnings phase is still running."""
+        return self._warnings is not None and not self._warnings.done()
+
+    def warnings(self, timeout: Optional[float] = None) -> Optional[ValidationResult]:
+        """
+        Get the warnings phase result, waiting for it if needed.
+
+        Args:
+            timeout: Seconds to wait (None waits until done)
+
+        Returns:
+            Warnings phase result, or None if the phase was skipped
+
+        Raises:
+            concurrent.futures.TimeoutError: If the phase is not done in time
+            Exception: Any exception raised while validating
+        """
+        if self._warnings is None:
+            return None
+        return self._warnings.result(timeout=timeout)
+
+    def merged(self, timeout: Optional[float] = None) -> ValidationResult:
+        """
+        Combine both phases into one result, waiting for warnings if needed.
+
+        Args:
+            timeout: Seconds to wait for the warnings phase
+
+        Returns:
+            New ValidationResult with the issues and timings of both phases
+
+        Raises:
+            concurrent.futures.TimeoutError: If the phase is not done in time
+        """
+        warnings = self.warnings(timeout=timeout)
+        return ValidationResult.merge(
+            [self.errors] if warnings is None else [self.errors, warnings]
+        )
+
+    def __repr__(self) -> str:
+        """String representation of tiered result."""
+        state = "pending" if self.warnings_pending else "done"
+        if self._warnings is None:
+            state = "skipped"
+        return f"<TieredResult: {len(self.errors.errors)} errors, warnings {state}>"
+
+
+class TieredSchematronValidator(BaseValidator):
+    """
+    Schematron validator that reports errors first and warnings afterwards.
+
+    check() returns as soon as the errors phase is done; with the deferred
+    policy the warnings phase runs on a background thread against the same
+    parsed tree, so the tree must not be modified until warnings are done.
+    validate() returns one merged result and can stand in for a
+    SchematronValidator (for example as a ValidationPipeline stage).
+
+    Issues from the warnings phase, including failed assertions, are reported
+    as warnings, so they never change the pass/fail verdict.
+    """
+
+    def __init__(
+        self,
+        schematron_path: Optional[Union[str, Path]] = None,
+        warnings: Union[WarningsPolicy, str] = WarningsPolicy.DEFERRED,
+        errors_phase: str = ERRORS_PHASE,
+        warnings_phase: str = WARNINGS_PHASE,
+        auto_download: bool = True,
+        max_errors: Optional[int] = 100,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize tiered Schematron validator.
+
+        Args:
+            schematron_path: Path to Schematron file (None for the default HL7 file)
+            warnings: Warnings phase policy (WarningsPolicy or its value)
+            errors_phase: Phase holding the error-level patterns
+            warnings_phase: Phase holding the warning-level patterns
+            auto_download: Download the default Schematron files if missing
+            max_errors: Maximum number of issues extracted per phase
+            executor: Executor for deferred warnings. Must run tasks in this
+                process, since they share the parsed tree. Defaults to a
+                single background thread owned by the validator.
+
+        Raises:
+            ValueError: If warnings is not a valid policy
+            FileNotFoundError: If the Schematron file does not exist
+            etree.SchematronParseError: If the Schematron is invalid
+        """
+        self.policy = WarningsPolicy(warnings)
+        self.errors_phase = errors_phase
+        self.warnings_phase = warnings_phase
+        self.errors_validator = get_phase_validator(
+            schematron_path, errors_phase, max_errors, ValidationLevel.ERROR, auto_download
+        )
+        self.warnings_validator: Optional[SchematronValidator] = None
+        if self.policy is not WarningsPolicy.SKIP:
+            self.warnings_validator = get_phase_validator(
+                schematron_path, warnings_phase, max_errors, ValidationLevel.WARNING, auto_download
+            )
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def check(
+        self,
+        document: Union[etree._Element, str, bytes, Path],
+        warnings: Optional[Union[WarningsPolicy, str]] = None,
+    ) -> TieredResult:
+        """
+        Run the errors phase now and the warnings phase according to policy.
+
+        Args:
+            document: Document to validate (element, XML string, file path,
+                bytes or Path); parsed once for both phases
+            warnings: Policy for this call (default: the validator's policy)
+
+        Returns:
+            TieredResult whose errors are available immediately
+
+        Raises:
+            ValueError: If warnings is not a valid policy, or the validator was
+                created with the skip policy and this call asks for warnings
+        """
+        policy = self.policy if warnings is None else WarningsPolicy(warnings)
+        if policy is not WarningsPolicy.SKIP and self.warnings_validator is None:
+            raise ValueError("Warnings phase was not compiled (validator uses the skip policy)")
+
+        try:
+            element = self._parse_document(document)
+        except (etree.XMLSyntaxError, FileNotFoundError):
+            # The errors validator reports the parse failure in its usual form
+            return TieredResult(self.errors_validator.validate(document))
+
+        errors = self._run_phase(self.errors_validator, self.errors_phase, element)
+        if policy is WarningsPolicy.SKIP:
+            errors.timings.append(StageTiming(stage=self._stage(self.warnings_phase), skipped=True))
+            return TieredResult(errors)
+
+        if policy is WarningsPolicy.SYNC:
+            future: Future[ValidationResult] = Future()
+            future.set_result(
+                self._run_phase(self.warnings_validator, self.warnings_phase, element)
+            )
+        else:
+            future = self._get_executor().submit(
+                self._run_phase, self.warnings_validator, self.warnings_phase, element
+            )
+        return TieredResult(errors, future)
+
+    def validate(self, document: Union[etree._Element, str, bytes, Path]) -> ValidationResult:
+        """
+        Validate a document and merge both phases into one result.
+
+        The deferred policy runs warnings on the caller's thread here, since
+        the merged result has to wait for them anyway.
+
+        Args:
+            document: Document to validate (element, XML string, file path,
+                bytes or Path)
+
+        Returns:
+            ValidationResult with errors-phase and warnings-phase issues
+        """
+        policy = WarningsPolicy.SYNC if self.policy is WarningsPolicy.DEFERRED else None
+        return self.check(document, warnings=policy).merged()
+
+    def _run_phase(
+        self, validator: SchematronValidator, phase: str, element: etree._Element
+    ) -> ValidationResult:
+        """Run one phase and record its wall-clock and CPU time."""
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        result = validator.validate(element)
+        # Copy so the shared phase validator's result is never mutated
+        return ValidationResult(
+            errors=list(result.errors),
+            warnings=list(result.warnings),
+            infos=list(result.infos),
+            timings=[
+                *result.timings,
+                StageTiming(
+                    stage=self._stage(phase),
+                    wall_time=time.perf_counter() - wall_start,
+                    cpu_time=time.thread_time() - cpu_start,
+                ),
+            ],
+        )
+
+    @staticmethod
+    def _stage(phase: str) -> str:
+        """Timing stage name for a phase."""
+        return f"schematron:{phase}"
+
+    def _get_executor(self) -> Executor:
+        """Get the warnings executor, starting the owned thread on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="schematron-warnings"
+            )
+        return self._executor
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the owned background thread.
+
+        Args:
+            wait: Wait for pending warnings phases to finish
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self) -> "TieredSchematronValidator":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Exit context manager, waiting for pending warnings."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of tiered validator."""
+        return (
+            f"<TieredSchematronValidator: {self.errors_phase} now, "
+            f"{self.warnings_phase} {self.policy.value}>"
+        )
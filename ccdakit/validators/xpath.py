@@ -0,0 +1,90 @@
+"""Shared cache of compiled XPath expressions used by validation rules.
+
+``element.xpath(expression, namespaces=ns)`` parses and compiles the
+expression on every call. Rules evaluate the same handful of expressions
+against every document they see, so they compile them once with
+compile_xpath() when the rule is constructed and call the compiled
+``etree.XPath`` object afterwards. Rules that share an expression share the
+compiled object.
+
+The compiled objects pickle by expression and namespaces, so rules holding
+them can be sent to worker processes (see RulesEngine.validate_many); the
+unpickled copy is taken from the worker's own cache.
+
+Example:
+    sections = compile_xpath("//cda:section")
+    count = len(sections(document))
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from lxml import etree
+
+
+# Namespace map used by rules when none is given
+CDA_NAMESPACES: Dict[str, str] = {"cda": "urn:hl7-org:v3"}
+
+XPATH_CACHE_SIZE = 1024
+
+_NamespaceKey = Tuple[Tuple[str, str], ...]
+
+
+class CompiledXPath(etree.XPath):
+    """etree.XPath that remembers its namespaces so it can be pickled."""
+
+    def __init__(self, expression: str, namespaces: _NamespaceKey) -> None:
+        """
+        Compile expression.
+
+        Args:
+            expression: XPath expression
+            namespaces: Prefix to namespace URI pairs
+        """
+        super().__init__(expression, namespaces=dict(namespaces))
+        self.namespace_key = namespaces
+
+    def __reduce__(self):
+        """Pickle as a compile_xpath() call."""
+        return (compile_xpath, (self.path, dict(self.namespace_key)))
+
+
+def compile_xpath(expression: str, namespaces: Optional[Dict[str, str]] = None) -> CompiledXPath:
+    """
+    Get a compiled XPath for an expression, compiling it on first use.
+
+    Args:
+        expression: XPath expression
+        namespaces: Prefix to namespace URI mapping (defaults to CDA_NAMESPACES)
+
+    Returns:
+        Compiled XPath (an etree.XPath), shared by every caller with the same expression
+        and namespaces
+
+    Raises:
+        etree.XPathSyntaxError: If the expression is not valid XPath
+    """
+    ns = CDA_NAMESPACES if namespaces is None else namespaces
+    return _compile(expression, tuple(sorted(ns.items())))
+
+
+@lru_cache(maxsize=XPATH_CACHE_SIZE)
+def _compile(expression: str, namespaces: _NamespaceKey) -> CompiledXPath:
+    """Compile expression (cached on expression and frozen namespaces)."""
+    return CompiledXPath(expression, namespaces)
+
+
+def xpath_cache_info() -> Dict[str, int]:
+    """
+    Get statistics for the compiled XPath cache.
+
+    Returns:
+        Dictionary with hits, misses and current size
+    """
+    info = _compile.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def clear_xpath_cache() -> None:
+    """Drop every compiled expression and reset the statistics."""
+    _compile.cache_clear()
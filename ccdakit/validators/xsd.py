@@ -1,12 +1,13 @@
 """XSD schema validator for C-CDA documents."""
 
+import io
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
 
 from lxml import etree
 
 from ..core.validation import ValidationIssue, ValidationLevel, ValidationResult
-from .base import BaseValidator
+from .base import BaseValidator, parse_document
 
 
 class XSDValidator(BaseValidator):
@@ -30,16 +31,28 @@ class XSDValidator(BaseValidator):
         >>> validator = XSDValidator("/path/to/schemas/CDA.xsd")
         >>> result = validator.validate(document)
 
+        >>> # Validate large exports while parsing, without building the tree
+        >>> validator = XSDValidator(streaming=True, huge_tree=True)
+        >>> for path, result in validator.validate_files(Path("export").glob("*.xml")):
+        ...     print(path, "valid" if result.is_valid else "invalid")
+
     Note:
         XSD schemas are automatically downloaded on first use if not present.
         Set auto_download=False to disable automatic downloads.
     """
 
+    # Elements dropped once validated in streaming mode. Entries and
+    # components hold nearly all of a large document; handling only these
+    # keeps per-element Python overhead out of the parse loop.
+    STREAM_CLEAR_TAGS = ("{urn:hl7-org:v3}entry", "{urn:hl7-org:v3}component")
+
     def __init__(
         self,
         schema_path: Optional[Union[str, Path]] = None,
         auto_download: bool = True,
         max_errors: Optional[int] = 100,
+        streaming: bool = False,
+        huge_tree: bool = False,
     ):
         """
         Initialize XSD validator with schema file.
@@ -51,6 +64,13 @@ class XSDValidator(BaseValidator):
                 Default: True. Set to False to disable automatic downloads.
             max_errors: Maximum number of errors to extract and store (default: 100).
                 Set to None for unlimited. Limiting errors reduces memory usage.
+            streaming: Validate unparsed documents while parsing them and
+                discard the tree as it is read. Well-formedness and schema
+                errors are both reported, invalid documents are rejected at
+                the first violation, and memory use no longer grows with
+                document size. Streaming errors carry no line numbers.
+            huge_tree: Lift libxml2's safety limits on tree depth and text
+                size, needed for very large (100MB+) documents.
 
         Raises:
             FileNotFoundError: If schema file doesn't exist and auto_download=False
@@ -62,6 +82,8 @@ class XSDValidator(BaseValidator):
         """
         self.auto_download = auto_download
         self.max_errors = max_errors
+        self.streaming = streaming
+        self.huge_tree = huge_tree
         self.schema_path = self._resolve_schema_path(schema_path)
 
         # Attempt auto-download if file doesn't exist
@@ -158,7 +180,9 @@ class XSDValidator(BaseValidator):
                 stacklevel=2,
             )
 
-    def validate(self, document: Union[etree._Element, str, bytes, Path]) -> ValidationResult:
+    def validate(
+        self, document: Union[etree._Element, str, bytes, Path, IO[bytes]]
+    ) -> ValidationResult:
         """
         Validate a C-CDA document against XSD schema.
 
@@ -168,6 +192,7 @@ class XSDValidator(BaseValidator):
                 - str: XML string or file path
                 - bytes: XML bytes
                 - Path: Path to XML file
+                - Binary file object (streaming mode only)
 
         Returns:
             ValidationResult with errors from schema validation
@@ -176,19 +201,31 @@ class XSDValidator(BaseValidator):
             FileNotFoundError: If file path doesn't exist
             etree.XMLSyntaxError: If document is not well-formed XML
         """
+        return self._validate(document, self.streaming)
+
+    def _validate(
+        self,
+        document: Union[etree._Element, str, bytes, Path, IO[bytes]],
+        streaming: bool,
+    ) -> ValidationResult:
+        """Validate document, streaming unless it is already parsed."""
         result = ValidationResult()
 
         try:
-            # Parse document
-            doc_element = self._parse_document(document)
+            if streaming and not isinstance(document, etree._Element):
+                schema_errors = self._validate_streaming(document)
+            else:
+                # Parse document
+                doc_element = self._parse_document(document)
 
-            # Validate against schema
-            is_valid = self.schema.validate(doc_element)
+                # Validate against schema
+                is_valid = self.schema.validate(doc_element)
+                schema_errors = [] if is_valid else list(self.schema.error_log)
 
-            if not is_valid:
+            if schema_errors:
                 # Extract validation errors (limited by max_errors)
                 error_count = 0
-                for error in self.schema.error_log:
+                for error in schema_errors:
                     # Check if we've reached the limit
                     if self.max_errors is not None and error_count >= self.max_errors:
                         result.infos.append(
@@ -235,6 +272,126 @@ class XSDValidator(BaseValidator):
 
         return result
 
+    def _validate_streaming(
+        self, document: Union[str, bytes, Path, IO[bytes]]
+    ) -> List[etree._LogEntry]:
+        """
+        Validate document against the schema while parsing it.
+
+        Completed STREAM_CLEAR_TAGS subtrees are discarded as soon as the
+        parser has validated them, so memory stays flat regardless of how many
+        entries a document has. Parsing stops at the first schema violation.
+
+        Args:
+            document: Unparsed document
+
+        Returns:
+            Schema errors (empty if the document is valid)
+
+        Raises:
+            FileNotFoundError: If file path doesn't exist
+            etree.XMLSyntaxError: If document is not well-formed XML
+        """
+        context = etree.iterparse(
+            self._stream_source(document),
+            events=("end",),
+            tag=self.STREAM_CLEAR_TAGS,
+            schema=self.schema,
+            huge_tree=self.huge_tree,
+        )
+        try:
+            for _, element in context:
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        except etree.XMLSyntaxError:
+            schema_errors = [
+                error
+                for error in context.error_log
+                if error.domain == etree.ErrorDomains.SCHEMASV
+            ]
+            if not schema_errors:
+                raise
+            return schema_errors
+        return []
+
+    def _stream_source(self, document: Union[str, bytes, Path, IO[bytes]]) -> Union[str, IO[bytes]]:
+        """
+        Get a file name or file object lxml can parse incrementally.
+
+        Args:
+            document: Unparsed document (see validate)
+
+        Returns:
+            File name or binary file object
+
+        Raises:
+            FileNotFoundError: If file path doesn't exist
+            TypeError: If document is of an unsupported type
+        """
+        if isinstance(document, Path):
+            if not document.exists():
+                raise FileNotFoundError(f"File not found: {document}")
+            return str(document)
+
+        if isinstance(document, str):
+            # Same resolution as parse_document: XML text first, then file path
+            if not document.lstrip().startswith("<") and Path(document).exists():
+                return document
+            return io.BytesIO(document.encode("utf-8"))
+
+        if isinstance(document, bytes):
+            return io.BytesIO(document)
+
+        if hasattr(document, "read"):
+            return document
+
+        raise TypeError(
+            f"Unsupported document type: {type(document)}. "
+            "Expected str, bytes, Path, or a binary file object"
+        )
+
+    def _parse_document(self, document: Union[etree._Element, str, bytes, Path]) -> etree._Element:
+        """
+        Parse document into an lxml Element, allowing huge trees if configured.
+
+        Args:
+            document: Document in various formats
+
+        Returns:
+            Parsed XML element
+
+        Raises:
+            FileNotFoundError: If file path doesn't exist
+            etree.XMLSyntaxError: If document is not well-formed XML
+        """
+        parser = etree.XMLParser(huge_tree=True) if self.huge_tree else None
+        return parse_document(document, parser)
+
+    def parse_validated(self, document: Union[str, bytes, Path, IO[bytes]]) -> etree._Element:
+        """
+        Parse a document, validating it against the schema in the same pass.
+
+        Use this instead of validate() when the tree is needed afterwards (for
+        example for Schematron or custom rules): valid documents are parsed
+        only once, and invalid ones are rejected as soon as the parser reaches
+        the first violation instead of after a full parse.
+
+        Args:
+            document: Unparsed document (XML string, file path, bytes, Path or
+                binary file object)
+
+        Returns:
+            Parsed, schema-valid document element
+
+        Raises:
+            FileNotFoundError: If file path doesn't exist
+            etree.XMLSyntaxError: If document is not well-formed XML or
+                violates the schema
+        """
+        parser = etree.XMLParser(schema=self.schema, huge_tree=self.huge_tree)
+        return etree.parse(self._stream_source(document), parser).getroot()
+
     def _parse_schema_error(self, error: etree._LogEntry) -> ValidationIssue:
         """
         Parse lxml schema error into ValidationIssue.
@@ -247,7 +404,8 @@ class XSDValidator(BaseValidator):
         """
         # Extract location information
         location = None
-        if error.line is not None:
+        # Errors raised while streaming carry no position (line 0)
+        if error.line:
             location = f"Line {error.line}"
             if error.column is not None:
                 location += f", Column {error.column}"
@@ -266,12 +424,16 @@ class XSDValidator(BaseValidator):
             code="XSD_VALIDATION_ERROR",
         )
 
-    def validate_file(self, file_path: Union[str, Path]) -> ValidationResult:
+    def validate_file(
+        self, file_path: Union[str, Path], streaming: Optional[bool] = None
+    ) -> ValidationResult:
         """
         Convenience method to validate a file.
 
         Args:
             file_path: Path to XML file
+            streaming: Validate while parsing without keeping the tree.
+                Default: the validator's streaming setting
 
         Returns:
             ValidationResult with errors from schema validation
@@ -279,7 +441,29 @@ class XSDValidator(BaseValidator):
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        return self.validate(Path(file_path))
+        return self._validate(Path(file_path), self.streaming if streaming is None else streaming)
+
+    def validate_files(
+        self, file_paths: Iterable[Union[str, Path]], streaming: Optional[bool] = None
+    ) -> Iterator[Tuple[Path, ValidationResult]]:
+        """
+        Validate many files, yielding each result as soon as it is ready.
+
+        Only one document is held in memory at a time, or none in streaming
+        mode.
+
+        Args:
+            file_paths: Paths to XML files
+            streaming: Validate while parsing without keeping the tree.
+                Default: the validator's streaming setting
+
+        Yields:
+            Tuples of (path, ValidationResult)
+        """
+        streaming = self.streaming if streaming is None else streaming
+        for file_path in file_paths:
+            path = Path(file_path)
+            yield path, self._validate(path, streaming)
 
     def validate_string(self, xml_string: str) -> ValidationResult:
         """
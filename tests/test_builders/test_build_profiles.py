@@ -0,0 +1,147 @@
+"""Tests for structured-only and narrative-only build profiles."""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+from lxml import etree
+
+from ccdakit.builders.narrative import NARRATIVE_STUB_TEXT
+from ccdakit.builders.sections.goals import GoalsSection
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.base import BuildProfile
+from ccdakit.core.config import CDAConfig, OrganizationInfo, configure
+
+
+NS = "urn:hl7-org:v3"
+
+
+@dataclass
+class MockProblem:
+    """Minimal ProblemProtocol implementation."""
+
+    name: str = "Hypertension"
+    code: str = "38341003"
+    code_system: str = "SNOMED"
+    onset_date: Optional[date] = date(2020, 1, 1)
+    resolved_date: Optional[date] = None
+    status: str = "active"
+    persistent_id: Optional[object] = None
+
+
+@dataclass
+class MockVitalSign:
+    """Minimal VitalSignProtocol implementation."""
+
+    type: str = "Heart Rate"
+    code: str = "8867-4"
+    value: str = "72"
+    unit: str = "/min"
+    date: datetime = datetime(2024, 1, 1, 9, 0)
+    interpretation: Optional[str] = None
+
+
+@dataclass
+class MockVitalSignsOrganizer:
+    """Minimal VitalSignsOrganizerProtocol implementation."""
+
+    date: datetime = datetime(2024, 1, 1, 9, 0)
+    vital_signs: List[MockVitalSign] = field(default_factory=lambda: [MockVitalSign()])
+
+
+@dataclass
+class MockGoal:
+    """Minimal GoalProtocol implementation."""
+
+    description: str = "Lower blood pressure"
+    code: Optional[str] = None
+    code_system: Optional[str] = None
+    display_name: Optional[str] = None
+    start_date: Optional[date] = date(2024, 1, 1)
+    target_date: Optional[date] = None
+    value: Optional[str] = None
+    value_unit: Optional[str] = None
+    status: str = "active"
+    author: Optional[str] = None
+    priority: Optional[str] = None
+
+
+def narrative_text(section):
+    """Return the joined text of a section's <text> element."""
+    return "".join(section.find(f"{{{NS}}}text").itertext())
+
+
+def entry_count(section):
+    """Count a section's entry elements."""
+    return len(section.findall(f"{{{NS}}}entry"))
+
+
+def template_roots(section):
+    """Get the templateId roots of a section."""
+    return [t.get("root") for t in section.findall(f"{{{NS}}}templateId")]
+
+
+class TestBuildProfile:
+    """Tests for BuildProfile flags and resolution."""
+
+    def test_flags(self):
+        """Test which parts each profile generates."""
+        assert BuildProfile.FULL.includes_narrative and BuildProfile.FULL.includes_entries
+        assert not BuildProfile.STRUCTURED_ONLY.includes_narrative
+        assert BuildProfile.STRUCTURED_ONLY.includes_entries
+        assert BuildProfile.NARRATIVE_ONLY.includes_narrative
+        assert not BuildProfile.NARRATIVE_ONLY.includes_entries
+
+    def test_default_is_full(self):
+        """Test builders default to the full profile."""
+        assert ProblemsSection([]).build_profile is BuildProfile.FULL
+
+    def test_include_narrative_config(self):
+        """Test CDAConfig.include_narrative=False selects structured-only."""
+        configure(CDAConfig(organization=OrganizationInfo(name="Test"), include_narrative=False))
+        assert ProblemsSection([]).build_profile is BuildProfile.STRUCTURED_ONLY
+        explicit = ProblemsSection([], profile=BuildProfile.FULL)
+        assert explicit.build_profile is BuildProfile.FULL
+
+
+class TestSectionProfiles:
+    """Tests for section builders under each profile."""
+
+    def test_structured_only(self):
+        """Test structured-only builds keep entries and stub the narrative."""
+        section = ProblemsSection(
+            [MockProblem()], profile=BuildProfile.STRUCTURED_ONLY
+        ).to_element()
+
+        assert narrative_text(section) == NARRATIVE_STUB_TEXT
+        assert section.find(f".//{{{NS}}}table") is None
+        assert entry_count(section) == 1
+        assert template_roots(section) == [
+            "2.16.840.1.113883.10.20.22.2.5.1",
+            "2.16.840.1.113883.10.20.22.2.5",
+        ]
+
+    def test_narrative_only(self):
+        """Test narrative-only builds drop entries and the entries-required template."""
+        section = VitalSignsSection(
+            [MockVitalSignsOrganizer()], profile=BuildProfile.NARRATIVE_ONLY
+        ).to_element()
+
+        assert section.find(f"{{{NS}}}text/{{{NS}}}table") is not None
+        assert entry_count(section) == 0
+        assert template_roots(section) == ["2.16.840.1.113883.10.20.22.2.4"]
+
+    def test_narrative_only_keeps_required_entries(self):
+        """Test sections that must contain entries keep them."""
+        section = GoalsSection([MockGoal()], profile=BuildProfile.NARRATIVE_ONLY).to_element()
+        assert entry_count(section) == 1
+
+    def test_full_output_unchanged(self):
+        """Test an explicit full profile matches the default build."""
+        default = ProblemsSection([MockProblem()]).to_element()
+        full = ProblemsSection([MockProblem()], profile=BuildProfile.FULL).to_element()
+        text = f"{{{NS}}}text"
+        assert etree.tostring(default.find(text)) == etree.tostring(full.find(text))
+        assert template_roots(default) == template_roots(full)
+        assert entry_count(default) == entry_count(full) == 1
@@ -0,0 +1,397 @@
+"""Tests for columnar results and vital signs input."""
+
+import itertools
+import uuid
+from datetime import date, datetime
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders import columnar
+from ccdakit.builders.columnar import (
+    ResultColumns,
+    VitalSignColumns,
+    derive_interpretations,
+    format_numbers,
+    format_timestamps,
+)
+from ccdakit.builders.common import EffectiveTime
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.builders.sections.vital_signs import VitalSignsSection
+from ccdakit.core.base import BuildProfile, CDAVersion
+
+
+NS = "urn:hl7-org:v3"
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run with NumPy and with the pure Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "np", None)
+    return request.param
+
+
+@pytest.fixture
+def sequential_ids(monkeypatch):
+    """Make generated entry ids repeatable."""
+
+    def install():
+        counter = itertools.count()
+        monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
+
+    return install
+
+
+def canonical(section, sequential_ids):
+    """Build a section with repeatable ids and serialize it."""
+    sequential_ids()
+    return etree.tostring(section.to_element())
+
+
+def result_columns(**overrides):
+    """Create two panels with five results of every value type."""
+    panels = {
+        "panel_name": ["Complete Blood Count", "Chemistry"],
+        "panel_code": ["58410-2", "24323-8"],
+        "status": ["final", "preliminary"],
+        "effective_time": [datetime(2024, 3, 1, 8, 30), date(2024, 3, 2)],
+    }
+    results = {
+        "panel": [0, 0, 1, 1, 1],
+        "test_name": ["WBC", "Hemoglobin", "Glucose", "Culture", "Comment"],
+        "test_code": ["6690-2", "718-7", "2345-7", "600-7", "8251-1"],
+        "value": [7.2, 12.1, 250, "409801009", "Hemolyzed"],
+        "unit": ["10*3/uL", "g/dL", "mg/dL", None, None],
+        "value_type": [None, None, None, "CD", None],
+        "interpretation": [None, None, "critically high", None, None],
+        "reference_range_low": [4.5, 13.5, "70", None, None],
+        "reference_range_high": [11.0, 17.5, 99.0, None, None],
+        "reference_range_unit": ["10*3/uL", "g/dL", None, None, None],
+    }
+    results.update(overrides)
+    return panels, results
+
+
+def vital_sign_columns():
+    """Create two organizers with three vital signs."""
+    organizers = {"date": [datetime(2024, 3, 1, 8, 30), datetime(2024, 3, 2, 9, 0)]}
+    vital_signs = {
+        "organizer": [0, 0, 1],
+        "type": ["Heart Rate", "Body Temperature", "Heart Rate"],
+        "code": ["8867-4", "8310-5", "8867-4"],
+        "value": [72, 39.2, 130],
+        "unit": ["/min", "Cel", "/min"],
+        "reference_range_low": [60, 36.1, 60],
+        "reference_range_high": [100, 37.2, 100],
+    }
+    return organizers, vital_signs
+
+
+class TestFormatting:
+    """Tests for the column formatting helpers."""
+
+    def test_format_numbers(self, backend):
+        """Test numbers use their shortest form and missing values become None."""
+        assert format_numbers([98.6, 120, "7.0", None, float("nan")]) == [
+            "98.6",
+            "120",
+            "7.0",
+            None,
+            None,
+        ]
+
+    def test_format_numbers_arrays(self):
+        """Test numeric arrays format like Python numbers."""
+        np = pytest.importorskip("numpy")
+        assert format_numbers(np.array([98.6, 0.1, 1e-05, np.nan])) == [
+            "98.6",
+            "0.1",
+            "1e-05",
+            None,
+        ]
+        assert format_numbers(np.array([120, 80])) == ["120", "80"]
+
+    def test_format_timestamps(self, backend):
+        """Test timestamps match EffectiveTime formatting."""
+        values = [datetime(2024, 3, 1, 8, 30), date(2024, 3, 2), None, datetime(2024, 3, 1, 8, 30)]
+        assert format_timestamps(values) == [
+            EffectiveTime._format_datetime(values[0]),
+            "20240302",
+            None,
+            EffectiveTime._format_datetime(values[0]),
+        ]
+
+    def test_format_datetime64(self):
+        """Test datetime64 arrays format like naive datetimes."""
+        np = pytest.importorskip("numpy")
+        times = np.array(["2024-03-01T08:30:15.5", "NaT"], dtype="datetime64[ns]")
+        days = np.array(["2024-03-02"], dtype="datetime64[D]")
+
+        assert format_timestamps(times) == [
+            EffectiveTime._format_datetime(datetime(2024, 3, 1, 8, 30, 15)),
+            None,
+        ]
+        assert format_timestamps(days) == ["20240302"]
+
+    def test_derive_interpretations(self, backend):
+        """Test values are classified against their reference range."""
+        derived = derive_interpretations(
+            [3.0, 5.0, 12.0, "n/a", 8.0, 1.0, 20.0],
+            low=[4.0, 4.0, 4.0, 4.0, None, 4.0, None],
+            high=[11.0, 11.0, 11.0, 11.0, None, None, "15"],
+        )
+        assert derived == ["L", "N", "H", None, None, "L", "H"]
+
+    def test_derive_interpretations_labels(self, backend):
+        """Test custom labels."""
+        derived = derive_interpretations([50, 70], [60, 60], [100, 100], ("Low", "Normal", "High"))
+        assert derived == ["Low", "Normal"]
+
+
+class TestResultColumns:
+    """Tests for ResultColumns."""
+
+    def test_matches_object_path(self, backend, sequential_ids):
+        """Test columnar entries match the builders fed the same rows."""
+        results = ResultColumns(*result_columns())
+
+        assert canonical(ResultsSection(results), sequential_ids) == canonical(
+            ResultsSection(list(results)), sequential_ids
+        )
+
+    def test_matches_object_path_r20(self, backend, sequential_ids):
+        """Test R2.0 templates are used."""
+        results = ResultColumns(*result_columns())
+        columnar_xml = canonical(ResultsSection(results, version=CDAVersion.R2_0), sequential_ids)
+        object_xml = canonical(
+            ResultsSection(list(results), version=CDAVersion.R2_0), sequential_ids
+        )
+        assert columnar_xml == object_xml
+
+    def test_repeated_shapes(self, backend, sequential_ids):
+        """Test observations copied from a shape's first observation get their own values."""
+        count = 40
+        results = ResultColumns(
+            {
+                "panel_name": ["A", "B"],
+                "panel_code": ["1-1", "2-2"],
+                "effective_time": [datetime(2024, 1, 1, 8), datetime(2024, 1, 2, 8)],
+            },
+            {
+                "panel": [i % 2 for i in range(count)],
+                "test_name": [f"Test {i}" for i in range(count)],
+                "test_code": [f"{i}-0" for i in range(count)],
+                "value": [50 + i * 3 for i in range(count)],
+                "unit": ["mg/dL" if i % 3 else None for i in range(count)],
+                "value_type": ["PQ" if i % 5 else None for i in range(count)],
+                "effective_time": [datetime(2024, 1, 1, i % 24) for i in range(count)],
+                "reference_range_low": [70 if i % 4 else None for i in range(count)],
+                "reference_range_high": [100] * count,
+                "reference_range_unit": ["mg/dL" if i % 2 else None for i in range(count)],
+            },
+        )
+
+        assert canonical(ResultsSection(results), sequential_ids) == canonical(
+            ResultsSection(list(results)), sequential_ids
+        )
+
+    def test_numpy_columns(self, sequential_ids):
+        """Test NumPy arrays give the same section as lists."""
+        np = pytest.importorskip("numpy")
+        panels, results = result_columns()
+        arrays = dict(
+            results,
+            panel=np.array(results["panel"]),
+            reference_range_high=np.array([11.0, 17.5, 99.0, np.nan, np.nan]),
+        )
+
+        assert canonical(ResultsSection.from_columns(panels, arrays), sequential_ids) == canonical(
+            ResultsSection.from_columns(panels, results), sequential_ids
+        )
+
+    def test_organizer_rows(self, backend):
+        """Test organizers and results read as protocol objects."""
+        results = ResultColumns(*result_columns())
+
+        assert len(results) == 2
+        assert results.size == 5
+        cbc, chemistry = results
+        assert cbc.panel_name == "Complete Blood Count"
+        assert cbc.status == "final"
+        assert [r.test_name for r in chemistry.results] == ["Glucose", "Culture", "Comment"]
+        assert cbc.results[0].value == "7.2"
+        assert cbc.results[0].effective_time == datetime(2024, 3, 1, 8, 30)
+        assert results[-1].panel_code == "24323-8"
+        with pytest.raises(IndexError):
+            results[2]
+        with pytest.raises(AttributeError):
+            cbc.missing
+
+    def test_interpretations(self, backend):
+        """Test derived interpretations never replace given ones."""
+        rows = [r for organizer in ResultColumns(*result_columns()) for r in organizer.results]
+        assert [r.interpretation for r in rows] == ["N", "L", "critically high", None, None]
+
+        rows = [
+            r
+            for organizer in ResultColumns(*result_columns(), interpret=False)
+            for r in organizer.results
+        ]
+        assert [r.interpretation for r in rows] == [None, None, "critically high", None, None]
+
+    def test_entries(self, backend):
+        """Test the entries written for a result."""
+        section = ResultsSection(ResultColumns(*result_columns())).to_element()
+        observations = section.findall(f".//{{{NS}}}observation")
+        hemoglobin = observations[1]
+
+        assert len(section.findall(f"{{{NS}}}entry")) == 2
+        assert len(observations) == 5
+        value = hemoglobin.find(f"{{{NS}}}value")
+        assert (value.get("value"), value.get("unit")) == ("12.1", "g/dL")
+        assert hemoglobin.find(f"{{{NS}}}interpretationCode").get("code") == "L"
+        low = hemoglobin.find(f".//{{{NS}}}low")
+        assert (low.get("value"), low.get("unit")) == ("13.5", "g/dL")
+        assert observations[2].find(f"{{{NS}}}interpretationCode").get("code") == "HH"
+
+    def test_results_default_to_panel_time(self, backend, sequential_ids):
+        """Test results without times use their panel's time."""
+        panels, results = result_columns()
+        results["effective_time"] = [panels["effective_time"][p] for p in results["panel"]]
+
+        assert canonical(ResultsSection.from_columns(*result_columns()), sequential_ids) == (
+            canonical(ResultsSection.from_columns(panels, results), sequential_ids)
+        )
+
+    def test_narrative(self, backend):
+        """Test the narrative is rendered from the columns."""
+        section = ResultsSection(ResultColumns(*result_columns())).to_element()
+        text = etree.tostring(section.find(f"{{{NS}}}text"), encoding="unicode")
+
+        assert "Complete Blood Count" in text
+        assert "Hemolyzed" in text
+        assert "13.5 - 17.5 g/dL" in text
+
+    def test_narrative_only(self, backend):
+        """Test entries are skipped when the profile omits them."""
+        section = ResultsSection(
+            ResultColumns(*result_columns()), profile=BuildProfile.NARRATIVE_ONLY
+        ).to_element()
+        assert section.find(f"{{{NS}}}entry") is None
+
+    def test_fingerprint(self, backend):
+        """Test fingerprints follow the column values."""
+        first = ResultsSection(ResultColumns(*result_columns())).fingerprint()
+        same = ResultsSection(ResultColumns(*result_columns())).fingerprint()
+        other = ResultsSection(ResultColumns(*result_columns(value=[7.3, 12.1, 250, "x", "y"])))
+
+        assert first == same
+        assert first != other.fingerprint()
+
+    def test_missing_column(self):
+        """Test required columns are checked."""
+        panels, results = result_columns()
+        del results["test_code"]
+        with pytest.raises(ValueError, match="Missing result columns: test_code"):
+            ResultColumns(panels, results)
+
+    def test_missing_value(self, backend):
+        """Test required values are checked."""
+        with pytest.raises(ValueError, match=r"Missing value in result rows \[1\]"):
+            ResultColumns(*result_columns(value=[7.2, None, 250, "x", "y"]))
+
+    def test_length_mismatch(self):
+        """Test columns must have one length."""
+        with pytest.raises(ValueError, match="Result columns have different lengths"):
+            ResultColumns(*result_columns(unit=["g/dL"]))
+
+    def test_unknown_panel(self):
+        """Test results must refer to an existing panel."""
+        with pytest.raises(ValueError, match="Result row 4 refers to 2, not one of 2 rows"):
+            ResultColumns(*result_columns(panel=[0, 0, 1, 1, 2]))
+
+
+class TestVitalSignColumns:
+    """Tests for VitalSignColumns."""
+
+    def test_matches_object_path(self, backend, sequential_ids):
+        """Test columnar entries match the builders fed the same rows."""
+        vital_signs = VitalSignColumns(*vital_sign_columns())
+
+        assert canonical(VitalSignsSection(vital_signs), sequential_ids) == canonical(
+            VitalSignsSection(list(vital_signs)), sequential_ids
+        )
+
+    def test_repeated_shapes(self, backend, sequential_ids):
+        """Test observations copied from a shape's first observation get their own values."""
+        count = 30
+        vital_signs = VitalSignColumns(
+            {"date": [datetime(2024, 1, day) for day in range(1, 11)]},
+            {
+                "organizer": [i // 3 for i in range(count)],
+                "type": [f"Sign {i % 3}" for i in range(count)],
+                "code": [f"{i % 3}-1" for i in range(count)],
+                "value": [55 + i * 2 for i in range(count)],
+                "unit": ["/min"] * count,
+                "date": [datetime(2024, 1, 1 + i // 3, i % 24) for i in range(count)],
+                "interpretation": ["Critical High" if i == 7 else None for i in range(count)],
+                "reference_range_low": [60 if i % 2 else None for i in range(count)],
+                "reference_range_high": [100 if i % 2 else None for i in range(count)],
+            },
+        )
+
+        assert canonical(VitalSignsSection(vital_signs), sequential_ids) == canonical(
+            VitalSignsSection(list(vital_signs)), sequential_ids
+        )
+
+    def test_numpy_columns(self, sequential_ids):
+        """Test datetime64 and numeric arrays give the same section as lists."""
+        np = pytest.importorskip("numpy")
+        organizers, vital_signs = vital_sign_columns()
+        arrays = dict(
+            vital_signs,
+            organizer=np.array(vital_signs["organizer"]),
+            value=np.array([72.0, 39.2, 130.0]),
+        )
+        dates = {"date": np.array(organizers["date"], dtype="datetime64[ns]")}
+
+        assert canonical(VitalSignsSection.from_columns(dates, arrays), sequential_ids) == (
+            canonical(
+                VitalSignsSection.from_columns(organizers, dict(arrays, value=[72.0, 39.2, 130.0])),
+                sequential_ids,
+            )
+        )
+
+    def test_interpretations(self, backend):
+        """Test interpretations are derived as display names."""
+        vital_signs = VitalSignColumns(*vital_sign_columns())
+        signs = [sign for organizer in vital_signs for sign in organizer.vital_signs]
+        assert [sign.interpretation for sign in signs] == ["Normal", "High", "High"]
+
+        section = VitalSignsSection(vital_signs).to_element()
+        codes = section.findall(f".//{{{NS}}}interpretationCode")
+        assert [(c.get("code"), c.get("displayName")) for c in codes] == [
+            ("N", "Normal"),
+            ("H", "High"),
+            ("H", "High"),
+        ]
+
+    def test_signs_default_to_organizer_date(self, backend):
+        """Test vital signs without dates use their organizer's date."""
+        organizers, vital_signs = vital_sign_columns()
+        section = VitalSignsSection.from_columns(organizers, vital_signs).to_element()
+        times = [
+            obs.find(f"{{{NS}}}effectiveTime").get("value")
+            for obs in section.findall(f".//{{{NS}}}observation")
+        ]
+        assert times == format_timestamps([organizers["date"][o] for o in (0, 0, 1)])
+
+    def test_missing_column(self):
+        """Test required columns are checked."""
+        organizers, vital_signs = vital_sign_columns()
+        del vital_signs["unit"]
+        with pytest.raises(ValueError, match="Missing vital sign columns: unit"):
+            VitalSignColumns(organizers, vital_signs)
@@ -5,7 +5,16 @@ from datetime import date, datetime
 import pytest
 from lxml import etree
 
-from ccdakit.builders.common import Code, EffectiveTime, Identifier, StatusCode
+from ccdakit.builders.common import (
+    Code,
+    EffectiveTime,
+    Identifier,
+    StatusCode,
+    append_code,
+    append_effective_time,
+    append_identifier,
+    append_status_code,
+)
 from ccdakit.core.base import CDAVersion
 
 
@@ -18,6 +27,11 @@ def local_name(elem):
     return etree.QName(elem).localname
 
 
+def canonical(elem):
+    """Serialize element in canonical form (namespace declarations normalized)."""
+    return etree.tostring(elem, method="c14n")
+
+
 class TestCode:
     """Tests for Code builder."""
 
@@ -297,3 +311,77 @@ class TestCommonBuildersIntegration:
         assert code.to_element().get("nullFlavor") == "UNK"
         assert etime.to_element().get("nullFlavor") == "UNK"
         assert ident.to_element().get("nullFlavor") == "UNK"
+
+
+class TestEmitters:
+    """Tests for the append_* emitters."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"code": "11450-4", "system": "LOINC", "display_name": "Problem List"},
+            {"code": "12345", "system": "2.16.840.1.113883.3.CUSTOM"},
+            {"null_flavor": "UNK"},
+        ],
+    )
+    def test_code_matches_builder(self, kwargs):
+        """Test append_code writes the same element as Code."""
+        parent = etree.Element(f"{{{NS}}}observation")
+        elem = append_code(parent, **kwargs)
+
+        assert elem.getparent() is parent
+        assert canonical(elem) == canonical(Code(**kwargs).to_element())
+
+    def test_code_pre_resolved_system(self):
+        """Test a resolved OID with system_name skips the name lookup."""
+        parent = etree.Element(f"{{{NS}}}observation")
+        elem = append_code(
+            parent, code="2345-7", system="2.16.840.1.113883.6.1", system_name="LOINC"
+        )
+        expected = Code(code="2345-7", system="LOINC").to_element()
+        assert canonical(elem) == canonical(expected)
+
+    def test_code_custom_tag(self):
+        """Test append_code can write value or translation elements."""
+        parent = etree.Element(f"{{{NS}}}observation")
+        elem = append_code(parent, code="C38288", system="NCI", tag=f"{{{NS}}}routeCode")
+        assert local_name(elem) == "routeCode"
+        assert elem.get("codeSystem") == "2.16.840.1.113883.3.26.1.1"
+
+    def test_code_missing_leaves_parent_untouched(self):
+        """Test a missing code raises before anything is appended."""
+        parent = etree.Element(f"{{{NS}}}observation")
+        with pytest.raises(ValueError, match="code and system required"):
+            append_code(parent, code="123")
+        assert len(parent) == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"value": date(2023, 10, 15)},
+            {"low": date(2020, 1, 1)},
+            {"low": date(2020, 1, 1), "high": date(2023, 1, 1)},
+            {"high": date(2023, 1, 1)},
+            {"value": date(2023, 10, 15), "include_both_value_and_low": True},
+            {"null_flavor": "UNK"},
+        ],
+    )
+    def test_effective_time_matches_builder(self, kwargs):
+        """Test append_effective_time writes the same element as EffectiveTime."""
+        parent = etree.Element(f"{{{NS}}}observation")
+        elem = append_effective_time(parent, **kwargs)
+        assert canonical(elem) == canonical(EffectiveTime(**kwargs).to_element())
+
+    def test_identifier_and_status_code(self):
+        """Test append_identifier and append_status_code match their builders."""
+        parent = etree.Element(f"{{{NS}}}observation")
+        ident = append_identifier(parent, root="2.16.840.1.113883.19", extension="OBS-1")
+        null_ident = append_identifier(parent, null_flavor="NI")
+        status = append_status_code(parent, "completed")
+
+        assert [local_name(child) for child in parent] == ["id", "id", "statusCode"]
+        assert canonical(ident) == canonical(
+            Identifier(root="2.16.840.1.113883.19", extension="OBS-1").to_element()
+        )
+        assert null_ident.attrib == {"nullFlavor": "NI"}
+        assert canonical(status) == canonical(StatusCode("completed").to_element())
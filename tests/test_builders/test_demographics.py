@@ -4,7 +4,7 @@ from typing import Optional, Sequence
 
 from lxml import etree
 
-from ccdakit.builders.demographics import Address, Telecom
+from ccdakit.builders.demographics import Address, Telecom, append_address, append_telecom
 
 
 # CDA namespace
@@ -353,3 +353,17 @@ class TestDemographicsIntegration:
         assert parent.find(f"{{{NS}}}addr") is not None
         telecoms = parent.findall(f"{{{NS}}}telecom")
         assert len(telecoms) == 2
+
+    def test_emitters_match_builders(self):
+        """Test append_address and append_telecom match Address and Telecom."""
+        parent = etree.Element(f"{{{NS}}}patientRole")
+        addr_data = MockAddress(street_lines=["123 Main St", "Apt 4"])
+        url_data = MockTelecom(type_="url", value="example.com", use="work")
+
+        addr = append_address(parent, addr_data, use="home")
+        telecom = append_telecom(parent, url_data)
+
+        assert list(parent) == [addr, telecom]
+        assert etree.tostring(addr) == etree.tostring(Address(addr_data, use="home").to_element())
+        assert etree.tostring(telecom) == etree.tostring(Telecom(url_data).to_element())
+        assert telecom.get("value") == "http://example.com"
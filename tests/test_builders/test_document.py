@@ -1,8 +1,11 @@
 """Tests for ClinicalDocument builder."""
 
+import itertools
+import uuid
 from datetime import date, datetime
 from typing import Optional, Sequence
 
+import pytest
 from lxml import etree
 
 from ccdakit.builders.document import ClinicalDocument
@@ -165,6 +168,19 @@ class MockAuthor:
         return MockOrganization()
 
 
+class MockProblem:
+    """Mock problem for testing."""
+
+    def __init__(self, name: str, code: str):
+        self.name = name
+        self.code = code
+        self.code_system = "SNOMED"
+        self.onset_date = date(2020, 1, 15)
+        self.resolved_date = None
+        self.status = "active"
+        self.persistent_id = None
+
+
 class TestClinicalDocument:
     """Tests for ClinicalDocument builder."""
 
@@ -494,3 +510,405 @@ class TestClinicalDocumentIntegration:
         ns = {"c": "urn:hl7-org:v3"}
         component = elem.find(".//c:component", ns)
         assert component is None
+
+
+class TestClinicalDocumentSectionCache:
+    """Tests for incremental rebuilds with a SectionCache."""
+
+    def _problem(self, name, code):
+        return MockProblem(name=name, code=code)
+
+    def test_only_changed_sections_rebuilt(self):
+        """Test unchanged sections reuse cached subtrees."""
+        from ccdakit.builders.sections.problems import ProblemsSection
+        from ccdakit.core.cache import SectionCache
+
+        cache = SectionCache()
+        doc = ClinicalDocument(
+            patient=MockPatient(),
+            author=MockAuthor(),
+            custodian=MockOrganization(),
+            sections=[
+                ProblemsSection([self._problem("Diabetes", "44054006")]),
+                ProblemsSection([self._problem("Asthma", "195967001")], title="Other"),
+            ],
+            section_cache=cache,
+        )
+        first = doc.to_element()
+        assert cache.stats()["misses"] == 2
+
+        doc.sections[1] = ProblemsSection([self._problem("COPD", "13645005")], title="Other")
+        second = doc.to_element()
+        assert cache.stats() == {"hits": 1, "misses": 3, "size": 3}
+
+        ns = {"c": "urn:hl7-org:v3"}
+        sections_first = first.findall(".//c:section", ns)
+        sections_second = second.findall(".//c:section", ns)
+        assert etree.tostring(sections_first[0]) == etree.tostring(sections_second[0])
+        assert b"COPD" in etree.tostring(sections_second[1])
+
+    def test_cache_not_part_of_fingerprint(self):
+        """Test attaching a cache does not change the document fingerprint."""
+        from ccdakit.core.cache import SectionCache
+
+        kwargs = {
+            "patient": MockPatient(),
+            "author": MockAuthor(),
+            "custodian": MockOrganization(),
+            "document_id": "DOC-1",
+            "effective_time": datetime(2023, 10, 17, 10, 0),
+        }
+        without = ClinicalDocument(**kwargs)
+        with_cache = ClinicalDocument(section_cache=SectionCache(), **kwargs)
+        assert without.fingerprint() == with_cache.fingerprint()
+
+
+class TestClinicalDocumentHeaderCache:
+    """Tests for batch generation with a shared HeaderCache."""
+
+    def _documents(self, document_class=ClinicalDocument, **kwargs):
+        from ccdakit.builders.sections.problems import ProblemsSection
+
+        author, custodian = MockAuthor(), MockOrganization()
+        return [
+            document_class(
+                patient=MockPatient(),
+                author=author,
+                custodian=custodian,
+                sections=[ProblemsSection([MockProblem(f"Problem {i}", "44054006")])],
+                document_id=f"DOC-{i}",
+                effective_time=datetime(2023, 10, 17, 10, i),
+                **kwargs,
+            )
+            for i in range(3)
+        ]
+
+    def _serialize(self, documents, monkeypatch):
+        """Serialize documents with repeatable entry ids."""
+        counter = itertools.count()
+        monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
+        return [doc.to_xml_string() for doc in documents]
+
+    @pytest.mark.parametrize("document_type", ["clinical", "ccd", "discharge"])
+    def test_output_identical(self, document_type, monkeypatch):
+        """Test documents built with a header cache match the per-document path."""
+        from ccdakit.builders.documents import ContinuityOfCareDocument, DischargeSummary
+        from ccdakit.core.cache import HeaderCache
+
+        document_class = {
+            "clinical": ClinicalDocument,
+            "ccd": ContinuityOfCareDocument,
+            "discharge": DischargeSummary,
+        }[document_type]
+        expected = self._serialize(self._documents(document_class), monkeypatch)
+        cache = HeaderCache()
+        actual = self._serialize(self._documents(document_class, header_cache=cache), monkeypatch)
+
+        assert actual == expected
+
+    def test_fragments_built_once(self):
+        """Test each shared header fragment is built for the first document only."""
+        from ccdakit.core.cache import HeaderCache
+
+        cache = HeaderCache()
+        for doc in self._documents(header_cache=cache):
+            doc.to_element()
+
+        # prefix, code, confidentiality, author, custodian, legalAuthenticator
+        assert cache.stats() == {"hits": 12, "misses": 6, "size": 6}
+
+    def test_legal_authenticator_time_per_document(self):
+        """Test the shared legalAuthenticator gets each document's time."""
+        from ccdakit.core.cache import HeaderCache
+
+        cache = HeaderCache()
+        ns = {"c": "urn:hl7-org:v3"}
+        times = [
+            doc.to_element().find("c:legalAuthenticator/c:time", ns).get("value")
+            for doc in self._documents(header_cache=cache)
+        ]
+        assert [t[:12] for t in times] == ["202310171000", "202310171001", "202310171002"]
+
+    def test_new_author_builds_new_fragments(self):
+        """Test documents for another author do not reuse its fragments."""
+        from ccdakit.core.cache import HeaderCache
+
+        class OtherAuthor(MockAuthor):
+            @property
+            def last_name(self) -> str:
+                return "Jones"
+
+        cache = HeaderCache()
+        self._documents(header_cache=cache)[0].to_element()
+        ClinicalDocument(
+            patient=MockPatient(),
+            author=OtherAuthor(),
+            custodian=MockOrganization(),
+            header_cache=cache,
+        ).to_element()
+
+        # author and legalAuthenticator are rebuilt; the equal custodian is reused
+        assert cache.stats()["misses"] == 8
+
+    def test_equal_author_objects_share_fragments(self):
+        """Test per-record copies of the same author and custodian hit the cache."""
+        from ccdakit.core.cache import HeaderCache
+
+        cache = HeaderCache()
+        for _ in range(3):
+            ClinicalDocument(
+                patient=MockPatient(),
+                author=MockAuthor(),
+                custodian=MockOrganization(),
+                header_cache=cache,
+            ).to_element()
+
+        assert cache.stats()["misses"] == 6
+        assert len(cache) == 6
+
+    def test_cache_not_part_of_fingerprint(self):
+        """Test attaching a header cache does not change the document fingerprint."""
+        from ccdakit.core.cache import HeaderCache
+
+        plain = self._documents()[0]
+        cached = self._documents(header_cache=HeaderCache())[0]
+        assert plain.fingerprint() == cached.fingerprint()
+
+
+class TestClinicalDocumentRelatedDocuments:
+    """Tests for relatedDocument references in the header."""
+
+    def _header(self, document_class=ClinicalDocument, **kwargs):
+        """Local names of the document's top-level elements."""
+        from ccdakit.builders.header.related_document import RelatedDocument
+        from ccdakit.builders.sections.problems import ProblemsSection
+
+        doc = document_class(
+            patient=MockPatient(),
+            author=MockAuthor(),
+            custodian=MockOrganization(),
+            sections=[ProblemsSection([MockProblem("Asthma", "195967001")])],
+            related_documents=[RelatedDocument("DOC-1", root="1.2.3")],
+            **kwargs,
+        ).to_element()
+        return [etree.QName(child).localname for child in doc]
+
+    def test_related_document_before_body(self):
+        """Test relatedDocument follows legalAuthenticator and precedes the body."""
+        names = self._header()
+
+        assert names[-3:] == ["legalAuthenticator", "relatedDocument", "component"]
+
+    def test_discharge_summary_order(self):
+        """Test documentationOf precedes and componentOf follows relatedDocument."""
+        from ccdakit.builders.documents import DischargeSummary
+
+        names = self._header(
+            DischargeSummary,
+            admission_date=datetime(2024, 1, 15),
+            discharge_date=datetime(2024, 1, 20),
+        )
+
+        assert names[-5:] == [
+            "legalAuthenticator",
+            "documentationOf",
+            "relatedDocument",
+            "componentOf",
+            "component",
+        ]
+
+
+class TestClinicalDocumentBuildProfile:
+    """Tests for build profiles set on ClinicalDocument."""
+
+    def test_profile_applies_to_sections(self):
+        """Test sections without their own profile inherit the document's."""
+        from ccdakit.builders.narrative import NARRATIVE_STUB_TEXT
+        from ccdakit.builders.sections.problems import ProblemsSection
+        from ccdakit.core.base import BuildProfile
+
+        inherited = ProblemsSection([MockProblem("Diabetes", "44054006")])
+        explicit = ProblemsSection([MockProblem("Asthma", "195967001")], profile=BuildProfile.FULL)
+        doc = ClinicalDocument(
+            patient=MockPatient(),
+            author=MockAuthor(),
+            custodian=MockOrganization(),
+            sections=[inherited, explicit],
+            profile=BuildProfile.STRUCTURED_ONLY,
+        )
+
+        ns = {"c": "urn:hl7-org:v3"}
+        sections = doc.to_element().findall(".//c:section", ns)
+        assert "".join(sections[0].find("c:text", ns).itertext()) == NARRATIVE_STUB_TEXT
+        assert sections[1].find("c:text/c:table", ns) is not None
+        # The caller's builder is not modified
+        assert inherited.profile is None
+
+
+class CountingValidator:
+    """Validator that records how many sections each document contained."""
+
+    def __init__(self, valid=True):
+        self.valid = valid
+        self.section_counts = []
+
+    def validate(self, element):
+        from ccdakit.core.validation import ValidationIssue, ValidationLevel, ValidationResult
+
+        ns = {"c": "urn:hl7-org:v3"}
+        self.section_counts.append(len(element.findall(".//c:structuredBody/c:component", ns)))
+        result = ValidationResult()
+        if not self.valid:
+            result.errors.append(
+                ValidationIssue(level=ValidationLevel.ERROR, message="Invalid", code="TEST")
+            )
+        return result
+
+
+class TestClinicalDocumentBuildValidation:
+    """Tests for validating finished documents with BuildValidation."""
+
+    def _document(self, validation, problems=("Diabetes", "Asthma")):
+        from ccdakit.builders.sections.problems import ProblemsSection
+
+        return ClinicalDocument(
+            patient=MockPatient(),
+            author=MockAuthor(),
+            custodian=MockOrganization(),
+            sections=[
+                ProblemsSection([MockProblem(name, "44054006")], title=name) for name in problems
+            ],
+            build_validation=validation,
+        )
+
+    def test_validates_once_per_build(self):
+        """Test the finished document is validated once with every section."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        validator = CountingValidator()
+        validation = BuildValidation(validator)
+        self._document(validation).to_element()
+
+        assert validator.section_counts == [2]
+        assert validation.stats()["documents_validated"] == 1
+
+    def test_sampling(self):
+        """Test only one document in every N is validated."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        validator = CountingValidator()
+        validation = BuildValidation(validator, sample_every=3)
+        for _ in range(7):
+            self._document(validation).to_element()
+
+        assert len(validator.section_counts) == 3
+        stats = validation.stats()
+        assert stats["documents_validated"] == 3
+        assert stats["documents_skipped"] == 4
+
+    def test_changed_sections_only(self):
+        """Test sections that already passed are left out of later validations."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        validator = CountingValidator()
+        validation = BuildValidation(validator, changed_sections_only=True)
+        self._document(validation).to_element()
+        element = self._document(validation, problems=("Diabetes", "COPD")).to_element()
+        self._document(validation).to_element()
+
+        # All new, then only COPD, then nothing new (first section kept)
+        assert validator.section_counts == [2, 1, 1]
+        assert validation.stats()["sections_skipped"] == 2
+        # Sections removed for validation are restored in order
+        ns = {"c": "urn:hl7-org:v3"}
+        titles = [t.text for t in element.findall(".//c:section/c:title", ns)]
+        assert titles == ["Diabetes", "COPD"]
+
+    def test_invalid_document_raises(self):
+        """Test an invalid document raises ValidationError."""
+        from ccdakit.core.build_validation import BuildValidation
+        from ccdakit.core.validation import ValidationError
+
+        validation = BuildValidation(CountingValidator(valid=False))
+        with pytest.raises(ValidationError):
+            self._document(validation).to_element()
+        assert validation.stats()["documents_failed"] == 1
+
+    def test_invalid_document_without_raise(self):
+        """Test raise_on_error=False only counts failures."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        validation = BuildValidation(
+            CountingValidator(valid=False), changed_sections_only=True, raise_on_error=False
+        )
+        self._document(validation).to_element()
+        self._document(validation).to_element()
+
+        # Failed sections are not remembered as passed
+        assert validation.stats()["sections_validated"] == 4
+        assert validation.stats()["documents_failed"] == 2
+
+    def test_section_schemas_suppressed(self):
+        """Test per-section schemas are not applied when validating the document."""
+        from ccdakit.builders.sections.problems import ProblemsSection
+        from ccdakit.core.build_validation import BuildValidation
+
+        # A schema no section could pass
+        schema = etree.XMLSchema(
+            etree.fromstring(
+                b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                b'<xs:element name="nothing"/></xs:schema>'
+            )
+        )
+        section = ProblemsSection([MockProblem("Diabetes", "44054006")], schema=schema)
+        doc = ClinicalDocument(
+            patient=MockPatient(),
+            author=MockAuthor(),
+            custodian=MockOrganization(),
+            sections=[section],
+            build_validation=BuildValidation(CountingValidator()),
+        )
+        doc.to_element()
+        assert section.schema is schema
+
+    def test_validation_not_part_of_fingerprint(self):
+        """Test attaching build validation does not change the fingerprint."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        kwargs = {
+            "patient": MockPatient(),
+            "author": MockAuthor(),
+            "custodian": MockOrganization(),
+            "document_id": "DOC-1",
+            "effective_time": datetime(2023, 10, 17, 10, 0),
+        }
+        without = ClinicalDocument(**kwargs)
+        with_validation = ClinicalDocument(
+            build_validation=BuildValidation(CountingValidator()), **kwargs
+        )
+        assert without.fingerprint() == with_validation.fingerprint()
+
+    def test_invalid_arguments(self):
+        """Test sample_every and key counts are checked."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        with pytest.raises(ValueError):
+            BuildValidation(CountingValidator(), sample_every=0)
+
+        validation = BuildValidation(CountingValidator(), changed_sections_only=True)
+        element = self._document(None).to_element()
+        with pytest.raises(ValueError, match="section keys"):
+            validation.check(element, ["only-one"])
+
+    def test_reset(self):
+        """Test reset clears counters and remembered sections."""
+        from ccdakit.core.build_validation import BuildValidation
+
+        validator = CountingValidator()
+        validation = BuildValidation(validator, changed_sections_only=True)
+        self._document(validation).to_element()
+        validation.reset()
+        self._document(validation).to_element()
+
+        assert validator.section_counts == [2, 2]
+        assert validation.stats()["documents_validated"] == 1
@@ -3,10 +3,13 @@
 from datetime import date, datetime
 from typing import Optional, Sequence
 
+import pytest
 from lxml import etree
 
 from ccdakit.builders.header.author import Author, Custodian
 from ccdakit.builders.header.record_target import RecordTarget
+from ccdakit.builders.header.related_document import RelatedDocument
+from ccdakit.core.config import CDAConfig, configure
 
 
 # CDA namespace
@@ -474,6 +477,34 @@ class TestCustodian:
         assert telecom is not None
 
 
+class TestRelatedDocument:
+    """Tests for RelatedDocument builder."""
+
+    def test_related_document_basic(self):
+        """Test relatedDocument references the parent document id."""
+        elem = RelatedDocument("DOC-1", root="2.16.840.1.113883.3.TEST").to_element()
+
+        assert local_name(elem) == "relatedDocument"
+        assert elem.get("typeCode") == "APND"
+        parent_id = elem.find(f"{{{NS}}}parentDocument/{{{NS}}}id")
+        assert parent_id.get("root") == "2.16.840.1.113883.3.TEST"
+        assert parent_id.get("extension") == "DOC-1"
+
+    def test_related_document_default_root(self, sample_organization):
+        """Test the parent id root defaults to the configured document id root."""
+        configure(CDAConfig(organization=sample_organization, document_id_root="1.2.3.4"))
+
+        elem = RelatedDocument("DOC-1", type_code="RPLC").to_element()
+
+        assert elem.get("typeCode") == "RPLC"
+        assert elem.find(f"{{{NS}}}parentDocument/{{{NS}}}id").get("root") == "1.2.3.4"
+
+    def test_related_document_invalid_type_code(self):
+        """Test unknown relationship codes are rejected."""
+        with pytest.raises(ValueError, match="Invalid relatedDocument typeCode 'SPLIT'"):
+            RelatedDocument("DOC-1", type_code="SPLIT")
+
+
 class TestHeaderIntegration:
     """Integration tests for header components."""
 
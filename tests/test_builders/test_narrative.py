@@ -0,0 +1,219 @@
+"""Tests for the shared narrative engine."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders.narrative import (
+    NarrativeColumn,
+    NarrativeTable,
+    format_date,
+    format_date_or_datetime,
+    format_datetime,
+    resolve_narrative_style,
+)
+from ccdakit.builders.sections.medications import MedicationsSection
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.core.cache import compute_fingerprint
+from ccdakit.core.config import CDAConfig, OrganizationInfo, configure
+
+from .test_document_types import MockMedication
+
+
+NS = "urn:hl7-org:v3"
+
+
+@dataclass
+class MockProblem:
+    """Minimal ProblemProtocol implementation."""
+
+    name: str = "Hypertension"
+    code: str = "38341003"
+    code_system: str = "SNOMED"
+    onset_date: Optional[date] = date(2020, 1, 1)
+    resolved_date: Optional[date] = None
+    status: str = "active"
+    persistent_id: Optional[object] = None
+
+
+LAYOUT = NarrativeTable(
+    columns=[
+        NarrativeColumn("Name", lambda row: row[1], content_id=lambda row: f"item-{row[0]}"),
+        NarrativeColumn("Note", lambda row: row[2]),
+    ],
+    empty_text="Nothing here",
+)
+
+
+def render(rows, style):
+    """Render LAYOUT into a fresh section and return the <text> element."""
+    section = etree.Element(f"{{{NS}}}section")
+    return LAYOUT.render(section, rows, style=style)
+
+
+def configure_style(style):
+    """Configure ccdakit with a narrative style."""
+    configure(CDAConfig(organization=OrganizationInfo(name="Test"), narrative_style=style))
+
+
+class TestFormatting:
+    """Tests for date formatting helpers."""
+
+    def test_format_date_matches_strftime(self):
+        """Test format_date equals strftime output."""
+        value = date(2023, 4, 5)
+        assert format_date(value) == value.strftime("%Y-%m-%d")
+        assert format_date(datetime(2023, 4, 5, 6, 7)) == "2023-04-05"
+        assert format_date(None, "Unknown") == "Unknown"
+
+    def test_format_datetime_matches_strftime(self):
+        """Test format_datetime equals strftime output."""
+        value = datetime(2023, 4, 5, 6, 7, 8, 9)
+        assert format_datetime(value) == value.strftime("%Y-%m-%d %H:%M")
+        assert format_datetime(date(2023, 4, 5)) == "2023-04-05 00:00"
+        assert format_datetime(None) == "-"
+
+    def test_format_date_or_datetime(self):
+        """Test datetimes keep their time and plain dates do not."""
+        assert format_date_or_datetime(datetime(2023, 4, 5, 6, 7)) == "2023-04-05 06:07"
+        assert format_date_or_datetime(date(2023, 4, 5)) == "2023-04-05"
+        assert format_date_or_datetime("April 2023") == "April 2023"
+        assert format_date_or_datetime(None, "Unknown") == "Unknown"
+
+
+class TestNarrativeTable:
+    """Tests for NarrativeTable rendering."""
+
+    def test_empty_rows(self):
+        """Test empty input renders the empty paragraph in every style."""
+        for style in ("table", "list", "paragraph"):
+            text = render([], style)
+            assert [etree.QName(child).localname for child in text] == ["paragraph"]
+            assert text[0].text == "Nothing here"
+
+    def test_table(self):
+        """Test table rendering with header and content IDs."""
+        text = render([(1, "A", "first"), (2, "B", "")], "table")
+        table = text.find(f"{{{NS}}}table")
+
+        assert table.get("border") == "1"
+        assert [th.text for th in table.iter(f"{{{NS}}}th")] == ["Name", "Note"]
+        rows = table.findall(f"{{{NS}}}tbody/{{{NS}}}tr")
+        assert len(rows) == 2
+        content = rows[0].find(f"{{{NS}}}td/{{{NS}}}content")
+        assert content.get("ID") == "item-1"
+        assert content.text == "A"
+        assert rows[0][1].text == "first"
+
+    def test_header_is_cloned(self):
+        """Test each table gets its own copy of the compiled header."""
+        first = render([(1, "A", "x")], "table").find(f".//{{{NS}}}thead")
+        second = render([(1, "A", "x")], "table").find(f".//{{{NS}}}thead")
+        assert first is not second
+        assert etree.tostring(first) == etree.tostring(second)
+
+    def test_list(self):
+        """Test list rendering keeps content IDs and skips empty cells."""
+        text = render([(1, "A", "first"), (2, "B", "")], "list")
+        items = text.findall(f"{{{NS}}}list/{{{NS}}}item")
+
+        assert len(items) == 2
+        assert "".join(items[0].itertext()) == "Name: A; Note: first"
+        assert "".join(items[1].itertext()) == "Name: B"
+        assert items[0].find(f"{{{NS}}}content").get("ID") == "item-1"
+
+    def test_paragraph(self):
+        """Test paragraph rendering emits one paragraph per row."""
+        text = render(iter([(1, "A", "first"), (2, "B", "second")]), "paragraph")
+        paragraphs = text.findall(f"{{{NS}}}paragraph")
+
+        assert len(paragraphs) == 2
+        assert "".join(paragraphs[1].itertext()) == "Name: B; Note: second"
+
+    def test_empty_text_override(self):
+        """Test callers can replace the empty paragraph text per render."""
+        section = etree.Element(f"{{{NS}}}section")
+        text = LAYOUT.render(section, [], style="list", empty_text="Not asked")
+        assert text[0].text == "Not asked"
+
+    def test_cell_markup(self):
+        """Test links, nested lists and row spans in table cells."""
+        layout = NarrativeTable(
+            columns=[
+                NarrativeColumn(
+                    "Group",
+                    lambda row: row[0] if row[1] == 1 else "",
+                    rowspan=lambda row: 2 if row[1] == 1 else 0,
+                ),
+                NarrativeColumn("Link", lambda row: "doc", href=lambda row: row[2]),
+                NarrativeColumn("Items", lambda row: ["x", "y"]),
+            ],
+            empty_text="Nothing here",
+        )
+        rows = [("G", 1, "http://example.com/doc"), ("G", 2, None)]
+        table = layout.render(etree.Element(f"{{{NS}}}section"), rows, style="table")
+        first, second = table.findall(f".//{{{NS}}}tbody/{{{NS}}}tr")
+
+        assert first[0].get("rowspan") == "2"
+        assert len(second) == 2
+        link = first[1].find(f"{{{NS}}}linkHtml")
+        assert link.get("href") == "http://example.com/doc"
+        assert link.text == "doc"
+        assert second[0].text == "doc"
+        assert [item.text for item in first[2].iter(f"{{{NS}}}item")] == ["x", "y"]
+
+        text = layout.render(etree.Element(f"{{{NS}}}section"), rows, style="paragraph")
+        paragraphs = text.findall(f"{{{NS}}}paragraph")
+        assert "".join(paragraphs[0].itertext()) == "Group: G; Link: doc; Items: x, y"
+        assert paragraphs[0].find(f"{{{NS}}}linkHtml") is not None
+        assert "".join(paragraphs[1].itertext()) == "Link: doc; Items: x, y"
+
+    def test_invalid_style(self):
+        """Test unknown styles are rejected."""
+        with pytest.raises(ValueError, match="Unsupported narrative style"):
+            render([], "html")
+
+
+class TestNarrativeStyleConfig:
+    """Tests for CDAConfig.narrative_style handling."""
+
+    def test_default_without_config(self):
+        """Test table style is used when ccdakit is not configured."""
+        assert resolve_narrative_style() == "table"
+
+    def test_config_style(self):
+        """Test configured style is used by default."""
+        configure_style("list")
+        assert resolve_narrative_style() == "list"
+        assert resolve_narrative_style("paragraph") == "paragraph"
+
+    def test_section_honors_config(self):
+        """Test section builders render the configured style."""
+        configure_style("list")
+        section = ProblemsSection([MockProblem()]).build()
+        text = section.find(f"{{{NS}}}text")
+
+        assert text.find(f"{{{NS}}}table") is None
+        item = text.find(f"{{{NS}}}list/{{{NS}}}item")
+        assert item.find(f"{{{NS}}}content").get("ID") == "problem-1"
+        assert "Status: Active" in "".join(item.itertext())
+
+    def test_style_changes_fingerprint(self):
+        """Test cached sections are not reused across narrative styles."""
+        builder = ProblemsSection([MockProblem()])
+        table_fingerprint = compute_fingerprint(builder)
+        configure_style("paragraph")
+        assert compute_fingerprint(builder) != table_fingerprint
+
+    def test_tabular_sections_honor_config(self):
+        """Test sections other than Problems render the configured style too."""
+        configure_style("paragraph")
+        text = MedicationsSection([MockMedication()]).to_element().find(f"{{{NS}}}text")
+
+        assert text.find(f"{{{NS}}}table") is None
+        paragraph = text.find(f"{{{NS}}}paragraph")
+        assert paragraph.find(f"{{{NS}}}content").get("ID") == "medication-1"
+        assert "Status: Active" in "".join(paragraph.itertext())
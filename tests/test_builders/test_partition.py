@@ -0,0 +1,265 @@
+"""Tests for DocumentPartitioner."""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders.documents import ContinuityOfCareDocument
+from ccdakit.builders.partition import DocumentPartitioner, item_date
+from ccdakit.builders.plan import SectionPlan
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.builders.sections.results import ResultsSection
+from ccdakit.core.cache import HeaderCache
+
+from .test_document_types import MockAuthor, MockOrganization, MockPatient, MockProblem
+
+
+NS = "urn:hl7-org:v3"
+EFFECTIVE_TIME = datetime(2024, 1, 15, 9, 0)
+
+
+@dataclass
+class Result:
+    """ResultObservationProtocol implementation."""
+
+    test_name: str
+    effective_time: datetime
+    test_code: str = "2345-7"
+    value: str = "95"
+    unit: Optional[str] = "mg/dL"
+    status: str = "final"
+    value_type: Optional[str] = "PQ"
+    interpretation: Optional[str] = None
+    reference_range_low: Optional[str] = None
+    reference_range_high: Optional[str] = None
+    reference_range_unit: Optional[str] = None
+
+
+@dataclass
+class Panel:
+    """ResultOrganizerProtocol implementation."""
+
+    panel_name: str
+    effective_time: Optional[datetime]
+    results: List[Result] = field(default_factory=list)
+    panel_code: str = "24323-8"
+    status: str = "completed"
+
+
+def panels(days, per_day=1, start=datetime(2000, 1, 1, 8, 0)):
+    """Create per_day single-result panels on each of days consecutive days."""
+    made = []
+    for day in range(days):
+        when = start + timedelta(days=day)
+        for i in range(per_day):
+            name = f"Panel {day}-{i}"
+            made.append(Panel(name, when, [Result(f"Glucose {day}-{i}", when)]))
+    return made
+
+
+@pytest.fixture
+def plan():
+    """CCD plan with a repeated Problems section and windowed Results."""
+    return SectionPlan(
+        ContinuityOfCareDocument,
+        {"problems": ProblemsSection(problems=[]), "results": ResultsSection(result_organizers=[])},
+    )
+
+
+def split(partitioner, data, **kwargs):
+    """Split a record with a fixed header."""
+    return partitioner.split(
+        MockPatient(),
+        MockAuthor(),
+        MockOrganization(),
+        data,
+        effective_time=EFFECTIVE_TIME,
+        **kwargs,
+    )
+
+
+def panel_names(part):
+    """Names of the result panels in a part, in document order."""
+    section = part.document.sections[-1]
+    return [panel.panel_name for panel in section.result_organizers]
+
+
+class TestEntryLimit:
+    """Tests for splitting by entry count."""
+
+    def test_windows_by_date(self, plan):
+        """Test consecutive days are packed up to the entry limit."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=5)
+        data = {"problems": [MockProblem()], "results": panels(10)}
+
+        parts = split(partitioner, data)
+
+        # One problem is repeated in every part, leaving 4 results each
+        assert [part.entries for part in parts] == [5, 5, 3]
+        assert [(part.start, part.end) for part in parts] == [
+            (date(2000, 1, 1), date(2000, 1, 4)),
+            (date(2000, 1, 5), date(2000, 1, 8)),
+            (date(2000, 1, 9), date(2000, 1, 10)),
+        ]
+        for part in parts:
+            assert len(part.document.sections[0].problems) == 1
+
+    def test_day_kept_together(self, plan):
+        """Test entries of one day are never split across parts."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=3)
+
+        parts = split(partitioner, {"results": panels(3, per_day=2)})
+
+        assert [len(panel_names(part)) for part in parts] == [2, 2, 2]
+
+    def test_oversized_day_is_own_part(self, plan):
+        """Test a day over the limit becomes a part of its own."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=2)
+        data = {"results": panels(1) + panels(1, per_day=3, start=datetime(2001, 1, 1))}
+
+        parts = split(partitioner, data)
+
+        assert [part.entries for part in parts] == [1, 3]
+
+    def test_original_order_kept(self, plan):
+        """Test entries keep their order in the input within a part."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=10)
+        newest_first = list(reversed(panels(3)))
+
+        (part,) = split(partitioner, {"results": newest_first})
+
+        assert panel_names(part) == ["Panel 2-0", "Panel 1-0", "Panel 0-0"]
+
+    def test_undated_entries_in_last_part(self, plan):
+        """Test entries without a date go to the last part."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=3)
+        undated = Panel("Undated", None)
+
+        parts = split(partitioner, {"results": [undated] + panels(4)})
+
+        assert panel_names(parts[-1]) == ["Undated", "Panel 3-0"]
+        assert (parts[-1].start, parts[-1].end) == (date(2000, 1, 4), date(2000, 1, 4))
+
+    def test_single_part_when_under_limit(self, plan):
+        """Test small records are not split."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=100)
+
+        parts = split(partitioner, {"results": panels(3)}, document_id="DOC")
+
+        assert len(parts) == 1
+        assert parts[0].document.document_id == "DOC"
+        assert parts[0].document.related_documents == []
+
+    def test_shared_sections_over_limit(self, plan):
+        """Test repeated sections alone may not exceed the limit."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=2)
+
+        with pytest.raises(ValueError, match="hold 2 entries"):
+            split(partitioner, {"problems": [MockProblem(), MockProblem()], "results": []})
+
+
+class TestByteLimit:
+    """Tests for splitting by serialized size."""
+
+    def test_parts_under_max_bytes(self, plan):
+        """Test every part's serialized size stays under the limit."""
+        data = {"results": panels(40)}
+        whole = split(DocumentPartitioner(plan, ["results"], max_entries=1000), data)[0]
+        whole_size = len(etree.tostring(whole.document.to_element()))
+        limit = whole_size // 3
+
+        parts = split(DocumentPartitioner(plan, ["results"], max_bytes=limit), data)
+
+        assert len(parts) > 3
+        for part in parts:
+            assert len(etree.tostring(part.document.to_element())) <= limit
+        assert sum(len(panel_names(part)) for part in parts) == 40
+
+    def test_header_over_max_bytes(self, plan):
+        """Test a limit below the header size is rejected."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_bytes=100)
+
+        with pytest.raises(ValueError, match="exceed max_bytes=100"):
+            split(partitioner, {"results": panels(2)})
+
+
+class TestLinking:
+    """Tests for the header shared by the parts."""
+
+    def test_parts_reference_first(self, plan):
+        """Test later parts carry relatedDocument references to the first part."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=2)
+
+        parts = split(partitioner, {"results": panels(6)}, document_id="DOC")
+
+        assert [part.document.document_id for part in parts] == ["DOC", "DOC-2", "DOC-3"]
+        for part in parts[1:]:
+            related = part.document.to_element().find(f"{{{NS}}}relatedDocument")
+            assert related.get("typeCode") == "APND"
+            assert related.find(f"{{{NS}}}parentDocument/{{{NS}}}id").get("extension") == "DOC"
+
+    def test_header_shared(self, plan):
+        """Test parts share the effective time and one header cache."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=2)
+
+        parts = split(partitioner, {"results": panels(4)})
+
+        cache = parts[0].document.header_cache
+        assert isinstance(cache, HeaderCache)
+        assert all(part.document.header_cache is cache for part in parts)
+        assert {part.document.effective_time for part in parts} == {EFFECTIVE_TIME}
+
+    def test_parts_independent(self, plan):
+        """Test parts do not share section builders."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=2)
+
+        first, second = split(partitioner, {"results": panels(4)})
+
+        assert first.document.sections[0] is not second.document.sections[0]
+        assert panel_names(first) == ["Panel 0-0", "Panel 1-0"]
+
+
+class TestConfiguration:
+    """Tests for partitioner configuration."""
+
+    def test_limit_required(self, plan):
+        """Test at least one limit must be given."""
+        with pytest.raises(ValueError, match="max_entries, max_bytes or both"):
+            DocumentPartitioner(plan, windowed=["results"])
+
+    def test_windowed_section_in_plan(self, plan):
+        """Test windowed sections must be plan sections."""
+        with pytest.raises(ValueError, match="Sections not in plan: encounters"):
+            DocumentPartitioner(plan, windowed=["encounters"], max_entries=10)
+
+    def test_windowed_data_must_be_list(self, plan):
+        """Test windowed sections take a list of entries."""
+        partitioner = DocumentPartitioner(plan, windowed=["results"], max_entries=10)
+
+        with pytest.raises(ValueError, match="needs a list of entries"):
+            split(partitioner, {"results": {"result_organizers": []}})
+
+    def test_custom_date_of(self, plan):
+        """Test a custom date function decides the windows."""
+        partitioner = DocumentPartitioner(
+            plan,
+            windowed=["results"],
+            max_entries=1,
+            date_of=lambda panel: date(int(panel.panel_name), 1, 1),
+        )
+        data = {"results": [Panel("2020", None), Panel("2010", None)]}
+
+        parts = split(partitioner, data)
+
+        assert [part.start.year for part in parts] == [2010, 2020]
+
+    def test_item_date(self):
+        """Test the default date lookup tries the protocol date attributes."""
+        when = datetime(2020, 5, 1)
+
+        assert item_date(Panel("A", when)) == when
+        assert item_date(MockProblem()) == datetime(2020, 1, 1)
+        assert item_date(object()) is None
@@ -0,0 +1,267 @@
+"""Tests for SectionPlan and builder rebinding."""
+
+import itertools
+import uuid
+from datetime import datetime
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders.documents import ContinuityOfCareDocument, DischargeSummary
+from ccdakit.builders.plan import SectionPlan
+from ccdakit.builders.sections.admission_medications import AdmissionMedicationsSection
+from ccdakit.builders.sections.discharge_medications import DischargeMedicationsSection
+from ccdakit.builders.sections.hospital_course import HospitalCourseSection
+from ccdakit.builders.sections.hospital_discharge_instructions import (
+    HospitalDischargeInstructionsSection,
+)
+from ccdakit.builders.sections.medications import MedicationsSection
+from ccdakit.builders.sections.plan_of_treatment import PlanOfTreatmentSection
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.core.base import CDAVersion
+
+from .test_document_types import (
+    MockAuthor,
+    MockDischargeInstruction,
+    MockMedication,
+    MockOrganization,
+    MockPatient,
+    MockProblem,
+)
+
+
+NS = "urn:hl7-org:v3"
+EFFECTIVE_TIME = datetime(2024, 1, 15, 9, 0)
+
+
+def problem(name):
+    """Create a problem with the given name."""
+    item = MockProblem()
+    item.name = name
+    return item
+
+
+def serialize(monkeypatch, build):
+    """Serialize a document with generated ids made repeatable."""
+    counter = itertools.count()
+    monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
+    return etree.tostring(build().to_element())
+
+
+class MockHospitalCourse:
+    """Mock hospital course data model."""
+
+    def __init__(self, course_text):
+        self.course_text = course_text
+
+
+class TestBind:
+    """Tests for CDAElement.bind()."""
+
+    def test_bind_replaces_input_and_keeps_options(self):
+        """Test bind swaps data and keeps title and version."""
+        section = ProblemsSection(problems=[problem("Asthma")], title="Active Problems")
+
+        assert section.bind(problems=[problem("Diabetes")]) is section
+        elem = section.to_element()
+
+        assert elem.find(f"{{{NS}}}title").text == "Active Problems"
+        assert b"Diabetes" in etree.tostring(elem)
+        assert b"Asthma" not in etree.tostring(elem)
+
+    def test_bind_matches_new_builder(self, monkeypatch):
+        """Test a rebound builder emits what a new builder would."""
+        section = ProblemsSection(problems=[problem("Asthma")])
+        section.to_element()
+
+        rebound = serialize(monkeypatch, lambda: section.bind(problems=[problem("Gout")]))
+        fresh = serialize(monkeypatch, lambda: ProblemsSection(problems=[problem("Gout")]))
+        assert rebound == fresh
+
+    @pytest.mark.parametrize("name", ["problem", "version", "schema", "_released"])
+    def test_bind_unknown_input(self, name):
+        """Test only the builder's own inputs can be rebound."""
+        with pytest.raises(TypeError, match="has no input"):
+            ProblemsSection(problems=[]).bind(**{name: None})
+
+    def test_bind_released_builder(self):
+        """Test a consumed builder cannot be rebound."""
+        section = ProblemsSection(problems=[problem("Asthma")])
+        section.consume()
+
+        with pytest.raises(RuntimeError, match="cannot be rebound"):
+            section.bind(problems=[])
+
+    def test_hospital_course_narrative_follows_input(self):
+        """Test the hospital course narrative is taken from the bound input."""
+        section = HospitalCourseSection(hospital_course=MockHospitalCourse("Admitted."))
+        section.bind(hospital_course=MockHospitalCourse("Discharged home."))
+
+        text = section.to_element().find(f"{{{NS}}}text/{{{NS}}}paragraph").text
+        assert text == "Discharged home."
+
+    def test_discharge_instructions_placeholder_follows_input(self):
+        """Test the empty-section placeholder is not kept once instructions are bound."""
+        section = HospitalDischargeInstructionsSection()
+        section.bind(instructions=[MockDischargeInstruction()])
+
+        assert "No discharge instructions provided." not in section.to_string()
+
+
+class TestSectionPlan:
+    """Tests for SectionPlan."""
+
+    @pytest.fixture
+    def plan(self):
+        """CCD plan with problems and medications sections."""
+        return SectionPlan(
+            ContinuityOfCareDocument,
+            {
+                "problems": ProblemsSection(problems=[]),
+                "medications": MedicationsSection(medications=[], title="Meds"),
+            },
+        )
+
+    def document(self, plan, data):
+        """Create a plan document with a fixed header."""
+        return plan.document(
+            MockPatient(),
+            MockAuthor(),
+            MockOrganization(),
+            data,
+            document_id="DOC-1",
+            effective_time=EFFECTIVE_TIME,
+        )
+
+    def test_document_matches_direct_construction(self, plan, monkeypatch):
+        """Test plan documents equal documents built from new builders."""
+        problems = [problem("Asthma")]
+        medications = [MockMedication()]
+        author = MockAuthor()
+
+        def direct():
+            return ContinuityOfCareDocument(
+                patient=MockPatient(),
+                author=author,
+                custodian=MockOrganization(),
+                sections=[
+                    ProblemsSection(problems=problems),
+                    MedicationsSection(medications=medications, title="Meds"),
+                ],
+                document_id="DOC-1",
+                effective_time=EFFECTIVE_TIME,
+            )
+
+        def planned():
+            return plan.document(
+                MockPatient(),
+                author,
+                MockOrganization(),
+                {"problems": problems, "medications": medications},
+                document_id="DOC-1",
+                effective_time=EFFECTIVE_TIME,
+            )
+
+        assert serialize(monkeypatch, planned) == serialize(monkeypatch, direct)
+
+    def test_sections_reused_across_documents(self, plan):
+        """Test each document gets the plan's builders rebound to its data."""
+        first = self.document(plan, {"problems": [problem("Asthma")], "medications": []})
+        first_xml = first.to_xml_string()
+        second = self.document(plan, {"problems": [problem("Gout")], "medications": []})
+
+        assert second.sections[0] is first.sections[0]
+        assert "Asthma" in first_xml
+        assert "Gout" in second.to_xml_string()
+
+    def test_missing_sections_are_left_out(self, plan):
+        """Test sections without data are omitted from the document."""
+        doc = self.document(plan, {"medications": []})
+
+        assert [type(s) for s in doc.sections] == [MedicationsSection]
+
+    def test_unknown_section(self, plan):
+        """Test data for sections outside the plan is rejected."""
+        with pytest.raises(ValueError, match="Sections not in plan: allergies"):
+            plan.bind({"allergies": []})
+
+    def test_mapping_binds_named_inputs(self):
+        """Test a dict value binds several inputs of one section."""
+        plan = SectionPlan(
+            DischargeSummary,
+            {"instructions": HospitalDischargeInstructionsSection()},
+        )
+        (section,) = plan.bind(
+            {"instructions": {"instructions": [], "narrative_text": "Rest for a week."}}
+        )
+
+        assert section.narrative_text == "Rest for a week."
+
+    def test_mapping_resets_unnamed_inputs(self):
+        """Test inputs bound for one patient do not carry over to the next."""
+        plan = SectionPlan(
+            ContinuityOfCareDocument,
+            {"plan": PlanOfTreatmentSection(title="Care Plan")},
+        )
+        instructions, procedures = [object()], [object()]
+        (first,) = plan.bind({"plan": {"instructions": instructions}})
+        assert first.instructions == instructions
+
+        (second,) = plan.bind({"plan": {"planned_procedures": procedures}})
+
+        assert second.instructions == []
+        assert second.planned_procedures == procedures
+        assert second.title == "Care Plan"
+
+    def test_primary_input_resets_other_inputs(self):
+        """Test binding the primary input resets inputs named earlier."""
+        plan = SectionPlan(DischargeSummary, {"course": HospitalCourseSection()})
+        plan.bind({"course": {"narrative_text": "Uneventful stay."}})
+
+        (section,) = plan.bind({"course": MockHospitalCourse("Discharged on day 3.")})
+
+        assert section.narrative_text is None
+
+    def test_mapping_missing_required_input(self):
+        """Test a dict must name inputs that have no default."""
+        plan = SectionPlan(ContinuityOfCareDocument, {"problems": ProblemsSection([])})
+
+        with pytest.raises(TypeError, match="missing problems"):
+            plan.bind({"problems": {"title": "Active Problems"}})
+
+    def test_keys_distinguish_sections_with_same_input(self):
+        """Test sections sharing an input name are bound by their plan key."""
+        plan = SectionPlan(
+            DischargeSummary,
+            {
+                "admission_medications": AdmissionMedicationsSection(medications=[]),
+                "discharge_medications": DischargeMedicationsSection(medications=[]),
+            },
+        )
+        admission, discharge = [object()], [object()]
+        sections = plan.bind(
+            {"admission_medications": admission, "discharge_medications": discharge}
+        )
+
+        assert [s.medications for s in sections] == [admission, discharge]
+
+    def test_version_mismatch(self):
+        """Test sections must use the plan's version."""
+        with pytest.raises(ValueError, match="Section 'problems' is C-CDA 2.0, plan is 2.1"):
+            SectionPlan(
+                ContinuityOfCareDocument,
+                {"problems": ProblemsSection(problems=[], version=CDAVersion.R2_0)},
+            )
+
+    def test_unsupported_version(self):
+        """Test builders that lack the plan's version are rejected when compiling."""
+        with pytest.raises(ValueError, match="Version 1.1 not supported"):
+            SectionPlan(
+                ContinuityOfCareDocument,
+                {"problems": ProblemsSection(problems=[], version=CDAVersion.R1_1)},
+                version=CDAVersion.R1_1,
+            )
+
+    def test_repr(self, plan):
+        """Test string representation."""
+        assert repr(plan) == "<SectionPlan: ContinuityOfCareDocument, 2 sections>"
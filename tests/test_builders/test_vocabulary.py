@@ -0,0 +1,301 @@
+"""Tests for shared medication vocabulary normalization."""
+
+import json
+from datetime import date
+
+import pytest
+
+from ccdakit.builders import vocabulary
+from ccdakit.builders.entries.immunization import ImmunizationActivity
+from ccdakit.builders.entries.medication import MedicationActivity
+from ccdakit.builders.entries.medication_administered_entry import MedicationAdministeredActivity
+from ccdakit.builders.entries.planned_medication import PlannedMedication
+from ccdakit.builders.vocabulary import (
+    DEFAULT_FREQUENCY,
+    DoseQuantity,
+    Frequency,
+    RouteCode,
+    clear_vocabulary_cache,
+    normalize_dose,
+    normalize_frequency,
+    normalize_route,
+    vocabulary_cache_info,
+    warm_vocabulary_cache,
+)
+
+
+NS = "urn:hl7-org:v3"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with empty caches and statistics."""
+    clear_vocabulary_cache()
+    yield
+    clear_vocabulary_cache()
+
+
+class MockMedication:
+    """Minimal medication for builder tests."""
+
+    name = "Lisinopril 10mg oral tablet"
+    code = "314076"
+    start_date = date(2023, 1, 1)
+    end_date = None
+    status = "active"
+    instructions = None
+    authors = None
+
+    def __init__(self, dosage="10 mg", route="oral", frequency="once daily"):
+        self.dosage = dosage
+        self.route = route
+        self.frequency = frequency
+
+
+class MockPlannedMedication:
+    """Minimal planned medication for builder tests."""
+
+    description = "Metformin"
+    code = "860975"
+    code_system = "RxNorm"
+    status = "active"
+    planned_date = date(2024, 1, 1)
+    persistent_id = None
+
+    def __init__(self, dose="500 mg", route="oral", frequency="twice daily"):
+        self.dose = dose
+        self.route = route
+        self.frequency = frequency
+
+
+class MockImmunization:
+    """Minimal immunization for builder tests."""
+
+    vaccine_name = "Influenza vaccine"
+    cvx_code = "88"
+    administration_date = date(2023, 10, 1)
+    status = "completed"
+    lot_number = None
+    manufacturer = None
+    site = None
+    dose_quantity = None
+
+    def __init__(self, route):
+        self.route = route
+
+
+class TestNormalizeRoute:
+    """Tests for normalize_route."""
+
+    def test_known_route_is_case_insensitive(self):
+        """Test route text is looked up without regard to case."""
+        assert normalize_route("Oral") == RouteCode(code="C38288", text="Oral")
+        assert normalize_route("IV").code == "C38276"
+
+    def test_route_table(self):
+        """Test routes can be looked up in another table."""
+        assert normalize_route("PO", {"po": "C38288"}) == RouteCode(code="C38288", text="PO")
+        assert normalize_route("Oral", {"po": "C38288"}).code is None
+
+    def test_unknown_route(self):
+        """Test unrecognized routes have no code."""
+        assert normalize_route("transdermal") == RouteCode(code=None, text="transdermal")
+
+
+class TestNormalizeFrequency:
+    """Tests for normalize_frequency."""
+
+    def test_known_frequency(self):
+        """Test known frequencies map to a PIVL_TS period."""
+        assert normalize_frequency("Twice Daily") == Frequency(period="12", unit="h")
+        assert normalize_frequency("weekly") == Frequency(period="1", unit="wk")
+
+    @pytest.mark.parametrize("text", ["PRN", "as needed"])
+    def test_prn(self, text):
+        """Test PRN frequencies are flagged and have no period."""
+        frequency = normalize_frequency(text)
+        assert frequency.prn
+        assert frequency.period is None
+        assert frequency.known
+
+    def test_frequency_table(self):
+        """Test frequencies can be looked up in another table."""
+        codes = {"q6h": {"period": "6", "unit": "h"}, "sos": None}
+        assert normalize_frequency("Q6H", codes) == Frequency(period="6", unit="h")
+        assert normalize_frequency("SOS", codes).prn
+        assert not normalize_frequency("daily", codes).known
+
+    def test_unknown_frequency(self):
+        """Test unrecognized frequencies are neither periodic nor PRN."""
+        frequency = normalize_frequency("q6h")
+        assert not frequency.known
+        assert not frequency.prn
+
+    def test_default_frequency_is_daily(self):
+        """Test the fallback period is once a day."""
+        assert DEFAULT_FREQUENCY == Frequency(period="1", unit="d")
+
+
+class TestNormalizeDose:
+    """Tests for normalize_dose."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("10 mg", DoseQuantity(value="10", unit="mg", text="10 mg")),
+            (" 0.5 mL ", DoseQuantity(value="0.5", unit="mL", text="0.5 mL")),
+            ("2", DoseQuantity(value="2", unit=None, text="2")),
+            ("1 tab daily", DoseQuantity(value="1", unit="tab daily", text="1 tab daily")),
+            ("two tablets", DoseQuantity(value=None, unit=None, text="two tablets")),
+            ("   ", DoseQuantity(value=None, unit=None, text="")),
+        ],
+    )
+    def test_parse(self, text, expected):
+        """Test numeric value and unit are split from the text."""
+        assert normalize_dose(text) == expected
+
+
+class TestVocabularyCache:
+    """Tests for caching, statistics and warming."""
+
+    def test_each_string_parsed_once(self):
+        """Test repeated strings are served from the cache."""
+        for _ in range(3):
+            normalize_route("oral")
+            normalize_dose("10 mg")
+        normalize_dose("20 mg")
+
+        stats = vocabulary_cache_info()
+        assert stats["route"] == {"hits": 2, "misses": 1, "size": 1}
+        assert stats["dose"] == {"hits": 2, "misses": 2, "size": 2}
+        assert stats["frequency"] == {"hits": 0, "misses": 0, "size": 0}
+
+    def test_cached_result_is_shared(self):
+        """Test hits return the same parsed object."""
+        assert normalize_frequency("daily") is normalize_frequency("daily")
+
+    def test_builders_use_cache(self):
+        """Test medication entries share parsed vocabulary."""
+        for _ in range(4):
+            MedicationActivity(MockMedication()).to_element()
+
+        stats = vocabulary_cache_info()
+        for kind in ("route", "frequency", "dose"):
+            assert stats[kind] == {"hits": 3, "misses": 1, "size": 1}
+
+    def test_warm(self, tmp_path):
+        """Test a vocabulary file pre-parses its strings."""
+        path = tmp_path / "vocabulary.json"
+        path.write_text(
+            json.dumps({"route": ["Oral", "IV"], "frequency": ["daily"], "dose": ["10 mg"]})
+        )
+
+        assert warm_vocabulary_cache(path) == 4
+        normalize_route("IV")
+        stats = vocabulary_cache_info()
+        assert stats["route"] == {"hits": 1, "misses": 2, "size": 2}
+        assert stats["dose"]["size"] == 1
+
+    def test_warm_unknown_kind(self, tmp_path):
+        """Test unknown vocabulary kinds are rejected."""
+        path = tmp_path / "vocabulary.json"
+        path.write_text(json.dumps({"site": ["left arm"]}))
+
+        with pytest.raises(ValueError, match="Unknown vocabulary kinds: site"):
+            warm_vocabulary_cache(path)
+
+    def test_warm_non_string_entry(self, tmp_path):
+        """Test non-string entries are rejected."""
+        path = tmp_path / "vocabulary.json"
+        path.write_text(json.dumps({"dose": [10]}))
+
+        with pytest.raises(ValueError, match="dose entries must be strings"):
+            warm_vocabulary_cache(path)
+
+    def test_warm_requires_object(self, tmp_path):
+        """Test the file must hold a JSON object."""
+        path = tmp_path / "vocabulary.json"
+        path.write_text(json.dumps(["oral"]))
+
+        with pytest.raises(ValueError, match="JSON object"):
+            warm_vocabulary_cache(path)
+
+
+class TestBuilderVocabulary:
+    """Tests for builders using the shared route table."""
+
+    def test_builders_expose_shared_tables(self):
+        """Test the builders' route and frequency tables are the shared ones."""
+        assert MedicationActivity.ROUTE_CODES is vocabulary.ROUTE_CODES
+        assert MedicationActivity.FREQUENCY_CODES is vocabulary.FREQUENCY_CODES
+        assert MedicationAdministeredActivity.ROUTE_CODES is vocabulary.ROUTE_CODES
+        assert ImmunizationActivity.ROUTE_CODES is vocabulary.ROUTE_CODES
+
+    def test_subclass_tables(self):
+        """Test a subclass's route and frequency tables are used, bypassing the cache."""
+
+        class LocalMedicationActivity(MedicationActivity):
+            ROUTE_CODES = {**MedicationActivity.ROUTE_CODES, "po": "C38288"}
+            FREQUENCY_CODES = {"q6h": {"period": "6", "unit": "h"}}
+
+        medication = MockMedication(route="PO", frequency="q6h")
+        elem = LocalMedicationActivity(medication).to_element()
+
+        assert elem.find(f"{{{NS}}}routeCode").get("code") == "C38288"
+        period = elem.find(f"{{{NS}}}effectiveTime[@operator='A']/{{{NS}}}period")
+        assert period.get("value") == "6"
+        assert period.get("unit") == "h"
+        stats = vocabulary_cache_info()
+        assert stats["route"]["size"] == 0
+        assert stats["frequency"]["size"] == 0
+
+        # The base class still uses the shared tables
+        elem = MedicationActivity(medication).to_element()
+        assert elem.find(f"{{{NS}}}routeCode").get("code") is None
+
+    def test_subclass_immunization_route(self):
+        """Test an immunization subclass's route table is used."""
+
+        class LocalImmunizationActivity(ImmunizationActivity):
+            ROUTE_CODES = {"im": "C28161"}
+
+        elem = LocalImmunizationActivity(MockImmunization(route="IM")).to_element()
+        assert elem.find(f"{{{NS}}}routeCode").get("code") == "C28161"
+
+    def test_immunization_codes_iv(self):
+        """Test immunizations recognize every shared route."""
+        elem = ImmunizationActivity(MockImmunization(route="IV")).to_element()
+        route = elem.find(f"{{{NS}}}routeCode")
+        assert route.get("code") == "C38276"
+        assert route.get("displayName") == "IV"
+
+    def test_planned_medication(self):
+        """Test planned medications get route code, dose unit and frequency."""
+        elem = PlannedMedication(MockPlannedMedication(route="Intravenous")).to_element()
+
+        route = elem.find(f"{{{NS}}}routeCode")
+        assert route.get("code") == "C38276"
+        assert route.get("displayName") == "Intravenous"
+
+        dose = elem.find(f"{{{NS}}}doseQuantity")
+        assert dose.get("value") == "500"
+        assert dose.get("unit") == "mg"
+
+        period = elem.find(f"{{{NS}}}effectiveTime[@operator='A']/{{{NS}}}period")
+        assert period.get("value") == "12"
+        assert period.get("unit") == "h"
+
+    def test_planned_medication_unknown_values(self):
+        """Test unrecognized planned route, dose and frequency fall back to text."""
+        medication = MockPlannedMedication(dose="one tablet", route="PO", frequency="q6h")
+        elem = PlannedMedication(medication).to_element()
+
+        route = elem.find(f"{{{NS}}}routeCode")
+        assert route.get("nullFlavor") == "OTH"
+        assert route.find(f"{{{NS}}}originalText").text == "PO"
+
+        dose = elem.find(f"{{{NS}}}doseQuantity")
+        assert dose.get("value") is None
+        assert dose.find(f"{{{NS}}}originalText").text == "one tablet"
+
+        assert elem.find(f"{{{NS}}}effectiveTime[@operator='A']") is None
@@ -510,3 +510,58 @@ class TestCompareHelperFunctions:
         assert len(comparison["sections_only_in_1"]) == 0
         assert len(comparison["sections_only_in_2"]) == 0
         assert len(comparison["section_differences"]) == 0
+
+
+class TestCompareEntryDiff:
+    """Test entry-level differences in the compare command."""
+
+    def _write(self, path, status):
+        path.write_text(f"""<?xml version="1.0" encoding="UTF-8"?>
+<ClinicalDocument xmlns="urn:hl7-org:v3">
+    <title>Doc</title>
+    <component><structuredBody><component>
+        <section>
+            <code code="11450-4"/>
+            <title>Problems</title>
+            <entry>
+                <observation classCode="OBS" moodCode="EVN">
+                    <templateId root="2.16.840.1.113883.10.20.22.4.4"/>
+                    <id root="1.2.3" extension="p1"/>
+                    <statusCode code="{status}"/>
+                </observation>
+            </entry>
+        </section>
+    </component></structuredBody></component>
+</ClinicalDocument>""")
+        return path
+
+    def test_compare_reports_changed_entry(self, tmp_path):
+        """Test changed entry attributes are reported."""
+        file1 = self._write(tmp_path / "a.xml", "active")
+        file2 = self._write(tmp_path / "b.xml", "completed")
+
+        result = runner.invoke(app, ["compare", str(file1), str(file2)])
+
+        assert result.exit_code == 0
+        assert "Entry Differences" in result.stdout
+        assert "changed" in result.stdout
+        assert "Found 1 differences" in result.stdout
+
+    def test_compare_documents_includes_entries(self, tmp_path):
+        """Test _compare_documents aligns extracted entries."""
+        from lxml import etree
+
+        from ccdakit.cli.commands.compare import _compare_documents, _extract_comparison_data
+
+        file1 = self._write(tmp_path / "a.xml", "active")
+        file2 = self._write(tmp_path / "b.xml", "completed")
+        data1 = _extract_comparison_data(etree.parse(str(file1)).getroot())
+        data2 = _extract_comparison_data(etree.parse(str(file2)).getroot())
+
+        comparison = _compare_documents(data1, data2)
+
+        assert len(comparison["entry_differences"]) == 1
+        diff = comparison["entry_differences"][0]
+        assert diff["status"] == "changed"
+        assert diff["details"][0]["file1"] == "active"
+        assert diff["details"][0]["file2"] == "completed"
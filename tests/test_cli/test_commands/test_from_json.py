@@ -0,0 +1,105 @@
+"""Tests for the from-json CLI command."""
+
+import gzip
+import json
+import tarfile
+
+import pytest
+from typer.testing import CliRunner
+
+from ccdakit.cli.__main__ import app
+from ccdakit.utils.sinks import ContainerReader
+
+
+runner = CliRunner()
+
+
+def record(document_id):
+    """Minimal document dictionary."""
+    return {
+        "patient": {
+            "first_name": "John",
+            "last_name": "Doe",
+            "date_of_birth": "1970-05-15",
+            "sex": "M",
+        },
+        "author": {"first_name": "Alice", "last_name": "Smith", "time": "2024-01-15T10:30:00"},
+        "custodian": {"name": "Community Health Center"},
+        "document": {"document_id": document_id, "effective_time": "2024-01-15T14:30:00"},
+    }
+
+
+@pytest.fixture
+def single_file(tmp_path):
+    """JSON file holding one document."""
+    path = tmp_path / "record.json"
+    path.write_text(json.dumps(record("DOC-1")))
+    return path
+
+
+@pytest.fixture
+def batch_file(tmp_path):
+    """JSON file holding a list of three documents."""
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps([record(f"DOC-{i}") for i in range(3)]))
+    return path
+
+
+class TestFromJsonCommand:
+    """Test suite for the from-json command."""
+
+    def test_write_xml(self, single_file, tmp_path):
+        """Test one document is written as plain XML."""
+        output = tmp_path / "out.xml"
+        result = runner.invoke(app, ["from-json", str(single_file), "--output", str(output)])
+
+        assert result.exit_code == 0
+        assert "<ClinicalDocument" in output.read_text()
+
+    def test_write_compressed(self, single_file, tmp_path):
+        """Test --compress writes a gzip file with the .gz suffix added."""
+        output = tmp_path / "out.xml"
+        result = runner.invoke(
+            app, ["from-json", str(single_file), "-o", str(output), "--compress", "gzip"]
+        )
+
+        assert result.exit_code == 0
+        assert b"<ClinicalDocument" in gzip.decompress((tmp_path / "out.xml.gz").read_bytes())
+
+    def test_list_to_archive(self, batch_file, tmp_path):
+        """Test a JSON list is written as several archive members."""
+        output = tmp_path / "out.tar.gz"
+        result = runner.invoke(app, ["from-json", str(batch_file), "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert "3 C-CDA documents written" in result.stdout
+        with tarfile.open(output) as archive:
+            assert archive.getnames() == ["DOC-0.xml", "DOC-1.xml", "DOC-2.xml"]
+
+    def test_list_to_container(self, batch_file, tmp_path):
+        """Test a JSON list is written to an indexed container."""
+        output = tmp_path / "out.jsonl"
+        result = runner.invoke(app, ["from-json", str(batch_file), "-o", str(output)])
+
+        assert result.exit_code == 0
+        with ContainerReader(output) as reader:
+            assert reader.keys() == ["DOC-0", "DOC-1", "DOC-2"]
+            assert 'extension="DOC-1"' in reader.read("DOC-1")
+
+    def test_list_needs_output(self, batch_file):
+        """Test several documents cannot be printed to stdout."""
+        result = runner.invoke(app, ["from-json", str(batch_file)])
+
+        assert result.exit_code == 1
+        assert "needs --output" in result.output
+
+    def test_invalid_compression(self, single_file, tmp_path):
+        """Test unknown compressions are rejected."""
+        output = tmp_path / "out.xml"
+        result = runner.invoke(
+            app, ["from-json", str(single_file), "-o", str(output), "--compress", "bz2"]
+        )
+
+        assert result.exit_code == 1
+        assert "Unknown compression" in result.output
+        assert not output.exists()
@@ -1,5 +1,8 @@
 """Tests for the generate CLI command."""
 
+import gzip
+import lzma
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -296,6 +299,89 @@ class TestGenerateCommand:
         assert "vital-signs" in sections
 
 
+def mock_documents(count):
+    """Mock documents with distinct ids."""
+    docs = []
+    for i in range(count):
+        doc = MagicMock()
+        doc.document_id = f"DOC-{i}"
+        doc.to_xml_string.return_value = f'<?xml version="1.0"?><ClinicalDocument n="{i}"/>'
+        docs.append(doc)
+    return docs
+
+
+class TestGenerateOutputFormats:
+    """Test compressed and archived output of the generate command."""
+
+    @patch("ccdakit.cli.commands.generate._generate_document")
+    def test_generate_compressed_file(self, mock_generate, tmp_path):
+        """Test a .gz output name writes a gzip-compressed document."""
+        mock_generate.return_value = mock_documents(1)[0]
+
+        output_file = tmp_path / "test_ccd.xml.gz"
+        result = runner.invoke(app, ["generate", "ccd", "--output", str(output_file)])
+
+        assert result.exit_code == 0
+        assert b"ClinicalDocument" in gzip.decompress(output_file.read_bytes())
+
+    @patch("ccdakit.cli.commands.generate._generate_document")
+    def test_generate_compress_option_adds_suffix(self, mock_generate, tmp_path):
+        """Test --compress appends the compression suffix to the output name."""
+        mock_generate.return_value = mock_documents(1)[0]
+
+        output_file = tmp_path / "test_ccd.xml"
+        result = runner.invoke(
+            app, ["generate", "ccd", "--output", str(output_file), "--compress", "xz"]
+        )
+
+        assert result.exit_code == 0
+        assert not output_file.exists()
+        assert b"ClinicalDocument" in lzma.decompress((tmp_path / "test_ccd.xml.xz").read_bytes())
+
+    @patch("ccdakit.cli.commands.generate._generate_document")
+    def test_generate_count_to_archive(self, mock_generate, tmp_path):
+        """Test several documents are written to one archive."""
+        mock_generate.side_effect = mock_documents(3)
+
+        output_file = tmp_path / "batch.zip"
+        result = runner.invoke(
+            app, ["generate", "ccd", "--output", str(output_file), "--count", "3"]
+        )
+
+        assert result.exit_code == 0
+        assert "3 documents generated successfully" in result.stdout
+        with zipfile.ZipFile(output_file) as archive:
+            assert archive.namelist() == ["DOC-0.xml", "DOC-1.xml", "DOC-2.xml"]
+
+    @patch("ccdakit.cli.commands.generate._generate_document")
+    def test_generate_count_to_directory(self, mock_generate, tmp_path):
+        """Test several documents go to a directory of compressed files."""
+        mock_generate.side_effect = mock_documents(2)
+
+        output_dir = tmp_path / "batch"
+        result = runner.invoke(
+            app,
+            ["generate", "ccd", "-o", str(output_dir), "-n", "2", "--compress", "gzip"],
+        )
+
+        assert result.exit_code == 0
+        assert sorted(p.name for p in output_dir.iterdir()) == ["DOC-0.xml.gz", "DOC-1.xml.gz"]
+
+    def test_generate_invalid_compression(self):
+        """Test unknown compressions are rejected."""
+        result = runner.invoke(app, ["generate", "ccd", "--compress", "bz2"])
+
+        assert result.exit_code == 1
+        assert "Unknown compression" in result.stdout
+
+    def test_generate_invalid_count(self):
+        """Test a count below one is rejected."""
+        result = runner.invoke(app, ["generate", "ccd", "--count", "0"])
+
+        assert result.exit_code == 1
+        assert "--count must be at least 1" in result.stdout
+
+
 class TestInteractiveSelection:
     """Test interactive section selection functionality."""
 
@@ -486,6 +486,134 @@ class TestValidationResultDisplay:
         assert "warning(s) found" in result.stdout
         assert "Document is valid" in result.stdout
 
+    @patch("ccdakit.cli.commands.validate._run_xsd_validation")
+    @patch("ccdakit.cli.commands.validate._run_schematron_validation")
+    def test_validate_fail_fast(
+        self,
+        mock_schematron,
+        mock_xsd,
+        sample_xml_file,
+        mock_validation_result_with_errors,
+    ):
+        """Test --fail-fast skips Schematron when XSD validation fails."""
+        mock_xsd.return_value = mock_validation_result_with_errors
+
+        result = runner.invoke(app, ["validate", str(sample_xml_file), "--fail-fast"])
+
+        assert result.exit_code == 1
+        mock_schematron.assert_not_called()
+        assert "Schematron validation skipped" in result.stdout
+        assert "SKIPPED" in result.stdout
+
+    @patch("ccdakit.cli.commands.validate._run_xsd_validation")
+    @patch("ccdakit.cli.commands.validate._run_schematron_validation")
+    def test_validate_parses_once(
+        self,
+        mock_schematron,
+        mock_xsd,
+        sample_xml_file,
+        mock_validation_result_success,
+    ):
+        """Test both validators receive the same parsed document."""
+        mock_xsd.return_value = mock_validation_result_success
+        mock_schematron.return_value = mock_validation_result_success
+
+        result = runner.invoke(app, ["validate", str(sample_xml_file)])
+
+        assert result.exit_code == 0
+        assert mock_xsd.call_args[0][0] is mock_schematron.call_args[0][0]
+        assert "Time:" in result.stdout
+
+    @patch("ccdakit.cli.commands.validate._run_xsd_validation")
+    def test_validate_malformed_xml(self, mock_xsd, invalid_xml_file):
+        """Test malformed XML is reported by the parse stage."""
+        result = runner.invoke(app, ["validate", str(invalid_xml_file), "--no-schematron"])
+
+        assert result.exit_code == 1
+        mock_xsd.assert_not_called()
+        assert "PARSE: FAILED" in result.stdout
+        assert "XSD: SKIPPED" in result.stdout
+
+
+    @patch("ccdakit.cli.commands.validate._run_xsd_validation")
+    @patch("ccdakit.cli.commands.validate._run_schematron_validation")
+    def test_validate_custom_rules_profile(
+        self,
+        mock_schematron,
+        mock_xsd,
+        sample_xml_file,
+        mock_validation_result_success,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test --rules runs custom rules and --slowest-rules prints their profile."""
+        mock_xsd.return_value = mock_validation_result_success
+        mock_schematron.return_value = mock_validation_result_success
+        (tmp_path / "team_rules.py").write_text(
+            "from ccdakit.validators.rule_builder import RuleBuilder\n"
+            "rules = [\n"
+            "    RuleBuilder.xpath_exists('has_title', '//cda:title'),\n"
+            "    RuleBuilder.xpath_exists('has_section', '//cda:section'),\n"
+            "]\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        result = runner.invoke(
+            app,
+            [
+                "validate",
+                str(sample_xml_file),
+                "--rules",
+                "team_rules:rules",
+                "--slowest-rules",
+                "5",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Custom Rules Validation" in result.stdout
+        assert "RULES: FAILED" in result.stdout
+        assert "Slowest Rules" in result.stdout
+        assert "has_section" in result.stdout
+
+    @patch("ccdakit.cli.commands.validate._run_xsd_validation")
+    @patch("ccdakit.cli.commands.validate._run_schematron_validation")
+    def test_validate_rules_from_working_directory(
+        self,
+        mock_schematron,
+        mock_xsd,
+        sample_xml_file,
+        mock_validation_result_success,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test --rules finds modules in the working directory without changing sys.path."""
+        mock_xsd.return_value = mock_validation_result_success
+        mock_schematron.return_value = mock_validation_result_success
+        (tmp_path / "cwd_rules.py").write_text(
+            "from ccdakit.validators.rule_builder import RuleBuilder\n"
+            "rules = [RuleBuilder.xpath_exists('has_section', '//cda:section')]\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "path", [entry for entry in sys.path if entry != ""])
+        before = list(sys.path)
+
+        result = runner.invoke(
+            app, ["validate", str(sample_xml_file), "--rules", "cwd_rules:rules"]
+        )
+
+        assert "Custom Rules Validation" in result.stdout
+        assert sys.path == before
+
+    def test_validate_rules_not_found(self, sample_xml_file):
+        """Test an unknown rules module is reported."""
+        result = runner.invoke(
+            app, ["validate", str(sample_xml_file), "--rules", "no_such_module:engine"]
+        )
+
+        assert result.exit_code == 1
+        assert "Cannot load rules" in result.stdout
+
 
 class TestValidateIntegration:
     """Integration tests using real example files."""
@@ -158,6 +158,20 @@ class TestListTemplatesCommand:
         assert "List all available document templates" in result.stdout
         assert "--show-content" in result.stdout
 
+    def test_list_templates_oids(self):
+        """Test listing the builders that emit a template OID."""
+        result = runner.invoke(app, ["list-templates", "--oids", "2.16.840.1.113883.10.20.22.4.3"])
+        assert result.exit_code == 0
+        assert "2.16.840.1.113883.10.20.22.4.3" in result.stdout
+        assert "problem_concern_act" in result.stdout
+        assert "sections.problems.ProblemsSection" in result.stdout
+
+    def test_list_templates_oids_unknown(self):
+        """Test an OID no builder emits is reported."""
+        result = runner.invoke(app, ["list-templates", "--oids", "1.2.840.99999.1"])
+        assert result.exit_code == 1
+        assert "No builder emits template" in result.stdout
+
 
 class TestListEntriesCommand:
     """Tests for the list-entries command."""
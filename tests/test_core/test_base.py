@@ -1,5 +1,8 @@
 """Tests for core base classes."""
 
+import uuid
+from datetime import date
+
 import pytest
 from lxml import etree
 
@@ -180,3 +183,74 @@ def test_cda_element_to_string_with_encoding():
     xml_str = elem_builder.to_string(encoding="unicode")
     assert isinstance(xml_str, str)
     assert "test" in xml_str
+
+
+def test_builders_are_slotted():
+    """Test library builders carry no per-instance __dict__."""
+    from ccdakit.builders.entries.problem import ProblemObservation
+    from ccdakit.builders.sections.problems import ProblemsSection
+
+    section = ProblemsSection(problems=[])
+    assert not hasattr(section, "__dict__")
+    assert not hasattr(ProblemObservation.__new__(ProblemObservation), "__dict__")
+    with pytest.raises(AttributeError):
+        section.extra = "value"
+
+
+class Problem:
+    """Minimal problem for consume tests."""
+
+    name = "Hypertension"
+    code = "38341003"
+    code_system = "SNOMED"
+    status = "active"
+    onset_date = date(2020, 1, 1)
+    resolved_date = None
+    persistent_id = None
+
+
+def test_consume_matches_to_element(monkeypatch):
+    """Test consume builds the same element as to_element."""
+    from ccdakit.builders.sections.problems import ProblemsSection
+
+    fixed = uuid.UUID(int=1)
+    monkeypatch.setattr(uuid, "uuid4", lambda: fixed)
+
+    expected = etree.tostring(ProblemsSection(problems=[Problem()]).to_element())
+    assert etree.tostring(ProblemsSection(problems=[Problem()]).consume()) == expected
+
+
+def test_consume_releases_inputs():
+    """Test consume drops input data and keeps version."""
+    from ccdakit.builders.sections.problems import ProblemsSection
+
+    section = ProblemsSection(problems=[Problem()], title="Problems")
+    section.consume()
+
+    assert not hasattr(section, "problems")
+    assert not hasattr(section, "title")
+    assert section.version == CDAVersion.R2_1
+
+
+def test_release_nested_builders():
+    """Test release reaches builders held in attributes and lists."""
+    from ccdakit.builders.sections.problems import ProblemsSection
+
+    section = ProblemsSection(problems=[Problem()])
+    holder = MockElement()
+    holder.sections = [section]
+    holder.consume()
+
+    assert not hasattr(holder, "sections")
+    assert not hasattr(section, "problems")
+    with pytest.raises(RuntimeError, match="ProblemsSection was released"):
+        section.to_element()
+
+
+def test_released_builder_cannot_rebuild():
+    """Test building again after consume raises."""
+    builder = MockElement()
+    builder.consume()
+
+    with pytest.raises(RuntimeError, match="cannot be built again"):
+        builder.to_element()
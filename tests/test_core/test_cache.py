@@ -0,0 +1,206 @@
+"""Tests for section fingerprinting and caching."""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.core.base import CDAVersion
+from ccdakit.core.cache import HeaderCache, SectionCache, compute_fingerprint
+
+
+NS = "urn:hl7-org:v3"
+
+
+@dataclass
+class Problem:
+    """Minimal ProblemProtocol implementation."""
+
+    name: str = "Hypertension"
+    code: str = "38341003"
+    code_system: str = "SNOMED"
+    onset_date: Optional[date] = date(2020, 1, 1)
+    resolved_date: Optional[date] = None
+    status: str = "active"
+    persistent_id: Optional[object] = None
+
+
+class Slotted:
+    """Object storing its data in __slots__."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class TestFingerprint:
+    """Tests for builder fingerprints."""
+
+    def test_equal_inputs_equal_fingerprints(self):
+        """Test identical inputs produce identical fingerprints."""
+        a = ProblemsSection([Problem()])
+        b = ProblemsSection([Problem()])
+        assert a.fingerprint() == b.fingerprint()
+
+    def test_changed_input_changes_fingerprint(self):
+        """Test any input change produces a new fingerprint."""
+        base = ProblemsSection([Problem()]).fingerprint()
+        assert ProblemsSection([Problem(status="resolved")]).fingerprint() != base
+        assert ProblemsSection([Problem()], title="Other").fingerprint() != base
+        assert ProblemsSection([Problem(), Problem()]).fingerprint() != base
+
+    def test_version_changes_fingerprint(self):
+        """Test the C-CDA version is part of the fingerprint."""
+        r21 = ProblemsSection([Problem()], version=CDAVersion.R2_1)
+        r20 = ProblemsSection([Problem()], version=CDAVersion.R2_0)
+        assert r21.fingerprint() != r20.fingerprint()
+
+    def test_schema_is_excluded(self):
+        """Test the attached schema validator does not affect the fingerprint."""
+        a = ProblemsSection([Problem()])
+        b = ProblemsSection([Problem()])
+        b.schema = object()
+        assert a.fingerprint() == b.fingerprint()
+
+    def test_slots_and_cycles(self):
+        """Test slotted objects and reference cycles are handled."""
+        cyclic = [Slotted(1)]
+        cyclic.append(cyclic)
+        section = ProblemsSection(cyclic)
+        assert compute_fingerprint(section) == compute_fingerprint(section)
+
+        section.problems = [Slotted(2)]
+        other = ProblemsSection([Slotted(3)])
+        assert compute_fingerprint(section) != compute_fingerprint(other)
+
+
+class TestSectionCache:
+    """Tests for SectionCache."""
+
+    def test_hit_returns_copy(self):
+        """Test cached subtrees are copied on every hit."""
+        cache = SectionCache()
+        first = cache.get_or_build(ProblemsSection([Problem()]))
+        second = cache.get_or_build(ProblemsSection([Problem()]))
+
+        assert first is not second
+        assert etree.tostring(first) == etree.tostring(second)
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted."""
+        cache = SectionCache(maxsize=2)
+        for title in ("A", "B", "A", "C"):
+            cache.get_or_build(ProblemsSection([], title=title))
+
+        assert len(cache) == 2
+        cache.get_or_build(ProblemsSection([], title="B"))
+        assert cache.stats()["misses"] == 4
+
+    def test_invalid_maxsize(self):
+        """Test maxsize must be positive."""
+        with pytest.raises(ValueError, match="maxsize"):
+            SectionCache(maxsize=0)
+
+    def test_disk_cache(self, tmp_path):
+        """Test subtrees persist across cache instances."""
+        builder = ProblemsSection([Problem()])
+        built = SectionCache(directory=tmp_path).get_or_build(builder)
+
+        fresh = SectionCache(directory=tmp_path)
+        element = fresh.get(builder.fingerprint())
+        assert element is not None
+        assert etree.tostring(element) == etree.tostring(built)
+        assert fresh.stats()["hits"] == 1
+
+        fresh.invalidate()
+        assert list(tmp_path.glob("*.xml")) == []
+        assert fresh.get(builder.fingerprint()) is None
+
+    def test_invalidate_single_key(self):
+        """Test a single entry can be dropped."""
+        cache = SectionCache()
+        builder = ProblemsSection([Problem()])
+        cache.get_or_build(builder)
+        cache.invalidate(builder.fingerprint())
+        assert len(cache) == 0
+
+
+class TestHeaderCache:
+    """Tests for HeaderCache."""
+
+    def _factory(self, calls):
+        def build():
+            calls.append(1)
+            return [etree.Element("a"), etree.Element("b")]
+
+        return build
+
+    def test_hit_returns_copies(self):
+        """Test fragments are built once and copied on every use."""
+        cache = HeaderCache()
+        calls = []
+        first = cache.get_or_build("prefix", self._factory(calls))
+        second = cache.get_or_build("prefix", self._factory(calls))
+
+        assert len(calls) == 1
+        assert [e.tag for e in second] == ["a", "b"]
+        assert first[0] is not second[0]
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_source_fingerprint_is_part_of_key(self):
+        """Test fragments are shared by equal sources and kept apart for different ones."""
+        cache = HeaderCache()
+        calls = []
+        first, copy, other = Problem(), Problem(), Problem(name="Asthma")
+        cache.get_or_build("author", self._factory(calls), source=first)
+        cache.get_or_build("author", self._factory(calls), source=copy)
+        cache.get_or_build("author", self._factory(calls), source=other)
+
+        assert len(calls) == 2
+        assert len(cache) == 2
+
+    def test_modified_source_rebuilds(self):
+        """Test a source changed in place gets a new fragment."""
+        cache = HeaderCache()
+        calls = []
+        source = Problem()
+        cache.get_or_build("author", self._factory(calls), source=source)
+        source.name = "Asthma"
+        cache.get_or_build("author", self._factory(calls), source=source)
+
+        assert len(calls) == 2
+
+    def test_bounded(self):
+        """Test the least recently used fragment is dropped beyond maxsize."""
+        cache = HeaderCache(maxsize=2)
+        calls = []
+        cache.get_or_build("a", self._factory(calls))
+        cache.get_or_build("b", self._factory(calls))
+        cache.get_or_build("a", self._factory(calls))
+        cache.get_or_build("c", self._factory(calls))
+        cache.get_or_build("a", self._factory(calls))
+        cache.get_or_build("b", self._factory(calls))
+
+        assert len(calls) == 4
+        assert len(cache) == 2
+
+    def test_invalid_maxsize(self):
+        """Test maxsize must be positive."""
+        with pytest.raises(ValueError, match="maxsize"):
+            HeaderCache(maxsize=0)
+
+    def test_invalidate(self):
+        """Test invalidate drops every fragment."""
+        cache = HeaderCache()
+        calls = []
+        cache.get_or_build("prefix", self._factory(calls))
+        cache.invalidate()
+        cache.get_or_build("prefix", self._factory(calls))
+
+        assert len(calls) == 2
+        assert repr(cache) == "<HeaderCache: 1/128 fragments>"
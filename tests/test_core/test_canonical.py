@@ -0,0 +1,218 @@
+"""Tests for deterministic builds and content hashes."""
+
+import uuid
+from datetime import datetime
+from itertools import count
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders.common import EffectiveTime, create_default_author_participation
+from ccdakit.builders.documents import ContinuityOfCareDocument
+from ccdakit.builders.sections.medications import MedicationsSection
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.core.cache import SectionCache, compute_fingerprint
+from ccdakit.core.canonical import (
+    SequentialIds,
+    build_context,
+    canonical_build,
+    canonicalize,
+    fixed_utc_offset,
+    new_id,
+    now,
+)
+
+from ..test_builders.test_document_types import (
+    MockAuthor,
+    MockMedication,
+    MockOrganization,
+    MockPatient,
+    MockProblem,
+)
+
+
+NS = "urn:hl7-org:v3"
+CLOCK = datetime(2024, 1, 15, 9, 30)
+
+
+def ccd(problems=1, medications=1, **options):
+    """CCD with Problems and Medications sections."""
+    return ContinuityOfCareDocument(
+        patient=MockPatient(),
+        author=MockAuthor(),
+        custodian=MockOrganization(),
+        sections=[
+            ProblemsSection([MockProblem() for _ in range(problems)]),
+            MedicationsSection([MockMedication() for _ in range(medications)]),
+        ],
+        **options,
+    )
+
+
+def canonical_ccd(**options):
+    """Build a CCD inside canonical_build() and canonicalize it."""
+    with canonical_build(clock=CLOCK):
+        return canonicalize(ccd(**options))
+
+
+class TestCanonicalBuild:
+    """Tests for the canonical_build() scope."""
+
+    def test_defaults_outside_scope(self):
+        """Test ids are random UUIDs and times current outside a scope."""
+        assert build_context() is None
+        assert new_id() != new_id()
+        uuid.UUID(new_id())
+        assert abs((now() - datetime.now()).total_seconds()) < 60
+        assert fixed_utc_offset() is None
+
+    def test_fixed_clock(self):
+        """Test a datetime clock is returned by now()."""
+        with canonical_build(clock=CLOCK):
+            assert now() == CLOCK
+
+    def test_callable_clock_and_ids(self):
+        """Test callable clocks and id sources are used."""
+        ids = (f"id-{n}" for n in count(1))
+        with canonical_build(clock=lambda: CLOCK, ids=lambda: next(ids)) as context:
+            assert now() == CLOCK
+            assert [new_id(), new_id()] == ["id-1", "id-2"]
+        assert context.generated == {"id-1", "id-2"}
+
+    def test_nested_scopes(self):
+        """Test the innermost scope applies and the outer one is restored."""
+        later = datetime(2025, 1, 1)
+        with canonical_build(clock=CLOCK):
+            with canonical_build(clock=later, utc_offset="-0500"):
+                assert now() == later
+                assert fixed_utc_offset() == "-0500"
+            assert now() == CLOCK
+            assert fixed_utc_offset() == "+0000"
+        assert build_context() is None
+
+    def test_invalid_offset(self):
+        """Test malformed UTC offsets are rejected."""
+        with pytest.raises(ValueError, match="Invalid UTC offset"):
+            with canonical_build(clock=CLOCK, utc_offset="+5"):
+                pass
+
+    def test_fixed_offset_for_naive_datetimes(self):
+        """Test naive datetimes get the scope's offset."""
+        with canonical_build(clock=CLOCK, utc_offset="-0330"):
+            assert EffectiveTime._format_datetime(CLOCK) == "20240115093000-0330"
+
+    def test_default_author_time(self):
+        """Test the default author participation time comes from the clock."""
+        with canonical_build(clock=CLOCK):
+            author = create_default_author_participation()
+        assert author.find(f"{{{NS}}}time").get("value") == "20240115093000+0000"
+
+    def test_fingerprint_depends_on_scope(self):
+        """Test cached subtrees are not shared between scopes."""
+        section = ProblemsSection([MockProblem()])
+        plain = compute_fingerprint(section)
+        with canonical_build(clock=CLOCK):
+            first = compute_fingerprint(section)
+            assert compute_fingerprint(section) == first
+        with canonical_build(clock=CLOCK):
+            second = compute_fingerprint(section)
+        assert len({plain, first, second}) == 3
+        assert compute_fingerprint(section) == plain
+
+
+class TestSequentialIds:
+    """Tests for the repeatable id source."""
+
+    def test_repeatable(self):
+        """Test sources with the same seed return the same UUIDs."""
+        a, b = SequentialIds(), SequentialIds()
+        first = [a() for _ in range(3)]
+        assert first == [b() for _ in range(3)]
+        assert len(set(first)) == 3
+        uuid.UUID(first[0])
+
+    def test_seeds_differ(self):
+        """Test different seeds give different sequences."""
+        assert SequentialIds("a")() != SequentialIds("b")()
+
+
+class TestCanonicalize:
+    """Tests for canonical serialization and content hashes."""
+
+    def test_repeatable_output(self):
+        """Test two builds give identical canonical XML and hashes."""
+        first, second = canonical_ccd(), canonical_ccd()
+        assert first.xml == second.xml
+        assert first.content_hash == second.content_hash
+        assert first.section_hashes == second.section_hashes
+
+    def test_canonical_xml(self):
+        """Test the XML is C14N without an XML declaration."""
+        result = canonical_ccd()
+        assert "xml" not in vars(result)  # serialized on first use
+        assert result.xml.startswith(b"<ClinicalDocument")
+        assert b"20240115093000+0000" in result.xml
+        assert etree.fromstring(result.xml).tag == f"{{{NS}}}ClinicalDocument"
+
+    def test_section_hashes(self):
+        """Test sections are keyed by code and hashed separately."""
+        result = canonical_ccd()
+        assert set(result.section_hashes) == {"11450-4", "10160-0"}
+        assert len(set(result.section_hashes.values())) == 2
+
+    def test_unchanged_section_keeps_hash(self):
+        """Test changing one section leaves the other section's hash alone."""
+        before = canonical_ccd(problems=1)
+        after = canonical_ccd(problems=2)
+        assert before.section_hashes["11450-4"] != after.section_hashes["11450-4"]
+        assert before.section_hashes["10160-0"] == after.section_hashes["10160-0"]
+        assert before.content_hash != after.content_hash
+
+    def test_document_id_not_hashed(self):
+        """Test the document id does not change the content hash."""
+        first = canonical_ccd(document_id="DOC-1")
+        second = canonical_ccd(document_id="DOC-2")
+        assert first.xml != second.xml
+        assert first.content_hash == second.content_hash
+
+    def test_clock_is_hashed(self):
+        """Test a different build time changes the content hash."""
+        with canonical_build(clock=datetime(2024, 2, 1)):
+            later = canonicalize(ccd())
+        assert later.content_hash != canonical_ccd().content_hash
+
+    def test_duplicate_section_codes(self):
+        """Test repeated sections get numbered keys."""
+        with canonical_build(clock=CLOCK):
+            doc = ccd()
+            doc.sections.append(ProblemsSection([MockProblem()]))
+            result = canonicalize(doc)
+        assert set(result.section_hashes) == {"11450-4", "10160-0", "11450-4#2"}
+        assert result.section_hashes["11450-4"] == result.section_hashes["11450-4#2"]
+
+    def test_section_builder(self):
+        """Test a section builder hashes as a single section."""
+        with canonical_build(clock=CLOCK):
+            result = canonicalize(ProblemsSection([MockProblem()]))
+        assert result.content_hash == result.section_hashes["11450-4"]
+        assert etree.fromstring(result.xml).tag == f"{{{NS}}}section"
+
+    def test_generated_ids_restored(self):
+        """Test hashing leaves generated ids in place."""
+        with canonical_build(clock=CLOCK) as context:
+            result = canonicalize(ccd())
+        assert b"generated-" not in result.xml
+        assert any(value.encode() in result.xml for value in context.generated)
+
+    def test_section_cache(self):
+        """Test cached sections hash the same within and across scopes."""
+        cache = SectionCache()
+        with canonical_build(clock=CLOCK):
+            first = canonicalize(ccd(section_cache=cache))
+            second = canonicalize(ccd(section_cache=cache))
+        assert cache.hits == 2
+        assert first.content_hash == second.content_hash
+        third = canonical_ccd(section_cache=cache)
+        assert cache.hits == 2
+        assert third.xml == first.xml
+        assert third.content_hash == first.content_hash
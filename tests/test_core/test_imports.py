@@ -0,0 +1,108 @@
+"""Import-time regression tests for lazily loaded packages."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+# Modules that must not be loaded as a side effect of importing a light package
+HEAVY_MODULES = (
+    "ccdakit.builders.sections",
+    "ccdakit.builders.entries",
+    "ccdakit.validators",
+    "ccdakit.utils.test_data",
+    "ccdakit.cli.__main__",
+    "ccdakit.cli.web.app",
+    "flask",
+    "faker",
+    "typer",
+    "rich",
+)
+
+
+def imported_modules(statement: str) -> set:
+    """
+    Run an import in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        statement: Python import statement to execute
+
+    Returns:
+        Set of module names reported by the import-time log
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        if name != "imported package":
+            modules.add(name)
+    return modules
+
+
+def heavy_imports(modules: set) -> list:
+    """Return the heavy modules (or their submodules) present in a module set."""
+    return sorted(
+        m for m in modules if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)
+    )
+
+
+class TestLazyImports:
+    """Guard against eager imports creeping back into package __init__ modules."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import ccdakit",
+            "import ccdakit.builders",
+            "import ccdakit.builders.sections",
+            "import ccdakit.builders.entries",
+            "import ccdakit.utils",
+            "import ccdakit.cli",
+            "import ccdakit.cli.web",
+        ],
+    )
+    def test_package_import_is_light(self, statement):
+        """Test importing a package does not load heavy modules."""
+        modules = imported_modules(statement)
+        loaded = [m for m in heavy_imports(modules) if statement.split()[1] != m]
+        assert loaded == []
+
+    def test_single_section_import(self):
+        """Test importing one section does not load every other section."""
+        modules = imported_modules("from ccdakit import ProblemsSection")
+
+        assert "ccdakit.builders.sections.problems" in modules
+        assert "ccdakit.builders.sections.results" not in modules
+        assert "ccdakit.builders.entries.medication" not in modules
+
+    def test_lazy_attributes_resolve(self):
+        """Test lazily exported names resolve to the defining objects."""
+        import ccdakit
+        import ccdakit.builders.sections as sections
+        import ccdakit.validators as validators
+        from ccdakit.builders.sections.problems import ProblemsSection
+        from ccdakit.validators import common_rules
+
+        assert ccdakit.ProblemsSection is ProblemsSection
+        assert sections.ProblemsSection is ProblemsSection
+        assert validators.common_rules is common_rules
+        assert "ProblemsSection" in dir(ccdakit)
+        for name in ccdakit.__all__:
+            assert getattr(ccdakit, name) is not None
+        for name in sections.__all__:
+            assert getattr(sections, name) is not None
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import ccdakit
+
+        with pytest.raises(AttributeError, match="no attribute 'DoesNotExist'"):
+            ccdakit.DoesNotExist  # noqa: B018
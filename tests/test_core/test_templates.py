@@ -0,0 +1,181 @@
+"""Tests for the compiled template registry."""
+
+import pytest
+from lxml import etree
+
+from ccdakit.builders.sections.problems import ProblemsSection
+from ccdakit.core.base import BuildProfile, CDAElement, CDAVersion, TemplateConfig
+from ccdakit.core.templates import TemplateRegistry, template_registry
+
+
+NS = "urn:hl7-org:v3"
+
+SECTION_ROOT = "2.16.840.1.113883.10.20.22.2.99"
+ACT_ROOT = "2.16.840.1.113883.10.20.22.4.99"
+
+
+class SampleSection(CDAElement):
+    """Section with an entries-required variant and a nested template."""
+
+    TEMPLATES = {
+        CDAVersion.R2_1: [
+            TemplateConfig(root=SECTION_ROOT, description="Sample (entries optional)"),
+            TemplateConfig(
+                root=f"{SECTION_ROOT}.1",
+                extension="2015-08-01",
+                description="Sample (entries required)",
+                entries_required=True,
+            ),
+        ],
+    }
+
+    NESTED_TEMPLATES = {
+        "act": {CDAVersion.R2_1: [TemplateConfig(root=ACT_ROOT, extension="2015-08-01")]},
+    }
+
+    def build(self) -> etree._Element:
+        """Build section with a nested act."""
+        section = etree.Element(f"{{{NS}}}section")
+        self.add_template_ids(section)
+        act = etree.SubElement(section, f"{{{NS}}}act")
+        self.add_template_ids(act, nested="act")
+        return section
+
+
+def template_ids(parent):
+    """Get (root, extension) of each templateId child."""
+    return [(t.get("root"), t.get("extension")) for t in parent.findall(f"{{{NS}}}templateId")]
+
+
+class TestCompiledTemplates:
+    """Tests for templateIds added from compiled tables."""
+
+    def test_registered_at_class_definition(self):
+        """Test subclasses are compiled when defined."""
+        assert template_registry.compiled(SampleSection).source is SampleSection.TEMPLATES
+        assert template_registry.compiled(SampleSection) is template_registry.compiled(
+            SampleSection
+        )
+
+    def test_clones_prototypes(self):
+        """Test each build gets its own templateId elements."""
+        first = SampleSection().to_element()
+        second = SampleSection().to_element()
+
+        assert template_ids(first) == [(SECTION_ROOT, None), (f"{SECTION_ROOT}.1", "2015-08-01")]
+        assert first[0] is not second[0]
+        assert etree.tostring(first) == etree.tostring(second)
+
+    def test_matches_template_config(self):
+        """Test cloned templateIds serialize like TemplateConfig.to_element()."""
+        section = SampleSection().to_element()
+        expected = [t.to_element() for t in SampleSection().get_templates()]
+        assert [etree.tostring(t) for t in section.findall(f"{{{NS}}}templateId")] == [
+            etree.tostring(t) for t in expected
+        ]
+
+    def test_entries_optional_variant(self):
+        """Test entries-required templates are dropped without entries."""
+        section = SampleSection(profile=BuildProfile.NARRATIVE_ONLY).to_element()
+        assert template_ids(section) == [(SECTION_ROOT, None)]
+
+    def test_entries_required_is_explicit(self):
+        """Test only templates flagged entries_required are dropped, whatever their description."""
+
+        class Described(SampleSection):
+            TEMPLATES = {
+                CDAVersion.R2_1: [
+                    TemplateConfig(root="1.2.3"),
+                    TemplateConfig(root="1.2.4", description="Other (entries required)"),
+                ],
+            }
+
+        builder = Described(profile=BuildProfile.NARRATIVE_ONLY)
+        assert template_ids(builder.to_element()) == [("1.2.3", None), ("1.2.4", None)]
+        assert [t.root for t in builder.get_templates()] == ["1.2.3", "1.2.4"]
+
+    def test_nested_templates(self):
+        """Test nested templates are added to inline structures."""
+        section = SampleSection().to_element()
+        assert template_ids(section.find(f"{{{NS}}}act")) == [(ACT_ROOT, "2015-08-01")]
+
+    def test_unsupported_version(self):
+        """Test versions missing from the table raise ValueError."""
+        with pytest.raises(ValueError, match="Version 2.0 not supported for SampleSection"):
+            SampleSection(version=CDAVersion.R2_0).to_element()
+
+        builder = SampleSection(version=CDAVersion.R2_0)
+        with pytest.raises(ValueError, match="SampleSection act"):
+            builder.add_template_ids(etree.Element("act"), nested="act")
+
+    def test_reassigned_table_recompiled(self):
+        """Test assigning a new TEMPLATES table takes effect."""
+
+        class Replaced(SampleSection):
+            pass
+
+        Replaced.TEMPLATES = {CDAVersion.R2_1: [TemplateConfig(root="1.2.3")]}
+        assert template_ids(Replaced().to_element()) == [("1.2.3", None)]
+
+    def test_refresh_after_in_place_change(self):
+        """Test refresh() picks up a table mutated in place."""
+
+        class Mutated(SampleSection):
+            TEMPLATES = {CDAVersion.R2_1: [TemplateConfig(root="1.2.3")]}
+
+        Mutated.TEMPLATES[CDAVersion.R2_1].append(TemplateConfig(root="1.2.4"))
+        template_registry.refresh(Mutated)
+        assert template_ids(Mutated().to_element()) == [("1.2.3", None), ("1.2.4", None)]
+
+    def test_get_templates_override(self):
+        """Test builders overriding get_templates() keep their own templates."""
+
+        class Dynamic(SampleSection):
+            def get_templates(self):
+                return [TemplateConfig(root="9.9.9")]
+
+        assert template_ids(Dynamic().to_element()) == [("9.9.9", None)]
+
+
+class TestTemplateIndex:
+    """Tests for the builder to template OID index."""
+
+    def test_find_nested_template(self):
+        """Test templates written inline are attributed to their builder."""
+        usages = template_registry.find("2.16.840.1.113883.10.20.22.4.3")
+        problems = [u for u in usages if u.builder is ProblemsSection]
+
+        assert {(u.version, u.extension) for u in problems} == {
+            (CDAVersion.R2_1, "2015-08-01"),
+            (CDAVersion.R2_0, "2014-06-09"),
+        }
+        assert {u.nested for u in problems} == {"problem_concern_act"}
+
+    def test_find_filters(self):
+        """Test find() filters by extension and version."""
+        usages = template_registry.find(
+            SECTION_ROOT + ".1", extension="2015-08-01", version=CDAVersion.R2_1
+        )
+        assert [u.builder for u in usages] == [SampleSection]
+        assert template_registry.find(SECTION_ROOT + ".1", extension="2014-06-09") == []
+
+    def test_inherited_tables_not_listed(self):
+        """Test only the class declaring a table is listed for it."""
+
+        class Inherits(SampleSection):
+            pass
+
+        builders = {u.builder for u in template_registry.find(ACT_ROOT)}
+        assert SampleSection in builders
+        assert Inherits not in builders
+
+    def test_index(self):
+        """Test index() groups usages by OID in OID order."""
+        registry = TemplateRegistry()
+        registry.register(SampleSection)
+        index = registry.index()
+
+        assert list(index) == [SECTION_ROOT, f"{SECTION_ROOT}.1", ACT_ROOT]
+        assert index[ACT_ROOT][0].nested == "act"
+        assert index[ACT_ROOT][0].builder_name.endswith("test_templates.SampleSection")
+        assert len(registry) == 1
@@ -3,6 +3,8 @@
 import pytest
 
 from ccdakit.core.validation import (
+    RuleStats,
+    StageTiming,
     ValidationError,
     ValidationIssue,
     ValidationLevel,
@@ -261,3 +263,74 @@ def test_validation_result_str_empty_infos():
     str_repr = str(result)
     assert "PASSED" in str_repr
     assert "Info: 0" in str_repr
+
+
+def test_validation_result_merge():
+    """Test merging results keeps issues and timings in order."""
+    first = ValidationResult(
+        errors=[ValidationIssue(level=ValidationLevel.ERROR, message="a")],
+        timings=[StageTiming(stage="xsd", wall_time=0.5, cpu_time=0.4)],
+    )
+    second = ValidationResult(
+        warnings=[ValidationIssue(level=ValidationLevel.WARNING, message="b")],
+        timings=[StageTiming(stage="schematron", skipped=True)],
+    )
+
+    merged = ValidationResult.merge([first, second])
+
+    assert [e.message for e in merged.errors] == ["a"]
+    assert [w.message for w in merged.warnings] == ["b"]
+    assert [t.stage for t in merged.timings] == ["xsd", "schematron"]
+    assert not merged.skipped
+    assert second.skipped
+
+
+def test_validation_result_to_dict_timings():
+    """Test timings are only serialized when recorded."""
+    assert "timings" not in ValidationResult().to_dict()
+
+    result = ValidationResult(timings=[StageTiming(stage="xsd", wall_time=0.25)])
+    assert result.to_dict()["timings"] == [
+        {"stage": "xsd", "wall_time": 0.25, "cpu_time": 0.0, "skipped": False}
+    ]
+
+
+def test_rule_stats_record_and_merge():
+    """Test rule statistics accumulate calls, failures, issues and times."""
+    stats = RuleStats()
+    stats.record(0.002, 0)
+    stats.record(0.004, 3)
+
+    assert (stats.calls, stats.failures, stats.issues) == (2, 1, 3)
+    assert stats.total_time == pytest.approx(0.006)
+    assert stats.max_time == 0.004
+    assert stats.mean_time == pytest.approx(0.003)
+
+    other = RuleStats(calls=1, failures=1, issues=1, total_time=0.01, max_time=0.01)
+    stats.merge(other)
+    assert (stats.calls, stats.failures, stats.issues) == (3, 2, 4)
+    assert stats.max_time == 0.01
+    assert RuleStats().mean_time == 0.0
+
+
+def test_validation_result_rule_stats():
+    """Test rule statistics are merged and serialized when recorded."""
+    assert "rule_stats" not in ValidationResult().to_dict()
+
+    first = ValidationResult(rule_stats={"a": RuleStats(calls=1, total_time=0.5, max_time=0.5)})
+    second = ValidationResult(rule_stats={"a": RuleStats(calls=1, issues=2, failures=1)})
+    merged = ValidationResult.merge([first, second])
+
+    assert merged.rule_stats["a"].calls == 2
+    section = merged.to_dict()["rule_stats"]
+    assert section == [
+        {
+            "rule": "a",
+            "calls": 2,
+            "failures": 1,
+            "issues": 2,
+            "total_time": 0.5,
+            "max_time": 0.5,
+            "mean_time": 0.25,
+        }
+    ]
@@ -9,7 +9,8 @@ import pytest
 
 from ccdakit.builders.document import ClinicalDocument
 from ccdakit.core.base import CDAVersion
-from ccdakit.utils.converters import DictToCCDAConverter
+from ccdakit.core.validation import ValidationError
+from ccdakit.utils.converters import DictToCCDAConverter, ErrorBudgetError, RecordValidation
 
 
 class TestDictToCCDAConverter:
@@ -856,3 +857,125 @@ class TestDictToCCDAConverter:
         # Verify it's valid XML (handle both single and double quotes)
         assert xml.startswith("<?xml version=") and "encoding=" in xml
         assert "ClinicalDocument" in xml
+
+    def test_record_validation_accepts_valid_document(
+        self,
+        full_patient_data,
+        author_data,
+        custodian_data,
+        problems_data,
+        medications_data,
+        vital_signs_data,
+        results_data,
+    ):
+        """Test valid records pass inline validation unchanged."""
+        data = {
+            "patient": full_patient_data,
+            "author": author_data,
+            "custodian": custodian_data,
+            "sections": [
+                {"type": "problems", "data": problems_data},
+                {"type": "medications", "data": medications_data},
+                {"type": "vital_signs", "data": vital_signs_data},
+                {"type": "results", "data": results_data},
+            ],
+        }
+        validation = RecordValidation()
+        doc = DictToCCDAConverter.from_dict(data, validation=validation)
+
+        assert [len(section.problems) for section in doc.sections[:1]] == [3]
+        assert validation.stats() == {
+            "records_checked": 8,
+            "records_rejected": 0,
+            "documents_rejected": 0,
+        }
+        assert validation.result.is_valid
+
+    def test_record_validation_drops_invalid_records(
+        self, minimal_patient_data, author_data, custodian_data, medications_data
+    ):
+        """Test invalid section records are dropped and reported before building."""
+        bad_status = dict(medications_data[0], status="paused")
+        missing_route = {k: v for k, v in medications_data[1].items() if k != "route"}
+        data = {
+            "patient": minimal_patient_data,
+            "author": author_data,
+            "custodian": custodian_data,
+            "document": {"document_id": "DOC-1"},
+            "sections": [
+                {
+                    "type": "medications",
+                    "data": [bad_status, missing_route, medications_data[1]],
+                }
+            ],
+        }
+        validation = RecordValidation()
+        doc = DictToCCDAConverter.from_dict(data, validation=validation)
+
+        assert len(doc.sections[0].medications) == 1
+        errors = validation.result.errors
+        assert [(e.location, e.code) for e in errors] == [
+            ("DOC-1: medications[0]", "INVALID_VALUE"),
+            ("DOC-1: medications[1]", "MISSING_FIELD"),
+        ]
+        assert validation.records_rejected == 2
+
+    def test_record_validation_rejects_patient(
+        self, minimal_patient_data, author_data, custodian_data
+    ):
+        """Test an invalid patient rejects the document."""
+        data = {
+            "patient": dict(minimal_patient_data, sex="Q"),
+            "author": author_data,
+            "custodian": custodian_data,
+        }
+        validation = RecordValidation()
+        with pytest.raises(ValidationError) as exc_info:
+            DictToCCDAConverter.from_dict(data, validation=validation)
+
+        assert exc_info.value.result.errors[0].location == "patient"
+        assert validation.stats()["documents_rejected"] == 1
+
+        good = dict(data, patient=minimal_patient_data)
+        docs = list(DictToCCDAConverter.from_dicts([data, good, data], validation=validation))
+        assert len(docs) == 1
+        assert validation.stats()["documents_rejected"] == 3
+
+    def test_error_budget_max_errors(self, minimal_patient_data, author_data, custodian_data):
+        """Test the run aborts once rejected records exceed max_errors."""
+        bad = {
+            "patient": dict(minimal_patient_data, sex="Q"),
+            "author": author_data,
+            "custodian": custodian_data,
+        }
+        validation = RecordValidation(max_errors=2)
+        converted = DictToCCDAConverter.from_dicts([bad] * 10, validation=validation)
+
+        with pytest.raises(ErrorBudgetError, match="budget of 2") as exc_info:
+            list(converted)
+        assert validation.records_checked == 3
+        assert len(exc_info.value.result.errors) == 3
+
+    def test_error_budget_rate(self, author_data, custodian_data, minimal_patient_data):
+        """Test the run aborts when the rejection rate over the window spikes."""
+        good = {"name": "Asthma", "code": "195967001", "code_system": "SNOMED", "status": "active"}
+        bad = dict(good, status="unknown")
+        data = {
+            "patient": minimal_patient_data,
+            "author": author_data,
+            "custodian": custodian_data,
+            "sections": [{"type": "problems", "data": [good] * 8 + [bad, bad] + [bad] * 5}],
+        }
+        validation = RecordValidation(max_error_rate=0.2, rate_window=10)
+
+        with pytest.raises(ErrorBudgetError, match="last 10 records"):
+            DictToCCDAConverter.from_dict(data, validation=validation)
+        # Patient + 8 good + 2 bad fill the window at 20%; the third bad one exceeds it
+        assert validation.records_checked == 12
+
+    def test_record_validation_arguments(self):
+        """Test budget arguments are checked."""
+        with pytest.raises(ValueError):
+            RecordValidation(max_error_rate=1.5)
+        with pytest.raises(ValueError):
+            RecordValidation(rate_window=0)
@@ -0,0 +1,170 @@
+"""Tests for the structural document diff engine."""
+
+import pytest
+from lxml import etree
+
+from ccdakit.utils.diff import (
+    DocumentDiff,
+    diff_documents,
+    diff_entries,
+    extract_entries,
+)
+
+
+def _document(entries: str) -> str:
+    """Wrap entry XML in a minimal ClinicalDocument with one Problems section."""
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<ClinicalDocument xmlns="urn:hl7-org:v3" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+    <title>Doc</title>
+    <component><structuredBody><component>
+        <section>
+            <code code="11450-4"/>
+            <title>Problems</title>
+            {entries}
+        </section>
+    </component></structuredBody></component>
+</ClinicalDocument>"""
+
+
+def _problem(id_ext: str, value_code: str, status: str = "completed") -> str:
+    """Build a problem observation entry."""
+    return f"""<entry>
+        <observation classCode="OBS" moodCode="EVN">
+            <templateId root="2.16.840.1.113883.10.20.22.4.4" extension="2015-08-01"/>
+            <id root="1.2.3" extension="{id_ext}"/>
+            <code code="55607006" codeSystem="2.16.840.1.113883.6.96"/>
+            <statusCode code="{status}"/>
+            <value xsi:type="CD" code="{value_code}" codeSystem="2.16.840.1.113883.6.96"/>
+        </observation>
+    </entry>"""
+
+
+class TestExtractEntries:
+    """Tests for entry snapshot extraction."""
+
+    def test_extracts_keys(self):
+        """Test templates, ids, and codes are captured per entry."""
+        root = etree.fromstring(_document(_problem("p1", "38341003")).encode())
+        entries = extract_entries(root)
+
+        assert len(entries) == 1
+        snapshot = entries[0]
+        assert snapshot.section == "11450-4"
+        assert snapshot.templates == (("2.16.840.1.113883.10.20.22.4.4", "2015-08-01"),)
+        assert snapshot.ids == (("1.2.3", "p1"),)
+        assert ("38341003", "2.16.840.1.113883.6.96") in snapshot.codes
+        assert snapshot.fields["entry/observation/value/@xsi:type"] == "CD"
+        assert "code=38341003" in snapshot.label
+
+    def test_signature_ignores_whitespace(self):
+        """Test pretty-printing does not affect entry signatures."""
+        pretty = etree.fromstring(_document(_problem("p1", "38341003")).encode())
+        compact = etree.fromstring(
+            etree.tostring(pretty).replace(b"\n", b"").replace(b"    ", b"")
+        )
+
+        assert extract_entries(pretty)[0].signature == extract_entries(compact)[0].signature
+
+    def test_entry_without_statement(self):
+        """Test empty entries are still extracted."""
+        root = etree.fromstring(_document("<entry/>").encode())
+        entries = extract_entries(root)
+
+        assert len(entries) == 1
+        assert entries[0].label == "entry"
+        assert entries[0].id_key is None
+
+
+class TestDiffDocuments:
+    """Tests for document-level entry alignment."""
+
+    def test_identical_documents(self):
+        """Test identical documents have no differences."""
+        xml = _document(_problem("p1", "38341003") + _problem("p2", "44054006"))
+        result = diff_documents(xml, xml)
+
+        assert isinstance(result, DocumentDiff)
+        assert not result.has_differences
+        assert result.unchanged_count == 2
+
+    def test_added_and_removed(self):
+        """Test entries present in only one document are reported."""
+        doc1 = _document(_problem("p1", "38341003") + _problem("p2", "44054006"))
+        doc2 = _document(_problem("p1", "38341003") + _problem("p3", "195967001"))
+        result = diff_documents(doc1, doc2)
+
+        assert [c.label for c in result.removed] == ["observation id=p2 code=44054006"]
+        assert [c.label for c in result.added] == ["observation id=p3 code=195967001"]
+        assert result.unchanged_count == 1
+
+    def test_changed_attribute_matched_by_id(self):
+        """Test entries with the same id report attribute-level changes."""
+        doc1 = _document(_problem("p1", "38341003", status="active"))
+        doc2 = _document(_problem("p1", "38341003", status="completed"))
+        result = diff_documents(doc1, doc2)
+
+        assert len(result.changed) == 1
+        changes = result.changed[0].changes
+        assert len(changes) == 1
+        assert changes[0].path == "entry/observation/statusCode/@code"
+        assert changes[0].old == "active"
+        assert changes[0].new == "completed"
+
+    def test_matched_by_code_when_ids_differ(self):
+        """Test entries with regenerated ids fall back to code alignment."""
+        doc1 = _document(_problem("old-id", "38341003"))
+        doc2 = _document(_problem("new-id", "38341003"))
+        result = diff_documents(doc1, doc2)
+
+        assert not result.added
+        assert not result.removed
+        assert len(result.changed) == 1
+        assert result.changed[0].changes[0].old == "old-id"
+        assert result.changed[0].changes[0].new == "new-id"
+
+    def test_duplicate_keys_align_in_order(self):
+        """Test repeated identical entries are paired one-to-one."""
+        doc1 = _document(_problem("p1", "38341003") * 2)
+        doc2 = _document(_problem("p1", "38341003") * 3)
+        result = diff_documents(doc1, doc2)
+
+        assert result.unchanged_count == 2
+        assert len(result.added) == 1
+
+    def test_accepts_paths_and_trees(self, tmp_path):
+        """Test path and ElementTree inputs."""
+        path = tmp_path / "doc.xml"
+        path.write_text(_document(_problem("p1", "38341003")))
+
+        result = diff_documents(path, etree.parse(str(path)))
+        assert result.unchanged_count == 1
+
+        result = diff_documents(str(path), path.read_bytes())
+        assert result.unchanged_count == 1
+
+    def test_unsupported_type(self):
+        """Test unsupported inputs raise TypeError."""
+        with pytest.raises(TypeError, match="Unsupported document type"):
+            diff_documents(123, 456)
+
+    def test_to_dict(self):
+        """Test JSON-friendly serialization."""
+        doc1 = _document(_problem("p1", "38341003", status="active"))
+        doc2 = _document(_problem("p1", "38341003"))
+        data = diff_entries(
+            extract_entries(etree.fromstring(doc1.encode())),
+            extract_entries(etree.fromstring(doc2.encode())),
+        ).to_dict()
+
+        assert data["changed_count"] == 1
+        assert data["changed"][0]["changes"][0]["new"] == "completed"
+
+    def test_large_documents(self):
+        """Test thousands of entries align without quadratic behaviour."""
+        entries1 = "".join(_problem(f"p{i}", str(100000 + i)) for i in range(3000))
+        entries2 = "".join(_problem(f"p{i}", str(100000 + i)) for i in range(1, 3001))
+        result = diff_documents(_document(entries1), _document(entries2))
+
+        assert result.unchanged_count == 2999
+        assert len(result.removed) == 1
+        assert len(result.added) == 1
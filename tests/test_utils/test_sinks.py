@@ -0,0 +1,364 @@
+"""Tests for document output sinks."""
+
+import gzip
+import lzma
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from ccdakit.utils.sinks import (
+    ContainerReader,
+    ContainerSink,
+    DirectorySink,
+    DocumentSink,
+    TarSink,
+    ZipSink,
+    compress,
+    compression_of,
+    decompress,
+    open_sink,
+)
+
+
+MTIME = datetime(2024, 1, 15, 9, 0)
+
+
+class StubDocument:
+    """Stand-in for a ClinicalDocument."""
+
+    def __init__(self, document_id, text="Note"):
+        self.document_id = document_id
+        self.text = text
+
+    def to_xml_string(self, pretty=True):
+        separator = "\n  " if pretty else ""
+        return f"<ClinicalDocument>{separator}<title>{self.text}</title></ClinicalDocument>"
+
+
+def documents(count):
+    """(document_id, xml) pairs of varying size."""
+    return [
+        (f"DOC-{i}", f"<ClinicalDocument><text>{'x' * (i * 97 % 5000)}</text></ClinicalDocument>")
+        for i in range(count)
+    ]
+
+
+def fill(sink, items):
+    """Write documents to a sink and close it."""
+    with sink:
+        for document_id, xml in items:
+            sink.write_xml(document_id, xml)
+    return sink
+
+
+class TestCompression:
+    """Tests for compress() and decompress()."""
+
+    @pytest.mark.parametrize("compression", [None, "gzip", "xz"])
+    def test_round_trip(self, compression):
+        """Test decompress() reverses compress()."""
+        data = b"<ClinicalDocument/>" * 100
+
+        assert decompress(compress(data, compression), compression) == data
+
+    def test_gzip_readable_by_gzip_module(self):
+        """Test compressed members are standard gzip and xz data."""
+        assert gzip.decompress(compress(b"abc", "gzip")) == b"abc"
+        assert lzma.decompress(compress(b"abc", "xz")) == b"abc"
+
+    def test_gzip_repeatable(self):
+        """Test equal input compresses to equal bytes."""
+        assert compress(b"abc" * 50, "gzip") == compress(b"abc" * 50, "gzip")
+
+    def test_concatenated_gzip_members(self):
+        """Test decompress() reads every member of a multi-member stream."""
+        data = compress(b"one", "gzip") + compress(b"two", "gzip")
+
+        assert decompress(data, "gzip") == b"onetwo"
+
+    def test_unsupported_compression(self):
+        """Test unknown compressions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression 'bz2'"):
+            compress(b"abc", "bz2")
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("a.xml", None),
+            ("a.xml.gz", "gzip"),
+            ("a.TGZ", "gzip"),
+            ("a.tar.xz", "xz"),
+            ("a.txz", "xz"),
+            ("a.zip", None),
+        ],
+    )
+    def test_compression_of(self, name, expected):
+        """Test compression is taken from the file name."""
+        assert compression_of(name) == expected
+
+
+class TestDocumentSink:
+    """Tests for behavior shared by the sinks."""
+
+    def test_abstract(self):
+        """Test DocumentSink requires _encode() and _emit()."""
+        with pytest.raises(TypeError, match="abstract"):
+            DocumentSink()
+
+    def test_order_kept(self, tmp_path):
+        """Test output follows write order whatever order compression finishes in."""
+        items = documents(60)
+        sink = fill(TarSink(tmp_path / "a.tar.xz", compression="xz", workers=4), items)
+
+        with tarfile.open(tmp_path / "a.tar.xz") as archive:
+            assert archive.getnames() == [f"{document_id}.xml" for document_id, _ in items]
+        assert sink.count == 60
+
+    def test_pending_bounded(self, tmp_path):
+        """Test write() blocks once max_pending documents wait for the pool."""
+        sink = ZipSink(tmp_path / "a.zip", workers=2, max_pending=3)
+        for document_id, xml in documents(20):
+            sink.write_xml(document_id, xml)
+            assert len(sink._pending) <= 3
+        sink.close()
+
+    def test_write_document(self, tmp_path):
+        """Test write() serializes a document under its document_id."""
+        with DirectorySink(tmp_path) as sink:
+            sink.write(StubDocument("DOC-1"))
+            sink.write(StubDocument("DOC-1", text="Copy"), document_id="DOC-2")
+
+        assert (tmp_path / "DOC-1.xml").read_text() == (
+            "<ClinicalDocument><title>Note</title></ClinicalDocument>"
+        )
+        assert "Copy" in (tmp_path / "DOC-2.xml").read_text()
+
+    def test_pretty(self, tmp_path):
+        """Test pretty-printing is a sink option."""
+        with DirectorySink(tmp_path, pretty=True) as sink:
+            sink.write(StubDocument("DOC-1"))
+
+        assert "\n" in (tmp_path / "DOC-1.xml").read_text()
+
+    @pytest.mark.parametrize("document_id", ["", ".", "..", "a/b", "a\\b", "a\tb", "a\nb"])
+    def test_invalid_document_id(self, tmp_path, document_id):
+        """Test ids that cannot name a file are rejected."""
+        with DirectorySink(tmp_path) as sink:
+            with pytest.raises(ValueError, match="Invalid document_id"):
+                sink.write_xml(document_id, "<ClinicalDocument/>")
+
+    def test_write_after_close(self, tmp_path):
+        """Test a closed sink rejects documents and can be closed again."""
+        sink = fill(ContainerSink(tmp_path / "a.jsonl"), documents(1))
+
+        with pytest.raises(ValueError, match="ContainerSink is closed"):
+            sink.write_xml("DOC-9", "<ClinicalDocument/>")
+        sink.close()
+
+    def test_shared_executor_left_running(self, tmp_path):
+        """Test a sink does not shut down an executor it was given."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fill(DirectorySink(tmp_path, executor=executor), documents(3))
+
+            assert executor.submit(lambda: 42).result() == 42
+
+    def test_compression_error_raised(self, tmp_path):
+        """Test errors from the pool surface and the output is still closed."""
+        sink = ZipSink(tmp_path / "a.zip")
+        sink._encode = lambda document_id, data: 1 / 0
+
+        with pytest.raises(ZeroDivisionError):
+            fill(sink, documents(3))
+        assert sink.closed
+        assert sink._file.closed
+
+    def test_repr(self, tmp_path):
+        """Test string representation."""
+        sink = fill(ZipSink(tmp_path / "a.zip"), documents(2))
+
+        assert repr(sink) == f"<ZipSink: {tmp_path / 'a.zip'}, 2 documents>"
+
+
+class TestDirectorySink:
+    """Tests for DirectorySink."""
+
+    @pytest.mark.parametrize(
+        "compression, suffix, read",
+        [
+            (None, ".xml", bytes),
+            ("gzip", ".xml.gz", gzip.decompress),
+            ("xz", ".xml.xz", lzma.decompress),
+        ],
+    )
+    def test_one_file_per_document(self, tmp_path, compression, suffix, read):
+        """Test each document becomes its own (compressed) file."""
+        items = documents(5)
+        fill(DirectorySink(tmp_path / "out", compression=compression), items)
+
+        for document_id, xml in items:
+            assert read((tmp_path / "out" / f"{document_id}{suffix}").read_bytes()) == xml.encode()
+
+
+class TestTarSink:
+    """Tests for TarSink."""
+
+    @pytest.mark.parametrize("compression", [None, "gzip", "xz"])
+    def test_archive_readable(self, tmp_path, compression):
+        """Test tarfile reads back every member."""
+        items = documents(10)
+        fill(TarSink(tmp_path / "a.tar", compression=compression, mtime=MTIME), items)
+
+        with tarfile.open(tmp_path / "a.tar") as archive:
+            for document_id, xml in items:
+                member = archive.getmember(f"{document_id}.xml")
+                assert member.mtime == MTIME.timestamp()
+                assert archive.extractfile(member).read() == xml.encode()
+
+    def test_padded_to_record(self, tmp_path):
+        """Test an uncompressed archive ends on a tar record boundary."""
+        fill(TarSink(tmp_path / "a.tar"), documents(3))
+
+        assert (tmp_path / "a.tar").stat().st_size % tarfile.RECORDSIZE == 0
+
+    def test_empty_archive(self, tmp_path):
+        """Test a sink without documents writes a valid empty archive."""
+        fill(TarSink(tmp_path / "a.tar.gz", compression="gzip"), [])
+
+        with tarfile.open(tmp_path / "a.tar.gz") as archive:
+            assert archive.getnames() == []
+
+    def test_long_and_unicode_names(self, tmp_path):
+        """Test names beyond the ustar limits are kept."""
+        document_id = "Dokument-" + "ü" * 120
+        fill(TarSink(tmp_path / "a.tar"), [(document_id, "<ClinicalDocument/>")])
+
+        with tarfile.open(tmp_path / "a.tar") as archive:
+            assert archive.getnames() == [f"{document_id}.xml"]
+
+
+class TestZipSink:
+    """Tests for ZipSink."""
+
+    def test_archive_readable(self, tmp_path):
+        """Test zipfile reads back every deflated entry in order."""
+        items = documents(10)
+        fill(ZipSink(tmp_path / "a.zip", mtime=MTIME), items)
+
+        with zipfile.ZipFile(tmp_path / "a.zip") as archive:
+            assert archive.testzip() is None
+            infos = archive.infolist()
+            assert [info.filename for info in infos] == [f"{i}.xml" for i, _ in items]
+            assert {info.compress_type for info in infos} == {zipfile.ZIP_DEFLATED}
+            assert infos[0].date_time == (2024, 1, 15, 9, 0, 0)
+            for document_id, xml in items:
+                assert archive.read(f"{document_id}.xml") == xml.encode()
+
+    def test_empty_archive(self, tmp_path):
+        """Test a sink without documents writes a valid empty archive."""
+        fill(ZipSink(tmp_path / "a.zip"), [])
+
+        with zipfile.ZipFile(tmp_path / "a.zip") as archive:
+            assert archive.namelist() == []
+
+    def test_unicode_names(self, tmp_path):
+        """Test entry names are stored as UTF-8."""
+        fill(ZipSink(tmp_path / "a.zip"), [("Dokument-ü", "<ClinicalDocument/>")])
+
+        with zipfile.ZipFile(tmp_path / "a.zip") as archive:
+            assert archive.namelist() == ["Dokument-ü.xml"]
+
+
+class TestContainer:
+    """Tests for ContainerSink and ContainerReader."""
+
+    @pytest.mark.parametrize("name", ["a.jsonl", "a.jsonl.gz", "a.jsonl.xz"])
+    def test_random_access(self, tmp_path, name):
+        """Test documents are read back by id through the index."""
+        items = documents(30)
+        fill(ContainerSink(tmp_path / name, compression=compression_of(name)), items)
+
+        with ContainerReader(tmp_path / name) as reader:
+            assert len(reader) == 30
+            assert reader.keys() == [document_id for document_id, _ in items]
+            assert "DOC-17" in reader
+            assert reader.read("DOC-17") == items[17][1]
+            assert reader.read("DOC-3") == items[3][1]
+
+    def test_index_offsets(self, tmp_path):
+        """Test index lines give each record's offset and length."""
+        fill(ContainerSink(tmp_path / "a.jsonl"), documents(3))
+
+        data = (tmp_path / "a.jsonl").read_bytes()
+        for line in (tmp_path / "a.jsonl.idx").read_text().splitlines():
+            document_id, offset, length = line.split("\t")
+            record = data[int(offset) : int(offset) + int(length)]
+            assert record.startswith(b'{"document_id": "%s"' % document_id.encode())
+            assert record.endswith(b"\n")
+
+    def test_compressed_container_is_one_stream(self, tmp_path):
+        """Test a compressed container reads as JSON lines with gzip."""
+        fill(ContainerSink(tmp_path / "a.jsonl.gz", compression="gzip"), documents(4))
+
+        with gzip.open(tmp_path / "a.jsonl.gz", "rt") as lines:
+            assert len(list(lines)) == 4
+
+    def test_newlines_escaped(self, tmp_path):
+        """Test pretty-printed XML stays on one line."""
+        with ContainerSink(tmp_path / "a.jsonl", pretty=True) as sink:
+            sink.write(StubDocument("DOC-1"))
+
+        assert (tmp_path / "a.jsonl").read_bytes().count(b"\n") == 1
+        with ContainerReader(tmp_path / "a.jsonl") as reader:
+            assert "\n  <title>" in reader.read("DOC-1")
+
+    def test_custom_index_path(self, tmp_path):
+        """Test the index may live elsewhere."""
+        index = tmp_path / "index.tsv"
+        fill(ContainerSink(tmp_path / "a.jsonl", index_path=index), documents(2))
+
+        assert ContainerReader(tmp_path / "a.jsonl", index_path=index).keys() == [
+            "DOC-0",
+            "DOC-1",
+        ]
+
+    def test_unknown_document(self, tmp_path):
+        """Test reading a missing id raises KeyError."""
+        fill(ContainerSink(tmp_path / "a.jsonl"), documents(1))
+
+        with pytest.raises(KeyError):
+            ContainerReader(tmp_path / "a.jsonl").read("DOC-9")
+
+
+class TestOpenSink:
+    """Tests for open_sink()."""
+
+    @pytest.mark.parametrize(
+        "name, sink_class, compression",
+        [
+            ("a.zip", ZipSink, None),
+            ("a.tar", TarSink, None),
+            ("a.tar.gz", TarSink, "gzip"),
+            ("a.tgz", TarSink, "gzip"),
+            ("a.tar.xz", TarSink, "xz"),
+            ("a.jsonl", ContainerSink, None),
+            ("a.jsonl.gz", ContainerSink, "gzip"),
+        ],
+    )
+    def test_sink_from_name(self, tmp_path, name, sink_class, compression):
+        """Test archives and containers are chosen by file name."""
+        sink = open_sink(tmp_path / name)
+        sink.close()
+
+        assert type(sink) is sink_class
+        assert getattr(sink, "compression", None) == compression
+
+    def test_directory(self, tmp_path):
+        """Test other names are directories with per-file compression."""
+        with open_sink(tmp_path / "out", compression="xz") as sink:
+            sink.write_xml("DOC-1", "<ClinicalDocument/>")
+
+        assert isinstance(sink, DirectorySink)
+        assert (tmp_path / "out" / "DOC-1.xml.xz").exists()
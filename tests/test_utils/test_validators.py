@@ -2,6 +2,8 @@
 
 from datetime import date, datetime
 
+import pytest
+
 from ccdakit.utils.validators import DataValidator
 
 
@@ -1585,3 +1587,357 @@ class TestHelperMethodsEdgeCases:
         """Test validate_date_range with same datetime (should be valid)."""
         dt = datetime(2020, 1, 1, 10, 0)
         assert DataValidator.validate_date_range(dt, dt)
+
+
+class TestBatchValidation:
+    """Tests for the columnar *_batch validators."""
+
+    PROBLEMS = [
+        {"name": "Hypertension", "code": "38341003", "code_system": "SNOMED", "status": "active"},
+        {"name": "Asthma", "code": "195967001", "code_system": "SNOMED", "status": "unknown"},
+        {"name": "Diabetes", "code": None, "code_system": "SNOMED", "status": "active"},
+        {
+            "name": "Flu",
+            "code": "6142004",
+            "code_system": "SNOMED",
+            "status": "resolved",
+            "onset_date": date(2020, 5, 1),
+            "resolved_date": date(2020, 1, 1),
+        },
+        {"name": "Cough", "code": "bad", "code_system": "LOINC", "status": "resolved"},
+        {"name": "Rash", "code": "271807003", "code_system": "MADE-UP", "status": "active"},
+        {
+            "name": "Sprain",
+            "code": "44465007",
+            "code_system": "SNOMED",
+            "status": "active",
+            "onset_date": "2020-01-01",
+        },
+    ]
+
+    MEDICATIONS = [
+        {
+            "name": "Lisinopril",
+            "code": "314076",
+            "dosage": "10 mg",
+            "route": "oral",
+            "frequency": "daily",
+            "start_date": date(2020, 1, 1),
+            "status": "active",
+        },
+        {
+            "name": "Metformin",
+            "code": "ABC",
+            "dosage": "500 mg",
+            "route": "oral",
+            "frequency": "twice daily",
+            "start_date": date(2020, 1, 1),
+            "end_date": date(2019, 1, 1),
+            "status": "completed",
+        },
+        {
+            "name": "Aspirin",
+            "code": "1191",
+            "dosage": "81 mg",
+            "route": "oral",
+            "frequency": "",
+            "start_date": date(2020, 1, 1),
+            "status": "discontinued",
+        },
+        {
+            "name": "Insulin",
+            "code": "5856",
+            "dosage": "10 units",
+            "route": "subcutaneous",
+            "frequency": "daily",
+            "start_date": date(2020, 1, 1),
+            "status": "paused",
+        },
+    ]
+
+    RESULTS = [
+        {
+            "panel_name": "CBC",
+            "panel_code": "58410-2",
+            "status": "completed",
+            "effective_time": date(2023, 1, 1),
+            "results": [
+                {
+                    "test_name": "WBC",
+                    "test_code": "6690-2",
+                    "value": "7.5",
+                    "status": "final",
+                    "effective_time": date(2023, 1, 1),
+                    "reference_range_low": "4.0",
+                    "reference_range_high": "11.0",
+                    "reference_range_unit": "10*3/uL",
+                },
+            ],
+        },
+        {
+            "panel_name": "BMP",
+            "panel_code": "51990-0",
+            "status": "completed",
+            "effective_time": date(2023, 1, 1),
+            "results": [
+                {
+                    "test_name": "Sodium",
+                    "test_code": "2951-2",
+                    "value": "140",
+                    "status": "pending",
+                    "effective_time": date(2023, 1, 1),
+                    "reference_range_low": "145",
+                    "reference_range_high": "135",
+                },
+                {"test_name": "Potassium", "test_code": "2823-3", "value": "4.0"},
+            ],
+        },
+        {
+            "panel_name": "Empty",
+            "panel_code": "24323-8",
+            "status": "completed",
+            "effective_time": date(2023, 1, 1),
+            "results": [],
+        },
+        {
+            "panel_name": "Broken",
+            "panel_code": "bad",
+            "status": "completed",
+            "effective_time": "2023-01-01",
+            "results": "not a list",
+        },
+    ]
+
+    VITAL_SIGNS = [
+        {
+            "date": datetime(2023, 1, 1, 9, 0),
+            "vital_signs": [
+                {"type": "Heart Rate", "code": "8867-4", "value": "72", "unit": "/min"},
+                {"type": "Heart Rate", "code": "8867-4", "value": "300", "unit": "/min"},
+            ],
+        },
+        {"date": datetime(2023, 1, 1), "vital_signs": [{"type": "Weight", "code": "29463-7"}]},
+        {"date": "2023-01-01", "vital_signs": []},
+        {
+            "date": date(2023, 1, 1),
+            "vital_signs": [{"type": "SpO2", "code": "59408-5", "value": "40", "unit": "%"}],
+        },
+    ]
+
+    PATIENTS = [
+        {"first_name": "John", "last_name": "Doe", "date_of_birth": date(1980, 1, 1), "sex": "M"},
+        {"first_name": "Jane", "last_name": "Doe", "date_of_birth": date(1850, 1, 1), "sex": "X"},
+        {
+            "first_name": "Ann",
+            "last_name": "Lee",
+            "date_of_birth": date(1990, 1, 1),
+            "sex": "F",
+            "addresses": [{"city": "Boston", "state": "MA"}],
+            "telecoms": [{"type": "pager", "value": "555"}],
+        },
+        {"first_name": "Bob", "date_of_birth": date(1990, 1, 1), "sex": "M"},
+    ]
+
+    OTHER = [
+        (
+            DataValidator.validate_allergy_data,
+            DataValidator.validate_allergy_batch,
+            [
+                {"allergen": "Penicillin", "allergy_type": "allergy", "status": "active"},
+                {
+                    "allergen": "Peanuts",
+                    "allergy_type": "food",
+                    "status": "active",
+                    "severity": "extreme",
+                    "allergen_code": "256349002",
+                },
+                {
+                    "allergen": "Latex",
+                    "allergy_type": "allergy",
+                    "status": "active",
+                    "allergen_code": "111088007",
+                    "allergen_code_system": "NOPE",
+                    "onset_date": date(2099, 1, 1),
+                },
+            ],
+        ),
+        (
+            DataValidator.validate_immunization_data,
+            DataValidator.validate_immunization_batch,
+            [
+                {
+                    "vaccine_name": "Flu",
+                    "cvx_code": "88",
+                    "administration_date": date(2023, 1, 1),
+                    "status": "completed",
+                },
+                {
+                    "vaccine_name": "Flu",
+                    "cvx_code": "ABC",
+                    "administration_date": datetime(2099, 1, 1),
+                    "status": "given",
+                },
+                {"vaccine_name": "Flu", "cvx_code": "88", "status": "completed"},
+            ],
+        ),
+        (
+            DataValidator.validate_procedure_data,
+            DataValidator.validate_procedure_batch,
+            [
+                {
+                    "name": "Biopsy",
+                    "code": "86273004",
+                    "code_system": "SNOMED",
+                    "status": "completed",
+                },
+                {
+                    "name": "Scan",
+                    "code": "1",
+                    "code_system": "UNKNOWN",
+                    "status": "planned",
+                    "date": "2023-01-01",
+                    "target_site_code": "123",
+                },
+            ],
+        ),
+        (
+            DataValidator.validate_encounter_data,
+            DataValidator.validate_encounter_batch,
+            [
+                {"encounter_type": "Office", "code": "99213", "code_system": "CPT-4"},
+                {
+                    "encounter_type": "ER",
+                    "code": "99285",
+                    "code_system": "CPT-4",
+                    "date": datetime(2023, 2, 1),
+                    "end_date": datetime(2023, 1, 1),
+                },
+                {"encounter_type": "Visit", "code_system": "CPT-4"},
+            ],
+        ),
+        (
+            DataValidator.validate_smoking_status_data,
+            DataValidator.validate_smoking_status_batch,
+            [
+                {"smoking_status": "Never", "code": "266919005", "date": date(2023, 1, 1)},
+                {"smoking_status": "Never", "code": "X", "date": date(2099, 1, 1)},
+            ],
+        ),
+    ]
+
+    @staticmethod
+    def assert_matches(single, batch_result, records):
+        """Assert batch results flag the same rows as the single-record validator."""
+        results = [single(record) for record in records]
+        assert batch_result.size == len(records)
+        assert batch_result.error_rows == [i for i, r in enumerate(results) if not r.is_valid]
+        assert batch_result.warning_rows == [i for i, r in enumerate(results) if r.has_warnings]
+
+    def test_matches_single_record_validators(self):
+        """Test each batch validator flags the rows its single-record counterpart rejects."""
+        cases = [
+            (
+                DataValidator.validate_problem_data,
+                DataValidator.validate_problem_batch,
+                self.PROBLEMS,
+            ),
+            (
+                DataValidator.validate_medication_data,
+                DataValidator.validate_medication_batch,
+                self.MEDICATIONS,
+            ),
+            (DataValidator.validate_result_data, DataValidator.validate_result_batch, self.RESULTS),
+            (
+                DataValidator.validate_vital_signs_data,
+                DataValidator.validate_vital_signs_batch,
+                self.VITAL_SIGNS,
+            ),
+            (
+                DataValidator.validate_patient_data,
+                DataValidator.validate_patient_batch,
+                self.PATIENTS,
+            ),
+            *self.OTHER,
+        ]
+        for single, batch, records in cases:
+            self.assert_matches(single, batch(records), records)
+
+    def test_single_record_shares_batch_predicates(self):
+        """Test single-record validators accept datetimes and report mistyped ranges."""
+        patient = dict(self.PATIENTS[0], date_of_birth=datetime(1980, 1, 1, 8, 0))
+        assert DataValidator.validate_patient_data(patient).is_valid
+
+        result = DataValidator.validate_problem_data(
+            dict(self.PROBLEMS[6], status="resolved", resolved_date=date(2020, 2, 1))
+        )
+        assert [e.message for e in result.errors] == ["onset_date must be a date object"]
+
+    def test_single_record_nested_messages(self):
+        """Test nested issues are labelled with their item and ordered item by item."""
+        organizer = dict(self.VITAL_SIGNS[1])
+        organizer["vital_signs"] = organizer["vital_signs"] * 2
+        result = DataValidator.validate_vital_signs_data(organizer)
+
+        assert [e.message for e in result.errors] == [
+            "Vital sign 0: Missing required field: value",
+            "Vital sign 0: Missing required field: unit",
+            "Vital sign 1: Missing required field: value",
+            "Vital sign 1: Missing required field: unit",
+        ]
+
+    def test_issue_keys(self):
+        """Test issues are keyed by code and field with the failing rows."""
+        result = DataValidator.validate_problem_batch(self.PROBLEMS)
+
+        assert result.errors["INVALID_VALUE:status"] == [1]
+        assert result.errors["MISSING_FIELD:code"] == [2]
+        assert result.errors["INVALID_DATE_RANGE:resolved_date"] == [3]
+        assert result.warnings["INVALID_CODE_FORMAT:code"] == [4, 5]
+        assert result.warnings["UNKNOWN_CODE_SYSTEM:code_system"] == [5]
+        assert result.row_errors(6) == ["INVALID_TYPE:onset_date"]
+        assert result.valid_rows() == [0, 4, 5]
+
+    def test_nested_issues_reported_on_parent_row(self):
+        """Test issues of nested items are keyed with a dotted field on the parent row."""
+        result = DataValidator.validate_result_batch(self.RESULTS)
+
+        assert result.errors["INVALID_VALUE:results.status"] == [1]
+        assert result.errors["INVALID_RANGE:results.reference_range_low"] == [1]
+        assert result.errors["MISSING_FIELD:results.status"] == [1]
+        assert result.errors["INVALID_TYPE:results"] == [3]
+        assert result.warnings["EMPTY_LIST:results"] == [2]
+
+    def test_columnar_input(self):
+        """Test a dict of columns validates like the equivalent list of records."""
+        columns = {
+            name: [record.get(name) for record in self.MEDICATIONS]
+            for name in {name for record in self.MEDICATIONS for name in record}
+        }
+        assert DataValidator.validate_medication_batch(columns) == (
+            DataValidator.validate_medication_batch(self.MEDICATIONS)
+        )
+
+    def test_columns_must_have_same_length(self):
+        """Test ragged columns are rejected."""
+        with pytest.raises(ValueError, match="different lengths"):
+            DataValidator.validate_problem_batch({"name": ["a", "b"], "code": ["1"]})
+
+    def test_empty_batch(self):
+        """Test an empty batch is valid."""
+        result = DataValidator.validate_medication_batch([])
+        assert result.is_valid
+        assert result.to_dict()["error_count"] == 0
+
+    def test_code_format_checked_once_per_value(self, monkeypatch):
+        """Test repeated codes are only checked against the registry once."""
+        calls = []
+        original = DataValidator.validate_code
+
+        def counting(code, system):
+            calls.append(code)
+            return original(code, system)
+
+        monkeypatch.setattr(DataValidator, "validate_code", staticmethod(counting))
+        DataValidator.validate_medication_batch(self.MEDICATIONS[:1] * 1000)
+
+        assert calls == ["314076"]
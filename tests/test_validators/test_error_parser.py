@@ -1,5 +1,7 @@
 """Tests for Schematron error parser."""
 
+import pytest
+
 from ccdakit.validators.error_parser import ParsedError, SchematronErrorParser
 
 
@@ -268,3 +270,54 @@ class TestSchematronErrorParser:
         assert result["conf_number"] == "1098-123"
         assert result["severity"] == "error"
         assert len(result["suggestions"]) == 2
+
+
+class TestSchematronErrorParserCache:
+    """Test suite for the per-assertion cache."""
+
+    ASSERTION = (
+        'SHALL contain exactly one [1..1] templateId with @root="2.16.840.1.113883.10.20.22.4.7" '
+        "(CONF:1098-8583)"
+    )
+
+    def test_assertion_shared_across_locations(self):
+        """Test the same assertion at different nodes is enriched once."""
+        SchematronErrorParser.clear_cache()
+        first = SchematronErrorParser.parse_error(
+            f"ERROR at /*[local-name()='ClinicalDocument']/*[local-name()='entry'][1]: "
+            f"{self.ASSERTION}"
+        )
+        second = SchematronErrorParser.parse_error(
+            f"ERROR at /*[local-name()='ClinicalDocument']/*[local-name()='entry'][2]: "
+            f"{self.ASSERTION}"
+        )
+
+        info = SchematronErrorParser.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert first.simplified_path == "ClinicalDocument > entry[1]"
+        assert second.simplified_path == "ClinicalDocument > entry[2]"
+        assert first.requirement == second.requirement
+        assert first.conf_number == second.conf_number == "1098-8583"
+        assert first.template_name == "Allergy Observation"
+
+    def test_severity_not_shared(self):
+        """Test errors and warnings with the same text are cached separately."""
+        error = SchematronErrorParser.parse_error(f"ERROR at /a[1]: {self.ASSERTION}")
+        warning = SchematronErrorParser.parse_error(f"WARNING at /a[1]: {self.ASSERTION}")
+        assert error.severity == "error"
+        assert warning.severity == "warning"
+
+    def test_suggestions_are_independent(self):
+        """Test callers can modify suggestions without affecting the cache."""
+        message = f"ERROR at /a[1]: {self.ASSERTION}"
+        first = SchematronErrorParser.parse_error(message)
+        first.suggestions.append("extra")
+        assert "extra" not in SchematronErrorParser.parse_error(message).suggestions
+
+    def test_template_info_is_frozen(self):
+        """Test the template index cannot be modified."""
+        with pytest.raises(TypeError):
+            SchematronErrorParser.TEMPLATE_INFO["1.2.3"] = {"name": "X"}
+        info = SchematronErrorParser.TEMPLATE_INFO["2.16.840.1.113883.10.20.22.4.7"]
+        with pytest.raises(TypeError):
+            info["name"] = "Changed"
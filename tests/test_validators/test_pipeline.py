@@ -0,0 +1,178 @@
+"""Tests for the staged validation pipeline."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from ccdakit.core.validation import ValidationIssue, ValidationLevel, ValidationResult
+from ccdakit.validators.pipeline import PARSE_STAGE, ValidationPipeline
+from ccdakit.validators.rules import RequiredSectionsRule, RulesEngine
+
+
+XML = '<ClinicalDocument xmlns="urn:hl7-org:v3"><title>Test</title></ClinicalDocument>'
+
+
+class RecordingValidator:
+    """Validator that records the elements it receives."""
+
+    def __init__(self, errors=0, barrier=None):
+        self.errors = errors
+        self.barrier = barrier
+        self.seen = []
+
+    def validate(self, document):
+        self.seen.append(document)
+        if self.barrier is not None:
+            # Only returns when every stage runs at the same time
+            self.barrier.wait(timeout=5)
+        result = ValidationResult()
+        for i in range(self.errors):
+            result.errors.append(
+                ValidationIssue(level=ValidationLevel.ERROR, message=f"Error {i}", code="TEST")
+            )
+        return result
+
+
+class TestValidationPipeline:
+    """Tests for ValidationPipeline."""
+
+    def test_parses_once(self):
+        """Test every stage receives the same parsed element."""
+        first, second = RecordingValidator(), RecordingValidator()
+        pipeline = ValidationPipeline().add_stage("first", first).add_stage("second", second)
+
+        result = pipeline.validate(XML)
+
+        assert result.is_valid
+        assert isinstance(first.seen[0], etree._Element)
+        assert first.seen[0] is second.seen[0]
+
+    def test_accepts_path(self, tmp_path):
+        """Test documents can be given as a file path."""
+        xml_file = tmp_path / "doc.xml"
+        xml_file.write_text(XML)
+        validator = RecordingValidator()
+
+        ValidationPipeline().add_stage("stage", validator).validate(xml_file)
+
+        assert etree.QName(validator.seen[0]).localname == "ClinicalDocument"
+
+    def test_merges_results(self):
+        """Test issues from all stages are merged in stage order."""
+        pipeline = ValidationPipeline()
+        pipeline.add_stage("a", RecordingValidator(errors=1))
+        pipeline.add_stage("b", RecordingValidator(errors=2))
+
+        result = pipeline.validate(XML)
+
+        assert len(result.errors) == 3
+        assert [t.stage for t in result.timings] == [PARSE_STAGE, "a", "b"]
+
+    def test_timings(self):
+        """Test each stage records wall and CPU time."""
+        result = ValidationPipeline().add_stage("a", RecordingValidator()).validate(XML)
+
+        for timing in result.timings:
+            assert timing.wall_time >= 0
+            assert timing.cpu_time >= 0
+            assert not timing.skipped
+        assert result.to_dict()["timings"][1]["stage"] == "a"
+
+    def test_callable_stage(self):
+        """Test plain callables can be used as stages."""
+        pipeline = ValidationPipeline().add_stage("fn", lambda element: ValidationResult())
+        assert pipeline.run_stages(XML)["fn"].is_valid
+
+    def test_rules_engine_stage(self):
+        """Test RulesEngine works as a stage."""
+        engine = RulesEngine()
+        engine.add_rule(RequiredSectionsRule(required_sections=["11450-4"]))
+
+        result = ValidationPipeline().add_stage("rules", engine).validate(XML)
+
+        assert not result.is_valid
+
+    def test_fail_fast_skips_after_failed_gate(self):
+        """Test fail_fast skips stages after a failing gate."""
+        later = RecordingValidator()
+        pipeline = ValidationPipeline(fail_fast=True)
+        pipeline.add_stage("xsd", RecordingValidator(errors=1), gate=True)
+        pipeline.add_stage("schematron", later)
+
+        results = pipeline.run_stages(XML)
+
+        assert later.seen == []
+        assert results["schematron"].skipped
+        assert results["schematron"].is_valid
+        assert not results["xsd"].skipped
+
+    def test_gate_ignored_without_fail_fast(self):
+        """Test gates do not stop the run unless fail_fast is set."""
+        later = RecordingValidator()
+        pipeline = ValidationPipeline()
+        pipeline.add_stage("xsd", RecordingValidator(errors=1), gate=True)
+        pipeline.add_stage("schematron", later)
+
+        pipeline.run_stages(XML)
+
+        assert len(later.seen) == 1
+
+    def test_fail_fast_continues_after_passing_gate(self):
+        """Test stages after a passing gate still run."""
+        later = RecordingValidator()
+        pipeline = ValidationPipeline(fail_fast=True)
+        pipeline.add_stage("xsd", RecordingValidator(), gate=True)
+        pipeline.add_stage("schematron", later)
+
+        pipeline.run_stages(XML)
+
+        assert len(later.seen) == 1
+
+    def test_parse_error(self):
+        """Test malformed XML is reported once and all stages are skipped."""
+        validator = RecordingValidator()
+        results = ValidationPipeline().add_stage("xsd", validator).run_stages("<broken>")
+
+        assert results[PARSE_STAGE].errors[0].code == "XML_SYNTAX_ERROR"
+        assert results["xsd"].skipped
+        assert validator.seen == []
+
+    def test_missing_file(self):
+        """Test a missing file is reported as a parse error."""
+        results = ValidationPipeline().run_stages(Path("/nonexistent/file.xml"))
+        assert results[PARSE_STAGE].errors[0].code == "FILE_NOT_FOUND"
+
+    def test_concurrent(self):
+        """Test concurrent stages run at the same time."""
+        barrier = threading.Barrier(2)
+        pipeline = ValidationPipeline(concurrent=True)
+        pipeline.add_stage("a", RecordingValidator(barrier=barrier))
+        pipeline.add_stage("b", RecordingValidator(errors=1, barrier=barrier))
+
+        results = pipeline.run_stages(XML)
+
+        assert list(results) == [PARSE_STAGE, "a", "b"]
+        assert len(results["b"].errors) == 1
+
+    def test_stage_exception_propagates(self):
+        """Test validator exceptions are not swallowed."""
+
+        def broken(element):
+            raise RuntimeError("boom")
+
+        for concurrent in (False, True):
+            pipeline = ValidationPipeline(concurrent=concurrent)
+            pipeline.add_stage("a", RecordingValidator()).add_stage("broken", broken)
+            with pytest.raises(RuntimeError, match="boom"):
+                pipeline.validate(XML)
+
+    def test_duplicate_stage_name(self):
+        """Test stage names must be unique and not reserved."""
+        pipeline = ValidationPipeline().add_stage("a", RecordingValidator())
+        with pytest.raises(ValueError, match="Duplicate or reserved"):
+            pipeline.add_stage("a", RecordingValidator())
+        with pytest.raises(ValueError, match="Duplicate or reserved"):
+            pipeline.add_stage(PARSE_STAGE, RecordingValidator())
+        assert len(pipeline) == 1
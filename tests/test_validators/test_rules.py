@@ -1,5 +1,6 @@
 """Tests for custom validation rules engine."""
 
+import time
 from pathlib import Path
 
 import pytest
@@ -905,3 +906,188 @@ class TestFunctionBasedRule:
 
         with pytest.raises(TypeError, match="must return None, ValidationIssue"):
             rule.validate(doc)
+
+
+def _has_title(document):
+    """Module-level predicate, so the rule can be pickled."""
+    return bool(document.xpath("//cda:title", namespaces={"cda": "urn:hl7-org:v3"}))
+
+
+class TestValidateMany:
+    """Test suite for RulesEngine.validate_many."""
+
+    VALID = (
+        b'<ClinicalDocument xmlns="urn:hl7-org:v3"><title>T</title><section/></ClinicalDocument>'
+    )
+    INVALID = b'<ClinicalDocument xmlns="urn:hl7-org:v3"/>'
+
+    @pytest.fixture
+    def engine(self):
+        """Create engine with picklable rules."""
+        engine = RulesEngine()
+        engine.add_rule(RuleBuilder.create("has_title", "Title present", _has_title))
+        engine.add_rule(RuleBuilder.xpath_count("sections", "//cda:section", min_count=1))
+        engine.add_rule(RequiredSectionsRule(required_sections=["11450-4"]))
+        return engine
+
+    def test_in_process(self, engine, tmp_path):
+        """Test documents of every input type are validated in order."""
+        path = tmp_path / "doc.xml"
+        path.write_bytes(self.VALID)
+
+        results = list(
+            engine.validate_many(
+                [
+                    path,
+                    str(path),
+                    self.INVALID,
+                    etree.fromstring(self.VALID),
+                    ("custom", self.VALID),
+                ]
+            )
+        )
+
+        assert [doc_id for doc_id, _ in results] == [str(path), str(path), "2", "3", "custom"]
+        assert [len(result.errors) for _, result in results] == [1, 1, 2, 1, 1]
+
+    def test_rule_stats(self, engine):
+        """Test per-rule statistics are aggregated over the batch."""
+        list(engine.validate_many([self.VALID, self.INVALID, self.INVALID]))
+
+        stats = engine.stats()
+        assert stats["has_title"].calls == 3
+        assert stats["has_title"].failures == 2
+        assert stats["sections"].failures == 2
+        assert stats["required_sections"].failures == 3
+        assert all(s.total_time >= 0 for s in stats.values())
+        assert stats["has_title"].to_dict()["calls"] == 3
+
+        engine.reset_stats()
+        assert engine.stats() == {}
+
+    def test_parse_errors_do_not_stop_batch(self, engine, tmp_path):
+        """Test malformed and missing documents are reported per document."""
+        results = dict(engine.validate_many([b"<broken>", tmp_path / "missing.xml", self.VALID]))
+
+        assert results["0"].errors[0].code == "XML_SYNTAX_ERROR"
+        assert results[str(tmp_path / "missing.xml")].errors[0].code == "FILE_NOT_FOUND"
+        assert len(results["2"].errors) == 1
+
+    def test_workers(self, engine, tmp_path):
+        """Test a process pool gives the same results as in-process validation."""
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"doc{i}.xml"
+            path.write_bytes(self.VALID if i % 2 else self.INVALID)
+            paths.append(path)
+        documents = [*paths, etree.fromstring(self.VALID)]
+
+        expected = [
+            (doc_id, [i.code for i in result.all_issues])
+            for doc_id, result in engine.validate_many(documents)
+        ]
+        engine.reset_stats()
+        parallel = [
+            (doc_id, [i.code for i in result.all_issues])
+            for doc_id, result in engine.validate_many(documents, workers=2, max_pending=2)
+        ]
+
+        assert parallel == expected
+        assert engine.stats()["has_title"].calls == 7
+        assert engine.stats()["has_title"].failures == 3
+
+    def test_unpicklable_rules(self, engine):
+        """Test rules that cannot be pickled are rejected for worker processes."""
+        engine.add_rule(RuleBuilder.create("lambda", "Lambda rule", lambda doc: True))
+        with pytest.raises(TypeError, match="worker processes"):
+            list(engine.validate_many([self.VALID], workers=2))
+
+    def test_invalid_workers(self, engine):
+        """Test workers must be positive."""
+        with pytest.raises(ValueError):
+            list(engine.validate_many([self.VALID], workers=0))
+
+
+class TestRuleProfiling:
+    """Test suite for per-rule profiling."""
+
+    XML = b'<ClinicalDocument xmlns="urn:hl7-org:v3"><section/></ClinicalDocument>'
+
+    @pytest.fixture
+    def engine(self):
+        """Create profiling engine with a fast and a failing rule."""
+        engine = RulesEngine(profile=True)
+        engine.add_rule(RuleBuilder.xpath_exists("has_section", "//cda:section"))
+        engine.add_rule(RequiredSectionsRule(required_sections=["11450-4", "10160-0"]))
+        return engine
+
+    def test_disabled_by_default(self):
+        """Test engines do not profile unless asked to."""
+        engine = RulesEngine()
+        engine.add_rule(RequiredSectionsRule(required_sections=["11450-4"]))
+        result = engine.validate(self.XML)
+
+        assert result.rule_stats == {}
+        assert engine.stats() == {}
+
+    def test_validate_records_stats(self, engine):
+        """Test each rule's calls, issues and times are recorded."""
+        result = engine.validate(self.XML)
+        engine.validate(self.XML)
+
+        assert result.rule_stats["required_sections"].issues == 2
+        assert result.rule_stats["has_section"].failures == 0
+
+        stats = engine.stats()
+        assert list(stats) == ["has_section", "required_sections"]
+        assert stats["required_sections"].calls == 2
+        assert stats["required_sections"].failures == 2
+        assert stats["required_sections"].issues == 4
+        assert stats["has_section"].max_time <= stats["has_section"].total_time
+
+    def test_stats_is_a_copy(self, engine):
+        """Test stats() returns a snapshot."""
+        engine.validate(self.XML)
+        snapshot = engine.stats()
+        engine.validate(self.XML)
+        assert snapshot["has_section"].calls == 1
+
+    def test_to_dict_section(self, engine):
+        """Test the profile is serialized with the result."""
+        rows = engine.validate(self.XML).to_dict()["rule_stats"]
+        assert [row["rule"] for row in rows] == ["has_section", "required_sections"]
+        assert rows[1]["issues"] == 2
+
+    def test_slowest_rules(self, engine):
+        """Test rules are ranked by total time."""
+
+        def slow(document):
+            time.sleep(0.01)
+            return None
+
+        engine.add_rule(FunctionBasedRule("slow", "Sleeps", slow))
+        engine.validate(self.XML)
+
+        ranked = engine.slowest_rules(2)
+        assert len(ranked) == 2
+        assert ranked[0][0] == "slow"
+        assert ranked[0][1].total_time >= 0.01
+
+    def test_rule_exception_counts_as_failure(self, engine):
+        """Test a rule that raises is recorded with its error issue."""
+
+        def broken(document):
+            raise RuntimeError("boom")
+
+        engine.add_rule(FunctionBasedRule("broken", "Raises", broken))
+        engine.validate(self.XML)
+
+        assert engine.stats()["broken"].failures == 1
+        assert engine.stats()["broken"].issues == 1
+
+    def test_validate_many_attaches_profiles(self, engine):
+        """Test batch results carry their own profile when profiling."""
+        results = [result for _, result in engine.validate_many([self.XML, self.XML])]
+
+        assert all(result.rule_stats["has_section"].calls == 1 for result in results)
+        assert engine.stats()["has_section"].calls == 2
@@ -0,0 +1,163 @@
+"""Tests for tiered (errors first, warnings later) Schematron validation."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lxml import etree
+
+from ccdakit.core.validation import ValidationLevel
+from ccdakit.validators.pipeline import ValidationPipeline
+from ccdakit.validators.schematron_tiered import (
+    TieredSchematronValidator,
+    WarningsPolicy,
+    clear_phase_validators,
+    get_phase_validator,
+)
+
+
+SCHEMATRON = """<?xml version="1.0" encoding="UTF-8"?>
+<sch:schema xmlns:sch="http://purl.oclc.org/dsdl/schematron">
+  <sch:phase id="errors">
+    <sch:active pattern="shall"/>
+  </sch:phase>
+  <sch:phase id="warnings">
+    <sch:active pattern="should"/>
+  </sch:phase>
+
+  <sch:pattern id="shall">
+    <sch:rule context="/root">
+      <sch:assert test="@id" id="id-required">Root SHALL have an id.</sch:assert>
+    </sch:rule>
+  </sch:pattern>
+
+  <sch:pattern id="should">
+    <sch:rule context="/root">
+      <sch:assert test="title" id="title-recommended">Root SHOULD have a title.</sch:assert>
+    </sch:rule>
+  </sch:pattern>
+</sch:schema>"""
+
+NO_ID = "<root><child/></root>"
+NO_TITLE = '<root id="1"><child/></root>'
+VALID = '<root id="1"><title>T</title></root>'
+
+
+@pytest.fixture
+def schematron_file(tmp_path):
+    """Write the two-phase Schematron to a file."""
+    path = tmp_path / "phases.sch"
+    path.write_text(SCHEMATRON)
+    yield path
+    clear_phase_validators()
+
+
+class TestPhaseValidatorCache:
+    """Tests for get_phase_validator."""
+
+    def test_compiled_once(self, schematron_file):
+        """Test the same file and phase share one compiled validator."""
+        first = get_phase_validator(schematron_file, "errors")
+        assert get_phase_validator(str(schematron_file), "errors") is first
+        assert get_phase_validator(schematron_file, "warnings") is not first
+
+    def test_assert_level(self, schematron_file):
+        """Test failed assertions are reported at the configured level."""
+        validator = get_phase_validator(
+            schematron_file, "warnings", assert_level=ValidationLevel.WARNING
+        )
+        result = validator.validate(NO_TITLE)
+
+        assert result.is_valid
+        assert [w.code for w in result.warnings] == ["SCHEMATRON_title-recommended"]
+        assert result.warnings[0].level == ValidationLevel.WARNING
+
+
+class TestTieredSchematronValidator:
+    """Tests for TieredSchematronValidator."""
+
+    def test_errors_phase_verdict(self, schematron_file):
+        """Test the errors phase decides validity and warnings stay warnings."""
+        with TieredSchematronValidator(schematron_file) as validator:
+            tiered = validator.check(NO_ID)
+            assert not tiered.is_valid
+            assert [e.code for e in tiered.errors.errors] == ["SCHEMATRON_id-required"]
+            assert tiered.errors.warnings == []
+
+            warnings = tiered.warnings(timeout=5)
+            assert [w.code for w in warnings.warnings] == ["SCHEMATRON_title-recommended"]
+            assert warnings.errors == []
+
+    def test_deferred_runs_in_background(self, schematron_file):
+        """Test deferred warnings run on the executor, not the caller's thread."""
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(release.wait, 5)  # Occupy the only worker
+        try:
+            validator = TieredSchematronValidator(schematron_file, executor=executor)
+            tiered = validator.check(NO_TITLE)
+
+            assert tiered.is_valid
+            assert tiered.warnings_pending
+            release.set()
+            assert len(tiered.warnings(timeout=5).warnings) == 1
+            assert not tiered.warnings_pending
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_sync_policy(self, schematron_file):
+        """Test the sync policy has warnings ready when check returns."""
+        validator = TieredSchematronValidator(schematron_file, warnings="sync")
+        tiered = validator.check(NO_TITLE)
+        assert not tiered.warnings_pending
+        assert len(tiered.warnings().warnings) == 1
+
+    def test_skip_policy(self, schematron_file):
+        """Test the skip policy never compiles or runs the warnings phase."""
+        validator = TieredSchematronValidator(schematron_file, warnings=WarningsPolicy.SKIP)
+        tiered = validator.check(NO_TITLE)
+
+        assert validator.warnings_validator is None
+        assert tiered.warnings() is None
+        assert tiered.merged().warnings == []
+        assert tiered.errors.timings[-1].skipped
+        with pytest.raises(ValueError, match="skip policy"):
+            validator.check(NO_TITLE, warnings="sync")
+
+    def test_merged(self, schematron_file):
+        """Test both phases merge into one result with a timing per phase."""
+        with TieredSchematronValidator(schematron_file) as validator:
+            merged = validator.check(NO_ID).merged(timeout=5)
+
+        assert len(merged.errors) == 1
+        assert len(merged.warnings) == 1
+        assert [t.stage for t in merged.timings] == ["schematron:errors", "schematron:warnings"]
+
+    def test_validate_and_pipeline(self, schematron_file):
+        """Test validate() merges both phases and works as a pipeline stage."""
+        validator = TieredSchematronValidator(schematron_file)
+        assert validator.validate(VALID).is_valid
+
+        result = ValidationPipeline().add_stage("schematron", validator).validate(NO_ID)
+        assert len(result.errors) == 1
+        assert len(result.warnings) == 1
+        assert validator._executor is None  # validate() never needs the thread
+
+    def test_parse_error(self, schematron_file):
+        """Test malformed XML is reported once with warnings skipped."""
+        tiered = TieredSchematronValidator(schematron_file).check("<broken>")
+        assert tiered.errors.errors[0].code == "XML_SYNTAX_ERROR"
+        assert tiered.warnings() is None
+
+    def test_shares_parsed_tree(self, schematron_file):
+        """Test an element is validated as-is by both phases."""
+        element = etree.fromstring(NO_ID)
+        with TieredSchematronValidator(schematron_file) as validator:
+            merged = validator.check(element).merged(timeout=5)
+        assert len(merged.errors) == len(merged.warnings) == 1
+
+    def test_invalid_policy(self, schematron_file):
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            TieredSchematronValidator(schematron_file, warnings="later")
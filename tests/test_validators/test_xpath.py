@@ -0,0 +1,97 @@
+"""Tests for the compiled XPath cache."""
+
+import pytest
+from lxml import etree
+
+from ccdakit.validators import common_rules
+from ccdakit.validators.rule_builder import RuleBuilder
+from ccdakit.validators.xpath import (
+    CDA_NAMESPACES,
+    clear_xpath_cache,
+    compile_xpath,
+    xpath_cache_info,
+)
+
+
+XML = (
+    '<ClinicalDocument xmlns="urn:hl7-org:v3">'
+    "<component><structuredBody>"
+    "<component><section><title>A</title></section></component>"
+    "<component><section><title>B</title></section></component>"
+    "</structuredBody></component>"
+    "</ClinicalDocument>"
+)
+
+
+@pytest.fixture
+def document():
+    return etree.fromstring(XML)
+
+
+class TestCompileXPath:
+    """Tests for compile_xpath."""
+
+    def test_evaluates_like_element_xpath(self, document):
+        """Test compiled expressions return the same results as element.xpath."""
+        query = compile_xpath("//cda:section/cda:title/text()")
+        expected = document.xpath("//cda:section/cda:title/text()", namespaces=CDA_NAMESPACES)
+        assert query(document) == expected == ["A", "B"]
+
+    def test_shared_per_expression_and_namespaces(self):
+        """Test one compiled object is shared per (expression, namespaces)."""
+        first = compile_xpath("//cda:section")
+        assert compile_xpath("//cda:section") is first
+        assert compile_xpath("//cda:section", {"cda": "urn:hl7-org:v3"}) is first
+        assert compile_xpath("//cda:section", {"cda": "urn:other"}) is not first
+        assert compile_xpath("//cda:title") is not first
+
+    def test_namespace_order_ignored(self):
+        """Test namespace maps with the same entries share a compiled object."""
+        a = compile_xpath("//x:a", {"x": "urn:x", "y": "urn:y"})
+        b = compile_xpath("//x:a", {"y": "urn:y", "x": "urn:x"})
+        assert a is b
+
+    def test_cache_info(self):
+        """Test cache statistics and clearing."""
+        clear_xpath_cache()
+        compile_xpath("//cda:section")
+        compile_xpath("//cda:section")
+        assert xpath_cache_info() == {"hits": 1, "misses": 1, "size": 1}
+        clear_xpath_cache()
+        assert xpath_cache_info()["size"] == 0
+
+    def test_invalid_expression(self):
+        """Test invalid expressions fail when compiled."""
+        with pytest.raises(etree.XPathSyntaxError):
+            compile_xpath("//cda:section[")
+
+
+class TestRulesUseCompiledXPath:
+    """Tests that rules compile their expressions once."""
+
+    def test_rule_builder_compiles_at_construction(self, document):
+        """Test RuleBuilder rules compile their XPath when created."""
+        clear_xpath_cache()
+        rule = RuleBuilder.xpath_count("sections", "//cda:section", min_count=3)
+        misses = xpath_cache_info()["misses"]
+
+        for _ in range(3):
+            assert len(rule.validate(document)) == 1
+        assert xpath_cache_info()["misses"] == misses == 1
+
+    def test_rule_builder_invalid_xpath(self):
+        """Test an invalid expression is reported when the rule is built."""
+        with pytest.raises(etree.XPathSyntaxError):
+            RuleBuilder.xpath_exists("broken", "//cda:section[")
+
+    def test_rule_builder_custom_namespaces(self):
+        """Test rules honor custom namespace maps."""
+        doc = etree.fromstring('<root xmlns="urn:x"><item/></root>')
+        rule = RuleBuilder.xpath_exists("has_item", "//x:item", namespaces={"x": "urn:x"})
+        assert rule.validate(doc) == []
+
+    def test_common_rules_share_expressions(self):
+        """Test rule instances share compiled expressions."""
+        first = common_rules.SectionCountRule()
+        second = common_rules.SectionCountRule(min_sections=5)
+        assert first._sections is second._sections
@@ -612,3 +612,142 @@ class TestXSDValidator:
         validator = XSDValidator(simple_xsd_schema, auto_download=False)
 
         assert validator.auto_download is False
+
+
+class TestXSDValidatorStreaming:
+    """Test suite for XSDValidator streaming (validate-while-parsing) mode."""
+
+    @pytest.fixture
+    def schema_path(self, tmp_path):
+        """Create a schema allowing any number of <child> elements."""
+        schema_content = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="root">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="child" type="xs:string" maxOccurs="unbounded"/>
+      </xs:sequence>
+      <xs:attribute name="id" type="xs:string" use="required"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+        path = tmp_path / "schema.xsd"
+        path.write_text(schema_content)
+        return path
+
+    @pytest.fixture
+    def validator(self, schema_path):
+        """Streaming validator."""
+        return XSDValidator(schema_path, streaming=True, huge_tree=True)
+
+    def test_valid_inputs(self, validator, tmp_path):
+        """Test streaming accepts strings, bytes, paths and file objects."""
+        xml = '<root id="1"><child>a</child><child>b</child></root>'
+        xml_file = tmp_path / "doc.xml"
+        xml_file.write_text(xml)
+
+        for document in (xml, xml.encode(), xml_file, str(xml_file)):
+            assert validator.validate(document).is_valid
+        with open(xml_file, "rb") as stream:
+            assert validator.validate(stream).is_valid
+
+    def test_schema_error(self, validator):
+        """Test schema violations are reported while parsing."""
+        result = validator.validate('<root><child>a</child></root>')
+
+        assert not result.is_valid
+        assert result.errors[0].code == "XSD_VALIDATION_ERROR"
+        assert "id" in result.errors[0].message
+        # Streaming errors carry no position
+        assert result.errors[0].location is None
+
+    def test_syntax_error(self, validator):
+        """Test well-formedness errors are reported as syntax errors."""
+        result = validator.validate('<root id="1"><child>')
+
+        assert not result.is_valid
+        assert result.errors[0].code == "XML_SYNTAX_ERROR"
+
+    def test_missing_file(self, validator):
+        """Test missing files are reported."""
+        result = validator.validate(Path("/nonexistent/file.xml"))
+        assert result.errors[0].code == "FILE_NOT_FOUND"
+
+    def test_element_input_not_streamed(self, validator):
+        """Test already parsed elements are validated as usual."""
+        element = etree.fromstring('<root><child>a</child></root>')
+        result = validator.validate(element)
+
+        assert not result.is_valid
+        assert result.errors[0].location is not None
+
+    def test_matches_tree_validation(self, schema_path):
+        """Test streaming and tree validation agree on the verdict."""
+        tree_validator = XSDValidator(schema_path)
+        stream_validator = XSDValidator(schema_path, streaming=True)
+        documents = [
+            '<root id="1"><child>a</child></root>',
+            '<root id="1"><wrong/></root>',
+            "<root/>",
+        ]
+        for document in documents:
+            assert (
+                tree_validator.validate(document).is_valid
+                == stream_validator.validate(document).is_valid
+            )
+
+    def test_validate_file_override(self, schema_path, tmp_path):
+        """Test validate_file can switch streaming on per call."""
+        xml_file = tmp_path / "doc.xml"
+        xml_file.write_text("<root><child>a</child></root>")
+        validator = XSDValidator(schema_path)
+
+        assert validator.validate_file(xml_file).errors[0].location is not None
+        assert validator.validate_file(xml_file, streaming=True).errors[0].location is None
+
+    def test_validate_files(self, validator, tmp_path):
+        """Test batch validation yields one result per file, in order."""
+        paths = []
+        for i, xml in enumerate(['<root id="1"><child/></root>', "<root/>", "<root"]):
+            path = tmp_path / f"doc{i}.xml"
+            path.write_text(xml)
+            paths.append(path)
+
+        results = list(validator.validate_files(str(path) for path in paths))
+
+        assert [path for path, _ in results] == paths
+        assert [result.is_valid for _, result in results] == [True, False, False]
+
+    def test_clears_entries(self, tmp_path):
+        """Test CDA entries are dropped without affecting the verdict."""
+        schema = tmp_path / "cda.xsd"
+        schema.write_text(
+            """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="urn:hl7-org:v3" elementFormDefault="qualified">
+  <xs:element name="ClinicalDocument">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="entry" type="xs:string" maxOccurs="unbounded"/>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>"""
+        )
+        validator = XSDValidator(schema, streaming=True)
+        entries = "<entry>x</entry>" * 1000
+
+        valid = f'<ClinicalDocument xmlns="urn:hl7-org:v3">{entries}</ClinicalDocument>'
+        invalid = f'<ClinicalDocument xmlns="urn:hl7-org:v3">{entries}<bad/></ClinicalDocument>'
+
+        assert validator.validate(valid).is_valid
+        assert not validator.validate(invalid).is_valid
+
+    def test_parse_validated(self, validator):
+        """Test parse_validated returns the tree of valid documents."""
+        element = validator.parse_validated(b'<root id="1"><child>a</child></root>')
+        assert element.tag == "root"
+        assert len(element) == 1
+
+        with pytest.raises(etree.XMLSyntaxError):
+            validator.parse_validated(b"<root><child>a</child></root>")